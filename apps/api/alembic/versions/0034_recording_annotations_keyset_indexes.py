@@ -0,0 +1,49 @@
+"""Keyset-pagination indexes on ``recording_annotations``.
+
+Revision ID: 0034
+Revises: 0033
+Create Date: 2026-10-18
+
+The detection list pages newest-first by ``(created_at DESC, id DESC)``. With
+only single-column indexes PostgreSQL has to sort every matching row before
+it can return a page, and ``OFFSET n`` then reads and discards ``n`` of them.
+These composite indexes let both the first page and every cursor page
+(``WHERE (created_at, id) < (:v, :id)``) be served by a backward index range
+scan that stops after ``page_size`` rows:
+
+* ``ix_recording_annotations_created_id`` — project-wide list.
+* ``ix_recording_annotations_run_created_id`` — list filtered by detection
+  run, the most common review-grid filter.
+
+Alembic runs migrations inside a transaction (``alembic/env.py``), so this
+uses a plain ``CREATE INDEX`` (NOT ``CONCURRENTLY``).
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0034"
+down_revision: str | None = "0033"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_recording_annotations_created_id",
+        "recording_annotations",
+        ["created_at", "id"],
+    )
+    op.create_index(
+        "ix_recording_annotations_run_created_id",
+        "recording_annotations",
+        ["detection_run_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_recording_annotations_run_created_id", table_name="recording_annotations"
+    )
+    op.drop_index("ix_recording_annotations_created_id", table_name="recording_annotations")
@@ -0,0 +1,394 @@
+"""Materialised per-dataset detection rollups for the dashboard summaries.
+
+Revision ID: 0035
+Revises: 0034
+Create Date: 2026-10-18
+
+``DetectionService.get_species_summary`` / ``get_temporal_data`` aggregated
+every ``recording_annotations`` row of a project on each dashboard load, the
+temporal one with a per-row ``AT TIME ZONE`` conversion. This revision adds
+two rollup tables holding those aggregates per dataset:
+
+* ``detection_species_rollups`` — dataset x run x tag x source x status, with
+  count, confidence sum and confidence count (for the mean).
+* ``detection_temporal_rollups`` — dataset x run x tag x local date x hour.
+
+They are kept exact by triggers rather than by application code, because
+``recording_annotations`` has many writers and is also rewritten by FK
+actions (``SET NULL`` from tags / detection runs, ``CASCADE`` from
+recordings):
+
+* statement-level triggers on ``recording_annotations`` aggregate the
+  transition tables and upsert one delta per touched key;
+* row triggers on ``recordings`` move a recording's counts when its dataset
+  or datetime changes, and release them before it is deleted;
+* row triggers on ``datasets`` re-bucket on a timezone change and drop the
+  rollups on delete;
+* ``detection_rollups_refresh(dataset_id)`` rebuilds one dataset; it backs
+  the backfill below and the ``rebuild_detection_rollups`` worker task.
+
+The unique keys use ``NULLS NOT DISTINCT`` (PostgreSQL 15+; the stack runs
+16) so ``NULL`` run / tag ids are valid ``ON CONFLICT`` arbiters.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+# FROZEN SNAPSHOT — migration immutability principle.
+#
+# The DDL below captured ``echoroo.models.detection_rollup.DETECTION_ROLLUP_DDL``
+# when this migration was authored. It is deliberately inlined rather than
+# imported so a later edit to the live constant (which the test-database heal
+# in ``tests/conftest.py`` uses) can never change this revision. Any change to
+# the trigger logic must be a NEW migration.
+
+revision: str = "0035"
+down_revision: str | None = "0034"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+_FUNCTIONS: tuple[str, ...] = (
+    """
+    CREATE OR REPLACE FUNCTION detection_rollups_apply(
+        p_rows recording_annotations[], p_sign integer
+    ) RETURNS void AS $fn$
+    BEGIN
+        IF COALESCE(cardinality(p_rows), 0) = 0 THEN
+            RETURN;
+        END IF;
+
+        -- Writers share the per-dataset lock; a refresh takes it exclusively.
+        PERFORM pg_advisory_xact_lock_shared(
+            hashtext('detection_rollups'), hashtext(touched.dataset_id::text)
+        )
+        FROM (
+            SELECT DISTINCT rec.dataset_id
+            FROM unnest(p_rows) AS a
+            JOIN recordings rec ON rec.id = a.recording_id
+        ) AS touched;
+
+        INSERT INTO detection_species_rollups AS r (
+            dataset_id, detection_run_id, tag_id, source, status,
+            detection_count, confidence_sum, confidence_count
+        )
+        SELECT
+            rec.dataset_id, a.detection_run_id, a.tag_id, a.source, a.status,
+            p_sign * count(*),
+            p_sign * COALESCE(sum(a.confidence), 0),
+            p_sign * count(a.confidence)
+        FROM unnest(p_rows) AS a
+        JOIN recordings rec ON rec.id = a.recording_id
+        GROUP BY rec.dataset_id, a.detection_run_id, a.tag_id, a.source, a.status
+        ON CONFLICT (dataset_id, detection_run_id, tag_id, source, status)
+        DO UPDATE SET
+            detection_count = r.detection_count + EXCLUDED.detection_count,
+            confidence_sum = r.confidence_sum + EXCLUDED.confidence_sum,
+            confidence_count = r.confidence_count + EXCLUDED.confidence_count;
+
+        INSERT INTO detection_temporal_rollups AS r (
+            dataset_id, detection_run_id, tag_id, local_date, local_hour,
+            detection_count
+        )
+        SELECT
+            rec.dataset_id, a.detection_run_id, a.tag_id,
+            (rec.datetime AT TIME ZONE COALESCE(d.datetime_timezone, 'UTC'))::date,
+            extract(hour FROM rec.datetime AT TIME ZONE COALESCE(d.datetime_timezone, 'UTC'))::smallint,
+            p_sign * count(*)
+        FROM unnest(p_rows) AS a
+        JOIN recordings rec ON rec.id = a.recording_id
+        JOIN datasets d ON d.id = rec.dataset_id
+        WHERE a.tag_id IS NOT NULL AND rec.datetime IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5
+        ON CONFLICT (dataset_id, detection_run_id, tag_id, local_date, local_hour)
+        DO UPDATE SET
+            detection_count = r.detection_count + EXCLUDED.detection_count;
+
+        IF p_sign < 0 THEN
+            DELETE FROM detection_species_rollups
+            WHERE detection_count = 0
+              AND dataset_id IN (
+                  SELECT rec.dataset_id FROM unnest(p_rows) AS a
+                  JOIN recordings rec ON rec.id = a.recording_id
+              );
+            DELETE FROM detection_temporal_rollups
+            WHERE detection_count = 0
+              AND dataset_id IN (
+                  SELECT rec.dataset_id FROM unnest(p_rows) AS a
+                  JOIN recordings rec ON rec.id = a.recording_id
+              );
+        END IF;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION detection_rollups_refresh(p_dataset_id uuid)
+    RETURNS void AS $fn$
+    BEGIN
+        PERFORM pg_advisory_xact_lock(
+            hashtext('detection_rollups'), hashtext(p_dataset_id::text)
+        );
+
+        DELETE FROM detection_species_rollups WHERE dataset_id = p_dataset_id;
+        DELETE FROM detection_temporal_rollups WHERE dataset_id = p_dataset_id;
+
+        INSERT INTO detection_species_rollups (
+            dataset_id, detection_run_id, tag_id, source, status,
+            detection_count, confidence_sum, confidence_count
+        )
+        SELECT
+            rec.dataset_id, a.detection_run_id, a.tag_id, a.source, a.status,
+            count(*), COALESCE(sum(a.confidence), 0), count(a.confidence)
+        FROM recording_annotations a
+        JOIN recordings rec ON rec.id = a.recording_id
+        WHERE rec.dataset_id = p_dataset_id
+        GROUP BY rec.dataset_id, a.detection_run_id, a.tag_id, a.source, a.status;
+
+        INSERT INTO detection_temporal_rollups (
+            dataset_id, detection_run_id, tag_id, local_date, local_hour,
+            detection_count
+        )
+        SELECT
+            rec.dataset_id, a.detection_run_id, a.tag_id,
+            (rec.datetime AT TIME ZONE COALESCE(d.datetime_timezone, 'UTC'))::date,
+            extract(hour FROM rec.datetime AT TIME ZONE COALESCE(d.datetime_timezone, 'UTC'))::smallint,
+            count(*)
+        FROM recording_annotations a
+        JOIN recordings rec ON rec.id = a.recording_id
+        JOIN datasets d ON d.id = rec.dataset_id
+        WHERE rec.dataset_id = p_dataset_id
+          AND a.tag_id IS NOT NULL
+          AND rec.datetime IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION recording_annotations_rollup_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            PERFORM detection_rollups_apply(
+                ARRAY(SELECT n::recording_annotations FROM new_rows n), 1
+            );
+        ELSIF TG_OP = 'DELETE' THEN
+            -- Rows cascading from a deleted recording no longer join to it
+            -- and are skipped; recordings_rollup_sync released them already.
+            PERFORM detection_rollups_apply(
+                ARRAY(SELECT o::recording_annotations FROM old_rows o), -1
+            );
+        ELSE
+            PERFORM detection_rollups_apply(ARRAY(
+                SELECT o::recording_annotations
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE (o.recording_id, o.tag_id, o.detection_run_id,
+                       o.source, o.status, o.confidence)
+                    IS DISTINCT FROM
+                      (n.recording_id, n.tag_id, n.detection_run_id,
+                       n.source, n.status, n.confidence)
+            ), -1);
+            PERFORM detection_rollups_apply(ARRAY(
+                SELECT n::recording_annotations
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE (o.recording_id, o.tag_id, o.detection_run_id,
+                       o.source, o.status, o.confidence)
+                    IS DISTINCT FROM
+                      (n.recording_id, n.tag_id, n.detection_run_id,
+                       n.source, n.status, n.confidence)
+            ), 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION recordings_rollup_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        -- BEFORE: subtract while the old recording row is still visible.
+        -- AFTER: add back against the new one.
+        IF TG_WHEN = 'BEFORE' THEN
+            -- Inside a dataset delete cascade the dataset row is already
+            -- gone; datasets_rollup_sync drops its rollups wholesale.
+            IF EXISTS (SELECT 1 FROM datasets WHERE id = OLD.dataset_id) THEN
+                PERFORM detection_rollups_apply(ARRAY(
+                    SELECT a FROM recording_annotations a
+                    WHERE a.recording_id = OLD.id
+                ), -1);
+            END IF;
+            IF TG_OP = 'DELETE' THEN
+                RETURN OLD;
+            END IF;
+            RETURN NEW;
+        END IF;
+        PERFORM detection_rollups_apply(ARRAY(
+            SELECT a FROM recording_annotations a WHERE a.recording_id = NEW.id
+        ), 1);
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION datasets_rollup_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM detection_species_rollups WHERE dataset_id = OLD.id;
+            DELETE FROM detection_temporal_rollups WHERE dataset_id = OLD.id;
+        ELSE
+            PERFORM detection_rollups_refresh(NEW.id);
+        END IF;
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+)
+
+_TRIGGERS: tuple[str, ...] = (
+    """
+    CREATE OR REPLACE TRIGGER recording_annotations_rollup_insert
+    AFTER INSERT ON recording_annotations
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION recording_annotations_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recording_annotations_rollup_update
+    AFTER UPDATE ON recording_annotations
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION recording_annotations_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recording_annotations_rollup_delete
+    AFTER DELETE ON recording_annotations
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION recording_annotations_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recordings_rollup_before_move
+    BEFORE UPDATE OF dataset_id, datetime ON recordings
+    FOR EACH ROW
+    WHEN (OLD.dataset_id IS DISTINCT FROM NEW.dataset_id
+          OR OLD.datetime IS DISTINCT FROM NEW.datetime)
+    EXECUTE FUNCTION recordings_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recordings_rollup_after_move
+    AFTER UPDATE OF dataset_id, datetime ON recordings
+    FOR EACH ROW
+    WHEN (OLD.dataset_id IS DISTINCT FROM NEW.dataset_id
+          OR OLD.datetime IS DISTINCT FROM NEW.datetime)
+    EXECUTE FUNCTION recordings_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recordings_rollup_before_delete
+    BEFORE DELETE ON recordings
+    FOR EACH ROW EXECUTE FUNCTION recordings_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER datasets_rollup_timezone
+    AFTER UPDATE OF datetime_timezone ON datasets
+    FOR EACH ROW
+    WHEN (OLD.datetime_timezone IS DISTINCT FROM NEW.datetime_timezone)
+    EXECUTE FUNCTION datasets_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER datasets_rollup_delete
+    AFTER DELETE ON datasets
+    FOR EACH ROW EXECUTE FUNCTION datasets_rollup_sync();
+    """,
+)
+
+_TRIGGER_TABLES: dict[str, str] = {
+    "recording_annotations_rollup_insert": "recording_annotations",
+    "recording_annotations_rollup_update": "recording_annotations",
+    "recording_annotations_rollup_delete": "recording_annotations",
+    "recordings_rollup_before_move": "recordings",
+    "recordings_rollup_after_move": "recordings",
+    "recordings_rollup_before_delete": "recordings",
+    "datasets_rollup_timezone": "datasets",
+    "datasets_rollup_delete": "datasets",
+}
+
+_FUNCTION_SIGNATURES: tuple[str, ...] = (
+    "datasets_rollup_sync()",
+    "recordings_rollup_sync()",
+    "recording_annotations_rollup_sync()",
+    "detection_rollups_refresh(uuid)",
+    "detection_rollups_apply(recording_annotations[], integer)",
+)
+
+
+def _enum(name: str) -> sa.Enum:
+    return sa.Enum(name=name, create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "detection_species_rollups",
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("dataset_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("detection_run_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("tag_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("source", _enum("detectionsource"), nullable=False),
+        sa.Column("status", _enum("detectionstatus"), nullable=False),
+        sa.Column("detection_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("confidence_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("confidence_count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "uq_detection_species_rollups_key",
+        "detection_species_rollups",
+        ["dataset_id", "detection_run_id", "tag_id", "source", "status"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+    op.create_table(
+        "detection_temporal_rollups",
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("dataset_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("detection_run_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("tag_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("local_date", sa.Date(), nullable=False),
+        sa.Column("local_hour", sa.SmallInteger(), nullable=False),
+        sa.Column("detection_count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "uq_detection_temporal_rollups_key",
+        "detection_temporal_rollups",
+        ["dataset_id", "detection_run_id", "tag_id", "local_date", "local_hour"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+
+    for statement in _FUNCTIONS:
+        op.execute(sa.text(statement))
+    for statement in _TRIGGERS:
+        op.execute(sa.text(statement))
+
+    # Backfill. ``CREATE TRIGGER`` holds writers on these tables off until the
+    # migration commits, so the backfill and the triggers see the same rows.
+    op.execute(sa.text("SELECT detection_rollups_refresh(id) FROM datasets"))
+
+
+def downgrade() -> None:
+    for trigger, table in _TRIGGER_TABLES.items():
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger} ON {table}"))
+    for signature in _FUNCTION_SIGNATURES:
+        op.execute(sa.text(f"DROP FUNCTION IF EXISTS {signature}"))
+    op.drop_index("uq_detection_temporal_rollups_key", table_name="detection_temporal_rollups")
+    op.drop_table("detection_temporal_rollups")
+    op.drop_index("uq_detection_species_rollups_key", table_name="detection_species_rollups")
+    op.drop_table("detection_species_rollups")
@@ -0,0 +1,370 @@
+"""Per-annotation vote tallies and stored consensus status.
+
+Revision ID: 0036
+Revises: 0035
+Create Date: 2026-10-18
+
+``AnnotationVoteService.get_vote_summary`` and the detection list counted
+every ``annotation_votes`` row of the annotations involved in Python on each
+request, and consensus could not be filtered or sorted on in SQL. This
+revision adds ``annotation_vote_tallies`` — one row per voted annotation
+with the agree / disagree / unsure counts, the per-source agree / disagree
+split, and the consensus status and score under the project's review
+settings — kept in step by triggers:
+
+* a row trigger on ``annotation_votes`` applies each vote's delta in the
+  voting transaction (a re-vote is -old, +new);
+* a row trigger on ``projects`` re-derives consensus for the whole project
+  when ``review_min_votes`` / ``review_consensus_threshold`` change;
+* ``annotation_vote_tallies_refresh(project_id)`` rebuilds one project and
+  backs the backfill below.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+# FROZEN SNAPSHOT — migration immutability principle.
+#
+# The DDL below captured
+# ``echoroo.models.annotation_vote_tally.ANNOTATION_VOTE_TALLY_DDL`` when this
+# migration was authored. It is deliberately inlined rather than imported so a
+# later edit to the live constant (which the test-database heal in
+# ``tests/conftest.py`` uses) can never change this revision. Any change to
+# the trigger logic must be a NEW migration.
+
+revision: str = "0036"
+down_revision: str | None = "0035"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+_CONSENSUS_VALUES = ("needs_votes", "agreed", "rejected", "disputed")
+
+_FUNCTIONS: tuple[str, ...] = (
+    """
+    CREATE OR REPLACE FUNCTION annotation_vote_consensus(
+        p_agree integer, p_disagree integer,
+        p_min_votes integer, p_threshold double precision
+    ) RETURNS varchar AS $fn$
+        SELECT CASE
+            WHEN p_agree + p_disagree = 0
+              OR p_agree + p_disagree < p_min_votes THEN 'needs_votes'
+            WHEN p_agree::double precision / (p_agree + p_disagree) > p_threshold
+              AND p_agree >= p_min_votes THEN 'agreed'
+            WHEN p_agree::double precision / (p_agree + p_disagree) <= 1.0 - p_threshold
+              AND p_disagree >= p_min_votes THEN 'rejected'
+            ELSE 'disputed'
+        END;
+    $fn$ LANGUAGE sql IMMUTABLE;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION annotation_vote_score(
+        p_agree integer, p_disagree integer
+    ) RETURNS double precision AS $fn$
+        SELECT p_agree::double precision / NULLIF(p_agree + p_disagree, 0);
+    $fn$ LANGUAGE sql IMMUTABLE;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION annotation_vote_tallies_apply(
+        p_vote annotation_votes, p_sign integer
+    ) RETURNS void AS $fn$
+    DECLARE
+        v_min_votes integer;
+        v_threshold double precision;
+        d_agree integer := CASE WHEN p_vote.vote = 1 THEN p_sign ELSE 0 END;
+        d_disagree integer := CASE WHEN p_vote.vote = -1 THEN p_sign ELSE 0 END;
+        d_unsure integer := CASE WHEN p_vote.vote = 0 THEN p_sign ELSE 0 END;
+    BEGIN
+        SELECT review_min_votes, review_consensus_threshold
+        INTO v_min_votes, v_threshold
+        FROM projects WHERE id = p_vote.project_id;
+
+        IF p_sign < 0 THEN
+            -- Never insert on a decrement: inside an annotation / project
+            -- delete cascade the tally row is already gone.
+            UPDATE annotation_vote_tallies AS t SET
+                agree_count = t.agree_count + d_agree,
+                disagree_count = t.disagree_count + d_disagree,
+                unsure_count = t.unsure_count + d_unsure,
+                member_agree = t.member_agree
+                    + CASE WHEN p_vote.source = 'member' THEN d_agree ELSE 0 END,
+                member_disagree = t.member_disagree
+                    + CASE WHEN p_vote.source = 'member' THEN d_disagree ELSE 0 END,
+                guest_authenticated_agree = t.guest_authenticated_agree
+                    + CASE WHEN p_vote.source = 'guest_authenticated'
+                      THEN d_agree ELSE 0 END,
+                guest_authenticated_disagree = t.guest_authenticated_disagree
+                    + CASE WHEN p_vote.source = 'guest_authenticated'
+                      THEN d_disagree ELSE 0 END,
+                trusted_user_agree = t.trusted_user_agree
+                    + CASE WHEN p_vote.source = 'trusted_user' THEN d_agree ELSE 0 END,
+                trusted_user_disagree = t.trusted_user_disagree
+                    + CASE WHEN p_vote.source = 'trusted_user' THEN d_disagree ELSE 0 END,
+                consensus_status = annotation_vote_consensus(
+                    t.agree_count + d_agree, t.disagree_count + d_disagree,
+                    COALESCE(v_min_votes, 2), COALESCE(v_threshold, 0.667)
+                ),
+                consensus_score = annotation_vote_score(
+                    t.agree_count + d_agree, t.disagree_count + d_disagree
+                ),
+                updated_at = now()
+            WHERE t.annotation_id = p_vote.annotation_id;
+            RETURN;
+        END IF;
+
+        INSERT INTO annotation_vote_tallies AS t (
+            annotation_id, project_id, agree_count, disagree_count, unsure_count,
+            member_agree, member_disagree,
+            guest_authenticated_agree, guest_authenticated_disagree,
+            trusted_user_agree, trusted_user_disagree,
+            consensus_status, consensus_score, updated_at
+        ) VALUES (
+            p_vote.annotation_id, p_vote.project_id, d_agree, d_disagree, d_unsure,
+            CASE WHEN p_vote.source = 'member' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'member' THEN d_disagree ELSE 0 END,
+            CASE WHEN p_vote.source = 'guest_authenticated' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'guest_authenticated' THEN d_disagree ELSE 0 END,
+            CASE WHEN p_vote.source = 'trusted_user' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'trusted_user' THEN d_disagree ELSE 0 END,
+            annotation_vote_consensus(d_agree, d_disagree, v_min_votes, v_threshold),
+            annotation_vote_score(d_agree, d_disagree),
+            now()
+        )
+        ON CONFLICT (annotation_id) DO UPDATE SET
+            agree_count = t.agree_count + EXCLUDED.agree_count,
+            disagree_count = t.disagree_count + EXCLUDED.disagree_count,
+            unsure_count = t.unsure_count + EXCLUDED.unsure_count,
+            member_agree = t.member_agree + EXCLUDED.member_agree,
+            member_disagree = t.member_disagree + EXCLUDED.member_disagree,
+            guest_authenticated_agree =
+                t.guest_authenticated_agree + EXCLUDED.guest_authenticated_agree,
+            guest_authenticated_disagree =
+                t.guest_authenticated_disagree + EXCLUDED.guest_authenticated_disagree,
+            trusted_user_agree = t.trusted_user_agree + EXCLUDED.trusted_user_agree,
+            trusted_user_disagree =
+                t.trusted_user_disagree + EXCLUDED.trusted_user_disagree,
+            consensus_status = annotation_vote_consensus(
+                t.agree_count + EXCLUDED.agree_count,
+                t.disagree_count + EXCLUDED.disagree_count,
+                v_min_votes, v_threshold
+            ),
+            consensus_score = annotation_vote_score(
+                t.agree_count + EXCLUDED.agree_count,
+                t.disagree_count + EXCLUDED.disagree_count
+            ),
+            updated_at = now();
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION annotation_vote_tallies_refresh(p_project_id uuid)
+    RETURNS void AS $fn$
+    BEGIN
+        DELETE FROM annotation_vote_tallies WHERE project_id = p_project_id;
+
+        INSERT INTO annotation_vote_tallies (
+            annotation_id, project_id, agree_count, disagree_count, unsure_count,
+            member_agree, member_disagree,
+            guest_authenticated_agree, guest_authenticated_disagree,
+            trusted_user_agree, trusted_user_disagree,
+            consensus_status, consensus_score, updated_at
+        )
+        SELECT
+            c.annotation_id, c.project_id, c.agree, c.disagree, c.unsure,
+            c.member_agree, c.member_disagree,
+            c.guest_agree, c.guest_disagree, c.trusted_agree, c.trusted_disagree,
+            annotation_vote_consensus(
+                c.agree, c.disagree, p.review_min_votes, p.review_consensus_threshold
+            ),
+            annotation_vote_score(c.agree, c.disagree),
+            now()
+        FROM (
+            SELECT
+                v.annotation_id, v.project_id,
+                count(*) FILTER (WHERE v.vote = 1)::integer AS agree,
+                count(*) FILTER (WHERE v.vote = -1)::integer AS disagree,
+                count(*) FILTER (WHERE v.vote = 0)::integer AS unsure,
+                count(*) FILTER (
+                    WHERE v.vote = 1 AND v.source = 'member')::integer AS member_agree,
+                count(*) FILTER (
+                    WHERE v.vote = -1 AND v.source = 'member')::integer AS member_disagree,
+                count(*) FILTER (
+                    WHERE v.vote = 1 AND v.source = 'guest_authenticated'
+                )::integer AS guest_agree,
+                count(*) FILTER (
+                    WHERE v.vote = -1 AND v.source = 'guest_authenticated'
+                )::integer AS guest_disagree,
+                count(*) FILTER (
+                    WHERE v.vote = 1 AND v.source = 'trusted_user')::integer AS trusted_agree,
+                count(*) FILTER (
+                    WHERE v.vote = -1 AND v.source = 'trusted_user'
+                )::integer AS trusted_disagree
+            FROM annotation_votes v
+            WHERE v.project_id = p_project_id
+            GROUP BY v.annotation_id, v.project_id
+        ) AS c
+        JOIN projects p ON p.id = c.project_id;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION annotation_votes_tally_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM annotation_vote_tallies_apply(OLD, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM annotation_vote_tallies_apply(NEW, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION projects_vote_consensus_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        UPDATE annotation_vote_tallies SET
+            consensus_status = annotation_vote_consensus(
+                agree_count, disagree_count,
+                NEW.review_min_votes, NEW.review_consensus_threshold
+            ),
+            updated_at = now()
+        WHERE project_id = NEW.id;
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+)
+
+_TRIGGERS: tuple[str, ...] = (
+    """
+    CREATE OR REPLACE TRIGGER annotation_votes_tally_insert
+    AFTER INSERT ON annotation_votes
+    FOR EACH ROW EXECUTE FUNCTION annotation_votes_tally_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER annotation_votes_tally_update
+    AFTER UPDATE OF annotation_id, project_id, vote, source ON annotation_votes
+    FOR EACH ROW
+    WHEN ((OLD.annotation_id, OLD.project_id, OLD.vote, OLD.source)
+          IS DISTINCT FROM
+          (NEW.annotation_id, NEW.project_id, NEW.vote, NEW.source))
+    EXECUTE FUNCTION annotation_votes_tally_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER annotation_votes_tally_delete
+    AFTER DELETE ON annotation_votes
+    FOR EACH ROW EXECUTE FUNCTION annotation_votes_tally_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER projects_vote_consensus
+    AFTER UPDATE OF review_min_votes, review_consensus_threshold ON projects
+    FOR EACH ROW
+    WHEN (OLD.review_min_votes IS DISTINCT FROM NEW.review_min_votes
+          OR OLD.review_consensus_threshold IS DISTINCT FROM NEW.review_consensus_threshold)
+    EXECUTE FUNCTION projects_vote_consensus_sync();
+    """,
+)
+
+_TRIGGER_TABLES: dict[str, str] = {
+    "annotation_votes_tally_insert": "annotation_votes",
+    "annotation_votes_tally_update": "annotation_votes",
+    "annotation_votes_tally_delete": "annotation_votes",
+    "projects_vote_consensus": "projects",
+}
+
+_FUNCTION_SIGNATURES: tuple[str, ...] = (
+    "projects_vote_consensus_sync()",
+    "annotation_votes_tally_sync()",
+    "annotation_vote_tallies_refresh(uuid)",
+    "annotation_vote_tallies_apply(annotation_votes, integer)",
+    "annotation_vote_score(integer, integer)",
+    "annotation_vote_consensus(integer, integer, integer, double precision)",
+)
+
+_COUNT_COLUMNS: tuple[str, ...] = (
+    "agree_count",
+    "disagree_count",
+    "unsure_count",
+    "member_agree",
+    "member_disagree",
+    "guest_authenticated_agree",
+    "guest_authenticated_disagree",
+    "trusted_user_agree",
+    "trusted_user_disagree",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "annotation_vote_tallies",
+        sa.Column(
+            "annotation_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("recording_annotations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "project_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        *(
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+            for name in _COUNT_COLUMNS
+        ),
+        sa.Column(
+            "consensus_status",
+            sa.String(16),
+            nullable=False,
+            server_default="needs_votes",
+        ),
+        sa.Column("consensus_score", sa.Float(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.CheckConstraint(
+            "consensus_status IN (" + ", ".join(f"'{value}'" for value in _CONSENSUS_VALUES) + ")",
+            name="ck_annotation_vote_tallies_consensus_status",
+        ),
+    )
+    op.create_index(
+        "ix_annotation_vote_tallies_project_consensus",
+        "annotation_vote_tallies",
+        ["project_id", "consensus_status"],
+    )
+
+    for statement in _FUNCTIONS:
+        op.execute(sa.text(statement))
+    for statement in _TRIGGERS:
+        op.execute(sa.text(statement))
+
+    # Backfill. ``CREATE TRIGGER`` holds vote writers off until the migration
+    # commits, so the backfill and the triggers see the same rows.
+    op.execute(
+        sa.text(
+            "SELECT annotation_vote_tallies_refresh(id) FROM projects "
+            "WHERE id IN (SELECT DISTINCT project_id FROM annotation_votes)"
+        )
+    )
+
+
+def downgrade() -> None:
+    for trigger, table in _TRIGGER_TABLES.items():
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger} ON {table}"))
+    for signature in _FUNCTION_SIGNATURES:
+        op.execute(sa.text(f"DROP FUNCTION IF EXISTS {signature}"))
+    op.drop_index(
+        "ix_annotation_vote_tallies_project_consensus",
+        table_name="annotation_vote_tallies",
+    )
+    op.drop_table("annotation_vote_tallies")
@@ -0,0 +1,38 @@
+"""Add the precision / recall curve to evaluation results.
+
+Revision ID: 0037
+Revises: 0036
+Create Date: 2026-10-18
+
+Adds a NULLABLE ``pr_curve JSONB`` column to ``evaluation_results``. The
+evaluation worker fills it on the overall (``taxon_id IS NULL``) row of
+each model reference with precision and recall at each detection
+confidence threshold: a list of ``{"threshold", "precision", "recall"}``
+objects ordered by descending threshold. Rows written before this revision
+keep NULL.
+
+Fully reversible: ``downgrade()`` drops the column.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+revision: str = "0037"
+down_revision: str | None = "0036"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "evaluation_results",
+        sa.Column("pr_curve", JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("evaluation_results", "pr_curve")
@@ -0,0 +1,89 @@
+"""Background audit chain verification runs and keyset indexes.
+
+Revision ID: 0038
+Revises: 0037
+Create Date: 2026-10-18
+
+Chain verification moves out of the HTTP request into a Celery job
+(:mod:`echoroo.workers.audit_chain_verify`). Each run is recorded in the
+new ``audit_chain_verifications`` table, which also carries the run's
+signed checkpoint — the last settled row it verified, that row's
+``row_hash`` and a KMS MAC over both — so the next run only has to verify
+rows written after it. The ``(target, started_at DESC)`` index serves
+both the "latest run" lookup of the admin UI and the checkpoint lookup.
+
+The job (and the weekly export) stream the audit tables in
+``(created_at, id)`` keyset order. The baseline only indexes
+``created_at`` behind the project / action / actor columns, so each
+table gets a composite ``(created_at, id)`` index:
+
+* ``ix_project_audit_log_created_id``
+* ``ix_platform_audit_log_created_id``
+
+Alembic runs migrations inside a transaction (``alembic/env.py``), so this
+uses a plain ``CREATE INDEX`` (NOT ``CONCURRENTLY``).
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+revision: str = "0038"
+down_revision: str | None = "0037"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_chain_verifications",
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("target", sa.String(20), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("resumed_from_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("rows_total", sa.BigInteger(), nullable=True),
+        sa.Column("rows_verified", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("is_valid", sa.Boolean(), nullable=True),
+        sa.Column("first_mismatch_row_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("error_detail", sa.Text(), nullable=True),
+        sa.Column("checkpoint_row_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("checkpoint_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("checkpoint_row_hash", sa.String(64), nullable=True),
+        sa.Column("checkpoint_row_count", sa.BigInteger(), nullable=True),
+        sa.Column("checkpoint_mac", sa.String(64), nullable=True),
+    )
+    op.create_index(
+        "ix_audit_chain_verifications_target_started",
+        "audit_chain_verifications",
+        ["target", sa.text("started_at DESC")],
+    )
+    op.create_index(
+        "ix_project_audit_log_created_id",
+        "project_audit_log",
+        ["created_at", "id"],
+    )
+    op.create_index(
+        "ix_platform_audit_log_created_id",
+        "platform_audit_log",
+        ["created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_platform_audit_log_created_id", table_name="platform_audit_log")
+    op.drop_index("ix_project_audit_log_created_id", table_name="project_audit_log")
+    op.drop_index(
+        "ix_audit_chain_verifications_target_started",
+        table_name="audit_chain_verifications",
+    )
+    op.drop_table("audit_chain_verifications")
@@ -0,0 +1,75 @@
+"""Background chunked deletion of datasets and projects.
+
+Revision ID: 0039
+Revises: 0038
+Create Date: 2026-10-18
+
+Deleting a dataset or project used to run one cascading ``DELETE`` inside
+the API request — millions of ``embeddings`` / ``recording_annotations``
+rows in a single transaction. Deletion is now a Celery job
+(:mod:`echoroo.workers.deletion_tasks`):
+
+* ``datasetstatus`` and ``projectstatus`` gain a ``deleting`` value, set by
+  the API when the job is queued;
+* the new ``deletion_jobs`` table records each job and its progress. It has
+  no foreign key to the deleted entity, which it outlives. The
+  ``(entity_type, entity_id, started_at DESC)`` index serves the lookup of
+  an entity's active job.
+
+``ALTER TYPE ... ADD VALUE`` runs in an autocommit block, as in 0006a.
+There is no enum downgrade: PostgreSQL has no ``DROP VALUE``, so
+``downgrade()`` only drops the table.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+revision: str = "0039"
+down_revision: str | None = "0038"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+_WIDENED_ENUMS: tuple[str, ...] = ("datasetstatus", "projectstatus")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for enum_name in _WIDENED_ENUMS:
+            op.execute(f"ALTER TYPE {enum_name} ADD VALUE IF NOT EXISTS 'deleting'")
+
+    op.create_table(
+        "deletion_jobs",
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("entity_type", sa.String(20), nullable=False),
+        sa.Column("entity_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("project_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("requested_by_user_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("stage", sa.String(40), nullable=True),
+        sa.Column("rows_deleted", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("objects_deleted", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error_detail", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "ix_deletion_jobs_entity",
+        "deletion_jobs",
+        ["entity_type", "entity_id", sa.text("started_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Drop the job table; the ``deleting`` enum values stay (no ``DROP VALUE``)."""
+    op.drop_index("ix_deletion_jobs_entity", table_name="deletion_jobs")
+    op.drop_table("deletion_jobs")
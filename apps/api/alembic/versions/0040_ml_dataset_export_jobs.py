@@ -0,0 +1,64 @@
+"""Background ML-dataset ZIP exports.
+
+Revision ID: 0040
+Revises: 0039
+Create Date: 2026-10-19
+
+The ML training dataset export used to load every confirmed annotation of
+a project and build the ZIP in API memory. It is now a Celery job
+(:mod:`echoroo.workers.detection_export_tasks`) that streams the archive
+to object storage; the new ``ml_dataset_export_jobs`` table records each
+job, its progress and the key of the finished ZIP. Rows go with their
+project (``ON DELETE CASCADE``); the ``(project_id, started_at DESC)``
+index serves listing a project's recent exports.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+revision: str = "0040"
+down_revision: str | None = "0039"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ml_dataset_export_jobs",
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column(
+            "project_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("dataset_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("detection_run_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("requested_by_user_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("entries_written", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("object_key", sa.String(1024), nullable=True),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error_detail", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "ix_ml_dataset_export_jobs_project",
+        "ml_dataset_export_jobs",
+        ["project_id", sa.text("started_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ml_dataset_export_jobs_project", table_name="ml_dataset_export_jobs")
+    op.drop_table("ml_dataset_export_jobs")
@@ -0,0 +1,45 @@
+"""Persistent taxon-resolution cache.
+
+Revision ID: 0041
+Revises: 0040
+Create Date: 2026-10-19
+
+Resolving model labels against GBIF used to issue one ``species/match``
+call per name on every pass, with vernacular names cached in Redis only.
+The new ``taxon_resolution_cache`` table remembers the outcome of each
+lookup by normalized name (GBIF key, canonical name, rank, classification
+and the vernacular names fetched for that key, grouped by locale) so
+:mod:`echoroo.services.taxon_resolution` can answer repeated names without
+touching the network. Rows hold both hits and misses; ``expires_at``
+carries the TTL of each.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+revision: str = "0041"
+down_revision: str | None = "0040"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "taxon_resolution_cache",
+        sa.Column("name_key", sa.String(300), primary_key=True),
+        sa.Column("gbif_taxon_key", sa.Integer(), nullable=True),
+        sa.Column("scientific_name", sa.String(300), nullable=True),
+        sa.Column("rank", sa.String(50), nullable=True),
+        sa.Column("classification", JSONB(), nullable=True),
+        sa.Column("vernacular_names", JSONB(), nullable=True),
+        sa.Column("resolved_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("taxon_resolution_cache")
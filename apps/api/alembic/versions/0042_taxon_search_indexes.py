@@ -0,0 +1,74 @@
+"""Trigram-indexed, folded taxon search names.
+
+Revision ID: 0042
+Revises: 0041
+Create Date: 2026-10-19
+
+The species picker searched ``taxa.scientific_name`` and
+``taxon_vernacular_names.name`` with ``ILIKE '%term%'``, which no B-tree
+can serve, so every keystroke scanned both tables. Each table now carries
+a ``search_name`` column holding the name folded by
+:func:`echoroo.core.text.fold_for_search` (case, width, Latin diacritics,
+katakana/hiragana), filled by the models on insert and backfilled here.
+Every ``search_name`` gets a ``pg_trgm`` GIN index for substring matches
+and a ``varchar_pattern_ops`` B-tree for prefix matches of queries too
+short to form a trigram.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+from echoroo.core.text import fold_for_search
+
+revision: str = "0042"
+down_revision: str | None = "0041"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+# (table, source column) pairs that gain a ``search_name``.
+_TABLES = (("taxa", "scientific_name"), ("taxon_vernacular_names", "name"))
+_BACKFILL_BATCH = 1000
+
+
+def _backfill(table: str, source: str) -> None:
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(f"SELECT id, {source} FROM {table}")).all()
+    update = sa.text(f"UPDATE {table} SET search_name = :search_name WHERE id = :id")
+    for start in range(0, len(rows), _BACKFILL_BATCH):
+        bind.execute(
+            update,
+            [
+                {"id": row_id, "search_name": fold_for_search(name)[:300]}
+                for row_id, name in rows[start : start + _BACKFILL_BATCH]
+            ],
+        )
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, source in _TABLES:
+        op.add_column(table, sa.Column("search_name", sa.String(300), nullable=True))
+        _backfill(table, source)
+        op.alter_column(table, "search_name", nullable=False)
+        op.create_index(
+            f"ix_{table}_search_name_trgm",
+            table,
+            ["search_name"],
+            postgresql_using="gin",
+            postgresql_ops={"search_name": "gin_trgm_ops"},
+        )
+        op.create_index(
+            f"ix_{table}_search_name_prefix",
+            table,
+            ["search_name"],
+            postgresql_ops={"search_name": "varchar_pattern_ops"},
+        )
+
+
+def downgrade() -> None:
+    for table, _source in reversed(_TABLES):
+        op.drop_index(f"ix_{table}_search_name_prefix", table_name=table)
+        op.drop_index(f"ix_{table}_search_name_trgm", table_name=table)
+        op.drop_column(table, "search_name")
@@ -0,0 +1,72 @@
+"""Background dataset-wide clip generation.
+
+Revision ID: 0043
+Revises: 0042
+Create Date: 2026-10-19
+
+Fixed-length clips used to be generated one recording per request, so
+covering a dataset took one API call per recording. A Celery job
+(:mod:`echoroo.workers.clip_tasks`) now plans the windows of a whole
+dataset and bulk-inserts those it does not already have; the new
+``clip_generation_jobs`` table records each job, its parameters and its
+progress. Rows go with their project (``ON DELETE CASCADE``); the
+``(project_id, started_at DESC)`` index serves listing a project's recent
+jobs.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+revision: str = "0043"
+down_revision: str | None = "0042"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "clip_generation_jobs",
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column(
+            "project_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "dataset_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("datasets.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("requested_by_user_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("clip_length", sa.Float(), nullable=False),
+        sa.Column("overlap", sa.Float(), nullable=False),
+        sa.Column("start_time", sa.Float(), nullable=False),
+        sa.Column("end_time", sa.Float(), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("recordings_processed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("clips_created", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error_detail", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "ix_clip_generation_jobs_project",
+        "clip_generation_jobs",
+        ["project_id", sa.text("started_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_clip_generation_jobs_project", table_name="clip_generation_jobs")
+    op.drop_table("clip_generation_jobs")
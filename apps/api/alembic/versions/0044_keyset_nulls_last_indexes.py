@@ -0,0 +1,51 @@
+"""``DESC NULLS LAST`` indexes for keyset lists sorted on nullable columns.
+
+Revision ID: 0044
+Revises: 0043
+Create Date: 2026-10-19
+
+Keyset pages sort NULL values last. For a NOT NULL sort key that is a plain
+``ORDER BY sort DESC, id DESC`` served by the ``(sort, id)`` indexes of
+revision 0034, but a backward scan of an ascending B-tree yields
+``DESC NULLS FIRST``, so a descending sort on a nullable key could not use
+any index and PostgreSQL sorted every matching row for each page:
+
+* ``ix_annotation_vote_tallies_score_annotation`` — detection list ordered
+  by ``consensus_score`` (highest agreement first, undecided last).
+* ``ix_recordings_dataset_datetime_id`` — dataset recording list, newest
+  first, recordings without a parsed timestamp last.
+
+Alembic runs migrations inside a transaction (``alembic/env.py``), so this
+uses a plain ``CREATE INDEX`` (NOT ``CONCURRENTLY``).
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0044"
+down_revision: str | None = "0043"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_annotation_vote_tallies_score_annotation",
+        "annotation_vote_tallies",
+        [sa.text("consensus_score DESC NULLS LAST"), sa.text("annotation_id DESC")],
+    )
+    op.create_index(
+        "ix_recordings_dataset_datetime_id",
+        "recordings",
+        ["dataset_id", sa.text("datetime DESC NULLS LAST"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recordings_dataset_datetime_id", table_name="recordings")
+    op.drop_index(
+        "ix_annotation_vote_tallies_score_annotation", table_name="annotation_vote_tallies"
+    )
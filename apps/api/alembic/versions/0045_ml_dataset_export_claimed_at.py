@@ -0,0 +1,36 @@
+"""Record when an ML-dataset export job was claimed by a worker.
+
+Revision ID: 0045
+Revises: 0044
+Create Date: 2026-10-19
+
+A worker killed by the Celery hard time limit (or lost with its host) never
+reaches the handler that marks its export job failed, so the job stayed
+``running`` forever and the UI polled it indefinitely. The worker now
+stamps ``claimed_at`` when it claims a job, and the periodic reaper in
+:mod:`echoroo.workers.detection_export_tasks` fails ``running`` jobs claimed
+longer ago than any live task can run. Rows claimed before this revision
+keep ``claimed_at`` NULL; the reaper falls back to ``started_at`` for them.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0045"
+down_revision: str | None = "0044"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "ml_dataset_export_jobs",
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("ml_dataset_export_jobs", "claimed_at")
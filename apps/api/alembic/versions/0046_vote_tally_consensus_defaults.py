@@ -0,0 +1,226 @@
+"""Evaluate vote consensus with the same default settings on every branch.
+
+Revision ID: 0046
+Revises: 0045
+Create Date: 2026-10-19
+
+``annotation_vote_tallies_apply`` (revision 0036) read the project's
+``review_min_votes`` / ``review_consensus_threshold`` and passed them raw to
+``annotation_vote_consensus`` on the insert / increment branch, but wrapped
+them in ``COALESCE(..., 2)`` / ``COALESCE(..., 0.667)`` on the decrement
+branch, so a missing project row yielded different consensus depending on
+which branch ran. The function now applies the defaults once, right after
+reading the settings. Only the function body changes; no tally is rewritten.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# FROZEN SNAPSHOT — see revision 0036. ``_APPLY_FUNCTION`` captured the live
+# ``echoroo.models.annotation_vote_tally.ANNOTATION_VOTE_TALLY_DDL`` entry;
+# ``_PREVIOUS_APPLY_FUNCTION`` is revision 0036's copy, restored on downgrade.
+
+revision: str = "0046"
+down_revision: str | None = "0045"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+_APPLY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION annotation_vote_tallies_apply(
+        p_vote annotation_votes, p_sign integer
+    ) RETURNS void AS $fn$
+    DECLARE
+        v_min_votes integer;
+        v_threshold double precision;
+        d_agree integer := CASE WHEN p_vote.vote = 1 THEN p_sign ELSE 0 END;
+        d_disagree integer := CASE WHEN p_vote.vote = -1 THEN p_sign ELSE 0 END;
+        d_unsure integer := CASE WHEN p_vote.vote = 0 THEN p_sign ELSE 0 END;
+    BEGIN
+        SELECT review_min_votes, review_consensus_threshold
+        INTO v_min_votes, v_threshold
+        FROM projects WHERE id = p_vote.project_id;
+        -- Both settings are NOT NULL; the project row is only missing while
+        -- its delete cascades through the votes. Either way every branch
+        -- below must evaluate consensus with the same values.
+        v_min_votes := COALESCE(v_min_votes, 2);
+        v_threshold := COALESCE(v_threshold, 0.667);
+
+        IF p_sign < 0 THEN
+            -- Never insert on a decrement: inside an annotation / project
+            -- delete cascade the tally row is already gone.
+            UPDATE annotation_vote_tallies AS t SET
+                agree_count = t.agree_count + d_agree,
+                disagree_count = t.disagree_count + d_disagree,
+                unsure_count = t.unsure_count + d_unsure,
+                member_agree = t.member_agree
+                    + CASE WHEN p_vote.source = 'member' THEN d_agree ELSE 0 END,
+                member_disagree = t.member_disagree
+                    + CASE WHEN p_vote.source = 'member' THEN d_disagree ELSE 0 END,
+                guest_authenticated_agree = t.guest_authenticated_agree
+                    + CASE WHEN p_vote.source = 'guest_authenticated'
+                      THEN d_agree ELSE 0 END,
+                guest_authenticated_disagree = t.guest_authenticated_disagree
+                    + CASE WHEN p_vote.source = 'guest_authenticated'
+                      THEN d_disagree ELSE 0 END,
+                trusted_user_agree = t.trusted_user_agree
+                    + CASE WHEN p_vote.source = 'trusted_user' THEN d_agree ELSE 0 END,
+                trusted_user_disagree = t.trusted_user_disagree
+                    + CASE WHEN p_vote.source = 'trusted_user' THEN d_disagree ELSE 0 END,
+                consensus_status = annotation_vote_consensus(
+                    t.agree_count + d_agree, t.disagree_count + d_disagree,
+                    v_min_votes, v_threshold
+                ),
+                consensus_score = annotation_vote_score(
+                    t.agree_count + d_agree, t.disagree_count + d_disagree
+                ),
+                updated_at = now()
+            WHERE t.annotation_id = p_vote.annotation_id;
+            RETURN;
+        END IF;
+
+        INSERT INTO annotation_vote_tallies AS t (
+            annotation_id, project_id, agree_count, disagree_count, unsure_count,
+            member_agree, member_disagree,
+            guest_authenticated_agree, guest_authenticated_disagree,
+            trusted_user_agree, trusted_user_disagree,
+            consensus_status, consensus_score, updated_at
+        ) VALUES (
+            p_vote.annotation_id, p_vote.project_id, d_agree, d_disagree, d_unsure,
+            CASE WHEN p_vote.source = 'member' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'member' THEN d_disagree ELSE 0 END,
+            CASE WHEN p_vote.source = 'guest_authenticated' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'guest_authenticated' THEN d_disagree ELSE 0 END,
+            CASE WHEN p_vote.source = 'trusted_user' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'trusted_user' THEN d_disagree ELSE 0 END,
+            annotation_vote_consensus(d_agree, d_disagree, v_min_votes, v_threshold),
+            annotation_vote_score(d_agree, d_disagree),
+            now()
+        )
+        ON CONFLICT (annotation_id) DO UPDATE SET
+            agree_count = t.agree_count + EXCLUDED.agree_count,
+            disagree_count = t.disagree_count + EXCLUDED.disagree_count,
+            unsure_count = t.unsure_count + EXCLUDED.unsure_count,
+            member_agree = t.member_agree + EXCLUDED.member_agree,
+            member_disagree = t.member_disagree + EXCLUDED.member_disagree,
+            guest_authenticated_agree =
+                t.guest_authenticated_agree + EXCLUDED.guest_authenticated_agree,
+            guest_authenticated_disagree =
+                t.guest_authenticated_disagree + EXCLUDED.guest_authenticated_disagree,
+            trusted_user_agree = t.trusted_user_agree + EXCLUDED.trusted_user_agree,
+            trusted_user_disagree =
+                t.trusted_user_disagree + EXCLUDED.trusted_user_disagree,
+            consensus_status = annotation_vote_consensus(
+                t.agree_count + EXCLUDED.agree_count,
+                t.disagree_count + EXCLUDED.disagree_count,
+                v_min_votes, v_threshold
+            ),
+            consensus_score = annotation_vote_score(
+                t.agree_count + EXCLUDED.agree_count,
+                t.disagree_count + EXCLUDED.disagree_count
+            ),
+            updated_at = now();
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """
+
+_PREVIOUS_APPLY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION annotation_vote_tallies_apply(
+        p_vote annotation_votes, p_sign integer
+    ) RETURNS void AS $fn$
+    DECLARE
+        v_min_votes integer;
+        v_threshold double precision;
+        d_agree integer := CASE WHEN p_vote.vote = 1 THEN p_sign ELSE 0 END;
+        d_disagree integer := CASE WHEN p_vote.vote = -1 THEN p_sign ELSE 0 END;
+        d_unsure integer := CASE WHEN p_vote.vote = 0 THEN p_sign ELSE 0 END;
+    BEGIN
+        SELECT review_min_votes, review_consensus_threshold
+        INTO v_min_votes, v_threshold
+        FROM projects WHERE id = p_vote.project_id;
+
+        IF p_sign < 0 THEN
+            -- Never insert on a decrement: inside an annotation / project
+            -- delete cascade the tally row is already gone.
+            UPDATE annotation_vote_tallies AS t SET
+                agree_count = t.agree_count + d_agree,
+                disagree_count = t.disagree_count + d_disagree,
+                unsure_count = t.unsure_count + d_unsure,
+                member_agree = t.member_agree
+                    + CASE WHEN p_vote.source = 'member' THEN d_agree ELSE 0 END,
+                member_disagree = t.member_disagree
+                    + CASE WHEN p_vote.source = 'member' THEN d_disagree ELSE 0 END,
+                guest_authenticated_agree = t.guest_authenticated_agree
+                    + CASE WHEN p_vote.source = 'guest_authenticated'
+                      THEN d_agree ELSE 0 END,
+                guest_authenticated_disagree = t.guest_authenticated_disagree
+                    + CASE WHEN p_vote.source = 'guest_authenticated'
+                      THEN d_disagree ELSE 0 END,
+                trusted_user_agree = t.trusted_user_agree
+                    + CASE WHEN p_vote.source = 'trusted_user' THEN d_agree ELSE 0 END,
+                trusted_user_disagree = t.trusted_user_disagree
+                    + CASE WHEN p_vote.source = 'trusted_user' THEN d_disagree ELSE 0 END,
+                consensus_status = annotation_vote_consensus(
+                    t.agree_count + d_agree, t.disagree_count + d_disagree,
+                    COALESCE(v_min_votes, 2), COALESCE(v_threshold, 0.667)
+                ),
+                consensus_score = annotation_vote_score(
+                    t.agree_count + d_agree, t.disagree_count + d_disagree
+                ),
+                updated_at = now()
+            WHERE t.annotation_id = p_vote.annotation_id;
+            RETURN;
+        END IF;
+
+        INSERT INTO annotation_vote_tallies AS t (
+            annotation_id, project_id, agree_count, disagree_count, unsure_count,
+            member_agree, member_disagree,
+            guest_authenticated_agree, guest_authenticated_disagree,
+            trusted_user_agree, trusted_user_disagree,
+            consensus_status, consensus_score, updated_at
+        ) VALUES (
+            p_vote.annotation_id, p_vote.project_id, d_agree, d_disagree, d_unsure,
+            CASE WHEN p_vote.source = 'member' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'member' THEN d_disagree ELSE 0 END,
+            CASE WHEN p_vote.source = 'guest_authenticated' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'guest_authenticated' THEN d_disagree ELSE 0 END,
+            CASE WHEN p_vote.source = 'trusted_user' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'trusted_user' THEN d_disagree ELSE 0 END,
+            annotation_vote_consensus(d_agree, d_disagree, v_min_votes, v_threshold),
+            annotation_vote_score(d_agree, d_disagree),
+            now()
+        )
+        ON CONFLICT (annotation_id) DO UPDATE SET
+            agree_count = t.agree_count + EXCLUDED.agree_count,
+            disagree_count = t.disagree_count + EXCLUDED.disagree_count,
+            unsure_count = t.unsure_count + EXCLUDED.unsure_count,
+            member_agree = t.member_agree + EXCLUDED.member_agree,
+            member_disagree = t.member_disagree + EXCLUDED.member_disagree,
+            guest_authenticated_agree =
+                t.guest_authenticated_agree + EXCLUDED.guest_authenticated_agree,
+            guest_authenticated_disagree =
+                t.guest_authenticated_disagree + EXCLUDED.guest_authenticated_disagree,
+            trusted_user_agree = t.trusted_user_agree + EXCLUDED.trusted_user_agree,
+            trusted_user_disagree =
+                t.trusted_user_disagree + EXCLUDED.trusted_user_disagree,
+            consensus_status = annotation_vote_consensus(
+                t.agree_count + EXCLUDED.agree_count,
+                t.disagree_count + EXCLUDED.disagree_count,
+                v_min_votes, v_threshold
+            ),
+            consensus_score = annotation_vote_score(
+                t.agree_count + EXCLUDED.agree_count,
+                t.disagree_count + EXCLUDED.disagree_count
+            ),
+            updated_at = now();
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """
+
+
+def upgrade() -> None:
+    op.execute(_APPLY_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(_PREVIOUS_APPLY_FUNCTION)
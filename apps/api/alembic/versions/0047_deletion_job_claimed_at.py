@@ -0,0 +1,36 @@
+"""Record when a deletion job was last claimed by a worker.
+
+Revision ID: 0047
+Revises: 0046
+Create Date: 2026-10-19
+
+A deletion worker killed by the Celery hard time limit (or lost with its
+host) never re-enqueues or fails its job, so the job stayed ``running`` and
+its dataset or project ``deleting`` forever. The worker now stamps
+``claimed_at`` whenever it claims a job, and the periodic task in
+:mod:`echoroo.workers.deletion_tasks` re-sends ``running`` jobs claimed
+longer ago than any live task can run. Rows claimed before this revision
+keep ``claimed_at`` NULL; the task falls back to ``started_at`` for them.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0047"
+down_revision: str | None = "0046"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "deletion_jobs",
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("deletion_jobs", "claimed_at")
@@ -0,0 +1,38 @@
+"""Drop the unused prefix indexes on the taxon search names.
+
+Revision ID: 0048
+Revises: 0047
+Create Date: 2026-10-19
+
+Revision 0042 added a ``varchar_pattern_ops`` B-tree on ``search_name`` of
+``taxa`` and ``taxon_vernacular_names`` for prefix matches of queries too
+short to form a trigram. The species search now matches every query as a
+substring through the ``pg_trgm`` GIN indexes, so nothing reads the prefix
+indexes any more; they only slow down taxon writes and the GBIF syncs.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0048"
+down_revision: str | None = "0047"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+_TABLES = ("taxa", "taxon_vernacular_names")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.drop_index(f"ix_{table}_search_name_prefix", table_name=table)
+
+
+def downgrade() -> None:
+    for table in reversed(_TABLES):
+        op.create_index(
+            f"ix_{table}_search_name_prefix",
+            table,
+            ["search_name"],
+            postgresql_ops={"search_name": "varchar_pattern_ops"},
+        )
@@ -6,6 +6,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from echoroo.core import s3_async
 from echoroo.core.actions import (
     CLIP_AUDIO_ACTION,
     CLIP_CREATE_ACTION,
@@ -18,9 +19,17 @@ from echoroo.core.actions import (
     CLIP_UPDATE_ACTION,
 )
 from echoroo.core.database import DbSession
+from echoroo.core.pagination import (
+    InvalidCursorError,
+    TotalMode,
+    decode_cursor,
+    is_estimate,
+    next_cursor,
+)
 from echoroo.core.permissions import gate_action
 from echoroo.core.settings import get_settings
 from echoroo.middleware.auth import CurrentUser
+from echoroo.models.clip import Clip
 from echoroo.schemas.clip import (
     ClipCreate,
     ClipDetailResponse,
@@ -92,6 +101,8 @@ async def list_clips(
     page_size: int = 50,
     sort_by: str = "start_time",
     sort_order: str = "asc",
+    cursor: str | None = None,
+    total_mode: TotalMode = "exact",
 ) -> ClipListResponse:
     """List clips for a recording.
 
@@ -104,11 +115,14 @@ async def list_clips(
         page_size: Items per page (default: 50)
         sort_by: Sort column (default: start_time)
         sort_order: Sort order (asc/desc, default: asc)
+        cursor: Opaque ``next_cursor`` from a previous page (keyset mode)
+        total_mode: ``exact`` (default) or ``estimate``
 
     Returns:
         Paginated list of clips
 
     Raises:
+        400: Malformed or mismatched cursor
         401: Not authenticated
     """
     await gate_action(
@@ -118,9 +132,23 @@ async def list_clips(
         request=request,
         db=db,
     )
-    clips, total = await service.list_by_recording(
-        recording_id, page, page_size, sort_by, sort_order
-    )
+    sort_key = sort_by if hasattr(Clip, sort_by) else "start_time"
+    descending = sort_order != "asc"
+    try:
+        keyset = (
+            decode_cursor(cursor, sort_key=sort_key, descending=descending) if cursor else None
+        )
+        clips, total = await service.list_by_recording(
+            recording_id,
+            page,
+            page_size,
+            sort_by,
+            sort_order,
+            cursor=keyset,
+            total_mode=total_mode,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     pages = (total + page_size - 1) // page_size
     return ClipListResponse(
         items=[ClipResponse.model_validate(c) for c in clips],
@@ -128,6 +156,8 @@ async def list_clips(
         page=page,
         page_size=page_size,
         pages=pages,
+        next_cursor=next_cursor(clips, page_size, sort_key=sort_key, descending=descending),
+        total_is_estimate=is_estimate(total),
     )
 
 
@@ -428,7 +458,9 @@ async def get_clip_audio(
 
     try:
         audio_svc = audio_service
-        await asyncio.to_thread(audio_svc.ensure_file_local, recording.path)
+        await s3_async.run_blocking(
+            audio_svc.ensure_window_local, recording.path, clip.start_time, clip.end_time
+        )
         data, samplerate = await asyncio.to_thread(
             lambda: audio_svc.resample_for_playback(
                 recording.path,
@@ -514,7 +546,9 @@ async def get_clip_spectrogram(
 
     try:
         audio_svc = audio_service
-        await asyncio.to_thread(audio_svc.ensure_file_local, recording.path)
+        await s3_async.run_blocking(
+            audio_svc.ensure_window_local, recording.path, clip.start_time, clip.end_time
+        )
         png_bytes = await asyncio.to_thread(
             lambda: audio_svc.generate_spectrogram(
                 recording.path,
@@ -585,7 +619,9 @@ async def download_clip(
 
     try:
         audio_svc = audio_service
-        await asyncio.to_thread(audio_svc.ensure_file_local, recording.path)
+        await s3_async.run_blocking(
+            audio_svc.ensure_window_local, recording.path, clip.start_time, clip.end_time
+        )
         data, samplerate = await asyncio.to_thread(
             lambda: audio_svc.read_audio(
                 recording.path,
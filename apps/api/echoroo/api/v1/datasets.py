@@ -49,6 +49,7 @@ from echoroo.schemas.dataset import (
     ImportRequest,
     ImportStatusResponse,
 )
+from echoroo.schemas.deletion_job import DeletionJobResponse
 from echoroo.services.audio import AudioService
 from echoroo.services.dataset import DatasetService
 from echoroo.services.export import ExportService
@@ -340,8 +341,11 @@ async def delete_dataset(
     current_user: CurrentUser,
     service: DatasetServiceDep,
     db: DbSession,
-) -> None:
-    """Delete dataset.
+) -> DeletionJobResponse:
+    """Queue the background deletion of a dataset.
+
+    The dataset is marked ``deleting`` and removed by a Celery job; poll
+    ``GET /web/v1/deletion-jobs/{job_id}`` for progress.
 
     Args:
         project_id: Project's UUID
@@ -350,6 +354,9 @@ async def delete_dataset(
         service: Dataset service instance
         db: Database session
 
+    Returns:
+        The queued (or already running) deletion job
+
     Raises:
         401: Not authenticated
         403: Not project admin
@@ -362,9 +369,17 @@ async def delete_dataset(
         request=request,
         db=db,
     )
-    await service.delete(current_user.id, project_id, dataset_id)
+    job = await service.delete(current_user.id, project_id, dataset_id)
+    response = DeletionJobResponse.model_validate(job)
     await db.commit()
 
+    if job.status == "queued":
+        from echoroo.workers.deletion_tasks import run_deletion_job
+
+        run_deletion_job.delay(str(job.id))
+
+    return response
+
 
 # T045: Import endpoints
 async def start_import(
@@ -397,7 +412,7 @@ async def start_import(
         401: Not authenticated
         403: Access denied
         404: Dataset or upload session not found
-        409: Upload session not in validated state
+        409: Upload session not in validated state, or dataset being deleted
     """
     # Gate: admin-only (DATASET_IMPORT_ACTION → MANAGE_DATASET_ADMIN)
     await gate_action(
@@ -409,7 +424,12 @@ async def start_import(
     )
 
     # Verify dataset access (membership + dataset belongs to project)
-    await service.get_by_id(current_user.id, project_id, dataset_id)
+    dataset = await service.get_by_id(current_user.id, project_id, dataset_id)
+    if dataset.status == DatasetStatus.DELETING:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Dataset is being deleted",
+        )
 
     upload_session_repo = UploadSessionRepository(db)
     source = request.source
@@ -28,6 +28,7 @@ from echoroo.core.actions import (
     DETECTION_REJECT_ACTION,
 )
 from echoroo.core.database import DbSession
+from echoroo.core.pagination import InvalidCursorError, TotalMode
 from echoroo.core.permissions import Permission, gate_action
 from echoroo.core.response_filter import (
     MASKED_SPECIES_LABEL,
@@ -35,8 +36,8 @@ from echoroo.core.response_filter import (
     apply_response_filter,
 )
 from echoroo.middleware.auth import CurrentUser
-from echoroo.models.enums import DetectionStatus
-from echoroo.repositories.annotation import AnnotationRepository
+from echoroo.models.enums import ConsensusStatus, DetectionStatus
+from echoroo.repositories.annotation import AnnotationRepository, DetectionSort
 from echoroo.repositories.annotation_vote import AnnotationVoteRepository
 from echoroo.repositories.confirmed_region import ConfirmedRegionRepository
 from echoroo.repositories.detection_run import DetectionRunRepository
@@ -200,7 +201,7 @@ async def _build_detection_filter_maps(
         project_id,
         taxon_ids,
     )
-    # ``override_map`` is typed as dict[tuple[UUID, str], ProjectTaxonSensitivityOverride]
+    # ``override_map`` is typed as dict[tuple[UUID, str], OverrideSnapshot]
     # by the loader; the response filter accepts the broader
     # ``Mapping[tuple[Any, str], Any]`` so the cast below is purely for typing.
     return sensitivity_map, dict(override_map)
@@ -288,6 +289,10 @@ async def list_detections(
         pattern="^(en|ja)$",
         description="Locale code for vernacular name resolution (en, ja)",
     ),
+    cursor: str | None = None,
+    total_mode: TotalMode = "exact",
+    consensus: ConsensusStatus | None = None,
+    sort_by: DetectionSort = "created_at",
 ) -> DetectionListResponse:
     """List detection annotations for a project.
 
@@ -311,11 +316,16 @@ async def list_detections(
         page: Page number (default: 1)
         page_size: Items per page (default: 50)
         locale: Locale code used to populate ``vernacular_name`` on embedded tags
+        cursor: Opaque ``next_cursor`` from a previous page (keyset mode)
+        total_mode: ``exact`` (default) or ``estimate``
+        consensus: Optional vote-consensus filter
+        sort_by: ``created_at`` (default, newest first) or ``consensus_score``
 
     Returns:
         Paginated list of detections
 
     Raises:
+        400: Malformed or mismatched cursor
         401: Not authenticated
         403: Permission denied
     """
@@ -332,22 +342,30 @@ async def list_detections(
     effective: frozenset[Permission] = getattr(state, "effective_permissions", frozenset())
     role: str = getattr(state, "normalized_role", "Guest")
 
-    result = await service.list_detections(
-        project_id=project_id,
-        tag_id=tag_id,
-        status=status,
-        confidence_min=confidence_min,
-        confidence_max=confidence_max,
-        dataset_id=dataset_id,
-        recording_id=recording_id,
-        detection_run_id=detection_run_id,
-        page=page,
-        page_size=page_size,
-        current_user_id=current_user.id,
-        min_votes=min_votes,
-        threshold=threshold,
-        locale=locale,
-    )
+    try:
+        result = await service.list_detections(
+            project_id=project_id,
+            tag_id=tag_id,
+            status=status,
+            confidence_min=confidence_min,
+            confidence_max=confidence_max,
+            dataset_id=dataset_id,
+            recording_id=recording_id,
+            detection_run_id=detection_run_id,
+            page=page,
+            page_size=page_size,
+            current_user_id=current_user.id,
+            min_votes=min_votes,
+            threshold=threshold,
+            locale=locale,
+            cursor=cursor,
+            total_mode=total_mode,
+            consensus=consensus,
+            sort_by=sort_by,
+        )
+    except InvalidCursorError as exc:
+        # ``status`` is shadowed by the DetectionStatus filter parameter here.
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     # Round 1 review C1: bulk-preload sensitivity + override maps once,
     # then apply Stage-2 filter per-item using the populated maps.
     sensitivity_map, override_map = await _build_detection_filter_maps(
@@ -42,6 +42,7 @@ from echoroo.middleware.auth import CurrentUser
 from echoroo.models.enums import ProjectVisibility
 from echoroo.repositories.project import ProjectRepository
 from echoroo.repositories.user import UserRepository
+from echoroo.schemas.deletion_job import DeletionJobResponse
 from echoroo.schemas.project import (
     ProjectCreateRequest,
     ProjectLicenseHistoryEntry,
@@ -280,9 +281,10 @@ async def update_project(
 
 @router.delete(
     "/{project_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=DeletionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Delete project",
-    description="Delete project (owner only)",
+    description="Queue the background deletion of a project (owner only)",
 )
 async def delete_project(
     project_id: UUID,
@@ -290,8 +292,8 @@ async def delete_project(
     current_user: CurrentUser,
     service: ProjectServiceDep,
     db: DbSession,
-) -> None:
-    """Delete a project.
+) -> DeletionJobResponse:
+    """Queue the background deletion of a project.
 
     Guarded by :data:`PROJECT_DELETE_ACTION`
     (:data:`Permission.DELETE_PROJECT`). Only the project owner has this
@@ -316,9 +318,17 @@ async def delete_project(
         request=request,
         db=db,
     )
-    await service.delete_project(current_user.id, project_id)
+    job = await service.delete_project(current_user.id, project_id)
+    response = DeletionJobResponse.model_validate(job)
     await db.commit()
 
+    if job.status == "queued":
+        from echoroo.workers.deletion_tasks import run_deletion_job
+
+        run_deletion_job.delay(str(job.id))
+
+    return response
+
 
 # =============================================================================
 # Phase 7 polish round 2 (致命 1) — license PATCH + history GET
@@ -29,6 +29,7 @@ from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, R
 from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from echoroo.core import s3_async
 from echoroo.core.actions import (
     RECORDING_DELETE_ACTION,
     RECORDING_LIST_ACTION,
@@ -36,6 +37,13 @@ from echoroo.core.actions import (
     RECORDING_UPDATE_ACTION,
 )
 from echoroo.core.database import DbSession
+from echoroo.core.pagination import (
+    InvalidCursorError,
+    TotalMode,
+    decode_cursor,
+    is_estimate,
+    next_cursor,
+)
 from echoroo.core.permissions import Permission, gate_action
 from echoroo.core.response_filter import apply_response_filter
 from echoroo.core.settings import get_settings
@@ -46,6 +54,7 @@ from echoroo.core.stream_guard import (
     recheck_action_permission,
 )
 from echoroo.middleware.auth import API_TOKEN_PREFIX, CurrentUser, _stamp_superuser_status
+from echoroo.models.recording import Recording
 from echoroo.models.user import User
 from echoroo.schemas.recording import (
     RecordingDetailResponse,
@@ -166,6 +175,8 @@ def get_audio_service() -> AudioService:
         settings.AUDIO_ROOT,
         settings.AUDIO_CACHE_DIR,
         s3_audio_cache_dir=settings.S3_AUDIO_CACHE_DIR,
+        playback_cache_dir=settings.PLAYBACK_CACHE_DIR,
+        playback_cache_max_bytes=settings.PLAYBACK_CACHE_MAX_BYTES,
     )
 
 
@@ -217,6 +228,8 @@ async def list_recordings(
     samplerate: int | None = None,
     sort_by: str = "datetime",
     sort_order: str = "desc",
+    cursor: str | None = None,
+    total_mode: TotalMode = "exact",
 ) -> RecordingListResponse:
     """List/search recordings across project datasets.
 
@@ -239,12 +252,16 @@ async def list_recordings(
         datetime_to: Filter to datetime
         samplerate: Filter by samplerate
         sort_by: Sort column (default: datetime)
-        sort_order: Sort order (asc/desc, default: desc)
+        sort_order: Sort order (asc/desc, default: desc); the cross-dataset
+            search is always newest first
+        cursor: Opaque ``next_cursor`` from a previous page (keyset mode)
+        total_mode: ``exact`` (default) or ``estimate``
 
     Returns:
         Paginated list of recordings
 
     Raises:
+        400: Malformed or mismatched cursor
         401: Not authenticated
         403: Permission denied
     """
@@ -275,15 +292,48 @@ async def list_recordings(
                 detail="Dataset not found",
             )
 
-        # List by specific dataset
-        recordings, total = await service.list_by_dataset(
-            dataset_id, page, page_size, search, datetime_from, datetime_to, samplerate, sort_by, sort_order
-        )
+        # List by specific dataset. The repository falls back to datetime
+        # for unknown sort columns; the cursor is bound to that effective key.
+        sort_key = sort_by if hasattr(Recording, sort_by) else "datetime"
+        descending = sort_order != "asc"
     else:
-        # Search across all datasets in project
-        recordings, total = await service.search_by_project(
-            project_id, page, page_size, search, site_id, dataset_id, datetime_from, datetime_to
+        # The cross-dataset search is always newest first.
+        sort_key, descending = "datetime", True
+
+    try:
+        keyset = (
+            decode_cursor(cursor, sort_key=sort_key, descending=descending) if cursor else None
         )
+        if dataset_id:
+            recordings, total = await service.list_by_dataset(
+                dataset_id,
+                page,
+                page_size,
+                search,
+                datetime_from,
+                datetime_to,
+                samplerate,
+                sort_key,
+                sort_order,
+                cursor=keyset,
+                total_mode=total_mode,
+            )
+        else:
+            # Search across all datasets in project
+            recordings, total = await service.search_by_project(
+                project_id,
+                page,
+                page_size,
+                search,
+                site_id,
+                dataset_id,
+                datetime_from,
+                datetime_to,
+                cursor=keyset,
+                total_mode=total_mode,
+            )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     pages = (total + page_size - 1) // page_size
     items = [RecordingResponse.model_validate(r) for r in recordings]
@@ -307,6 +357,10 @@ async def list_recordings(
         page=page,
         page_size=page_size,
         pages=pages,
+        next_cursor=next_cursor(
+            recordings, page_size, sort_key=sort_key, descending=descending
+        ),
+        total_is_estimate=is_estimate(total),
     )
 
 
@@ -557,6 +611,12 @@ async def delete_recording(
     await db.commit()
 
 
+# Upper bound on the bytes returned for an open-ended (``bytes=N-``) Range
+# request into a cached OGG copy. The window is extended to the next OGG page
+# boundary using the playback cache's seek index.
+OGG_RANGE_WINDOW_BYTES = 1024 * 1024
+
+
 # T061: Audio streaming with HTTP Range support
 #
 # W2-4 PR-D (2026-07-07): the ``@router.get("/{recording_id}/audio", ...)``
@@ -660,7 +720,9 @@ async def stream_audio(
     assert service.audio_service is not None  # narrowing for Pyright
 
     try:
-        local_file_path = service.audio_service.ensure_file_local(recording.path)
+        local_file_path = await s3_async.run_blocking(
+            service.audio_service.ensure_file_local, recording.path
+        )
     except FileNotFoundError as err:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audio file not found") from err
 
@@ -679,24 +741,26 @@ async def stream_audio(
     )
 
     # For passthrough mode, serve the compressed OGG version to reduce transfer size
-    # (83 MB WAV -> ~3-5 MB OGG over SSH). The compressed file is created on first
-    # access and cached on disk for subsequent requests.
+    # (83 MB WAV -> ~3-5 MB OGG over SSH). The compressed copy is produced by a
+    # background worker (at import, or scheduled here on the first miss); until
+    # it exists the raw file is served below so playback never waits on ffmpeg.
     if is_passthrough:
-        import logging
-
-        _logger = logging.getLogger(__name__)
-        try:
-            compressed_path = service.audio_service.get_compressed_for_playback(recording.path)
-        except Exception as exc:
-            _logger.warning(
-                "OGG compression failed for %s, falling back to raw WAV: %s",
-                recording.path,
-                exc,
+        compressed_path = service.audio_service.get_cached_playback(recording.path)
+        if compressed_path is None:
+            # Claiming the marker and publishing to the broker both block;
+            # keep them off the event loop.
+            await asyncio.to_thread(
+                service.audio_service.schedule_playback_transcode, recording.path
             )
-            compressed_path = None
 
         if compressed_path is not None:
             ogg_size = compressed_path.stat().st_size
+            seek_index = service.audio_service.get_playback_seek_index(recording.path)
+            ogg_headers: dict[str, str] = {}
+            if seek_index is not None and seek_index.duration > 0:
+                # Lets the browser show the duration without bisecting to the
+                # last OGG page with extra Range requests.
+                ogg_headers["X-Content-Duration"] = f"{seek_index.duration:.3f}"
 
             if range is None:
                 # No Range header: stream the full compressed file.
@@ -759,15 +823,23 @@ async def stream_audio(
                     _iter_ogg_guarded(),
                     status_code=status.HTTP_200_OK,
                     media_type="audio/ogg",
+                    headers=ogg_headers,
                 )
 
             # Range request: serve the requested byte slice of the OGG file
             range_value = range.replace("bytes=", "")
             parts = range_value.split("-")
             req_start = int(parts[0]) if parts[0] else 0
-            req_end = int(parts[1]) if len(parts) > 1 and parts[1] else ogg_size - 1
+            open_ended = not (len(parts) > 1 and parts[1])
+            req_end = ogg_size - 1 if open_ended else int(parts[1])
 
             req_start = max(0, min(req_start, ogg_size - 1))
+            if open_ended and seek_index is not None:
+                # Seeks arrive as ``bytes=N-``; answer with a bounded window
+                # ending on an OGG page boundary instead of reading the whole
+                # tail of a long file into memory. The browser issues the next
+                # Range request from where this one stops.
+                req_end = seek_index.page_aligned_end(req_start, OGG_RANGE_WINDOW_BYTES)
             req_end = max(req_start, min(req_end, ogg_size - 1))
             chunk_size = req_end - req_start + 1
 
@@ -780,6 +852,7 @@ async def stream_audio(
                 status_code=status.HTTP_206_PARTIAL_CONTENT,
                 media_type="audio/ogg",
                 headers={
+                    **ogg_headers,
                     "Accept-Ranges": "bytes",
                     "Content-Length": str(chunk_size),
                     "Content-Range": f"bytes {req_start}-{req_end}/{ogg_size}",
@@ -1097,7 +1170,11 @@ async def get_spectrogram(
     assert service.audio_service is not None  # narrowing for Pyright
 
     try:
-        await asyncio.to_thread(service.audio_service.ensure_file_local, recording.path)
+        # Spectrogram chunks of long recordings only need their own window;
+        # uncompressed WAVs are read with a ranged GET instead of a full download.
+        await s3_async.run_blocking(
+            service.audio_service.ensure_window_local, recording.path, start, end
+        )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audio file not found") from exc
 
@@ -1182,7 +1259,9 @@ async def download_recording(
         )
 
     try:
-        file_path = service.audio_service.ensure_file_local(recording.path)
+        file_path = await s3_async.run_blocking(
+            service.audio_service.ensure_file_local, recording.path
+        )
     except FileNotFoundError as err:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audio file not found") from err
 
@@ -318,6 +318,7 @@ async def _prepare_batch_job(
     # Upload new files to S3 and set s3_key on each matching source
     s3_prefix = f"search_reference/{project_id}/{job_id}"
     try:
+        from echoroo.core import s3_async
         from echoroo.core.s3 import get_s3_client
         from echoroo.core.settings import get_settings as _get_settings
 
@@ -329,23 +330,27 @@ async def _prepare_batch_job(
         # later refactor adding it cannot regress).
         from echoroo.services.s3_upload_sanitizer import sanitize_put_object_kwargs
 
-        for field_name, content in uploaded_file_bytes.items():
-            suffix = uploaded_file_suffixes[field_name]
-            s3_key = f"{s3_prefix}/{field_name}{suffix}"
-            put_kwargs = sanitize_put_object_kwargs(
-                {
-                    "Bucket": s3_settings.S3_BUCKET,
-                    "Key": s3_key,
-                    "Body": content,
-                }
-            )
-            s3_client.put_object(**put_kwargs)
+        def _put_references() -> None:
+            for field_name, content in uploaded_file_bytes.items():
+                suffix = uploaded_file_suffixes[field_name]
+                s3_key = f"{s3_prefix}/{field_name}{suffix}"
+                put_kwargs = sanitize_put_object_kwargs(
+                    {
+                        "Bucket": s3_settings.S3_BUCKET,
+                        "Key": s3_key,
+                        "Body": content,
+                    }
+                )
+                s3_client.put_object(**put_kwargs)
+
+                # Assign s3_key to all matching sources across species
+                for sp in batch_request.species:
+                    for src in sp.sources:
+                        if src.file_key == field_name and src.s3_key is None:
+                            src.s3_key = s3_key
 
-            # Assign s3_key to all matching sources across species
-            for sp in batch_request.species:
-                for src in sp.sources:
-                    if src.file_key == field_name and src.s3_key is None:
-                        src.s3_key = s3_key
+        # One hop to the S3 I/O pool for the whole set, off the event loop.
+        await s3_async.run_blocking(_put_references)
 
     except Exception as _s3_exc:
         logger.exception("Failed to upload reference audio to S3 for %s %s", log_tag, job_id)
@@ -9,10 +9,8 @@ itself); no ``@router.get`` decorator is mounted here.
 
 from __future__ import annotations
 
-import collections.abc
 import logging
 from pathlib import Path
-from typing import Any
 from uuid import UUID
 
 from fastapi import Header, HTTPException, Request, status
@@ -88,18 +86,9 @@ async def stream_reference_audio(
     s3_key = session.reference_audio_keys[source_index]
 
     try:
-        from echoroo.core.s3 import get_s3_client as _get_s3_stream_client
-        from echoroo.core.settings import get_settings as _get_stream_settings
-
-        _stream_settings = _get_stream_settings()
-        _stream_client = _get_s3_stream_client()
-        s3_params: dict[str, Any] = {
-            "Bucket": _stream_settings.S3_BUCKET,
-            "Key": s3_key,
-        }
-        if range:
-            s3_params["Range"] = range
-        s3_response = _stream_client.get_object(**s3_params)
+        from echoroo.core import s3_async
+
+        s3_stream = await s3_async.open_object(s3_key, byte_range=range)
     except Exception as exc:
         logger.exception("Failed to stream reference audio key=%s", s3_key)
         raise HTTPException(
@@ -107,36 +96,23 @@ async def stream_reference_audio(
             detail="Failed to retrieve reference audio from storage",
         ) from exc
 
-    body = s3_response["Body"]
-    content_length = s3_response.get("ContentLength")
-
     # Determine content type from file extension
     suffix = Path(s3_key).suffix.lower()
     content_type, _ = mimetypes.guess_type(f"file{suffix}")
     if not content_type:
         content_type = "audio/wav"
 
-    def _iter_stream() -> collections.abc.Iterator[bytes]:
-        try:
-            while True:
-                chunk = body.read(65536)
-                if not chunk:
-                    break
-                yield chunk
-        finally:
-            body.close()
-
     response_headers: dict[str, str] = {}
-    if content_length is not None:
-        response_headers["Content-Length"] = str(content_length)
+    if s3_stream.content_length is not None:
+        response_headers["Content-Length"] = str(s3_stream.content_length)
     response_headers["Accept-Ranges"] = "bytes"
 
     response_status = 206 if range else 200
-    if range and "ContentRange" in s3_response:
-        response_headers["Content-Range"] = s3_response["ContentRange"]
+    if range and s3_stream.content_range:
+        response_headers["Content-Range"] = s3_stream.content_range
 
     return StreamingResponse(
-        _iter_stream(),
+        s3_stream.chunks(65536),
         status_code=response_status,
         media_type=content_type,
         headers=response_headers,
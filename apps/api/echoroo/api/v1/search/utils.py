@@ -38,6 +38,8 @@ async def _resolve_vernacular_via_gbif(
     Performs the following steps:
     1. Match the scientific name via GBIF /species/match to get a usageKey.
     2. Fetch vernacular names via GBIF /species/{key}/vernacularNames.
+       Both lookups go through the taxon-resolution cache, so a name GBIF
+       has already answered (or failed to match) costs no network call.
     3. Insert the taxon and its vernacular names into the local database for
        future lookups (so subsequent searches are fast).
 
@@ -53,17 +55,18 @@ async def _resolve_vernacular_via_gbif(
 
     from echoroo.models.taxon import Taxon
     from echoroo.models.taxon_vernacular_name import TaxonVernacularName
-    from echoroo.services.gbif import GBIFService
+    from echoroo.repositories import taxon_name_index
+    from echoroo.services.taxon_resolution import TaxonResolver
 
     # Outer guard: any unexpected failure (network, async/greenlet mismatch,
     # SQLAlchemy state error) must degrade to "no vernacular name" rather than
     # propagate a 500 to the API caller. Routes that call this function expect
     # a best-effort enrichment, not a hard dependency.
     try:
-        gbif = GBIFService()
+        resolver = TaxonResolver(db)
 
         # Step 1: resolve scientific name to GBIF taxon key
-        resolve_result = await gbif.resolve_taxon(scientific_name)
+        resolve_result = await resolver.resolve(scientific_name)
         if resolve_result is None:
             logger.debug("GBIF could not resolve scientific name=%r", scientific_name)
             return None
@@ -72,7 +75,7 @@ async def _resolve_vernacular_via_gbif(
         logger.debug("GBIF resolved %r -> taxon_key=%d", scientific_name, taxon_key)
 
         # Step 2: fetch vernacular names from GBIF
-        vernacular_entries = await gbif.get_vernacular_names(taxon_key)
+        vernacular_entries = await resolver.vernacular_names(scientific_name, taxon_key)
         logger.debug(
             "GBIF vernacular names for key=%d: %d entries", taxon_key, len(vernacular_entries)
         )
@@ -146,6 +149,7 @@ async def _resolve_vernacular_via_gbif(
         # unit-of-work at request termination.  We intentionally do not commit
         # here to keep the route's transactional boundary unchanged.
         await db.flush()
+        taxon_name_index.invalidate_on_commit(db)
         logger.debug(
             "Cached taxon %r (id=%s) with %d vernacular names",
             scientific_name,
@@ -6,7 +6,10 @@ from the frontend. All endpoints are scoped to a project_id for access control.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import ipaddress
+import json
 import logging
 import socket
 import urllib.parse
@@ -15,15 +18,21 @@ from uuid import UUID
 
 import httpx
 from fastapi import APIRouter, HTTPException, Query, Request, status
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from echoroo.core.actions import XENO_CANTO_AUDIO_ACTION
 from echoroo.core.database import DbSession
+from echoroo.core.http_clients import (
+    XENO_CANTO,
+    XENO_CANTO_AUDIO,
+    get_http_client,
+    get_pinned_http_client,
+)
 from echoroo.core.permissions import check_project_access, gate_action
 from echoroo.core.settings import get_settings
-from echoroo.core.url_allowlist import PinnedIPAsyncTransport
 from echoroo.middleware.auth import CurrentUser
 from echoroo.schemas.xeno_canto import XenoCantoRecording, XenoCantoSearchResponse
+from echoroo.services.xeno_canto_cache import CachedMedia, get_xeno_canto_media_cache
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +51,9 @@ _SONOGRAM_ALLOWED_HOSTS: frozenset[str] = frozenset({"xeno-canto.org"})
 # SSRF guard: maximum number of HTTP redirects to follow before giving up.
 _SONOGRAM_MAX_REDIRECTS: int = 3
 
+# Redis key prefix of cached search responses (raw upstream JSON).
+_SEARCH_CACHE_PREFIX = "xeno_canto:search:"
+
 
 def _validate_sonogram_url(url: str) -> tuple[str, str]:
     """Validate a sonogram proxy target URL against the SSRF allowlist.
@@ -215,6 +227,49 @@ def _xeno_canto_not_configured_exception() -> HTTPException:
     )
 
 
+def _cached_media_response(entry: CachedMedia, headers: dict[str, str]) -> FileResponse:
+    """Serve a cached Xeno-canto file.
+
+    ``FileResponse`` answers ``Range`` / ``If-Range`` requests from the file
+    itself, so seeking in a cached preview never touches Xeno-canto.
+    """
+    return FileResponse(entry.path, media_type=entry.content_type, headers=headers)
+
+
+def _search_cache_key(xc_query: str, page: int) -> str:
+    digest = hashlib.sha256(f"{xc_query}\x00{page}".encode()).hexdigest()
+    return f"{_SEARCH_CACHE_PREFIX}{digest}"
+
+
+async def _search_cache_get(key: str) -> dict[str, object] | None:
+    """Return a cached raw search response, or ``None`` on miss/redis error."""
+    if get_settings().XENO_CANTO_SEARCH_CACHE_TTL_SECONDS <= 0:
+        return None
+    try:
+        from echoroo.core.redis import get_redis_connection  # noqa: PLC0415
+
+        client = await get_redis_connection()
+        value = await client.get(key)
+        if value is None:
+            return None
+        data = json.loads(value)
+    except Exception:  # noqa: BLE001 — cache is best-effort
+        return None
+    return data if isinstance(data, dict) else None
+
+
+async def _search_cache_set(key: str, data: dict[str, object]) -> None:
+    """Cache a raw search response for the configured TTL. Best-effort."""
+    ttl = get_settings().XENO_CANTO_SEARCH_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return
+    try:
+        from echoroo.core.redis import get_redis_connection  # noqa: PLC0415
+
+        client = await get_redis_connection()
+        await client.set(key, json.dumps(data), ex=ttl)
+    except Exception:  # noqa: BLE001 — cache write must never fail search
+        return
 
 
 def _parse_float(value: str) -> float | None:
@@ -336,22 +391,29 @@ async def proxy_audio(
     request: Request,
     current_user: CurrentUser,
     db: DbSession,
-) -> StreamingResponse:
+) -> Response:
     """Stream a Xeno-canto audio file back to the client.
 
     Downloads the audio file from ``https://xeno-canto.org/{xc_id}/download``
     and streams it to the client so the full file is never buffered in memory.
-    The httpx streaming context manager stays open for the lifetime of the
-    response body generator.
+    The upstream response stays open for the lifetime of the response body
+    generator.
+
+    Downloads are teed into the Xeno-canto media cache
+    (:mod:`echoroo.services.xeno_canto_cache`). A fresh cached copy is
+    served from disk — honouring ``Range`` requests — without contacting
+    Xeno-canto; a stale one is revalidated with a conditional GET and
+    served as-is on ``304`` (or when Xeno-canto is unreachable).
 
     Args:
         project_id: Project UUID (path parameter, used for access control)
         xc_id: Xeno-canto recording ID (e.g. "1069474")
+        request: Incoming request (its ``Range`` header is honoured on hits)
         current_user: Current authenticated user
         db: Database session
 
     Returns:
-        StreamingResponse with the audio content
+        The cached file (200/206) or a StreamingResponse with the audio content
 
     Raises:
         403: Access denied to project
@@ -370,69 +432,117 @@ async def proxy_audio(
     )
 
     url = f"https://xeno-canto.org/{xc_id}/download"
+    response_headers = {"Content-Disposition": f'inline; filename="XC{xc_id}.mp3"'}
 
-    async def _stream_audio() -> AsyncIterator[bytes]:
-        try:
-            async with (
-                httpx.AsyncClient(
-                    timeout=30.0,
-                    follow_redirects=True,
-                ) as client,
-                client.stream(
-                    "GET",
-                    url,
-                    headers={"User-Agent": "Echoroo/2.0 (https://echoroo.app)"},
-                ) as xc_resp,
-            ):
-                if xc_resp.status_code == 404:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Xeno-canto recording {xc_id} not found",
-                    )
-                if xc_resp.status_code != 200:
-                    raise HTTPException(
-                        status_code=status.HTTP_502_BAD_GATEWAY,
-                        detail=f"Xeno-canto returned HTTP {xc_resp.status_code}",
-                    )
+    cache = get_xeno_canto_media_cache()
+    resource = f"audio/{xc_id}"
+    cached = await asyncio.to_thread(cache.lookup, resource)
+    if cached is not None and cached.is_fresh(get_settings().XENO_CANTO_CACHE_FRESH_SECONDS):
+        logger.debug("Serving cached Xeno-canto audio: xc_id=%r", xc_id)
+        return _cached_media_response(cached, response_headers)
+
+    request_headers = {"User-Agent": "Echoroo/2.0 (https://echoroo.app)"}
+    if cached is not None:
+        request_headers.update(cached.validator_headers())
+
+    # Own client: the streamed body holds its slot until the client has read it.
+    client = get_http_client(XENO_CANTO_AUDIO)
+    try:
+        xc_resp = await client.send(
+            client.build_request("GET", url, headers=request_headers, timeout=30.0),
+            stream=True,
+            follow_redirects=True,
+        )
+    except httpx.TimeoutException as exc:
+        if cached is not None:
+            logger.warning("Xeno-canto audio timed out; serving stale copy of xc_id=%r", xc_id)
+            return _cached_media_response(cached, response_headers)
+        logger.warning("Xeno-canto audio proxy timed out for xc_id=%r", xc_id)
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Xeno-canto audio request timed out",
+        ) from exc
+    except httpx.RequestError as exc:
+        if cached is not None:
+            logger.warning("Xeno-canto unreachable; serving stale copy of xc_id=%r", xc_id)
+            return _cached_media_response(cached, response_headers)
+        logger.warning(
+            "Xeno-canto audio proxy network error for xc_id=%r: %s", xc_id, exc
+        )
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Xeno-canto is unreachable",
+        ) from exc
 
-                # Reject files that exceed the size limit based on Content-Length
-                content_length_str = xc_resp.headers.get("content-length")
-                if content_length_str is not None:
-                    try:
-                        content_length = int(content_length_str)
-                        if content_length > AUDIO_SIZE_LIMIT_BYTES:
-                            raise HTTPException(
-                                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                                detail="Audio file exceeds 50 MB limit",
-                            )
-                    except ValueError:
-                        pass
-
-                async for chunk in xc_resp.aiter_bytes(chunk_size=8192):
-                    yield chunk
-        except httpx.TimeoutException as exc:
-            logger.warning("Xeno-canto audio proxy timed out for xc_id=%r", xc_id)
+    if xc_resp.status_code == 304 and cached is not None:
+        await xc_resp.aclose()
+        revalidated = await asyncio.to_thread(cache.mark_validated, resource)
+        return _cached_media_response(revalidated or cached, response_headers)
+    if xc_resp.status_code != 200:
+        await xc_resp.aclose()
+        if xc_resp.status_code == 404:
             raise HTTPException(
-                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-                detail="Xeno-canto audio request timed out",
-            ) from exc
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Xeno-canto recording {xc_id} not found",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Xeno-canto returned HTTP {xc_resp.status_code}",
+        )
+
+    # Reject files that exceed the size limit based on Content-Length
+    content_length: int | None = None
+    content_length_str = xc_resp.headers.get("content-length")
+    if content_length_str is not None:
+        try:
+            content_length = int(content_length_str)
+        except ValueError:
+            content_length = None
+    if content_length is not None and content_length > AUDIO_SIZE_LIMIT_BYTES:
+        await xc_resp.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Audio file exceeds 50 MB limit",
+        )
+
+    writer = await asyncio.to_thread(
+        cache.writer,
+        resource,
+        content_type="audio/mpeg",
+        etag=xc_resp.headers.get("etag"),
+        last_modified=xc_resp.headers.get("last-modified"),
+        content_length=content_length,
+    )
+
+    async def _stream_audio() -> AsyncIterator[bytes]:
+        completed = False
+        try:
+            async for chunk in xc_resp.aiter_bytes(chunk_size=8192):
+                if writer is not None:
+                    await asyncio.to_thread(writer.write, chunk)
+                yield chunk
+            completed = True
         except httpx.RequestError as exc:
             logger.warning(
                 "Xeno-canto audio proxy network error for xc_id=%r: %s", xc_id, exc
             )
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail="Xeno-canto is unreachable",
-            ) from exc
+            raise
+        finally:
+            await xc_resp.aclose()
+            if writer is not None:
+                # Only a complete body is published; a disconnect or a
+                # truncated upstream body leaves no entry behind.
+                if completed and content_length in (None, writer.bytes_written):
+                    await asyncio.to_thread(writer.commit)
+                else:
+                    await asyncio.to_thread(writer.abort)
 
     logger.info("Proxying Xeno-canto audio: xc_id=%r", xc_id)
 
     return StreamingResponse(
         _stream_audio(),
         media_type="audio/mpeg",
-        headers={
-            "Content-Disposition": f'inline; filename="XC{xc_id}.mp3"',
-        },
+        headers=response_headers,
     )
 
 
@@ -452,6 +562,11 @@ async def proxy_sonogram(
     xeno-canto.org.  The project_id path parameter is kept for URL consistency
     but is not validated.
 
+    Fetched images are kept in the Xeno-canto media cache. Only URLs that
+    passed the SSRF guard are ever cached, so a fresh hit is served without
+    re-validating (or contacting) anything; a stale one is revalidated with a
+    conditional GET through the same guarded redirect loop.
+
     Args:
         project_id: Project UUID (path parameter, kept for URL structure)
         url: Full xeno-canto.org image URL to proxy
@@ -476,37 +591,45 @@ async def proxy_sonogram(
     # Initial allowlist + private-IP guard on the user-supplied URL.
     # `_validate_sonogram_url` raises HTTPException(400) on rejection
     # AND returns the pinned IP literal that the actual TCP connect must
-    # target — the IP-pinning transport (built per hop below) defeats the
+    # target — the IP-pinning client (picked per hop below) defeats the
     # DNS rebinding TOCTOU window between validation and connect.
+    cache = get_xeno_canto_media_cache()
+    resource = f"sonogram/{url}"
+    response_headers = {"Cache-Control": "public, max-age=86400"}
+    cached = await asyncio.to_thread(cache.lookup, resource)
+    if cached is not None and cached.is_fresh(get_settings().XENO_CANTO_CACHE_FRESH_SECONDS):
+        return _cached_media_response(cached, response_headers)
+
     pinned_host, pinned_ip = _validate_sonogram_url(url)
+    request_headers = {"User-Agent": "Echoroo/2.0 (https://echoroo.app)"}
+    if cached is not None:
+        request_headers.update(cached.validator_headers())
 
     # Manual redirect loop — `follow_redirects=False` prevents httpx from
     # silently chasing a `Location` header into a private network.  Each
     # hop is re-validated through `_validate_sonogram_url`, capping the
     # chain at `_SONOGRAM_MAX_REDIRECTS` to bound resource use. Each hop
-    # also rebuilds the pinned transport with a fresh IP (the redirect
-    # target's hostname could legitimately resolve to a different public
-    # IP than the original host's), so the connect still skips DNS.
+    # also switches to the pooled client pinned to that hop's freshly
+    # validated IP (the redirect target's hostname could legitimately
+    # resolve to a different public IP than the original host's), so the
+    # connect still skips DNS.
     current_url = url
     current_pinned_host = pinned_host
     current_pinned_ip = pinned_ip
     resp: httpx.Response | None = None
     try:
         for hop in range(_SONOGRAM_MAX_REDIRECTS + 1):
-            transport = PinnedIPAsyncTransport(
+            client = get_pinned_http_client(
+                XENO_CANTO,
                 pinned_host=current_pinned_host,
                 pinned_ip=current_pinned_ip,
                 allowed_hosts=_SONOGRAM_ALLOWED_HOSTS,
             )
-            async with httpx.AsyncClient(
-                transport=transport,
-                timeout=10.0,
+            resp = await client.get(
+                current_url,
+                headers=request_headers,
                 follow_redirects=False,
-            ) as client:
-                resp = await client.get(
-                    current_url,
-                    headers={"User-Agent": "Echoroo/2.0 (https://echoroo.app)"},
-                )
+            )
             # Redirect: validate the new target before following.
             if resp.status_code in (301, 302, 303, 307, 308):
                 if hop >= _SONOGRAM_MAX_REDIRECTS:
@@ -556,18 +679,28 @@ async def proxy_sonogram(
             # Non-redirect: leave the loop and process the response.
             break
     except httpx.TimeoutException as exc:
+        if cached is not None:
+            logger.warning("Xeno-canto sonogram timed out; serving stale copy of url=%r", url)
+            return _cached_media_response(cached, response_headers)
         logger.warning("Xeno-canto sonogram proxy timed out for url=%r", url)
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
             detail="Xeno-canto sonogram request timed out",
         ) from exc
     except httpx.RequestError as exc:
+        if cached is not None:
+            logger.warning("Xeno-canto unreachable; serving stale copy of url=%r", url)
+            return _cached_media_response(cached, response_headers)
         logger.warning("Xeno-canto sonogram proxy network error for url=%r: %s", url, exc)
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Xeno-canto is unreachable",
         ) from exc
 
+    if resp is not None and resp.status_code == 304 and cached is not None:
+        revalidated = await asyncio.to_thread(cache.mark_validated, resource)
+        return _cached_media_response(revalidated or cached, response_headers)
+
     if resp is None or resp.status_code != 200:
         upstream_status = resp.status_code if resp is not None else 0
         raise HTTPException(
@@ -578,13 +711,65 @@ async def proxy_sonogram(
     content_type = resp.headers.get("content-type", "image/png")
     logger.debug("Proxying Xeno-canto sonogram: url=%r content_type=%r", url, content_type)
 
+    await asyncio.to_thread(
+        cache.store,
+        resource,
+        resp.content,
+        content_type=content_type,
+        etag=resp.headers.get("etag"),
+        last_modified=resp.headers.get("last-modified"),
+    )
+
     return Response(
         content=resp.content,
         media_type=content_type,
-        headers={"Cache-Control": "public, max-age=86400"},
+        headers=response_headers,
     )
 
 
+async def _fetch_xc_search(xc_query: str, page: int, api_key: str) -> dict[str, object]:
+    """Fetch one page of raw Xeno-canto search results.
+
+    Raises:
+        HTTPException: 502 on upstream errors, 504 on timeout.
+    """
+    try:
+        resp = await get_http_client(XENO_CANTO).get(
+            XENO_CANTO_BASE_URL,
+            params={
+                "query": xc_query,
+                "page": page,
+                "key": api_key,
+            },
+            headers={"User-Agent": "Echoroo/2.0 (https://echoroo.app)"},
+        )
+        resp.raise_for_status()
+        data: dict[str, object] = resp.json()
+    except httpx.TimeoutException as exc:
+        logger.warning("Xeno-canto API request timed out for query=%r", xc_query)
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Xeno-canto API request timed out",
+        ) from exc
+    except httpx.HTTPStatusError as exc:
+        logger.warning(
+            "Xeno-canto API returned HTTP %s for query=%r",
+            exc.response.status_code,
+            xc_query,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Xeno-canto API error: HTTP {exc.response.status_code}",
+        ) from exc
+    except httpx.RequestError as exc:
+        logger.warning("Xeno-canto API network error for query=%r: %s", xc_query, exc)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Xeno-canto API is unreachable",
+        ) from exc
+    return data
+
+
 # W2-4 PR-C: the ``@router.get("/search", ...)`` decorator was removed so the
 # legacy ``/api/v1`` Xeno-canto search route is unmounted. ``search_xeno_canto``
 # survives as a plain helper that the ``/web-api/v1`` search adapter
@@ -622,7 +807,9 @@ async def search_xeno_canto(
 
     Builds the Xeno-canto tag-based query string from the individual filter
     parameters, fetches the results, and transforms them into a cleaner schema
-    for the frontend.
+    for the frontend. Raw upstream pages are cached in Redis for
+    ``XENO_CANTO_SEARCH_CACHE_TTL_SECONDS``, so repeated searches while
+    picking references skip the upstream round trip.
 
     Args:
         project_id: Project UUID (path parameter, used for access control)
@@ -654,41 +841,16 @@ async def search_xeno_canto(
 
     xc_query = _build_xc_query(query, country, area, quality_min, recording_type)
 
-    try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                XENO_CANTO_BASE_URL,
-                params={
-                    "query": xc_query,
-                    "page": page,
-                    "key": api_key,
-                },
-                headers={"User-Agent": "Echoroo/2.0 (https://echoroo.app)"},
-            )
-            resp.raise_for_status()
-            data: dict[str, object] = resp.json()
-    except httpx.TimeoutException as exc:
-        logger.warning("Xeno-canto API request timed out for query=%r", xc_query)
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="Xeno-canto API request timed out",
-        ) from exc
-    except httpx.HTTPStatusError as exc:
-        logger.warning(
-            "Xeno-canto API returned HTTP %s for query=%r",
-            exc.response.status_code,
-            xc_query,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Xeno-canto API error: HTTP {exc.response.status_code}",
-        ) from exc
-    except httpx.RequestError as exc:
-        logger.warning("Xeno-canto API network error for query=%r: %s", xc_query, exc)
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Xeno-canto API is unreachable",
-        ) from exc
+    # Identical searches (same query and page) are answered from the raw
+    # upstream response cached in Redis; the per-project sonogram rewrite
+    # below runs on every request.
+    cache_key = _search_cache_key(xc_query, page)
+    cached_data = await _search_cache_get(cache_key)
+    if cached_data is not None:
+        data = cached_data
+    else:
+        data = await _fetch_xc_search(xc_query, page, api_key)
+        await _search_cache_set(cache_key, data)
 
     # Parse pagination metadata from the API response
     # data.get() returns object, so we str() first then int() to satisfy mypy
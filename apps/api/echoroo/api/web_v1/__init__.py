@@ -11,6 +11,7 @@ from echoroo.api.web_v1 import admin as admin_module
 from echoroo.api.web_v1 import audit as audit_module
 from echoroo.api.web_v1 import auth as auth_module
 from echoroo.api.web_v1 import auth_confirm_identity as auth_confirm_identity_module
+from echoroo.api.web_v1 import deletion_jobs as deletion_jobs_module
 from echoroo.api.web_v1 import detection_runs as detection_runs_module
 from echoroo.api.web_v1 import licenses as licenses_module
 from echoroo.api.web_v1 import me as me_module
@@ -33,6 +34,10 @@ web_v1_router.include_router(projects_router)
 web_v1_router.include_router(taxa_module.router)
 # Spec/009 PR D — first-party detection model discovery for dataset status panels.
 web_v1_router.include_router(detection_runs_module.router)
+# Progress of the background dataset / project deletions queued by the
+# DELETE routes (202 + job). Requester-only; no project gate because the
+# project may already be gone.
+web_v1_router.include_router(deletion_jobs_module.router)
 # Phase 11 / T630: superuser admin surface (looser-override approval +
 # IUCN force-resync). Authentication is gated by the AuthRouter / CSRF
 # middleware; per-handler ``is_superuser`` checks live in admin.py.
@@ -131,6 +131,7 @@ from echoroo.services.superuser_service import (
     NotSuperuserError,
     SuperuserServiceError,
 )
+from echoroo.services.taxon_sensitivity_service import bump_sensitivity_version
 
 logger = logging.getLogger(__name__)
 
@@ -439,6 +440,7 @@ async def approve_looser_override(
     # on a connection that has already issued SQL (and ``approve_taxon_override``
     # has done plenty: SELECT, UPDATE, _close_approval_request).
     await db.commit()
+    await bump_sensitivity_version()
 
     await trigger_decision_post_commit_audit(decision_outcome)
 
@@ -530,6 +532,7 @@ async def reject_looser_override(
     # post-commit hook. See the matching note in
     # ``approve_looser_override`` above for the rationale.
     await db.commit()
+    await bump_sensitivity_version()
 
     await trigger_decision_post_commit_audit(decision_outcome)
 
@@ -2,11 +2,13 @@
 
 Contract: ``specs/006-permissions-redesign/contracts/audit.yaml``.
 
-Three endpoints:
+Endpoints:
 
     GET /projects/{id}/audit-log      — Owner / Admin view project rows
     GET /admin/audit-log              — Superuser view platform rows
-    POST /admin/audit-log/chain-verify — Superuser runs chain integrity check
+    POST /admin/audit-log/chain-verify — Superuser starts a background chain
+                                         integrity check
+    GET /admin/audit-log/chain-verify[/{id}] — Superuser polls its progress
 
 FR-096 requires that reading the audit log is itself auditable: every
 invocation writes a meta-entry to the corresponding audit table so a
@@ -40,9 +42,9 @@ drift cleanup, so the three audit paths declared in
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Annotated, Any, Literal
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import sqlalchemy as sa
 from fastapi import APIRouter, HTTPException, Query, Request, status
@@ -57,10 +59,12 @@ from echoroo.core.permissions import (
     register_action,
 )
 from echoroo.middleware.auth import CurrentUser
+from echoroo.models.audit_chain_verification import AuditChainVerification
 from echoroo.schemas.web_v1.audit import (
     AuditLogEntryResponse,
     AuditLogListResponse,
-    ChainVerifyResponse,
+    ChainVerificationListResponse,
+    ChainVerificationResponse,
 )
 from echoroo.services.audit_service import AuditLogService
 
@@ -449,19 +453,24 @@ async def list_platform_audit_log(
 
 @router.post(
     "/admin/audit-log/chain-verify",
-    response_model=ChainVerifyResponse,
-    summary="Verify audit log chain integrity (Superuser)",
+    response_model=ChainVerificationResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start an audit log chain verification (Superuser)",
 )
 async def verify_audit_chain(
     request: Request,
     current_user: CurrentUser,
     db: DbSession,
     target: Annotated[Literal["project", "platform"], Query()],
-) -> ChainVerifyResponse:
-    """Recompute ``row_hash`` over every row in the selected table.
-
-    Delegates to :mod:`echoroo.workers.audit_log_export` helpers so the
-    algorithm matches the weekly batch bit-for-bit.
+    full: Annotated[bool, Query()] = False,
+) -> ChainVerificationResponse:
+    """Queue a background verification of the selected table's ``row_hash`` chain.
+
+    The job (:mod:`echoroo.workers.audit_chain_verify`) reuses the
+    :mod:`echoroo.workers.audit_log_export` helpers so the algorithm matches
+    the weekly batch bit-for-bit. It resumes after the newest signed
+    checkpoint unless ``full`` is set. Poll
+    ``GET /admin/audit-log/chain-verify/{verification_id}`` for progress.
     """
     allowed, _ = is_allowed(
         action=VERIFY_AUDIT_CHAIN_ACTION,
@@ -472,30 +481,15 @@ async def verify_audit_chain(
     if not allowed:
         raise HTTPException(status.HTTP_403_FORBIDDEN, detail="chain verify denied")
 
-    table = "project_audit_log" if target == "project" else "platform_audit_log"
-    include_project_id = target == "project"
-
-    from echoroo.core.kms import compute_audit_chain_hash
-    from echoroo.workers.audit_log_export import (
-        _afetch_rows,
-        _canonical_row,
+    verification = AuditChainVerification(
+        id=uuid4(),
+        target=target,
+        status="queued",
+        started_at=datetime.now(UTC),
     )
 
-    rows = await _afetch_rows(db, table, since=None)
-    first_mismatch: UUID | None = None
-    for row in rows:
-        recomputed = compute_audit_chain_hash(
-            row["prev_hash"],
-            _canonical_row(row, include_project_id=include_project_id),
-        )
-        if recomputed != row["row_hash"]:
-            first_mismatch = (
-                row["id"] if isinstance(row["id"], UUID) else UUID(str(row["id"]))
-            )
-            break
-
-    # Phase 2.11 P0-c — fail-closed on meta-audit write (FR-096): the
-    # chain-verify result MUST NOT be returned without an audit row.
+    # Phase 2.11 P0-c — fail-closed on meta-audit write (FR-096): no
+    # verification is started without an audit row naming it.
     try:
         await _write_meta_audit_in_fresh_session(
             table="platform_audit_log",
@@ -504,7 +498,11 @@ async def verify_audit_chain(
             request_id=_request_id(request),
             ip=_client_ip(request),
             user_agent=_user_agent(request),
-            detail={"target": target, "row_count": len(rows), "is_valid": first_mismatch is None},
+            detail={
+                "target": target,
+                "full": full,
+                "verification_id": str(verification.id),
+            },
         )
     except MetaAuditWriteError as exc:
         raise HTTPException(
@@ -512,20 +510,87 @@ async def verify_audit_chain(
             detail={
                 "error_code": "META_AUDIT_WRITE_FAILED",
                 "message": (
-                    "Audit chain verify could not be recorded; result "
-                    "withheld to preserve FR-096 traceability."
+                    "Audit chain verify could not be recorded; verification "
+                    "not started to preserve FR-096 traceability."
                 ),
                 "request_id": exc.request_id,
             },
         ) from exc
 
-    return ChainVerifyResponse(
-        is_valid=first_mismatch is None,
-        verified_row_count=len(rows),
-        first_mismatch_row_id=first_mismatch,
+    db.add(verification)
+    await db.commit()
+
+    # Local import: keeps the worker dependency tree out of the API process
+    # until the first dispatch (mirrors ``force_iucn_resync``).
+    from echoroo.workers.audit_chain_verify import verify_audit_chain as verify_task
+
+    verify_task.delay(str(verification.id), full=full)
+    return ChainVerificationResponse.model_validate(verification)
+
+
+@router.get(
+    "/admin/audit-log/chain-verify",
+    response_model=ChainVerificationListResponse,
+    summary="List recent audit log chain verifications (Superuser)",
+)
+async def list_audit_chain_verifications(
+    request: Request,
+    current_user: CurrentUser,
+    db: DbSession,
+    target: Annotated[Literal["project", "platform"] | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> ChainVerificationListResponse:
+    """Return the newest verification runs, most recent first.
+
+    Run metadata carries no audit row content, so polling it is not
+    itself meta-audited; starting a run is.
+    """
+    allowed, _ = is_allowed(
+        action=VERIFY_AUDIT_CHAIN_ACTION,
+        user=current_user,
+        project=None,
+        request=request,
+    )
+    if not allowed:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, detail="chain verify denied")
+
+    stmt = sa.select(AuditChainVerification)
+    if target is not None:
+        stmt = stmt.where(AuditChainVerification.target == target)
+    stmt = stmt.order_by(AuditChainVerification.started_at.desc()).limit(limit)
+    runs = (await db.execute(stmt)).scalars().all()
+    return ChainVerificationListResponse(
+        items=[ChainVerificationResponse.model_validate(run) for run in runs]
     )
 
 
+@router.get(
+    "/admin/audit-log/chain-verify/{verification_id}",
+    response_model=ChainVerificationResponse,
+    summary="Get an audit log chain verification (Superuser)",
+)
+async def get_audit_chain_verification(
+    request: Request,
+    current_user: CurrentUser,
+    db: DbSession,
+    verification_id: UUID,
+) -> ChainVerificationResponse:
+    """Return the progress (or verdict) of one verification run."""
+    allowed, _ = is_allowed(
+        action=VERIFY_AUDIT_CHAIN_ACTION,
+        user=current_user,
+        project=None,
+        request=request,
+    )
+    if not allowed:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, detail="chain verify denied")
+
+    run = await db.get(AuditChainVerification, verification_id)
+    if run is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="verification not found")
+    return ChainVerificationResponse.model_validate(run)
+
+
 # ---------------------------------------------------------------------------
 # Small utilities
 # ---------------------------------------------------------------------------
@@ -0,0 +1,55 @@
+"""Progress of background dataset / project deletions.
+
+``DELETE`` on a dataset or project answers ``202`` with a
+:class:`~echoroo.schemas.deletion_job.DeletionJobResponse`; the UI polls
+the job here until it reaches ``success`` or ``failure``. The deleted
+project may already be gone by then, so the job is not behind a project
+permission gate: only the user who requested the deletion can read it,
+and anyone else gets the same ``404`` as for an unknown job.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, status
+
+from echoroo.core.database import DbSession
+from echoroo.middleware.auth import OptionalCurrentUser
+from echoroo.models.user import User
+from echoroo.repositories.deletion_job import DeletionJobRepository
+from echoroo.schemas.deletion_job import DeletionJobResponse
+
+router = APIRouter(prefix="/deletion-jobs", tags=["deletion-jobs"])
+
+
+def _require_authenticated(current_user: User | None) -> User:
+    """Return the authenticated caller for global auth-only routes."""
+    if current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+    return current_user
+
+
+@router.get(
+    "/{job_id}",
+    response_model=DeletionJobResponse,
+    summary="Get deletion job progress",
+    description="Status and progress of a dataset or project deletion (requester only).",
+)
+async def get_deletion_job(
+    job_id: UUID,
+    current_user: OptionalCurrentUser,
+    db: DbSession,
+) -> DeletionJobResponse:
+    """Return a deletion job requested by the caller."""
+    user = _require_authenticated(current_user)
+    job = await DeletionJobRepository(db).get_by_id(job_id)
+    if job is None or job.requested_by_user_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Deletion job not found",
+        )
+    return DeletionJobResponse.model_validate(job)
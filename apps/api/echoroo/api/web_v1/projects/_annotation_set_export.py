@@ -34,10 +34,11 @@ import asyncio
 import contextlib
 import os
 import tempfile
+from typing import Annotated
 from urllib.parse import quote
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 from fastapi.responses import FileResponse, StreamingResponse
 from starlette.background import BackgroundTask
 
@@ -48,6 +49,7 @@ from echoroo.core.settings import get_settings
 from echoroo.middleware.auth import CurrentUser
 from echoroo.services.annotation_set_dataset_export import (
     AnnotationSetDatasetExportService,
+    ClipFormat,
     write_dataset_zip,
 )
 from echoroo.services.annotation_set_export import AnnotationSetExportService
@@ -185,8 +187,9 @@ def _build_audio_service() -> AudioService:
     description=(
         "Export an annotation set as a ZIP bundling its CamtrapDP CSV labels "
         "(annotations.csv), a per-segment manifest (segments.csv) and the "
-        "audio clip for every FINALIZED segment (clips/<segment_id>.wav), so a "
-        "user can validate a model on the exact annotated segment audio. "
+        "audio clip for every FINALIZED segment (clips/<segment_id>.wav, or "
+        ".flac with clip_format=flac), so a user can validate a model on the "
+        "exact annotated segment audio. "
         "Gated by set-view access (same as the CSV export)."
     ),
 )
@@ -196,6 +199,10 @@ async def export_annotation_set_dataset(
     request: Request,
     current_user: CurrentUser,
     db: DbSession,
+    clip_format: Annotated[
+        ClipFormat,
+        Query(description="Clip encoding: 16-bit WAV or (smaller) 16-bit FLAC"),
+    ] = "wav",
 ) -> Response:
     """Build and return the annotation-set dataset ZIP.
 
@@ -204,9 +211,9 @@ async def export_annotation_set_dataset(
 
     The build is split so it never pins the event loop or blows up memory:
     all DB/ORM work happens up front (:meth:`prepare_plan`), and the blocking
-    audio decode + ZIP DEFLATE is offloaded to a worker thread
-    (:func:`asyncio.to_thread`), streaming each clip into a temp file on disk
-    so peak RAM is ``O(one clip)``. The temp file is returned via
+    audio decode / encode + ZIP assembly is offloaded to a worker thread
+    (:func:`asyncio.to_thread`), which cuts several recordings in parallel and
+    writes the archive into a temp file on disk. The temp file is returned via
     :class:`FileResponse` and deleted after the response is sent.
     """
     await gate_action(
@@ -258,7 +265,11 @@ async def export_annotation_set_dataset(
     tmp.close()
     try:
         await asyncio.to_thread(
-            write_dataset_zip, plan, service.audio, tmp_path
+            write_dataset_zip,
+            plan,
+            service.audio,
+            tmp_path,
+            clip_format=clip_format,
         )
     except Exception:
         # Build failed before we could hand ownership to FileResponse — clean
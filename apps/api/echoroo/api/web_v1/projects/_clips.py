@@ -7,12 +7,21 @@ write surface — create, update, delete, auto-generate — onto
 ``/web-api/v1`` so the frontend can finish migrating off ``/api/v1`` for
 the clip-management screens.
 
-Endpoints (4):
+Endpoints (6):
 
 * POST   ``/{pid}/recordings/{rid}/clips``           → ``CLIP_CREATE_ACTION``
 * PATCH  ``/{pid}/recordings/{rid}/clips/{cid}``     → ``CLIP_UPDATE_ACTION``
 * DELETE ``/{pid}/recordings/{rid}/clips/{cid}``     → ``CLIP_DELETE_ACTION``
 * POST   ``/{pid}/recordings/{rid}/clips/generate``  → ``CLIP_GENERATE_ACTION``
+* POST   ``/{pid}/datasets/{did}/clips/generate``    → ``CLIP_GENERATE_ACTION``
+* GET    ``/{pid}/datasets/{did}/clips/generate/{job_id}``
+  → ``CLIP_GENERATE_ACTION``
+
+The dataset routes are BFF-native: the POST answers ``202`` with a queued
+:class:`~echoroo.schemas.clip_generation_job.ClipGenerationJobResponse`
+and :mod:`echoroo.workers.clip_tasks` generates the clips of every
+recording in the dataset; the UI polls the GET for progress. Only the
+requesting user can read a job.
 
 The audio / spectrogram / download GETs are intentionally **NOT** moved
 in this PR — they require alignment with the spec/009 PR D media-token
@@ -23,7 +32,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, HTTPException, Request, status
 
 from echoroo.api.v1 import clips as legacy_clips
 from echoroo.core.actions import (
@@ -35,6 +44,8 @@ from echoroo.core.actions import (
 from echoroo.core.database import DbSession
 from echoroo.core.permissions import gate_action
 from echoroo.middleware.auth import CurrentUser
+from echoroo.repositories.clip_generation_job import ClipGenerationJobRepository
+from echoroo.repositories.dataset import DatasetRepository
 from echoroo.schemas.clip import (
     ClipCreate,
     ClipDetailResponse,
@@ -42,6 +53,8 @@ from echoroo.schemas.clip import (
     ClipGenerateResponse,
     ClipUpdate,
 )
+from echoroo.schemas.clip_generation_job import ClipGenerationJobResponse
+from echoroo.services.clip import validate_generation_params
 
 router = APIRouter()
 
@@ -186,3 +199,88 @@ async def delete_clip(
         service=service,
         db=db,
     )
+
+
+@router.post(
+    "/{project_id}/datasets/{dataset_id}/clips/generate",
+    response_model=ClipGenerationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue dataset clip generation",
+    description=(
+        "Queue a background job generating fixed-length clips for every "
+        "recording in the dataset. Existing clips are kept and not duplicated."
+    ),
+)
+async def create_dataset_clip_generation_job(
+    project_id: UUID,
+    dataset_id: UUID,
+    request: ClipGenerateRequest,
+    http_request: Request,
+    current_user: CurrentUser,
+    db: DbSession,
+) -> ClipGenerationJobResponse:
+    """Queue clip generation over every recording of a dataset."""
+    await gate_action(
+        action=CLIP_GENERATE_ACTION,
+        project_id=project_id,
+        current_user=current_user,
+        request=http_request,
+        db=db,
+    )
+    if await DatasetRepository(db).get_by_id_in_project(dataset_id, project_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dataset not found",
+        )
+    overlap = request.overlap or 0.0
+    try:
+        validate_generation_params(request.clip_length, overlap)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    job = await ClipGenerationJobRepository(db).create(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        requested_by_user_id=current_user.id,
+        clip_length=request.clip_length,
+        overlap=overlap,
+        start_time=request.start_time or 0.0,
+        end_time=request.end_time,
+    )
+    response = ClipGenerationJobResponse.model_validate(job)
+    await db.commit()
+
+    from echoroo.workers.clip_tasks import run_clip_generation
+
+    run_clip_generation.delay(str(job.id))
+    return response
+
+
+@router.get(
+    "/{project_id}/datasets/{dataset_id}/clips/generate/{job_id}",
+    response_model=ClipGenerationJobResponse,
+    summary="Get dataset clip generation job",
+    description="Status and progress of a dataset clip generation job (requester only).",
+)
+async def get_dataset_clip_generation_job(
+    project_id: UUID,
+    dataset_id: UUID,
+    job_id: UUID,
+    request: Request,
+    current_user: CurrentUser,
+    db: DbSession,
+) -> ClipGenerationJobResponse:
+    """Return a dataset clip generation job requested by the caller."""
+    await gate_action(
+        action=CLIP_GENERATE_ACTION,
+        project_id=project_id,
+        current_user=current_user,
+        request=request,
+        db=db,
+    )
+    job = await ClipGenerationJobRepository(db).get_for_dataset(project_id, dataset_id, job_id)
+    if job is None or job.requested_by_user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Clip generation job not found",
+        )
+    return ClipGenerationJobResponse.model_validate(job)
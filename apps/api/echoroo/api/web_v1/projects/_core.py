@@ -58,6 +58,16 @@ from echoroo.core.actions import (
     RECORDING_LIST_ACTION,
 )
 from echoroo.core.database import DbSession
+from echoroo.core.pagination import (
+    InvalidCursorError,
+    TotalMode,
+    count_total,
+    decode_cursor,
+    is_estimate,
+    keyset_after,
+    keyset_order_by,
+    next_cursor,
+)
 from echoroo.core.permissions import (
     H3_RES_15,
     Permission,
@@ -78,6 +88,7 @@ from echoroo.models.site import Site
 from echoroo.models.user import User
 from echoroo.repositories.project import ProjectRepository
 from echoroo.repositories.user import UserRepository
+from echoroo.schemas.deletion_job import DeletionJobResponse
 from echoroo.schemas.project import (
     ProjectCreateRequest,
     ProjectCreateResponse,
@@ -626,11 +637,13 @@ async def update_project(
 
 @router.delete(
     "/{project_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=DeletionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Delete project (Web UI)",
     description=(
         "Cookie + CSRF Web UI surface mirroring the programmatic DELETE "
-        "route. Owner only via the canonical DELETE_PROJECT gate."
+        "route. Owner only via the canonical DELETE_PROJECT gate. Queues a "
+        "background deletion and returns its job."
     ),
 )
 async def delete_project(
@@ -639,8 +652,8 @@ async def delete_project(
     current_user: OptionalCurrentUser,
     service: ProjectServiceDep,
     db: DbSession,
-) -> None:
-    """Delete a project through the first-party BFF surface."""
+) -> DeletionJobResponse:
+    """Queue a project deletion through the first-party BFF surface."""
     if current_user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -655,8 +668,15 @@ async def delete_project(
         db=db,
     )
     before = _project_audit_snapshot(project)
-    await service.delete_project(current_user.id, project_id)
+    job = await service.delete_project(current_user.id, project_id)
+    response = DeletionJobResponse.model_validate(job)
     await db.commit()
+
+    if job.status == "queued":
+        from echoroo.workers.deletion_tasks import run_deletion_job
+
+        run_deletion_job.delay(str(job.id))
+
     # ``project_audit_log.project_id`` references ``projects.id``. A durable
     # project-scoped row would keep the hard-deleted project alive via FK, so
     # the delete event is recorded at platform scope with the project id in
@@ -668,10 +688,12 @@ async def delete_project(
         detail={
             "project_id": str(project_id),
             "delete_mode": "hard_delete",
+            "deletion_job_id": str(job.id),
         },
         before=before,
         after=None,
     )
+    return response
 
 
 # =============================================================================
@@ -718,6 +740,12 @@ async def list_public_recordings(
         pattern="^(asc|desc)$",
         description="Sort order",
     ),
+    cursor: str | None = Query(
+        None, description="Opaque next_cursor from a previous page; overrides page"
+    ),
+    total_mode: TotalMode = Query(
+        "exact", description="'estimate' returns a fast planner estimate as total"
+    ),
 ) -> PublicRecordingListResponse:
     """Paginated recordings for ``project_id`` with Guest enumeration safety.
 
@@ -815,7 +843,7 @@ async def list_public_recordings(
         .where(Dataset.project_id == project_id)
     )
     count_query = (
-        select(func.count(Recording.id))
+        select(Recording.id)
         .join(Dataset, Dataset.id == Recording.dataset_id)
         .where(Dataset.project_id == project_id)
     )
@@ -862,16 +890,29 @@ async def list_public_recordings(
         if (not is_member_level and sort_by in _SENSITIVE_RECORDING_SORTS)
         else sort_by
     )
-    sort_column = sort_columns.get(effective_sort_by, Recording.datetime)
-    if sort_order == "asc":
-        base_query = base_query.order_by(sort_column.asc().nulls_last())
+    if effective_sort_by not in sort_columns:
+        effective_sort_by = "datetime"
+    sort_column = sort_columns[effective_sort_by]
+    descending = sort_order != "asc"
+    base_query = base_query.order_by(
+        *keyset_order_by(sort_column, Recording.id, descending=descending)
+    )
+    # Keyset mode: the cursor is bound to the EFFECTIVE sort, so a cursor
+    # minted on a member's datetime sort is rejected for an outsider (whose
+    # sort falls back to filename) rather than resuming on a hidden column.
+    if cursor:
+        try:
+            keyset = decode_cursor(cursor, sort_key=effective_sort_by, descending=descending)
+            keyset_clause = keyset_after(sort_column, Recording.id, keyset)
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        base_query = base_query.where(keyset_clause)
     else:
-        base_query = base_query.order_by(sort_column.desc().nulls_last())
+        base_query = base_query.offset(offset)
 
-    total_result = await db.execute(count_query)
-    total: int = total_result.scalar_one()
+    total = await count_total(db, count_query, total_mode)
 
-    rows_result = await db.execute(base_query.offset(offset).limit(limit))
+    rows_result = await db.execute(base_query.limit(limit))
     rows = rows_result.all()
 
     # ``normalized_role`` / ``is_member_level`` were resolved before query
@@ -948,6 +989,13 @@ async def list_public_recordings(
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor(
+            [recording for recording, _ in rows],
+            limit,
+            sort_key=effective_sort_by,
+            descending=descending,
+        ),
+        total_is_estimate=is_estimate(total),
     )
 
 
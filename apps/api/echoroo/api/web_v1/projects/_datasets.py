@@ -38,6 +38,7 @@ from echoroo.schemas.dataset import (
     DatetimeTestRequest,
     ImportRequest,
 )
+from echoroo.schemas.deletion_job import DeletionJobResponse
 
 router = APIRouter()
 
@@ -254,9 +255,13 @@ async def update_dataset(
 
 @router.delete(
     "/{project_id}/datasets/{dataset_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=DeletionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Delete dataset",
-    description="BFF adapter for the legacy dataset DELETE endpoint.",
+    description=(
+        "BFF adapter for the legacy dataset DELETE endpoint. Queues a "
+        "background deletion and returns its job."
+    ),
 )
 async def delete_dataset(
     project_id: UUID,
@@ -265,7 +270,7 @@ async def delete_dataset(
     current_user: CurrentUser,
     service: legacy_datasets.DatasetServiceDep,
     db: DbSession,
-) -> None:
+) -> DeletionJobResponse:
     """Delegate dataset DELETE to the legacy handler."""
     await gate_action(
         action=DATASET_DELETE_ACTION,
@@ -274,7 +279,7 @@ async def delete_dataset(
         request=request,
         db=db,
     )
-    await legacy_datasets.delete_dataset(
+    return await legacy_datasets.delete_dataset(
         project_id=project_id,
         dataset_id=dataset_id,
         request=request,
@@ -9,10 +9,21 @@ request on the cookie + CSRF session boundary, fires
 :func:`gate_action` once, and returns the legacy
 :class:`fastapi.responses.StreamingResponse` unchanged.
 
-Endpoints (2):
+Endpoints (4):
 
 * GET ``/{pid}/detections/export/csv``        → ``DETECTION_EXPORT_CSV_ACTION``
 * GET ``/{pid}/detections/export/ml-dataset`` → ``DETECTION_EXPORT_ML_DATASET_ACTION``
+* POST ``/{pid}/detections/export/ml-dataset/jobs``
+  → ``DETECTION_EXPORT_ML_DATASET_ACTION``
+* GET ``/{pid}/detections/export/ml-dataset/jobs/{job_id}``
+  → ``DETECTION_EXPORT_ML_DATASET_ACTION``
+
+The buffered ML-dataset GET stays for small projects and API clients. The
+job routes are BFF-native: the POST answers ``202`` with a queued
+:class:`~echoroo.schemas.ml_dataset_export_job.MlDatasetExportJobResponse`
+and :mod:`echoroo.workers.detection_export_tasks` streams the ZIP to object
+storage; the UI polls the GET, which adds a presigned ``download_url``
+once the job has succeeded. Only the requesting user can read a job.
 
 Both legacy handlers are already centrally gated through
 :func:`gate_action`, so no entry is required in
@@ -26,7 +37,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 
 from echoroo.api.v1 import detections as legacy_detections
@@ -36,8 +47,11 @@ from echoroo.core.actions import (
 )
 from echoroo.core.database import DbSession
 from echoroo.core.permissions import gate_action
+from echoroo.core.s3 import generate_presigned_download_url
 from echoroo.middleware.auth import CurrentUser
 from echoroo.models.enums import DetectionStatus
+from echoroo.repositories.ml_dataset_export_job import MlDatasetExportJobRepository
+from echoroo.schemas.ml_dataset_export_job import MlDatasetExportJobResponse
 
 router = APIRouter()
 
@@ -106,3 +120,82 @@ async def export_ml_dataset(
         dataset_id=dataset_id,
         detection_run_id=detection_run_id,
     )
+
+
+@router.post(
+    "/{project_id}/detections/export/ml-dataset/jobs",
+    response_model=MlDatasetExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue ML training dataset export",
+    description=(
+        "Queue a background ML-dataset ZIP export written to object storage. "
+        "Poll the returned job for its download URL."
+    ),
+)
+async def create_ml_dataset_export_job(
+    project_id: UUID,
+    request: Request,
+    current_user: CurrentUser,
+    db: DbSession,
+    dataset_id: UUID | None = None,
+    detection_run_id: UUID | None = None,
+) -> MlDatasetExportJobResponse:
+    """Queue an ML-dataset export of the project."""
+    await gate_action(
+        action=DETECTION_EXPORT_ML_DATASET_ACTION,
+        project_id=project_id,
+        current_user=current_user,
+        request=request,
+        db=db,
+    )
+    job = await MlDatasetExportJobRepository(db).create(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        detection_run_id=detection_run_id,
+        requested_by_user_id=current_user.id,
+    )
+    response = MlDatasetExportJobResponse.model_validate(job)
+    await db.commit()
+
+    from echoroo.workers.detection_export_tasks import run_ml_dataset_export
+
+    run_ml_dataset_export.delay(str(job.id))
+    return response
+
+
+@router.get(
+    "/{project_id}/detections/export/ml-dataset/jobs/{job_id}",
+    response_model=MlDatasetExportJobResponse,
+    summary="Get ML training dataset export job",
+    description=(
+        "Status and progress of an ML-dataset export (requester only), with a "
+        "presigned download URL once it has succeeded."
+    ),
+)
+async def get_ml_dataset_export_job(
+    project_id: UUID,
+    job_id: UUID,
+    request: Request,
+    current_user: CurrentUser,
+    db: DbSession,
+) -> MlDatasetExportJobResponse:
+    """Return an ML-dataset export job requested by the caller."""
+    await gate_action(
+        action=DETECTION_EXPORT_ML_DATASET_ACTION,
+        project_id=project_id,
+        current_user=current_user,
+        request=request,
+        db=db,
+    )
+    job = await MlDatasetExportJobRepository(db).get_for_project(project_id, job_id)
+    if job is None or job.requested_by_user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found",
+        )
+    response = MlDatasetExportJobResponse.model_validate(job)
+    if job.status == "success" and job.object_key:
+        response.download_url = generate_presigned_download_url(
+            job.object_key, filename="ml-dataset.zip"
+        )
+    return response
@@ -13,9 +13,11 @@ from echoroo.core.actions import (
     DETECTION_LIST_ACTION,
 )
 from echoroo.core.database import DbSession
+from echoroo.core.pagination import TotalMode
 from echoroo.core.permissions import gate_action
 from echoroo.middleware.auth import CurrentUser
-from echoroo.models.enums import DetectionStatus
+from echoroo.models.enums import ConsensusStatus, DetectionStatus
+from echoroo.repositories.annotation import DetectionSort
 
 router = APIRouter()
 
@@ -42,6 +44,18 @@ async def list_detections(
     page: int = 1,
     page_size: int = 50,
     locale: str = Query("en", pattern="^(en|ja)$"),
+    cursor: str | None = Query(
+        None, description="Opaque next_cursor from a previous page; overrides page"
+    ),
+    total_mode: TotalMode = Query(
+        "exact", description="'estimate' returns a fast planner estimate as total"
+    ),
+    consensus: ConsensusStatus | None = Query(
+        None, description="Only detections whose vote consensus has this status"
+    ),
+    sort_by: DetectionSort = Query(
+        "created_at", description="'consensus_score' orders by vote agreement, highest first"
+    ),
 ) -> legacy_detections.DetectionListResponse:
     """Delegate detection listing to the legacy handler."""
     await gate_action(
@@ -67,6 +81,10 @@ async def list_detections(
         page=page,
         page_size=page_size,
         locale=locale,
+        cursor=cursor,
+        total_mode=total_mode,
+        consensus=consensus,
+        sort_by=sort_by,
     )
 
 
@@ -8,6 +8,7 @@ first-party session surface.
 
 from __future__ import annotations
 
+import logging
 from typing import Annotated
 from uuid import UUID
 
@@ -32,7 +33,7 @@ from echoroo.core.auth import (
     issue_media_token,
 )
 from echoroo.core.database import DbSession
-from echoroo.core.pagination import MAX_PAGE_SIZE
+from echoroo.core.pagination import MAX_PAGE_SIZE, TotalMode
 from echoroo.core.permissions import gate_action
 from echoroo.middleware.auth import CurrentUser, OptionalCurrentUser
 from echoroo.models.enums import ProjectStatus, ProjectVisibility
@@ -44,6 +45,8 @@ from echoroo.schemas.web_v1.media_token import (
     MediaTokenResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -117,6 +120,16 @@ async def issue_recording_media_token(
             expires_in=int(ANON_MEDIA_TTL.total_seconds()),
         )
 
+    if payload.prefetch and service.audio_service is not None:
+        # Warm the S3 audio cache ahead of the media GETs this token is for.
+        # Authenticated callers only (a Guest cannot trigger full downloads)
+        # and fire-and-forget: a failed prefetch just means the stream
+        # request downloads the file itself.
+        try:
+            service.audio_service.prefetch([recording.path])
+        except Exception:  # noqa: BLE001
+            logger.warning("Audio prefetch failed for recording %s", recording_id, exc_info=True)
+
     token = issue_media_token(
         user_id=current_user.id,
         security_stamp=current_user.security_stamp,
@@ -245,6 +258,12 @@ async def list_clips(
     page_size: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
     sort_by: str = "start_time",
     sort_order: str = "asc",
+    cursor: str | None = Query(
+        None, description="Opaque next_cursor from a previous page; overrides page"
+    ),
+    total_mode: TotalMode = Query(
+        "exact", description="'estimate' returns a fast planner estimate as total"
+    ),
 ) -> ClipListResponse:
     """Delegate clip list reads to the legacy handler."""
     await gate_action(
@@ -265,6 +284,8 @@ async def list_clips(
         page_size=page_size,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
+        total_mode=total_mode,
     )
 
 
@@ -19,7 +19,7 @@ Endpoints (16, plus 2 streaming):
 
 * GET    ``/{pid}/search/embedding-stats``                      → ``SEARCH_EMBEDDING_STATS_ACTION``
 * GET    ``/{pid}/xeno-canto/search``                           → ``SEARCH_SESSION_LIST_ACTION`` (legacy unguarded baseline)
-* GET    ``/{pid}/xeno-canto/audio/{xc_id}``                    → ``XENO_CANTO_AUDIO_ACTION`` (StreamingResponse)
+* GET    ``/{pid}/xeno-canto/audio/{xc_id}``                    → ``XENO_CANTO_AUDIO_ACTION`` (StreamingResponse, or the cached file)
 * POST   ``/{pid}/search/batch``                                → ``SEARCH_BATCH_CREATE_ACTION``
 * GET    ``/{pid}/search/jobs/{job_id}``                        → ``SEARCH_BATCH_JOB_GET_ACTION``
 * POST   ``/{pid}/annotations``                                 → ``SEARCH_ANNOTATION_ACTION``
@@ -251,7 +251,7 @@ async def proxy_xeno_canto_audio(
     request: Request,
     current_user: CurrentUser,
     db: DbSession,
-) -> StreamingResponse:
+) -> Response:
     """Delegate Xeno-canto audio streaming to the legacy proxy."""
     await gate_action(
         action=XENO_CANTO_AUDIO_ACTION,
@@ -0,0 +1,334 @@
+"""Shared, pooled HTTP clients for third-party upstreams.
+
+GBIF, iNaturalist, Xeno-canto and IUCN calls used to open a fresh
+``httpx.AsyncClient`` per request, paying DNS + TCP + TLS setup every time.
+This module keeps one long-lived client per :class:`Upstream` instead:
+
+* connections are pooled and kept alive (``httpx.Limits`` of the upstream);
+* HTTP/2 is negotiated when the optional ``h2`` package is installed;
+* every request holds one of ``max_concurrency`` slots for its host until
+  the response body is closed, which replaces the old per-service
+  ``RateLimiter``;
+* request counts, status classes, errors, queueing and latency are
+  recorded per upstream (:func:`http_client_metrics`).
+
+An ``httpx`` connection pool is bound to the event loop that opened it, and
+Celery tasks run each job in its own ``asyncio.run`` loop, so clients are
+registered per running loop. The API process has a single loop; its clients
+are closed by :func:`close_http_clients` on shutdown.
+
+User-controlled URLs (the Xeno-canto sonogram proxy) still go through
+:class:`~echoroo.core.url_allowlist.PinnedIPAsyncTransport`:
+:func:`get_pinned_http_client` pools one client per validated
+``(host, pinned IP)`` pair, so the SSRF guarantees are unchanged — the
+caller validates the URL first, and the transport refuses any other host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import time
+import weakref
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from echoroo.core.url_allowlist import PinnedIPAsyncTransport
+
+logger = logging.getLogger(__name__)
+
+#: HTTP/2 needs the optional ``h2`` package (``httpx[http2]``).
+HTTP2_AVAILABLE: bool = importlib.util.find_spec("h2") is not None
+
+# Pinned clients kept per upstream; the least recently used one is closed.
+_MAX_PINNED_CLIENTS = 8
+
+
+@dataclass(frozen=True)
+class Upstream:
+    """Connection policy of one third-party API."""
+
+    name: str
+    timeout: float
+    #: Concurrent requests per host; further requests wait for a slot.
+    max_concurrency: int
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+GBIF = Upstream("gbif", timeout=10.0, max_concurrency=8)
+INATURALIST = Upstream("inaturalist", timeout=10.0, max_concurrency=4)
+XENO_CANTO = Upstream("xeno_canto", timeout=15.0, max_concurrency=8)
+#: Proxied Xeno-canto audio downloads. A streamed download holds its slot
+#: until the browser has read the whole file, so these get their own client
+#: and slots and slow previews cannot starve the search API calls.
+XENO_CANTO_AUDIO = Upstream("xeno_canto_audio", timeout=30.0, max_concurrency=8)
+IUCN = Upstream(
+    "iucn", timeout=30.0, max_concurrency=2, max_connections=2, max_keepalive_connections=2
+)
+
+
+@dataclass
+class UpstreamMetrics:
+    """Process-wide request counters of one upstream."""
+
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    waiting: int = 0
+    statuses: Counter[str] = field(default_factory=Counter)
+    wait_seconds: float = 0.0
+    latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-friendly copy; latency is time to response headers."""
+        answered = self.requests - self.errors
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "statuses": dict(self.statuses),
+            "mean_wait_seconds": self.wait_seconds / self.requests if self.requests else None,
+            "mean_latency_seconds": self.latency_seconds / answered if answered else None,
+            "max_latency_seconds": self.max_latency_seconds,
+        }
+
+
+_METRICS: dict[str, UpstreamMetrics] = {}
+
+
+def http_client_metrics() -> dict[str, dict[str, Any]]:
+    """Return a snapshot of the request metrics of every upstream."""
+    return {name: metrics.snapshot() for name, metrics in sorted(_METRICS.items())}
+
+
+class _SlotReleasingStream(httpx.AsyncByteStream):
+    """Response body that frees its concurrency slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    """Caps concurrent requests per host and records :class:`UpstreamMetrics`."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, upstream: Upstream) -> None:
+        self._inner = inner
+        self._upstream = upstream
+        self._metrics = _METRICS.setdefault(upstream.name, UpstreamMetrics())
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = self._metrics
+        slot = self._slots.get(request.url.host)
+        if slot is None:
+            slot = self._slots[request.url.host] = asyncio.Semaphore(self._upstream.max_concurrency)
+
+        queued = time.perf_counter()
+        metrics.waiting += 1
+        try:
+            await slot.acquire()
+        finally:
+            metrics.waiting -= 1
+        started = time.perf_counter()
+        metrics.requests += 1
+        metrics.wait_seconds += started - queued
+        metrics.in_flight += 1
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                metrics.in_flight -= 1
+                slot.release()
+
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException as exc:
+            metrics.errors += 1
+            metrics.statuses[type(exc).__name__] += 1
+            release()
+            raise
+
+        elapsed = time.perf_counter() - started
+        metrics.statuses[f"{response.status_code // 100}xx"] += 1
+        metrics.latency_seconds += elapsed
+        metrics.max_latency_seconds = max(metrics.max_latency_seconds, elapsed)
+        if response.is_closed:
+            # Body already read in memory (e.g. a mock transport).
+            release()
+        else:
+            # The slot is held until the body is consumed or closed, so a
+            # streamed download counts against the limit for its whole length.
+            response.stream = _SlotReleasingStream(response.stream, release)  # type: ignore[arg-type]
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def build_http_client(
+    upstream: Upstream,
+    *,
+    verify: Any = True,
+    timeout: float | None = None,
+    inner: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Return a new pooled, metered client for ``upstream``.
+
+    The caller owns (and must close) the client; request paths should
+    prefer :func:`get_http_client`. ``inner`` replaces the default
+    connection transport, e.g. with an IP-pinned one.
+    """
+    if inner is None:
+        inner = httpx.AsyncHTTPTransport(
+            verify=verify,
+            http2=upstream.http2 and HTTP2_AVAILABLE,
+            limits=upstream.limits,
+        )
+    return httpx.AsyncClient(
+        transport=_MeteredTransport(inner, upstream),
+        timeout=upstream.timeout if timeout is None else timeout,
+        follow_redirects=False,
+    )
+
+
+@dataclass
+class _LoopClients:
+    shared: dict[str, httpx.AsyncClient] = field(default_factory=dict)
+    pinned: OrderedDict[tuple[str, str, str], httpx.AsyncClient] = field(
+        default_factory=OrderedDict
+    )
+    closing: set[asyncio.Task[None]] = field(default_factory=set)
+
+
+_REGISTRY: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _loop_clients() -> _LoopClients:
+    loop = asyncio.get_running_loop()
+    clients = _REGISTRY.get(loop)
+    if clients is None:
+        clients = _REGISTRY[loop] = _LoopClients()
+    return clients
+
+
+def get_http_client(upstream: Upstream) -> httpx.AsyncClient:
+    """Return the shared client of ``upstream`` for the running loop.
+
+    Do not close it (or use it as a context manager); it lives until
+    :func:`close_http_clients`. Per-call settings such as ``timeout`` or
+    ``follow_redirects`` are passed to the request method instead.
+    """
+    clients = _loop_clients()
+    client = clients.shared.get(upstream.name)
+    if client is None:
+        client = clients.shared[upstream.name] = build_http_client(upstream)
+    return client
+
+
+def get_pinned_http_client(
+    upstream: Upstream,
+    *,
+    pinned_host: str,
+    pinned_ip: str,
+    allowed_hosts: Iterable[str] | None = None,
+) -> httpx.AsyncClient:
+    """Return a shared client whose connects all go to ``pinned_ip``.
+
+    ``pinned_ip`` must come from the caller's SSRF validation of the URL
+    (e.g. :func:`~echoroo.core.url_allowlist.validate_audio_url`); the
+    client is reused for every later request validated to the same pair.
+    Redirects are never followed automatically.
+    """
+    clients = _loop_clients()
+    key = (upstream.name, pinned_host.lower(), pinned_ip)
+    client = clients.pinned.get(key)
+    if client is not None:
+        clients.pinned.move_to_end(key)
+        return client
+
+    transport = PinnedIPAsyncTransport(
+        pinned_host=pinned_host,
+        pinned_ip=pinned_ip,
+        http2=upstream.http2 and HTTP2_AVAILABLE,
+        allowed_hosts=allowed_hosts,
+        limits=upstream.limits,
+    )
+    client = clients.pinned[key] = build_http_client(upstream, inner=transport)
+    per_upstream = [k for k in clients.pinned if k[0] == upstream.name]
+    if len(per_upstream) > _MAX_PINNED_CLIENTS:
+        # DNS moved the host to another IP: retire the oldest pool.
+        stale = clients.pinned.pop(per_upstream[0])
+        task = asyncio.get_running_loop().create_task(stale.aclose())
+        clients.closing.add(task)
+        task.add_done_callback(clients.closing.discard)
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every client registered on the running loop.
+
+    Called from the application lifespan on shutdown; safe to call again.
+    """
+    clients = _REGISTRY.pop(asyncio.get_running_loop(), None)
+    if clients is None:
+        return
+    for client in [*clients.shared.values(), *clients.pinned.values()]:
+        try:
+            await client.aclose()
+        except Exception:  # noqa: BLE001 — shutdown must not fail on one client
+            logger.debug("Closing an upstream HTTP client failed", exc_info=True)
+    if clients.closing:
+        await asyncio.gather(*clients.closing, return_exceptions=True)
+    if _METRICS:
+        logger.info("Upstream HTTP metrics: %s", http_client_metrics())
+
+
+__all__ = [
+    "GBIF",
+    "HTTP2_AVAILABLE",
+    "INATURALIST",
+    "IUCN",
+    "XENO_CANTO",
+    "XENO_CANTO_AUDIO",
+    "Upstream",
+    "UpstreamMetrics",
+    "build_http_client",
+    "close_http_clients",
+    "get_http_client",
+    "get_pinned_http_client",
+    "http_client_metrics",
+]
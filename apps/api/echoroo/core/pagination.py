@@ -2,16 +2,55 @@
 
 Provides consistent clamping and validation for page/page_size parameters
 across all API endpoints, replacing per-service ad-hoc validation.
+
+Large lists (detections, recordings, clips) additionally support keyset
+pagination: every page carries an opaque ``next_cursor`` encoding the last
+row's sort value and id, and passing it back as ``cursor`` resumes strictly
+after that row with an index range scan instead of ``OFFSET n`` (which reads
+and discards ``n`` rows). Offset pages stay available for backwards
+compatibility. ``total_mode="estimate"`` replaces the exact ``count(*)`` with
+the planner's row estimate for callers that only need an order of magnitude.
 """
 
-from collections.abc import Callable
+import base64
+import binascii
+import json
+import logging
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Literal
+from uuid import UUID
 
 from fastapi import Query
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    bindparam,
+    false,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_PAGE_SIZE = 50
 MAX_PAGE_SIZE = 200
 
+TotalMode = Literal["exact", "estimate"]
+
+# Below this many estimated rows an exact count is cheap, and planner
+# estimates for small or freshly-filtered sets are often far off.
+ESTIMATE_EXACT_BELOW = 10_000
+
 
 @dataclass(frozen=True)
 class PaginationParams:
@@ -113,3 +152,324 @@ def make_pagination_dep(
         )
 
     return _dep
+
+
+# =============================================================================
+# Keyset cursors
+# =============================================================================
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client-supplied cursor cannot be decoded or reused."""
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Decoded keyset position: resume strictly after ``(value, id)``.
+
+    Attributes:
+        sort_key: Attribute name of the sort column the cursor was minted for.
+        descending: Sort direction the cursor was minted for.
+        value: Sort column value of the last row on the previous page.
+        id: Primary key of that row (tie-breaker).
+    """
+
+    sort_key: str
+    descending: bool
+    value: Any
+    id: UUID
+
+
+def _encode_value(value: Any) -> list[Any]:
+    if value is None:
+        return ["n", None]
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, bool):
+        return ["b", value]
+    if isinstance(value, int):
+        return ["i", value]
+    if isinstance(value, float):
+        return ["f", value]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    return ["s", str(value)]
+
+
+def _decode_value(tagged: Any) -> Any:
+    kind, raw = tagged
+    if kind == "n":
+        return None
+    if kind == "dt":
+        return datetime.fromisoformat(raw)
+    if kind == "b":
+        return bool(raw)
+    if kind == "i":
+        return int(raw)
+    if kind == "f":
+        return float(raw)
+    if kind == "u":
+        return UUID(raw)
+    if kind == "s":
+        return str(raw)
+    raise ValueError(f"unknown value kind {kind!r}")
+
+
+def encode_cursor(sort_key: str, descending: bool, value: Any, row_id: UUID) -> str:
+    """Encode a keyset position as an opaque URL-safe token.
+
+    Args:
+        sort_key: Attribute name of the sort column.
+        descending: Sort direction.
+        value: Sort value of the last row returned.
+        row_id: Primary key of the last row returned.
+
+    Returns:
+        Base64url token without padding.
+    """
+    payload = {"k": sort_key, "d": int(descending), "v": _encode_value(value), "i": str(row_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str, *, sort_key: str, descending: bool) -> Cursor:
+    """Decode ``token`` and check it was minted for the same ordering.
+
+    A cursor is only meaningful for the sort it came from; reusing one after
+    the client changed ``sort_by`` / ``sort_order`` would silently skip or
+    repeat rows, so that is rejected instead.
+
+    Args:
+        token: Value of the ``cursor`` query parameter.
+        sort_key: Attribute name of the sort column of this request.
+        descending: Sort direction of this request.
+
+    Returns:
+        The decoded :class:`Cursor`.
+
+    Raises:
+        InvalidCursorError: If the token is malformed or was minted for a
+            different ordering.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        cursor = Cursor(
+            sort_key=str(payload["k"]),
+            descending=bool(payload["d"]),
+            value=_decode_value(payload["v"]),
+            id=UUID(payload["i"]),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as exc:
+        raise InvalidCursorError("Malformed pagination cursor") from exc
+    if cursor.sort_key != sort_key or cursor.descending != descending:
+        raise InvalidCursorError(
+            "Pagination cursor does not match the requested sort; restart from page 1"
+        )
+    return cursor
+
+
+def _is_nullable(column: InstrumentedAttribute[Any], nullable: bool | None) -> bool:
+    if nullable is not None:
+        return nullable
+    return bool(getattr(column, "nullable", True))
+
+
+def keyset_order_by(
+    sort_column: InstrumentedAttribute[Any],
+    id_column: InstrumentedAttribute[Any],
+    *,
+    descending: bool,
+    nullable: bool | None = None,
+) -> list[Any]:
+    """Return the ``ORDER BY`` clauses matching :func:`keyset_after`.
+
+    ``id`` breaks ties, so the order is total and offset pages are stable
+    too. A NOT NULL sort column gets a plain ``ASC`` / ``DESC`` so a
+    ``(sort, id)`` btree index serves it in either direction; a nullable one
+    sorts its NULLs last, which a descending scan only gets from an index
+    declared ``DESC NULLS LAST``.
+
+    Args:
+        sort_column: Sort column.
+        id_column: Primary key used as the tie-breaker.
+        descending: Sort direction.
+        nullable: Whether the sort value can be NULL. Defaults to the
+            column's declared nullability; pass True for a NOT NULL column
+            reached through an outer join.
+    """
+    if _is_nullable(sort_column, nullable):
+        if descending:
+            return [sort_column.desc().nulls_last(), id_column.desc()]
+        return [sort_column.asc().nulls_last(), id_column.asc()]
+    if descending:
+        return [sort_column.desc(), id_column.desc()]
+    return [sort_column.asc(), id_column.asc()]
+
+
+def _check_cursor_value(sort_column: InstrumentedAttribute[Any], value: Any) -> None:
+    """Reject a cursor value the sort column cannot be compared with.
+
+    A forged cursor (e.g. a string for a timestamp column) would otherwise
+    only fail inside PostgreSQL and surface as a 500.
+    """
+    if value is None:
+        return
+    try:
+        expected = sort_column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return
+    if expected not in (bool, int, float, str, datetime, UUID):
+        return
+    if expected is float and isinstance(value, int) and not isinstance(value, bool):
+        return
+    if isinstance(value, bool) and expected is not bool:
+        raise InvalidCursorError("Pagination cursor value does not match the sort column")
+    if not isinstance(value, expected):
+        raise InvalidCursorError("Pagination cursor value does not match the sort column")
+
+
+def keyset_after(
+    sort_column: InstrumentedAttribute[Any],
+    id_column: InstrumentedAttribute[Any],
+    cursor: Cursor,
+    *,
+    nullable: bool | None = None,
+) -> ColumnElement[bool]:
+    """Return a ``WHERE`` clause selecting rows after ``cursor``.
+
+    Mirrors :func:`keyset_order_by`. For a NOT NULL column this is the row
+    comparison ``(sort, id) < (:v, :id)`` (``>`` ascending), which PostgreSQL
+    turns into a single index range condition. For a nullable column a
+    non-NULL cursor is followed by the remaining non-NULL rows and then every
+    NULL row, and a NULL cursor only by NULL rows with a later id.
+
+    Raises:
+        InvalidCursorError: If the cursor value cannot be compared with
+            ``sort_column``.
+    """
+    _check_cursor_value(sort_column, cursor.value)
+    is_nullable = _is_nullable(sort_column, nullable)
+    past_id = id_column < cursor.id if cursor.descending else id_column > cursor.id
+    if cursor.value is None:
+        # NULLs sort last, so a NULL cursor on a NOT NULL column is past
+        # every row.
+        return and_(sort_column.is_(None), past_id) if is_nullable else false()
+    key = tuple_(sort_column, id_column)
+    position = tuple_(literal(cursor.value, sort_column.type), literal(cursor.id, id_column.type))
+    past = key < position if cursor.descending else key > position
+    if not is_nullable:
+        return past
+    return or_(past, sort_column.is_(None))
+
+
+def next_cursor(
+    rows: Sequence[Any],
+    page_size: int,
+    *,
+    sort_key: str,
+    descending: bool,
+    value: Callable[[Any], Any] | None = None,
+) -> str | None:
+    """Return the cursor for the page after ``rows``, or None on a short page.
+
+    A full page may still be the last one; the client then receives one empty
+    page, which is cheaper than fetching ``page_size + 1`` rows every time.
+    ``value`` extracts the sort value from a row when it is not the row's
+    ``sort_key`` attribute (e.g. a column of a joined table).
+    """
+    if not rows or len(rows) < page_size:
+        return None
+    last = rows[-1]
+    sort_value = value(last) if value is not None else getattr(last, sort_key)
+    return encode_cursor(sort_key, descending, sort_value, last.id)
+
+
+# =============================================================================
+# Totals
+# =============================================================================
+
+
+class RowCount(int):
+    """Row total that records whether it is a planner estimate.
+
+    Behaves as a plain ``int`` everywhere; :attr:`is_estimate` feeds the
+    ``total_is_estimate`` response field, which must stay False when
+    ``total_mode="estimate"`` fell back to an exact count.
+    """
+
+    is_estimate: bool
+
+    def __new__(cls, value: int, *, is_estimate: bool = False) -> "RowCount":
+        count = super().__new__(cls, value)
+        count.is_estimate = is_estimate
+        return count
+
+
+def is_estimate(total: int) -> bool:
+    """Return True when ``total`` came from the planner estimate."""
+    return bool(getattr(total, "is_estimate", False))
+
+
+async def estimate_row_count(db: AsyncSession, query: Select[Any]) -> int | None:
+    """Return the planner's row estimate for ``query`` without running it.
+
+    ``EXPLAIN`` only plans the statement, so this costs about as much as one
+    catalog lookup regardless of table size. It runs in a SAVEPOINT so a
+    failed ``EXPLAIN`` leaves the caller's transaction usable. Returns None
+    when the estimate is unavailable (e.g. non-PostgreSQL backend).
+    """
+    try:
+        # ``render_postcompile`` expands ``IN`` lists into one bind per
+        # element (``<name>_<n>``) so the statement can be re-bound as text.
+        compiled = query.compile(
+            dialect=postgresql.dialect(paramstyle="named"),
+            compile_kwargs={"render_postcompile": True},
+        )
+        types = {name: bind.type for name, bind in compiled.binds.items()}
+        # Escape PostgreSQL ``::type`` casts so text() does not mistake the
+        # ``:name::UUID`` that follows a bind for part of the bind name.
+        sql = str(compiled).replace("::", r"\:\:")
+        explain = text(f"EXPLAIN (FORMAT JSON) {sql}").bindparams(
+            *(
+                bindparam(
+                    name,
+                    value,
+                    type_=types.get(name) or types.get(name.rpartition("_")[0]),
+                )
+                for name, value in compiled.params.items()
+            )
+        )
+        async with db.begin_nested():
+            plan = (await db.execute(explain)).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception:  # noqa: BLE001 — the caller falls back to an exact count
+        logger.debug("Row estimate unavailable; using exact count", exc_info=True)
+        return None
+
+
+async def count_total(
+    db: AsyncSession,
+    query: Select[Any],
+    total_mode: TotalMode = "exact",
+) -> RowCount:
+    """Count the rows ``query`` would return.
+
+    Args:
+        db: Database session.
+        query: Filtered, unordered, unpaginated row query.
+        total_mode: ``"exact"`` runs ``count(*)``; ``"estimate"`` uses the
+            planner estimate unless it is below :data:`ESTIMATE_EXACT_BELOW`.
+
+    Returns:
+        The total, flagged with :attr:`RowCount.is_estimate` when it is the
+        planner estimate.
+    """
+    if total_mode == "estimate":
+        estimate = await estimate_row_count(db, query)
+        if estimate is not None and estimate >= ESTIMATE_EXACT_BELOW:
+            return RowCount(estimate, is_estimate=True)
+    result = await db.execute(select(func.count()).select_from(query.order_by(None).subquery()))
+    return RowCount(result.scalar_one())
@@ -197,6 +197,9 @@ SUPERUSER_PROJECT_SCOPE_ALLOWLIST: frozenset[str] = frozenset(
 )
 """FR-008b: Superuser may bypass per-project Permission gate ONLY for these actions."""
 
+DELETING_PROJECT_MUTATION_ALLOWLIST: frozenset[str] = frozenset({"project.delete"})
+"""Mutating actions still allowed on a ``deleting`` project (retrying a failed deletion)."""
+
 
 # =============================================================================
 # T040b. Action model + ACTIONS catalog
@@ -1016,8 +1019,19 @@ def is_allowed(
     if project is None:
         return False, frozenset()
 
-    # --- Step 1: archived block -----------------------------------------------
-    if getattr(project, "status", None) == "archived" and action.is_mutating:
+    # --- Step 1: archived / deleting block --------------------------------------
+    # A ``deleting`` project is being removed by a background job
+    # (``echoroo.workers.deletion_tasks``); writes racing it would either
+    # fail on vanished parents or leave rows behind. Only the delete
+    # itself may be re-issued, so a failed deletion can be retried.
+    project_status = getattr(project, "status", None)
+    if action.is_mutating and (
+        project_status == "archived"
+        or (
+            project_status == "deleting"
+            and action.name not in DELETING_PROJECT_MUTATION_ALLOWLIST
+        )
+    ):
         _stash_state(request, effective=frozenset(), normalized_role="Authenticated")
         return False, frozenset()
 
@@ -1541,6 +1555,7 @@ __all__ = [
     "ACTIONS",
     "Action",
     "COMPUTED_ONLY_PERMISSIONS",
+    "DELETING_PROJECT_MUTATION_ALLOWLIST",
     "ComputedRole",
     "ENDPOINT_BACKED_PERMISSIONS",
     "FRONTEND_PROJECT_PERMISSIONS",
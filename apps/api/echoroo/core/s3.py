@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import hmac
+import io
 import logging
+import os
+import threading
 from collections.abc import Iterator
 from datetime import datetime
+from pathlib import Path
 from typing import Any, NamedTuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
@@ -41,35 +47,94 @@ class BatchDeleteResult(NamedTuple):
     errors: list[S3DeletionError]
 
 
-def get_s3_client() -> Any:
-    """Create and return an S3 client configured for S3-compatible storage."""
+# ---------------------------------------------------------------------------
+# Shared clients
+# ---------------------------------------------------------------------------
+#
+# Building a boto3 client resolves credentials, loads the service model and
+# sets up a fresh connection pool, which costs milliseconds and throws away
+# warm TLS/keep-alive connections. Clients are thread-safe once built, so
+# every caller in a process shares one per endpoint. boto3's default session
+# is *not* thread-safe, hence the lock around construction. The cache is
+# keyed by PID as well because a client must not cross a fork (Celery
+# prefork children would share the parent's sockets).
+
+_clients: dict[tuple[Any, ...], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _client_config() -> Config:
+    """Return the botocore config shared by every S3 client."""
     settings = get_settings()
-    return boto3.client(
-        "s3",
-        endpoint_url=settings.S3_ENDPOINT_URL,
-        aws_access_key_id=settings.S3_ACCESS_KEY,
-        aws_secret_access_key=settings.S3_SECRET_KEY,
-        region_name=settings.S3_REGION,
-        config=Config(signature_version="s3v4"),
+    return Config(
+        signature_version="s3v4",
+        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+        connect_timeout=settings.S3_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=settings.S3_READ_TIMEOUT_SECONDS,
+        retries={"max_attempts": settings.S3_MAX_ATTEMPTS, "mode": "standard"},
+        tcp_keepalive=True,
     )
 
 
+def _shared_client(endpoint_url: str) -> Any:
+    """Return the process-wide S3 client for ``endpoint_url``."""
+    settings = get_settings()
+    key = (
+        os.getpid(),
+        endpoint_url,
+        settings.S3_ACCESS_KEY,
+        settings.S3_SECRET_KEY,
+        settings.S3_REGION,
+        settings.S3_MAX_POOL_CONNECTIONS,
+    )
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = boto3.client(
+                "s3",
+                endpoint_url=endpoint_url,
+                aws_access_key_id=settings.S3_ACCESS_KEY,
+                aws_secret_access_key=settings.S3_SECRET_KEY,
+                region_name=settings.S3_REGION,
+                config=_client_config(),
+            )
+            _clients[key] = client
+        return client
+
+
+def reset_s3_clients() -> None:
+    """Forget the shared clients (tests, credential rotation)."""
+    with _clients_lock:
+        _clients.clear()
+
+
+def get_s3_client() -> Any:
+    """Return the shared S3 client for the internal endpoint."""
+    return _shared_client(get_settings().S3_ENDPOINT_URL)
+
+
 def get_public_s3_client() -> Any:
-    """Create and return an S3 client using the public endpoint URL.
+    """Return the shared S3 client for the public endpoint URL.
 
     This client is intended for generating presigned URLs that are accessible
     from browsers. Uses S3_PUBLIC_ENDPOINT_URL when set, falling back to
     S3_ENDPOINT_URL.
     """
     settings = get_settings()
-    endpoint_url = settings.S3_PUBLIC_ENDPOINT_URL or settings.S3_ENDPOINT_URL
-    return boto3.client(
-        "s3",
-        endpoint_url=endpoint_url,
-        aws_access_key_id=settings.S3_ACCESS_KEY,
-        aws_secret_access_key=settings.S3_SECRET_KEY,
-        region_name=settings.S3_REGION,
-        config=Config(signature_version="s3v4"),
+    return _shared_client(settings.S3_PUBLIC_ENDPOINT_URL or settings.S3_ENDPOINT_URL)
+
+
+def transfer_config() -> TransferConfig:
+    """Return the multipart transfer settings for uploads and downloads."""
+    settings = get_settings()
+    return TransferConfig(
+        multipart_threshold=settings.S3_MULTIPART_THRESHOLD_BYTES,
+        multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE_BYTES,
+        max_concurrency=settings.S3_TRANSFER_CONCURRENCY,
+        use_threads=True,
     )
 
 
@@ -379,3 +444,233 @@ def delete_objects_batch(keys: list[str], client: Any = None) -> BatchDeleteResu
         for err in response.get("Errors", []) or []
     ]
     return BatchDeleteResult(deleted=deleted, errors=errors)
+
+
+def download_file(object_key: str, dest: str | Path, client: Any = None) -> None:
+    """Download an object to ``dest``, in concurrent ranged parts when large.
+
+    Args:
+        object_key: S3 object key.
+        dest: Local file path to write.
+        client: Optional S3 client instance.
+
+    Raises:
+        ClientError: If the object cannot be read.
+    """
+    settings = get_settings()
+    client = client or get_s3_client()
+    client.download_file(settings.S3_BUCKET, object_key, str(dest), Config=transfer_config())
+
+
+def upload_file(
+    path: str | Path,
+    object_key: str,
+    extra_args: dict[str, Any] | None = None,
+    client: Any = None,
+) -> None:
+    """Upload a local file, as a concurrent multipart upload when large.
+
+    ``extra_args`` must not carry user ``Metadata``: unlike ``put_object``
+    callers, this path does not run the FR-028e GPS metadata sanitizer.
+
+    Args:
+        path: Local file to upload.
+        object_key: Destination S3 object key.
+        extra_args: Optional ``ExtraArgs`` (e.g. ``ContentType``).
+        client: Optional S3 client instance.
+
+    Raises:
+        ValueError: If ``extra_args`` contains ``Metadata``.
+        ClientError: If the upload fails.
+    """
+    if extra_args and "Metadata" in extra_args:
+        raise ValueError("upload_file does not accept Metadata; use put_object with the sanitizer")
+    settings = get_settings()
+    client = client or get_s3_client()
+    client.upload_file(
+        str(path),
+        settings.S3_BUCKET,
+        object_key,
+        ExtraArgs=extra_args or None,
+        Config=transfer_config(),
+    )
+
+
+class MultipartUploadWriter(io.RawIOBase):
+    """Write-only, non-seekable file object backed by an S3 multipart upload.
+
+    Written bytes are buffered up to ``S3_MULTIPART_CHUNKSIZE_BYTES`` and
+    sent as one part each, so memory stays at one part however large the
+    object grows; this lets a producer such as :class:`zipfile.ZipFile`
+    write an archive straight to storage. :meth:`close` uploads the last
+    part and completes the upload; leaving a ``with`` block on an
+    exception (or calling :meth:`abort`) discards it instead.
+
+    Like :func:`upload_file`, this path never sets user ``Metadata``.
+    ``extra_args`` are passed to ``CreateMultipartUpload``; when they set
+    ``ObjectLockMode`` every part carries the ``Content-MD5`` that S3
+    requires for Object Lock uploads.
+    """
+
+    def __init__(
+        self,
+        object_key: str,
+        *,
+        content_type: str | None = None,
+        bucket: str | None = None,
+        extra_args: dict[str, Any] | None = None,
+        client: Any = None,
+    ) -> None:
+        if extra_args and "Metadata" in extra_args:
+            raise ValueError(
+                "MultipartUploadWriter does not accept Metadata; use put_object with the sanitizer"
+            )
+        super().__init__()
+        settings = get_settings()
+        self.object_key = object_key
+        self.bytes_written = 0
+        self._bucket = bucket or settings.S3_BUCKET
+        self._part_size = settings.S3_MULTIPART_CHUNKSIZE_BYTES
+        self._client = client or get_s3_client()
+        params: dict[str, Any] = {**(extra_args or {}), "Bucket": self._bucket, "Key": object_key}
+        if content_type:
+            params["ContentType"] = content_type
+        self._part_md5 = "ObjectLockMode" in params
+        self._upload_id: str = self._client.create_multipart_upload(**params)["UploadId"]
+        self._parts: list[dict[str, Any]] = []
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        if self.closed:
+            raise ValueError("write to closed MultipartUploadWriter")
+        view = memoryview(data).cast("B")
+        self._buffer += view
+        self.bytes_written += len(view)
+        while len(self._buffer) >= self._part_size:
+            self._upload_part(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+        return len(view)
+
+    def _upload_part(self, body: bytes) -> None:
+        number = len(self._parts) + 1
+        params: dict[str, Any] = {}
+        if self._part_md5:
+            params["ContentMD5"] = base64.b64encode(hashlib.md5(body, usedforsecurity=False).digest()).decode("ascii")
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self.object_key,
+            UploadId=self._upload_id,
+            PartNumber=number,
+            Body=body,
+            **params,
+        )
+        self._parts.append({"PartNumber": number, "ETag": response["ETag"]})
+
+    def close(self) -> None:
+        """Upload the buffered tail and complete the upload."""
+        if self.closed:
+            return
+        try:
+            if self._buffer or not self._parts:
+                self._upload_part(bytes(self._buffer))
+                self._buffer.clear()
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self.object_key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+        except Exception:
+            self._abort_upload()
+            raise
+        finally:
+            super().close()
+
+    def abort(self) -> None:
+        """Discard the upload and every part sent so far."""
+        if self.closed:
+            return
+        self._abort_upload()
+        super().close()
+
+    def _abort_upload(self) -> None:
+        self._buffer.clear()
+        try:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self.object_key, UploadId=self._upload_id
+            )
+        except ClientError:
+            logger.warning("Failed to abort multipart upload of %s", self.object_key)
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def __del__(self) -> None:
+        # IOBase would close() — i.e. *complete* — an abandoned upload.
+        if hasattr(self, "_upload_id") and not self.closed:
+            self.abort()
+
+
+def abort_multipart_uploads(object_key: str, *, client: Any = None) -> int:
+    """Abort every unfinished multipart upload of ``object_key``.
+
+    Frees the parts of an upload whose writer died before it could call
+    :meth:`MultipartUploadWriter.abort` (e.g. a worker killed by its hard
+    time limit).
+
+    Args:
+        object_key: S3 object key whose pending uploads are discarded.
+        client: Optional S3 client instance.
+
+    Returns:
+        Number of uploads aborted.
+    """
+    settings = get_settings()
+    client = client or get_s3_client()
+    response = client.list_multipart_uploads(Bucket=settings.S3_BUCKET, Prefix=object_key)
+    aborted = 0
+    for upload in response.get("Uploads", []):
+        if upload["Key"] != object_key:
+            continue
+        client.abort_multipart_upload(
+            Bucket=settings.S3_BUCKET, Key=object_key, UploadId=upload["UploadId"]
+        )
+        aborted += 1
+    return aborted
+
+
+def generate_presigned_download_url(
+    object_key: str,
+    *,
+    filename: str | None = None,
+    expiry_seconds: int | None = None,
+    client: Any = None,
+) -> str:
+    """Generate a presigned GET URL for browser-direct download.
+
+    Args:
+        object_key: S3 object key
+        filename: Optional download file name (``Content-Disposition``)
+        expiry_seconds: URL expiry in seconds (default from settings)
+        client: Optional S3 client instance (default: the public endpoint)
+
+    Returns:
+        Presigned URL string
+    """
+    settings = get_settings()
+    client = client or get_public_s3_client()
+    params: dict[str, Any] = {"Bucket": settings.S3_BUCKET, "Key": object_key}
+    if filename:
+        params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
+    url: str = client.generate_presigned_url(
+        "get_object",
+        Params=params,
+        ExpiresIn=expiry_seconds or settings.S3_PRESIGNED_URL_EXPIRY,
+    )
+    return url
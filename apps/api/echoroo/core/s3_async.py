@@ -0,0 +1,150 @@
+"""Async facade over the shared S3 client.
+
+boto3 is blocking, so async code must not call it on the event loop
+thread. Every helper here runs the call on a dedicated thread pool sized
+to ``S3_MAX_POOL_CONNECTIONS`` — one thread per pooled connection of the
+shared client (:func:`echoroo.core.s3.get_s3_client`) — rather than the
+loop's default executor, so slow S3 reads cannot starve unrelated
+``asyncio.to_thread`` work and vice versa.
+
+- :func:`open_object` / :func:`iter_object` / :func:`read_object` stream an
+  object (optionally a byte range) without buffering it whole.
+- :func:`download_file` / :func:`upload_file` use boto3's managed transfer,
+  which splits large objects into concurrent ranged or multipart parts
+  (``S3_MULTIPART_*`` / ``S3_TRANSFER_CONCURRENCY``).
+- :func:`run_blocking` runs any other blocking storage call (including
+  :meth:`AudioService.ensure_file_local`) on the same pool.
+
+The pool is created per process, like the client, so Celery prefork
+children never inherit the parent's threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+from echoroo.core import s3
+from echoroo.core.settings import get_settings
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+#: Bytes read per blocking ``read`` when streaming an object.
+STREAM_CHUNK_SIZE = 256 * 1024
+
+_executors: dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    pid = os.getpid()
+    executor = _executors.get(pid)
+    if executor is not None:
+        return executor
+    with _executors_lock:
+        executor = _executors.get(pid)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=get_settings().S3_MAX_POOL_CONNECTIONS,
+                thread_name_prefix="s3-io",
+            )
+            _executors[pid] = executor
+        return executor
+
+
+async def run_blocking(fn: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs) -> _T:
+    """Run a blocking storage call on the S3 I/O thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor(), functools.partial(fn, *args, **kwargs))
+
+
+@dataclass
+class ObjectStream:
+    """An open ``GetObject`` response read asynchronously in chunks."""
+
+    body: Any
+    content_length: int | None
+    content_range: str | None
+    content_type: str | None
+
+    async def chunks(self, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Yield the body in chunks, closing it when done or abandoned."""
+        try:
+            while chunk := await run_blocking(self.body.read, chunk_size):
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the pooled connection held by the body."""
+        await run_blocking(self.body.close)
+
+
+def _get_object(object_key: str, byte_range: str | None) -> dict[str, Any]:
+    params: dict[str, Any] = {"Bucket": get_settings().S3_BUCKET, "Key": object_key}
+    if byte_range:
+        params["Range"] = byte_range
+    response: dict[str, Any] = s3.get_s3_client().get_object(**params)
+    return response
+
+
+async def open_object(object_key: str, byte_range: str | None = None) -> ObjectStream:
+    """Issue a (ranged) GET and return the open response.
+
+    Args:
+        object_key: S3 object key.
+        byte_range: Optional HTTP range (e.g. ``"bytes=0-65535"``).
+
+    Raises:
+        ClientError: If the object cannot be read.
+    """
+    response = await run_blocking(_get_object, object_key, byte_range)
+    return ObjectStream(
+        body=response["Body"],
+        content_length=response.get("ContentLength"),
+        content_range=response.get("ContentRange"),
+        content_type=response.get("ContentType"),
+    )
+
+
+async def iter_object(
+    object_key: str,
+    byte_range: str | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield an object (or a byte range of it) in chunks."""
+    stream = await open_object(object_key, byte_range)
+    async for chunk in stream.chunks(chunk_size):
+        yield chunk
+
+
+async def read_object(object_key: str, byte_range: str | None = None) -> bytes:
+    """Return an object (or a byte range of it) as bytes."""
+    return b"".join([chunk async for chunk in iter_object(object_key, byte_range)])
+
+
+async def download_file(object_key: str, dest: str | Path) -> None:
+    """Download an object to ``dest`` (multipart for large objects)."""
+    await run_blocking(s3.download_file, object_key, dest)
+
+
+async def upload_file(
+    path: str | Path,
+    object_key: str,
+    extra_args: dict[str, Any] | None = None,
+) -> None:
+    """Upload a local file (multipart for large files); see :func:`s3.upload_file`."""
+    await run_blocking(s3.upload_file, path, object_key, extra_args)
+
+
+async def delete_object(object_key: str) -> bool:
+    """Delete an object; ``False`` if S3 refused."""
+    return await run_blocking(s3.delete_object, object_key)
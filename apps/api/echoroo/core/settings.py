@@ -226,6 +226,42 @@ class Settings(BaseSettings):
         default="/data/s3_audio_cache",
         description="Directory used by AudioService to cache files downloaded from S3",
     )
+    # The S3 audio cache is LRU-bounded. Objects used within the min-age
+    # window are never evicted (an ML worker may still be decoding them),
+    # so the budget is soft while a large detection run is in flight.
+    S3_AUDIO_CACHE_MAX_BYTES: int = Field(
+        default=50 * 1024 * 1024 * 1024,
+        ge=0,
+        description="LRU budget for S3_AUDIO_CACHE_DIR in bytes (0 = unbounded)",
+    )
+    S3_AUDIO_CACHE_MIN_AGE_SECONDS: int = Field(
+        default=600,
+        ge=0,
+        description="Objects used more recently than this are exempt from eviction",
+    )
+    S3_AUDIO_PREFETCH_WORKERS: int = Field(
+        default=4,
+        ge=1,
+        description="Threads per process used to prefetch S3 audio objects",
+    )
+    # Compressed (OGG/Vorbis) playback copies. Produced by the
+    # ``echoroo.workers.playback_tasks`` background task at import time or
+    # on first play; the directory must be shared between the API and the
+    # CPU worker (``backend-data`` volume in compose). Least-recently-played
+    # entries are evicted once the directory exceeds the byte budget.
+    PLAYBACK_CACHE_DIR: str = Field(
+        default="/data/audio_compressed",
+        description="Directory holding compressed OGG playback copies",
+    )
+    PLAYBACK_CACHE_MAX_BYTES: int = Field(
+        default=20 * 1024 * 1024 * 1024,
+        ge=0,
+        description="LRU budget for PLAYBACK_CACHE_DIR in bytes (0 = unbounded)",
+    )
+    PLAYBACK_TRANSCODE_ON_IMPORT: bool = Field(
+        default=True,
+        description="Enqueue playback transcodes for every recording created by an import",
+    )
 
     # S3 / Object Storage
     S3_ENDPOINT_URL: str = "http://localhost:9000"
@@ -235,6 +271,36 @@ class Settings(BaseSettings):
     S3_BUCKET: str = "echoroo"
     S3_REGION: str = "us-east-1"
     S3_PRESIGNED_URL_EXPIRY: int = 900  # 15 minutes
+    # The S3 client is shared per process (see ``echoroo.core.s3``), so its
+    # connection pool must cover every thread that talks to S3 at once:
+    # the async I/O executor, audio prefetch and multipart transfer threads.
+    S3_MAX_POOL_CONNECTIONS: int = Field(
+        default=50,
+        ge=1,
+        description="HTTP connections kept by the shared S3 client (also the async I/O thread count)",
+    )
+    S3_CONNECT_TIMEOUT_SECONDS: float = Field(default=5.0, gt=0)
+    S3_READ_TIMEOUT_SECONDS: float = Field(default=60.0, gt=0)
+    S3_MAX_ATTEMPTS: int = Field(
+        default=5,
+        ge=1,
+        description="Attempts per S3 call (botocore 'standard' retry mode)",
+    )
+    S3_MULTIPART_THRESHOLD_BYTES: int = Field(
+        default=16 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        description="Objects at least this large are transferred in concurrent parts",
+    )
+    S3_MULTIPART_CHUNKSIZE_BYTES: int = Field(
+        default=16 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        description="Part size of multipart uploads and ranged multipart downloads",
+    )
+    S3_TRANSFER_CONCURRENCY: int = Field(
+        default=8,
+        ge=1,
+        description="Parts transferred in parallel per multipart upload/download",
+    )
 
     # Upload limits
     UPLOAD_MAX_FILE_SIZE: int = 1 * 1024 * 1024 * 1024  # 1GB per file
@@ -280,6 +346,24 @@ class Settings(BaseSettings):
     JANITOR_DRY_RUN: bool = True  # default True; flip to False after prod monitoring
     JANITOR_AGE_HOURS: int = 24  # orphan age threshold (hours)
 
+    # GBIF taxon resolution cache.
+    #
+    # Outcomes of GBIF ``species/match`` lookups (and the vernacular names
+    # fetched for a match) are kept in the ``taxon_resolution_cache`` table
+    # (``echoroo.services.taxon_resolution``) so a label seen before is
+    # answered without a network call. Matches are trusted for the hit TTL;
+    # names GBIF could not match are asked about again after the miss TTL.
+    TAXON_RESOLUTION_HIT_TTL_DAYS: int = Field(
+        default=90,
+        ge=0,
+        description="Days a cached GBIF name match is reused (0 = not cached)",
+    )
+    TAXON_RESOLUTION_MISS_TTL_DAYS: int = Field(
+        default=7,
+        ge=0,
+        description="Days a cached GBIF 'no match' is reused (0 = not cached)",
+    )
+
     # Xeno-canto integration.
     #
     # The Xeno-canto search/import features require an API key issued from a
@@ -295,6 +379,32 @@ class Settings(BaseSettings):
             "Unset or 'demo' disables the Xeno-canto integration."
         ),
     )
+    # Proxied Xeno-canto audio and sonograms are cached on local disk
+    # (``echoroo.services.xeno_canto_cache``) so reference previews while
+    # building a batch search do not re-fetch them upstream. Copies younger
+    # than the freshness window are served as-is, older ones are revalidated
+    # with a conditional GET; least-recently-used entries are evicted once
+    # the directory exceeds the byte budget. Search responses are cached in
+    # Redis for the search TTL.
+    XENO_CANTO_CACHE_DIR: str = Field(
+        default="/data/xeno_canto_cache",
+        description="Directory caching proxied Xeno-canto audio and sonograms",
+    )
+    XENO_CANTO_CACHE_MAX_BYTES: int = Field(
+        default=2 * 1024 * 1024 * 1024,
+        ge=0,
+        description="LRU budget for XENO_CANTO_CACHE_DIR in bytes (0 = cache disabled)",
+    )
+    XENO_CANTO_CACHE_FRESH_SECONDS: int = Field(
+        default=7 * 24 * 60 * 60,
+        ge=0,
+        description="Age after which a cached Xeno-canto file is revalidated upstream",
+    )
+    XENO_CANTO_SEARCH_CACHE_TTL_SECONDS: int = Field(
+        default=60 * 60,
+        ge=0,
+        description="Redis TTL of cached Xeno-canto search responses (0 = not cached)",
+    )
 
     # Boot probes (fail-fast on missing critical config).
     #
@@ -350,6 +460,18 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/1"
 
+    # Outbox listener (echoroo.workers.outbox_listener). Woken by
+    # pg_notify on enqueue; this is only the fallback poll interval.
+    OUTBOX_LISTENER_POLL_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias="ECHOROO_OUTBOX_LISTENER_POLL_SECONDS",
+        description=(
+            "Longest the outbox listener sleeps without a notification "
+            "before re-checking the table."
+        ),
+    )
+
     # ML / inference (Celery worker).
     #
     # Both BirdNET (via the ``birdnet`` package) and Perch run on
@@ -432,6 +554,71 @@ class Settings(BaseSettings):
         ),
     )
 
+    # Shared inference server (echoroo.ml.serving). When enabled, similarity
+    # search embeds query audio through one long-lived process that owns the
+    # models and micro-batches concurrent requests, instead of loading a
+    # model copy in every API / worker process. The socket must live on a
+    # volume shared by the server, the API and the GPU worker.
+    INFERENCE_SERVER_ENABLED: bool = Field(
+        default=False,
+        validation_alias="ECHOROO_INFERENCE_SERVER_ENABLED",
+        description="Route query embedding through the shared inference server.",
+    )
+    INFERENCE_SERVER_SOCKET: str = Field(
+        default="/data/run/inference.sock",
+        validation_alias="ECHOROO_INFERENCE_SERVER_SOCKET",
+        description="Unix socket path of the inference server.",
+    )
+    INFERENCE_SERVER_MODELS: str = Field(
+        default="perch,birdnet",
+        validation_alias="ECHOROO_INFERENCE_SERVER_MODELS",
+        description="Comma-separated models the inference server loads.",
+    )
+    INFERENCE_SERVER_BACKEND: Literal["model", "stand-in"] = Field(
+        default="model",
+        validation_alias="ECHOROO_INFERENCE_SERVER_BACKEND",
+        description=(
+            "'model' serves the real TensorFlow models; 'stand-in' serves a "
+            "deterministic CPU substitute with the same shapes (tests / dev)."
+        ),
+    )
+    INFERENCE_SERVER_MAX_BATCH: int = Field(
+        default=16,
+        ge=1,
+        validation_alias="ECHOROO_INFERENCE_SERVER_MAX_BATCH",
+        description="Maximum segments per model call when coalescing requests.",
+    )
+    INFERENCE_SERVER_MAX_WAIT_MS: float = Field(
+        default=10.0,
+        ge=0,
+        validation_alias="ECHOROO_INFERENCE_SERVER_MAX_WAIT_MS",
+        description="How long the oldest queued request waits for others to batch with.",
+    )
+    INFERENCE_SERVER_TIMEOUT_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        validation_alias="ECHOROO_INFERENCE_SERVER_TIMEOUT_SECONDS",
+        description="Client-side timeout for one inference server reply.",
+    )
+    SEARCH_EMBED_MAX_BATCH: int = Field(
+        default=16,
+        ge=1,
+        validation_alias="ECHOROO_SEARCH_EMBED_MAX_BATCH",
+        description=(
+            "Maximum query segments embedded per model call when audio-file "
+            "searches are embedded in-process (inference server disabled)."
+        ),
+    )
+    SEARCH_EMBED_MAX_WAIT_MS: float = Field(
+        default=20.0,
+        ge=0,
+        validation_alias="ECHOROO_SEARCH_EMBED_MAX_WAIT_MS",
+        description=(
+            "How long an in-process audio-file search waits for concurrent "
+            "searches to share its model call. 0 disables coalescing."
+        ),
+    )
+
     def ml_cpu_warmup_batch_sizes(self) -> list[int]:
         """Parse ``ML_CPU_WARMUP_BATCHES`` into a list of positive ints.
 
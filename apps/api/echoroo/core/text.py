@@ -1,8 +1,29 @@
-"""Shared text safety helpers."""
+"""Shared text helpers."""
 
 from __future__ import annotations
 
+import unicodedata
+
+# Katakana ァ..ヶ fold onto hiragana ぁ..ゖ (same order, 0x60 apart), so a
+# name typed in either kana script matches the other.
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+
 
 def has_control_chars(value: str) -> bool:
     """Return True when ``value`` contains ASCII control characters."""
     return any(ord(ch) < 32 or ord(ch) == 127 for ch in value)
+
+
+def fold_for_search(value: str) -> str:
+    """Normalize a name for accent-, width-, kana- and case-insensitive search.
+
+    NFKC turns full-width Latin into ASCII and half-width kana into
+    full-width; Latin combining diacritics are then stripped (``Sterna
+    paradisæa`` keeps its ligature, ``Pájaro`` becomes ``pajaro``) while the
+    kana voicing marks survive, katakana is folded onto hiragana, and the
+    result is case-folded with whitespace collapsed. Kanji are kept as-is.
+    """
+    text = unicodedata.normalize("NFKD", unicodedata.normalize("NFKC", value))
+    text = "".join(ch for ch in text if not 0x300 <= ord(ch) <= 0x36F)
+    text = unicodedata.normalize("NFC", text).translate(_KATAKANA_TO_HIRAGANA)
+    return " ".join(text.casefold().split())
@@ -321,6 +321,7 @@ class PinnedIPAsyncTransport(httpx.AsyncBaseTransport):
         http1: bool = True,
         http2: bool = False,
         allowed_hosts: Iterable[str] | None = None,
+        limits: httpx.Limits | None = None,
     ) -> None:
         self._pinned_host = pinned_host.lower()
         self._pinned_ip = pinned_ip
@@ -337,8 +338,11 @@ class PinnedIPAsyncTransport(httpx.AsyncBaseTransport):
             if allowed_hosts is not None
             else ALLOWED_AUDIO_HOSTS
         )
+        # ``limits`` sizes the connection pool when the transport is shared
+        # (see :mod:`echoroo.core.http_clients`); httpx defaults otherwise.
+        pool: dict[str, Any] = {} if limits is None else {"limits": limits}
         self._inner: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
-            verify=verify, http1=http1, http2=http2
+            verify=verify, http1=http1, http2=http2, **pool
         )
 
     async def __aenter__(self) -> PinnedIPAsyncTransport:
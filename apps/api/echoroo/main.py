@@ -22,6 +22,7 @@ from echoroo.core.exceptions import (
     validation_exception_handler,
 )
 from echoroo.core.health import check_readiness
+from echoroo.core.http_clients import close_http_clients
 from echoroo.core.redis import close_redis_connection, get_redis_connection
 from echoroo.core.settings import get_settings
 from echoroo.middleware.api_key_ip_enforcement import DbIpEnforcer
@@ -210,6 +211,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: ARG001
     yield
     # Shutdown
     await close_rate_limiter()
+    await close_http_clients()
     await close_redis_connection()
 
 
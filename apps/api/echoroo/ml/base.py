@@ -442,6 +442,31 @@ class InferenceEngine(ABC):
         """
         raise NotImplementedError
 
+    def get_embeddings_only(
+        self,
+        segments: list[NDArray[np.float32]],
+    ) -> NDArray[np.float32]:
+        """Extract embeddings of audio segments without predictions.
+
+        Default implementation runs :meth:`predict_segment` per segment;
+        subclasses should override it with a single batched encode.
+
+        Parameters
+        ----------
+        segments : list[NDArray[np.float32]]
+            List of audio segments, each with shape (segment_samples,).
+
+        Returns
+        -------
+        NDArray[np.float32]
+            Embeddings array, shape (num_segments, embedding_dim).
+        """
+        if not segments:
+            return np.empty((0, self.specification.embedding_dim), dtype=np.float32)
+        return np.stack(
+            [self.predict_segment(segment, 0.0).embedding for segment in segments]
+        ).astype(np.float32)
+
     def predict_file(
         self,
         path: Path,
@@ -455,7 +455,9 @@ class BirdNETInference(InferenceEngine):
     ) -> NDArray[np.float32]:
         """Extract embeddings without predictions.
 
-        Useful for clustering or similarity searches.
+        Concatenates all segments into a single file and calls encode() once;
+        BirdNET's 3-second windows line up with the segment boundaries, so
+        window ``i`` is segment ``i``. The classifier (predict()) is skipped.
 
         Parameters
         ----------
@@ -466,16 +468,31 @@ class BirdNETInference(InferenceEngine):
         -------
         NDArray[np.float32]
             Embeddings array, shape (num_segments, 1024).
+
+        Raises
+        ------
+        ValueError
+            If a segment shape is invalid.
         """
         if not segments:
             return np.empty((0, EMBEDDING_DIM), dtype=np.float32)
 
-        embeddings = []
-        for segment in segments:
-            result = self.predict_segment(segment)
-            embeddings.append(result.embedding)
-
-        return np.stack(embeddings)
+        validated: list[NDArray[np.float32]] = []
+        for seg in segments:
+            seg = seg.astype(np.float32)
+            if seg.ndim != 1 or seg.shape[0] != SEGMENT_SAMPLES:
+                raise ValueError(
+                    f"BirdNET expects audio of shape ({SEGMENT_SAMPLES},) at {SAMPLE_RATE}Hz, "
+                    f"got shape {seg.shape}"
+                )
+            validated.append(seg)
+
+        with self._temp_audio_file(np.concatenate(validated, axis=0)) as tmp_path:
+            embeddings_result = self._model.encode(tmp_path, **self._build_infer_kwargs())
+            embeddings = self._extract_embeddings(embeddings_result)
+            embeddings_by_segment = self._normalize_embedding_batch(embeddings)
+
+        return embeddings_by_segment[: len(validated)].astype(np.float32)
 
     def encode_batch(self, file_paths: list[str]) -> Any:
         """Encode multiple files in a single batch call.
@@ -0,0 +1,185 @@
+"""Cached BirdNET geo-model species lists.
+
+The BirdNET geo model maps a location and a week of the year to the species
+expected there. Its output only depends on that input, the confidence cut
+and the model version, so lists are cached in Redis under
+``(H3 cell at GEO_CACHE_H3_RESOLUTION, week, min_species_conf,
+BIRDNET_VERSION)`` and shared by every detection run (and every worker)
+that needs them. Locations are snapped to the centre of their resolution-5
+cell (~250 km²), well inside the geo model's own spatial resolution.
+
+Weeks follow BirdNET's 48-week year (four weeks per month, see
+:func:`birdnet_week`), not ISO weeks. The cache is best-effort: a Redis
+failure only means the geo model runs again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import h3
+
+from echoroo.ml.birdnet_wrapper import BIRDNET_VERSION, BirdNETWrapper
+from echoroo.services.h3_utils import h3_to_center
+
+logger = logging.getLogger(__name__)
+
+#: H3 resolution the cache is keyed on; finer site cells share their parent.
+GEO_CACHE_H3_RESOLUTION = 5
+
+#: Default geo-model confidence for a species to make the list.
+GEO_MIN_SPECIES_CONF = 0.03
+
+#: BirdNET geo-model weeks.
+GEO_WEEKS = range(1, 49)
+
+# Lists only change with BIRDNET_VERSION (part of the key); the TTL just
+# bounds Redis memory for cells nobody records in any more.
+_GEO_CACHE_TTL = 180 * 24 * 60 * 60
+
+
+def birdnet_week(when: datetime) -> int:
+    """Return the BirdNET geo-model week (1-48) of ``when``.
+
+    BirdNET splits every month into four weeks: days 1-7, 8-14, 15-21 and
+    22 to the end of the month.
+    """
+    return (when.month - 1) * 4 + min((when.day - 1) // 7, 3) + 1
+
+
+def geo_cell(h3_index: str) -> str:
+    """Return the cache cell (resolution :data:`GEO_CACHE_H3_RESOLUTION`)."""
+    if h3.get_resolution(h3_index) <= GEO_CACHE_H3_RESOLUTION:
+        return h3_index
+    return str(h3.cell_to_parent(h3_index, GEO_CACHE_H3_RESOLUTION))
+
+
+def geo_cache_key(cell: str, week: int, min_species_conf: float) -> str:
+    """Redis key of one cached species list."""
+    return f"birdnet_geo:{BIRDNET_VERSION}:{cell}:{week}:{min_species_conf:.4f}"
+
+
+async def _cache_get(key: str) -> list[str] | None:
+    try:
+        from echoroo.core.redis import get_redis_connection  # noqa: PLC0415
+
+        client = await get_redis_connection()
+        raw = await client.get(key)
+    except Exception:  # noqa: BLE001 — cache is best-effort
+        logger.debug("BirdNET geo cache read failed for %s", key, exc_info=True)
+        return None
+    return None if raw is None else list(json.loads(raw))
+
+
+async def _cache_set(key: str, species: list[str]) -> None:
+    try:
+        from echoroo.core.redis import get_redis_connection  # noqa: PLC0415
+
+        client = await get_redis_connection()
+        await client.set(key, json.dumps(species), ex=_GEO_CACHE_TTL)
+    except Exception:  # noqa: BLE001 — cache write must never fail detection
+        logger.debug("BirdNET geo cache write failed for %s", key, exc_info=True)
+
+
+async def get_geo_species(
+    cell: str,
+    week: int,
+    *,
+    min_species_conf: float = GEO_MIN_SPECIES_CONF,
+) -> list[str]:
+    """Return the sorted geo species list of a cache cell and week.
+
+    Served from Redis when cached; otherwise the geo model runs at the
+    cell centre and the result is cached.
+    """
+    key = geo_cache_key(cell, week, min_species_conf)
+    cached = await _cache_get(key)
+    if cached is not None:
+        return cached
+    lat, lon = h3_to_center(cell)
+    species = sorted(
+        BirdNETWrapper.get_instance().get_species_for_location(
+            lat, lon, week, min_species_conf=min_species_conf
+        )
+    )
+    await _cache_set(key, species)
+    return species
+
+
+def _recording_cell(recording: Any) -> str | None:
+    """H3 cell of a recording: its own override, else its dataset's site."""
+    h3_index: str | None = getattr(recording, "h3_index_member", None)
+    if h3_index is None:
+        site = getattr(getattr(recording, "dataset", None), "site", None)
+        h3_index = getattr(site, "h3_index_member", None)
+    return geo_cell(h3_index) if h3_index else None
+
+
+async def geo_species_by_recording(
+    recordings: Iterable[Any],
+    *,
+    min_species_conf: float = GEO_MIN_SPECIES_CONF,
+) -> dict[UUID, tuple[str, ...] | None]:
+    """Resolve the geo species list of every recording.
+
+    Recordings are grouped by (cache cell, BirdNET week) so each distinct
+    pair is looked up once. Recordings sharing a pair get the very same
+    tuple, so callers can batch inference by list. A recording without a
+    location or a datetime maps to None (no geo filter).
+    """
+    resolved: dict[tuple[str, int], tuple[str, ...]] = {}
+    result: dict[UUID, tuple[str, ...] | None] = {}
+    for recording in recordings:
+        cell = _recording_cell(recording)
+        if cell is None or recording.datetime is None:
+            result[recording.id] = None
+            continue
+        pair = (cell, birdnet_week(recording.datetime))
+        if pair not in resolved:
+            resolved[pair] = tuple(await get_geo_species(*pair, min_species_conf=min_species_conf))
+        result[recording.id] = resolved[pair]
+    if resolved:
+        logger.info(
+            "Geo filter: %d recordings over %d (cell, week) pairs",
+            len(result),
+            len(resolved),
+        )
+    return result
+
+
+async def precompute_geo_species(
+    h3_index: str,
+    *,
+    min_species_conf: float = GEO_MIN_SPECIES_CONF,
+) -> int:
+    """Warm the cache for every week of a site's cell.
+
+    Returns:
+        Number of weeks whose list had to be computed.
+    """
+    cell = geo_cell(h3_index)
+    computed = 0
+    for week in GEO_WEEKS:
+        key = geo_cache_key(cell, week, min_species_conf)
+        if await _cache_get(key) is None:
+            await get_geo_species(cell, week, min_species_conf=min_species_conf)
+            computed += 1
+    return computed
+
+
+__all__ = [
+    "GEO_CACHE_H3_RESOLUTION",
+    "GEO_MIN_SPECIES_CONF",
+    "GEO_WEEKS",
+    "birdnet_week",
+    "geo_cache_key",
+    "geo_cell",
+    "geo_species_by_recording",
+    "get_geo_species",
+    "precompute_geo_species",
+]
@@ -16,7 +16,10 @@ inference call is fast.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import numpy as np
 from numpy.typing import NDArray
@@ -28,7 +31,78 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["PerchDirectInference"]
+__all__ = ["PerchDirectInference", "pack_segment_batches"]
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def pack_segment_batches(
+    blocks: Iterable[tuple[int, NDArray[np.float32]]],
+    batch_size: int,
+) -> Iterator[tuple[NDArray[np.float32], list[tuple[int, int]]]]:
+    """Pack per-file segment blocks into model batches.
+
+    Every yielded batch holds exactly ``batch_size`` rows except the last,
+    which is zero-padded up to the next power of two (capped at
+    ``batch_size``). The model therefore only ever sees a handful of input
+    shapes and XLA does not recompile for each file's segment count.
+
+    Parameters
+    ----------
+    blocks : Iterable[tuple[int, NDArray[np.float32]]]
+        ``(file_index, segments)`` pairs in file order.
+    batch_size : int
+        Rows per full batch.
+
+    Yields
+    ------
+    tuple[NDArray[np.float32], list[tuple[int, int]]]
+        The batch and its ``(file_index, n_rows)`` owners in row order.
+        Padding rows have no owner and follow the owned rows.
+    """
+    batch_size = max(1, batch_size)
+    buffer: NDArray[np.float32] | None = None
+    filled = 0
+    owners: list[tuple[int, int]] = []
+
+    for file_index, segments in blocks:
+        offset = 0
+        while offset < segments.shape[0]:
+            if buffer is None:
+                buffer = np.zeros((batch_size, segments.shape[1]), dtype=np.float32)
+            take = min(batch_size - filled, segments.shape[0] - offset)
+            buffer[filled : filled + take] = segments[offset : offset + take]
+            owners.append((file_index, take))
+            filled += take
+            offset += take
+            if filled == batch_size:
+                yield buffer, owners
+                buffer, filled, owners = None, 0, []
+
+    if buffer is not None and filled:
+        bucket = min(batch_size, 1 << (filled - 1).bit_length())
+        yield buffer[:bucket], owners
+
+
+def _bounded_map(
+    pool: ThreadPoolExecutor,
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    ahead: int,
+) -> Iterator[_R]:
+    """Ordered ``pool.map`` that keeps at most ``ahead`` results in flight.
+
+    ``Executor.map`` submits every item up front, which for a long file list
+    would decode all of them into memory before the model catches up.
+    """
+    pending: deque[Future[_R]] = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= ahead:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 class PerchDirectInference:
@@ -190,7 +264,7 @@ class PerchDirectInference:
                 dtype=np.float32,
             )
 
-        return audio.astype(np.float32)
+        return np.asarray(audio, dtype=np.float32)
 
     @staticmethod
     def _chunk_into_segments(
@@ -219,13 +293,16 @@ class PerchDirectInference:
             padded[: len(audio)] = audio
             return padded[np.newaxis, :]
 
-        return np.stack(
-            [
-                audio[i * SEGMENT_SAMPLES : (i + 1) * SEGMENT_SAMPLES]
-                for i in range(n_segments)
-            ],
-            axis=0,
-        ).astype(np.float32)
+        # Reshaping a contiguous buffer is a strided view, not a copy: the
+        # segments share memory with ``audio`` and the trailing partial
+        # segment is simply left out of the view.
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        return audio[: n_segments * SEGMENT_SAMPLES].reshape(n_segments, SEGMENT_SAMPLES)
+
+    @classmethod
+    def _decode_segments(cls, file_path: str) -> NDArray[np.float32]:
+        """Load, resample and frame *file_path* (runs on a decode thread)."""
+        return cls._chunk_into_segments(cls._load_and_resample(file_path))
 
     def encode_audio_file(self, file_path: str) -> NDArray[np.float32]:
         """Load an audio file and return per-segment Perch embeddings.
@@ -249,16 +326,12 @@ class PerchDirectInference:
         RuntimeError
             If the model has not been loaded yet.
         """
-        import tensorflow as tf
-
         if self._encode_fn is None:
             raise RuntimeError("Model not loaded. Call load() first.")
 
         audio = self._load_and_resample(file_path)
         segments = self._chunk_into_segments(audio)
-
-        result = self._encode_fn(inputs=tf.constant(segments))
-        embeddings: NDArray[np.float32] = result["embedding"].numpy()
+        embeddings = self.encode_segments(segments)
 
         logger.debug(
             "PerchDirectInference: encoded '%s' -> %d segment(s), shape=%s",
@@ -267,27 +340,96 @@ class PerchDirectInference:
             embeddings.shape,
         )
 
+        return embeddings
+
+    def encode_segments(self, segments: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Run one model call over pre-framed 5-second segments.
+
+        Parameters
+        ----------
+        segments : NDArray[np.float32]
+            Shape ``(n_segments, SEGMENT_SAMPLES)`` float32 array at 32 kHz.
+
+        Returns
+        -------
+        NDArray[np.float32]
+            Shape ``(n_segments, EMBEDDING_DIM)`` float32 array.
+
+        Raises
+        ------
+        RuntimeError
+            If the model has not been loaded yet.
+        """
+        import tensorflow as tf
+
+        if self._encode_fn is None:
+            raise RuntimeError("Model not loaded. Call load() first.")
+
+        result = self._encode_fn(inputs=tf.constant(segments, dtype=tf.float32))
+        embeddings: NDArray[np.float32] = result["embedding"].numpy()
         return embeddings.astype(np.float32)
 
     def encode_audio_files(
-        self, file_paths: list[str]
+        self,
+        file_paths: list[str],
+        batch_size: int = 16,
+        decode_workers: int = 4,
     ) -> list[NDArray[np.float32]]:
         """Encode multiple audio files, returning per-file embeddings.
 
-        Each file is processed independently (different files may have
-        different durations and therefore different numbers of segments).
+        Files are decoded and resampled on a thread pool (soundfile and
+        scipy release the GIL for the heavy parts) while the model runs on
+        the calling thread. Segments from consecutive files are packed into
+        batches of ``batch_size`` rows, so a set of short clips costs a few
+        model calls rather than one per file, and outputs are mapped back to
+        their files in order. At most ``2 * decode_workers`` decoded files
+        are held in memory ahead of the model.
 
         Parameters
         ----------
         file_paths : list[str]
             List of paths to audio files.
+        batch_size : int, optional
+            Segments per model call. Default is 16 (a warmed-up size).
+        decode_workers : int, optional
+            Decode threads. Default is 4.
 
         Returns
         -------
         list[NDArray[np.float32]]
             One ``(n_segments, EMBEDDING_DIM)`` array per file.
+
+        Raises
+        ------
+        RuntimeError
+            If the model has not been loaded yet.
         """
-        return [self.encode_audio_file(fp) for fp in file_paths]
+        if self._encode_fn is None:
+            raise RuntimeError("Model not loaded. Call load() first.")
+        if not file_paths:
+            return []
+
+        per_file: list[list[NDArray[np.float32]]] = [[] for _ in file_paths]
+        workers = max(1, min(decode_workers, len(file_paths)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="perch-decode") as pool:
+            decoded = _bounded_map(pool, self._decode_segments, file_paths, ahead=2 * workers)
+            for batch, owners in pack_segment_batches(enumerate(decoded), batch_size):
+                embeddings = self.encode_segments(batch)
+                offset = 0
+                for file_index, count in owners:
+                    per_file[file_index].append(embeddings[offset : offset + count])
+                    offset += count
+
+        results = [
+            parts[0] if len(parts) == 1 else np.concatenate(parts, axis=0)
+            for parts in per_file
+        ]
+        logger.debug(
+            "PerchDirectInference: encoded %d file(s) -> %d segment(s)",
+            len(file_paths),
+            sum(r.shape[0] for r in results),
+        )
+        return results
 
     # ------------------------------------------------------------------
     # Convenience properties
@@ -0,0 +1,32 @@
+"""Shared inference server: resident models behind a micro-batching socket.
+
+- batcher.py  : MicroBatcher (dynamic micro-batching across callers)
+- backends.py : Perch / BirdNET backends and the CPU stand-in
+- server.py   : InferenceServer (Unix socket, one batcher per model)
+- client.py   : InferenceClient / get_inference_client (used by search)
+- protocol.py : wire ops, ModelInfo and error types
+
+Run the server with ``python -m echoroo.workers.inference_server``; clients
+only use it when ``INFERENCE_SERVER_ENABLED`` is set.
+"""
+
+from echoroo.ml.serving.batcher import BatcherStats, MicroBatcher
+from echoroo.ml.serving.client import InferenceClient, get_inference_client, load_segments
+from echoroo.ml.serving.protocol import (
+    InferenceServerError,
+    InferenceServerUnavailable,
+    ModelInfo,
+    UnknownModelError,
+)
+
+__all__ = [
+    "BatcherStats",
+    "InferenceClient",
+    "InferenceServerError",
+    "InferenceServerUnavailable",
+    "MicroBatcher",
+    "ModelInfo",
+    "UnknownModelError",
+    "get_inference_client",
+    "load_segments",
+]
@@ -0,0 +1,183 @@
+"""Model backends owned by the inference server.
+
+A backend turns a ``(n, segment_samples)`` float32 array into
+``(n, embedding_dim)`` embeddings with a single model call. Backends are only
+ever driven from their model's :class:`~echoroo.ml.serving.batcher.MicroBatcher`
+thread, so they need no locking of their own.
+
+``INFERENCE_SERVER_BACKEND=stand-in`` swaps the TensorFlow models for
+:class:`StandInBackend`, a cheap deterministic CPU implementation with the
+same shapes. It lets tests and GPU-less dev setups exercise the server,
+client and batching without downloading model weights.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from echoroo.core.settings import Settings
+from echoroo.ml.serving.protocol import ModelInfo
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "BirdNETBackend",
+    "EmbeddingBackend",
+    "PerchBackend",
+    "StandInBackend",
+    "build_backends",
+]
+
+
+class EmbeddingBackend(ABC):
+    """One resident model that embeds batches of framed segments."""
+
+    def __init__(self, info: ModelInfo) -> None:
+        self.info = info
+
+    @abstractmethod
+    def load(self) -> None:
+        """Load weights and warm the model up. Called once at server start."""
+
+    @abstractmethod
+    def embed(self, segments: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Embed ``(n, segment_samples)`` segments into ``(n, embedding_dim)``."""
+
+
+class PerchBackend(EmbeddingBackend):
+    """Perch V2 via the direct TensorFlow SavedModel signature.
+
+    XLA compiles one program per input shape, and coalesced batches come in
+    every size from 1 to ``max_batch``. Batches are therefore zero-padded up
+    to the next power-of-two bucket so only ``log2(max_batch)`` shapes are
+    ever compiled, all of them during warmup in GPU mode.
+    """
+
+    def __init__(self, device: str, max_batch: int, warmup: bool = True) -> None:
+        from echoroo.ml.perch.constants import EMBEDDING_DIM, SAMPLE_RATE, SEGMENT_SAMPLES
+
+        super().__init__(ModelInfo("perch", SAMPLE_RATE, SEGMENT_SAMPLES, EMBEDDING_DIM))
+        self._device = device
+        self._warmup = warmup
+        self.buckets = _pow2_buckets(max_batch)
+        self._direct: Any = None
+
+    def load(self) -> None:
+        from echoroo.ml.perch.direct_inference import PerchDirectInference
+
+        direct = PerchDirectInference(device=self._device)
+        direct.load()
+        if self._warmup:
+            direct.warmup(self.buckets)
+        self._direct = direct
+
+    def embed(self, segments: NDArray[np.float32]) -> NDArray[np.float32]:
+        n = segments.shape[0]
+        bucket = next((b for b in self.buckets if b >= n), n)
+        if bucket > n:
+            padded = np.zeros((bucket, segments.shape[1]), dtype=np.float32)
+            padded[:n] = segments
+            segments = padded
+        result: NDArray[np.float32] = self._direct.encode_segments(segments)
+        return result[:n]
+
+
+class BirdNETBackend(EmbeddingBackend):
+    """BirdNET V2.4 through the registered inference engine.
+
+    BirdNET has no direct segment signature in this tree, so each batch goes
+    through the engine's segment API; the gain here is a single resident copy
+    of the model shared by every caller rather than a faster call.
+    """
+
+    def __init__(self) -> None:
+        from echoroo.ml.birdnet.constants import EMBEDDING_DIM, SAMPLE_RATE, SEGMENT_SAMPLES
+
+        super().__init__(ModelInfo("birdnet", SAMPLE_RATE, SEGMENT_SAMPLES, EMBEDDING_DIM))
+        self._engine: Any = None
+
+    def load(self) -> None:
+        from echoroo.workers.model_preloader import get_model
+
+        _, self._engine = get_model("birdnet")
+
+    def embed(self, segments: NDArray[np.float32]) -> NDArray[np.float32]:
+        result: NDArray[np.float32] = self._engine.get_embeddings_only(list(segments))
+        return result
+
+
+class StandInBackend(EmbeddingBackend):
+    """Deterministic CPU stand-in with a real model's shapes.
+
+    Each embedding is the mean absolute amplitude of ``embedding_dim`` equal
+    slices of the segment, so different audio yields different vectors and
+    identical audio identical ones. ``batch_sizes`` records every call so
+    tests can assert on coalescing.
+    """
+
+    def __init__(self, info: ModelInfo) -> None:
+        super().__init__(info)
+        self.batch_sizes: list[int] = []
+
+    def load(self) -> None:
+        return None
+
+    def embed(self, segments: NDArray[np.float32]) -> NDArray[np.float32]:
+        self.batch_sizes.append(int(segments.shape[0]))
+        dim = self.info.embedding_dim
+        usable = (segments.shape[1] // dim) * dim
+        bands = np.abs(segments[:, :usable]).reshape(segments.shape[0], dim, -1)
+        return bands.mean(axis=2).astype(np.float32)
+
+
+def _pow2_buckets(max_batch: int) -> list[int]:
+    """Return ``[1, 2, 4, ...]`` up to and including ``max_batch``."""
+    buckets: list[int] = []
+    size = 1
+    while size < max_batch:
+        buckets.append(size)
+        size *= 2
+    buckets.append(max_batch)
+    return buckets
+
+
+def build_backends(settings: Settings) -> dict[str, EmbeddingBackend]:
+    """Instantiate the backends selected by ``INFERENCE_SERVER_BACKEND``.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Mapping of model name to (not yet loaded) backend.
+    """
+    from echoroo.ml.birdnet import constants as birdnet_constants
+    from echoroo.ml.perch import constants as perch_constants
+
+    models = [m.strip() for m in settings.INFERENCE_SERVER_MODELS.split(",") if m.strip()]
+    backends: dict[str, EmbeddingBackend] = {}
+    for model in models:
+        if settings.INFERENCE_SERVER_BACKEND == "stand-in":
+            consts = {"perch": perch_constants, "birdnet": birdnet_constants}.get(model)
+            if consts is None:
+                raise ValueError(f"No stand-in shape for model '{model}'")
+            backends[model] = StandInBackend(
+                ModelInfo(model, consts.SAMPLE_RATE, consts.SEGMENT_SAMPLES, consts.EMBEDDING_DIM)
+            )
+        elif model == "perch":
+            # CPU mode skips warming every bucket when warmup is disabled
+            # (ML_CPU_WARMUP_BATCHES empty) to keep start-up memory low.
+            backends[model] = PerchBackend(
+                device="GPU" if settings.ML_USE_GPU else "CPU",
+                max_batch=settings.INFERENCE_SERVER_MAX_BATCH,
+                warmup=settings.ML_USE_GPU or bool(settings.ml_cpu_warmup_batch_sizes()),
+            )
+        elif model == "birdnet":
+            backends[model] = BirdNETBackend()
+        else:
+            raise ValueError(f"Inference server cannot serve model '{model}'")
+    return backends
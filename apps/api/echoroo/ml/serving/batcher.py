@@ -0,0 +1,237 @@
+"""Dynamic micro-batching of segment-embedding requests.
+
+Callers submit small arrays of pre-framed audio segments (a single short
+query clip is often one to three segments). Running each of those through
+the model on its own leaves the accelerator mostly idle, so
+:class:`MicroBatcher` holds the first request for at most ``max_wait``
+seconds, gathers whatever else arrives in that window (up to ``max_batch``
+segments), runs the model once over the concatenation and hands every
+caller its own slice of the output.
+
+The batcher is transport-agnostic: the inference server puts one in front of
+each model, and anything else that owns an ``embed(segments)`` callable can
+use it the same way.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BatcherStats", "MicroBatcher"]
+
+EmbedFn = Callable[[NDArray[np.float32]], NDArray[np.float32]]
+
+
+@dataclass(frozen=True)
+class BatcherStats:
+    """Point-in-time counters for one :class:`MicroBatcher`.
+
+    Attributes:
+        queue_depth: Requests waiting to be picked up by the batch loop.
+        requests: Requests completed since start.
+        segments: Segments embedded since start.
+        batches: Model calls made since start.
+        batch_fill: Mean fraction of ``max_batch`` used per model call.
+        mean_requests_per_batch: Mean number of requests coalesced per flush.
+        mean_queue_wait_ms: Mean time a request waited before its model call.
+        max_batch: Configured segment cap per model call.
+        max_wait_ms: Configured coalescing window.
+    """
+
+    queue_depth: int
+    requests: int
+    segments: int
+    batches: int
+    batch_fill: float
+    mean_requests_per_batch: float
+    mean_queue_wait_ms: float
+    max_batch: int
+    max_wait_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the stats as a plain dict (JSON / pickle friendly)."""
+        return asdict(self)
+
+
+@dataclass
+class _Pending:
+    segments: NDArray[np.float32]
+    future: Future[NDArray[np.float32]]
+    enqueued_at: float
+
+
+class MicroBatcher:
+    """Coalesce concurrent ``embed`` calls into model-sized batches.
+
+    Example:
+        >>> batcher = MicroBatcher(backend.embed, max_batch=16, max_wait=0.01)
+        >>> embeddings = batcher.submit(segments).result()
+    """
+
+    def __init__(
+        self,
+        embed_fn: EmbedFn,
+        max_batch: int = 16,
+        max_wait: float = 0.01,
+        name: str = "model",
+    ) -> None:
+        """Start the batch loop.
+
+        Args:
+            embed_fn: Callable mapping ``(n, samples)`` segments to
+                ``(n, dim)`` embeddings. Only ever called from the batch
+                thread, so it need not be thread-safe.
+            max_batch: Maximum segments per model call.
+            max_wait: Seconds the oldest request may wait for company.
+            name: Label used in the thread name and log lines.
+        """
+        self._embed_fn = embed_fn
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self.name = name
+        self._queue: queue.Queue[_Pending] = queue.Queue()
+        self._closed = threading.Event()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._segments = 0
+        self._batches = 0
+        self._flushes = 0
+        self._wait_total = 0.0
+        self._thread = threading.Thread(target=self._run, name=f"micro-batcher-{name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, segments: NDArray[np.float32]) -> Future[NDArray[np.float32]]:
+        """Queue ``segments`` for embedding and return a future for the result.
+
+        Args:
+            segments: ``(n, samples)`` float32 array of framed audio.
+
+        Returns:
+            Future resolving to the ``(n, dim)`` embeddings of ``segments``.
+
+        Raises:
+            RuntimeError: If the batcher has been closed.
+        """
+        if self._closed.is_set():
+            raise RuntimeError(f"MicroBatcher '{self.name}' is closed")
+        future: Future[NDArray[np.float32]] = Future()
+        segments = np.asarray(segments, dtype=np.float32)
+        if segments.shape[0] == 0:
+            future.set_result(np.empty((0, 0), dtype=np.float32))
+            return future
+        self._queue.put(_Pending(segments, future, time.monotonic()))
+        return future
+
+    def stats(self) -> BatcherStats:
+        """Return current queue depth and batching counters."""
+        with self._lock:
+            batches = self._batches
+            flushes = self._flushes
+            return BatcherStats(
+                queue_depth=self._queue.qsize(),
+                requests=self._requests,
+                segments=self._segments,
+                batches=batches,
+                batch_fill=(self._segments / (batches * self.max_batch)) if batches else 0.0,
+                mean_requests_per_batch=(self._requests / flushes) if flushes else 0.0,
+                mean_queue_wait_ms=(self._wait_total / self._requests * 1000)
+                if self._requests
+                else 0.0,
+                max_batch=self.max_batch,
+                max_wait_ms=self.max_wait * 1000,
+            )
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Stop the batch loop; requests still queued fail with RuntimeError."""
+        self._closed.set()
+        self._thread.join(timeout)
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            pending.future.set_exception(RuntimeError(f"MicroBatcher '{self.name}' closed"))
+
+    # ------------------------------------------------------------------
+    # Batch loop
+    # ------------------------------------------------------------------
+
+    def _collect(self, first: _Pending) -> list[_Pending]:
+        """Gather requests arriving within the window opened by ``first``."""
+        batch = [first]
+        total = first.segments.shape[0]
+        deadline = first.enqueued_at + self.max_wait
+        while total < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            batch.append(item)
+            total += item.segments.shape[0]
+        return batch
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            batch = self._collect(first)
+            self._flush(batch)
+
+    def _flush(self, batch: list[_Pending]) -> None:
+        """Embed every request in ``batch`` and resolve its future."""
+        started = time.monotonic()
+        counts = [p.segments.shape[0] for p in batch]
+        stacked = (
+            batch[0].segments
+            if len(batch) == 1
+            else np.concatenate([p.segments for p in batch], axis=0)
+        )
+        calls = 0
+        try:
+            # Requests larger than max_batch (long files) are split so the
+            # model never sees more than max_batch rows at once.
+            outputs = []
+            for offset in range(0, stacked.shape[0], self.max_batch):
+                outputs.append(
+                    np.asarray(self._embed_fn(stacked[offset : offset + self.max_batch]))
+                )
+                calls += 1
+            embeddings = outputs[0] if len(outputs) == 1 else np.concatenate(outputs, axis=0)
+        except Exception as exc:
+            logger.exception(
+                "MicroBatcher '%s': batch of %d segments failed", self.name, sum(counts)
+            )
+            for pending in batch:
+                pending.future.set_exception(exc)
+            return
+
+        offset = 0
+        for pending, count in zip(batch, counts, strict=True):
+            pending.future.set_result(embeddings[offset : offset + count])
+            offset += count
+
+        with self._lock:
+            self._requests += len(batch)
+            self._segments += int(sum(counts))
+            self._batches += calls
+            self._flushes += 1
+            self._wait_total += sum(started - p.enqueued_at for p in batch)
@@ -0,0 +1,201 @@
+"""Client for the shared inference server.
+
+:func:`get_inference_client` returns ``None`` unless
+``INFERENCE_SERVER_ENABLED`` is set, so call sites keep their in-process
+model path as the fallback::
+
+    client = get_inference_client()
+    if client is not None:
+        embeddings = client.embed_file("perch", path)
+
+Audio is decoded, resampled and framed in the *calling* process; only the
+framed segments cross the socket. Connections are kept per thread because a
+:class:`multiprocessing.connection.Connection` is not safe to share.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+from functools import lru_cache
+from multiprocessing.connection import AuthenticationError, Client, Connection
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from echoroo.ml.serving.protocol import (
+    ERROR_UNKNOWN_MODEL,
+    OP_DESCRIBE,
+    OP_EMBED,
+    OP_STATS,
+    InferenceServerError,
+    InferenceServerUnavailable,
+    ModelInfo,
+    UnknownModelError,
+    authkey_from_settings,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["InferenceClient", "get_inference_client", "load_segments"]
+
+
+def load_segments(path: str | Path, sample_rate: int, segment_samples: int) -> NDArray[np.float32]:
+    """Decode an audio file into ``(n, segment_samples)`` mono segments.
+
+    Mirrors :class:`~echoroo.ml.perch.direct_inference.PerchDirectInference`:
+    channels are averaged, audio is resampled to ``sample_rate``, audio
+    shorter than one segment is zero-padded and a trailing partial segment
+    is dropped.
+    """
+    import soundfile as sf
+
+    audio, sr = sf.read(str(path), dtype="float32")
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if sr != sample_rate:
+        from math import gcd
+
+        from scipy.signal import resample_poly
+
+        g = gcd(sample_rate, sr)
+        audio = resample_poly(audio, sample_rate // g, sr // g)
+    audio = np.asarray(audio, dtype=np.float32)
+
+    n_segments = len(audio) // segment_samples
+    if n_segments == 0:
+        padded = np.zeros((1, segment_samples), dtype=np.float32)
+        padded[0, : len(audio)] = audio
+        return padded
+    return audio[: n_segments * segment_samples].reshape(n_segments, segment_samples)
+
+
+class InferenceClient:
+    """Thread-safe client for :class:`~echoroo.ml.serving.server.InferenceServer`."""
+
+    def __init__(self, socket_path: str | Path, authkey: bytes, timeout: float = 60.0) -> None:
+        """Configure the client; connections are opened lazily per thread.
+
+        Args:
+            socket_path: Server Unix socket path.
+            authkey: Shared connection key.
+            timeout: Seconds to wait for each reply.
+        """
+        self.socket_path = Path(socket_path)
+        self._authkey = authkey
+        self.timeout = timeout
+        self._local = threading.local()
+        self._models: dict[str, ModelInfo] = {}
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> Connection:
+        conn: Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                conn = Client(str(self.socket_path), family="AF_UNIX", authkey=self._authkey)
+            except (OSError, EOFError, AuthenticationError) as exc:
+                raise InferenceServerUnavailable(
+                    f"Cannot connect to inference server at {self.socket_path}: {exc}"
+                ) from exc
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn: Connection | None = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            with contextlib.suppress(OSError):
+                conn.close()
+
+    def _call(self, op: str, **payload: Any) -> Any:
+        # One reconnect covers a server restart between calls; a second
+        # failure is reported to the caller.
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.send((op, payload))
+                if not conn.poll(self.timeout):
+                    self._drop_connection()
+                    raise InferenceServerUnavailable(
+                        f"Inference server did not answer '{op}' within {self.timeout}s"
+                    )
+                reply = conn.recv()
+                break
+            except (OSError, EOFError) as exc:
+                self._drop_connection()
+                if attempt == 1:
+                    raise InferenceServerUnavailable(
+                        f"Inference server connection lost: {exc}"
+                    ) from exc
+
+        if reply[0] == "ok":
+            return reply[1]
+        _, kind, message = reply
+        if kind == ERROR_UNKNOWN_MODEL:
+            raise UnknownModelError(message)
+        raise InferenceServerError(message)
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def describe(self, model: str) -> ModelInfo:
+        """Return the served model's input / output shape (cached)."""
+        info = self._models.get(model)
+        if info is None:
+            info = self._call(OP_DESCRIBE, model=model)
+            self._models[model] = info
+        return info
+
+    def embed_segments(self, model: str, segments: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Embed pre-framed ``(n, segment_samples)`` segments.
+
+        Raises:
+            UnknownModelError: If the server does not serve ``model``.
+            InferenceServerUnavailable: If the server cannot be reached.
+            InferenceServerError: If inference failed on the server.
+        """
+        result: NDArray[np.float32] = self._call(
+            OP_EMBED, model=model, segments=np.ascontiguousarray(segments, dtype=np.float32)
+        )
+        return result
+
+    def embed_file(self, model: str, path: str | Path) -> NDArray[np.float32]:
+        """Decode ``path`` locally and return its per-segment embeddings.
+
+        Returns:
+            ``(n_segments, embedding_dim)`` float32 array.
+        """
+        info = self.describe(model)
+        segments = load_segments(path, info.sample_rate, info.segment_samples)
+        return self.embed_segments(model, segments)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the server's per-model queue depth and batching counters."""
+        result: dict[str, Any] = self._call(OP_STATS)
+        return result
+
+
+@lru_cache(maxsize=1)
+def _cached_client(socket_path: str, authkey: bytes, timeout: float) -> InferenceClient:
+    return InferenceClient(socket_path, authkey, timeout)
+
+
+def get_inference_client() -> InferenceClient | None:
+    """Return the process-wide client, or None when the server is disabled."""
+    from echoroo.core.settings import get_settings
+
+    settings = get_settings()
+    if not settings.INFERENCE_SERVER_ENABLED:
+        return None
+    return _cached_client(
+        settings.INFERENCE_SERVER_SOCKET,
+        authkey_from_settings(settings),
+        settings.INFERENCE_SERVER_TIMEOUT_SECONDS,
+    )
@@ -0,0 +1,72 @@
+"""Wire protocol shared by the inference server and its clients.
+
+Messages travel over a :mod:`multiprocessing.connection` Unix socket, which
+frames and pickles Python objects and performs an HMAC challenge on connect.
+Every request is a ``(op, payload)`` tuple and every reply is either
+``("ok", result)`` or ``("error", kind, message)``.
+
+Because payloads are pickled, both ends authenticate with a key derived from
+``JWT_SECRET_KEY``: only processes configured with the deployment's secret
+can talk to the server, in addition to the socket's filesystem permissions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+from echoroo.core.settings import Settings
+
+__all__ = [
+    "OP_DESCRIBE",
+    "OP_EMBED",
+    "OP_STATS",
+    "InferenceServerError",
+    "InferenceServerUnavailable",
+    "ModelInfo",
+    "UnknownModelError",
+    "authkey_from_settings",
+]
+
+OP_DESCRIBE = "describe"
+OP_EMBED = "embed"
+OP_STATS = "stats"
+
+# ``kind`` values carried by error replies.
+ERROR_UNKNOWN_MODEL = "unknown_model"
+ERROR_BAD_REQUEST = "bad_request"
+ERROR_INTERNAL = "internal"
+
+
+class InferenceServerError(RuntimeError):
+    """The inference server rejected or failed a request."""
+
+
+class UnknownModelError(InferenceServerError):
+    """The requested model is not served by this inference server."""
+
+
+class InferenceServerUnavailable(InferenceServerError):
+    """The inference server could not be reached or did not answer in time."""
+
+
+@dataclass(frozen=True)
+class ModelInfo:
+    """Input / output shape of a served model.
+
+    Attributes:
+        name: Registered model name (``"perch"``, ``"birdnet"``).
+        sample_rate: Sample rate segments must be resampled to.
+        segment_samples: Samples per segment.
+        embedding_dim: Length of each returned embedding.
+    """
+
+    name: str
+    sample_rate: int
+    segment_samples: int
+    embedding_dim: int
+
+
+def authkey_from_settings(settings: Settings) -> bytes:
+    """Derive the connection auth key from the deployment secret."""
+    return hashlib.sha256(b"echoroo-inference-server:" + settings.JWT_SECRET_KEY.encode()).digest()
@@ -0,0 +1,219 @@
+"""Long-lived inference server owning the embedding models.
+
+Without it every process that embeds audio keeps its own model copy: each
+GPU Celery worker, and the API process itself the first time someone runs a
+single-file similarity search. The server loads each model once, puts a
+:class:`~echoroo.ml.serving.batcher.MicroBatcher` in front of it and answers
+requests from any number of local clients over a Unix socket, so concurrent
+callers (batch search jobs, interactive searches) share both the memory and
+the model calls.
+
+Run it with ``python -m echoroo.workers.inference_server``. Each client
+connection is served by its own thread which blocks on its batcher future,
+so requests from different connections coalesce naturally. Queue depth and
+batch-fill counters are available through the ``stats`` op
+(``python -m echoroo.workers.inference_server --stats``) and are logged
+periodically.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import threading
+from multiprocessing.connection import AuthenticationError, Connection, Listener
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from echoroo.ml.serving.backends import EmbeddingBackend
+from echoroo.ml.serving.batcher import MicroBatcher
+from echoroo.ml.serving.protocol import (
+    ERROR_BAD_REQUEST,
+    ERROR_INTERNAL,
+    ERROR_UNKNOWN_MODEL,
+    OP_DESCRIBE,
+    OP_EMBED,
+    OP_STATS,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["InferenceServer"]
+
+
+class InferenceServer:
+    """Serve segment embeddings for a set of resident models."""
+
+    def __init__(
+        self,
+        socket_path: str | Path,
+        backends: dict[str, EmbeddingBackend],
+        authkey: bytes,
+        max_batch: int = 16,
+        max_wait: float = 0.01,
+        stats_interval: float = 60.0,
+    ) -> None:
+        """Configure the server; nothing is loaded until :meth:`start`.
+
+        Args:
+            socket_path: Unix socket path clients connect to.
+            backends: Model name to backend.
+            authkey: Shared connection key (see ``authkey_from_settings``).
+            max_batch: Segment cap per model call.
+            max_wait: Coalescing window in seconds.
+            stats_interval: Seconds between stats log lines (0 disables).
+        """
+        self.socket_path = Path(socket_path)
+        self.backends = backends
+        self._authkey = authkey
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._stats_interval = stats_interval
+        self.batchers: dict[str, MicroBatcher] = {}
+        self._listener: Listener | None = None
+        self._stopped = threading.Event()
+        self._connections = 0
+        self._conn_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Load every backend and bind the socket."""
+        for name, backend in self.backends.items():
+            logger.info("Inference server: loading model %s", name)
+            backend.load()
+            self.batchers[name] = MicroBatcher(
+                backend.embed, max_batch=self._max_batch, max_wait=self._max_wait, name=name
+            )
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # A socket left behind by a crashed server would make bind() fail.
+        self.socket_path.unlink(missing_ok=True)
+        self._listener = Listener(str(self.socket_path), family="AF_UNIX", authkey=self._authkey)
+        os.chmod(self.socket_path, 0o660)
+        logger.info(
+            "Inference server listening on %s (models=%s, max_batch=%d, max_wait=%.1fms)",
+            self.socket_path,
+            ",".join(self.backends),
+            self._max_batch,
+            self._max_wait * 1000,
+        )
+
+    def serve_forever(self) -> None:
+        """Accept connections until :meth:`close` is called."""
+        if self._listener is None:
+            self.start()
+        assert self._listener is not None
+        if self._stats_interval > 0:
+            threading.Thread(
+                target=self._log_stats_loop, name="inference-stats", daemon=True
+            ).start()
+        while not self._stopped.is_set():
+            try:
+                conn = self._listener.accept()
+            except AuthenticationError:
+                logger.warning("Inference server: rejected connection with a bad auth key")
+                continue
+            except OSError:
+                if self._stopped.is_set():
+                    break
+                raise
+            threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+    def serve_in_background(self) -> threading.Thread:
+        """Start the server on a daemon thread (tests, embedded use)."""
+        self.start()
+        thread = threading.Thread(target=self.serve_forever, name="inference-server", daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        """Stop accepting connections and shut the batchers down."""
+        self._stopped.set()
+        if self._listener is not None:
+            with contextlib.suppress(OSError):
+                self._listener.close()
+        for batcher in self.batchers.values():
+            batcher.close()
+        self.socket_path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Return per-model batcher stats plus the open connection count."""
+        with self._conn_lock:
+            connections = self._connections
+        return {
+            "connections": connections,
+            "models": {name: b.stats().to_dict() for name, b in self.batchers.items()},
+        }
+
+    def _serve_connection(self, conn: Connection) -> None:
+        with self._conn_lock:
+            self._connections += 1
+        try:
+            while not self._stopped.is_set():
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                conn.send(self._handle(request))
+        except (BrokenPipeError, ConnectionResetError):
+            return
+        finally:
+            with self._conn_lock:
+                self._connections -= 1
+            conn.close()
+
+    def _handle(self, request: Any) -> tuple[Any, ...]:
+        try:
+            op, payload = request
+        except (TypeError, ValueError):
+            return ("error", ERROR_BAD_REQUEST, "malformed request")
+        if not isinstance(payload, dict):
+            return ("error", ERROR_BAD_REQUEST, "payload must be a dict")
+
+        if op == OP_STATS:
+            return ("ok", self.stats())
+
+        model = payload.get("model")
+        backend = self.backends.get(model)
+        if backend is None:
+            return ("error", ERROR_UNKNOWN_MODEL, f"model '{model}' is not served")
+
+        if op == OP_DESCRIBE:
+            return ("ok", backend.info)
+
+        if op == OP_EMBED:
+            segments = np.asarray(payload.get("segments"), dtype=np.float32)
+            if segments.ndim != 2 or segments.shape[1] != backend.info.segment_samples:
+                return (
+                    "error",
+                    ERROR_BAD_REQUEST,
+                    f"expected (n, {backend.info.segment_samples}) segments, got {segments.shape}",
+                )
+            try:
+                return ("ok", self.batchers[model].submit(segments).result())
+            except Exception as exc:
+                return ("error", ERROR_INTERNAL, f"{type(exc).__name__}: {exc}")
+
+        return ("error", ERROR_BAD_REQUEST, f"unknown op '{op}'")
+
+    def _log_stats_loop(self) -> None:
+        while not self._stopped.wait(self._stats_interval):
+            for name, batcher in self.batchers.items():
+                s = batcher.stats()
+                logger.info(
+                    "Inference server [%s]: queue=%d requests=%d batches=%d "
+                    "fill=%.2f req/batch=%.1f wait=%.1fms",
+                    name,
+                    s.queue_depth,
+                    s.requests,
+                    s.batches,
+                    s.batch_fill,
+                    s.mean_requests_per_batch,
+                    s.mean_queue_wait_ms,
+                )
@@ -10,13 +10,18 @@ from echoroo.models.annotation_set import (
     time_range_annotation_notes,
 )
 from echoroo.models.annotation_vote import AnnotationVote
+from echoroo.models.annotation_vote_tally import AnnotationVoteTally
 from echoroo.models.api_key import ApiKey
+from echoroo.models.audit_chain_verification import AuditChainVerification
 from echoroo.models.base import Base, TimestampMixin, UUIDMixin
 from echoroo.models.clip import Clip
+from echoroo.models.clip_generation_job import ClipGenerationJob
 from echoroo.models.confirmed_region import ConfirmedRegion
 from echoroo.models.custom_model import CustomModel, CustomModelStatus
 from echoroo.models.dataset import Dataset
+from echoroo.models.deletion_job import DeletionJob
 from echoroo.models.detection import Detection
+from echoroo.models.detection_rollup import DetectionSpeciesRollup, DetectionTemporalRollup
 from echoroo.models.detection_run import DetectionRun
 from echoroo.models.embedding import Embedding
 from echoroo.models.enums import (
@@ -55,6 +60,7 @@ from echoroo.models.evaluation import (
 )
 from echoroo.models.iucn_sync_attempt import IucnSyncAttempt
 from echoroo.models.license import License
+from echoroo.models.ml_dataset_export_job import MlDatasetExportJob
 from echoroo.models.note import Note
 from echoroo.models.project import Project, ProjectInvitation, ProjectLicenseHistory, ProjectMember
 from echoroo.models.project_taxon_override import ProjectTaxonSensitivityOverride
@@ -71,6 +77,7 @@ from echoroo.models.superuser_approval_request import SuperuserApprovalRequest
 from echoroo.models.system import SystemSetting
 from echoroo.models.tag import Tag
 from echoroo.models.taxon import Taxon
+from echoroo.models.taxon_resolution import TaxonResolution
 from echoroo.models.taxon_sensitivity import TaxonSensitivity
 from echoroo.models.taxon_vernacular_name import TaxonVernacularName
 from echoroo.models.trusted_device import TrustedDevice
@@ -121,16 +128,28 @@ __all__ = [
     "TimeRangeAnnotation",
     # Taxon models
     "Taxon",
+    "TaxonResolution",
     "TaxonSensitivity",
     "TaxonVernacularName",
     # Taxon-driven auto-obscure (Phase 11)
     "IucnSyncAttempt",
+    # Background audit chain verification runs / checkpoints
+    "AuditChainVerification",
+    # Background chunked dataset / project deletion
+    "DeletionJob",
+    # Background ML-dataset ZIP exports
+    "MlDatasetExportJob",
+    # Background dataset-wide clip generation
+    "ClipGenerationJob",
     # Detection review models (003-detection-review)
     "AnnotationComment",
     "AnnotationVote",
+    "AnnotationVoteTally",
     "ConfirmedRegion",
     "Detection",
     "DetectionRun",
+    "DetectionSpeciesRollup",
+    "DetectionTemporalRollup",
     # Phase 14+ deferred (recording-level annotation review state)
     "RecordingAnnotation",
     # Custom model (SVM classifier)
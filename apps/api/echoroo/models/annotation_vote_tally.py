@@ -0,0 +1,361 @@
+"""Per-annotation vote tallies and consensus status.
+
+The vote summary and every detection list page used to load all
+``annotation_votes`` rows of the annotations involved and count them in
+Python, and consensus could not be filtered or sorted on because it only
+existed in the response. ``annotation_vote_tallies`` holds one row per voted
+annotation with the counts the API exposes (agree / disagree / unsure plus
+the FR-038 per-source agree / disagree split) and the consensus status and
+score derived from them under the owning project's ``review_min_votes`` /
+``review_consensus_threshold``.
+
+The rows are maintained in PostgreSQL so they are updated in the same
+transaction as the vote itself. :data:`ANNOTATION_VOTE_TALLY_DDL` installs:
+
+* ``annotation_vote_consensus(...)`` / ``annotation_vote_score(...)`` — the
+  SQL twins of :meth:`AnnotationVoteService.compute_consensus_status` and
+  ``agree / (agree + disagree)``;
+* a row-level ``AFTER INSERT / UPDATE / DELETE`` trigger on
+  ``annotation_votes`` that applies the vote's delta (a re-vote is −old,
+  +new). Concurrent votes on one annotation serialise on the tally row lock
+  taken by ``INSERT ... ON CONFLICT DO UPDATE``;
+* an ``AFTER UPDATE`` trigger on ``projects`` that re-derives the consensus
+  of every tally of the project when its review settings change;
+* ``annotation_vote_tallies_refresh(project_id)``, the set-based rebuild used
+  by the migration backfill.
+
+Decrements never insert: when an annotation (and with it its votes and its
+tally) is deleted, the cascaded vote deletes find no tally row and do
+nothing.
+
+Migration ``0036_annotation_vote_tallies`` carries a frozen copy of this DDL
+(``0046_vote_tally_consensus_defaults`` replaces ``annotation_vote_tallies_apply``);
+the constant here is the live source for the test-database heal in
+``tests/conftest.py``. Any change to the DDL must ship as a NEW migration.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, Integer, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from echoroo.models.base import Base
+from echoroo.models.enums import ConsensusStatus
+
+
+class AnnotationVoteTally(Base):
+    """Vote counts and consensus for one ``recording_annotations`` row.
+
+    Annotations nobody has voted on have no row; readers treat a missing
+    row as zero votes and :attr:`ConsensusStatus.NEEDS_VOTES`.
+    """
+
+    __tablename__ = "annotation_vote_tallies"
+
+    annotation_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("recording_annotations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    project_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+        doc="Project whose review settings the consensus is derived from.",
+    )
+    agree_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    disagree_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    unsure_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    member_agree: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    member_disagree: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    guest_authenticated_agree: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    guest_authenticated_disagree: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    trusted_user_agree: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    trusted_user_disagree: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    consensus_status: Mapped[ConsensusStatus] = mapped_column(
+        Enum(
+            ConsensusStatus,
+            name="consensusstatus",
+            native_enum=False,
+            length=16,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+        server_default=ConsensusStatus.NEEDS_VOTES.value,
+    )
+    consensus_score: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+        doc="agree / (agree + disagree); NULL while there is no decisive vote.",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        server_default=text("now()"),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_annotation_vote_tallies_project_consensus",
+            "project_id",
+            "consensus_status",
+        ),
+        # Keyset order of the detection list's ``consensus_score`` sort
+        # (see ``echoroo.core.pagination.keyset_order_by``).
+        Index(
+            "ix_annotation_vote_tallies_score_annotation",
+            text("consensus_score DESC NULLS LAST"),
+            text("annotation_id DESC"),
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Trigger / function DDL (live copy; migration 0036 holds the frozen one)
+# ---------------------------------------------------------------------------
+#
+# Every statement is idempotent (``CREATE OR REPLACE``) so the conftest heal
+# can re-run it against a reused test database.
+
+ANNOTATION_VOTE_TALLY_DDL: tuple[str, ...] = (
+    """
+    CREATE OR REPLACE FUNCTION annotation_vote_consensus(
+        p_agree integer, p_disagree integer,
+        p_min_votes integer, p_threshold double precision
+    ) RETURNS varchar AS $fn$
+        SELECT CASE
+            WHEN p_agree + p_disagree = 0
+              OR p_agree + p_disagree < p_min_votes THEN 'needs_votes'
+            WHEN p_agree::double precision / (p_agree + p_disagree) > p_threshold
+              AND p_agree >= p_min_votes THEN 'agreed'
+            WHEN p_agree::double precision / (p_agree + p_disagree) <= 1.0 - p_threshold
+              AND p_disagree >= p_min_votes THEN 'rejected'
+            ELSE 'disputed'
+        END;
+    $fn$ LANGUAGE sql IMMUTABLE;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION annotation_vote_score(
+        p_agree integer, p_disagree integer
+    ) RETURNS double precision AS $fn$
+        SELECT p_agree::double precision / NULLIF(p_agree + p_disagree, 0);
+    $fn$ LANGUAGE sql IMMUTABLE;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION annotation_vote_tallies_apply(
+        p_vote annotation_votes, p_sign integer
+    ) RETURNS void AS $fn$
+    DECLARE
+        v_min_votes integer;
+        v_threshold double precision;
+        d_agree integer := CASE WHEN p_vote.vote = 1 THEN p_sign ELSE 0 END;
+        d_disagree integer := CASE WHEN p_vote.vote = -1 THEN p_sign ELSE 0 END;
+        d_unsure integer := CASE WHEN p_vote.vote = 0 THEN p_sign ELSE 0 END;
+    BEGIN
+        SELECT review_min_votes, review_consensus_threshold
+        INTO v_min_votes, v_threshold
+        FROM projects WHERE id = p_vote.project_id;
+        -- Both settings are NOT NULL; the project row is only missing while
+        -- its delete cascades through the votes. Either way every branch
+        -- below must evaluate consensus with the same values.
+        v_min_votes := COALESCE(v_min_votes, 2);
+        v_threshold := COALESCE(v_threshold, 0.667);
+
+        IF p_sign < 0 THEN
+            -- Never insert on a decrement: inside an annotation / project
+            -- delete cascade the tally row is already gone.
+            UPDATE annotation_vote_tallies AS t SET
+                agree_count = t.agree_count + d_agree,
+                disagree_count = t.disagree_count + d_disagree,
+                unsure_count = t.unsure_count + d_unsure,
+                member_agree = t.member_agree
+                    + CASE WHEN p_vote.source = 'member' THEN d_agree ELSE 0 END,
+                member_disagree = t.member_disagree
+                    + CASE WHEN p_vote.source = 'member' THEN d_disagree ELSE 0 END,
+                guest_authenticated_agree = t.guest_authenticated_agree
+                    + CASE WHEN p_vote.source = 'guest_authenticated'
+                      THEN d_agree ELSE 0 END,
+                guest_authenticated_disagree = t.guest_authenticated_disagree
+                    + CASE WHEN p_vote.source = 'guest_authenticated'
+                      THEN d_disagree ELSE 0 END,
+                trusted_user_agree = t.trusted_user_agree
+                    + CASE WHEN p_vote.source = 'trusted_user' THEN d_agree ELSE 0 END,
+                trusted_user_disagree = t.trusted_user_disagree
+                    + CASE WHEN p_vote.source = 'trusted_user' THEN d_disagree ELSE 0 END,
+                consensus_status = annotation_vote_consensus(
+                    t.agree_count + d_agree, t.disagree_count + d_disagree,
+                    v_min_votes, v_threshold
+                ),
+                consensus_score = annotation_vote_score(
+                    t.agree_count + d_agree, t.disagree_count + d_disagree
+                ),
+                updated_at = now()
+            WHERE t.annotation_id = p_vote.annotation_id;
+            RETURN;
+        END IF;
+
+        INSERT INTO annotation_vote_tallies AS t (
+            annotation_id, project_id, agree_count, disagree_count, unsure_count,
+            member_agree, member_disagree,
+            guest_authenticated_agree, guest_authenticated_disagree,
+            trusted_user_agree, trusted_user_disagree,
+            consensus_status, consensus_score, updated_at
+        ) VALUES (
+            p_vote.annotation_id, p_vote.project_id, d_agree, d_disagree, d_unsure,
+            CASE WHEN p_vote.source = 'member' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'member' THEN d_disagree ELSE 0 END,
+            CASE WHEN p_vote.source = 'guest_authenticated' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'guest_authenticated' THEN d_disagree ELSE 0 END,
+            CASE WHEN p_vote.source = 'trusted_user' THEN d_agree ELSE 0 END,
+            CASE WHEN p_vote.source = 'trusted_user' THEN d_disagree ELSE 0 END,
+            annotation_vote_consensus(d_agree, d_disagree, v_min_votes, v_threshold),
+            annotation_vote_score(d_agree, d_disagree),
+            now()
+        )
+        ON CONFLICT (annotation_id) DO UPDATE SET
+            agree_count = t.agree_count + EXCLUDED.agree_count,
+            disagree_count = t.disagree_count + EXCLUDED.disagree_count,
+            unsure_count = t.unsure_count + EXCLUDED.unsure_count,
+            member_agree = t.member_agree + EXCLUDED.member_agree,
+            member_disagree = t.member_disagree + EXCLUDED.member_disagree,
+            guest_authenticated_agree =
+                t.guest_authenticated_agree + EXCLUDED.guest_authenticated_agree,
+            guest_authenticated_disagree =
+                t.guest_authenticated_disagree + EXCLUDED.guest_authenticated_disagree,
+            trusted_user_agree = t.trusted_user_agree + EXCLUDED.trusted_user_agree,
+            trusted_user_disagree =
+                t.trusted_user_disagree + EXCLUDED.trusted_user_disagree,
+            consensus_status = annotation_vote_consensus(
+                t.agree_count + EXCLUDED.agree_count,
+                t.disagree_count + EXCLUDED.disagree_count,
+                v_min_votes, v_threshold
+            ),
+            consensus_score = annotation_vote_score(
+                t.agree_count + EXCLUDED.agree_count,
+                t.disagree_count + EXCLUDED.disagree_count
+            ),
+            updated_at = now();
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION annotation_vote_tallies_refresh(p_project_id uuid)
+    RETURNS void AS $fn$
+    BEGIN
+        DELETE FROM annotation_vote_tallies WHERE project_id = p_project_id;
+
+        INSERT INTO annotation_vote_tallies (
+            annotation_id, project_id, agree_count, disagree_count, unsure_count,
+            member_agree, member_disagree,
+            guest_authenticated_agree, guest_authenticated_disagree,
+            trusted_user_agree, trusted_user_disagree,
+            consensus_status, consensus_score, updated_at
+        )
+        SELECT
+            c.annotation_id, c.project_id, c.agree, c.disagree, c.unsure,
+            c.member_agree, c.member_disagree,
+            c.guest_agree, c.guest_disagree, c.trusted_agree, c.trusted_disagree,
+            annotation_vote_consensus(
+                c.agree, c.disagree, p.review_min_votes, p.review_consensus_threshold
+            ),
+            annotation_vote_score(c.agree, c.disagree),
+            now()
+        FROM (
+            SELECT
+                v.annotation_id, v.project_id,
+                count(*) FILTER (WHERE v.vote = 1)::integer AS agree,
+                count(*) FILTER (WHERE v.vote = -1)::integer AS disagree,
+                count(*) FILTER (WHERE v.vote = 0)::integer AS unsure,
+                count(*) FILTER (
+                    WHERE v.vote = 1 AND v.source = 'member')::integer AS member_agree,
+                count(*) FILTER (
+                    WHERE v.vote = -1 AND v.source = 'member')::integer AS member_disagree,
+                count(*) FILTER (
+                    WHERE v.vote = 1 AND v.source = 'guest_authenticated'
+                )::integer AS guest_agree,
+                count(*) FILTER (
+                    WHERE v.vote = -1 AND v.source = 'guest_authenticated'
+                )::integer AS guest_disagree,
+                count(*) FILTER (
+                    WHERE v.vote = 1 AND v.source = 'trusted_user')::integer AS trusted_agree,
+                count(*) FILTER (
+                    WHERE v.vote = -1 AND v.source = 'trusted_user'
+                )::integer AS trusted_disagree
+            FROM annotation_votes v
+            WHERE v.project_id = p_project_id
+            GROUP BY v.annotation_id, v.project_id
+        ) AS c
+        JOIN projects p ON p.id = c.project_id;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION annotation_votes_tally_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM annotation_vote_tallies_apply(OLD, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM annotation_vote_tallies_apply(NEW, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION projects_vote_consensus_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        UPDATE annotation_vote_tallies SET
+            consensus_status = annotation_vote_consensus(
+                agree_count, disagree_count,
+                NEW.review_min_votes, NEW.review_consensus_threshold
+            ),
+            updated_at = now()
+        WHERE project_id = NEW.id;
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE TRIGGER annotation_votes_tally_insert
+    AFTER INSERT ON annotation_votes
+    FOR EACH ROW EXECUTE FUNCTION annotation_votes_tally_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER annotation_votes_tally_update
+    AFTER UPDATE OF annotation_id, project_id, vote, source ON annotation_votes
+    FOR EACH ROW
+    WHEN ((OLD.annotation_id, OLD.project_id, OLD.vote, OLD.source)
+          IS DISTINCT FROM
+          (NEW.annotation_id, NEW.project_id, NEW.vote, NEW.source))
+    EXECUTE FUNCTION annotation_votes_tally_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER annotation_votes_tally_delete
+    AFTER DELETE ON annotation_votes
+    FOR EACH ROW EXECUTE FUNCTION annotation_votes_tally_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER projects_vote_consensus
+    AFTER UPDATE OF review_min_votes, review_consensus_threshold ON projects
+    FOR EACH ROW
+    WHEN (OLD.review_min_votes IS DISTINCT FROM NEW.review_min_votes
+          OR OLD.review_consensus_threshold IS DISTINCT FROM NEW.review_consensus_threshold)
+    EXECUTE FUNCTION projects_vote_consensus_sync();
+    """,
+)
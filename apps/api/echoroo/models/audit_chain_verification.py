@@ -0,0 +1,146 @@
+"""Audit chain verification runs (FR-095 / FR-096).
+
+Each row captures one execution of the background chain verifier
+(:mod:`echoroo.workers.audit_chain_verify`) over ``project_audit_log`` or
+``platform_audit_log``. The row doubles as the progress record the admin
+UI polls (``rows_verified`` out of ``rows_total``) and, once the run
+succeeds, as the checkpoint the next run resumes from.
+
+The checkpoint (``checkpoint_*`` columns) names the last verified row
+that is old enough to be settled, its ``row_hash``, the number of rows
+verified up to and including it, and ``checkpoint_mac`` — a MAC under the
+audit chain key over all of those. A later run only trusts the checkpoint
+if the MAC still verifies and the row still carries the same hash;
+otherwise it verifies the table from the start.
+
+Like :class:`~echoroo.models.iucn_sync_attempt.IucnSyncAttempt` this entity
+inherits :class:`UUIDMixin` only; the lifecycle is captured by the
+explicit ``started_at`` / ``finished_at`` columns.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Boolean, DateTime, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from echoroo.models.base import Base, UUIDMixin
+
+
+class AuditChainVerification(UUIDMixin, Base):
+    """One run of the background audit chain verifier.
+
+    The ``ix_audit_chain_verifications_target_started`` index serves both
+    the "latest run" lookup of the admin UI and the worker's search for
+    the newest successful checkpoint of a target.
+    """
+
+    __tablename__ = "audit_chain_verifications"
+
+    target: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        doc="Verified table: 'project' (project_audit_log) or 'platform'.",
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        doc=(
+            "One of 'queued', 'running', 'success', 'failure'. 'success' "
+            "means the run completed, not that the chain is valid — see "
+            "``is_valid``."
+        ),
+    )
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        doc="Wall-clock timestamp at which the run was requested.",
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp of the terminal state. NULL while queued or running.",
+    )
+    resumed_from_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        doc=(
+            "Run whose checkpoint this run started after. NULL for a full "
+            "verification (no usable checkpoint)."
+        ),
+    )
+    rows_total: Mapped[int | None] = mapped_column(
+        BigInteger,
+        nullable=True,
+        doc="Rows this run has to verify, counted when it starts.",
+    )
+    rows_verified: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Rows verified so far; committed after every batch.",
+    )
+    is_valid: Mapped[bool | None] = mapped_column(
+        Boolean,
+        nullable=True,
+        doc="Verdict once the run succeeds; NULL until then.",
+    )
+    first_mismatch_row_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        doc="First row (in ``(created_at, id)`` order) whose MAC did not match.",
+    )
+    error_detail: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        doc="Error description recorded when ``status='failure'``.",
+    )
+    checkpoint_row_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        doc="Last settled row covered by the checkpoint.",
+    )
+    checkpoint_created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="``created_at`` of the checkpoint row (the keyset resume point).",
+    )
+    checkpoint_row_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        doc="``row_hash`` of the checkpoint row when it was verified.",
+    )
+    checkpoint_row_count: Mapped[int | None] = mapped_column(
+        BigInteger,
+        nullable=True,
+        doc="Rows verified from the start of the table up to the checkpoint.",
+    )
+    checkpoint_mac: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        doc="Audit chain key MAC over the other checkpoint columns.",
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_audit_chain_verifications_target_started",
+            "target",
+            text("started_at DESC"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of AuditChainVerification."""
+        return (
+            "<AuditChainVerification("
+            f"id={self.id}, target={self.target}, status={self.status}, "
+            f"rows_verified={self.rows_verified}, is_valid={self.is_valid}"
+            ")>"
+        )
+
+
+__all__ = ["AuditChainVerification"]
@@ -0,0 +1,134 @@
+"""Background dataset-wide clip generation.
+
+Generating fixed-length clips used to take one request per recording. The
+API now records a queued job here and :mod:`echoroo.workers.clip_tasks`
+plans the windows of every recording in the dataset and inserts the ones
+that do not exist yet, so a job can be re-run without duplicating clips.
+
+Like :class:`~echoroo.models.ml_dataset_export_job.MlDatasetExportJob`
+this entity inherits :class:`UUIDMixin` only; the lifecycle is captured by
+the explicit ``started_at`` / ``finished_at`` columns.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from echoroo.models.base import Base, UUIDMixin
+
+
+class ClipGenerationJob(UUIDMixin, Base):
+    """One background clip generation over a dataset.
+
+    The ``ix_clip_generation_jobs_project`` index serves listing a
+    project's recent jobs.
+    """
+
+    __tablename__ = "clip_generation_jobs"
+
+    project_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+        doc="Project of the dataset.",
+    )
+    dataset_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("datasets.id", ondelete="CASCADE"),
+        nullable=False,
+        doc="Dataset whose recordings are clipped.",
+    )
+    requested_by_user_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        doc="User who requested the job; only they may poll it.",
+    )
+    clip_length: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        doc="Length of each clip in seconds.",
+    )
+    overlap: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        doc="Overlap between consecutive clips in seconds.",
+    )
+    start_time: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        doc="Offset of the first clip in each recording.",
+    )
+    end_time: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+        doc="Offset after which no clip ends. NULL = end of each recording.",
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        doc="One of 'queued', 'running', 'success', 'failure'.",
+    )
+    recordings_processed: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Recordings planned so far; committed after every batch.",
+    )
+    clips_created: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Clips inserted so far; windows that already existed are not counted.",
+    )
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        doc="Wall-clock timestamp at which the job was requested.",
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp of the terminal state. NULL while queued or running.",
+    )
+    error_detail: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        doc="Error description recorded when ``status='failure'``.",
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_clip_generation_jobs_project",
+            "project_id",
+            text("started_at DESC"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of ClipGenerationJob."""
+        return (
+            "<ClipGenerationJob("
+            f"id={self.id}, dataset_id={self.dataset_id}, status={self.status}, "
+            f"clips_created={self.clips_created}"
+            ")>"
+        )
+
+
+__all__ = ["ClipGenerationJob"]
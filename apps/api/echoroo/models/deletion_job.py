@@ -0,0 +1,131 @@
+"""Background deletion jobs for datasets and projects.
+
+Deleting a dataset or project no longer runs one cascading ``DELETE`` in
+the API request. The request flips the entity to ``status='deleting'``
+and records a queued job here; :mod:`echoroo.workers.deletion_tasks`
+then removes the child rows in bounded, separately committed batches
+(embeddings first), deletes the S3 objects under the entity's prefixes
+and finally deletes the entity row itself.
+
+The row doubles as the progress record the UI polls (``stage``,
+``rows_deleted``, ``objects_deleted``). It deliberately has no foreign key
+to ``datasets`` / ``projects``: it has to outlive the entity it deletes.
+
+Like :class:`~echoroo.models.iucn_sync_attempt.IucnSyncAttempt` this entity
+inherits :class:`UUIDMixin` only; the lifecycle is captured by the
+explicit ``started_at`` / ``claimed_at`` / ``finished_at`` columns.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from echoroo.models.base import Base, UUIDMixin
+
+
+class DeletionJob(UUIDMixin, Base):
+    """One background deletion of a dataset or project.
+
+    The ``ix_deletion_jobs_entity`` index serves the idempotency lookup a
+    repeated DELETE makes for the entity's active job.
+    """
+
+    __tablename__ = "deletion_jobs"
+
+    entity_type: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        doc="Deleted entity kind: 'dataset' or 'project'.",
+    )
+    entity_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=False,
+        doc="ID of the dataset or project being deleted.",
+    )
+    project_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=False,
+        doc="Owning project (equal to ``entity_id`` for a project job).",
+    )
+    requested_by_user_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        doc="User who requested the deletion; only they may poll the job.",
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        doc="One of 'queued', 'running', 'success', 'failure'.",
+    )
+    stage: Mapped[str | None] = mapped_column(
+        String(40),
+        nullable=True,
+        doc=(
+            "What the job is deleting right now: a child table name, "
+            "'storage' or 'entity'. NULL while queued."
+        ),
+    )
+    rows_deleted: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Database rows deleted so far; committed after every batch.",
+    )
+    objects_deleted: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="S3 objects deleted so far.",
+    )
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        doc="Wall-clock timestamp at which the deletion was requested.",
+    )
+    claimed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc=(
+            "Timestamp at which a worker last claimed the job. A job still "
+            "'running' long after it is re-sent as a continuation."
+        ),
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp of the terminal state. NULL while queued or running.",
+    )
+    error_detail: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        doc="Error description recorded when ``status='failure'``.",
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_deletion_jobs_entity",
+            "entity_type",
+            "entity_id",
+            text("started_at DESC"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of DeletionJob."""
+        return (
+            "<DeletionJob("
+            f"id={self.id}, entity_type={self.entity_type}, "
+            f"entity_id={self.entity_id}, status={self.status}, "
+            f"stage={self.stage}, rows_deleted={self.rows_deleted}"
+            ")>"
+        )
+
+
+__all__ = ["DeletionJob"]
@@ -0,0 +1,415 @@
+"""Pre-aggregated detection counts backing the dashboard summaries.
+
+``species_summary`` / ``temporal_summary`` used to aggregate every
+``recording_annotations`` row of a project (with a per-row timezone
+conversion for the hourly buckets) on each dashboard load. These two rollup
+tables hold the same aggregates, keyed per dataset so they survive a dataset
+moving between projects and can be rebuilt one dataset at a time:
+
+* ``detection_species_rollups`` — dataset × detection run × tag × source ×
+  status, with the count and the confidence sum / count needed for the mean.
+* ``detection_temporal_rollups`` — dataset × detection run × tag × local
+  date × local hour (recording datetime in the dataset's timezone).
+
+The rows are maintained in PostgreSQL, not in application code, because
+``recording_annotations`` has many writers (bulk ``pg_insert`` inference,
+``db.add()`` sampling, search sessions, the review API) and is also changed
+by FK actions (``tags`` / ``detection_runs`` ``SET NULL``, ``recordings``
+``CASCADE``). The DDL in :data:`DETECTION_ROLLUP_DDL` installs:
+
+* statement-level ``AFTER INSERT / UPDATE / DELETE`` triggers on
+  ``recording_annotations`` that aggregate the transition tables and upsert
+  deltas (one upsert per touched key per statement, so a 10k-row inference
+  batch is one grouped upsert, not 10k);
+* ``BEFORE`` / ``AFTER`` row triggers on ``recordings`` that move a
+  recording's annotations when its dataset or datetime changes and release
+  them before it is deleted (the cascade would otherwise run after the
+  recording row — and its dataset / datetime — is gone);
+* row triggers on ``datasets`` that re-bucket the dataset when its timezone
+  changes and drop its rollups when it is deleted;
+* ``detection_rollups_refresh(dataset_id)``, the set-based rebuild used by
+  the migration backfill and :mod:`echoroo.workers.detection_rollups`.
+
+Writers take a shared per-dataset advisory lock and a refresh takes it
+exclusively, so a rebuild never interleaves with in-flight deltas.
+
+Migration ``0035_detection_rollups`` carries a frozen copy of this DDL; the
+constant here is the live source for the test-database heal in
+``tests/conftest.py``. Any change to the DDL must ship as a NEW migration.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    Enum,
+    Float,
+    Index,
+    SmallInteger,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from echoroo.models.base import Base
+from echoroo.models.enums import DetectionSource, DetectionStatus
+
+
+class DetectionSpeciesRollup(Base):
+    """Annotation count per dataset × run × tag × source × status.
+
+    ``detection_run_id`` and ``tag_id`` are plain (FK-less) columns: deleting
+    a run or tag ``SET NULL``s the annotations, and the triggers move the
+    counts to the ``NULL`` key in the same statement. Rows whose count
+    reaches zero are deleted.
+    """
+
+    __tablename__ = "detection_species_rollups"
+
+    id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    dataset_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    detection_run_id: Mapped[UUID | None] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
+    tag_id: Mapped[UUID | None] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
+    source: Mapped[DetectionSource] = mapped_column(
+        Enum(
+            DetectionSource,
+            name="detectionsource",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+    )
+    status: Mapped[DetectionStatus] = mapped_column(
+        Enum(
+            DetectionStatus,
+            name="detectionstatus",
+            create_type=False,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+    )
+    detection_count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
+    confidence_sum: Mapped[float] = mapped_column(Float, nullable=False, server_default=text("0"))
+    confidence_count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
+
+    __table_args__ = (
+        # ON CONFLICT arbiter for the trigger upserts; NULL run / tag ids
+        # must collide, hence NULLS NOT DISTINCT (PostgreSQL 15+).
+        Index(
+            "uq_detection_species_rollups_key",
+            "dataset_id",
+            "detection_run_id",
+            "tag_id",
+            "source",
+            "status",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+
+class DetectionTemporalRollup(Base):
+    """Tagged annotation count per dataset × run × tag × local date × hour.
+
+    Mirrors the live ``temporal_summary`` semantics: untagged annotations and
+    recordings without a parsed datetime are not counted, and the bucket is
+    the recording datetime in ``COALESCE(datasets.datetime_timezone, 'UTC')``.
+    """
+
+    __tablename__ = "detection_temporal_rollups"
+
+    id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    dataset_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    detection_run_id: Mapped[UUID | None] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
+    tag_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    local_date: Mapped[date] = mapped_column(Date, nullable=False)
+    local_hour: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    detection_count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
+
+    __table_args__ = (
+        Index(
+            "uq_detection_temporal_rollups_key",
+            "dataset_id",
+            "detection_run_id",
+            "tag_id",
+            "local_date",
+            "local_hour",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Trigger / function DDL (live copy; migration 0035 holds the frozen one)
+# ---------------------------------------------------------------------------
+#
+# Every statement is idempotent (``CREATE OR REPLACE``) so the conftest heal
+# can re-run it against a reused test database.
+
+_LOCAL_DATETIME = "rec.datetime AT TIME ZONE COALESCE(d.datetime_timezone, 'UTC')"
+
+DETECTION_ROLLUP_DDL: tuple[str, ...] = (
+    f"""
+    CREATE OR REPLACE FUNCTION detection_rollups_apply(
+        p_rows recording_annotations[], p_sign integer
+    ) RETURNS void AS $fn$
+    BEGIN
+        IF COALESCE(cardinality(p_rows), 0) = 0 THEN
+            RETURN;
+        END IF;
+
+        -- Writers share the per-dataset lock; a refresh takes it exclusively.
+        PERFORM pg_advisory_xact_lock_shared(
+            hashtext('detection_rollups'), hashtext(touched.dataset_id::text)
+        )
+        FROM (
+            SELECT DISTINCT rec.dataset_id
+            FROM unnest(p_rows) AS a
+            JOIN recordings rec ON rec.id = a.recording_id
+        ) AS touched;
+
+        INSERT INTO detection_species_rollups AS r (
+            dataset_id, detection_run_id, tag_id, source, status,
+            detection_count, confidence_sum, confidence_count
+        )
+        SELECT
+            rec.dataset_id, a.detection_run_id, a.tag_id, a.source, a.status,
+            p_sign * count(*),
+            p_sign * COALESCE(sum(a.confidence), 0),
+            p_sign * count(a.confidence)
+        FROM unnest(p_rows) AS a
+        JOIN recordings rec ON rec.id = a.recording_id
+        GROUP BY rec.dataset_id, a.detection_run_id, a.tag_id, a.source, a.status
+        ON CONFLICT (dataset_id, detection_run_id, tag_id, source, status)
+        DO UPDATE SET
+            detection_count = r.detection_count + EXCLUDED.detection_count,
+            confidence_sum = r.confidence_sum + EXCLUDED.confidence_sum,
+            confidence_count = r.confidence_count + EXCLUDED.confidence_count;
+
+        INSERT INTO detection_temporal_rollups AS r (
+            dataset_id, detection_run_id, tag_id, local_date, local_hour,
+            detection_count
+        )
+        SELECT
+            rec.dataset_id, a.detection_run_id, a.tag_id,
+            ({_LOCAL_DATETIME})::date,
+            extract(hour FROM {_LOCAL_DATETIME})::smallint,
+            p_sign * count(*)
+        FROM unnest(p_rows) AS a
+        JOIN recordings rec ON rec.id = a.recording_id
+        JOIN datasets d ON d.id = rec.dataset_id
+        WHERE a.tag_id IS NOT NULL AND rec.datetime IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5
+        ON CONFLICT (dataset_id, detection_run_id, tag_id, local_date, local_hour)
+        DO UPDATE SET
+            detection_count = r.detection_count + EXCLUDED.detection_count;
+
+        IF p_sign < 0 THEN
+            DELETE FROM detection_species_rollups
+            WHERE detection_count = 0
+              AND dataset_id IN (
+                  SELECT rec.dataset_id FROM unnest(p_rows) AS a
+                  JOIN recordings rec ON rec.id = a.recording_id
+              );
+            DELETE FROM detection_temporal_rollups
+            WHERE detection_count = 0
+              AND dataset_id IN (
+                  SELECT rec.dataset_id FROM unnest(p_rows) AS a
+                  JOIN recordings rec ON rec.id = a.recording_id
+              );
+        END IF;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION detection_rollups_refresh(p_dataset_id uuid)
+    RETURNS void AS $fn$
+    BEGIN
+        PERFORM pg_advisory_xact_lock(
+            hashtext('detection_rollups'), hashtext(p_dataset_id::text)
+        );
+
+        DELETE FROM detection_species_rollups WHERE dataset_id = p_dataset_id;
+        DELETE FROM detection_temporal_rollups WHERE dataset_id = p_dataset_id;
+
+        INSERT INTO detection_species_rollups (
+            dataset_id, detection_run_id, tag_id, source, status,
+            detection_count, confidence_sum, confidence_count
+        )
+        SELECT
+            rec.dataset_id, a.detection_run_id, a.tag_id, a.source, a.status,
+            count(*), COALESCE(sum(a.confidence), 0), count(a.confidence)
+        FROM recording_annotations a
+        JOIN recordings rec ON rec.id = a.recording_id
+        WHERE rec.dataset_id = p_dataset_id
+        GROUP BY rec.dataset_id, a.detection_run_id, a.tag_id, a.source, a.status;
+
+        INSERT INTO detection_temporal_rollups (
+            dataset_id, detection_run_id, tag_id, local_date, local_hour,
+            detection_count
+        )
+        SELECT
+            rec.dataset_id, a.detection_run_id, a.tag_id,
+            ({_LOCAL_DATETIME})::date,
+            extract(hour FROM {_LOCAL_DATETIME})::smallint,
+            count(*)
+        FROM recording_annotations a
+        JOIN recordings rec ON rec.id = a.recording_id
+        JOIN datasets d ON d.id = rec.dataset_id
+        WHERE rec.dataset_id = p_dataset_id
+          AND a.tag_id IS NOT NULL
+          AND rec.datetime IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION recording_annotations_rollup_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            PERFORM detection_rollups_apply(
+                ARRAY(SELECT n::recording_annotations FROM new_rows n), 1
+            );
+        ELSIF TG_OP = 'DELETE' THEN
+            -- Rows cascading from a deleted recording no longer join to it
+            -- and are skipped; recordings_rollup_sync released them already.
+            PERFORM detection_rollups_apply(
+                ARRAY(SELECT o::recording_annotations FROM old_rows o), -1
+            );
+        ELSE
+            PERFORM detection_rollups_apply(ARRAY(
+                SELECT o::recording_annotations
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE (o.recording_id, o.tag_id, o.detection_run_id,
+                       o.source, o.status, o.confidence)
+                    IS DISTINCT FROM
+                      (n.recording_id, n.tag_id, n.detection_run_id,
+                       n.source, n.status, n.confidence)
+            ), -1);
+            PERFORM detection_rollups_apply(ARRAY(
+                SELECT n::recording_annotations
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE (o.recording_id, o.tag_id, o.detection_run_id,
+                       o.source, o.status, o.confidence)
+                    IS DISTINCT FROM
+                      (n.recording_id, n.tag_id, n.detection_run_id,
+                       n.source, n.status, n.confidence)
+            ), 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION recordings_rollup_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        -- BEFORE: subtract while the old recording row is still visible.
+        -- AFTER: add back against the new one.
+        IF TG_WHEN = 'BEFORE' THEN
+            -- Inside a dataset delete cascade the dataset row is already
+            -- gone; datasets_rollup_sync drops its rollups wholesale.
+            IF EXISTS (SELECT 1 FROM datasets WHERE id = OLD.dataset_id) THEN
+                PERFORM detection_rollups_apply(ARRAY(
+                    SELECT a FROM recording_annotations a
+                    WHERE a.recording_id = OLD.id
+                ), -1);
+            END IF;
+            IF TG_OP = 'DELETE' THEN
+                RETURN OLD;
+            END IF;
+            RETURN NEW;
+        END IF;
+        PERFORM detection_rollups_apply(ARRAY(
+            SELECT a FROM recording_annotations a WHERE a.recording_id = NEW.id
+        ), 1);
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION datasets_rollup_sync()
+    RETURNS trigger AS $fn$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM detection_species_rollups WHERE dataset_id = OLD.id;
+            DELETE FROM detection_temporal_rollups WHERE dataset_id = OLD.id;
+        ELSE
+            PERFORM detection_rollups_refresh(NEW.id);
+        END IF;
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recording_annotations_rollup_insert
+    AFTER INSERT ON recording_annotations
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION recording_annotations_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recording_annotations_rollup_update
+    AFTER UPDATE ON recording_annotations
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION recording_annotations_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recording_annotations_rollup_delete
+    AFTER DELETE ON recording_annotations
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION recording_annotations_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recordings_rollup_before_move
+    BEFORE UPDATE OF dataset_id, datetime ON recordings
+    FOR EACH ROW
+    WHEN (OLD.dataset_id IS DISTINCT FROM NEW.dataset_id
+          OR OLD.datetime IS DISTINCT FROM NEW.datetime)
+    EXECUTE FUNCTION recordings_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recordings_rollup_after_move
+    AFTER UPDATE OF dataset_id, datetime ON recordings
+    FOR EACH ROW
+    WHEN (OLD.dataset_id IS DISTINCT FROM NEW.dataset_id
+          OR OLD.datetime IS DISTINCT FROM NEW.datetime)
+    EXECUTE FUNCTION recordings_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER recordings_rollup_before_delete
+    BEFORE DELETE ON recordings
+    FOR EACH ROW EXECUTE FUNCTION recordings_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER datasets_rollup_timezone
+    AFTER UPDATE OF datetime_timezone ON datasets
+    FOR EACH ROW
+    WHEN (OLD.datetime_timezone IS DISTINCT FROM NEW.datetime_timezone)
+    EXECUTE FUNCTION datasets_rollup_sync();
+    """,
+    """
+    CREATE OR REPLACE TRIGGER datasets_rollup_delete
+    AFTER DELETE ON datasets
+    FOR EACH ROW EXECUTE FUNCTION datasets_rollup_sync();
+    """,
+)
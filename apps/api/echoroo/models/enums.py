@@ -65,6 +65,7 @@ class ProjectStatus(StrEnum):
     ACTIVE = "active"
     DORMANT = "dormant"
     ARCHIVED = "archived"
+    DELETING = "deleting"  # Background deletion job queued or running
 
 
 class SettingType(StrEnum):
@@ -91,6 +92,7 @@ class DatasetStatus(StrEnum):
     PROCESSING = "processing"  # Importing recordings
     COMPLETED = "completed"  # Import finished successfully
     FAILED = "failed"  # Import failed with error
+    DELETING = "deleting"  # Background deletion job queued or running
 
 
 class DatetimeParseStatus(StrEnum):
@@ -182,7 +182,9 @@ class EvaluationResult(UUIDMixin, TimestampMixin, Base):
         - ``f1 = 2 p r / (p + r)`` (0 when denom 0)
 
     The derived ``precision``, ``recall`` and ``f1`` fields are persisted to
-    avoid recomputing them on every read (see research.md §7).
+    avoid recomputing them on every read (see research.md §7). The overall
+    row also carries ``pr_curve``: ``{"threshold", "precision", "recall"}``
+    points ordered by descending detection-confidence threshold.
     """
 
     __tablename__ = "evaluation_results"
@@ -247,6 +249,11 @@ class EvaluationResult(UUIDMixin, TimestampMixin, Base):
         default=0.0,
         doc="Derived F1 metric (persisted for query speed)",
     )
+    pr_curve: Mapped[list[dict[str, Any]] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        doc="Precision / recall per confidence threshold (overall rows only)",
+    )
 
     # Relationships
     evaluation_run: Mapped[EvaluationRun] = relationship(
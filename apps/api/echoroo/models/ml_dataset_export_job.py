@@ -0,0 +1,121 @@
+"""Background ML training dataset exports.
+
+The ML-dataset export used to assemble the whole ZIP in API memory. The
+API now records a queued job here and
+:mod:`echoroo.workers.detection_export_tasks` streams the annotations
+from a server-side cursor into a ZIP that is written straight to object storage as a
+multipart upload. Once the job succeeds the UI polls it for a presigned
+download URL of ``object_key``.
+
+Like :class:`~echoroo.models.deletion_job.DeletionJob` this entity
+inherits :class:`UUIDMixin` only; the lifecycle is captured by the
+explicit ``started_at`` / ``claimed_at`` / ``finished_at`` columns.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from echoroo.models.base import Base, UUIDMixin
+
+
+class MlDatasetExportJob(UUIDMixin, Base):
+    """One background ML-dataset ZIP export of a project.
+
+    The ``ix_ml_dataset_export_jobs_project`` index serves listing a
+    project's recent exports.
+    """
+
+    __tablename__ = "ml_dataset_export_jobs"
+
+    project_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+        doc="Exported project.",
+    )
+    dataset_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        doc="Optional dataset filter of the export.",
+    )
+    detection_run_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        doc="Optional detection run filter of the export.",
+    )
+    requested_by_user_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=True,
+        doc="User who requested the export; only they may poll the job.",
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        doc="One of 'queued', 'running', 'success', 'failure'.",
+    )
+    entries_written: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="annotations.csv rows written so far; committed after every batch.",
+    )
+    object_key: Mapped[str | None] = mapped_column(
+        String(1024),
+        nullable=True,
+        doc="S3 key of the finished ZIP. NULL until the job succeeds.",
+    )
+    size_bytes: Mapped[int | None] = mapped_column(
+        BigInteger,
+        nullable=True,
+        doc="Size of the finished ZIP in bytes.",
+    )
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        doc="Wall-clock timestamp at which the export was requested.",
+    )
+    claimed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc=(
+            "Timestamp at which a worker claimed the job. A job still "
+            "'running' long after it is reaped as failed."
+        ),
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp of the terminal state. NULL while queued or running.",
+    )
+    error_detail: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        doc="Error description recorded when ``status='failure'``.",
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_ml_dataset_export_jobs_project",
+            "project_id",
+            text("started_at DESC"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of MlDatasetExportJob."""
+        return (
+            "<MlDatasetExportJob("
+            f"id={self.id}, project_id={self.project_id}, status={self.status}, "
+            f"entries_written={self.entries_written}"
+            ")>"
+        )
+
+
+__all__ = ["MlDatasetExportJob"]
@@ -18,6 +18,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -188,6 +189,12 @@ class Recording(UUIDMixin, TimestampMixin, Base):
         Index("ix_recordings_hash", "hash"),
         Index("ix_recordings_datetime", "datetime"),
         Index("ix_recordings_dataset_id_datetime", "dataset_id", "datetime"),
+        Index(
+            "ix_recordings_dataset_datetime_id",
+            "dataset_id",
+            text("datetime DESC NULLS LAST"),
+            text("id DESC"),
+        ),
         Index("ix_recordings_h3_index_member", "h3_index_member"),
     )
 
@@ -173,6 +173,14 @@ class RecordingAnnotation(UUIDMixin, TimestampMixin, Base):
         Index("ix_recording_annotations_status", "status"),
         Index("ix_recording_annotations_source", "source"),
         Index("ix_recording_annotations_confidence", "confidence"),
+        # Keyset pagination of the detection list (migration 0034).
+        Index("ix_recording_annotations_created_id", "created_at", "id"),
+        Index(
+            "ix_recording_annotations_run_created_id",
+            "detection_run_id",
+            "created_at",
+            "id",
+        ),
     )
 
     def __repr__(self) -> str:
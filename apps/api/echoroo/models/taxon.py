@@ -3,18 +3,24 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import Boolean, DateTime, Float, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from echoroo.core.text import fold_for_search
 from echoroo.models.base import Base, TimestampMixin, UUIDMixin
 
 if TYPE_CHECKING:
     from echoroo.models.taxon_vernacular_name import TaxonVernacularName
 
 
+def _search_name_default(context: Any) -> str:
+    """Fill ``search_name`` from ``scientific_name`` on ORM and Core inserts."""
+    return fold_for_search(context.get_current_parameters()["scientific_name"])[:300]
+
+
 class Taxon(UUIDMixin, TimestampMixin, Base):
     """Global taxon record linked to GBIF taxonomy.
 
@@ -36,6 +42,8 @@ class Taxon(UUIDMixin, TimestampMixin, Base):
         gbif_backbone_version: GBIF/COL backbone version pinned at match time
         verbatim_scientific_name: Original name as supplied before normalization
         accepted_scientific_name: GBIF canonical/accepted name
+        search_name: ``scientific_name`` folded by
+            :func:`~echoroo.core.text.fold_for_search`; trigram-indexed for search
     """
 
     __tablename__ = "taxa"
@@ -52,6 +60,12 @@ class Taxon(UUIDMixin, TimestampMixin, Base):
     is_non_biological: Mapped[bool] = mapped_column(
         Boolean, default=False, nullable=False, doc="Non-biological label (noise, engine, etc.)",
     )
+    search_name: Mapped[str] = mapped_column(
+        String(300),
+        nullable=False,
+        default=_search_name_default,
+        doc="Search-folded scientific name",
+    )
     gbif_metadata: Mapped[dict[str, object] | None] = mapped_column(
         JSONB, nullable=True, doc="GBIF classification metadata",
     )
@@ -91,6 +105,12 @@ class Taxon(UUIDMixin, TimestampMixin, Base):
         Index("ix_taxa_gbif_taxon_key", "gbif_taxon_key", unique=True, postgresql_where=gbif_taxon_key.isnot(None)),
         Index("ix_taxa_scientific_name", "scientific_name"),
         Index("ix_taxa_is_non_biological", "is_non_biological"),
+        Index(
+            "ix_taxa_search_name_trgm",
+            "search_name",
+            postgresql_using="gin",
+            postgresql_ops={"search_name": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,81 @@
+"""Persistent cache of GBIF taxon resolutions.
+
+Every scientific name resolved through
+:class:`~echoroo.services.taxon_resolution.TaxonResolver` leaves a row
+here keyed by its normalized form, recording either the GBIF match or an
+explicit miss (``gbif_taxon_key IS NULL``). Vernacular names fetched for
+the matched key are kept alongside, grouped by locale, once some caller
+has asked for them. Rows are served until ``expires_at``; hits and misses
+get separate TTLs (see ``TAXON_RESOLUTION_HIT_TTL_DAYS`` /
+``TAXON_RESOLUTION_MISS_TTL_DAYS``).
+
+The table is a cache, not a source of truth: it carries no UUID identity
+or timestamps mixin and may be truncated at any time.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from echoroo.models.base import Base
+
+
+class TaxonResolution(Base):
+    """Cached outcome of resolving one scientific name against GBIF."""
+
+    __tablename__ = "taxon_resolution_cache"
+
+    name_key: Mapped[str] = mapped_column(
+        String(300),
+        primary_key=True,
+        doc="Normalized name (whitespace-collapsed, case-folded).",
+    )
+    gbif_taxon_key: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        doc="Matched GBIF usage key. NULL records a miss.",
+    )
+    scientific_name: Mapped[str | None] = mapped_column(
+        String(300),
+        nullable=True,
+        doc="GBIF canonical name of the match.",
+    )
+    rank: Mapped[str | None] = mapped_column(
+        String(50),
+        nullable=True,
+        doc="Taxonomic rank of the match.",
+    )
+    classification: Mapped[dict[str, object] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        doc="kingdom/phylum/class/order/family/genus of the match.",
+    )
+    vernacular_names: Mapped[dict[str, list[str]] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        doc="GBIF vernacular names by locale. NULL until first fetched.",
+    )
+    resolved_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        doc="When GBIF was last asked about this name.",
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        doc="After this instant the row is ignored and the name re-resolved.",
+    )
+
+    def __repr__(self) -> str:
+        """String representation of TaxonResolution."""
+        return (
+            f"<TaxonResolution(name_key={self.name_key!r}, "
+            f"gbif_taxon_key={self.gbif_taxon_key})>"
+        )
+
+
+__all__ = ["TaxonResolution"]
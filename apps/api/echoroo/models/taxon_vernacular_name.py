@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from sqlalchemy import Boolean, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from echoroo.core.text import fold_for_search
 from echoroo.models.base import Base, TimestampMixin, UUIDMixin
 
 if TYPE_CHECKING:
     from echoroo.models.taxon import Taxon
 
 
+def _search_name_default(context: Any) -> str:
+    """Fill ``search_name`` from ``name`` on ORM and Core inserts."""
+    return fold_for_search(context.get_current_parameters()["name"])[:300]
+
+
 class TaxonVernacularName(UUIDMixin, TimestampMixin, Base):
     """Multilingual common name for a taxon.
 
@@ -24,6 +30,8 @@ class TaxonVernacularName(UUIDMixin, TimestampMixin, Base):
         name: Vernacular name in the given locale
         source: Origin of the name ("gbif", "birdnet", "user")
         is_primary: Whether this is the primary name for the locale
+        search_name: ``name`` folded by :func:`~echoroo.core.text.fold_for_search`;
+            trigram-indexed for search
     """
 
     __tablename__ = "taxon_vernacular_names"
@@ -40,6 +48,12 @@ class TaxonVernacularName(UUIDMixin, TimestampMixin, Base):
     name: Mapped[str] = mapped_column(
         String(300), nullable=False, doc="Vernacular name",
     )
+    search_name: Mapped[str] = mapped_column(
+        String(300),
+        nullable=False,
+        default=_search_name_default,
+        doc="Search-folded vernacular name",
+    )
     source: Mapped[str] = mapped_column(
         String(20), nullable=False, doc="Source of the name (gbif, birdnet, user)",
     )
@@ -61,6 +75,12 @@ class TaxonVernacularName(UUIDMixin, TimestampMixin, Base):
             "locale",
             "taxon_id",
         ),
+        Index(
+            "ix_taxon_vernacular_names_search_name_trgm",
+            "search_name",
+            postgresql_using="gin",
+            postgresql_ops={"search_name": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -8,7 +8,13 @@ whose ``__tablename__`` is ``recording_annotations``. That table
 ``0011_recording_annotations_placeholder``, renamed from its transitional
 ``recording_annotations_DEFERRED`` placeholder name by migration
 ``0029_rename_recording_annotations_final``, and actively written/read by the
-ML classifier, search-session, and detection grid).
+ML classifier, search-session, and detection grid). ``species_summary`` /
+``temporal_summary`` read its trigger-maintained aggregates in
+``detection_species_rollups`` / ``detection_temporal_rollups``
+(:mod:`echoroo.models.detection_rollup`) instead of scanning it.
+``list_annotations`` filters and sorts on vote consensus by joining the
+trigger-maintained ``annotation_vote_tallies``
+(:mod:`echoroo.models.annotation_vote_tally`).
 
 The two existence-probe methods used by the vote / comment / detection API
 paths (:meth:`exists` and :meth:`exists_in_project`) now also operate on the
@@ -26,15 +32,23 @@ cross-project id is correctly rejected (BOLA / IDOR guard).
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Literal, TypedDict
 from uuid import UUID
 
-from sqlalchemy import Integer, delete, func, select
+from sqlalchemy import case, delete, func, select
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.orm import selectinload
-from sqlalchemy.sql.expression import cast
 
-from echoroo.models.enums import DetectionStatus
+from echoroo.core.pagination import (
+    Cursor,
+    TotalMode,
+    count_total,
+    keyset_after,
+    keyset_order_by,
+)
+from echoroo.models.annotation_vote_tally import AnnotationVoteTally
+from echoroo.models.detection_rollup import DetectionSpeciesRollup, DetectionTemporalRollup
+from echoroo.models.enums import ConsensusStatus, DetectionStatus
 from echoroo.models.recording_annotation import RecordingAnnotation
 from echoroo.models.tag import Tag
 from echoroo.repositories.base import BaseRepository
@@ -42,6 +56,10 @@ from echoroo.repositories.base import BaseRepository
 if TYPE_CHECKING:
     pass
 
+# Detection list orderings. ``consensus_score`` is agree / (agree + disagree),
+# highest first; annotations without a decisive vote sort last.
+DetectionSort = Literal["created_at", "consensus_score"]
+
 
 class TemporalSummaryRow(TypedDict):
     """Typed row for temporal summary query results."""
@@ -188,11 +206,21 @@ class AnnotationRepository(BaseRepository[RecordingAnnotation]):
         detection_run_id: UUID | None = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: Cursor | None = None,
+        total_mode: TotalMode = "exact",
+        consensus: ConsensusStatus | None = None,
+        sort_by: DetectionSort = "created_at",
     ) -> tuple[list[RecordingAnnotation], int]:
         """List recording annotations using rich-shape filters.
 
         Queries the live :class:`RecordingAnnotation` table
-        (``recording_annotations``).
+        (``recording_annotations``), newest first or by descending consensus
+        score. With ``cursor`` the page starts right after the cursor row and
+        ``page`` is ignored.
+
+        ``consensus`` filters on the stored ``annotation_vote_tallies``
+        status, which follows the project's review settings; annotations
+        nobody has voted on count as ``needs_votes``.
         """
         from echoroo.models.dataset import Dataset
         from echoroo.models.recording import Recording
@@ -204,58 +232,65 @@ class AnnotationRepository(BaseRepository[RecordingAnnotation]):
             .where(Dataset.project_id == project_id)
         )
 
-        count_query = (
-            select(func.count())
-            .select_from(RecordingAnnotation)
-            .join(Recording, RecordingAnnotation.recording_id == Recording.id)
-            .join(Dataset, Recording.dataset_id == Dataset.id)
-            .where(Dataset.project_id == project_id)
-        )
-
         if tag_id is not None:
             base_query = base_query.where(RecordingAnnotation.tag_id == tag_id)
-            count_query = count_query.where(RecordingAnnotation.tag_id == tag_id)
 
         if status is not None:
             base_query = base_query.where(RecordingAnnotation.status == status)
-            count_query = count_query.where(RecordingAnnotation.status == status)
 
         if confidence_min is not None:
             base_query = base_query.where(RecordingAnnotation.confidence >= confidence_min)
-            count_query = count_query.where(RecordingAnnotation.confidence >= confidence_min)
 
         if confidence_max is not None:
             base_query = base_query.where(RecordingAnnotation.confidence <= confidence_max)
-            count_query = count_query.where(RecordingAnnotation.confidence <= confidence_max)
 
         if dataset_id is not None:
             base_query = base_query.where(Recording.dataset_id == dataset_id)
-            count_query = count_query.where(Recording.dataset_id == dataset_id)
 
         if recording_id is not None:
             base_query = base_query.where(RecordingAnnotation.recording_id == recording_id)
-            count_query = count_query.where(RecordingAnnotation.recording_id == recording_id)
 
         if detection_run_id is not None:
             base_query = base_query.where(RecordingAnnotation.detection_run_id == detection_run_id)
-            count_query = count_query.where(
-                RecordingAnnotation.detection_run_id == detection_run_id
+
+        if consensus is not None or sort_by == "consensus_score":
+            base_query = base_query.outerjoin(
+                AnnotationVoteTally,
+                AnnotationVoteTally.annotation_id == RecordingAnnotation.id,
+            )
+        if consensus is not None:
+            base_query = base_query.where(
+                func.coalesce(
+                    AnnotationVoteTally.consensus_status, ConsensusStatus.NEEDS_VOTES
+                )
+                == consensus
             )
 
-        count_result = await self.db.execute(count_query)
-        total: int = count_result.scalar_one()
+        total = await count_total(self.db, base_query, total_mode)
+
+        sort_column = (
+            AnnotationVoteTally.consensus_score
+            if sort_by == "consensus_score"
+            else RecordingAnnotation.created_at
+        )
+        page_query = base_query.order_by(
+            *keyset_order_by(sort_column, RecordingAnnotation.id, descending=True)
+        )
+        if cursor is not None:
+            page_query = page_query.where(
+                keyset_after(sort_column, RecordingAnnotation.id, cursor)
+            )
+        else:
+            page_query = page_query.offset((page - 1) * page_size)
 
-        offset = (page - 1) * page_size
         result = await self.db.execute(
-            base_query
+            page_query
             .options(
                 selectinload(RecordingAnnotation.recording),
                 selectinload(RecordingAnnotation.tag),
                 selectinload(RecordingAnnotation.detection_run),
                 selectinload(RecordingAnnotation.reviewed_by),
             )
-            .order_by(RecordingAnnotation.created_at.desc())
-            .offset(offset)
             .limit(page_size)
         )
         annotations = list(result.scalars().all())
@@ -270,61 +305,65 @@ class AnnotationRepository(BaseRepository[RecordingAnnotation]):
     ) -> list[SpeciesSummaryRow]:
         """Species rollup keyed by tag.
 
-        Queries the live :class:`RecordingAnnotation` table
-        (``recording_annotations``).
+        Reads the trigger-maintained ``detection_species_rollups`` table (see
+        :mod:`echoroo.models.detection_rollup`), so the cost scales with the
+        number of dataset × tag × status keys rather than with the number of
+        annotations. Rows are identical to aggregating
+        ``recording_annotations`` directly.
         """
         from echoroo.models.dataset import Dataset
         from echoroo.models.detection_run import DetectionRun
-        from echoroo.models.recording import Recording
 
-        def _agg_columns() -> list[object]:
-            return [
-                func.count(RecordingAnnotation.id).label("total_count"),
-                func.avg(RecordingAnnotation.confidence).label("avg_confidence"),
-                func.sum(
-                    cast(RecordingAnnotation.status == DetectionStatus.UNREVIEWED, Integer)
-                ).label("unreviewed_count"),
-                func.sum(
-                    cast(RecordingAnnotation.status == DetectionStatus.CONFIRMED, Integer)
-                ).label("confirmed_count"),
-                func.sum(
-                    cast(RecordingAnnotation.status == DetectionStatus.REJECTED, Integer)
-                ).label("rejected_count"),
-            ]
+        rollup = DetectionSpeciesRollup
+        total = func.sum(rollup.detection_count)
+
+        def _status_count(value: DetectionStatus) -> object:
+            return func.sum(
+                case((rollup.status == value, rollup.detection_count), else_=0)
+            )
+
+        agg_columns = [
+            total.label("total_count"),
+            (
+                func.sum(rollup.confidence_sum)
+                / func.nullif(func.sum(rollup.confidence_count), 0)
+            ).label("avg_confidence"),
+            _status_count(DetectionStatus.UNREVIEWED).label("unreviewed_count"),
+            _status_count(DetectionStatus.CONFIRMED).label("confirmed_count"),
+            _status_count(DetectionStatus.REJECTED).label("rejected_count"),
+        ]
 
         if detection_run_id is not None:
             query = (
                 select(
-                    RecordingAnnotation.tag_id,
+                    rollup.tag_id,
                     Tag.name.label("tag_name"),
                     Tag.scientific_name,
                     Tag.common_name,
                     Tag.taxon_id,
-                    RecordingAnnotation.source.label("annotation_source"),
+                    rollup.source.label("annotation_source"),
                     DetectionRun.model_name.label("detection_run_model_name"),
-                    *_agg_columns(),
-                )
-                .join(Recording, RecordingAnnotation.recording_id == Recording.id)
-                .join(Dataset, Recording.dataset_id == Dataset.id)
-                .outerjoin(Tag, RecordingAnnotation.tag_id == Tag.id)
-                .outerjoin(
-                    DetectionRun, RecordingAnnotation.detection_run_id == DetectionRun.id
+                    *agg_columns,
                 )
+                .join(Dataset, rollup.dataset_id == Dataset.id)
+                .outerjoin(Tag, rollup.tag_id == Tag.id)
+                .outerjoin(DetectionRun, rollup.detection_run_id == DetectionRun.id)
                 .where(Dataset.project_id == project_id)
-                .where(RecordingAnnotation.detection_run_id == detection_run_id)
+                .where(rollup.detection_run_id == detection_run_id)
                 .group_by(
-                    RecordingAnnotation.tag_id,
+                    rollup.tag_id,
                     Tag.name,
                     Tag.scientific_name,
                     Tag.common_name,
                     Tag.taxon_id,
-                    RecordingAnnotation.source,
+                    rollup.source,
                     DetectionRun.model_name,
                 )
-                .order_by(func.count(RecordingAnnotation.id).desc())
+                .having(total > 0)
+                .order_by(total.desc())
             )
             if dataset_id is not None:
-                query = query.where(Recording.dataset_id == dataset_id)
+                query = query.where(rollup.dataset_id == dataset_id)
 
             result = await self.db.execute(query)
             rows = result.all()
@@ -340,7 +379,7 @@ class AnnotationRepository(BaseRepository[RecordingAnnotation]):
                     scientific_name=row.scientific_name,
                     common_name=row.common_name,
                     taxon_id=row.taxon_id,
-                    total_count=row.total_count,
+                    total_count=int(row.total_count),
                     avg_confidence=float(row.avg_confidence) if row.avg_confidence is not None else None,
                     unreviewed_count=int(row.unreviewed_count or 0),
                     confirmed_count=int(row.confirmed_count or 0),
@@ -351,29 +390,29 @@ class AnnotationRepository(BaseRepository[RecordingAnnotation]):
 
         query_no_run = (
             select(
-                RecordingAnnotation.tag_id,
+                rollup.tag_id,
                 Tag.name.label("tag_name"),
                 Tag.scientific_name,
                 Tag.common_name,
                 Tag.taxon_id,
-                *_agg_columns(),
+                *agg_columns,
             )
-            .join(Recording, RecordingAnnotation.recording_id == Recording.id)
-            .join(Dataset, Recording.dataset_id == Dataset.id)
-            .outerjoin(Tag, RecordingAnnotation.tag_id == Tag.id)
+            .join(Dataset, rollup.dataset_id == Dataset.id)
+            .outerjoin(Tag, rollup.tag_id == Tag.id)
             .where(Dataset.project_id == project_id)
-            .where(RecordingAnnotation.tag_id.isnot(None))
+            .where(rollup.tag_id.isnot(None))
             .group_by(
-                RecordingAnnotation.tag_id,
+                rollup.tag_id,
                 Tag.name,
                 Tag.scientific_name,
                 Tag.common_name,
                 Tag.taxon_id,
             )
-            .order_by(func.count(RecordingAnnotation.id).desc())
+            .having(total > 0)
+            .order_by(total.desc())
         )
         if dataset_id is not None:
-            query_no_run = query_no_run.where(Recording.dataset_id == dataset_id)
+            query_no_run = query_no_run.where(rollup.dataset_id == dataset_id)
 
         result_no_run = await self.db.execute(query_no_run)
         rows_no_run = result_no_run.all()
@@ -385,7 +424,7 @@ class AnnotationRepository(BaseRepository[RecordingAnnotation]):
                 scientific_name=row.scientific_name,
                 common_name=row.common_name,
                 taxon_id=row.taxon_id,
-                total_count=row.total_count,
+                total_count=int(row.total_count),
                 avg_confidence=float(row.avg_confidence) if row.avg_confidence is not None else None,
                 unreviewed_count=int(row.unreviewed_count or 0),
                 confirmed_count=int(row.confirmed_count or 0),
@@ -402,46 +441,34 @@ class AnnotationRepository(BaseRepository[RecordingAnnotation]):
     ) -> list[TemporalSummaryRow]:
         """Hourly detection counts grouped by tag.
 
-        Queries the live :class:`RecordingAnnotation` table
-        (``recording_annotations``).
+        Reads the trigger-maintained ``detection_temporal_rollups`` table,
+        whose buckets are already in each dataset's local timezone, so no
+        per-annotation ``AT TIME ZONE`` conversion happens at request time.
         """
         from echoroo.models.dataset import Dataset
-        from echoroo.models.recording import Recording
 
-        tz_expr = func.coalesce(Dataset.datetime_timezone, "UTC")
-        local_datetime = Recording.datetime.op("AT TIME ZONE")(tz_expr)
-        date_expr = func.date(local_datetime).label("detection_date")
-        hour_expr = func.extract("hour", local_datetime).label("detection_hour")
+        rollup = DetectionTemporalRollup
+        count = func.sum(rollup.detection_count)
 
         query = (
             select(
-                RecordingAnnotation.tag_id,
-                date_expr,
-                hour_expr,
-                func.count(RecordingAnnotation.id).label("detection_count"),
+                rollup.tag_id,
+                rollup.local_date.label("detection_date"),
+                rollup.local_hour.label("detection_hour"),
+                count.label("detection_count"),
             )
-            .join(Recording, RecordingAnnotation.recording_id == Recording.id)
-            .join(Dataset, Recording.dataset_id == Dataset.id)
+            .join(Dataset, rollup.dataset_id == Dataset.id)
             .where(Dataset.project_id == project_id)
-            .where(RecordingAnnotation.tag_id.isnot(None))
-            .where(Recording.datetime.isnot(None))
-            .group_by(
-                RecordingAnnotation.tag_id,
-                func.date(local_datetime),
-                func.extract("hour", local_datetime),
-            )
-            .order_by(
-                RecordingAnnotation.tag_id,
-                func.date(local_datetime),
-                func.extract("hour", local_datetime),
-            )
+            .group_by(rollup.tag_id, rollup.local_date, rollup.local_hour)
+            .having(count > 0)
+            .order_by(rollup.tag_id, rollup.local_date, rollup.local_hour)
         )
 
         if dataset_id is not None:
-            query = query.where(Recording.dataset_id == dataset_id)
+            query = query.where(rollup.dataset_id == dataset_id)
 
         if detection_run_id is not None:
-            query = query.where(RecordingAnnotation.detection_run_id == detection_run_id)
+            query = query.where(rollup.detection_run_id == detection_run_id)
 
         result = await self.db.execute(query)
         rows = result.all()
@@ -24,6 +24,7 @@ from echoroo.models.annotation_vote import (
     vote_from_int,
     vote_to_int,
 )
+from echoroo.models.annotation_vote_tally import AnnotationVoteTally
 from echoroo.models.enums import (
     AnnotationVoteSource,
     ProjectMemberRole,
@@ -174,6 +175,61 @@ class AnnotationVoteRepository(BaseRepository[AnnotationVote]):
         await self.db.flush()
         return cursor.rowcount > 0
 
+    async def get_tally(self, annotation_id: UUID) -> AnnotationVoteTally | None:
+        """Get the trigger-maintained vote tally for an annotation.
+
+        Args:
+            annotation_id: Annotation's UUID
+
+        Returns:
+            AnnotationVoteTally instance, or None if nobody has voted yet
+        """
+        # The row is written by a trigger, never through the session, so a
+        # copy already in the identity map may predate this transaction's votes.
+        return await self.db.get(AnnotationVoteTally, annotation_id, populate_existing=True)
+
+    async def list_tallies(self, annotation_ids: list[UUID]) -> dict[UUID, AnnotationVoteTally]:
+        """Get the vote tallies for several annotations in one query.
+
+        Args:
+            annotation_ids: Annotation UUIDs
+
+        Returns:
+            Mapping of annotation_id to tally; annotations without votes are absent
+        """
+        if not annotation_ids:
+            return {}
+        result = await self.db.execute(
+            select(AnnotationVoteTally)
+            .where(AnnotationVoteTally.annotation_id.in_(annotation_ids))
+            .execution_options(populate_existing=True)
+        )
+        return {tally.annotation_id: tally for tally in result.scalars().all()}
+
+    async def list_user_votes(
+        self,
+        annotation_ids: list[UUID],
+        user_id: UUID,
+    ) -> dict[UUID, VoteType]:
+        """Get one user's votes on several annotations in one query.
+
+        Args:
+            annotation_ids: Annotation UUIDs
+            user_id: Voter's UUID
+
+        Returns:
+            Mapping of annotation_id to the user's vote; unvoted annotations are absent
+        """
+        if not annotation_ids:
+            return {}
+        result = await self.db.execute(
+            select(AnnotationVote.annotation_id, AnnotationVote.vote).where(
+                AnnotationVote.annotation_id.in_(annotation_ids),
+                AnnotationVote.voter_user_id == user_id,
+            )
+        )
+        return {annotation_id: vote_from_int(vote) for annotation_id, vote in result.all()}
+
     async def count_by_annotation(self, annotation_id: UUID) -> dict[VoteType, int]:
         """Count votes by type for an annotation.
 
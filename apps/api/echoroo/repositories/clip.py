@@ -1,14 +1,55 @@
 """Clip repository for database operations."""
 
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, select, text
 from sqlalchemy.orm import selectinload
 
-from echoroo.core.pagination import MAX_PAGE_SIZE
+from echoroo.core.pagination import (
+    MAX_PAGE_SIZE,
+    Cursor,
+    TotalMode,
+    count_total,
+    keyset_after,
+    keyset_order_by,
+)
 from echoroo.models.clip import Clip
 from echoroo.repositories.base import BaseRepository
 
+_WINDOW_STAGING_TABLE = "clip_window_staging"
+
+_CREATE_WINDOW_STAGING_SQL = f"""
+CREATE TEMPORARY TABLE IF NOT EXISTS {_WINDOW_STAGING_TABLE} (
+    recording_id uuid NOT NULL,
+    start_time double precision NOT NULL,
+    end_time double precision NOT NULL
+) ON COMMIT DROP
+"""
+
+#: Boundaries closer than this (in seconds) name the same window. Clips made
+#: before windows were planned as ``start + k * step`` were built by repeated
+#: addition and can sit a few ULPs away from the planned boundary.
+_WINDOW_MATCH_TOLERANCE = 1e-6
+
+#: Insert the staged windows a recording does not have yet. The NOT EXISTS
+#: anti-join range-scans ``uq_clip_recording_time`` once per window so
+#: existing clips, exact or within the tolerance, are skipped; ON CONFLICT
+#: only covers an exact clip created concurrently by another writer.
+_INSERT_NEW_WINDOWS_SQL = f"""
+INSERT INTO clips (id, recording_id, start_time, end_time, note, created_at, updated_at)
+SELECT gen_random_uuid(), s.recording_id, s.start_time, s.end_time, NULL, now(), now()
+FROM {_WINDOW_STAGING_TABLE} s
+WHERE NOT EXISTS (
+    SELECT 1 FROM clips c
+    WHERE c.recording_id = s.recording_id
+      AND c.start_time > s.start_time - {_WINDOW_MATCH_TOLERANCE!r}
+      AND c.start_time < s.start_time + {_WINDOW_MATCH_TOLERANCE!r}
+      AND abs(c.end_time - s.end_time) < {_WINDOW_MATCH_TOLERANCE!r}
+)
+ON CONFLICT ON CONSTRAINT uq_clip_recording_time DO NOTHING
+"""
+
 
 class ClipRepository(BaseRepository[Clip]):
     """Repository for Clip entity operations."""
@@ -58,39 +99,44 @@ class ClipRepository(BaseRepository[Clip]):
         page_size: int = 50,
         sort_by: str = "start_time",
         sort_order: str = "asc",
+        cursor: Cursor | None = None,
+        total_mode: TotalMode = "exact",
     ) -> tuple[list[Clip], int]:
         """List clips for a recording with pagination.
 
         Args:
             recording_id: Recording's UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); ignored when ``cursor`` is given
             page_size: Items per page
             sort_by: Sort column name
             sort_order: Sort order (asc/desc)
+            cursor: Keyset position to resume after (see
+                :func:`echoroo.core.pagination.decode_cursor`)
+            total_mode: ``"exact"`` or ``"estimate"`` total
 
         Returns:
             Tuple of (list of clips, total count)
         """
+        query = select(Clip).where(Clip.recording_id == recording_id)
+
         # Get total count
-        count_result = await self.db.execute(
-            select(func.count()).select_from(Clip).where(Clip.recording_id == recording_id)
-        )
-        total: int = count_result.scalar_one()
+        total = await count_total(self.db, query, total_mode)
 
-        # Build query with sorting
-        query = select(Clip).where(Clip.recording_id == recording_id)
+        # Build query with sorting; id breaks ties so pages never overlap.
         sort_column = getattr(Clip, sort_by, Clip.start_time)
-        if sort_order == "asc":
-            query = query.order_by(sort_column.asc())
-        else:
-            query = query.order_by(sort_column.desc())
+        query = query.order_by(
+            *keyset_order_by(sort_column, Clip.id, descending=sort_order != "asc")
+        )
 
         # Apply pagination. Clamp the client-controlled page_size to
         # MAX_PAGE_SIZE so a caller cannot force an unbounded SQL query
         # regardless of the entry point (v1 helper, BFF delegate, or internal).
         page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
-        offset = (max(page, 1) - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        if cursor is not None:
+            query = query.where(keyset_after(sort_column, Clip.id, cursor))
+        else:
+            query = query.offset((max(page, 1) - 1) * page_size)
+        query = query.limit(page_size)
 
         result = await self.db.execute(query)
         clips = list(result.scalars().all())
@@ -124,6 +170,34 @@ class ClipRepository(BaseRepository[Clip]):
         await self.db.flush()
         return clips
 
+    async def insert_windows(self, windows: Sequence[tuple[UUID, float, float]]) -> int:
+        """Bulk-insert clip windows, skipping those that already exist.
+
+        The windows are ``COPY``-ed into a transaction-scoped staging table
+        and inserted with one set-based statement, so re-running a
+        generation only adds the clips that are missing. An existing clip
+        whose boundaries differ from a window's by less than
+        ``_WINDOW_MATCH_TOLERANCE`` counts as that window.
+
+        Args:
+            windows: ``(recording_id, start_time, end_time)`` tuples
+
+        Returns:
+            Number of clips inserted
+        """
+        if not windows:
+            return 0
+        await self.db.execute(text(_CREATE_WINDOW_STAGING_SQL))
+        await self.db.execute(text(f"TRUNCATE {_WINDOW_STAGING_TABLE}"))
+        raw = await (await self.db.connection()).get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            _WINDOW_STAGING_TABLE,
+            records=windows,
+            columns=["recording_id", "start_time", "end_time"],
+        )
+        result = await self.db.execute(text(_INSERT_NEW_WINDOWS_SQL))
+        return int(result.rowcount or 0)
+
     async def update(self, clip: Clip) -> Clip:
         """Update an existing clip.
 
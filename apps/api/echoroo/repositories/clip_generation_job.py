@@ -0,0 +1,82 @@
+"""ClipGenerationJob repository for database operations."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+
+from echoroo.models.clip_generation_job import ClipGenerationJob
+from echoroo.repositories.base import BaseRepository
+
+
+class ClipGenerationJobRepository(BaseRepository[ClipGenerationJob]):
+    """Repository for ClipGenerationJob entity operations."""
+
+    model = ClipGenerationJob
+
+    async def get_for_dataset(
+        self, project_id: UUID, dataset_id: UUID, job_id: UUID
+    ) -> ClipGenerationJob | None:
+        """Get a clip generation job of a dataset by ID.
+
+        Args:
+            project_id: Project's UUID
+            dataset_id: Dataset's UUID
+            job_id: ClipGenerationJob's UUID
+
+        Returns:
+            ClipGenerationJob instance or None if not found in the dataset
+        """
+        result = await self.db.execute(
+            select(ClipGenerationJob).where(
+                ClipGenerationJob.id == job_id,
+                ClipGenerationJob.project_id == project_id,
+                ClipGenerationJob.dataset_id == dataset_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def create(
+        self,
+        *,
+        project_id: UUID,
+        dataset_id: UUID,
+        requested_by_user_id: UUID,
+        clip_length: float,
+        overlap: float,
+        start_time: float,
+        end_time: float | None,
+    ) -> ClipGenerationJob:
+        """Record a queued clip generation job.
+
+        Args:
+            project_id: Project's UUID
+            dataset_id: Dataset to generate clips for
+            requested_by_user_id: Requesting user's UUID
+            clip_length: Length of each clip in seconds
+            overlap: Overlap between clips in seconds
+            start_time: Offset of the first clip in each recording
+            end_time: Offset after which no clip ends (None = end of recording)
+
+        Returns:
+            Created ClipGenerationJob instance
+        """
+        job = ClipGenerationJob(
+            id=uuid4(),
+            project_id=project_id,
+            dataset_id=dataset_id,
+            requested_by_user_id=requested_by_user_id,
+            clip_length=clip_length,
+            overlap=overlap,
+            start_time=start_time,
+            end_time=end_time,
+            status="queued",
+            recordings_processed=0,
+            clips_created=0,
+            started_at=datetime.now(UTC),
+        )
+        self.db.add(job)
+        await self.db.flush()
+        return job
@@ -188,6 +188,9 @@ class DatasetRepository(BaseRepository[Dataset]):
     ) -> None:
         """Update dataset import status.
 
+        A dataset queued for deletion keeps ``DELETING``: an import that was
+        already running when the delete came in must not resurrect it.
+
         Args:
             dataset_id: Dataset's UUID
             status: New status
@@ -198,6 +201,8 @@ class DatasetRepository(BaseRepository[Dataset]):
         dataset = await self.get_by_id(dataset_id)
         if dataset is None:
             raise ValueError(f"Dataset {dataset_id} not found")
+        if dataset.status == DatasetStatus.DELETING:
+            return
         dataset.status = status
         if total_files is not None:
             dataset.total_files = total_files
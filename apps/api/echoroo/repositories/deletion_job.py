@@ -0,0 +1,90 @@
+"""DeletionJob repository for database operations."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Literal
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+
+from echoroo.models.deletion_job import DeletionJob
+from echoroo.repositories.base import BaseRepository
+
+#: Job states in which the entity is still waiting to be deleted.
+ACTIVE_DELETION_STATUSES: tuple[str, ...] = ("queued", "running")
+
+
+class DeletionJobRepository(BaseRepository[DeletionJob]):
+    """Repository for DeletionJob entity operations."""
+
+    model = DeletionJob
+
+    async def get_by_id(self, job_id: UUID) -> DeletionJob | None:
+        """Get deletion job by ID.
+
+        Args:
+            job_id: DeletionJob's UUID
+
+        Returns:
+            DeletionJob instance or None if not found
+        """
+        result = await self.db.execute(select(DeletionJob).where(DeletionJob.id == job_id))
+        return result.scalar_one_or_none()
+
+    async def get_latest_for_entity(
+        self, entity_type: Literal["dataset", "project"], entity_id: UUID
+    ) -> DeletionJob | None:
+        """Get the most recent deletion job of a dataset or project.
+
+        Args:
+            entity_type: 'dataset' or 'project'
+            entity_id: Dataset's or project's UUID
+
+        Returns:
+            Newest DeletionJob instance or None if the entity never had one
+        """
+        result = await self.db.execute(
+            select(DeletionJob)
+            .where(
+                DeletionJob.entity_type == entity_type,
+                DeletionJob.entity_id == entity_id,
+            )
+            .order_by(DeletionJob.started_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def create(
+        self,
+        *,
+        entity_type: Literal["dataset", "project"],
+        entity_id: UUID,
+        project_id: UUID,
+        requested_by_user_id: UUID,
+    ) -> DeletionJob:
+        """Record a queued deletion job.
+
+        Args:
+            entity_type: 'dataset' or 'project'
+            entity_id: Dataset's or project's UUID
+            project_id: Owning project's UUID
+            requested_by_user_id: Requesting user's UUID
+
+        Returns:
+            Created DeletionJob instance
+        """
+        job = DeletionJob(
+            id=uuid4(),
+            entity_type=entity_type,
+            entity_id=entity_id,
+            project_id=project_id,
+            requested_by_user_id=requested_by_user_id,
+            status="queued",
+            rows_deleted=0,
+            objects_deleted=0,
+            started_at=datetime.now(UTC),
+        )
+        self.db.add(job)
+        await self.db.flush()
+        return job
@@ -152,7 +152,7 @@ class EvaluationResultRepository(BaseRepository[EvaluationResult]):
 
         Each row dict may contain the keys: ``model_ref`` (dict),
         ``taxon_id`` (UUID | None), ``tp_precision``, ``fp``, ``tp_recall``,
-        ``fn``, ``precision``, ``recall``, ``f1``.
+        ``fn``, ``precision``, ``recall``, ``f1``, ``pr_curve``.
 
         Args:
             evaluation_run_id: Parent run.
@@ -173,6 +173,7 @@ class EvaluationResultRepository(BaseRepository[EvaluationResult]):
                 precision=float(row.get("precision", 0.0)),
                 recall=float(row.get("recall", 0.0)),
                 f1=float(row.get("f1", 0.0)),
+                pr_curve=row.get("pr_curve"),
             )
             for row in rows
         ]
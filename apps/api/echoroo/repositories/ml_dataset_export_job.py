@@ -0,0 +1,68 @@
+"""MlDatasetExportJob repository for database operations."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+
+from echoroo.models.ml_dataset_export_job import MlDatasetExportJob
+from echoroo.repositories.base import BaseRepository
+
+
+class MlDatasetExportJobRepository(BaseRepository[MlDatasetExportJob]):
+    """Repository for MlDatasetExportJob entity operations."""
+
+    model = MlDatasetExportJob
+
+    async def get_for_project(self, project_id: UUID, job_id: UUID) -> MlDatasetExportJob | None:
+        """Get an export job of a project by ID.
+
+        Args:
+            project_id: Project's UUID
+            job_id: MlDatasetExportJob's UUID
+
+        Returns:
+            MlDatasetExportJob instance or None if not found in the project
+        """
+        result = await self.db.execute(
+            select(MlDatasetExportJob).where(
+                MlDatasetExportJob.id == job_id,
+                MlDatasetExportJob.project_id == project_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def create(
+        self,
+        *,
+        project_id: UUID,
+        dataset_id: UUID | None,
+        detection_run_id: UUID | None,
+        requested_by_user_id: UUID,
+    ) -> MlDatasetExportJob:
+        """Record a queued export job.
+
+        Args:
+            project_id: Exported project's UUID
+            dataset_id: Optional dataset filter
+            detection_run_id: Optional detection run filter
+            requested_by_user_id: Requesting user's UUID
+
+        Returns:
+            Created MlDatasetExportJob instance
+        """
+        job = MlDatasetExportJob(
+            id=uuid4(),
+            project_id=project_id,
+            dataset_id=dataset_id,
+            detection_run_id=detection_run_id,
+            requested_by_user_id=requested_by_user_id,
+            status="queued",
+            entries_written=0,
+            started_at=datetime.now(UTC),
+        )
+        self.db.add(job)
+        await self.db.flush()
+        return job
@@ -6,7 +6,14 @@ from uuid import UUID
 from sqlalchemy import case, func, select
 from sqlalchemy.orm import selectinload
 
-from echoroo.core.pagination import MAX_PAGE_SIZE
+from echoroo.core.pagination import (
+    MAX_PAGE_SIZE,
+    Cursor,
+    TotalMode,
+    count_total,
+    keyset_after,
+    keyset_order_by,
+)
 from echoroo.models.enums import DatetimeParseStatus
 from echoroo.models.recording import Recording
 from echoroo.repositories.base import BaseRepository
@@ -112,12 +119,14 @@ class RecordingRepository(BaseRepository[Recording]):
         samplerate: int | None = None,
         sort_by: str = "datetime",
         sort_order: str = "desc",
+        cursor: Cursor | None = None,
+        total_mode: TotalMode = "exact",
     ) -> tuple[list[Recording], int]:
         """List recordings for a dataset with pagination and filters.
 
         Args:
             dataset_id: Dataset's UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); ignored when ``cursor`` is given
             page_size: Items per page
             search: Search in filename
             datetime_from: Filter from datetime
@@ -125,6 +134,8 @@ class RecordingRepository(BaseRepository[Recording]):
             samplerate: Filter by samplerate
             sort_by: Sort column name
             sort_order: Sort order (asc/desc)
+            cursor: Keyset position to resume after
+            total_mode: ``"exact"`` or ``"estimate"`` total
 
         Returns:
             Tuple of (list of recordings, total count)
@@ -142,22 +153,22 @@ class RecordingRepository(BaseRepository[Recording]):
             query = query.where(Recording.samplerate == samplerate)
 
         # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self.db.execute(count_query)
-        total: int = count_result.scalar_one()
+        total = await count_total(self.db, query, total_mode)
 
-        # Apply sorting
+        # Apply sorting; id breaks ties so pages never overlap.
         sort_column = getattr(Recording, sort_by, Recording.datetime)
-        if sort_order == "asc":
-            query = query.order_by(sort_column.asc())
-        else:
-            query = query.order_by(sort_column.desc())
+        query = query.order_by(
+            *keyset_order_by(sort_column, Recording.id, descending=sort_order != "asc")
+        )
 
         # Apply pagination. Clamp the client-controlled page_size to
         # MAX_PAGE_SIZE so a caller cannot force an unbounded SQL query.
         page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
-        offset = (max(page, 1) - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        if cursor is not None:
+            query = query.where(keyset_after(sort_column, Recording.id, cursor))
+        else:
+            query = query.offset((max(page, 1) - 1) * page_size)
+        query = query.limit(page_size)
 
         result = await self.db.execute(query)
         recordings = list(result.scalars().all())
@@ -174,18 +185,22 @@ class RecordingRepository(BaseRepository[Recording]):
         dataset_id: UUID | None = None,
         datetime_from: datetime | None = None,
         datetime_to: datetime | None = None,
+        cursor: Cursor | None = None,
+        total_mode: TotalMode = "exact",
     ) -> tuple[list[Recording], int]:
-        """Search recordings across all datasets in a project.
+        """Search recordings across all datasets in a project, newest first.
 
         Args:
             project_id: Project's UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); ignored when ``cursor`` is given
             page_size: Items per page
             search: Search in filename
             site_id: Filter by site ID
             dataset_id: Filter by dataset ID
             datetime_from: Filter from datetime
             datetime_to: Filter to datetime
+            cursor: Keyset position (``datetime`` descending) to resume after
+            total_mode: ``"exact"`` or ``"estimate"`` total
 
         Returns:
             Tuple of (list of recordings, total count)
@@ -211,15 +226,19 @@ class RecordingRepository(BaseRepository[Recording]):
             query = query.where(Recording.datetime <= datetime_to)
 
         # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self.db.execute(count_query)
-        total: int = count_result.scalar_one()
+        total = await count_total(self.db, query, total_mode)
 
         # Apply pagination. Clamp the client-controlled page_size to
         # MAX_PAGE_SIZE so a caller cannot force an unbounded SQL query.
         page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
-        offset = (max(page, 1) - 1) * page_size
-        query = query.order_by(Recording.datetime.desc()).offset(offset).limit(page_size)
+        query = query.order_by(
+            *keyset_order_by(Recording.datetime, Recording.id, descending=True)
+        )
+        if cursor is not None:
+            query = query.where(keyset_after(Recording.datetime, Recording.id, cursor))
+        else:
+            query = query.offset((max(page, 1) - 1) * page_size)
+        query = query.limit(page_size)
 
         result = await self.db.execute(query)
         recordings = list(result.scalars().all())
@@ -281,6 +300,30 @@ class RecordingRepository(BaseRepository[Recording]):
         )
         return result.scalar_one()
 
+    async def list_durations_by_dataset(
+        self, dataset_id: UUID, after_id: UUID | None = None, limit: int = 1000
+    ) -> list[tuple[UUID, float]]:
+        """List ``(id, duration)`` of a dataset's recordings in id order.
+
+        Selects only the two columns, so bulk jobs can walk a large dataset
+        in keyset pages without loading recording entities.
+
+        Args:
+            dataset_id: Dataset's UUID
+            after_id: Return recordings with an id greater than this one
+            limit: Maximum number of rows
+
+        Returns:
+            List of (recording id, duration in seconds)
+        """
+        query = select(Recording.id, Recording.duration).where(
+            Recording.dataset_id == dataset_id
+        )
+        if after_id is not None:
+            query = query.where(Recording.id > after_id)
+        result = await self.db.execute(query.order_by(Recording.id).limit(limit))
+        return [(row.id, row.duration) for row in result.all()]
+
     async def get_total_duration_by_dataset(self, dataset_id: UUID) -> float:
         """Get total duration of recordings in a dataset.
 
@@ -5,13 +5,18 @@ from __future__ import annotations
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import case, func, select, union_all
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
 from sqlalchemy.sql.elements import ColumnElement
 
+from echoroo.core.text import fold_for_search
+from echoroo.models.recording import Recording
+from echoroo.models.recording_annotation import RecordingAnnotation
+from echoroo.models.tag import Tag
 from echoroo.models.taxon import Taxon
 from echoroo.models.taxon_vernacular_name import TaxonVernacularName
+from echoroo.repositories import taxon_name_index
 from echoroo.repositories.base import BaseRepository
 
 # GBIF/ISO 639-3 → ISO 639-1 normalization for incoming vernacular locales.
@@ -54,6 +59,33 @@ def normalize_locale(locale: str) -> str:
     return _LOCALE_NORMALIZE.get(primary, primary)
 
 
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_match(column: InstrumentedAttribute[str], folded: str) -> ColumnElement[bool]:
+    """Match a ``search_name`` column against a folded query.
+
+    A case-sensitive ``LIKE`` on the folded column (rather than ``ILIKE`` on
+    the raw name) is what the ``gin_trgm_ops`` index serves. Queries shorter
+    than three characters yield no trigram, so the planner scans instead;
+    the in-process snapshot answers them whenever the tables are small
+    enough.
+    """
+    return column.like(f"%{_like_escape(folded)}%", escape="\\")
+
+
+def _search_rank(column: InstrumentedAttribute[str], folded: str) -> ColumnElement[int]:
+    """SQL form of :func:`echoroo.repositories.taxon_name_index.rank_name`."""
+    escaped = _like_escape(folded)
+    return case(
+        (column == folded, 0),
+        (column.like(f"{escaped}%", escape="\\"), 1),
+        (column.like(f"% {escaped}%", escape="\\"), 2),
+        else_=3,
+    )
+
+
 class TaxonRepository(BaseRepository[Taxon]):
     """Repository for Taxon entity operations."""
 
@@ -190,6 +222,29 @@ class TaxonRepository(BaseRepository[Taxon]):
         )
         return list(result.scalars().all())
 
+    async def get_unresolved_for_dataset(self, dataset_id: UUID) -> list[Taxon]:
+        """Get taxa without GBIF resolution that a dataset's detections use.
+
+        A taxon qualifies when at least one annotation on a recording of the
+        dataset carries a tag linked to it, so each taxon appears once no
+        matter how many detections reference it.
+        """
+        used_in_dataset = (
+            select(RecordingAnnotation.id)
+            .join(Tag, Tag.id == RecordingAnnotation.tag_id)
+            .join(Recording, Recording.id == RecordingAnnotation.recording_id)
+            .where(Tag.taxon_id == Taxon.id, Recording.dataset_id == dataset_id)
+            .exists()
+        )
+        result = await self.db.execute(
+            select(Taxon)
+            .where(Taxon.gbif_resolved_at.is_(None))
+            .where(Taxon.is_non_biological.is_(False))
+            .where(used_in_dataset)
+            .order_by(Taxon.created_at.asc())
+        )
+        return list(result.scalars().all())
+
     async def list_taxa(
         self,
         search: str | None = None,
@@ -199,9 +254,9 @@ class TaxonRepository(BaseRepository[Taxon]):
     ) -> tuple[list[Taxon], int]:
         """List taxa with optional filtering and pagination."""
         conditions: list[ColumnElement[Any]] = []
-        if search:
-            pattern = f"%{search}%"
-            conditions.append(Taxon.scientific_name.ilike(pattern))
+        folded = fold_for_search(search) if search else ""
+        if folded:
+            conditions.append(_search_match(Taxon.search_name, folded))
         if is_non_biological is not None:
             conditions.append(Taxon.is_non_biological == is_non_biological)
 
@@ -231,42 +286,65 @@ class TaxonRepository(BaseRepository[Taxon]):
         """Search taxa by scientific name or vernacular name.
 
         Matching is locale-agnostic: a taxon matches when its scientific name
-        OR any of its vernacular names (in any locale) ILIKE the query. This
-        keeps English-name searches working even when the UI requests a
+        OR any of its vernacular names (in any locale) contains the query.
+        This keeps English-name searches working even when the UI requests a
         non-English display locale; the display name resolution is handled
         separately by the service layer.
 
+        Names and query are compared in their
+        :func:`~echoroo.core.text.fold_for_search` form, so case, full/half
+        width, Latin diacritics and katakana vs. hiragana do not matter.
+        Each taxon is ranked by its best-matching name (exact, prefix, word
+        prefix, substring), then by shorter scientific name.
+
+        The in-process :mod:`~echoroo.repositories.taxon_name_index`
+        answers the ranking when the tables are small enough to snapshot;
+        otherwise the trigram-indexed ``search_name`` columns do.
+
         Returns the list of matching ``Taxon`` rows.
         """
-        pattern = f"%{query}%"
-
-        # Correlated EXISTS for vernacular name matches across ALL locales so
-        # that, for example, an English-name search still surfaces the taxon
-        # under a ``ja`` UI. EXISTS (rather than a JOIN) guarantees each taxon
-        # is counted at most once even when several of its vernacular rows
-        # (e.g. both a ``ja`` and an ``en`` row, or multiple sources) match the
-        # query, so the ``limit`` counts distinct taxa instead of being
-        # consumed by duplicate rows. The matched vernacular row itself is
-        # intentionally not returned here — the display name is resolved by the
-        # service using the requested locale (with ja→en fallback).
-        vn_exists = (
-            select(TaxonVernacularName.id)
-            .where(
-                TaxonVernacularName.taxon_id == Taxon.id,
-                TaxonVernacularName.name.ilike(pattern),
-            )
-            .exists()
+        folded = fold_for_search(query)
+        if not folded:
+            return []
+
+        taxon_ids = await taxon_name_index.lookup(self.db, folded, limit)
+        if taxon_ids is not None:
+            if not taxon_ids:
+                return []
+            result = await self.db.execute(select(Taxon).where(Taxon.id.in_(taxon_ids)))
+            by_id = {taxon.id: taxon for taxon in result.scalars().all()}
+            return [by_id[taxon_id] for taxon_id in taxon_ids if taxon_id in by_id]
+
+        # Best rank per taxon over its scientific name and ALL vernacular
+        # names. Grouping by taxon (rather than joining) counts each taxon
+        # once however many of its names match, so ``limit`` counts distinct
+        # taxa. The matched vernacular row itself is intentionally not
+        # returned here — the display name is resolved by the service using
+        # the requested locale (with ja→en fallback).
+        matches = union_all(
+            select(
+                Taxon.id.label("taxon_id"),
+                _search_rank(Taxon.search_name, folded).label("rank"),
+            ).where(_search_match(Taxon.search_name, folded)),
+            select(
+                TaxonVernacularName.taxon_id,
+                _search_rank(TaxonVernacularName.search_name, folded),
+            ).where(_search_match(TaxonVernacularName.search_name, folded)),
+        ).subquery()
+        best = (
+            select(matches.c.taxon_id, func.min(matches.c.rank).label("rank"))
+            .group_by(matches.c.taxon_id)
+            .subquery()
         )
 
         result = await self.db.execute(
             select(Taxon)
-            .where(
-                or_(
-                    Taxon.scientific_name.ilike(pattern),
-                    vn_exists,
-                )
+            .join(best, best.c.taxon_id == Taxon.id)
+            .order_by(
+                best.c.rank,
+                func.length(Taxon.scientific_name),
+                Taxon.scientific_name.asc(),
             )
-            .order_by(Taxon.scientific_name.asc())
             .limit(limit)
         )
         return list(result.scalars().all())
@@ -295,6 +373,7 @@ class TaxonRepository(BaseRepository[Taxon]):
         existing = result.scalar_one_or_none()
         if existing is not None:
             existing.name = name
+            existing.search_name = fold_for_search(name)[:_VERNACULAR_NAME_MAX]
             existing.is_primary = is_primary
             await self.db.flush()
             return existing
@@ -407,6 +486,7 @@ class TaxonRepository(BaseRepository[Taxon]):
                     # the dedup set never reports a name that no longer exists.
                     by_name.discard((locale, conflict.name))
                     conflict.name = name
+                    conflict.search_name = fold_for_search(name)[:_VERNACULAR_NAME_MAX]
                     by_name.add((locale, name))
                 continue
 
@@ -0,0 +1,181 @@
+"""In-process prefix index over taxon search names.
+
+The species picker queries :meth:`TaxonRepository.search` on every
+keystroke, and the taxa it searches are dominated by the BirdNET label set:
+a few thousand species with their English and Japanese names. This module
+keeps a process-local snapshot of every ``search_name`` (scientific and
+vernacular) in a sorted list, so a query is answered with a bisect for
+the prefix matches plus, when those do not fill the page, one in-memory
+substring scan of the remaining names. The database is then
+only asked for the matched rows by primary key.
+
+The snapshot ranks exactly like the SQL path of
+:meth:`~echoroo.repositories.taxon.TaxonRepository.search` and is only a
+cache of it:
+
+- It is rebuilt after ``_INDEX_TTL_SECONDS``, and this process drops it
+  whenever a transaction that wrote taxa or vernacular names commits. ORM
+  flushes are detected automatically; Core inserts call
+  :func:`invalidate_on_commit`. Taxa created by another process can
+  therefore take up to the TTL to appear.
+- A session with uncommitted taxon writes bypasses the snapshot, so it
+  sees its own rows and never snapshots rows that may be rolled back.
+- Tables larger than ``_INDEX_MAX_NAMES`` names are not snapshotted; the
+  trigram-indexed SQL path serves them instead.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import chain
+from uuid import UUID
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from echoroo.models.taxon import Taxon
+from echoroo.models.taxon_vernacular_name import TaxonVernacularName
+
+_INDEX_TTL_SECONDS = 300.0
+_INDEX_MAX_NAMES = 50_000
+_DIRTY_KEY = "taxon_name_index_dirty"
+
+
+def rank_name(name: str, folded: str) -> int | None:
+    """Rank how ``name`` matches the folded query; ``None`` if it does not.
+
+    0 = exact, 1 = name prefix, 2 = word prefix, 3 = other substring.
+    """
+    if name.startswith(folded):
+        return 0 if name == folded else 1
+    if folded not in name:
+        return None
+    return 2 if f" {folded}" in name else 3
+
+
+class TaxonNameIndex:
+    """Sorted snapshot of ``(search_name, taxon_id)`` pairs."""
+
+    def __init__(
+        self,
+        names: Iterable[tuple[str, UUID]],
+        scientific_names: dict[UUID, str],
+    ) -> None:
+        self._entries = sorted(names)
+        self._keys = [name for name, _taxon_id in self._entries]
+        self._scientific_names = scientific_names
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, folded: str, limit: int) -> list[UUID]:
+        """Return up to ``limit`` taxon ids matching ``folded``, best first."""
+        best: dict[UUID, int] = {}
+        start = end = bisect_left(self._keys, folded)
+        while end < len(self._entries) and self._keys[end].startswith(folded):
+            name, taxon_id = self._entries[end]
+            best[taxon_id] = min(best.get(taxon_id, 1), 0 if name == folded else 1)
+            end += 1
+        # Prefix matches outrank every other substring match, so the scan
+        # is only needed when they do not fill ``limit``; it skips them.
+        if len(best) < limit:
+            for position in chain(range(start), range(end, len(self._entries))):
+                name, taxon_id = self._entries[position]
+                if best.get(taxon_id, 4) > 1 and folded in name:
+                    rank = rank_name(name, folded)
+                    if rank is not None:
+                        best[taxon_id] = min(best.get(taxon_id, rank), rank)
+
+        def order(taxon_id: UUID) -> tuple[int, int, str]:
+            scientific_name = self._scientific_names.get(taxon_id, "")
+            return best[taxon_id], len(scientific_name), scientific_name
+
+        return sorted(best, key=order)[:limit]
+
+
+@dataclass
+class _Snapshot:
+    index: TaxonNameIndex | None
+    loaded_at: float
+
+
+_snapshot: _Snapshot | None = None
+
+
+def invalidate() -> None:
+    """Drop this process's snapshot; the next search rebuilds it."""
+    global _snapshot
+    _snapshot = None
+
+
+def invalidate_on_commit(db: AsyncSession) -> None:
+    """Drop the snapshot once ``db``'s current transaction commits.
+
+    Needed after Core inserts into the taxon tables; ORM writes are picked
+    up by the flush hook below. Dropping it right away would let a
+    concurrent search rebuild the snapshot from the committed state,
+    missing the pending rows until the TTL expires.
+    """
+    db.sync_session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _note_taxon_writes(session: Session, _flush_context: object) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Taxon | TaxonVernacularName):
+            session.info[_DIRTY_KEY] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    # Also fired when a SAVEPOINT is released; only the outermost commit
+    # makes the rows visible to other sessions.
+    if session.in_nested_transaction():
+        return
+    if session.info.pop(_DIRTY_KEY, False):
+        invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_writes(session: Session) -> None:
+    if not session.in_nested_transaction():
+        session.info.pop(_DIRTY_KEY, None)
+
+
+async def _load(db: AsyncSession) -> TaxonNameIndex | None:
+    total = (await db.execute(select(func.count()).select_from(Taxon))).scalar_one()
+    total += (
+        await db.execute(select(func.count()).select_from(TaxonVernacularName))
+    ).scalar_one()
+    if total > _INDEX_MAX_NAMES:
+        return None
+    taxa = (await db.execute(select(Taxon.id, Taxon.search_name, Taxon.scientific_name))).all()
+    vernaculars = (
+        await db.execute(select(TaxonVernacularName.search_name, TaxonVernacularName.taxon_id))
+    ).all()
+    names = [(search_name, taxon_id) for taxon_id, search_name, _ in taxa]
+    names.extend((search_name, taxon_id) for search_name, taxon_id in vernaculars)
+    return TaxonNameIndex(names, {taxon_id: name for taxon_id, _, name in taxa})
+
+
+async def lookup(db: AsyncSession, folded: str, limit: int) -> list[UUID] | None:
+    """Search the snapshot, (re)building it when missing or expired.
+
+    Returns ``None`` when the tables are too large to snapshot, or when
+    ``db`` holds uncommitted taxon writes; the caller then runs the SQL
+    search.
+    """
+    global _snapshot
+    if db.sync_session.info.get(_DIRTY_KEY):
+        return None
+    now = time.monotonic()
+    if _snapshot is None or now - _snapshot.loaded_at >= _INDEX_TTL_SECONDS:
+        _snapshot = _Snapshot(index=await _load(db), loaded_at=now)
+    if _snapshot.index is None:
+        return None
+    return _snapshot.index.search(folded, limit)
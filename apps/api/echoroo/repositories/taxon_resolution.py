@@ -0,0 +1,92 @@
+"""TaxonResolution repository for database operations."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from echoroo.models.taxon_resolution import TaxonResolution
+from echoroo.repositories.base import BaseRepository
+
+# Names per ``IN`` list / multi-row ``INSERT``; keeps each statement well
+# under asyncpg's 32767 bind-parameter ceiling.
+_CHUNK_SIZE = 1000
+
+
+class TaxonResolutionRepository(BaseRepository[TaxonResolution]):
+    """Repository for the taxon-resolution cache."""
+
+    model = TaxonResolution
+
+    async def get_fresh(
+        self, name_keys: Collection[str], now: datetime
+    ) -> dict[str, TaxonResolution]:
+        """Get the unexpired cache rows of the given normalized names.
+
+        Args:
+            name_keys: Normalized names to look up
+            now: Reference instant; rows expiring at or before it are ignored
+
+        Returns:
+            Mapping of name key to cache row, for the names that have one
+        """
+        keys = sorted(set(name_keys))
+        found: dict[str, TaxonResolution] = {}
+        for start in range(0, len(keys), _CHUNK_SIZE):
+            result = await self.db.execute(
+                select(TaxonResolution)
+                .where(
+                    TaxonResolution.name_key.in_(keys[start : start + _CHUNK_SIZE]),
+                    TaxonResolution.expires_at > now,
+                )
+                # Rows may have been rewritten by a Core upsert/update since
+                # they were last loaded into this session.
+                .execution_options(populate_existing=True)
+            )
+            for row in result.scalars():
+                found[row.name_key] = row
+        return found
+
+    async def upsert(self, rows: Sequence[dict[str, Any]]) -> None:
+        """Insert or replace cache rows keyed by ``name_key``.
+
+        A replaced row loses its cached vernacular names unless the new
+        values carry them, so a re-resolved name never keeps names of a
+        previous GBIF key.
+
+        Args:
+            rows: Column values of each row; every row must set the same keys
+        """
+        for start in range(0, len(rows), _CHUNK_SIZE):
+            statement = pg_insert(TaxonResolution).values(
+                list(rows[start : start + _CHUNK_SIZE])
+            )
+            await self.db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[TaxonResolution.name_key],
+                    set_={
+                        column: statement.excluded[column]
+                        for column in rows[start]
+                        if column != "name_key"
+                    },
+                )
+            )
+
+    async def set_vernacular_names(
+        self, name_key: str, vernacular_names: dict[str, list[str]]
+    ) -> None:
+        """Store the vernacular names fetched for a cached match.
+
+        Args:
+            name_key: Normalized name of the cache row
+            vernacular_names: GBIF vernacular names grouped by locale
+        """
+        await self.db.execute(
+            update(TaxonResolution)
+            .where(TaxonResolution.name_key == name_key)
+            .values(vernacular_names=vernacular_names)
+        )
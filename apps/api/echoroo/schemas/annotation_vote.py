@@ -162,3 +162,9 @@ class DetectionVoteCounts(BaseModel):
     user_signal_quality: SignalQuality | None = Field(None)
     signal_quality_counts: dict[str, int] = Field(default_factory=dict)
     consensus_status: ConsensusStatus = Field(ConsensusStatus.NEEDS_VOTES)
+    consensus_score: float | None = Field(
+        None,
+        ge=0,
+        le=1,
+        description="agree / (agree + disagree); null while there is no decisive vote",
+    )
@@ -0,0 +1,33 @@
+"""Dataset clip generation job response schema."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ClipGenerationJobResponse(BaseModel):
+    """Background clip generation over a dataset and its progress.
+
+    ``clips_created`` counts only new clips; windows the dataset already
+    had are skipped, so re-running a job is safe.
+    """
+
+    id: UUID
+    project_id: UUID
+    dataset_id: UUID
+    clip_length: float
+    overlap: float
+    start_time: float
+    end_time: float | None
+    status: Literal["queued", "running", "success", "failure"]
+    recordings_processed: int
+    clips_created: int
+    started_at: datetime
+    finished_at: datetime | None
+    error_detail: str | None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,27 @@
+"""Deletion job response schema."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class DeletionJobResponse(BaseModel):
+    """Background dataset / project deletion and its progress."""
+
+    id: UUID
+    entity_type: Literal["dataset", "project"]
+    entity_id: UUID
+    project_id: UUID
+    status: Literal["queued", "running", "success", "failure"]
+    stage: str | None
+    rows_deleted: int
+    objects_deleted: int
+    started_at: datetime
+    finished_at: datetime | None
+    error_detail: str | None
+
+    model_config = {"from_attributes": True}
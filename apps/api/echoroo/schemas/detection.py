@@ -79,6 +79,14 @@ class DetectionListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as ``cursor`` to fetch the next page; null on the last page",
+    )
+    total_is_estimate: bool = Field(
+        default=False,
+        description="True when ``total`` is a planner estimate (total_mode=estimate)",
+    )
 
 
 class SpeciesSummaryItem(BaseModel):
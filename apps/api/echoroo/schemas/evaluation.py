@@ -97,6 +97,18 @@ class EvaluationRunListResponse(BaseModel):
     total: int
 
 
+class PRCurvePoint(BaseModel):
+    """Precision and recall when keeping detections scoring >= ``threshold``.
+
+    ``threshold`` is None on the final point when some detections carry no
+    confidence score (they are only kept there).
+    """
+
+    threshold: float | None = None
+    precision: float
+    recall: float
+
+
 class EvaluationResultResponse(BaseModel):
     """One per-species (or overall, when ``taxon_id`` is None) result row.
 
@@ -114,6 +126,7 @@ class EvaluationResultResponse(BaseModel):
     precision: float
     recall: float
     f1: float
+    pr_curve: list[PRCurvePoint] | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -156,6 +169,10 @@ class OverallMetric(BaseModel):
     f1: float
     detections_total: int
     ground_truths_total: int
+    pr_curve: list[PRCurvePoint] = Field(
+        default_factory=list,
+        description="Precision / recall by descending confidence threshold",
+    )
 
 
 class ModelEvaluationSummary(BaseModel):
@@ -199,6 +216,7 @@ __all__ = [
     "EvaluationRunCreate",
     "EvaluationRunResponse",
     "EvaluationRunListResponse",
+    "PRCurvePoint",
     "EvaluationResultResponse",
     "SpeciesMetric",
     "OverallMetric",
@@ -0,0 +1,31 @@
+"""ML-dataset export job response schema."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class MlDatasetExportJobResponse(BaseModel):
+    """Background ML-dataset ZIP export and its progress.
+
+    ``download_url`` is a short-lived presigned GET URL of the ZIP, set
+    only once the job has succeeded.
+    """
+
+    id: UUID
+    project_id: UUID
+    dataset_id: UUID | None
+    detection_run_id: UUID | None
+    status: Literal["queued", "running", "success", "failure"]
+    entries_written: int
+    size_bytes: int | None
+    started_at: datetime
+    finished_at: datetime | None
+    error_detail: str | None
+    download_url: str | None = None
+
+    model_config = {"from_attributes": True}
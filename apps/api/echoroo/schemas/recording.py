@@ -84,6 +84,14 @@ class RecordingListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as ``cursor`` to fetch the next page; null on the last page",
+    )
+    total_is_estimate: bool = Field(
+        default=False,
+        description="True when ``total`` is a planner estimate (total_mode=estimate)",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -185,6 +193,14 @@ class PublicRecordingListResponse(BaseModel):
     total: int = Field(..., ge=0)
     page: int = Field(..., ge=1)
     limit: int = Field(..., ge=1)
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as ``cursor`` to fetch the next page; null on the last page",
+    )
+    total_is_estimate: bool = Field(
+        default=False,
+        description="True when ``total`` is a planner estimate (total_mode=estimate)",
+    )
 
 
 class SpectrogramParams(BaseModel):
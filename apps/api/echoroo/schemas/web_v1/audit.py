@@ -9,7 +9,7 @@ action registrations, and the fail-closed ``MetaAuditWriteError``.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -43,16 +43,36 @@ class AuditLogListResponse(BaseModel):
     page: int
 
 
-class ChainVerifyResponse(BaseModel):
-    model_config = ConfigDict(frozen=True)
+class ChainVerificationResponse(BaseModel):
+    """One background chain verification run and its progress."""
+
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
-    is_valid: bool
-    verified_row_count: int
+    id: UUID
+    target: Literal["project", "platform"]
+    status: Literal["queued", "running", "success", "failure"]
+    started_at: datetime
+    finished_at: datetime | None = None
+    resumed_from_id: UUID | None = None
+    rows_total: int | None = None
+    rows_verified: int = 0
+    is_valid: bool | None = None
     first_mismatch_row_id: UUID | None = None
+    error_detail: str | None = None
+    checkpoint_row_id: UUID | None = None
+    checkpoint_created_at: datetime | None = None
+    checkpoint_row_count: int | None = None
+
+
+class ChainVerificationListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    items: list[ChainVerificationResponse]
 
 
 __all__ = [
     "AuditLogEntryResponse",
     "AuditLogListResponse",
-    "ChainVerifyResponse",
+    "ChainVerificationListResponse",
+    "ChainVerificationResponse",
 ]
@@ -16,9 +16,15 @@ from echoroo.core.auth import MediaTokenScope
 
 
 class MediaTokenRequest(BaseModel):
-    """Request body for issuing a scoped recording media token."""
+    """Request body for issuing a scoped recording media token.
+
+    ``prefetch`` lets the review UI warm the server-side S3 audio cache for a
+    recording it is about to open (e.g. the next item in a review queue), so
+    the subsequent stream / spectrogram requests do not wait on a download.
+    """
 
     scope: MediaTokenScope
+    prefetch: bool = False
 
 
 class MediaTokenResponse(BaseModel):
@@ -49,7 +49,10 @@ from pathlib import Path
 
 from echoroo.core.database import AsyncSessionLocal
 from echoroo.models.enums import TaxonSensitivitySource
-from echoroo.services.taxon_sensitivity_service import upsert_taxon_sensitivity
+from echoroo.services.taxon_sensitivity_service import (
+    bump_sensitivity_version,
+    upsert_taxon_sensitivity,
+)
 
 logger = logging.getLogger("echoroo.scripts.seed_moe_rdb")
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
@@ -163,6 +166,7 @@ async def _seed_csv(csv_path: Path) -> dict[str, int]:
                 await session.rollback()
                 raise
 
+    await bump_sensitivity_version()
     return {"upserted": upserted, "skipped": skipped}
 
 
@@ -17,7 +17,8 @@ ZIP layout::
                             confirmed-empty negatives, with a ``clip_path``
                             pointing into ``clips/`` (empty when the clip could
                             not be extracted).
-    clips/<segment_id>.wav  16-bit PCM WAV slice of the segment audio.
+    clips/<segment_id>.wav  16-bit PCM slice of the segment audio (``.flac``
+                            when the export asks for FLAC clips).
 
 The CSV labels reuse :class:`AnnotationSetExportService` rather than
 duplicating the column logic, so the two exports stay consistent.
@@ -27,24 +28,46 @@ Concurrency / memory model
 The async path (:meth:`AnnotationSetDatasetExportService.prepare_plan`) does
 ALL database / ORM access up front and returns a plain, ORM-free
 :class:`DatasetExportPlan` (the rendered ``annotations.csv`` text plus a flat
-list of :class:`SegmentClipSpec`). The blocking work — S3 GET, libsndfile
-decode, WAV encode, DEFLATE — is then offloaded to a worker thread via
-:func:`asyncio.to_thread` (:func:`write_dataset_zip`), which NEVER touches the
-session and streams each clip straight into a temp file on disk so peak memory
-stays ``O(one clip)`` rather than ``O(whole dataset)``.
+list of :class:`SegmentClipSpec`). The blocking work is then offloaded to a
+worker thread (:func:`write_dataset_zip`), which NEVER touches the session and
+pipelines the export per recording:
+
+* up to :data:`EXPORT_WORKERS` recordings are localised and cut at once, and
+  the next few are prefetched into the S3 audio cache while they wait;
+* every segment of a recording is read from ONE open :class:`soundfile.SoundFile`
+  with sequential seeks (segments are sorted by start time), instead of
+  re-opening and re-probing the file per clip;
+* clips are encoded on the same worker threads — libsndfile and zlib release
+  the GIL, so decode / WAV or FLAC encode run in parallel without a process
+  pool or pickling sample arrays between processes;
+* the calling thread only appends clips to the ZIP, in plan order,
+  so the archive layout is deterministic. FLAC clips are already compressed
+  and are STORED; WAV clips get fast (level 1) DEFLATE.
+
+Workers hand clips to the writer through bounded per-recording channels, so
+at most ``CLIPS_IN_FLIGHT`` encoded clips per in-flight recording (and
+``2 * EXPORT_WORKERS`` recordings) are held in memory at once, however many
+segments a recording has; the archive itself is written straight to
+``out_path`` on disk.
 """
 
 from __future__ import annotations
 
+import contextlib
 import csv
 import io
 import logging
+import queue
+import threading
 import zipfile
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, cast
 from uuid import UUID
 
+import soundfile as sf
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -57,10 +80,27 @@ from echoroo.models.enums import AnnotationSegmentStatus
 from echoroo.services.annotation_set_export import AnnotationSetExportService
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
+
     from echoroo.services.audio import AudioService
 
 logger = logging.getLogger(__name__)
 
+ClipFormat = Literal["wav", "flac"]
+
+#: Recordings localised + cut concurrently by :func:`write_dataset_zip`.
+EXPORT_WORKERS = 4
+
+#: Encoded clips a cutting worker may hold for the ZIP writer per recording.
+CLIPS_IN_FLIGHT = 4
+
+# (libsndfile container, subtype, ZIP compression, ZIP compresslevel) per clip
+# format. FLAC is already entropy-coded, so DEFLATE would only burn CPU.
+_CLIP_ENCODINGS: dict[str, tuple[str, str, int, int | None]] = {
+    "wav": ("WAV", "PCM_16", zipfile.ZIP_DEFLATED, 1),
+    "flac": ("FLAC", "PCM_16", zipfile.ZIP_STORED, None),
+}
+
 # segments.csv manifest columns. ``clip_path`` is relative to the ZIP root and
 # is left blank when the clip failed to extract so negatives stay explicit and
 # missing-audio segments are unambiguous for model validation.
@@ -119,15 +159,21 @@ class DatasetExportPlan:
     segments: list[SegmentClipSpec] = field(default_factory=list)
 
 
+def _clip_member(segment_id: UUID, clip_format: ClipFormat) -> str:
+    """Return the ZIP member path of a segment's clip."""
+    return f"clips/{segment_id}.{clip_format}"
+
+
 def _render_segments_csv(
     segments: list[SegmentClipSpec],
     extracted: set[UUID],
+    clip_format: ClipFormat = "wav",
 ) -> str:
     """Render the per-segment manifest, exposing negatives + missing clips.
 
     ``clip_path`` is blank when the segment's clip is NOT in ``extracted``
-    (extraction failed); otherwise ``clips/<segment_id>.wav``. ``n_annotations``
-    is 0 for confirmed-empty negatives.
+    (extraction failed); otherwise ``clips/<segment_id>.<format>``.
+    ``n_annotations`` is 0 for confirmed-empty negatives.
     """
     buf = io.StringIO()
     writer = csv.DictWriter(buf, fieldnames=_SEGMENT_COLUMNS)
@@ -139,7 +185,7 @@ def _render_segments_csv(
                 "segment_id": str(spec.segment_id),
                 "recording_id": str(spec.recording_id),
                 "clip_path": (
-                    f"clips/{spec.segment_id}.wav" if has_clip else ""
+                    _clip_member(spec.segment_id, clip_format) if has_clip else ""
                 ),
                 "recording_start_sec": _format_float(spec.start_sec),
                 "recording_end_sec": _format_float(spec.end_sec),
@@ -152,24 +198,143 @@ def _render_segments_csv(
     return buf.getvalue()
 
 
+def _encode_clip(data: np.ndarray, samplerate: int, clip_format: ClipFormat) -> bytes:
+    """Encode one clip as 16-bit WAV or FLAC bytes."""
+    container, subtype, _, _ = _CLIP_ENCODINGS[clip_format]
+    buf = io.BytesIO()
+    sf.write(buf, data, samplerate, format=container, subtype=subtype)
+    return buf.getvalue()
+
+
+class _ExportAborted(Exception):
+    """Raised in a cutting worker once :func:`write_dataset_zip` has stopped."""
+
+
+class _ClipChannel:
+    """Bounded hand-off of one recording's clips from a worker to the writer.
+
+    Holds at most :data:`CLIPS_IN_FLIGHT` encoded clips, so a worker cutting
+    ahead of the ZIP writer blocks instead of buffering every segment of its
+    recording. :meth:`put` gives up once ``stop`` is set, so a writer that
+    fails never leaves workers blocked forever.
+    """
+
+    _DONE = object()
+
+    def __init__(self, stop: threading.Event) -> None:
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=CLIPS_IN_FLIGHT)
+        self._stop = stop
+
+    def put(self, segment_id: UUID, clip_bytes: bytes) -> None:
+        self._put((segment_id, clip_bytes))
+
+    def close(self) -> None:
+        self._put(self._DONE)
+
+    def _put(self, item: object) -> None:
+        while True:
+            if self._stop.is_set():
+                raise _ExportAborted
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self) -> Iterator[tuple[UUID, bytes]]:
+        while (item := self._queue.get()) is not self._DONE:
+            yield cast("tuple[UUID, bytes]", item)
+
+
+def _cut_recording(
+    audio_service: AudioService,
+    recording_path: str,
+    specs: list[SegmentClipSpec],
+    clip_format: ClipFormat,
+    channel: _ClipChannel,
+) -> None:
+    """Localise one recording and hand each encoded segment clip to ``channel``.
+
+    The file is opened once and read with forward seeks in start-time order.
+    A failure to localise or open the recording drops all of its clips; a
+    failure on one segment (e.g. a window past the end of the file) drops
+    only that clip. Both are logged, never raised. As with
+    :meth:`AudioService.read_audio`, a window that ends at or before its
+    start reads to the end of the file. ``channel`` is always closed, so the
+    writer never waits on a worker that died.
+    """
+    try:
+        _cut_into(audio_service, recording_path, specs, clip_format, channel)
+    finally:
+        channel.close()
+
+
+def _cut_into(
+    audio_service: AudioService,
+    recording_path: str,
+    specs: list[SegmentClipSpec],
+    clip_format: ClipFormat,
+    channel: _ClipChannel,
+) -> None:
+    """Body of :func:`_cut_recording`; the caller closes ``channel``."""
+    try:
+        local_path = audio_service.ensure_file_local(recording_path)
+        source = sf.SoundFile(str(local_path))
+    except Exception:  # noqa: BLE001 - missing source must not abort
+        logger.warning(
+            "Dataset export: could not localise recording path=%s; "
+            "skipping %d clip(s)",
+            recording_path,
+            len(specs),
+            exc_info=True,
+        )
+        return
+
+    with source:
+        samplerate = source.samplerate
+        for spec in sorted(specs, key=lambda s: s.start_sec):
+            try:
+                start_frame = int(spec.start_sec * samplerate)
+                frames = int(spec.end_sec * samplerate) - start_frame
+                source.seek(start_frame)
+                data = source.read(frames if frames > 0 else -1, dtype="float32")
+                if spec.channel is not None and data.ndim > 1:
+                    channel_index = spec.channel if spec.channel < data.shape[1] else 0
+                    data = data[:, channel_index]
+                clip_bytes = _encode_clip(data, samplerate, clip_format)
+            except Exception:  # noqa: BLE001 - one bad clip must not abort
+                logger.warning(
+                    "Dataset export: failed to extract clip for segment %s "
+                    "(recording=%s, %.3f-%.3f); leaving clip_path empty",
+                    spec.segment_id,
+                    spec.recording_id,
+                    spec.start_sec,
+                    spec.end_sec,
+                    exc_info=True,
+                )
+                continue
+            channel.put(spec.segment_id, clip_bytes)
+
+
 def write_dataset_zip(
     plan: DatasetExportPlan,
     audio_service: AudioService,
     out_path: str,
+    *,
+    clip_format: ClipFormat = "wav",
 ) -> None:
     """Assemble the dataset ZIP on disk from a plan (BLOCKING — run in a thread).
 
-    This is the heavy, synchronous half of the export: it performs the blocking
-    S3 GET (``ensure_file_local``), libsndfile decode (``read_audio``) and WAV
-    encode (``audio_to_wav_bytes``), then DEFLATE-compresses each clip straight
-    into ``out_path`` so peak memory stays ``O(one clip)``. It MUST NOT touch
-    the database session — every value it needs is already on ``plan``.
+    This is the heavy, synchronous half of the export: S3 GET
+    (``ensure_file_local``), libsndfile decode, WAV/FLAC encode and ZIP
+    compression, pipelined across recordings as described in the module
+    docstring. It MUST NOT touch the database session — every value it needs
+    is already on ``plan``.
 
-    The source recording is localised ONCE per distinct ``recording_path``
-    (clips that share a recording reuse the cached file). A per-clip failure
-    (missing source / decode error) is logged and swallowed so a single bad
-    segment never aborts the whole export; that clip's ``clip_path`` is then
-    left blank in ``segments.csv``.
+    The source recording is localised ONCE per distinct ``recording_path``.
+    A per-clip failure (missing source / decode error) is logged and swallowed
+    so a single bad segment never aborts the whole export; that clip's
+    ``clip_path`` is then left blank in ``segments.csv``.
 
     Designed to be invoked via ``await asyncio.to_thread(write_dataset_zip, ...)``.
     """
@@ -190,53 +355,67 @@ def write_dataset_zip(
             spec.segment_id,
         )
 
+    _, _, compression, compresslevel = _CLIP_ENCODINGS[clip_format]
+    recordings = list(by_recording.items())
+    window = 2 * EXPORT_WORKERS
     extracted: set[UUID] = set()
-
-    with zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for recording_path, recording_segments in by_recording.items():
-            try:
-                audio_service.ensure_file_local(recording_path)
-            except Exception:  # noqa: BLE001 - missing source must not abort
-                logger.warning(
-                    "Dataset export: could not localise recording path=%s; "
-                    "skipping %d clip(s)",
-                    recording_path,
-                    len(recording_segments),
-                    exc_info=True,
-                )
-                continue
-            for spec in recording_segments:
-                try:
-                    data, samplerate = audio_service.read_audio(
+    stop = threading.Event()
+
+    with (
+        zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED) as zf,
+        ThreadPoolExecutor(
+            max_workers=EXPORT_WORKERS, thread_name_prefix="dataset-export"
+        ) as pool,
+    ):
+        pending: deque[tuple[_ClipChannel, Future[None]]] = deque()
+        try:
+            submitted = 0
+            while submitted < len(recordings) or pending:
+                while submitted < len(recordings) and len(pending) < window:
+                    recording_path, recording_segments = recordings[submitted]
+                    channel = _ClipChannel(stop)
+                    future = pool.submit(
+                        _cut_recording,
+                        audio_service,
                         recording_path,
-                        start=spec.start_sec,
-                        end=spec.end_sec,
-                        channel=spec.channel,
-                    )
-                    wav_bytes = audio_service.audio_to_wav_bytes(
-                        data, samplerate
+                        recording_segments,
+                        clip_format,
+                        channel,
                     )
-                except Exception:  # noqa: BLE001 - one bad clip must not abort
-                    logger.warning(
-                        "Dataset export: failed to extract clip for segment %s "
-                        "(recording=%s, %.3f-%.3f); leaving clip_path empty",
-                        spec.segment_id,
-                        spec.recording_id,
-                        spec.start_sec,
-                        spec.end_sec,
-                        exc_info=True,
+                    pending.append((channel, future))
+                    submitted += 1
+                    if len(pending) > EXPORT_WORKERS:
+                        # Queued behind busy workers: start its download now so
+                        # it overlaps the cuts in progress.
+                        with contextlib.suppress(Exception):
+                            audio_service.prefetch([recording_path])
+                # Write clips in plan order as the head recording's worker
+                # produces them. Workers are started in submission order, so
+                # the head one is always running and later ones merely block
+                # on their full channel.
+                channel, future = pending.popleft()
+                for segment_id, clip_bytes in channel:
+                    zf.writestr(
+                        _clip_member(segment_id, clip_format),
+                        clip_bytes,
+                        compress_type=compression,
+                        compresslevel=compresslevel,
                     )
-                    continue
-                # Write the clip immediately so only one clip's bytes are held
-                # in memory at a time (peak RAM is O(one clip)).
-                zf.writestr(f"clips/{spec.segment_id}.wav", wav_bytes)
-                extracted.add(spec.segment_id)
+                    extracted.add(segment_id)
+                future.result()
+        finally:
+            # Unblock and cancel the workers still cutting ahead if the
+            # writer failed; a no-op after a complete run.
+            stop.set()
+            for _, future in pending:
+                future.cancel()
 
         # CSVs reflect ACTUAL extraction success: clip_path is blank for any
         # segment whose clip could not be extracted above.
         zf.writestr("annotations.csv", plan.annotations_csv)
         zf.writestr(
-            "segments.csv", _render_segments_csv(plan.segments, extracted)
+            "segments.csv",
+            _render_segments_csv(plan.segments, extracted, clip_format),
         )
 
 
@@ -19,6 +19,12 @@ Phase 6 (US2 / FR-037 / FR-038 / FR-039) additions:
   - VoteSummaryResponse exposes per-source aggregate counts
     (``member_agree`` / ``member_disagree`` / ``guest_authenticated_*`` /
     ``trusted_user_*``) per FR-038.
+
+Counts are read from ``annotation_vote_tallies`` (see
+:mod:`echoroo.models.annotation_vote_tally`), which triggers on
+``annotation_votes`` keep in step with every vote write. The SQL
+``annotation_vote_consensus`` function there must stay in sync with
+:meth:`AnnotationVoteService.compute_consensus_status`.
 """
 
 from __future__ import annotations
@@ -332,47 +338,20 @@ class AnnotationVoteService:
 
         votes = await self.vote_repo.list_by_annotation(annotation_id)
 
-        # Phase 13 P1.5: ``vote`` is now a smallint at the DB layer; use the
-        # ``vote_enum`` ergonomic property for VoteType comparisons.
-        agree_count = sum(1 for v in votes if v.vote_enum == VoteType.AGREE)
-        disagree_count = sum(1 for v in votes if v.vote_enum == VoteType.DISAGREE)
-        unsure_count = sum(1 for v in votes if v.vote_enum == VoteType.UNSURE)
-
-        # Per-source counts computed in Python because we already load all
-        # votes for the voters[] response (FR-038/039 require both). Switching
-        # to SQL GROUP BY would not avoid the load and would require a second
-        # round-trip — the linear pass below is cheaper end-to-end.
+        # Counts come from the trigger-maintained ``annotation_vote_tallies``
+        # row (one PK lookup) instead of a pass over ``votes``; the rows are
+        # still loaded for voters[] (FR-039). No tally row means no votes.
+        tally = await self.vote_repo.get_tally(annotation_id)
+        agree_count = tally.agree_count if tally else 0
+        disagree_count = tally.disagree_count if tally else 0
+        unsure_count = tally.unsure_count if tally else 0
         # FR-038: per-source aggregate counts
-        member_agree = sum(
-            1 for v in votes
-            if v.vote_enum == VoteType.AGREE
-            and v.source == AnnotationVoteSource.MEMBER
-        )
-        member_disagree = sum(
-            1 for v in votes
-            if v.vote_enum == VoteType.DISAGREE
-            and v.source == AnnotationVoteSource.MEMBER
-        )
-        guest_authenticated_agree = sum(
-            1 for v in votes
-            if v.vote_enum == VoteType.AGREE
-            and v.source == AnnotationVoteSource.GUEST_AUTHENTICATED
-        )
-        guest_authenticated_disagree = sum(
-            1 for v in votes
-            if v.vote_enum == VoteType.DISAGREE
-            and v.source == AnnotationVoteSource.GUEST_AUTHENTICATED
-        )
-        trusted_user_agree = sum(
-            1 for v in votes
-            if v.vote_enum == VoteType.AGREE
-            and v.source == AnnotationVoteSource.TRUSTED_USER
-        )
-        trusted_user_disagree = sum(
-            1 for v in votes
-            if v.vote_enum == VoteType.DISAGREE
-            and v.source == AnnotationVoteSource.TRUSTED_USER
-        )
+        member_agree = tally.member_agree if tally else 0
+        member_disagree = tally.member_disagree if tally else 0
+        guest_authenticated_agree = tally.guest_authenticated_agree if tally else 0
+        guest_authenticated_disagree = tally.guest_authenticated_disagree if tally else 0
+        trusted_user_agree = tally.trusted_user_agree if tally else 0
+        trusted_user_disagree = tally.trusted_user_disagree if tally else 0
 
         # Phase 13 P1.5: ``signal_quality`` was dropped from the AnnotationVote
         # row (Phase 14+ recording_annotations defer). The aggregate dict is
@@ -6,9 +6,13 @@ The implementation is split into sub-modules:
 - service.py   : AudioService class (main entry point)
 - _spectrogram.py : spectrogram computation helpers (PCEN, dB, colormap, STFT)
 - _window.py   : window function builder (13 window types)
-- _wav.py      : WAV header generation and streaming constants
+- _wav.py      : WAV header generation/parsing and streaming constants
+- _playback_cache.py : LRU-bounded OGG playback cache and OGG page seek index
+- _object_cache.py : LRU-bounded, single-flight local cache of S3 audio objects
 """
 
+from echoroo.services.audio._object_cache import AudioObjectCache
+from echoroo.services.audio._playback_cache import OggSeekIndex, PlaybackCache
 from echoroo.services.audio._spectrogram import (
     _apply_colormap,
     _apply_pcen,
@@ -20,7 +24,9 @@ from echoroo.services.audio._wav import (
     CHUNK_SIZE,
     HEADER_FORMAT,
     HEADER_SIZE,
+    WavLayout,
     generate_wav_header,
+    parse_wav_layout,
 )
 from echoroo.services.audio._window import _build_window
 from echoroo.services.audio.service import AudioMetadata, AudioService
@@ -28,10 +34,15 @@ from echoroo.services.audio.service import AudioMetadata, AudioService
 __all__ = [
     "AudioService",
     "AudioMetadata",
+    "AudioObjectCache",
+    "OggSeekIndex",
+    "PlaybackCache",
     "CHUNK_SIZE",
     "HEADER_FORMAT",
     "HEADER_SIZE",
+    "WavLayout",
     "generate_wav_header",
+    "parse_wav_layout",
     "_apply_colormap",
     "_apply_pcen",
     "_compute_spectrogram_tensor",
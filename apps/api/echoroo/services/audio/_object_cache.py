@@ -0,0 +1,336 @@
+"""Local cache of S3 audio objects with LRU eviction, single-flight and prefetch.
+
+Recordings live in S3; anything that decodes them (playback, spectrograms,
+ML workers, exports) needs a local copy. This module owns that copy:
+
+- **Bounded**: once the directory exceeds ``max_bytes`` the least-recently
+  used objects are removed. Objects touched within ``min_age_seconds`` are
+  never evicted, so a file another request or worker is still reading is
+  not pulled out from under it (the budget is therefore soft).
+- **Single-flight**: concurrent requests for the same key (threads in this
+  process *and* other processes sharing the directory) wait for one
+  download instead of each fetching the object.
+- **Prefetch**: :meth:`AudioObjectCache.prefetch` warms objects on a small
+  shared thread pool so callers can fetch ahead of need.
+- **Ranged reads**: :meth:`AudioObjectCache.read_range` fetches a byte range
+  without caching the whole object, for short clip windows.
+
+Usage accounting is kept per process and reconciled against the directory
+whenever it crosses the budget, because other processes write to the same
+directory.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_LOCK_DIR = ".locks"
+_TMP_SUFFIX = ".part"
+# Keys are spread over a fixed set of lock stripes (threads and lock files)
+# so the number of locks stays bounded however many objects are cached.
+_LOCK_STRIPES = 64
+_THREAD_LOCKS = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+_READ_CHUNK = 1024 * 1024
+
+_registry: dict[Path, AudioObjectCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_object_cache(
+    cache_dir: Path,
+    max_bytes: int,
+    min_age_seconds: int,
+    prefetch_workers: int,
+) -> AudioObjectCache:
+    """Return the process-wide cache for ``cache_dir``.
+
+    AudioService instances are built per request, so the cache (and its
+    usage counter and prefetch pool) is shared per directory. Limits are
+    refreshed from the latest caller so a settings change takes effect.
+    """
+    key = cache_dir.resolve()
+    with _registry_lock:
+        cache = _registry.get(key)
+        if cache is None:
+            cache = AudioObjectCache(cache_dir, max_bytes, min_age_seconds, prefetch_workers)
+            _registry[key] = cache
+        else:
+            cache.max_bytes = max_bytes
+            cache.min_age_seconds = min_age_seconds
+        return cache
+
+
+class AudioObjectCache:
+    """Size-bounded local mirror of S3 objects keyed by object key."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = 0,
+        min_age_seconds: int = 600,
+        prefetch_workers: int = 4,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory the objects are mirrored into.
+            max_bytes: Eviction budget in bytes (0 = unbounded).
+            min_age_seconds: Objects used more recently than this are never
+                evicted.
+            prefetch_workers: Size of the prefetch thread pool.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.min_age_seconds = min_age_seconds
+        self._prefetch_workers = max(1, prefetch_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._usage: int | None = None
+        self._usage_lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Paths / lookup
+    # ------------------------------------------------------------------
+
+    def path_for(self, key: str) -> Path:
+        """Return the local path mirroring ``key``.
+
+        Raises:
+            ValueError: If the key escapes the cache directory.
+        """
+        path = self.cache_dir / key
+        if not path.resolve().is_relative_to(self.cache_dir.resolve()):
+            raise ValueError(f"Path traversal detected in cache path: {key}")
+        return path
+
+    def lookup(self, key: str) -> Path | None:
+        """Return the cached copy of ``key`` (refreshing its LRU time), or None."""
+        path = self.path_for(key)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        now = time.time()
+        # Touch at most once a minute so hot objects do not cause a metadata
+        # write on every read.
+        if now - mtime > 60:
+            with contextlib.suppress(OSError):
+                os.utime(path, (now, now))
+        return path
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def _single_flight(self, key: str) -> Iterator[None]:
+        """Serialize fetches of ``key`` across threads and processes."""
+        stripe = int(hashlib.sha1(key.encode()).hexdigest()[:8], 16) % _LOCK_STRIPES
+        lock_dir = self.cache_dir / _LOCK_DIR
+        lock_dir.mkdir(parents=True, exist_ok=True)
+        with _THREAD_LOCKS[stripe], open(lock_dir / f"{stripe:02d}.lock", "a+b") as fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+    def fetch(self, key: str, client: Any = None) -> Path:
+        """Return a local copy of ``key``, downloading it once if missing.
+
+        Args:
+            key: S3 object key (also the path relative to the cache dir).
+            client: Optional S3 client.
+
+        Returns:
+            Local path of the object.
+
+        Raises:
+            FileNotFoundError: If the object cannot be downloaded.
+            ValueError: If the key escapes the cache directory.
+        """
+        cached = self.lookup(key)
+        if cached is not None:
+            return cached
+
+        path = self.path_for(key)
+        with self._single_flight(key):
+            # Another thread / process may have finished while we waited.
+            if path.exists():
+                return path
+            size = self._download(key, path, client)
+
+        self._account(size, keep=path)
+        return path
+
+    def _download(self, key: str, path: Path, client: Any) -> int:
+        """Stream ``key`` into ``path`` via a temp file; return its size."""
+        from echoroo.core.s3 import get_object_stream
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}{_TMP_SUFFIX}")
+        size = 0
+        try:
+            body = get_object_stream(key, client=client)
+            with open(tmp, "wb") as f:
+                while chunk := body.read(_READ_CHUNK):
+                    f.write(chunk)
+                    size += len(chunk)
+            tmp.rename(path)
+        except Exception as exc:
+            # Clean up any partial download before propagating the error
+            tmp.unlink(missing_ok=True)
+            raise FileNotFoundError(f"Audio file not found locally or in S3: {key}") from exc
+        return size
+
+    def read_range(self, key: str, first: int, last: int, client: Any = None) -> bytes:
+        """Return bytes ``first..last`` (inclusive) of ``key``.
+
+        Served from the cached copy when present; otherwise a ranged S3 GET
+        that does not populate the cache.
+
+        Raises:
+            FileNotFoundError: If the object cannot be read.
+        """
+        if last < first:
+            return b""
+        cached = self.lookup(key)
+        if cached is not None:
+            with open(cached, "rb") as f:
+                f.seek(first)
+                return f.read(last - first + 1)
+
+        from echoroo.core.s3 import get_object_stream
+
+        try:
+            body = get_object_stream(key, byte_range=f"bytes={first}-{last}", client=client)
+            data: bytes = body.read()
+        except Exception as exc:
+            raise FileNotFoundError(f"Audio file not found in S3: {key}") from exc
+        return data
+
+    # ------------------------------------------------------------------
+    # Prefetch
+    # ------------------------------------------------------------------
+
+    def prefetch(self, keys: list[str], client: Any = None) -> list[Future[Path]]:
+        """Start background fetches of ``keys`` and return their futures.
+
+        Already-cached keys resolve immediately. Failures are logged and
+        surface through the corresponding future.
+        """
+        futures: list[Future[Path]] = []
+        for key in keys:
+            cached = self.lookup(key)
+            if cached is not None:
+                done: Future[Path] = Future()
+                done.set_result(cached)
+                futures.append(done)
+                continue
+            futures.append(self._pool().submit(self._prefetch_one, key, client))
+        return futures
+
+    def _prefetch_one(self, key: str, client: Any) -> Path:
+        try:
+            return self.fetch(key, client=client)
+        except Exception:
+            logger.warning("Prefetch failed for %s", key, exc_info=True)
+            raise
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._usage_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._prefetch_workers,
+                    thread_name_prefix="s3-audio-prefetch",
+                )
+            return self._executor
+
+    # ------------------------------------------------------------------
+    # Accounting / eviction
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """Return ``(mtime, size, path)`` for every cached object."""
+        entries: list[tuple[float, int, Path]] = []
+        for root, dirs, files in os.walk(self.cache_dir):
+            if root == str(self.cache_dir):
+                dirs[:] = [d for d in dirs if d != _LOCK_DIR]
+            for name in files:
+                if name.endswith(_TMP_SUFFIX):
+                    continue
+                path = Path(root) / name
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def usage(self) -> int:
+        """Return the bytes currently held in the cache directory (full scan)."""
+        total = sum(size for _, size, _ in self._entries())
+        with self._usage_lock:
+            self._usage = total
+        return total
+
+    def _account(self, added: int, keep: Path | None = None) -> None:
+        """Record ``added`` bytes and evict if the estimate crosses the budget."""
+        if self.max_bytes <= 0:
+            return
+        with self._usage_lock:
+            if self._usage is not None:
+                self._usage += added
+            over = self._usage is None or self._usage > self.max_bytes
+        if over:
+            self.evict(keep=keep)
+
+    def evict(self, keep: Path | None = None) -> list[Path]:
+        """Remove least-recently-used objects until the cache fits ``max_bytes``.
+
+        Objects used within ``min_age_seconds`` and ``keep`` are skipped, so
+        the directory may stay over budget while everything in it is hot.
+
+        Returns:
+            Paths of the evicted objects.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted: list[Path] = []
+        if self.max_bytes > 0:
+            cutoff = time.time() - self.min_age_seconds
+            for mtime, size, path in entries:
+                if total <= self.max_bytes or mtime >= cutoff:
+                    break
+                if keep is not None and path == keep:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted.append(path)
+            if total > self.max_bytes:
+                logger.warning(
+                    "S3 audio cache over budget (%.1f MB > %.1f MB): remaining entries in use",
+                    total / 1_048_576,
+                    self.max_bytes / 1_048_576,
+                )
+        if evicted:
+            logger.info(
+                "S3 audio cache evicted %d objects (usage now %.1f MB)",
+                len(evicted),
+                total / 1_048_576,
+            )
+        with self._usage_lock:
+            self._usage = total
+        return evicted
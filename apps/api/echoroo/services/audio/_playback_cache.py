@@ -0,0 +1,405 @@
+"""Compressed playback cache (OGG/Vorbis) with LRU eviction and seek index.
+
+Browser playback of long PAM recordings is served from an OGG/Vorbis copy
+of the source file (83 MB WAV -> ~3-5 MB OGG). Transcoding is expensive, so
+it runs in a background worker (``echoroo.workers.playback_tasks``) at
+import time or on first access; request handlers only ever *look up* the
+cache and fall back to the raw file while the copy is being produced.
+
+The cache directory is shared between API and worker processes, so all
+state lives on disk:
+
+- ``<key>.ogg``      : the transcoded audio.
+- ``<key>.idx.json`` : seek index (byte offset + granule position per OGG
+  page) used to answer HTTP Range requests on page boundaries and to
+  advertise the stream duration.
+- ``<key>.pending``  : claim marker written when a transcode is scheduled,
+  so concurrent first plays enqueue a single job.
+
+Recency is tracked through the ``.ogg`` mtime (bumped on hit, throttled to
+once per :data:`_TOUCH_INTERVAL_SECONDS`); eviction removes the
+least-recently-used entries until the directory fits ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import struct
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_OGG_SUFFIX = ".ogg"
+_INDEX_SUFFIX = ".idx.json"
+_PENDING_SUFFIX = ".pending"
+_INDEX_VERSION = 1
+
+# A ``.pending`` marker older than this is treated as abandoned (crashed
+# worker, lost message) and may be re-claimed. Exceeds the ffmpeg timeout.
+_PENDING_STALE_SECONDS = 600
+# Bump the LRU timestamp at most this often per entry so hot recordings do
+# not turn every playback request into a metadata write.
+_TOUCH_INTERVAL_SECONDS = 60
+
+# OGG page header: capture pattern, version, header type, granule position,
+# bitstream serial, page sequence, CRC, segment count (RFC 3533 §6).
+_OGG_PAGE_HEADER = struct.Struct("<4sBBqIIIB")
+_OGG_CAPTURE = b"OggS"
+
+
+@dataclass(frozen=True)
+class OggSeekIndex:
+    """Page-level seek index for an OGG/Vorbis file.
+
+    Attributes:
+        sample_rate: Vorbis stream sample rate (granule units per second).
+        offsets: Byte offset of every page carrying a granule position.
+        granules: Granule position (last decodable sample) of each page.
+        total_bytes: Size of the indexed file in bytes.
+    """
+
+    sample_rate: int
+    offsets: tuple[int, ...]
+    granules: tuple[int, ...]
+    total_bytes: int
+
+    @property
+    def duration(self) -> float:
+        """Stream duration in seconds (0.0 when nothing was indexed)."""
+        if not self.granules or self.sample_rate <= 0:
+            return 0.0
+        return self.granules[-1] / self.sample_rate
+
+    def page_aligned_end(self, start: int, window: int) -> int:
+        """Return an inclusive end byte for a ``window``-sized range at ``start``.
+
+        The end is extended to the next page boundary so a bounded response
+        never splits an OGG page; the file end caps the result.
+        """
+        target = start + max(window, 1)
+        if target >= self.total_bytes:
+            return self.total_bytes - 1
+        pos = bisect.bisect_left(self.offsets, target)
+        if pos >= len(self.offsets):
+            return self.total_bytes - 1
+        return self.offsets[pos] - 1
+
+    def to_json(self) -> str:
+        """Serialize the index for the on-disk sidecar."""
+        return json.dumps(
+            {
+                "version": _INDEX_VERSION,
+                "sample_rate": self.sample_rate,
+                "total_bytes": self.total_bytes,
+                "offsets": list(self.offsets),
+                "granules": list(self.granules),
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, payload: str) -> OggSeekIndex:
+        """Load an index previously produced by :meth:`to_json`.
+
+        Raises:
+            ValueError: If the payload is malformed or from another version.
+        """
+        data = json.loads(payload)
+        if data.get("version") != _INDEX_VERSION:
+            raise ValueError(f"Unsupported seek index version: {data.get('version')}")
+        offsets = tuple(int(v) for v in data["offsets"])
+        granules = tuple(int(v) for v in data["granules"])
+        if len(offsets) != len(granules):
+            raise ValueError("Seek index offsets/granules length mismatch")
+        return cls(
+            sample_rate=int(data["sample_rate"]),
+            offsets=offsets,
+            granules=granules,
+            total_bytes=int(data["total_bytes"]),
+        )
+
+
+def build_ogg_seek_index(path: Path) -> OggSeekIndex:
+    """Scan the page headers of an OGG/Vorbis file and build its seek index.
+
+    Only the 27-byte page headers and segment tables are read; packet
+    payloads are skipped except for the Vorbis identification header on the
+    first page, which carries the sample rate.
+
+    Raises:
+        ValueError: If the file is not a well-formed OGG stream.
+    """
+    offsets: list[int] = []
+    granules: list[int] = []
+    sample_rate = 0
+    total_bytes = path.stat().st_size
+
+    with path.open("rb") as f:
+        offset = 0
+        while offset < total_bytes:
+            f.seek(offset)
+            header = f.read(_OGG_PAGE_HEADER.size)
+            if len(header) < _OGG_PAGE_HEADER.size:
+                break
+            capture, _version, _type, granule, _serial, _seq, _crc, n_segments = (
+                _OGG_PAGE_HEADER.unpack(header)
+            )
+            if capture != _OGG_CAPTURE:
+                raise ValueError(f"Invalid OGG page at byte {offset} in {path}")
+            lacing = f.read(n_segments)
+            body_size = sum(lacing)
+            if offset == 0:
+                # Vorbis identification header: packet type 0x01, "vorbis",
+                # version (u32), channels (u8), sample rate (u32).
+                ident = f.read(min(body_size, 16))
+                if ident[:7] == b"\x01vorbis" and len(ident) >= 16:
+                    sample_rate = struct.unpack_from("<I", ident, 12)[0]
+            if granule >= 0 and offset > 0:
+                offsets.append(offset)
+                granules.append(granule)
+            offset += _OGG_PAGE_HEADER.size + n_segments + body_size
+
+    if sample_rate <= 0:
+        raise ValueError(f"Not an OGG/Vorbis stream: {path}")
+
+    return OggSeekIndex(
+        sample_rate=sample_rate,
+        offsets=tuple(offsets),
+        granules=tuple(granules),
+        total_bytes=total_bytes,
+    )
+
+
+class PlaybackCache:
+    """LRU-bounded on-disk cache of OGG/Vorbis playback copies.
+
+    Instances are cheap and stateless; every method works purely against
+    the cache directory so API and worker processes can share it.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached files (created lazily).
+            max_bytes: Soft upper bound on the total size of cached entries.
+                ``0`` disables eviction.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def key_for(recording_path: str) -> str:
+        """Return the stable cache key for a recording path."""
+        return hashlib.sha256(recording_path.encode()).hexdigest()[:16]
+
+    def path_for(self, recording_path: str) -> Path:
+        """Return the location of the cached OGG copy (may not exist)."""
+        return self.cache_dir / f"{self.key_for(recording_path)}{_OGG_SUFFIX}"
+
+    def _index_path(self, ogg_path: Path) -> Path:
+        return ogg_path.with_name(ogg_path.name.removesuffix(_OGG_SUFFIX) + _INDEX_SUFFIX)
+
+    def _pending_path(self, recording_path: str) -> Path:
+        return self.cache_dir / f"{self.key_for(recording_path)}{_PENDING_SUFFIX}"
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def lookup(self, recording_path: str) -> Path | None:
+        """Return the cached OGG copy, or ``None`` on a miss.
+
+        Never transcodes. A hit refreshes the entry's LRU timestamp.
+        """
+        ogg_path = self.path_for(recording_path)
+        try:
+            mtime = ogg_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        now = time.time()
+        if now - mtime > _TOUCH_INTERVAL_SECONDS:
+            with contextlib.suppress(OSError):
+                os.utime(ogg_path, (now, now))
+        return ogg_path
+
+    def load_seek_index(self, recording_path: str) -> OggSeekIndex | None:
+        """Return the seek index of a cached entry, or ``None`` if unavailable."""
+        index_path = self._index_path(self.path_for(recording_path))
+        try:
+            return OggSeekIndex.from_json(index_path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Ignoring unreadable seek index %s: %s", index_path, exc)
+            return None
+
+    # ------------------------------------------------------------------
+    # Scheduling claims
+    # ------------------------------------------------------------------
+
+    def claim_pending(self, recording_path: str) -> bool:
+        """Atomically claim the right to schedule a transcode.
+
+        Returns:
+            True if the caller created the marker (and should enqueue the
+            job); False if another caller already holds a fresh claim.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        marker = self._pending_path(recording_path)
+        try:
+            fd = os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            try:
+                age = time.time() - marker.stat().st_mtime
+            except FileNotFoundError:
+                return self.claim_pending(recording_path)
+            if age < _PENDING_STALE_SECONDS:
+                return False
+            # Abandoned claim: refresh it and take over.
+            with contextlib.suppress(OSError):
+                os.utime(marker)
+            return True
+        os.close(fd)
+        return True
+
+    def release_pending(self, recording_path: str) -> None:
+        """Drop the scheduling claim for ``recording_path`` (idempotent)."""
+        self._pending_path(recording_path).unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Population
+    # ------------------------------------------------------------------
+
+    def transcode(self, recording_path: str, source_path: Path) -> Path:
+        """Encode ``source_path`` to OGG/Vorbis and store it in the cache.
+
+        Uses ffmpeg at Vorbis quality 4 (~128 kbps VBR), writes the seek
+        index sidecar, then evicts least-recently-used entries so the
+        directory stays within ``max_bytes``.
+
+        Returns:
+            Path to the cached OGG file.
+
+        Raises:
+            RuntimeError: If ffmpeg encoding fails.
+        """
+        cache_path = self.path_for(recording_path)
+        if cache_path.exists():
+            return cache_path
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.info("Encoding compressed audio: %s -> %s", source_path, cache_path)
+
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp.ogg")
+        try:
+            result = subprocess.run(
+                [
+                    "ffmpeg",
+                    "-y",  # overwrite output without prompting
+                    "-i", str(source_path),
+                    "-c:a", "libvorbis",
+                    "-q:a", "4",  # quality 4 ≈ 128 kbps VBR
+                    "-vn",  # no video stream
+                    "-f", "ogg",  # explicit output format so ffmpeg does not rely on extension
+                    str(tmp_path),
+                ],
+                capture_output=True,
+                timeout=300,  # 5-minute ceiling for very long files
+            )
+            if result.returncode != 0:
+                raise RuntimeError(
+                    f"ffmpeg failed (exit {result.returncode}): "
+                    f"{result.stderr.decode(errors='replace')[-500:]}"
+                )
+            index = build_ogg_seek_index(tmp_path)
+            self._index_path(cache_path).write_text(index.to_json())
+            # Publish the audio last: a visible ``.ogg`` always has its index.
+            tmp_path.rename(cache_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(
+            "Compressed audio ready: %s (%.1f MB)",
+            cache_path,
+            cache_path.stat().st_size / 1_048_576,
+        )
+        self.evict(keep=cache_path)
+        return cache_path
+
+    # ------------------------------------------------------------------
+    # Accounting / eviction
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """Return ``(mtime, size_incl_index, ogg_path)`` for every entry."""
+        entries: list[tuple[float, int, Path]] = []
+        try:
+            scan = list(os.scandir(self.cache_dir))
+        except FileNotFoundError:
+            return entries
+        sizes: dict[str, int] = {}
+        for dirent in scan:
+            if dirent.name.endswith(_INDEX_SUFFIX):
+                with contextlib.suppress(OSError):
+                    sizes[dirent.name.removesuffix(_INDEX_SUFFIX)] = dirent.stat().st_size
+        for dirent in scan:
+            name = dirent.name
+            if not name.endswith(_OGG_SUFFIX) or name.endswith(f".tmp{_OGG_SUFFIX}"):
+                continue
+            try:
+                st = dirent.stat()
+            except OSError:
+                continue
+            key = name.removesuffix(_OGG_SUFFIX)
+            entries.append((st.st_mtime, st.st_size + sizes.get(key, 0), Path(dirent.path)))
+        return entries
+
+    def usage(self) -> int:
+        """Return the total bytes held by cached entries (audio + index)."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, keep: Path | None = None) -> list[Path]:
+        """Remove least-recently-used entries until usage fits ``max_bytes``.
+
+        Args:
+            keep: Entry that must survive this pass (typically the one just
+                written), even if it alone exceeds the budget.
+
+        Returns:
+            Paths of the evicted OGG files.
+        """
+        if self.max_bytes <= 0:
+            return []
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted: list[Path] = []
+        for _mtime, size, ogg_path in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and ogg_path == keep:
+                continue
+            ogg_path.unlink(missing_ok=True)
+            self._index_path(ogg_path).unlink(missing_ok=True)
+            total -= size
+            evicted.append(ogg_path)
+        if evicted:
+            logger.info(
+                "Playback cache evicted %d entries (usage now %.1f MB)",
+                len(evicted),
+                total / 1_048_576,
+            )
+        return evicted
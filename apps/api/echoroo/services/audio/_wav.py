@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import struct
+from dataclasses import dataclass
 
 CHUNK_SIZE = 512 * 1024
 HEADER_FORMAT = "<4si4s4sihhiihh4si"
@@ -47,3 +48,106 @@ def generate_wav_header(
         b"data",
         data_size,
     )
+
+
+# RIFF/WAVE format tags (``wFormatTag``) that map directly onto raw frames.
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# libsndfile RAW subtypes for each (format tag, bits per sample) pair.
+_RAW_SUBTYPES: dict[tuple[int, int], str] = {
+    (_WAVE_FORMAT_PCM, 8): "PCM_U8",
+    (_WAVE_FORMAT_PCM, 16): "PCM_16",
+    (_WAVE_FORMAT_PCM, 24): "PCM_24",
+    (_WAVE_FORMAT_PCM, 32): "PCM_32",
+    (_WAVE_FORMAT_IEEE_FLOAT, 32): "FLOAT",
+    (_WAVE_FORMAT_IEEE_FLOAT, 64): "DOUBLE",
+}
+
+
+@dataclass(frozen=True)
+class WavLayout:
+    """Byte layout of an uncompressed WAV file's sample data.
+
+    Attributes:
+        samplerate: Frames per second.
+        channels: Interleaved channel count.
+        subtype: libsndfile RAW subtype used to decode the frames.
+        block_align: Bytes per frame (all channels).
+        data_offset: Byte offset of the first frame in the file.
+        data_size: Size of the ``data`` chunk in bytes.
+    """
+
+    samplerate: int
+    channels: int
+    subtype: str
+    block_align: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def frames(self) -> int:
+        """Total number of frames in the ``data`` chunk."""
+        return self.data_size // self.block_align
+
+    def byte_range(self, start_frame: int, end_frame: int) -> tuple[int, int]:
+        """Return the inclusive file byte range holding ``[start_frame, end_frame)``."""
+        start_frame = max(0, min(start_frame, self.frames))
+        end_frame = max(start_frame, min(end_frame, self.frames))
+        first = self.data_offset + start_frame * self.block_align
+        last = self.data_offset + end_frame * self.block_align - 1
+        return first, last
+
+
+def parse_wav_layout(head: bytes) -> WavLayout | None:
+    """Locate the ``fmt `` and ``data`` chunks in the leading bytes of a WAV file.
+
+    Only uncompressed PCM / IEEE-float layouts (including
+    WAVE_FORMAT_EXTENSIBLE wrappers around them) are recognised, since only
+    those can be decoded from an arbitrary byte range.
+
+    Args:
+        head: Leading bytes of the file; must cover every chunk header up to
+            and including the ``data`` chunk header.
+
+    Returns:
+        The layout, or None if the bytes are not a supported WAV header.
+    """
+    if len(head) < 12 or head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+        return None
+
+    fmt: tuple[int, int, int, int, int] | None = None
+    pos = 12
+    while pos + 8 <= len(head):
+        chunk_id = head[pos : pos + 4]
+        (chunk_size,) = struct.unpack_from("<I", head, pos + 4)
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            if body + 16 > len(head):
+                return None
+            tag, channels, samplerate, _byte_rate, block_align, bits = struct.unpack_from(
+                "<HHIIHH", head, body
+            )
+            if tag == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40 and body + 26 <= len(head):
+                # The sub-format GUID starts with the effective format tag.
+                (tag,) = struct.unpack_from("<H", head, body + 24)
+            fmt = (tag, channels, samplerate, block_align, bits)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            tag, channels, samplerate, block_align, bits = fmt
+            subtype = _RAW_SUBTYPES.get((tag, bits))
+            if subtype is None or channels <= 0 or block_align <= 0:
+                return None
+            return WavLayout(
+                samplerate=samplerate,
+                channels=channels,
+                subtype=subtype,
+                block_align=block_align,
+                data_offset=body,
+                data_size=chunk_size,
+            )
+        # Chunks are word-aligned: odd sizes carry one pad byte.
+        pos = body + chunk_size + (chunk_size & 1)
+    return None
@@ -11,6 +11,9 @@ from __future__ import annotations
 import hashlib
 import io
 import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -19,6 +22,8 @@ import soundfile as sf
 import torch
 from torchaudio import functional as taF
 
+from echoroo.services.audio._object_cache import AudioObjectCache, get_object_cache
+from echoroo.services.audio._playback_cache import OggSeekIndex, PlaybackCache
 from echoroo.services.audio._spectrogram import (
     _apply_colormap,
     _apply_pcen,
@@ -26,7 +31,20 @@ from echoroo.services.audio._spectrogram import (
     _get_colormap_lut,
     _to_db,
 )
-from echoroo.services.audio._wav import CHUNK_SIZE, HEADER_SIZE, generate_wav_header
+from echoroo.services.audio._wav import (
+    CHUNK_SIZE,
+    HEADER_SIZE,
+    WavLayout,
+    generate_wav_header,
+    parse_wav_layout,
+)
+
+# Leading bytes fetched to locate the ``data`` chunk of a remote WAV. Covers
+# the RIFF/fmt headers plus typical LIST/bext metadata chunks.
+_WAV_HEAD_BYTES = 64 * 1024
+_WAV_LAYOUT_CACHE_SIZE = 4096
+_wav_layouts: OrderedDict[str, WavLayout | None] = OrderedDict()
+_wav_layout_lock = threading.Lock()
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -79,6 +97,9 @@ class AudioService:
         audio_root: str,
         cache_dir: str | None = None,
         s3_audio_cache_dir: str | None = None,
+        s3_audio_cache_max_bytes: int | None = None,
+        playback_cache_dir: str | None = None,
+        playback_cache_max_bytes: int = 0,
     ) -> None:
         """Initialize AudioService.
 
@@ -87,14 +108,26 @@ class AudioService:
             cache_dir: Optional directory for caching spectrograms.
             s3_audio_cache_dir: Optional directory to cache files downloaded
                 from S3. Falls back to /tmp/echoroo-s3-audio when not set.
+            s3_audio_cache_max_bytes: LRU budget for the S3 audio cache in
+                bytes. Defaults to ``S3_AUDIO_CACHE_MAX_BYTES`` (0 = unbounded).
+            playback_cache_dir: Optional directory for compressed playback
+                copies. Falls back to COMPRESSED_CACHE_DIR when not set.
+            playback_cache_max_bytes: LRU budget for the playback cache in
+                bytes (0 = unbounded).
         """
         self.audio_root = Path(audio_root)
         self.cache_dir = Path(cache_dir) if cache_dir else None
         self.s3_audio_cache = Path(s3_audio_cache_dir) if s3_audio_cache_dir else None
+        self.s3_audio_cache_max_bytes = s3_audio_cache_max_bytes
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
         if self.s3_audio_cache:
             self.s3_audio_cache.mkdir(parents=True, exist_ok=True)
+        # Created lazily on first write: /data may be read-only in tests.
+        self.playback_cache = PlaybackCache(
+            Path(playback_cache_dir) if playback_cache_dir else self.COMPRESSED_CACHE_DIR,
+            max_bytes=playback_cache_max_bytes,
+        )
 
     # ------------------------------------------------------------------
     # Path helpers
@@ -135,11 +168,38 @@ class AudioService:
         # Return the primary path so callers can report a consistent error
         return result
 
+    @property
+    def object_cache(self) -> AudioObjectCache:
+        """Process-wide local cache of S3 audio objects for this service's cache dir."""
+        from echoroo.core.settings import get_settings as _get_settings
+
+        _settings = _get_settings()
+        cache_base = self.s3_audio_cache or Path("/tmp/echoroo-s3-audio")
+        return get_object_cache(
+            cache_base,
+            max_bytes=(
+                self.s3_audio_cache_max_bytes
+                if self.s3_audio_cache_max_bytes is not None
+                else _settings.S3_AUDIO_CACHE_MAX_BYTES
+            ),
+            min_age_seconds=_settings.S3_AUDIO_CACHE_MIN_AGE_SECONDS,
+            prefetch_workers=_settings.S3_AUDIO_PREFETCH_WORKERS,
+        )
+
+    def _primary_path(self, relative_path: str) -> Path:
+        """Return the audio_root path for ``relative_path`` (traversal-guarded)."""
+        primary = self.audio_root / relative_path
+        if not primary.resolve().is_relative_to(self.audio_root.resolve()):
+            raise ValueError(f"Path traversal detected: {relative_path}")
+        return primary
+
     def ensure_file_local(self, relative_path: str) -> Path:
         """Ensure audio file is available locally, downloading from S3 if needed.
 
         Checks the primary audio_root first, then the S3 audio cache. If not
         found in either location, downloads the file from S3 to the cache.
+        Concurrent callers share a single download, and the cache evicts
+        least-recently-used objects once it exceeds its size budget.
 
         Args:
             relative_path: Path relative to audio_root (also used as S3 key).
@@ -151,49 +211,102 @@ class AudioService:
             FileNotFoundError: If the file cannot be found or downloaded.
             ValueError: If a path traversal attempt is detected.
         """
-        # Guard against path traversal in the primary root
-        primary = self.audio_root / relative_path
-        if not primary.resolve().is_relative_to(self.audio_root.resolve()):
-            raise ValueError(f"Path traversal detected: {relative_path}")
-
+        primary = self._primary_path(relative_path)
         if primary.exists():
             return primary
 
-        # Determine cache base directory
-        cache_base = self.s3_audio_cache or Path("/tmp/echoroo-s3-audio")
-        cached = cache_base / relative_path
+        return self.object_cache.fetch(relative_path)
 
-        # Guard against path traversal in the cache directory
-        if not cached.resolve().is_relative_to(cache_base.resolve()):
-            raise ValueError(f"Path traversal detected in cache path: {relative_path}")
+    def prefetch(self, relative_paths: list[str]) -> list[Future[Path]]:
+        """Start downloading recordings in the background ahead of need.
 
-        if cached.exists():
-            return cached
+        Files already under audio_root or in the S3 cache resolve
+        immediately. Callers may wait on the returned futures or drop them
+        (fire-and-forget warm-up).
 
-        # Download from S3 to local cache
-        from echoroo.core.s3 import get_s3_client
-        from echoroo.core.settings import get_settings as _get_settings
+        Args:
+            relative_paths: Paths relative to audio_root (also S3 keys).
 
-        _settings = _get_settings()
-        client = get_s3_client()
+        Returns:
+            One future per remote path, resolving to its local path.
 
-        cached.parent.mkdir(parents=True, exist_ok=True)
+        Raises:
+            ValueError: If a path traversal attempt is detected.
+        """
+        remote = [p for p in relative_paths if not self._primary_path(p).exists()]
+        if not remote:
+            return []
+        return self.object_cache.prefetch(remote)
+
+    def _remote_wav_layout(self, relative_path: str) -> WavLayout | None:
+        """Return the sample layout of a remote WAV object, or None.
+
+        Reads the object's first :data:`_WAV_HEAD_BYTES` with a ranged GET;
+        layouts are memoised per process since recordings are immutable.
+        """
+        if Path(relative_path).suffix.lower() != ".wav":
+            return None
+        with _wav_layout_lock:
+            if relative_path in _wav_layouts:
+                _wav_layouts.move_to_end(relative_path)
+                return _wav_layouts[relative_path]
         try:
-            response = client.get_object(Bucket=_settings.S3_BUCKET, Key=relative_path)
-            with open(cached, "wb") as f:
-                body = response["Body"]
-                while True:
-                    chunk = body.read(65536)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-            return cached
-        except Exception as exc:
-            # Clean up any partial download before propagating the error
-            cached.unlink(missing_ok=True)
-            raise FileNotFoundError(
-                f"Audio file not found locally or in S3: {relative_path}"
-            ) from exc
+            head = self.object_cache.read_range(relative_path, 0, _WAV_HEAD_BYTES - 1)
+        except FileNotFoundError:
+            return None
+        layout = parse_wav_layout(head)
+        with _wav_layout_lock:
+            _wav_layouts[relative_path] = layout
+            while len(_wav_layouts) > _WAV_LAYOUT_CACHE_SIZE:
+                _wav_layouts.popitem(last=False)
+        return layout
+
+    def ensure_window_local(
+        self,
+        relative_path: str,
+        start: float = 0,  # noqa: ARG002 — mirrors read_audio's window signature
+        end: float | None = None,
+    ) -> None:
+        """Make ``[start, end)`` of a recording readable by :meth:`read_audio`.
+
+        Bounded windows of uncompressed WAV objects are read with ranged S3
+        GETs by :meth:`read_audio` itself, so nothing is downloaded here;
+        any other case falls back to :meth:`ensure_file_local`.
+
+        Raises:
+            FileNotFoundError: If the file cannot be found or downloaded.
+            ValueError: If a path traversal attempt is detected.
+        """
+        if self.get_absolute_path(relative_path).exists():
+            return
+        if end is not None and self._remote_wav_layout(relative_path) is not None:
+            return
+        self.ensure_file_local(relative_path)
+
+    def _read_remote_window(
+        self, relative_path: str, start: float, end: float
+    ) -> tuple[np.ndarray, int] | None:
+        """Decode ``[start, end)`` of a remote WAV from a single ranged GET."""
+        layout = self._remote_wav_layout(relative_path)
+        if layout is None:
+            return None
+        start_frame = int(start * layout.samplerate)
+        end_frame = int(end * layout.samplerate)
+        first, last = layout.byte_range(start_frame, end_frame)
+        raw = self.object_cache.read_range(relative_path, first, last)
+        if not raw:
+            shape = (0, layout.channels) if layout.channels > 1 else (0,)
+            return np.zeros(shape, dtype=np.float32), layout.samplerate
+        data, _ = sf.read(
+            io.BytesIO(raw),
+            dtype="float32",
+            format="RAW",
+            subtype=layout.subtype,
+            samplerate=layout.samplerate,
+            channels=layout.channels,
+            endian="LITTLE",
+        )
+        return data, layout.samplerate
 
     def is_supported_format(self, filename: str) -> bool:
         """Check if file format is supported.
@@ -294,6 +407,16 @@ class AudioService:
             Tuple of (audio data as float32 numpy array, sample rate).
         """
         file_path = self.get_absolute_path(relative_path)
+        if end is not None and not file_path.exists():
+            # Not mirrored locally: bounded WAV windows are fetched with a
+            # ranged GET instead of downloading the whole recording.
+            window = self._read_remote_window(relative_path, start, end)
+            if window is not None:
+                data, samplerate = window
+                if channel is not None and len(data.shape) > 1:
+                    data = data[:, channel] if channel < data.shape[1] else data[:, 0]
+                return data, samplerate
+
         info = sf.info(str(file_path))
         start_frame = int(start * info.samplerate)
         end_frame = int(end * info.samplerate) if end is not None else None
@@ -575,75 +698,95 @@ class AudioService:
 
     COMPRESSED_CACHE_DIR = Path("/data/audio_compressed")
 
-    def get_compressed_for_playback(self, recording_path: str) -> Path:
-        """Return a compressed OGG/Vorbis version of the audio file, creating it if needed.
+    def get_cached_playback(self, recording_path: str) -> Path | None:
+        """Return the cached OGG/Vorbis playback copy without transcoding.
 
-        Uses ffmpeg to encode the source WAV to OGG Vorbis at quality 4 (~128 kbps).
-        The output is cached under COMPRESSED_CACHE_DIR keyed by the SHA-256 hash of
-        the source file path so that repeated requests incur no I/O overhead.
+        Request handlers use this on the hot path: a miss returns ``None``
+        immediately so the caller can serve the source file while
+        :meth:`schedule_playback_transcode` produces the compressed copy.
 
         Args:
             recording_path: Path relative to audio_root (also the S3 key).
 
         Returns:
-            Path to the local OGG file ready for streaming.
+            Path to the cached OGG file, or None if it does not exist yet.
+        """
+        return self.playback_cache.lookup(recording_path)
 
-        Raises:
-            FileNotFoundError: If the source audio file cannot be resolved locally.
-            RuntimeError: If ffmpeg encoding fails.
+    def get_playback_seek_index(self, recording_path: str) -> OggSeekIndex | None:
+        """Return the OGG page seek index of a cached playback copy.
+
+        Args:
+            recording_path: Path relative to audio_root (also the S3 key).
+
+        Returns:
+            The seek index, or None if the copy (or its index) is missing.
         """
-        import logging
-        import subprocess
+        return self.playback_cache.load_seek_index(recording_path)
 
-        logger = logging.getLogger(__name__)
+    def schedule_playback_transcode(self, recording_path: str) -> bool:
+        """Enqueue a background transcode of ``recording_path``, best-effort.
 
-        # Ensure the source file is available locally (download from S3 if needed)
-        source_path = self.ensure_file_local(recording_path)
+        A claim marker in the cache directory deduplicates concurrent
+        first plays so only one job is enqueued per recording. The publish
+        is not retried, so an unreachable broker fails after one connection
+        timeout; dispatch failures are logged and swallowed, and playback
+        falls back to the source file either way. Blocking: request handlers
+        call this from a worker thread.
 
-        # Build a stable cache key from the source path
-        path_hash = hashlib.sha256(recording_path.encode()).hexdigest()[:16]
-        cache_path = self.COMPRESSED_CACHE_DIR / f"{path_hash}.ogg"
+        Args:
+            recording_path: Path relative to audio_root (also the S3 key).
 
-        if cache_path.exists():
-            logger.debug("Compressed cache hit: %s -> %s", recording_path, cache_path)
-            return cache_path
+        Returns:
+            True if a job was enqueued by this call.
+        """
+        import logging
 
-        # Create cache directory on first use
-        self.COMPRESSED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        logger = logging.getLogger(__name__)
 
-        logger.info("Encoding compressed audio: %s -> %s", source_path, cache_path)
+        try:
+            if not self.playback_cache.claim_pending(recording_path):
+                return False
+        except OSError as exc:
+            logger.warning("Playback cache unavailable for %s: %s", recording_path, exc)
+            return False
 
-        tmp_path = cache_path.with_suffix(".tmp.ogg")
         try:
-            result = subprocess.run(
-                [
-                    "ffmpeg",
-                    "-y",  # overwrite output without prompting
-                    "-i", str(source_path),
-                    "-c:a", "libvorbis",
-                    "-q:a", "4",  # quality 4 ≈ 128 kbps VBR
-                    "-vn",  # no video stream
-                    "-f", "ogg",  # explicit output format so ffmpeg does not rely on extension
-                    str(tmp_path),
-                ],
-                capture_output=True,
-                timeout=300,  # 5-minute ceiling for very long files
-            )
-            if result.returncode != 0:
-                raise RuntimeError(
-                    f"ffmpeg failed (exit {result.returncode}): "
-                    f"{result.stderr.decode(errors='replace')[-500:]}"
-                )
-            tmp_path.rename(cache_path)
-            logger.info(
-                "Compressed audio ready: %s (%.1f MB)",
-                cache_path,
-                cache_path.stat().st_size / 1_048_576,
+            from echoroo.workers.playback_tasks import transcode_for_playback
+
+            transcode_for_playback.apply_async((recording_path,), retry=False)
+        except Exception:  # noqa: BLE001 — playback falls back to the source file
+            logger.warning(
+                "Failed to enqueue playback transcode for %s", recording_path, exc_info=True
             )
-            return cache_path
-        except Exception:
-            tmp_path.unlink(missing_ok=True)
-            raise
+            self.playback_cache.release_pending(recording_path)
+            return False
+        return True
+
+    def get_compressed_for_playback(self, recording_path: str) -> Path:
+        """Return a compressed OGG/Vorbis version of the audio file, creating it if needed.
+
+        Blocking: on a cache miss the source is fetched (from S3 if needed)
+        and transcoded with ffmpeg before returning. Only background
+        workers call this; request handlers use :meth:`get_cached_playback`.
+
+        Args:
+            recording_path: Path relative to audio_root (also the S3 key).
+
+        Returns:
+            Path to the local OGG file ready for streaming.
+
+        Raises:
+            FileNotFoundError: If the source audio file cannot be resolved locally.
+            RuntimeError: If ffmpeg encoding fails.
+        """
+        cached = self.playback_cache.lookup(recording_path)
+        if cached is not None:
+            return cached
+
+        # Ensure the source file is available locally (download from S3 if needed)
+        source_path = self.ensure_file_local(recording_path)
+        return self.playback_cache.transcode(recording_path, source_path)
 
     # ------------------------------------------------------------------
     # HTTP Range streaming helper
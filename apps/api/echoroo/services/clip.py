@@ -1,14 +1,112 @@
 """Clip service for business logic."""
 
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from echoroo.core.pagination import Cursor, TotalMode
 from echoroo.models.clip import Clip
 from echoroo.repositories.clip import ClipRepository
 from echoroo.repositories.recording import RecordingRepository
 from echoroo.services.audio import AudioService
 
+# Recordings read per keyset page by ``generate_dataset_clips``.
+DATASET_CLIP_RECORDING_PAGE = 1000
+# Upper bound on the windows planned at once and staged by one
+# ``insert_windows`` call. A page is planned in runs of recordings that stay
+# under it; a single recording planning more is inserted in several batches.
+DATASET_CLIP_WINDOW_BATCH = 50_000
+# Slack for the window count, so a window ending exactly at the stop time is
+# not lost to float rounding; the exact ``end <= stop`` test is applied after.
+_WINDOW_COUNT_EPSILON = 1e-9
+
+
+def validate_generation_params(clip_length: float, overlap: float) -> None:
+    """Validate clip generation parameters.
+
+    Raises:
+        ValueError: If ``clip_length`` is not positive or ``overlap`` is not
+            in ``[0, clip_length)``.
+    """
+    if clip_length <= 0:
+        raise ValueError("Clip length must be positive")
+    if overlap < 0 or overlap >= clip_length:
+        raise ValueError("Overlap must be between 0 and clip_length")
+
+
+def plan_clip_windows(
+    durations: np.ndarray,
+    clip_length: float,
+    overlap: float = 0.0,
+    start_time: float = 0.0,
+    end_time: float | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Plan the fixed-length clip windows of many recordings at once.
+
+    Window ``k`` of a recording starts at ``start_time + k * (clip_length -
+    overlap)``; windows are kept while they end within the recording (and
+    ``end_time`` when given). Computing each start from ``k`` rather than
+    by repeated addition keeps the boundaries identical however a recording
+    is planned, which is what lets a re-run recognise existing clips.
+
+    Args:
+        durations: Recording durations in seconds
+        clip_length: Duration of each clip in seconds
+        overlap: Overlap between clips in seconds
+        start_time: Offset of the first window
+        end_time: Offset after which no window ends (None = end of recording)
+
+    Returns:
+        Tuple of (index into ``durations``, start times, end times)
+    """
+    durations = np.asarray(durations, dtype=np.float64)
+    stop = durations if end_time is None else np.minimum(durations, end_time)
+    counts = _window_counts(stop, clip_length, overlap, start_time)
+    index = np.repeat(np.arange(len(stop)), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    starts = start_time + (np.arange(len(index)) - first) * (clip_length - overlap)
+    ends = starts + clip_length
+    keep = ends <= stop[index]
+    return index[keep], starts[keep], ends[keep]
+
+
+def _window_counts(
+    stop: np.ndarray, clip_length: float, overlap: float, start_time: float
+) -> np.ndarray:
+    span = stop - start_time - clip_length
+    counts = np.floor(span / (clip_length - overlap) + _WINDOW_COUNT_EPSILON) + 1
+    return np.where(span >= 0, counts, 0).astype(np.int64)
+
+
+def _recording_runs(counts: np.ndarray, budget: int) -> list[tuple[int, int]]:
+    """Split recordings into consecutive ``[first, last)`` runs by window count.
+
+    Each run plans at most ``budget`` windows; a recording planning more
+    forms a run of its own.
+    """
+    runs: list[tuple[int, int]] = []
+    first = total = 0
+    for position, count in enumerate(counts.tolist()):
+        if position > first and total + count > budget:
+            runs.append((first, position))
+            first, total = position, 0
+        total += count
+    if len(counts):
+        runs.append((first, len(counts)))
+    return runs
+
+
+@dataclass
+class ClipGenerationStats:
+    """Outcome of :meth:`ClipService.generate_dataset_clips`."""
+
+    recordings_processed: int = 0
+    windows_planned: int = 0
+    clips_created: int = 0
+
 
 class ClipService:
     """Service for Clip operations."""
@@ -43,21 +141,31 @@ class ClipService:
         page_size: int = 50,
         sort_by: str = "start_time",
         sort_order: str = "asc",
+        cursor: Cursor | None = None,
+        total_mode: TotalMode = "exact",
     ) -> tuple[list[Clip], int]:
         """List clips for a recording.
 
         Args:
             recording_id: Recording's UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); ignored when ``cursor`` is given
             page_size: Items per page
             sort_by: Sort column name
             sort_order: Sort order (asc/desc)
+            cursor: Decoded keyset cursor to resume after
+            total_mode: ``"exact"`` or ``"estimate"`` total
 
         Returns:
             Tuple of (list of clips, total count)
         """
         return await self.repo.list_by_recording(
-            recording_id, page, page_size, sort_by, sort_order
+            recording_id,
+            page,
+            page_size,
+            sort_by,
+            sort_order,
+            cursor=cursor,
+            total_mode=total_mode,
         )
 
     async def create(
@@ -197,32 +305,89 @@ class ClipService:
         recording = await self.recording_repo.get_by_id(recording_id)
         if not recording:
             raise ValueError("Recording not found")
+        validate_generation_params(clip_length, overlap)
 
-        if clip_length <= 0:
-            raise ValueError("Clip length must be positive")
-        if overlap < 0 or overlap >= clip_length:
-            raise ValueError("Overlap must be between 0 and clip_length")
-
-        actual_end = end_time if end_time is not None else recording.duration
-        if actual_end > recording.duration:
-            actual_end = recording.duration
-
-        # Generate clip boundaries
-        clips_to_create: list[Clip] = []
-        current_start = start_time
-        step = clip_length - overlap
-
-        while current_start + clip_length <= actual_end:
-            clips_to_create.append(
-                Clip(
-                    recording_id=recording_id,
-                    start_time=current_start,
-                    end_time=current_start + clip_length,
-                )
-            )
-            current_start += step
+        _index, starts, ends = plan_clip_windows(
+            np.array([recording.duration]), clip_length, overlap, start_time, end_time
+        )
+        clips_to_create = [
+            Clip(recording_id=recording_id, start_time=start, end_time=end)
+            for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+        ]
 
         # Batch create
         if clips_to_create:
             return await self.repo.create_many(clips_to_create)
         return []
+
+    async def generate_dataset_clips(
+        self,
+        dataset_id: UUID,
+        clip_length: float,
+        overlap: float = 0.0,
+        start_time: float = 0.0,
+        end_time: float | None = None,
+        on_batch: Callable[[ClipGenerationStats], Awaitable[None]] | None = None,
+    ) -> ClipGenerationStats:
+        """Generate fixed-length clips for every recording of a dataset.
+
+        Recordings are read in keyset pages of ``(id, duration)``, their
+        windows planned with :func:`plan_clip_windows` in runs of at most
+        :data:`DATASET_CLIP_WINDOW_BATCH` windows and inserted through
+        :meth:`ClipRepository.insert_windows`, which skips windows that
+        already exist. Running the same generation twice therefore creates
+        each clip once.
+
+        Args:
+            dataset_id: Dataset's UUID
+            clip_length: Duration of each clip in seconds
+            overlap: Overlap between clips in seconds (default 0)
+            start_time: Start generating from this time
+            end_time: Stop generating at this time (None = end of recording)
+            on_batch: Awaited with the running totals after every insert
+                batch, e.g. to commit and report progress
+
+        Returns:
+            Totals over the whole dataset
+
+        Raises:
+            ValueError: If validation fails
+        """
+        validate_generation_params(clip_length, overlap)
+        stats = ClipGenerationStats()
+        after_id: UUID | None = None
+        while True:
+            page = await self.recording_repo.list_durations_by_dataset(
+                dataset_id, after_id=after_id, limit=DATASET_CLIP_RECORDING_PAGE
+            )
+            if not page:
+                return stats
+            after_id = page[-1][0]
+            recording_ids = [recording_id for recording_id, _duration in page]
+            durations = np.array([duration for _recording_id, duration in page], dtype=np.float64)
+            stop = durations if end_time is None else np.minimum(durations, end_time)
+            counts = _window_counts(stop, clip_length, overlap, start_time)
+            # Plan in runs of recordings so a page of long recordings at a
+            # short step never holds more than a batch of windows in memory
+            # (bar a single recording that plans more on its own).
+            for first, last in _recording_runs(counts, DATASET_CLIP_WINDOW_BATCH):
+                index, starts, ends = plan_clip_windows(
+                    durations[first:last], clip_length, overlap, start_time, end_time
+                )
+                stats.windows_planned += len(index)
+                for lo in range(0, max(len(index), 1), DATASET_CLIP_WINDOW_BATCH):
+                    hi = lo + DATASET_CLIP_WINDOW_BATCH
+                    stats.clips_created += await self.repo.insert_windows(
+                        list(
+                            zip(
+                                [recording_ids[first + i] for i in index[lo:hi].tolist()],
+                                starts[lo:hi].tolist(),
+                                ends[lo:hi].tolist(),
+                                strict=True,
+                            )
+                        )
+                    )
+                    if hi >= len(index):
+                        stats.recordings_processed += last - first
+                    if on_batch is not None:
+                        await on_batch(stats)
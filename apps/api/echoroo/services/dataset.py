@@ -11,9 +11,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from echoroo.core.pagination import paginate
 from echoroo.models.dataset import Dataset
+from echoroo.models.deletion_job import DeletionJob
 from echoroo.models.enums import DatasetStatus, DatasetVisibility
 from echoroo.models.recording import Recording
 from echoroo.repositories.dataset import DatasetRepository
+from echoroo.repositories.deletion_job import ACTIVE_DELETION_STATUSES, DeletionJobRepository
 from echoroo.repositories.project import ProjectRepository
 from echoroo.repositories.recording import RecordingRepository
 from echoroo.repositories.site import SiteRepository
@@ -335,14 +337,25 @@ class DatasetService:
 
     async def delete(
         self, user_id: UUID, project_id: UUID, dataset_id: UUID
-    ) -> None:
-        """Delete dataset and cascade to recordings.
+    ) -> DeletionJob:
+        """Queue the background deletion of a dataset.
+
+        The dataset is marked ``DELETING`` and a queued
+        :class:`~echoroo.models.deletion_job.DeletionJob` is recorded; the
+        caller commits and dispatches
+        :func:`~echoroo.workers.deletion_tasks.run_deletion_job`, which
+        removes recordings, their child rows and S3 objects in batches.
+        Deleting a dataset whose deletion is still queued or running
+        returns that job; after a failed job a new one is queued.
 
         Args:
             user_id: Current user's UUID
             project_id: Project's UUID
             dataset_id: Dataset's UUID
 
+        Returns:
+            Deletion job of the dataset
+
         Raises:
             HTTPException: If not admin or dataset not found
         """
@@ -361,7 +374,19 @@ class DatasetService:
                 detail="Dataset not found",
             )
 
-        await self.dataset_repo.delete(dataset_id)
+        job_repo = DeletionJobRepository(self.dataset_repo.db)
+        if dataset.status == DatasetStatus.DELETING:
+            existing = await job_repo.get_latest_for_entity("dataset", dataset_id)
+            if existing is not None and existing.status in ACTIVE_DELETION_STATUSES:
+                return existing
+
+        dataset.status = DatasetStatus.DELETING
+        return await job_repo.create(
+            entity_type="dataset",
+            entity_id=dataset_id,
+            project_id=project_id,
+            requested_by_user_id=user_id,
+        )
 
     def get_import_status(self, dataset: Dataset) -> dict[str, DatasetStatus | int | float | str | None]:
         """Get import progress status.
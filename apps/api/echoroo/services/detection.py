@@ -9,10 +9,16 @@ from fastapi import HTTPException, status
 from sqlalchemy import select as sa_select
 from sqlalchemy.exc import IntegrityError
 
-from echoroo.core.pagination import paginate
-from echoroo.models.annotation_vote import AnnotationVote
+from echoroo.core.pagination import (
+    TotalMode,
+    decode_cursor,
+    is_estimate,
+    next_cursor,
+    paginate,
+)
 from echoroo.models.confirmed_region import ConfirmedRegion
 from echoroo.models.enums import (
+    ConsensusStatus,
     DetectionSource,
     DetectionStatus,
     SignalQuality,
@@ -33,7 +39,11 @@ from echoroo.models.recording_annotation import (
     CUSTOM_SVM_DEDUP_INDEX_NAME,
     RecordingAnnotation,
 )
-from echoroo.repositories.annotation import AnnotationRepository, TemporalSummaryRow
+from echoroo.repositories.annotation import (
+    AnnotationRepository,
+    DetectionSort,
+    TemporalSummaryRow,
+)
 from echoroo.repositories.annotation_vote import AnnotationVoteRepository
 from echoroo.repositories.confirmed_region import ConfirmedRegionRepository
 from echoroo.repositories.detection_run import DetectionRunRepository
@@ -103,6 +113,10 @@ class DetectionService:
         min_votes: int = 2,
         threshold: float = 0.667,
         locale: str = "en",
+        cursor: str | None = None,
+        total_mode: TotalMode = "exact",
+        consensus: ConsensusStatus | None = None,
+        sort_by: DetectionSort = "created_at",
     ) -> DetectionListResponse:
         """List detections for a project with optional filtering and pagination.
 
@@ -121,11 +135,27 @@ class DetectionService:
             min_votes: Minimum votes required for consensus (from project settings)
             threshold: Consensus agreement threshold (from project settings)
             locale: Locale code used to resolve vernacular names on embedded tags
+            cursor: Opaque ``next_cursor`` from a previous page; when given,
+                ``page`` is ignored and the list resumes after that row
+            total_mode: ``"estimate"`` trades an exact ``total`` for speed
+            consensus: Optional vote-consensus filter (stored status under the
+                project's review settings)
+            sort_by: ``created_at`` (newest first) or ``consensus_score``
+                (highest agreement first, undecided last)
 
         Returns:
             Paginated detection list response
+
+        Raises:
+            InvalidCursorError: If ``cursor`` is malformed or its value does
+                not fit the sort column
         """
         pagination = paginate(page, page_size)
+        keyset = (
+            decode_cursor(cursor, sort_key=sort_by, descending=True)
+            if cursor
+            else None
+        )
 
         annotations, total = await self.annotation_repo.list_annotations(
             project_id=project_id,
@@ -138,6 +168,10 @@ class DetectionService:
             detection_run_id=detection_run_id,
             page=pagination.page,
             page_size=pagination.page_size,
+            cursor=keyset,
+            total_mode=total_mode,
+            consensus=consensus,
+            sort_by=sort_by,
         )
 
         # Batch-load vote counts for all annotations in one query
@@ -164,12 +198,24 @@ class DetectionService:
             for a in annotations
         ]
 
+        def _consensus_score(annotation: RecordingAnnotation) -> float | None:
+            counts = vote_counts_map.get(annotation.id)
+            return counts.consensus_score if counts is not None else None
+
         return DetectionListResponse(
             items=items,
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
             pages=pagination.total_pages(total),
+            next_cursor=next_cursor(
+                annotations,
+                pagination.page_size,
+                sort_key=sort_by,
+                descending=True,
+                value=_consensus_score if sort_by == "consensus_score" else None,
+            ),
+            total_is_estimate=is_estimate(total),
         )
 
     async def _resolve_vernacular_names(
@@ -714,7 +760,11 @@ class DetectionService:
         min_votes: int = 2,
         threshold: float = 0.667,
     ) -> dict[UUID, DetectionVoteCounts]:
-        """Batch-load vote counts for a list of annotations in one query.
+        """Batch-load vote counts for a list of annotations.
+
+        Reads the trigger-maintained ``annotation_vote_tallies`` rows of the
+        page plus the current user's own votes — two indexed queries whose
+        size is bounded by the page, however many votes each annotation has.
 
         Args:
             annotation_ids: List of annotation UUIDs
@@ -728,41 +778,16 @@ class DetectionService:
 
         from echoroo.services.annotation_vote import AnnotationVoteService
 
-        votes_result = await self.annotation_repo.db.execute(
-            sa_select(AnnotationVote).where(
-                AnnotationVote.annotation_id.in_(annotation_ids)
-            )
-        )
-        all_votes = list(votes_result.scalars().all())
-
-        # Group votes by annotation_id
-        grouped: dict[UUID, list[AnnotationVote]] = {aid: [] for aid in annotation_ids}
-        for vote in all_votes:
-            if vote.annotation_id in grouped:
-                grouped[vote.annotation_id].append(vote)
+        tallies = await self.vote_repo.list_tallies(annotation_ids)
+        user_votes: dict[UUID, VoteType] = {}
+        if current_user_id is not None:
+            user_votes = await self.vote_repo.list_user_votes(annotation_ids, current_user_id)
 
         result: dict[UUID, DetectionVoteCounts] = {}
-        for annotation_id, votes in grouped.items():
-            # Phase 13 P1.5 (T804): ``vote`` is now smallint at the DB layer;
-            # use the ``vote_enum`` ergonomic property for VoteType compares.
-            agree_count = sum(1 for v in votes if v.vote_enum == VoteType.AGREE)
-            disagree_count = sum(1 for v in votes if v.vote_enum == VoteType.DISAGREE)
-            unsure_count = sum(1 for v in votes if v.vote_enum == VoteType.UNSURE)
-
-            # Phase 13 P1.5: ``signal_quality`` was dropped from the vote
-            # row; emit zero counts to preserve the API contract until
-            # Phase 14+ recording_annotations reinstates it.
-            signal_quality_counts: dict[str, int] = {q.value: 0 for q in SignalQuality}
-
-            user_vote: VoteType | None = None
-            user_signal_quality: SignalQuality | None = None
-            if current_user_id is not None:
-                for v in votes:
-                    if v.voter_user_id == current_user_id:
-                        user_vote = v.vote_enum
-                        # Phase 13 P1.5: signal_quality dropped — None until Phase 14+.
-                        user_signal_quality = None
-                        break
+        for annotation_id in annotation_ids:
+            tally = tallies.get(annotation_id)
+            agree_count = tally.agree_count if tally else 0
+            disagree_count = tally.disagree_count if tally else 0
 
             consensus_status = AnnotationVoteService.compute_consensus_status(
                 agree_count=agree_count,
@@ -774,11 +799,15 @@ class DetectionService:
             result[annotation_id] = DetectionVoteCounts(
                 agree_count=agree_count,
                 disagree_count=disagree_count,
-                unsure_count=unsure_count,
-                user_vote=user_vote,
-                user_signal_quality=user_signal_quality,
-                signal_quality_counts=signal_quality_counts,
+                unsure_count=tally.unsure_count if tally else 0,
+                user_vote=user_votes.get(annotation_id),
+                # Phase 13 P1.5: ``signal_quality`` was dropped from the vote
+                # row; emit None / zero counts to preserve the API contract
+                # until Phase 14+ recording_annotations reinstates it.
+                user_signal_quality=None,
+                signal_quality_counts={q.value: 0 for q in SignalQuality},
                 consensus_status=consensus_status,
+                consensus_score=tally.consensus_score if tally else None,
             )
 
         return result
@@ -29,14 +29,16 @@ import io
 import json
 import logging
 import zipfile
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, BinaryIO
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, contains_eager, joinedload, selectinload
 
 from echoroo.core.stream_guard import (
     CSV_RECHECK_INTERVAL,
@@ -52,6 +54,7 @@ from echoroo.models.project import Project
 from echoroo.models.recording import Recording
 from echoroo.models.recording_annotation import RecordingAnnotation
 from echoroo.models.site import Site
+from echoroo.models.tag import Tag
 from echoroo.services.camtrap import (
     CAMTRAPDP_OBSERVATION_COLUMNS,
     deployment_id,
@@ -69,16 +72,34 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
 logger = logging.getLogger(__name__)
 
 
-class _AnnotationEntry(TypedDict):
-    """Internal annotation entry for ML dataset export."""
+#: Annotations fetched per server-side cursor batch by the CSV stream.
+CSV_EXPORT_BATCH_SIZE = 2000
 
-    recording_filename: str
-    recording_path: str
-    start_time: float
-    end_time: float
-    species: str
-    confidence: float | None
-    label: str
+#: Rows fetched per server-side cursor batch by the ML-dataset export.
+ML_EXPORT_BATCH_SIZE = 5000
+
+_ML_CSV_HEADER = (
+    "recording_filename",
+    "start_time",
+    "end_time",
+    "species",
+    "confidence",
+    "label",
+)
+
+
+@dataclass
+class MlDatasetStats:
+    """Entry counts and species of one ML-dataset export."""
+
+    positive_count: int = 0
+    negative_count: int = 0
+    species: set[str] = field(default_factory=set)
+
+    @property
+    def total_entries(self) -> int:
+        """Positive plus negative entries."""
+        return self.positive_count + self.negative_count
 
 
 # Default H3 resolution exposed to a Member-equivalent exporter when no
@@ -87,6 +108,14 @@ class _AnnotationEntry(TypedDict):
 _DEFAULT_MEMBER_H3_RESOLUTION = 9
 
 
+def _drain(buffer: io.StringIO) -> bytes:
+    """Return the buffered CSV text as UTF-8 and empty the buffer for reuse."""
+    chunk = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
+
+
 class DetectionExportService:
     """Service for exporting detection data as CSV or ML training datasets."""
 
@@ -406,8 +435,15 @@ class DetectionExportService:
 
         Phase 17 backlog A-5 Hybrid Contract:
 
-        * The header row is yielded immediately so the response status and
-          ``Content-Disposition`` headers commit before the first re-check.
+        * The header row is yielded before any annotation is fetched so the
+          response status and ``Content-Disposition`` headers commit before
+          the first re-check, however large the export.
+        * Annotations are read through a server-side cursor in batches of
+          :data:`CSV_EXPORT_BATCH_SIZE` (:meth:`_stream_annotations_for_export`)
+          and each batch's Site H3 resolutions are looked up with it, so
+          memory stays flat for any export size. Rows are written through
+          one reusable writer and yielded as one chunk per batch (or per
+          re-check interval, whichever is shorter).
         * Every :data:`CSV_RECHECK_INTERVAL` rows the generator calls
           :func:`recheck_action_permission` against the request-scoped
           session. PostgreSQL READ COMMITTED guarantees the new SELECT
@@ -428,14 +464,6 @@ class DetectionExportService:
         :func:`gate_action`. If the request is denied at gate-time, the
         endpoint returns 403 BEFORE any chunk is yielded.
         """
-        annotations = await self._fetch_annotations_for_export(
-            project_id=project_id,
-            status=status,
-            tag_id=tag_id,
-            dataset_id=dataset_id,
-            detection_run_id=detection_run_id,
-            search_session_id=search_session_id,
-        )
         project = await self._load_project(project_id)
         license_value = (
             project.license
@@ -443,7 +471,6 @@ class DetectionExportService:
             else ""
         )
         license_history_url = self._build_license_history_url(project_id)
-        recording_h3_map = await self._build_recording_h3_resolution_map(annotations)
 
         user_id = getattr(current_user, "id", None)
         request_id = getattr(getattr(request, "state", None), "request_id", "") or ""
@@ -455,48 +482,78 @@ class DetectionExportService:
         except Exception:  # noqa: BLE001 — defensive against test stubs
             user_agent = ""
 
+        # One writer for the whole export; its buffer is drained into a
+        # chunk at every batch end and before every re-check.
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=CAMTRAPDP_OBSERVATION_COLUMNS)
+
         # ----- emit header row (commits the response) ---------------------
-        header_buf = io.StringIO()
-        header_writer = csv.DictWriter(header_buf, fieldnames=CAMTRAPDP_OBSERVATION_COLUMNS)
-        header_writer.writeheader()
-        yield header_buf.getvalue().encode("utf-8")
+        writer.writeheader()
+        yield _drain(buffer)
 
         # ----- emit rows + periodic re-check ------------------------------
-        for index, ann in enumerate(annotations):
-            if index > 0 and index % CSV_RECHECK_INTERVAL == 0:
-                try:
-                    await recheck_action_permission(
-                        db=self.db,
-                        action=action,
-                        project_id=project_id,
-                        current_user=current_user,
-                        request=request,
-                    )
-                except PermissionRevokedMidStream as exc:
-                    await audit_stream_revoked(
-                        project_id=project_id,
-                        user_id=user_id,
-                        stream_type=stream_type,
-                        request_id=request_id,
-                        ip=ip,
-                        user_agent=user_agent,
-                        reason=str(exc),
+        recording_h3_map: dict[UUID, int] = {}
+        index = 0
+        async with aclosing(
+            self._stream_annotations_for_export(
+                project_id=project_id,
+                status=status,
+                tag_id=tag_id,
+                dataset_id=dataset_id,
+                detection_run_id=detection_run_id,
+                search_session_id=search_session_id,
+            )
+        ) as batches:
+            async for batch in batches:
+                # Rows come ordered by recording, so only the recordings
+                # new to this batch need their Site resolution looked up.
+                batch_recordings = {ann.recording_id for ann in batch}
+                recording_h3_map = {
+                    rec_id: res
+                    for rec_id, res in recording_h3_map.items()
+                    if rec_id in batch_recordings
+                }
+                recording_h3_map.update(
+                    await self._build_recording_h3_resolution_map(
+                        [ann for ann in batch if ann.recording_id not in recording_h3_map]
                     )
-                    yield SENTINEL_BYTES
-                    return
-
-            row_buf = io.StringIO()
-            row_writer = csv.DictWriter(row_buf, fieldnames=CAMTRAPDP_OBSERVATION_COLUMNS)
-            row_writer.writerow(
-                self._build_csv_row(
-                    ann,
-                    project=project,
-                    license_value=license_value,
-                    license_history_url=license_history_url,
-                    recording_h3_map=recording_h3_map,
                 )
-            )
-            yield row_buf.getvalue().encode("utf-8")
+                for ann in batch:
+                    if index > 0 and index % CSV_RECHECK_INTERVAL == 0:
+                        if buffer.tell():
+                            yield _drain(buffer)
+                        try:
+                            await recheck_action_permission(
+                                db=self.db,
+                                action=action,
+                                project_id=project_id,
+                                current_user=current_user,
+                                request=request,
+                            )
+                        except PermissionRevokedMidStream as exc:
+                            await audit_stream_revoked(
+                                project_id=project_id,
+                                user_id=user_id,
+                                stream_type=stream_type,
+                                request_id=request_id,
+                                ip=ip,
+                                user_agent=user_agent,
+                                reason=str(exc),
+                            )
+                            yield SENTINEL_BYTES
+                            return
+                    writer.writerow(
+                        self._build_csv_row(
+                            ann,
+                            project=project,
+                            license_value=license_value,
+                            license_history_url=license_history_url,
+                            recording_h3_map=recording_h3_map,
+                        )
+                    )
+                    index += 1
+                if buffer.tell():
+                    yield _drain(buffer)
 
     async def export_ml_dataset(
         self,
@@ -506,6 +563,39 @@ class DetectionExportService:
     ) -> bytes:
         """Export ML training dataset as ZIP bytes.
 
+        Buffers the whole archive in memory; the background export job
+        (:mod:`echoroo.workers.detection_export_tasks`) streams
+        :meth:`write_ml_dataset` to object storage instead and should be
+        preferred for anything but small projects.
+
+        Args:
+            project_id: Project UUID to scope the export
+            dataset_id: Optional dataset UUID filter
+            detection_run_id: Optional detection run UUID filter
+
+        Returns:
+            ZIP archive as bytes
+        """
+        buffer = io.BytesIO()
+        await self.write_ml_dataset(
+            buffer,
+            project_id=project_id,
+            dataset_id=dataset_id,
+            detection_run_id=detection_run_id,
+        )
+        return buffer.getvalue()
+
+    async def write_ml_dataset(
+        self,
+        out: BinaryIO,
+        *,
+        project_id: UUID,
+        dataset_id: UUID | None = None,
+        detection_run_id: UUID | None = None,
+        on_batch: Callable[[int], Awaitable[None]] | None = None,
+    ) -> MlDatasetStats:
+        """Write the ML training dataset ZIP to ``out``.
+
         The ZIP archive contains:
         - annotations.csv: Clip-level annotations with audio file references
         - metadata.json: Export metadata including counts and species list
@@ -515,102 +605,76 @@ class DetectionExportService:
         derived from confirmed regions that have no overlapping confirmed
         annotation (i.e. the reviewer listened but confirmed no species).
 
+        Positives and negatives are each read by ONE ordered query selecting
+        only the CSV columns, streamed from a server-side cursor in batches
+        of :data:`ML_EXPORT_BATCH_SIZE` and written straight into the
+        archive, so memory does not grow with the project. ``out`` does not
+        need to be seekable.
+
         Args:
+            out: Writable binary file object receiving the ZIP
             project_id: Project UUID to scope the export
             dataset_id: Optional dataset UUID filter
             detection_run_id: Optional detection run UUID filter
+            on_batch: Awaited with the number of entries written so far
+                after every batch
 
         Returns:
-            ZIP archive as bytes
+            Entry counts and species of the export
         """
-        # Fetch confirmed annotations (positive examples)
-        confirmed = await self._fetch_annotations_for_export(
-            project_id=project_id,
-            status=DetectionStatus.CONFIRMED,
-            dataset_id=dataset_id,
-            detection_run_id=detection_run_id,
-        )
-
-        # Fetch confirmed regions for deriving negative examples
-        confirmed_regions = await self._fetch_confirmed_regions(
-            project_id=project_id,
-            dataset_id=dataset_id,
-        )
-
-        # Build annotation entries from confirmed detections
-        entries: list[_AnnotationEntry] = []
-        for ann in confirmed:
-            entries.append({
-                "recording_filename": ann.recording.filename if ann.recording else "",
-                "recording_path": ann.recording.path if ann.recording else "",
-                "start_time": ann.start_time,
-                "end_time": ann.end_time,
-                "species": ann.tag.name if ann.tag else "",
-                "confidence": ann.confidence,
-                "label": "positive",
-            })
-
-        # Derive negative entries from confirmed regions that do not overlap
-        # with any positive annotation in the same recording
-        for region in confirmed_regions:
-            region_filename = region.recording.filename if region.recording else ""
-            has_positive_overlap = False
-            for e in entries:
-                if (
-                    e["recording_filename"] == region_filename
-                    and e["start_time"] <= region.end_time
-                    and e["end_time"] >= region.start_time
-                    and e["label"] == "positive"
-                ):
-                    has_positive_overlap = True
-                    break
-            if not has_positive_overlap:
-                entries.append({
-                    "recording_filename": region_filename,
-                    "recording_path": region.recording.path if region.recording else "",
-                    "start_time": region.start_time,
-                    "end_time": region.end_time,
-                    "species": "",
-                    "confidence": None,
-                    "label": "negative",
-                })
-
-        # Assemble ZIP archive in memory
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        stats = MlDatasetStats()
+        with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
             # --- annotations.csv ---
-            csv_output = io.StringIO()
-            writer = csv.writer(csv_output)
-            writer.writerow([
-                "recording_filename",
-                "start_time",
-                "end_time",
-                "species",
-                "confidence",
-                "label",
-            ])
-            for entry in entries:
-                writer.writerow([
-                    entry["recording_filename"],
-                    f"{entry['start_time']:.3f}",
-                    f"{entry['end_time']:.3f}",
-                    entry["species"],
-                    f"{entry['confidence']:.4f}" if entry["confidence"] is not None else "",
-                    entry["label"],
-                ])
-            zf.writestr("annotations.csv", csv_output.getvalue())
+            with io.TextIOWrapper(
+                zf.open("annotations.csv", "w", force_zip64=True),
+                encoding="utf-8",
+                newline="",
+            ) as csv_output:
+                writer = csv.writer(csv_output)
+                writer.writerow(_ML_CSV_HEADER)
+                async for rows in self._iter_ml_positive_batches(
+                    project_id, dataset_id, detection_run_id
+                ):
+                    for filename, start_time, end_time, species, confidence, _id in rows:
+                        writer.writerow([
+                            filename,
+                            f"{start_time:.3f}",
+                            f"{end_time:.3f}",
+                            species or "",
+                            f"{confidence:.4f}" if confidence is not None else "",
+                            "positive",
+                        ])
+                        if species:
+                            stats.species.add(species)
+                    stats.positive_count += len(rows)
+                    if on_batch is not None:
+                        await on_batch(stats.total_entries)
+                async for rows in self._iter_ml_negative_batches(
+                    project_id, dataset_id, detection_run_id
+                ):
+                    for filename, start_time, end_time, _id in rows:
+                        writer.writerow([
+                            filename,
+                            f"{start_time:.3f}",
+                            f"{end_time:.3f}",
+                            "",
+                            "",
+                            "negative",
+                        ])
+                    stats.negative_count += len(rows)
+                    if on_batch is not None:
+                        await on_batch(stats.total_entries)
 
             # --- metadata.json ---
             exported_at = datetime.now(UTC).isoformat()
-            species_set: set[str] = {e["species"] for e in entries if e["species"]}
-            species_list = sorted(species_set)
+            species_list = sorted(stats.species)
             metadata = {
                 "project_id": str(project_id),
                 "dataset_id": str(dataset_id) if dataset_id else None,
                 "exported_at": exported_at,
-                "total_entries": len(entries),
-                "positive_count": sum(1 for e in entries if e["label"] == "positive"),
-                "negative_count": sum(1 for e in entries if e["label"] == "negative"),
+                "total_entries": stats.total_entries,
+                "positive_count": stats.positive_count,
+                "negative_count": stats.negative_count,
                 "species": species_list,
             }
             zf.writestr("metadata.json", json.dumps(metadata, indent=2))
@@ -637,43 +701,122 @@ class DetectionExportService:
             ]
             zf.writestr("README.txt", "\n".join(readme_lines))
 
-        return zip_buffer.getvalue()
+        return stats
 
-    async def _fetch_annotations_for_export(
+    async def _stream_batches(self, query: Select[Any]) -> AsyncIterator[list[Row[Any]]]:
+        """Yield the rows of one ordered ``query`` from a server-side cursor.
+
+        The query runs once and is read in partitions of
+        :data:`ML_EXPORT_BATCH_SIZE`, so the matching rows are sorted (or
+        the index walked) a single time however large the export is.
+        """
+        result = await self.db.stream(
+            query.execution_options(yield_per=ML_EXPORT_BATCH_SIZE)
+        )
+        try:
+            async for batch in result.partitions():
+                yield list(batch)
+        finally:
+            await result.close()
+
+    def _iter_ml_positive_batches(
         self,
+        project_id: UUID,
+        dataset_id: UUID | None,
+        detection_run_id: UUID | None,
+    ) -> AsyncIterator[list[Row[Any]]]:
+        """Confirmed annotations as ``(filename, start, end, species, confidence, id)``."""
+        query = (
+            select(
+                Recording.filename,
+                RecordingAnnotation.start_time,
+                RecordingAnnotation.end_time,
+                Tag.name,
+                RecordingAnnotation.confidence,
+                RecordingAnnotation.id,
+            )
+            .select_from(RecordingAnnotation)
+            .join(Recording, RecordingAnnotation.recording_id == Recording.id)
+            .join(Dataset, Recording.dataset_id == Dataset.id)
+            .outerjoin(Tag, RecordingAnnotation.tag_id == Tag.id)
+            .where(
+                Dataset.project_id == project_id,
+                RecordingAnnotation.status == DetectionStatus.CONFIRMED,
+            )
+            .order_by(Recording.filename, RecordingAnnotation.start_time, RecordingAnnotation.id)
+        )
+        if dataset_id is not None:
+            query = query.where(Recording.dataset_id == dataset_id)
+        if detection_run_id is not None:
+            query = query.where(RecordingAnnotation.detection_run_id == detection_run_id)
+        return self._stream_batches(query)
+
+    def _iter_ml_negative_batches(
+        self,
+        project_id: UUID,
+        dataset_id: UUID | None,
+        detection_run_id: UUID | None,
+    ) -> AsyncIterator[list[Row[Any]]]:
+        """Confirmed regions with no overlapping positive as ``(filename, start, end, id)``.
+
+        A positive overlaps a region when it is in the export and belongs to
+        a recording with the same filename.
+        """
+        positive = aliased(RecordingAnnotation)
+        positive_recording = aliased(Recording)
+        positive_dataset = aliased(Dataset)
+        overlapping = (
+            select(positive.id)
+            .join(positive_recording, positive.recording_id == positive_recording.id)
+            .join(positive_dataset, positive_recording.dataset_id == positive_dataset.id)
+            .where(
+                positive_dataset.project_id == project_id,
+                positive.status == DetectionStatus.CONFIRMED,
+                positive_recording.filename == Recording.filename,
+                positive.start_time <= ConfirmedRegion.end_time,
+                positive.end_time >= ConfirmedRegion.start_time,
+            )
+        )
+        if dataset_id is not None:
+            overlapping = overlapping.where(positive_recording.dataset_id == dataset_id)
+        if detection_run_id is not None:
+            overlapping = overlapping.where(positive.detection_run_id == detection_run_id)
+
+        query = (
+            select(
+                Recording.filename,
+                ConfirmedRegion.start_time,
+                ConfirmedRegion.end_time,
+                ConfirmedRegion.id,
+            )
+            .select_from(ConfirmedRegion)
+            .join(Recording, ConfirmedRegion.recording_id == Recording.id)
+            .join(Dataset, Recording.dataset_id == Dataset.id)
+            .where(Dataset.project_id == project_id, ~overlapping.exists())
+            .order_by(Recording.filename, ConfirmedRegion.start_time, ConfirmedRegion.id)
+        )
+        if dataset_id is not None:
+            query = query.where(Recording.dataset_id == dataset_id)
+        return self._stream_batches(query)
+
+    @staticmethod
+    def _annotations_export_query(
         project_id: UUID,
         status: DetectionStatus | None = None,
         tag_id: UUID | None = None,
         dataset_id: UUID | None = None,
         detection_run_id: UUID | None = None,
         search_session_id: UUID | None = None,
-    ) -> list[RecordingAnnotation]:
-        """Fetch annotations with all relationships needed for export.
+    ) -> Select[tuple[RecordingAnnotation]]:
+        """Build the filtered, ordered annotation query shared by the exports.
 
         Joins through Recording -> Dataset to enforce project-level scoping.
-
-        Args:
-            project_id: Project UUID for scoping
-            status: Optional status filter
-            tag_id: Optional tag UUID filter
-            dataset_id: Optional dataset UUID filter
-            detection_run_id: Optional detection run UUID filter
-            search_session_id: Optional search session UUID filter
-
-        Returns:
-            List of Annotation instances with eagerly loaded relationships
         """
         query = (
             select(RecordingAnnotation)
             .join(Recording, RecordingAnnotation.recording_id == Recording.id)
             .join(Dataset, Recording.dataset_id == Dataset.id)
             .where(Dataset.project_id == project_id)
-            .options(
-                selectinload(RecordingAnnotation.recording),
-                selectinload(RecordingAnnotation.tag),
-                selectinload(RecordingAnnotation.detection_run),
-                selectinload(RecordingAnnotation.reviewed_by),
-            )
             .order_by(Recording.filename, RecordingAnnotation.start_time)
         )
 
@@ -687,37 +830,95 @@ class DetectionExportService:
             query = query.where(RecordingAnnotation.detection_run_id == detection_run_id)
         if search_session_id is not None:
             query = query.where(RecordingAnnotation.search_session_id == search_session_id)
+        return query
 
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
-
-    async def _fetch_confirmed_regions(
+    async def _fetch_annotations_for_export(
         self,
         project_id: UUID,
+        status: DetectionStatus | None = None,
+        tag_id: UUID | None = None,
         dataset_id: UUID | None = None,
-    ) -> list[ConfirmedRegion]:
-        """Fetch confirmed regions with recording relationships for export.
+        detection_run_id: UUID | None = None,
+        search_session_id: UUID | None = None,
+    ) -> list[RecordingAnnotation]:
+        """Fetch annotations with all relationships needed for export.
 
         Joins through Recording -> Dataset to enforce project-level scoping.
 
         Args:
             project_id: Project UUID for scoping
+            status: Optional status filter
+            tag_id: Optional tag UUID filter
             dataset_id: Optional dataset UUID filter
+            detection_run_id: Optional detection run UUID filter
+            search_session_id: Optional search session UUID filter
 
         Returns:
-            List of ConfirmedRegion instances with eagerly loaded recording
+            List of Annotation instances with eagerly loaded relationships
         """
-        query = (
-            select(ConfirmedRegion)
-            .join(Recording, ConfirmedRegion.recording_id == Recording.id)
-            .join(Dataset, Recording.dataset_id == Dataset.id)
-            .where(Dataset.project_id == project_id)
-            .options(selectinload(ConfirmedRegion.recording))
-            .order_by(Recording.filename, ConfirmedRegion.start_time)
+        query = self._annotations_export_query(
+            project_id,
+            status=status,
+            tag_id=tag_id,
+            dataset_id=dataset_id,
+            detection_run_id=detection_run_id,
+            search_session_id=search_session_id,
+        ).options(
+            selectinload(RecordingAnnotation.recording),
+            selectinload(RecordingAnnotation.tag),
+            selectinload(RecordingAnnotation.detection_run),
+            selectinload(RecordingAnnotation.reviewed_by),
         )
-
-        if dataset_id is not None:
-            query = query.where(Recording.dataset_id == dataset_id)
-
         result = await self.db.execute(query)
         return list(result.scalars().all())
+
+    async def _stream_annotations_for_export(
+        self,
+        project_id: UUID,
+        status: DetectionStatus | None = None,
+        tag_id: UUID | None = None,
+        dataset_id: UUID | None = None,
+        detection_run_id: UUID | None = None,
+        search_session_id: UUID | None = None,
+    ) -> AsyncIterator[list[RecordingAnnotation]]:
+        """Yield export annotations in batches from a server-side cursor.
+
+        Every relationship :meth:`_build_csv_row` reads is many-to-one, so
+        it is loaded in the same statement (the already joined recording
+        and dataset via ``contains_eager``, the rest via ``joinedload``)
+        rather than by a ``selectinload`` round trip per batch.
+
+        Args:
+            project_id: Project UUID for scoping
+            status: Optional status filter
+            tag_id: Optional tag UUID filter
+            dataset_id: Optional dataset UUID filter
+            detection_run_id: Optional detection run UUID filter
+            search_session_id: Optional search session UUID filter
+
+        Yields:
+            Lists of up to :data:`CSV_EXPORT_BATCH_SIZE` annotations
+        """
+        query = (
+            self._annotations_export_query(
+                project_id,
+                status=status,
+                tag_id=tag_id,
+                dataset_id=dataset_id,
+                detection_run_id=detection_run_id,
+                search_session_id=search_session_id,
+            )
+            .options(
+                contains_eager(RecordingAnnotation.recording).contains_eager(Recording.dataset),
+                joinedload(RecordingAnnotation.tag),
+                joinedload(RecordingAnnotation.detection_run),
+                joinedload(RecordingAnnotation.reviewed_by),
+            )
+            .execution_options(yield_per=CSV_EXPORT_BATCH_SIZE)
+        )
+        result = await self.db.stream_scalars(query)
+        try:
+            async for batch in result.partitions():
+                yield list(batch)
+        finally:
+            await result.close()
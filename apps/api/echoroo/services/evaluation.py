@@ -229,6 +229,7 @@ class EvaluationService:
                     f1=overall_row.f1,
                     detections_total=overall_row.tp_precision + overall_row.fp,
                     ground_truths_total=overall_row.tp_recall + overall_row.fn,
+                    pr_curve=overall_row.pr_curve or [],
                 )
                 if overall_row is not None
                 else OverallMetric(
@@ -1,6 +1,5 @@
 """Export service for CamtrapDP-style dataset export."""
 
-import asyncio
 import csv
 import io
 import json
@@ -12,6 +11,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from echoroo.core import s3_async
 from echoroo.repositories.dataset import DatasetRepository
 from echoroo.repositories.recording import RecordingRepository
 from echoroo.services.audio import AudioService
@@ -427,7 +427,7 @@ class ExportService:
 
                     for recording in recordings:
                         try:
-                            file_path = await asyncio.to_thread(
+                            file_path = await s3_async.run_blocking(
                                 self.audio_service.ensure_file_local, recording.path
                             )
                             zf.write(file_path, f"data/{recording.path}")
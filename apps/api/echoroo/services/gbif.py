@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
 from echoroo.core.exceptions import GBIFUnavailableError
+from echoroo.core.http_clients import GBIF, INATURALIST, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +20,6 @@ logger = logging.getLogger(__name__)
 # is never mistaken for a legitimate empty result.
 _HTTP_FAILURE = (httpx.HTTPStatusError, httpx.RequestError)
 
-# Rate limiter: 10 calls per second
-GBIF_RATE_LIMIT_CALLS = 10
-GBIF_RATE_LIMIT_PERIOD = 1.0
-
 GBIF_BASE_URL = "https://api.gbif.org/v1"
 INATURALIST_BASE_URL = "https://api.inaturalist.org/v1"
 GBIF_BACKBONE_DATASET_KEY = "d7dddbf4-2cf0-4f39-9b2a-bb099caae36c"
@@ -96,29 +92,13 @@ class GBIFResolveResult:
     metadata: dict[str, object]
 
 
-@dataclass
-class RateLimiter:
-    """Simple token-bucket rate limiter."""
-
-    max_calls: int = GBIF_RATE_LIMIT_CALLS
-    period: float = GBIF_RATE_LIMIT_PERIOD
-    _timestamps: list[float] = field(default_factory=list)
-
-    async def acquire(self) -> None:
-        now = time.monotonic()
-        self._timestamps = [t for t in self._timestamps if now - t < self.period]
-        if len(self._timestamps) >= self.max_calls:
-            sleep_time = self.period - (now - self._timestamps[0])
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-        self._timestamps.append(time.monotonic())
-
-
 class GBIFService:
-    """Service for interacting with the GBIF API."""
+    """Service for interacting with the GBIF API.
 
-    def __init__(self) -> None:
-        self._rate_limiter = RateLimiter()
+    Requests go through the shared GBIF / iNaturalist clients of
+    :mod:`echoroo.core.http_clients`, whose per-host concurrency cap
+    throttles every caller in the process together.
+    """
 
     async def search_species_full(
         self,
@@ -157,20 +137,18 @@ class GBIFService:
         # the zero-extra-call path and lets ``ja-JP`` enrich like ``ja``.
         locale = _normalize_locale(locale)
 
-        await self._rate_limiter.acquire()
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(
-                    f"{GBIF_BASE_URL}/species/search",
-                    params={
-                        "q": query,
-                        "limit": limit,
-                        "datasetKey": GBIF_BACKBONE_DATASET_KEY,
-                        "status": "ACCEPTED",
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client(GBIF).get(
+                f"{GBIF_BASE_URL}/species/search",
+                params={
+                    "q": query,
+                    "limit": limit,
+                    "datasetKey": GBIF_BACKBONE_DATASET_KEY,
+                    "status": "ACCEPTED",
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
         except Exception:
             # Interactive autocomplete path: degrade to an empty result set so
             # the UI stays responsive, but log at ERROR so an outage is visible.
@@ -216,15 +194,13 @@ class GBIFService:
             List of parsed species result dicts compatible with the standard
             search_species_full output format.
         """
-        await self._rate_limiter.acquire()
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(
-                    f"{INATURALIST_BASE_URL}/taxa",
-                    params={"q": query, "limit": limit, "locale": "ja"},
-                )
-                resp.raise_for_status()
-                inat_data = resp.json()
+            resp = await get_http_client(INATURALIST).get(
+                f"{INATURALIST_BASE_URL}/taxa",
+                params={"q": query, "limit": limit, "locale": "ja"},
+            )
+            resp.raise_for_status()
+            inat_data = resp.json()
         except Exception:
             # Interactive autocomplete fallback path: degrade to empty results.
             logger.error(
@@ -239,57 +215,56 @@ class GBIFService:
         parsed: list[dict[str, Any]] = []
         seen_keys: set[int] = set()
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            for inat in inat_results[:limit]:
-                sci_name: str = inat.get("name") or ""
-                common_name: str = inat.get("preferred_common_name") or ""
-                rank: str = (inat.get("rank") or "").upper()
+        client = get_http_client(GBIF)
+        for inat in inat_results[:limit]:
+            sci_name: str = inat.get("name") or ""
+            common_name: str = inat.get("preferred_common_name") or ""
+            rank: str = (inat.get("rank") or "").upper()
 
-                if not sci_name:
-                    continue
+            if not sci_name:
+                continue
 
-                # Resolve scientific name to GBIF backbone taxon key
-                await self._rate_limiter.acquire()
-                try:
-                    match_resp = await client.get(
-                        f"{GBIF_BASE_URL}/species/match",
-                        params={"name": sci_name, "strict": "false"},
-                    )
-                    match_resp.raise_for_status()
-                    gbif_match = match_resp.json()
-                except Exception:
-                    logger.error(
-                        "GBIF species/match failed for name=%s", sci_name, exc_info=True
-                    )
-                    continue
+            # Resolve scientific name to GBIF backbone taxon key
+            try:
+                match_resp = await client.get(
+                    f"{GBIF_BASE_URL}/species/match",
+                    params={"name": sci_name, "strict": "false"},
+                )
+                match_resp.raise_for_status()
+                gbif_match = match_resp.json()
+            except Exception:
+                logger.error(
+                    "GBIF species/match failed for name=%s", sci_name, exc_info=True
+                )
+                continue
 
-                if gbif_match.get("matchType") == "NONE" or "usageKey" not in gbif_match:
-                    continue
+            if gbif_match.get("matchType") == "NONE" or "usageKey" not in gbif_match:
+                continue
 
-                gbif_key = int(gbif_match["usageKey"])
-                if gbif_key in seen_keys:
-                    continue
-                seen_keys.add(gbif_key)
-
-                # Build vernacular names list; inject iNaturalist common name as Japanese entry
-                vernacular_names: list[dict[str, str]] = []
-                if common_name:
-                    vernacular_names.append({"name": common_name, "language": "ja"})
-
-                entry: dict[str, Any] = {
-                    "gbif_key": gbif_key,
-                    "scientific_name": gbif_match.get("scientificName") or sci_name,
-                    "canonical_name": gbif_match.get("canonicalName") or sci_name,
-                    "rank": gbif_match.get("rank") or rank or None,
-                    "vernacular_name": common_name or None,
-                    "vernacular_names": vernacular_names if vernacular_names else None,
-                    "kingdom": gbif_match.get("kingdom"),
-                    "phylum": gbif_match.get("phylum"),
-                    "class_name": gbif_match.get("class"),
-                    "order": gbif_match.get("order"),
-                    "family": gbif_match.get("family"),
-                }
-                parsed.append(entry)
+            gbif_key = int(gbif_match["usageKey"])
+            if gbif_key in seen_keys:
+                continue
+            seen_keys.add(gbif_key)
+
+            # Build vernacular names list; inject iNaturalist common name as Japanese entry
+            vernacular_names: list[dict[str, str]] = []
+            if common_name:
+                vernacular_names.append({"name": common_name, "language": "ja"})
+
+            entry: dict[str, Any] = {
+                "gbif_key": gbif_key,
+                "scientific_name": gbif_match.get("scientificName") or sci_name,
+                "canonical_name": gbif_match.get("canonicalName") or sci_name,
+                "rank": gbif_match.get("rank") or rank or None,
+                "vernacular_name": common_name or None,
+                "vernacular_names": vernacular_names if vernacular_names else None,
+                "kingdom": gbif_match.get("kingdom"),
+                "phylum": gbif_match.get("phylum"),
+                "class_name": gbif_match.get("class"),
+                "order": gbif_match.get("order"),
+                "family": gbif_match.get("family"),
+            }
+            parsed.append(entry)
 
         return parsed
 
@@ -407,15 +382,13 @@ class GBIFService:
 
     async def search_species(self, query: str, limit: int = 10) -> list[dict[str, object]]:
         """Search GBIF species suggest API."""
-        await self._rate_limiter.acquire()
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(
-                    f"{GBIF_BASE_URL}/species/suggest",
-                    params={"q": query, "limit": limit},
-                )
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
+            resp = await get_http_client(GBIF).get(
+                f"{GBIF_BASE_URL}/species/suggest",
+                params={"q": query, "limit": limit},
+            )
+            resp.raise_for_status()
+            return resp.json()  # type: ignore[no-any-return]
         except Exception:
             # Interactive suggest path (tag autocomplete): degrade to empty.
             logger.error("GBIF search failed for query=%s", query, exc_info=True)
@@ -423,15 +396,13 @@ class GBIFService:
 
     async def resolve_taxon(self, scientific_name: str) -> GBIFResolveResult | None:
         """Resolve a scientific name to a GBIF taxon key + metadata."""
-        await self._rate_limiter.acquire()
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(
-                    f"{GBIF_BASE_URL}/species/match",
-                    params={"name": scientific_name, "strict": "false"},
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client(GBIF).get(
+                f"{GBIF_BASE_URL}/species/match",
+                params={"name": scientific_name, "strict": "false"},
+            )
+            resp.raise_for_status()
+            data = resp.json()
         except _HTTP_FAILURE as exc:
             # Batch/resolution path: surface the outage instead of returning
             # ``None`` (which the caller would treat as "no GBIF match found").
@@ -466,15 +437,13 @@ class GBIFService:
 
         Returns list of dicts with keys: locale, name.
         """
-        await self._rate_limiter.acquire()
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(
-                    f"{GBIF_BASE_URL}/species/{taxon_key}/vernacularNames",
-                    params={"limit": 200},
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client(GBIF).get(
+                f"{GBIF_BASE_URL}/species/{taxon_key}/vernacularNames",
+                params={"limit": 200},
+            )
+            resp.raise_for_status()
+            data = resp.json()
         except _HTTP_FAILURE as exc:
             # Batch/resolution path: surface the outage instead of returning an
             # empty list (which the caller would treat as "no names found").
@@ -674,13 +643,13 @@ class GBIFService:
 
         name: str | None = None
         try:
-            async with httpx.AsyncClient(timeout=_ENRICH_SOURCE_TIMEOUT) as client:
-                resp = await client.get(
-                    f"{INATURALIST_BASE_URL}/taxa",
-                    params={"q": canonical_name, "locale": locale, "per_page": 10},
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client(INATURALIST).get(
+                f"{INATURALIST_BASE_URL}/taxa",
+                params={"q": canonical_name, "locale": locale, "per_page": 10},
+                timeout=_ENRICH_SOURCE_TIMEOUT,
+            )
+            resp.raise_for_status()
+            data = resp.json()
         except Exception:
             logger.debug(
                 "iNat vernacular lookup failed for name=%s", canonical_name,
@@ -741,20 +710,19 @@ class GBIFService:
         # GBIF expects the 3-letter language code on the result rows; the
         # existing get_vernacular_names already normalises jpn→ja internally and
         # filters by the 2-letter ``locale``.
-        # Route through the shared GBIF rate limiter like every other GBIF call.
-        # If the limiter wait pushes past the per-source timeout/total budget the
-        # existing timeout/fallback handles it gracefully. The iNat host is on a
-        # separate origin and is intentionally NOT throttled here.
+        # Shares the GBIF client (and its concurrency cap) with every other
+        # GBIF call. If waiting for a slot pushes past the total budget the
+        # existing timeout/fallback handles it gracefully. The iNat host has
+        # its own client and cap.
         name: str | None = None
         try:
-            await self._rate_limiter.acquire()
-            async with httpx.AsyncClient(timeout=_ENRICH_SOURCE_TIMEOUT) as client:
-                resp = await client.get(
-                    f"{GBIF_BASE_URL}/species/{gbif_key}/vernacularNames",
-                    params={"limit": 200},
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client(GBIF).get(
+                f"{GBIF_BASE_URL}/species/{gbif_key}/vernacularNames",
+                params={"limit": 200},
+                timeout=_ENRICH_SOURCE_TIMEOUT,
+            )
+            resp.raise_for_status()
+            data = resp.json()
         except Exception:
             logger.debug(
                 "GBIF vernacular lookup failed for key=%s", gbif_key, exc_info=True
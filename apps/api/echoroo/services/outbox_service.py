@@ -10,9 +10,13 @@ audit log row that survives a worker crash). The flow is:
    the mutation share the transaction, the outbox row exists if and only
    if the business change was committed (FR-076a).
 
-2. A pool of Celery worker-cpu processes polls the table with
-   ``SELECT ... FOR UPDATE SKIP LOCKED`` so that 4 parallel workers never
-   double-process the same row (research.md §6).
+2. The INSERT also issues ``pg_notify`` on :data:`OUTBOX_NOTIFY_CHANNEL`;
+   PostgreSQL delivers it when (and only if) the transaction commits. The
+   long-lived :mod:`echoroo.workers.outbox_listener` process LISTENs on
+   that channel and claims rows with ``SELECT ... FOR UPDATE SKIP LOCKED``
+   so that parallel consumers never double-process the same row
+   (research.md §6). The beat-driven Celery task stays as the polling
+   safety net.
 
 3. Each worker invokes the registered handler for ``event_type``. The
    handler MUST be idempotent — if the worker crashes between handler
@@ -76,6 +80,12 @@ DEFAULT_CLAIM_BATCH_SIZE: Final[int] = 50
 #: authentication time (FR-076d, SC-021).
 STALL_THRESHOLD: Final[timedelta] = timedelta(minutes=5)
 
+#: ``LISTEN`` / ``NOTIFY`` channel :func:`enqueue` signals on. The payload
+#: is the ``event_type`` and is informational only — consumers always
+#: re-claim from the table, so a lost notification costs latency, never
+#: an event.
+OUTBOX_NOTIFY_CHANNEL: Final[str] = "outbox_events"
+
 
 # -- Status constants ---------------------------------------------------------
 
@@ -155,16 +165,21 @@ async def enqueue(
     # both newly-inserted and already-existing rows uniformly. The fake
     # update of ``retry_count = retry_count`` is a no-op SET that lets the
     # RETURNING clause fire on the conflict path (Postgres requires SET
-    # for DO UPDATE).
+    # for DO UPDATE). ``pg_notify`` rides along in the same statement; the
+    # notification is queued until commit and dropped on rollback, and
+    # PostgreSQL folds duplicates within one transaction.
     stmt = sa.text(
         """
-        INSERT INTO outbox_events
-            (event_type, payload, status, retry_count, next_retry_at, idempotency_key, created_at)
-        VALUES
-            (:event_type, CAST(:payload AS JSONB), :status, 0, :next_retry_at, :idempotency_key, :created_at)
-        ON CONFLICT (idempotency_key) DO UPDATE
-            SET retry_count = outbox_events.retry_count
-        RETURNING id
+        WITH enqueued AS (
+            INSERT INTO outbox_events
+                (event_type, payload, status, retry_count, next_retry_at, idempotency_key, created_at)
+            VALUES
+                (:event_type, CAST(:payload AS JSONB), :status, 0, :next_retry_at, :idempotency_key, :created_at)
+            ON CONFLICT (idempotency_key) DO UPDATE
+                SET retry_count = outbox_events.retry_count
+            RETURNING id
+        )
+        SELECT id, pg_notify(:channel, :event_type) FROM enqueued
         """
     )
     import json
@@ -178,6 +193,7 @@ async def enqueue(
             "next_retry_at": next_retry_at,
             "idempotency_key": idempotency_key,
             "created_at": now,
+            "channel": OUTBOX_NOTIFY_CHANNEL,
         },
     )
     row = result.first()
@@ -216,14 +232,15 @@ async def claim_batch(
 
     Returns:
         List of row dicts (id / event_type / payload / retry_count /
-        idempotency_key). Empty list when the queue is drained.
+        idempotency_key / created_at). Empty list when the queue is
+        drained.
     """
     if batch_size <= 0:
         raise ValueError("batch_size must be positive")
 
     select_stmt = sa.text(
         """
-        SELECT id, event_type, payload, retry_count, idempotency_key
+        SELECT id, event_type, payload, retry_count, idempotency_key, created_at
         FROM outbox_events
         WHERE status = :pending
           AND (next_retry_at IS NULL OR next_retry_at <= :now)
@@ -264,11 +281,14 @@ async def claim_batch(
 async def mark_done(session: AsyncSession, event_id: UUID) -> None:
     """Mark an outbox row as successfully processed and scrub its payload.
 
-    The handler is responsible for being idempotent — if the worker
-    crashes between handler completion and this UPDATE, the row stays in
-    ``processing`` and a watchdog (T093, future phase) will eventually
-    reset it to ``pending`` so a retry can run. Re-running the handler
-    against the same ``idempotency_key`` MUST be a no-op (FR-076a).
+    The processor runs this in the handler's own transaction, so the
+    handler's database effects and the ``done`` state commit or roll back
+    together. The handler is still responsible for being idempotent — a
+    worker killed mid-transaction leaves the row in ``processing`` and
+    :func:`requeue_stuck_processing` eventually resets it to ``pending``
+    so a retry can run, and effects outside the database (e.g. an email
+    already sent) are not rolled back. Re-running the handler against the
+    same ``idempotency_key`` MUST be a no-op (FR-076a).
 
     PII scrub (FR-105)
     ------------------
@@ -453,6 +473,31 @@ async def requeue_stuck_processing(
     return int(rowcount)
 
 
+async def seconds_until_next_due(session: AsyncSession) -> float | None:
+    """Return how long until the earliest pending row becomes claimable.
+
+    ``0.0`` when a row is already due, ``None`` when nothing is pending.
+    The listener sleeps for this long (capped by its fallback poll
+    interval) so rows rescheduled by :func:`mark_failed` are retried on
+    time without a notification. Served by
+    ``ix_outbox_events_status_next_retry``.
+    """
+    stmt = sa.text(
+        """
+        SELECT MIN(COALESCE(next_retry_at, :now)) AS due
+          FROM outbox_events
+         WHERE status = :pending
+        """
+    )
+    now = datetime.now(UTC)
+    result = await session.execute(stmt, {"pending": STATUS_PENDING, "now": now})
+    row = result.first()
+    if row is None or row[0] is None:
+        return None
+    due: datetime = row[0]
+    return max((due - now).total_seconds(), 0.0)
+
+
 async def count_pending_older_than(
     session: AsyncSession,
     age: timedelta,
@@ -525,6 +570,7 @@ __all__ = [
     "CELERY_TASK_MAX_RETRIES",
     "DEFAULT_CLAIM_BATCH_SIZE",
     "MAX_RETRY",
+    "OUTBOX_NOTIFY_CHANNEL",
     "OutboxStallDetector",
     "STALL_THRESHOLD",
     "STATUS_DEAD_LETTER",
@@ -538,4 +584,5 @@ __all__ = [
     "mark_done",
     "mark_failed",
     "requeue_stuck_processing",
+    "seconds_until_next_due",
 ]
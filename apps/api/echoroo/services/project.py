@@ -9,9 +9,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from echoroo.core.pagination import paginate
 from echoroo.models.dataset import Dataset
-from echoroo.models.enums import ProjectMemberRole, ProjectVisibility
+from echoroo.models.deletion_job import DeletionJob
+from echoroo.models.enums import ProjectMemberRole, ProjectStatus, ProjectVisibility
 from echoroo.models.project import Project, ProjectMember
 from echoroo.models.user import User
+from echoroo.repositories.deletion_job import ACTIVE_DELETION_STATUSES, DeletionJobRepository
 from echoroo.repositories.license import LicenseRepository
 from echoroo.repositories.project import ProjectRepository
 from echoroo.repositories.user import UserRepository
@@ -554,15 +556,24 @@ class ProjectService:
         )
         return response
 
-    async def delete_project(self, user_id: UUID, project_id: UUID) -> None:
-        """Delete a project.
+    async def delete_project(self, user_id: UUID, project_id: UUID) -> DeletionJob:
+        """Queue the background deletion of a project.
 
-        Only the project owner can delete projects.
+        Only the project owner can delete projects. The project is marked
+        ``DELETING`` (which blocks the other mutating actions on it) and a
+        queued :class:`~echoroo.models.deletion_job.DeletionJob` is
+        recorded; the caller commits and dispatches
+        :func:`~echoroo.workers.deletion_tasks.run_deletion_job`. Deleting
+        a project whose deletion is still queued or running returns that
+        job; after a failed job a new one is queued.
 
         Args:
             user_id: Current user's UUID
             project_id: Project's UUID
 
+        Returns:
+            Deletion job of the project
+
         Raises:
             HTTPException: If project not found or user is not owner
         """
@@ -580,7 +591,19 @@ class ProjectService:
                 detail="Not project owner",
             )
 
-        await self.project_repo.delete(project_id)
+        job_repo = DeletionJobRepository(self.project_repo.db)
+        if project.status == ProjectStatus.DELETING:
+            existing = await job_repo.get_latest_for_entity("project", project_id)
+            if existing is not None and existing.status in ACTIVE_DELETION_STATUSES:
+                return existing
+
+        project.status = ProjectStatus.DELETING
+        return await job_repo.create(
+            entity_type="project",
+            entity_id=project_id,
+            project_id=project_id,
+            requested_by_user_id=user_id,
+        )
 
     async def list_members(self, user_id: UUID, project_id: UUID) -> list[ProjectMemberResponse]:
         """List all members of a project.
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from echoroo.core.pagination import Cursor, TotalMode
 from echoroo.models.recording import Recording
 from echoroo.repositories.clip import ClipRepository
 from echoroo.repositories.dataset import DatasetRepository
@@ -68,12 +69,14 @@ class RecordingService:
         samplerate: int | None = None,
         sort_by: str = "datetime",
         sort_order: str = "desc",
+        cursor: Cursor | None = None,
+        total_mode: TotalMode = "exact",
     ) -> tuple[list[Recording], int]:
         """List recordings for a dataset.
 
         Args:
             dataset_id: Dataset's UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); ignored when ``cursor`` is given
             page_size: Items per page
             search: Search in filename
             datetime_from: Filter from datetime
@@ -81,12 +84,24 @@ class RecordingService:
             samplerate: Filter by samplerate
             sort_by: Sort column name
             sort_order: Sort order (asc/desc)
+            cursor: Decoded keyset cursor to resume after
+            total_mode: ``"exact"`` or ``"estimate"`` total
 
         Returns:
             Tuple of (list of recordings, total count)
         """
         return await self.repo.list_by_dataset(
-            dataset_id, page, page_size, search, datetime_from, datetime_to, samplerate, sort_by, sort_order
+            dataset_id,
+            page,
+            page_size,
+            search,
+            datetime_from,
+            datetime_to,
+            samplerate,
+            sort_by,
+            sort_order,
+            cursor=cursor,
+            total_mode=total_mode,
         )
 
     async def search_by_project(
@@ -99,24 +114,37 @@ class RecordingService:
         dataset_id: UUID | None = None,
         datetime_from: datetime | None = None,
         datetime_to: datetime | None = None,
+        cursor: Cursor | None = None,
+        total_mode: TotalMode = "exact",
     ) -> tuple[list[Recording], int]:
         """Search recordings across all datasets in a project.
 
         Args:
             project_id: Project's UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); ignored when ``cursor`` is given
             page_size: Items per page
             search: Search in filename
             site_id: Filter by site ID
             dataset_id: Filter by dataset ID
             datetime_from: Filter from datetime
             datetime_to: Filter to datetime
+            cursor: Decoded keyset cursor to resume after
+            total_mode: ``"exact"`` or ``"estimate"`` total
 
         Returns:
             Tuple of (list of recordings, total count)
         """
         return await self.repo.search_by_project(
-            project_id, page, page_size, search, site_id, dataset_id, datetime_from, datetime_to
+            project_id,
+            page,
+            page_size,
+            search,
+            site_id,
+            dataset_id,
+            datetime_from,
+            datetime_to,
+            cursor=cursor,
+            total_mode=total_mode,
         )
 
     async def update(
@@ -9,8 +9,10 @@ All queries are scoped to a project_id to enforce data isolation.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -32,7 +34,11 @@ from echoroo.schemas.search import (
 )
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
     from echoroo.ml.base import InferenceEngine, ModelLoader
+    from echoroo.ml.serving import MicroBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -333,22 +339,31 @@ class SimilaritySearchService:
         if not Path(audio_path).exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        # Retrieve or initialise the model from the process-level cache.
-        # Loading model weights is expensive (several seconds), so we keep a
-        # cached (loader, engine) pair for each model name and reuse it across
-        # requests.
-        try:
-            _, engine = _get_or_load_model(model_name)
-        except ModelNotFoundError as exc:
-            available = ModelRegistry.available_models()
-            raise ValueError(
-                f"Model '{model_name}' not registered. Available: {available}"
-            ) from exc
+        # Prefer the shared inference server: the model stays resident in one
+        # process and concurrent searches are micro-batched together, instead
+        # of this API process loading its own copy of the weights.
+        segment_embeddings = await asyncio.to_thread(
+            _embed_file_via_inference_server, model_name, audio_path
+        )
+
+        if segment_embeddings is None:
+            # Retrieve or initialise the model from the process-level cache.
+            # Loading model weights is expensive (several seconds), so we keep a
+            # cached (loader, engine) pair for each model name and reuse it across
+            # requests.
+            try:
+                _, engine = _get_or_load_model(model_name)
+            except ModelNotFoundError as exc:
+                available = ModelRegistry.available_models()
+                raise ValueError(
+                    f"Model '{model_name}' not registered. Available: {available}"
+                ) from exc
 
-        # Run file inference to get embeddings
-        inference_results = engine.predict_file(Path(audio_path))
+            # Decode off the event loop, then queue the query segment on the
+            # per-model batcher so concurrent searches share one model call.
+            segment_embeddings = await _embed_file_batched(model_name, engine, audio_path)
 
-        if not inference_results:
+        if len(segment_embeddings) == 0:
             logger.warning(
                 "No inference results from audio file %s with model %s",
                 audio_path,
@@ -362,7 +377,7 @@ class SimilaritySearchService:
 
         # Use the first segment's embedding as the representative query vector
         # (for short uploaded clips there will typically be one segment)
-        raw_embedding: list[float] = inference_results[0].embedding.tolist()
+        raw_embedding: list[float] = segment_embeddings[0].tolist()
 
         # Zero-pad to the storage dimension so the pgvector distance operator
         # does not raise a dimension mismatch error.  Stored vectors are always
@@ -375,7 +390,7 @@ class SimilaritySearchService:
         logger.info(
             "Generated embedding from audio (model=%s, segments=%d, dim=%d)",
             model_name,
-            len(inference_results),
+            len(segment_embeddings),
             len(query_embedding),
         )
 
@@ -1312,6 +1327,102 @@ def _candidate_key(result: SimilarityResult) -> str:
     return str(result.embedding_id)
 
 
+def _embed_file_via_inference_server(
+    model_name: str, audio_path: str
+) -> NDArray[np.float32] | None:
+    """Embed an audio file through the shared inference server.
+
+    Args:
+        model_name: Registered model name (e.g. "birdnet", "perch")
+        audio_path: Local path of the query audio
+
+    Returns:
+        ``(n_segments, dim)`` embeddings, or None when the server is disabled,
+        unreachable, or does not serve ``model_name`` — callers then fall
+        back to the in-process model.
+    """
+    from echoroo.ml.serving import InferenceServerError, get_inference_client
+
+    client = get_inference_client()
+    if client is None:
+        return None
+    try:
+        return client.embed_file(model_name, audio_path)
+    except InferenceServerError as exc:
+        logger.warning(
+            "Inference server could not embed %s with %s (%s); using in-process model",
+            audio_path,
+            model_name,
+            exc,
+        )
+        return None
+
+
+# One MicroBatcher per model for the in-process fallback path. Engines are
+# process-wide singletons (see _get_or_load_model), so the batcher is too.
+_query_batchers: dict[str, MicroBatcher] = {}
+_query_batchers_lock = threading.Lock()
+
+
+def _get_query_batcher(model_name: str, engine: InferenceEngine) -> MicroBatcher:
+    """Return the process-wide query batcher for ``model_name``.
+
+    Args:
+        model_name: Registered model name (e.g. "birdnet", "perch")
+        engine: Loaded engine the batcher's model calls go to
+
+    Returns:
+        Batcher coalescing concurrent query segments into one engine call
+    """
+    from echoroo.ml.serving import MicroBatcher
+
+    with _query_batchers_lock:
+        batcher = _query_batchers.get(model_name)
+        if batcher is None:
+            settings = get_settings()
+
+            def embed(segments: NDArray[np.float32]) -> NDArray[np.float32]:
+                # BirdNET and Perch override get_embeddings_only with one
+                # encode() over the concatenated segments, skipping the
+                # classifier head that predict_file would also run.
+                return engine.get_embeddings_only(list(segments))
+
+            batcher = MicroBatcher(
+                embed,
+                max_batch=settings.SEARCH_EMBED_MAX_BATCH,
+                max_wait=settings.SEARCH_EMBED_MAX_WAIT_MS / 1000,
+                name=f"search-{model_name}",
+            )
+            _query_batchers[model_name] = batcher
+        return batcher
+
+
+async def _embed_file_batched(
+    model_name: str, engine: InferenceEngine, audio_path: str
+) -> NDArray[np.float32]:
+    """Embed the query segment of ``audio_path`` through the model's batcher.
+
+    Only the first segment is used as the query vector, so only that one is
+    queued; the rest of the clip would be encoded and thrown away.
+
+    Args:
+        model_name: Registered model name (e.g. "birdnet", "perch")
+        engine: Loaded engine for ``model_name``
+        audio_path: Local path of the query audio
+
+    Returns:
+        ``(1, dim)`` embeddings of the first segment
+    """
+    from echoroo.ml.serving import load_segments
+
+    spec = engine.specification
+    segments = await asyncio.to_thread(
+        load_segments, audio_path, spec.sample_rate, spec.segment_samples
+    )
+    batcher = _get_query_batcher(model_name, engine)
+    return await asyncio.wrap_future(batcher.submit(segments[:1]))
+
+
 def _get_or_load_model(model_name: str) -> tuple[ModelLoader, InferenceEngine]:
     """Return a cached (loader, engine) pair, loading it on first call.
 
@@ -82,6 +82,7 @@ from echoroo.models.enums import (
 )
 from echoroo.models.project_taxon_override import ProjectTaxonSensitivityOverride
 from echoroo.services.audit_service import AuditLogService
+from echoroo.services.taxon_sensitivity_service import bump_sensitivity_version
 
 logger = logging.getLogger(__name__)
 
@@ -209,7 +210,9 @@ async def apply_taxon_override(
     transaction and then invoke :func:`trigger_apply_post_commit_audit`
     so the audit writer (which requires a fresh session for
     ``SET TRANSACTION ISOLATION LEVEL SERIALIZABLE``) sees an unsullied
-    connection.
+    connection. That hook also bumps the sensitivity snapshot version
+    when the override is live (stricter), so a stricter override masks
+    on every worker without waiting for the snapshot TTL.
     """
     now = datetime.now(UTC)
     is_stricter = direction == TaxonOverrideDirection.STRICTER
@@ -467,7 +470,12 @@ async def trigger_apply_post_commit_audit(
     *,
     audit_log_factory: Callable[[AsyncSession], AuditLogService] | None = None,
 ) -> None:
-    """Write the ``project_audit_log`` row for an apply outcome.
+    """Publish an apply outcome: bump the snapshot version, then audit.
+
+    A stricter override is inserted as ``applied`` and takes effect as soon
+    as the caller's transaction commits, so the sensitivity snapshot version
+    is bumped first (:func:`bump_sensitivity_version` is itself best effort).
+    A looser override stays pending until approved and changes nothing yet.
 
     Mirrors the pattern in
     :func:`echoroo.services.ownership_service.trigger_post_commit_side_effects`:
@@ -487,6 +495,8 @@ async def trigger_apply_post_commit_audit(
             passed to it; never a pre-bound instance, because the SERIALIZABLE
             upgrade must be the first statement on the audit connection.
     """
+    if outcome.override.approval_status == TaxonOverrideApprovalStatus.APPLIED:
+        await bump_sensitivity_version()
     try:
         async with AsyncSessionLocal() as audit_session:
             try:
@@ -21,7 +21,8 @@ from echoroo.schemas.taxon import (
     TaxonSearchResult,
     VernacularNameResponse,
 )
-from echoroo.services.gbif import GBIFService
+from echoroo.services.gbif import GBIFResolveResult, GBIFService
+from echoroo.services.taxon_resolution import TaxonResolver, normalize_taxon_name
 from echoroo.services.vernacular import resolve_vernacular_names
 
 logger = logging.getLogger(__name__)
@@ -100,9 +101,11 @@ class TaxonService:
         self,
         taxon_repo: TaxonRepository,
         gbif_service: GBIFService | None = None,
+        resolver: TaxonResolver | None = None,
     ) -> None:
         self.taxon_repo = taxon_repo
         self.gbif_service = gbif_service or GBIFService()
+        self.resolver = resolver or TaxonResolver(taxon_repo.db, self.gbif_service)
 
     async def list_taxa(
         self,
@@ -365,25 +368,25 @@ class TaxonService:
         upstream outage rather than a per-taxon miss: it is counted in
         ``errored`` and, once ``_GBIF_OUTAGE_THRESHOLD`` such failures occur
         back-to-back, the batch re-raises so the Celery task ends in FAILURE.
+
+        Names answered by the taxon-resolution cache (read once for the whole
+        batch up front) are applied without a GBIF call; only the rest reach
+        the network, and their answers are cached for the next run.
         """
         unresolved = await self.taxon_repo.get_unresolved(limit=limit)
         if not unresolved:
             return GBIFBatchResolveResult(resolved=0)
 
+        cached = await self.resolver.lookup(t.scientific_name for t in unresolved)
+
         async def resolve_one(taxon: Taxon) -> bool:
             """Resolve a single taxon; return True if GBIF data was found."""
-            result = await self.gbif_service.resolve_taxon(taxon.scientific_name)
-            if result is None:
-                taxon.gbif_resolved_at = datetime.now(UTC)
-                await self.taxon_repo.update(taxon)
-                return False
-
-            taxon.gbif_taxon_key = result.taxon_key
-            taxon.rank = result.rank
-            taxon.gbif_metadata = result.metadata
-            taxon.gbif_resolved_at = datetime.now(UTC)
-            await self.taxon_repo.update(taxon)
-            return True
+            key = normalize_taxon_name(taxon.scientific_name)
+            if key in cached:
+                result = cached[key]
+            else:
+                result = await self.resolver.fetch(taxon.scientific_name)
+            return await self._apply_gbif_result(taxon, result)
 
         resolved_count = 0
         errored_count = 0
@@ -420,3 +423,50 @@ class TaxonService:
                 )
                 consecutive_errors = 0
         return GBIFBatchResolveResult(resolved=resolved_count, errored=errored_count)
+
+    async def resolve_dataset_taxa(self, dataset_id: UUID) -> GBIFBatchResolveResult:
+        """Resolve GBIF data for every unresolved taxon a dataset's detections use.
+
+        Meant to run once after a detection run has created the taxa of a
+        model's label set. All names go through a single
+        :meth:`TaxonResolver.resolve_many` pass, so a label set of thousands
+        of species costs one cache read plus one ``species/match`` call per
+        name GBIF has not already been asked about. Names whose lookup failed
+        upstream are left unresolved for :meth:`resolve_gbif_batch` to retry
+        and counted in ``errored``.
+        """
+        taxa = await self.taxon_repo.get_unresolved_for_dataset(dataset_id)
+        if not taxa:
+            return GBIFBatchResolveResult(resolved=0)
+
+        batch = await self.resolver.resolve_many(t.scientific_name for t in taxa)
+        resolved_count = 0
+        errored_count = 0
+        for taxon in taxa:
+            if batch.failed(taxon.scientific_name):
+                errored_count += 1
+                continue
+            if await self._apply_gbif_result(taxon, batch.get(taxon.scientific_name)):
+                resolved_count += 1
+        logger.info(
+            "Resolved taxa of dataset %s: %d resolved, %d errored, "
+            "%d cache hits, %d GBIF lookups",
+            dataset_id,
+            resolved_count,
+            errored_count,
+            batch.cache_hits,
+            batch.fetched,
+        )
+        return GBIFBatchResolveResult(resolved=resolved_count, errored=errored_count)
+
+    async def _apply_gbif_result(
+        self, taxon: Taxon, result: GBIFResolveResult | None
+    ) -> bool:
+        """Record a GBIF answer on ``taxon``; return True if it was a match."""
+        taxon.gbif_resolved_at = datetime.now(UTC)
+        if result is not None:
+            taxon.gbif_taxon_key = result.taxon_key
+            taxon.rank = result.rank
+            taxon.gbif_metadata = result.metadata
+        await self.taxon_repo.update(taxon)
+        return result is not None
@@ -0,0 +1,245 @@
+"""Cached GBIF taxon resolution.
+
+:class:`TaxonResolver` sits in front of :class:`~echoroo.services.gbif.GBIFService`
+and answers ``species/match`` and ``vernacularNames`` lookups from the
+``taxon_resolution_cache`` table first. Only names without a live cache row
+reach the network, and every answer GBIF gives (including "no match") is
+written back, so the next pass over the same label set is free.
+
+:meth:`TaxonResolver.resolve_many` is the bulk entry point: it collapses
+names that differ only by case or whitespace, reads the cache for all of
+them in one query, fetches the remainder concurrently and stores the new
+rows in one upsert. Upstream failures are reported per name and never
+cached; after ``_OUTAGE_THRESHOLD`` consecutive failures the remaining
+names are skipped rather than sent to an upstream that is down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from echoroo.core.exceptions import ExternalServiceError
+from echoroo.core.settings import get_settings
+from echoroo.models.taxon_resolution import TaxonResolution
+from echoroo.repositories.taxon_resolution import TaxonResolutionRepository
+from echoroo.services.gbif import GBIFResolveResult, GBIFService
+
+logger = logging.getLogger(__name__)
+
+# Concurrent ``species/match`` calls of one ``resolve_many`` pass. The shared
+# GBIF client caps per-host concurrency process-wide on top of this.
+_RESOLVE_CONCURRENCY = 8
+# Consecutive upstream failures after which the rest of a bulk pass is
+# skipped (mirrors ``echoroo.services.taxon._GBIF_OUTAGE_THRESHOLD``).
+_OUTAGE_THRESHOLD = 5
+# Length of ``taxon_resolution_cache.name_key``.
+_NAME_KEY_MAX = 300
+
+
+def normalize_taxon_name(name: str) -> str:
+    """Reduce a scientific name to its cache key.
+
+    Collapses runs of whitespace and case-folds, so ``"Parus  major"`` and
+    ``"parus major"`` share one cache row and one GBIF lookup.
+    """
+    return " ".join(name.split()).casefold()[:_NAME_KEY_MAX]
+
+
+@dataclass
+class TaxonResolutionBatch:
+    """Outcome of :meth:`TaxonResolver.resolve_many`.
+
+    ``results`` maps the normalized key of every name that was answered to
+    its match, or ``None`` for a legitimate "no match". Names whose lookup
+    failed upstream are in ``errored`` instead.
+    """
+
+    results: dict[str, GBIFResolveResult | None] = field(default_factory=dict)
+    errored: set[str] = field(default_factory=set)
+    cache_hits: int = 0
+    fetched: int = 0
+
+    def get(self, name: str) -> GBIFResolveResult | None:
+        """Return the match of ``name`` (``None`` when unmatched or errored)."""
+        return self.results.get(normalize_taxon_name(name))
+
+    def failed(self, name: str) -> bool:
+        """Return whether the lookup of ``name`` failed upstream."""
+        return normalize_taxon_name(name) in self.errored
+
+
+def _result_from_row(row: TaxonResolution) -> GBIFResolveResult | None:
+    if row.gbif_taxon_key is None:
+        return None
+    return GBIFResolveResult(
+        taxon_key=row.gbif_taxon_key,
+        scientific_name=row.scientific_name or row.name_key,
+        rank=row.rank or "UNKNOWN",
+        metadata=dict(row.classification or {}),
+    )
+
+
+def _row_values(
+    name_key: str, result: GBIFResolveResult | None, now: datetime
+) -> dict[str, Any]:
+    settings = get_settings()
+    ttl_days = (
+        settings.TAXON_RESOLUTION_MISS_TTL_DAYS
+        if result is None
+        else settings.TAXON_RESOLUTION_HIT_TTL_DAYS
+    )
+    return {
+        "name_key": name_key,
+        "gbif_taxon_key": None if result is None else result.taxon_key,
+        "scientific_name": None if result is None else result.scientific_name,
+        "rank": None if result is None else result.rank,
+        "classification": None if result is None else result.metadata,
+        "vernacular_names": None,
+        "resolved_at": now,
+        "expires_at": now + timedelta(days=ttl_days),
+    }
+
+
+class TaxonResolver:
+    """GBIF name resolution backed by the persistent resolution cache.
+
+    Cache rows are written through the caller's session and become
+    visible to other processes when the caller commits.
+    """
+
+    def __init__(self, db: AsyncSession, gbif_service: GBIFService | None = None) -> None:
+        self.cache = TaxonResolutionRepository(db)
+        self.gbif_service = gbif_service or GBIFService()
+
+    async def lookup(self, names: Iterable[str]) -> dict[str, GBIFResolveResult | None]:
+        """Return the cached resolutions of ``names``, keyed by normalized name.
+
+        Names without a live cache row are absent from the result; a cached
+        "no match" maps to ``None``.
+        """
+        rows = await self.cache.get_fresh(
+            {normalize_taxon_name(name) for name in names}, datetime.now(UTC)
+        )
+        return {key: _result_from_row(row) for key, row in rows.items()}
+
+    async def fetch(self, name: str) -> GBIFResolveResult | None:
+        """Resolve ``name`` upstream and cache the answer, skipping the read.
+
+        Raises:
+            GBIFUnavailableError: GBIF failed; nothing is cached.
+        """
+        result = await self.gbif_service.resolve_taxon(name)
+        await self.cache.upsert(
+            [_row_values(normalize_taxon_name(name), result, datetime.now(UTC))]
+        )
+        return result
+
+    async def resolve(self, name: str) -> GBIFResolveResult | None:
+        """Resolve one name, from the cache when it has a live row.
+
+        Raises:
+            GBIFUnavailableError: The name was not cached and GBIF failed.
+        """
+        key = normalize_taxon_name(name)
+        cached = await self.lookup([name])
+        if key in cached:
+            return cached[key]
+        return await self.fetch(name)
+
+    async def resolve_many(
+        self,
+        names: Iterable[str],
+        *,
+        concurrency: int = _RESOLVE_CONCURRENCY,
+    ) -> TaxonResolutionBatch:
+        """Resolve a set of names with one cache read and one cache write.
+
+        Names are deduplicated by :func:`normalize_taxon_name` first, so a
+        label set with thousands of entries costs one ``species/match`` call
+        per distinct name GBIF has not been asked about within its TTL.
+        """
+        unique: dict[str, str] = {}
+        for name in names:
+            unique.setdefault(normalize_taxon_name(name), name)
+        batch = TaxonResolutionBatch()
+        if not unique:
+            return batch
+
+        batch.results.update(await self.lookup(unique.values()))
+        batch.cache_hits = len(batch.results)
+        pending = [(key, name) for key, name in unique.items() if key not in batch.results]
+        if not pending:
+            return batch
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        consecutive_failures = 0
+        now = datetime.now(UTC)
+        rows: list[dict[str, Any]] = []
+
+        async def fetch_one(key: str, name: str) -> None:
+            nonlocal consecutive_failures
+            async with semaphore:
+                if consecutive_failures >= _OUTAGE_THRESHOLD:
+                    batch.errored.add(key)
+                    return
+                try:
+                    result = await self.gbif_service.resolve_taxon(name)
+                except ExternalServiceError:
+                    consecutive_failures += 1
+                    batch.errored.add(key)
+                    return
+                consecutive_failures = 0
+                batch.results[key] = result
+                rows.append(_row_values(key, result, now))
+
+        await asyncio.gather(*(fetch_one(key, name) for key, name in pending))
+        batch.fetched = len(rows)
+        if rows:
+            await self.cache.upsert(rows)
+        if batch.errored:
+            logger.warning(
+                "GBIF resolution failed for %d of %d uncached names",
+                len(batch.errored),
+                len(pending),
+            )
+        return batch
+
+    async def vernacular_names(
+        self,
+        name: str,
+        taxon_key: int,
+        locales: list[str] | None = None,
+    ) -> list[dict[str, str]]:
+        """Return GBIF vernacular names of a resolved name, cached per locale.
+
+        The first call for a cached match fetches every locale GBIF has for
+        ``taxon_key`` and stores them on the match's cache row; later calls,
+        for any locale, are answered from the row. The return shape matches
+        :meth:`GBIFService.get_vernacular_names`.
+
+        Raises:
+            GBIFUnavailableError: The names were not cached and GBIF failed.
+        """
+        key = normalize_taxon_name(name)
+        row = (await self.cache.get_fresh([key], datetime.now(UTC))).get(key)
+        by_locale = row.vernacular_names if row is not None else None
+        if row is None or row.gbif_taxon_key != taxon_key or by_locale is None:
+            entries = await self.gbif_service.get_vernacular_names(taxon_key)
+            by_locale = {}
+            for entry in entries:
+                by_locale.setdefault(entry["locale"], []).append(entry["name"])
+            if row is not None and row.gbif_taxon_key == taxon_key:
+                await self.cache.set_vernacular_names(key, by_locale)
+        return [
+            {"locale": locale, "name": vernacular}
+            for locale, vernaculars in by_locale.items()
+            if not locales or locale in locales
+            for vernacular in vernaculars
+        ]
@@ -26,6 +26,18 @@ how many detections / recordings are being projected. We satisfy this with a
 :class:`contextvars.ContextVar` cache that the FastAPI dependency tree can
 reset on every request boundary.
 
+Both tables change rarely (the weekly IUCN sync, the MoE seeder, superuser
+override decisions), so the loaders normally issue no SELECT at all: each
+process keeps a snapshot of the whole of both tables, tagged with the
+version counter in Redis under :data:`SENSITIVITY_VERSION_REDIS_KEY`.
+Writers call :func:`bump_sensitivity_version` **after** committing; a
+request reads the counter once (one Redis ``GET``) and reloads the snapshot
+only when it moved, or when the snapshot is older than
+:data:`SNAPSHOT_MAX_AGE_SECONDS` (a backstop for writes that bypass the
+bump, e.g. manual SQL). When Redis is unreachable the loaders fall back to
+the per-request SELECTs, so a Redis outage can cost latency but never
+serves a stale map.
+
 This module also exposes helpers used by the IUCN / MoE workers and CLI:
 
 * :func:`upsert_taxon_sensitivity` — single-row UPSERT for the
@@ -46,6 +58,8 @@ from __future__ import annotations
 
 import contextvars
 import logging
+import time
+from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
@@ -58,7 +72,11 @@ from echoroo.core.permissions import (
     compute_effective_resolution as _compute_effective_resolution,
 )
 from echoroo.core.redis import get_redis_connection
-from echoroo.models.enums import TaxonOverrideApprovalStatus, TaxonSensitivitySource
+from echoroo.models.enums import (
+    TaxonOverrideApprovalStatus,
+    TaxonOverrideDirection,
+    TaxonSensitivitySource,
+)
 from echoroo.models.project_taxon_override import ProjectTaxonSensitivityOverride
 from echoroo.models.taxon_sensitivity import TaxonSensitivity
 
@@ -77,6 +95,15 @@ IUCN_FAIL_SAFE_REDIS_KEY: str = "iucn:fail_safe_active"
 #: the spec's "2 weeks consecutive failure" trigger.
 IUCN_FAIL_SAFE_TTL_SECONDS: int = 30 * 24 * 60 * 60
 
+#: Redis counter bumped (``INCR``) after every committed write to
+#: ``taxon_sensitivities`` or ``project_taxon_sensitivity_overrides``. A
+#: missing key reads as version 0.
+SENSITIVITY_VERSION_REDIS_KEY: str = "taxon_sensitivity:version"
+
+#: Upper bound on how long a process serves one snapshot without reloading,
+#: even when the version counter has not moved.
+SNAPSHOT_MAX_AGE_SECONDS: float = 300.0
+
 #: Source priority for tie-breaking *metadata* (category, notes). The
 #: actual ``sensitivity_h3_res`` is collapsed via min() per the spec
 #: (most-conservative wins). Spec L313-365 + FR-032.
@@ -101,13 +128,17 @@ class _RequestCache:
     follow-up DB query that POPULATES the cache, never a stale read.
     """
 
-    __slots__ = ("sensitivity", "overrides")
+    __slots__ = ("sensitivity", "overrides", "snapshot", "snapshot_resolved")
 
     def __init__(self) -> None:
         # taxon_id -> effective h3 resolution
         self.sensitivity: dict[str, int] = {}
-        # (project_id, taxon_id) -> applied ProjectTaxonSensitivityOverride
-        self.overrides: dict[tuple[UUID, str], ProjectTaxonSensitivityOverride] = {}
+        # (project_id, taxon_id) -> applied override
+        self.overrides: dict[tuple[UUID, str], OverrideSnapshot] = {}
+        # Process snapshot pinned for this request (None: Redis unavailable,
+        # use the per-request SELECTs). Resolved at most once per request.
+        self.snapshot: _Snapshot | None = None
+        self.snapshot_resolved = False
 
 
 _REQUEST_CACHE: contextvars.ContextVar[_RequestCache | None] = contextvars.ContextVar(
@@ -149,6 +180,149 @@ def _ensure_request_cache() -> _RequestCache:
     return cache
 
 
+# =============================================================================
+# Process-wide versioned snapshot
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class OverrideSnapshot:
+    """Detached copy of the override fields the masking decision reads.
+
+    :func:`echoroo.core.permissions.compute_effective_resolution` only
+    consults ``direction`` / ``approval_status`` / ``sensitivity_h3_res``,
+    so the loaders hand out these instead of ORM rows, which would expire
+    with the session that loaded them.
+    """
+
+    id: UUID
+    project_id: UUID
+    taxon_id: str
+    sensitivity_h3_res: int
+    direction: TaxonOverrideDirection
+    approval_status: TaxonOverrideApprovalStatus
+
+    @classmethod
+    def from_row(cls, row: ProjectTaxonSensitivityOverride) -> OverrideSnapshot:
+        return cls(
+            id=row.id,
+            project_id=row.project_id,
+            taxon_id=row.taxon_id,
+            sensitivity_h3_res=row.sensitivity_h3_res,
+            direction=row.direction,
+            approval_status=row.approval_status,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Snapshot:
+    """Whole-table copy of the masking inputs at one version."""
+
+    version: int
+    loaded_at: float
+    # taxon_id -> strictest h3 resolution across sources
+    sensitivity: dict[str, int]
+    # (project_id, taxon_id) -> applied override
+    overrides: dict[tuple[UUID, str], OverrideSnapshot]
+
+
+_SNAPSHOT: _Snapshot | None = None
+
+
+def _collapse_strictest(rows: Any) -> dict[str, int]:
+    """Collapse ``(taxon_id, h3_res)`` rows to the strictest resolution per taxon."""
+    per_taxon: dict[str, int] = {}
+    for tid, h3_res in rows:
+        current = per_taxon.get(tid)
+        if current is None or h3_res < current:
+            per_taxon[tid] = h3_res
+    return per_taxon
+
+
+async def _current_version() -> int | None:
+    """Return the Redis version counter, or None when Redis is unavailable."""
+    try:
+        client = await get_redis_connection()
+        value = await client.get(SENSITIVITY_VERSION_REDIS_KEY)
+    except Exception as exc:  # noqa: BLE001 — fall back to per-request SELECTs
+        logger.warning("taxon sensitivity version lookup failed: %r", exc)
+        return None
+    return int(value) if value is not None else 0
+
+
+async def _load_snapshot(session: AsyncSession, version: int) -> _Snapshot:
+    sensitivity_rows = await session.execute(
+        sa.select(TaxonSensitivity.taxon_id, TaxonSensitivity.sensitivity_h3_res)
+    )
+    override_rows = await session.execute(
+        sa.select(ProjectTaxonSensitivityOverride).where(
+            ProjectTaxonSensitivityOverride.approval_status
+            == TaxonOverrideApprovalStatus.APPLIED,
+        )
+    )
+    return _Snapshot(
+        version=version,
+        loaded_at=time.monotonic(),
+        sensitivity=_collapse_strictest(sensitivity_rows.all()),
+        overrides={
+            (row.project_id, row.taxon_id): OverrideSnapshot.from_row(row)
+            for row in override_rows.scalars().all()
+        },
+    )
+
+
+async def _request_snapshot(session: AsyncSession) -> _Snapshot | None:
+    """Return the snapshot this request should read, reloading it if stale.
+
+    The version is checked once per request; every loader call in the
+    request then reads the same snapshot. Concurrent reloads in one process
+    are harmless — each builds a complete snapshot and the last one wins.
+    """
+    global _SNAPSHOT
+
+    cache = _ensure_request_cache()
+    if cache.snapshot_resolved:
+        return cache.snapshot
+
+    version = await _current_version()
+    snapshot: _Snapshot | None = None
+    if version is not None:
+        snapshot = _SNAPSHOT
+        if (
+            snapshot is None
+            or snapshot.version != version
+            or time.monotonic() - snapshot.loaded_at > SNAPSHOT_MAX_AGE_SECONDS
+        ):
+            # Read the version BEFORE loading: a write committed in between
+            # bumps past ``version`` and forces the next request to reload.
+            snapshot = await _load_snapshot(session, version)
+            _SNAPSHOT = snapshot
+
+    cache.snapshot = snapshot
+    cache.snapshot_resolved = True
+    return snapshot
+
+
+async def bump_sensitivity_version() -> None:
+    """Invalidate every process's snapshot after a committed write.
+
+    Call this AFTER the transaction that changed ``taxon_sensitivities`` or
+    ``project_taxon_sensitivity_overrides`` has committed; bumping earlier
+    lets a concurrent request cache the pre-commit rows under the new
+    version. Best effort: on a Redis error the snapshots refresh within
+    :data:`SNAPSHOT_MAX_AGE_SECONDS`.
+    """
+    global _SNAPSHOT
+
+    # This process never waits on Redis to see its own write.
+    _SNAPSHOT = None
+    try:
+        client = await get_redis_connection()
+        await client.incr(SENSITIVITY_VERSION_REDIS_KEY)
+    except Exception as exc:  # noqa: BLE001 — best effort; TTL backstop
+        logger.warning("taxon sensitivity version bump failed: %r", exc)
+
+
 # =============================================================================
 # Bulk preload — sensitivity map
 # =============================================================================
@@ -176,8 +350,9 @@ async def bulk_load_sensitivity_map(
       FR-036 ("unknown species default to H3_RES_7 during 2-week IUCN
       outage"). Known taxa always retain whatever the last successful
       sync recorded.
-    * Re-uses the request-scope cache so a second list endpoint in the
-      same request does not re-query for taxa already loaded.
+    * Reads the process snapshot when it is current (no SELECT at all);
+      otherwise re-uses the request-scope cache so a second list endpoint
+      in the same request does not re-query for taxa already loaded.
 
     Args:
         session: Active SQLAlchemy AsyncSession.
@@ -193,6 +368,11 @@ async def bulk_load_sensitivity_map(
     if not taxon_ids:
         return {}
 
+    default_res = H3_RES_7 if iucn_fail_safe_active else H3_RES_9
+    snapshot = await _request_snapshot(session)
+    if snapshot is not None:
+        return {tid: snapshot.sensitivity.get(tid, default_res) for tid in taxon_ids}
+
     cache = _ensure_request_cache()
 
     # Determine which IDs still need a database lookup. We do not assume
@@ -203,26 +383,16 @@ async def bulk_load_sensitivity_map(
     if missing:
         stmt = sa.select(
             TaxonSensitivity.taxon_id,
-            TaxonSensitivity.source,
             TaxonSensitivity.sensitivity_h3_res,
         ).where(TaxonSensitivity.taxon_id.in_(missing))
         result = await session.execute(stmt)
 
         # Collapse multi-source rows to the strictest h3 resolution.
-        per_taxon: dict[str, int] = {}
-        for tid, _source, h3_res in result.all():
-            current = per_taxon.get(tid)
-            if current is None or h3_res < current:
-                per_taxon[tid] = h3_res
+        per_taxon = _collapse_strictest(result.all())
 
         for tid in missing:
-            if tid in per_taxon:
-                cache.sensitivity[tid] = per_taxon[tid]
-            else:
-                # Unknown taxon — apply fail-safe default if active.
-                cache.sensitivity[tid] = (
-                    H3_RES_7 if iucn_fail_safe_active else H3_RES_9
-                )
+            # Unknown taxon — apply fail-safe default if active.
+            cache.sensitivity[tid] = per_taxon.get(tid, default_res)
 
     return {tid: cache.sensitivity[tid] for tid in taxon_ids}
 
@@ -236,10 +406,11 @@ async def bulk_load_override_map(
     session: AsyncSession,
     project_id: UUID,
     taxon_ids: set[str],
-) -> dict[tuple[UUID, str], ProjectTaxonSensitivityOverride]:
+) -> dict[tuple[UUID, str], OverrideSnapshot]:
     """Return ``{(project_id, taxon_id): override}`` for applied overrides.
 
-    Issues at most ONE SELECT against ``project_taxon_sensitivity_overrides``
+    Served from the process snapshot when it is current; otherwise issues at
+    most ONE SELECT against ``project_taxon_sensitivity_overrides``
     (NFR-001a). Filters to ``approval_status = 'applied'`` so neither
     pending looser overrides (still awaiting superuser approval) nor
     rejected ones leak into the masking decision (FR-034).
@@ -258,6 +429,14 @@ async def bulk_load_override_map(
     if not taxon_ids:
         return {}
 
+    snapshot = await _request_snapshot(session)
+    if snapshot is not None:
+        return {
+            (project_id, tid): snapshot.overrides[(project_id, tid)]
+            for tid in taxon_ids
+            if (project_id, tid) in snapshot.overrides
+        }
+
     cache = _ensure_request_cache()
 
     # All requested keys for this project. The cache uses the same tuple
@@ -277,7 +456,7 @@ async def bulk_load_override_map(
         rows = result.scalars().all()
 
         for row in rows:
-            cache.overrides[(row.project_id, row.taxon_id)] = row
+            cache.overrides[(row.project_id, row.taxon_id)] = OverrideSnapshot.from_row(row)
 
         # The unique partial index ``ux_taxon_overrides_applied_unique``
         # guarantees that the SELECT above returns at most ONE row per
@@ -304,7 +483,7 @@ def compute_effective_resolution(
     role: str,
     effective_permissions: Any = frozenset(),
     taxon_sensitivity_map: dict[str, int] | None = None,
-    override_map: dict[tuple[UUID, str], ProjectTaxonSensitivityOverride] | None = None,
+    override_map: dict[tuple[UUID, str], OverrideSnapshot] | None = None,
 ) -> int:
     """Service-layer wrapper around :func:`echoroo.core.permissions.compute_effective_resolution`.
 
@@ -492,8 +671,12 @@ async def set_iucn_fail_safe(active: bool) -> None:
 __all__ = [
     "IUCN_FAIL_SAFE_REDIS_KEY",
     "IUCN_FAIL_SAFE_TTL_SECONDS",
+    "SENSITIVITY_VERSION_REDIS_KEY",
+    "SNAPSHOT_MAX_AGE_SECONDS",
+    "OverrideSnapshot",
     "bulk_load_override_map",
     "bulk_load_sensitivity_map",
+    "bump_sensitivity_version",
     "compute_effective_resolution",
     "is_iucn_fail_safe_active",
     "reset_request_cache",
@@ -0,0 +1,448 @@
+"""On-disk cache of proxied Xeno-canto media (audio downloads and sonograms).
+
+Building a batch search means previewing the same handful of reference
+recordings (and their sonograms) over and over, by every member of the
+project. The proxy used to re-fetch each of them from xeno-canto.org on
+every request; this cache keeps a local copy so repeat previews are served
+from disk, including HTTP Range requests.
+
+Every entry is two files in the cache directory:
+
+- ``<key>.bin``  : the response body.
+- ``<key>.json`` : content type, upstream validators (``ETag`` /
+  ``Last-Modified``), body size and the time the copy was last confirmed
+  against upstream.
+
+Entries younger than the freshness window are served without contacting
+Xeno-canto; older ones are revalidated with a conditional GET
+(:meth:`CachedMedia.validator_headers`) and re-dated on ``304``. Recency is
+tracked through the ``.bin`` mtime (bumped on hit, throttled to once per
+:data:`_TOUCH_INTERVAL_SECONDS`). Eviction is content-length aware: room for
+a download's announced ``Content-Length`` is made *before* it is written,
+bodies larger than the whole budget are never cached, and a write that
+outgrows the budget is abandoned. Each eviction pass also removes temp
+files orphaned by a writer that never committed or aborted.
+
+The directory may be shared by several API processes; bodies are written
+to a private temp file and published with an atomic rename.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_BODY_SUFFIX = ".bin"
+_META_SUFFIX = ".json"
+_TMP_SUFFIX = ".tmp"
+
+# Bump the LRU timestamp at most this often per entry so popular reference
+# recordings do not turn every preview into a metadata write.
+_TOUCH_INTERVAL_SECONDS = 60
+
+# A temp file untouched for this long belongs to a writer whose process died
+# (or whose thread was cancelled) before it could commit or abort.
+_STALE_TMP_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class CachedMedia:
+    """A cached upstream response.
+
+    Attributes:
+        path: Location of the cached body.
+        size: Body size in bytes.
+        content_type: Upstream ``Content-Type``.
+        etag: Upstream ``ETag`` (used for revalidation), if any.
+        last_modified: Upstream ``Last-Modified`` (used for revalidation).
+        validated_at: Epoch seconds when upstream last confirmed this copy.
+    """
+
+    path: Path
+    size: int
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    validated_at: float
+
+    def is_fresh(self, max_age_seconds: float) -> bool:
+        """Return True if the copy may be served without revalidation."""
+        return time.time() - self.validated_at < max_age_seconds
+
+    def validator_headers(self) -> dict[str, str]:
+        """Return the conditional-GET headers that revalidate this copy."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MediaCacheWriter:
+    """Incremental writer for one cache entry (see :meth:`XenoCantoMediaCache.writer`).
+
+    Chunks go to a private temp file; :meth:`commit` publishes the entry and
+    :meth:`abort` discards it. A writer that exceeds the cache budget aborts
+    itself and ignores further chunks, so callers can tee a download into it
+    unconditionally.
+    """
+
+    def __init__(
+        self,
+        cache: XenoCantoMediaCache,
+        resource: str,
+        *,
+        content_type: str,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        self._cache = cache
+        self._resource = resource
+        self._meta = {
+            "content_type": content_type,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        self._tmp_path = cache.body_path(resource).with_name(
+            f"{cache.key_for(resource)}.{uuid.uuid4().hex}{_TMP_SUFFIX}"
+        )
+        self._file = self._tmp_path.open("wb")
+        self.bytes_written = 0
+        self.aborted = False
+
+    def write(self, chunk: bytes) -> None:
+        """Append ``chunk`` to the entry (a no-op once aborted)."""
+        if self.aborted:
+            return
+        if self.bytes_written + len(chunk) > self._cache.max_bytes:
+            logger.info("Xeno-canto cache: %s exceeds the cache budget; not cached", self._resource)
+            self.abort()
+            return
+        try:
+            self._file.write(chunk)
+        except OSError as exc:
+            logger.warning("Xeno-canto cache write failed for %s: %s", self._resource, exc)
+            self.abort()
+            return
+        self.bytes_written += len(chunk)
+
+    def commit(self) -> CachedMedia | None:
+        """Publish the entry, then evict down to the budget.
+
+        Returns:
+            The published entry, or ``None`` if the writer was aborted.
+        """
+        if self.aborted:
+            return None
+        try:
+            self._file.close()
+            body_path = self._cache.body_path(self._resource)
+            meta = {**self._meta, "size": self.bytes_written, "validated_at": time.time()}
+            self._cache.meta_path(self._resource).write_text(json.dumps(meta))
+            # Publish the body last: a visible ``.bin`` always has metadata.
+            self._tmp_path.rename(body_path)
+        except OSError as exc:
+            logger.warning("Xeno-canto cache commit failed for %s: %s", self._resource, exc)
+            self.abort()
+            return None
+        self._cache.evict(keep=body_path)
+        return self._cache.lookup(self._resource)
+
+    def abort(self) -> None:
+        """Discard the partially written entry (idempotent)."""
+        self.aborted = True
+        with contextlib.suppress(OSError):
+            self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class XenoCantoMediaCache:
+    """LRU-bounded on-disk cache of proxied Xeno-canto responses.
+
+    Keys are opaque resource strings chosen by the caller (e.g.
+    ``"audio/1069474"`` or the sonogram URL). Instances are cheap; all
+    state lives in the cache directory.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached files (created lazily).
+            max_bytes: Upper bound on the total size of cached entries.
+                ``0`` disables caching.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._evict_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_bytes > 0
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def key_for(resource: str) -> str:
+        """Return the stable cache key for ``resource``."""
+        return hashlib.sha256(resource.encode()).hexdigest()[:32]
+
+    def body_path(self, resource: str) -> Path:
+        """Return the location of the cached body (may not exist)."""
+        return self.cache_dir / f"{self.key_for(resource)}{_BODY_SUFFIX}"
+
+    def meta_path(self, resource: str) -> Path:
+        """Return the location of the metadata sidecar (may not exist)."""
+        return self.cache_dir / f"{self.key_for(resource)}{_META_SUFFIX}"
+
+    # ------------------------------------------------------------------
+    # Lookup / revalidation
+    # ------------------------------------------------------------------
+
+    def lookup(self, resource: str) -> CachedMedia | None:
+        """Return the cached entry for ``resource``, or ``None`` on a miss.
+
+        A hit refreshes the entry's LRU timestamp. Fresh or not is left to
+        the caller (:meth:`CachedMedia.is_fresh`).
+        """
+        if not self.enabled:
+            return None
+        body_path = self.body_path(resource)
+        try:
+            stat = body_path.stat()
+            meta = json.loads(self.meta_path(resource).read_text())
+            entry = CachedMedia(
+                path=body_path,
+                size=int(meta["size"]),
+                content_type=str(meta["content_type"]),
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+                validated_at=float(meta["validated_at"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable Xeno-canto cache entry %s: %s", body_path, exc)
+            return None
+        if entry.size != stat.st_size:
+            # Torn write from a crashed process; treat as a miss.
+            return None
+        now = time.time()
+        if now - stat.st_mtime > _TOUCH_INTERVAL_SECONDS:
+            with contextlib.suppress(OSError):
+                os.utime(body_path, (now, now))
+        return entry
+
+    def mark_validated(self, resource: str) -> CachedMedia | None:
+        """Record that upstream confirmed the copy (``304 Not Modified``)."""
+        meta_path = self.meta_path(resource)
+        try:
+            meta = json.loads(meta_path.read_text())
+            meta["validated_at"] = time.time()
+            meta_path.write_text(json.dumps(meta))
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not re-date Xeno-canto cache entry %s: %s", meta_path, exc)
+        return self.lookup(resource)
+
+    # ------------------------------------------------------------------
+    # Population
+    # ------------------------------------------------------------------
+
+    def writer(
+        self,
+        resource: str,
+        *,
+        content_type: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_length: int | None = None,
+    ) -> MediaCacheWriter | None:
+        """Start caching a response body.
+
+        Args:
+            resource: Cache resource string.
+            content_type: Upstream ``Content-Type``.
+            etag: Upstream ``ETag``.
+            last_modified: Upstream ``Last-Modified``.
+            content_length: Announced body size, if known. Room for it is
+                made before the first byte is written.
+
+        Returns:
+            A writer, or ``None`` when the body will not be cached (cache
+            disabled, body larger than the budget, or directory unwritable).
+        """
+        if not self.enabled:
+            return None
+        if content_length is not None and content_length > self.max_bytes:
+            return None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if content_length:
+                self.evict(reserve=content_length)
+            return MediaCacheWriter(
+                self,
+                resource,
+                content_type=content_type,
+                etag=etag,
+                last_modified=last_modified,
+            )
+        except OSError as exc:
+            logger.warning("Xeno-canto cache unavailable at %s: %s", self.cache_dir, exc)
+            return None
+
+    def store(
+        self,
+        resource: str,
+        body: bytes,
+        *,
+        content_type: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CachedMedia | None:
+        """Cache a fully read response body in one go."""
+        writer = self.writer(
+            resource,
+            content_type=content_type,
+            etag=etag,
+            last_modified=last_modified,
+            content_length=len(body),
+        )
+        if writer is None:
+            return None
+        writer.write(body)
+        return writer.commit()
+
+    # ------------------------------------------------------------------
+    # Accounting / eviction
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """Return ``(mtime, size_incl_meta, body_path)`` for every entry."""
+        entries: list[tuple[float, int, Path]] = []
+        try:
+            scan = list(os.scandir(self.cache_dir))
+        except FileNotFoundError:
+            return entries
+        meta_sizes: dict[str, int] = {}
+        for dirent in scan:
+            if dirent.name.endswith(_META_SUFFIX):
+                with contextlib.suppress(OSError):
+                    meta_sizes[dirent.name.removesuffix(_META_SUFFIX)] = dirent.stat().st_size
+        for dirent in scan:
+            if not dirent.name.endswith(_BODY_SUFFIX):
+                continue
+            try:
+                st = dirent.stat()
+            except OSError:
+                continue
+            key = dirent.name.removesuffix(_BODY_SUFFIX)
+            entries.append((st.st_mtime, st.st_size + meta_sizes.get(key, 0), Path(dirent.path)))
+        return entries
+
+    def sweep_stale_temp_files(self, max_age_seconds: float = _STALE_TMP_SECONDS) -> list[Path]:
+        """Remove temp files not written to for ``max_age_seconds``.
+
+        A live writer bumps its temp file's mtime with every chunk, so only
+        files left behind by a crashed process or a lost writer qualify.
+
+        Returns:
+            Paths of the removed temp files.
+        """
+        cutoff = time.time() - max_age_seconds
+        removed: list[Path] = []
+        try:
+            scan = list(os.scandir(self.cache_dir))
+        except FileNotFoundError:
+            return removed
+        for dirent in scan:
+            if not dirent.name.endswith(_TMP_SUFFIX):
+                continue
+            try:
+                if dirent.stat().st_mtime >= cutoff:
+                    continue
+                os.unlink(dirent.path)
+            except OSError:
+                continue
+            removed.append(Path(dirent.path))
+        if removed:
+            logger.info("Xeno-canto cache removed %d orphaned temp files", len(removed))
+        return removed
+
+    def usage(self) -> int:
+        """Return the total bytes held by cached entries (body + metadata)."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, keep: Path | None = None, reserve: int = 0) -> list[Path]:
+        """Remove least-recently-used entries until usage fits ``max_bytes``.
+
+        Args:
+            keep: Entry that must survive this pass (typically the one just
+                written).
+            reserve: Bytes about to be written; room is made for them too.
+
+        Returns:
+            Paths of the evicted bodies.
+        """
+        if not self.enabled:
+            return []
+        with self._evict_lock:
+            self.sweep_stale_temp_files()
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries) + reserve
+            evicted: list[Path] = []
+            for _mtime, size, body_path in entries:
+                if total <= self.max_bytes:
+                    break
+                if keep is not None and body_path == keep:
+                    continue
+                body_path.unlink(missing_ok=True)
+                body_path.with_suffix(_META_SUFFIX).unlink(missing_ok=True)
+                total -= size
+                evicted.append(body_path)
+        if evicted:
+            logger.info(
+                "Xeno-canto cache evicted %d entries (usage now %.1f MB)",
+                len(evicted),
+                (total - reserve) / 1_048_576,
+            )
+        return evicted
+
+
+_registry: dict[Path, XenoCantoMediaCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_xeno_canto_media_cache() -> XenoCantoMediaCache:
+    """Return the process-wide media cache configured by the settings.
+
+    The instance is shared per directory (its eviction lock must be);
+    the byte budget is refreshed on every call so a settings change takes
+    effect.
+    """
+    from echoroo.core.settings import get_settings
+
+    settings = get_settings()
+    cache_dir = Path(settings.XENO_CANTO_CACHE_DIR)
+    with _registry_lock:
+        cache = _registry.get(cache_dir)
+        if cache is None:
+            cache = _registry[cache_dir] = XenoCantoMediaCache(
+                cache_dir, settings.XENO_CANTO_CACHE_MAX_BYTES
+            )
+        else:
+            cache.max_bytes = settings.XENO_CANTO_CACHE_MAX_BYTES
+        return cache
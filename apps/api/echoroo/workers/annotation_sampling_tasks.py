@@ -4,14 +4,19 @@ Given an :class:`AnnotationSet` whose filters and geometry are already
 persisted (``segment_length_sec``, ``num_segments``, optional date and
 time-of-day filters), this task:
 
-1. Fetches candidate recordings from the owning dataset, filtered by
-   ``datetime`` (date filter) and local time-of-day (if present).
-2. Enumerates candidate ``(recording_id, start, end)`` segments. In ``fixed``
-   mode these are contiguous, non-overlapping ``segment_length_sec`` slots; in
-   ``whole_recording`` mode each surviving recording yields exactly one segment
-   spanning its full (time-expanded) duration.
-3. Uniformly samples ``num_segments`` slots without replacement (in
-   ``whole_recording`` mode this caps the number of sampled recordings).
+1. Counts, in SQL, the candidate ``(recording_id, start, end)`` slots of
+   every recording in the owning dataset that passes the date and local
+   time-of-day filters. In ``fixed`` mode these are contiguous,
+   non-overlapping ``segment_length_sec`` slots; in ``whole_recording`` mode
+   each surviving recording yields exactly one segment spanning its full
+   (time-expanded) duration.
+2. Uniformly draws ``num_segments`` distinct indices into the concatenation
+   of those slots (in ``whole_recording`` mode this caps the number of
+   sampled recordings).
+3. Streams the recordings again in the same order, keeping a running slot
+   offset, and resolves each drawn index to its slot — see
+   :class:`_SlotLocator`. The slots are never materialised, so memory is
+   proportional to ``num_segments`` rather than to the dataset's length.
 4. Bulk-inserts the resulting segments and marks the set as ``ready``.
 
 Queue routing
@@ -32,14 +37,27 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
 from datetime import time as dt_time
 from typing import Any
 from uuid import UUID
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    BigInteger,
+    Float,
+    Time,
+    and_,
+    case,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.sql.elements import ColumnElement
 
 from echoroo.workers.celery_app import app
 from echoroo.workers.db_utils import get_worker_engine_and_session_factory
@@ -55,6 +73,13 @@ logger = logging.getLogger(__name__)
 # guarantees no two sampled segments overlap inside a single recording.
 _SLOT_STEP_MULTIPLIER = 1.0
 
+# Tolerance when fitting fixed slots into a recording, so that e.g. a 90 s
+# recording stored as 89.9999999 s still yields three 30 s slots.
+_SLOT_FIT_EPSILON = 1e-6
+
+# Recordings fetched per round trip while streaming the slot space.
+_STREAM_BATCH_SIZE = 2000
+
 
 # ---------------------------------------------------------------------------
 # Celery task definition
@@ -160,50 +185,52 @@ async def _sample_annotation_segments(annotation_set_id: str) -> dict[str, Any]:
                 local_tz = ZoneInfo("UTC")
 
             # --------------------------------------------------------------
-            # 2. Fetch candidate recordings (dataset + date filter applied in SQL)
+            # 2. Count candidate slots per recording (all filters in SQL)
             # --------------------------------------------------------------
-            rec_stmt = select(
-                Recording.id,
-                Recording.duration,
-                Recording.time_expansion,
-                Recording.datetime,
-            ).where(Recording.dataset_id == dataset_id)
+            effective = Recording.duration * func.coalesce(Recording.time_expansion, 1.0)
+            slot_count = _slot_count_sql(
+                effective, segment_mode=segment_mode, segment_length=segment_length
+            )
+            conditions: list[ColumnElement[bool]] = [
+                Recording.dataset_id == dataset_id,
+                Recording.duration > 0,
+                slot_count >= 1,
+            ]
 
             if date_filter is not None:
                 start_str = date_filter.get("start")
                 end_str = date_filter.get("end")
                 if start_str:
                     start_dt = datetime.fromisoformat(start_str).replace(tzinfo=UTC)
-                    rec_stmt = rec_stmt.where(Recording.datetime >= start_dt)
+                    conditions.append(Recording.datetime >= start_dt)
                 if end_str:
                     # Inclusive end-of-day: use <= end + 1 day exclusive
                     end_dt = datetime.fromisoformat(end_str).replace(tzinfo=UTC)
-                    rec_stmt = rec_stmt.where(Recording.datetime <= end_dt.replace(
+                    conditions.append(Recording.datetime <= end_dt.replace(
                         hour=23, minute=59, second=59, microsecond=999999,
                     ))
 
-            rec_rows = (await db.execute(rec_stmt)).all()
-
-            # Apply time-of-day filter in Python (handles wrap-around cleanly).
-            tod_start: dt_time | None = None
-            tod_end: dt_time | None = None
             if tod_filter is not None:
                 tod_start = _parse_hhmm(tod_filter.get("start"))
                 tod_end = _parse_hhmm(tod_filter.get("end"))
+                if tod_start is not None and tod_end is not None:
+                    local_time = _local_time_sql(Recording.datetime, local_tz)
+                    conditions.append(
+                        or_(
+                            Recording.datetime.is_(None),
+                            _time_in_range_sql(local_time, tod_start, tod_end),
+                        )
+                    )
 
-            # --------------------------------------------------------------
-            # 3. Enumerate candidate (recording_id, start, end) tuples
-            # --------------------------------------------------------------
-            slots = _enumerate_segments(
-                rec_rows,
-                segment_mode=segment_mode,
-                segment_length=segment_length,
-                local_tz=local_tz,
-                tod_start=tod_start,
-                tod_end=tod_end,
+            total_slots = int(
+                (
+                    await db.execute(
+                        select(func.coalesce(func.sum(slot_count), 0)).where(*conditions)
+                    )
+                ).scalar_one()
             )
 
-            if not slots:
+            if total_slots == 0:
                 anno_set.status = AnnotationSetStatus.READY
                 anno_set.sampling_warning = (
                     "No recordings matched the configured filters; the set was "
@@ -218,25 +245,49 @@ async def _sample_annotation_segments(annotation_set_id: str) -> dict[str, Any]:
                 }
 
             # --------------------------------------------------------------
-            # 4. Uniformly sample without replacement
+            # 3. Uniformly sample slot indices without replacement, then
+            #    resolve them in one streaming pass over the recordings
             # --------------------------------------------------------------
             rng = random.Random()
-            sample_size = min(target_count, len(slots))
-            chosen = rng.sample(slots, sample_size)
+            sample_size = min(target_count, total_slots)
+            locator = _SlotLocator(
+                sorted(rng.sample(range(total_slots), sample_size)),
+                segment_mode=segment_mode,
+                segment_length=segment_length,
+            )
+            slot_stmt = (
+                select(Recording.id, cast(effective, Float), slot_count)
+                .where(*conditions)
+                .order_by(Recording.id)
+                .execution_options(yield_per=_STREAM_BATCH_SIZE)
+            )
+            chosen: list[tuple[UUID, float, float]] = []
+            stream = await db.stream(slot_stmt)
+            async for batch in stream.partitions():
+                chosen.extend(locator.feed(batch))
+                if locator.done:
+                    break
+            await stream.close()
+            # Recordings deleted between the count and the stream leave
+            # indices unresolved; report what was actually created.
+            sample_size = len(chosen)
 
             # --------------------------------------------------------------
-            # 5. Bulk insert and flip status to READY
+            # 4. Bulk insert and flip status to READY
             # --------------------------------------------------------------
-            rows = [
-                AnnotationSegment(
-                    annotation_set_id=set_uuid,
-                    recording_id=rec_id,
-                    start_time_sec=float(start_t),
-                    end_time_sec=float(end_t),
+            if chosen:
+                await db.execute(
+                    insert(AnnotationSegment),
+                    [
+                        {
+                            "annotation_set_id": set_uuid,
+                            "recording_id": rec_id,
+                            "start_time_sec": float(start_t),
+                            "end_time_sec": float(end_t),
+                        }
+                        for rec_id, start_t, end_t in chosen
+                    ],
                 )
-                for rec_id, start_t, end_t in chosen
-            ]
-            db.add_all(rows)
 
             warning: str | None = None
             if sample_size < target_count:
@@ -299,6 +350,121 @@ async def _sample_annotation_segments(annotation_set_id: str) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
+class _SlotLocator:
+    """Resolve sorted global slot indices while recordings stream past.
+
+    The sampler's slot space is the concatenation of every candidate
+    recording's slots in a fixed order. :meth:`feed` takes the next batch of
+    ``(recording_id, effective_duration, slot_count)`` rows, advances a
+    running offset over them, and returns the
+    ``(recording_id, start_sec, end_sec)`` slots of the drawn indices that
+    fall inside the batch. Only the indices and the returned slots are held,
+    so memory is proportional to the sample size.
+    """
+
+    def __init__(
+        self,
+        indices: Sequence[int],
+        *,
+        segment_mode: str,
+        segment_length: float | None,
+    ) -> None:
+        self._indices = indices
+        self._segment_mode = segment_mode
+        self._segment_length = segment_length
+        self._next = 0
+        self._offset = 0
+
+    @property
+    def done(self) -> bool:
+        """True once every index has been resolved."""
+        return self._next >= len(self._indices)
+
+    def feed(self, rows: Iterable[Any]) -> list[tuple[UUID, float, float]]:
+        """Advance over ``rows`` and return the drawn slots they contain."""
+        slots: list[tuple[UUID, float, float]] = []
+        for rec_id, effective, count in rows:
+            end = self._offset + int(count)
+            while not self.done and self._indices[self._next] < end:
+                local = self._indices[self._next] - self._offset
+                slots.append(
+                    _slot_bounds(
+                        rec_id,
+                        local,
+                        float(effective),
+                        segment_mode=self._segment_mode,
+                        segment_length=self._segment_length,
+                    )
+                )
+                self._next += 1
+            self._offset = end
+            if self.done:
+                break
+        return slots
+
+
+def _slot_count(
+    effective: float, *, segment_mode: str, segment_length: float | None
+) -> int:
+    """Number of candidate slots in a recording of ``effective`` seconds.
+
+    Mirrors :func:`_slot_count_sql`, which the task filters and sums on.
+    """
+    if segment_mode == "whole_recording":
+        return 1
+    if segment_length is None:
+        return 0
+    step = segment_length * _SLOT_STEP_MULTIPLIER
+    if effective + _SLOT_FIT_EPSILON < segment_length:
+        return 0
+    return int((effective + _SLOT_FIT_EPSILON - segment_length) // step) + 1
+
+
+def _slot_count_sql(
+    effective: ColumnElement[Any], *, segment_mode: str, segment_length: float | None
+) -> ColumnElement[Any]:
+    """SQL counterpart of :func:`_slot_count` (same step and fit tolerance)."""
+    if segment_mode == "whole_recording":
+        return literal(1, BigInteger)
+    if segment_length is None:
+        return literal(0, BigInteger)
+    step = segment_length * _SLOT_STEP_MULTIPLIER
+    fitted = effective + _SLOT_FIT_EPSILON
+    return case(
+        (fitted < segment_length, literal(0, BigInteger)),
+        else_=cast(func.floor((fitted - segment_length) / step), BigInteger) + 1,
+    )
+
+
+def _slot_bounds(
+    rec_id: UUID,
+    index: int,
+    effective: float,
+    *,
+    segment_mode: str,
+    segment_length: float | None,
+) -> tuple[UUID, float, float]:
+    """Return the ``index``-th slot of a recording."""
+    if segment_mode == "whole_recording" or segment_length is None:
+        return (rec_id, 0.0, effective)
+    start = index * segment_length * _SLOT_STEP_MULTIPLIER
+    return (rec_id, start, start + segment_length)
+
+
+def _local_time_sql(value: ColumnElement[Any], tz: ZoneInfo) -> ColumnElement[Any]:
+    """Wall-clock time of the UTC-aware ``value`` in ``tz``, as SQL ``time``."""
+    return cast(func.timezone(tz.key, value), Time)
+
+
+def _time_in_range_sql(
+    value: ColumnElement[Any], start: dt_time, end: dt_time
+) -> ColumnElement[bool]:
+    """SQL counterpart of :func:`_time_in_range` (same wrap-around rule)."""
+    if start <= end:
+        return and_(value >= start, value <= end)
+    return or_(value >= start, value <= end)
+
+
 def _enumerate_segments(
     rec_rows: Sequence[Any],
     *,
@@ -310,7 +476,9 @@ def _enumerate_segments(
 ) -> list[tuple[UUID, float, float]]:
     """Enumerate candidate ``(recording_id, start_sec, end_sec)`` segments.
 
-    Pure function (no DB / no RNG) so it can be unit-tested in isolation.
+    Pure function (no DB / no RNG) spelling out the whole slot space the task
+    samples from; the task itself never builds this list (see
+    :class:`_SlotLocator`), but tests use it as the reference.
 
     Each row is ``(recording_id, duration, time_expansion, datetime)``.
     Recordings with no/zero duration or that fall outside the optional
@@ -348,13 +516,19 @@ def _enumerate_segments(
             continue
 
         # Fixed-length sliding-window slots (default behaviour).
-        if segment_length is None or effective < segment_length:
-            continue
-        step = segment_length * _SLOT_STEP_MULTIPLIER
-        t = 0.0
-        while t + segment_length <= effective + 1e-6:
-            slots.append((rec_id, t, t + segment_length))
-            t += step
+        count = _slot_count(
+            effective, segment_mode=segment_mode, segment_length=segment_length
+        )
+        slots.extend(
+            _slot_bounds(
+                rec_id,
+                index,
+                effective,
+                segment_mode=segment_mode,
+                segment_length=segment_length,
+            )
+            for index in range(count)
+        )
     return slots
 
 
@@ -0,0 +1,437 @@
+"""Background audit chain verification (FR-095 / FR-096).
+
+``POST /admin/audit-log/chain-verify`` used to recompute every
+``row_hash`` of an audit table inside the HTTP request — one blocking KMS
+``GenerateMac`` round trip per row. The endpoint now records an
+:class:`AuditChainVerification` row (``status='queued'``) and dispatches
+:func:`verify_audit_chain`, which:
+
+1. Looks up the newest checkpoint of the target table and trusts it only
+   if its MAC verifies and the checkpoint row still carries the recorded
+   ``row_hash`` (:func:`_load_checkpoint`). Otherwise — or when a full
+   run is requested — verification starts at the first row.
+2. Streams the rows after the checkpoint in ``(created_at, id)`` keyset
+   batches, fetching the next batch while the MACs of the current one
+   are computed on a bounded thread pool (the helpers shared with
+   :mod:`echoroo.workers.audit_log_export`).
+3. Commits ``rows_verified`` and a freshly signed checkpoint after every
+   batch, so the admin UI can poll progress and a run that dies half way
+   (worker restart, time limit) still saves the next run the work it did.
+4. Stops at the first mismatching row and records it.
+
+Checkpoints only advance to rows older than :data:`SETTLE_MARGIN`:
+``created_at`` is taken before the writer serialises on the chain tail,
+so a row committed a moment later can still sort before its neighbours.
+Rows newer than the margin are verified but not checkpointed, and are
+verified again by the next run.
+
+A checkpoint vouches for the rows up to it at the time they were
+verified; a run with ``full=True`` re-verifies the whole table.
+The daily beat entry queues an incremental verification of each table as
+its own :func:`verify_audit_chain` task, each with its own time limit. It
+first fails runs still ``queued`` or ``running`` :data:`STALE_RUN_AGE`
+after they were requested, whose worker was killed or whose message was
+lost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import logging
+from collections.abc import Iterable
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from echoroo.core.kms import compute_audit_chain_hash
+from echoroo.models.audit_chain_verification import AuditChainVerification
+from echoroo.workers.audit_log_export import (
+    MAC_WORKERS,
+    _aiter_row_batches,
+    _averify_rows,
+    _prefetched,
+    mac_executor,
+)
+from echoroo.workers.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+#: Audit table verified for each ``target``.
+TARGET_TABLES: dict[str, str] = {
+    "project": "project_audit_log",
+    "platform": "platform_audit_log",
+}
+
+#: Rows younger than this are verified but never checkpointed.
+SETTLE_MARGIN = timedelta(minutes=5)
+
+#: Runs still queued or running this long after the request are failed by
+#: the daily beat. Far beyond the task's hard time limit plus the broker's
+#: 1800 s visibility timeout.
+STALE_RUN_AGE = timedelta(hours=6)
+
+_STALE_ERROR = "verification did not finish; the worker was killed or the task was lost"
+
+# Domain separation: a checkpoint MAC can never collide with a row MAC,
+# whose message starts with the row's ISO timestamp.
+_CHECKPOINT_DOMAIN = "audit-chain-checkpoint:v1"
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Last settled row a run verified, and how many rows led up to it."""
+
+    row_id: UUID
+    created_at: datetime
+    row_hash: str
+    row_count: int
+
+    @property
+    def keyset(self) -> tuple[datetime, UUID]:
+        return (self.created_at, self.row_id)
+
+
+def _checkpoint_message(target: str, checkpoint: Checkpoint) -> bytes:
+    created_at = checkpoint.created_at.astimezone(UTC).isoformat()
+    return "\n".join(
+        [
+            _CHECKPOINT_DOMAIN,
+            target,
+            str(checkpoint.row_id),
+            created_at,
+            str(checkpoint.row_count),
+        ]
+    ).encode("utf-8")
+
+
+def sign_checkpoint(target: str, checkpoint: Checkpoint) -> str:
+    """MAC a checkpoint under the audit chain key."""
+    return compute_audit_chain_hash(checkpoint.row_hash, _checkpoint_message(target, checkpoint))
+
+
+def checkpoint_is_authentic(target: str, checkpoint: Checkpoint, mac: str) -> bool:
+    """Return True iff ``mac`` is the checkpoint's MAC."""
+    return hmac.compare_digest(sign_checkpoint(target, checkpoint), mac)
+
+
+def advance_checkpoint(
+    checkpoint: Checkpoint | None,
+    rows: Iterable[dict[str, Any]],
+    *,
+    covered: int,
+    settled_before: datetime,
+) -> Checkpoint | None:
+    """Move ``checkpoint`` to the last settled row of verified ``rows``.
+
+    Args:
+        checkpoint: Current checkpoint (None before the first one).
+        rows: Verified rows in ``(created_at, id)`` order.
+        covered: Rows verified from the start of the table up to, but not
+            including, ``rows``.
+        settled_before: Rows created at or after this are not checkpointed.
+    """
+    for row in rows:
+        covered += 1
+        if row["created_at"] >= settled_before:
+            break
+        checkpoint = Checkpoint(
+            row_id=row["id"],
+            created_at=row["created_at"],
+            row_hash=row["row_hash"],
+            row_count=covered,
+        )
+    return checkpoint
+
+
+async def _load_checkpoint(session: AsyncSession, target: str) -> tuple[UUID, Checkpoint] | None:
+    """Return the newest trustworthy checkpoint of ``target`` and its run."""
+    stmt = (
+        sa.select(AuditChainVerification)
+        .where(
+            AuditChainVerification.target == target,
+            AuditChainVerification.checkpoint_mac.is_not(None),
+        )
+        .order_by(
+            AuditChainVerification.checkpoint_created_at.desc(),
+            AuditChainVerification.checkpoint_row_id.desc(),
+        )
+        .limit(1)
+    )
+    run = (await session.execute(stmt)).scalar_one_or_none()
+    if run is None:
+        return None
+    assert run.checkpoint_row_id is not None
+    assert run.checkpoint_created_at is not None
+    assert run.checkpoint_row_hash is not None
+    assert run.checkpoint_row_count is not None
+    assert run.checkpoint_mac is not None
+    checkpoint = Checkpoint(
+        row_id=run.checkpoint_row_id,
+        created_at=run.checkpoint_created_at,
+        row_hash=run.checkpoint_row_hash,
+        row_count=run.checkpoint_row_count,
+    )
+    if not checkpoint_is_authentic(target, checkpoint, run.checkpoint_mac):
+        logger.critical(
+            "audit chain checkpoint MAC mismatch (target=%s run=%s); verifying in full",
+            target,
+            run.id,
+        )
+        return None
+    stored = await session.execute(
+        sa.text(f"SELECT row_hash FROM {TARGET_TABLES[target]} WHERE id = :id"),
+        {"id": checkpoint.row_id},
+    )
+    if stored.scalar_one_or_none() != checkpoint.row_hash:
+        logger.critical(
+            "audit chain checkpoint row %s missing or changed (target=%s); verifying in full",
+            checkpoint.row_id,
+            target,
+        )
+        return None
+    return run.id, checkpoint
+
+
+async def _count_rows(
+    session: AsyncSession, table: str, after: tuple[datetime, UUID] | None
+) -> int:
+    where = "WHERE (created_at, id) > (:created_at, :id)" if after is not None else ""
+    params = {"created_at": after[0], "id": after[1]} if after is not None else {}
+    result = await session.execute(sa.text(f"SELECT count(*) FROM {table} {where}"), params)
+    return int(result.scalar_one())
+
+
+async def _update_run(
+    session_factory: async_sessionmaker[AsyncSession], run_id: UUID, **values: Any
+) -> None:
+    async with session_factory() as session:
+        await session.execute(
+            sa.update(AuditChainVerification)
+            .where(AuditChainVerification.id == run_id)
+            .values(**values)
+        )
+        await session.commit()
+
+
+def _checkpoint_values(target: str, checkpoint: Checkpoint | None) -> dict[str, Any]:
+    if checkpoint is None:
+        return {}
+    return {
+        "checkpoint_row_id": checkpoint.row_id,
+        "checkpoint_created_at": checkpoint.created_at,
+        "checkpoint_row_hash": checkpoint.row_hash,
+        "checkpoint_row_count": checkpoint.row_count,
+        "checkpoint_mac": sign_checkpoint(target, checkpoint),
+    }
+
+
+async def _verify_run(
+    session_factory: async_sessionmaker[AsyncSession],
+    run_id: UUID,
+    *,
+    full: bool,
+) -> dict[str, Any]:
+    async with session_factory() as session:
+        run = await session.get(AuditChainVerification, run_id)
+        if run is None or run.status != "queued":
+            # Unknown id, or a redelivered message for a run already started.
+            logger.warning("audit chain verification %s is not queued; skipping", run_id)
+            return {"status": "skipped", "verification_id": str(run_id)}
+        target = run.target
+        table = TARGET_TABLES[target]
+        resume = None if full else await _load_checkpoint(session, target)
+        checkpoint = resume[1] if resume else None
+        after = checkpoint.keyset if checkpoint else None
+        run.status = "running"
+        run.resumed_from_id = resume[0] if resume else None
+        run.rows_total = await _count_rows(session, table, after)
+        await session.commit()
+
+    include_project_id = target == "project"
+    settled_before = datetime.now(UTC) - SETTLE_MARGIN
+    covered = checkpoint.row_count if checkpoint else 0
+    verified = 0
+    mismatch_id: UUID | None = None
+    executor = mac_executor()
+    try:
+        async with session_factory() as reader:
+            batches = _prefetched(_aiter_row_batches(reader, table, after=after))
+            async with aclosing(batches) as stream:
+                async for rows in stream:
+                    index = await _averify_rows(
+                        rows,
+                        include_project_id=include_project_id,
+                        executor=executor,
+                        workers=MAC_WORKERS,
+                    )
+                    good = rows if index is None else rows[:index]
+                    moved = advance_checkpoint(
+                        checkpoint, good, covered=covered, settled_before=settled_before
+                    )
+                    covered += len(good)
+                    verified += len(good)
+                    if index is not None:
+                        mismatch_id = rows[index]["id"]
+                    await _update_run(
+                        session_factory,
+                        run_id,
+                        rows_verified=verified,
+                        **(_checkpoint_values(target, moved) if moved is not checkpoint else {}),
+                    )
+                    checkpoint = moved
+                    if mismatch_id is not None:
+                        break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if mismatch_id is not None:
+        logger.critical(
+            "audit chain mismatch: table=%s row=%s (verification %s)", table, mismatch_id, run_id
+        )
+    await _update_run(
+        session_factory,
+        run_id,
+        status="success",
+        finished_at=datetime.now(UTC),
+        is_valid=mismatch_id is None,
+        first_mismatch_row_id=mismatch_id,
+        # A run that found nothing new carries the previous checkpoint over,
+        # so the latest run always shows how far the chain is vouched for.
+        **(_checkpoint_values(target, checkpoint) if resume and verified == 0 else {}),
+    )
+    return {
+        "status": "success",
+        "verification_id": str(run_id),
+        "target": target,
+        "rows_verified": verified,
+        "is_valid": mismatch_id is None,
+        "first_mismatch_row_id": str(mismatch_id) if mismatch_id else None,
+    }
+
+
+async def _run_verification_async(run_id: UUID, *, full: bool = False) -> dict[str, Any]:
+    """Verify one queued run, recording any failure on its row."""
+    from echoroo.workers.db_utils import get_worker_engine_and_session_factory
+
+    engine, session_factory = get_worker_engine_and_session_factory()
+    try:
+        try:
+            return await _verify_run(session_factory, run_id, full=full)
+        except Exception as exc:  # noqa: BLE001 — recorded into the run row
+            logger.exception("audit chain verification %s failed", run_id)
+            await _update_run(
+                session_factory,
+                run_id,
+                status="failure",
+                finished_at=datetime.now(UTC),
+                error_detail=repr(exc),
+            )
+            return {"status": "failure", "verification_id": str(run_id), "error_detail": repr(exc)}
+    finally:
+        await engine.dispose()
+
+
+async def _fail_stale_runs(
+    session_factory: async_sessionmaker[AsyncSession], *, now: datetime | None = None
+) -> list[UUID]:
+    """Fail runs left ``queued`` or ``running`` past :data:`STALE_RUN_AGE`.
+
+    Returns:
+        IDs of the failed runs.
+    """
+    now = now or datetime.now(UTC)
+    async with session_factory() as session:
+        failed = (
+            await session.scalars(
+                sa.update(AuditChainVerification)
+                .where(
+                    AuditChainVerification.status.in_(("queued", "running")),
+                    AuditChainVerification.started_at < now - STALE_RUN_AGE,
+                )
+                .values(status="failure", finished_at=now, error_detail=_STALE_ERROR)
+                .returning(AuditChainVerification.id)
+            )
+        ).all()
+        await session.commit()
+    for run_id in failed:
+        logger.warning("failed stale audit chain verification %s", run_id)
+    return list(failed)
+
+
+async def _queue_all_async() -> list[UUID]:
+    """Fail stale runs, then record one queued run per audit table."""
+    from echoroo.workers.db_utils import get_worker_engine_and_session_factory
+
+    engine, session_factory = get_worker_engine_and_session_factory()
+    run_ids: list[UUID] = []
+    try:
+        await _fail_stale_runs(session_factory)
+        async with session_factory() as session:
+            for target in TARGET_TABLES:
+                run = AuditChainVerification(
+                    target=target, status="queued", started_at=datetime.now(UTC)
+                )
+                session.add(run)
+                await session.flush()
+                run_ids.append(run.id)
+            await session.commit()
+    finally:
+        await engine.dispose()
+    return run_ids
+
+
+# ---------------------------------------------------------------------------
+# Celery tasks
+# ---------------------------------------------------------------------------
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.audit_chain_verify.verify_audit_chain",
+    bind=True,
+    # A full verification of a large table outlives the global 600 s
+    # limit. Stay under the broker's 1800 s visibility timeout; a run cut
+    # short keeps its per-batch checkpoint and the next one resumes there.
+    soft_time_limit=1500,
+    time_limit=1560,
+)
+def verify_audit_chain(
+    self: Any,  # noqa: ARG001 - bound task; reserved for retry()
+    verification_id: str,
+    full: bool = False,
+) -> dict[str, Any]:
+    """Run the queued :class:`AuditChainVerification` ``verification_id``."""
+    return asyncio.run(_run_verification_async(UUID(verification_id), full=full))
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.audit_chain_verify.verify_all_audit_chains",
+)
+def verify_all_audit_chains() -> list[str]:
+    """Queue an incremental verification of each audit table (daily beat entry).
+
+    Each table gets its own :func:`verify_audit_chain` task, so a long
+    verification of one table cannot use up the other's time limit.
+    """
+    run_ids = asyncio.run(_queue_all_async())
+    for run_id in run_ids:
+        verify_audit_chain.delay(str(run_id))
+    return [str(run_id) for run_id in run_ids]
+
+
+__all__ = [
+    "SETTLE_MARGIN",
+    "STALE_RUN_AGE",
+    "TARGET_TABLES",
+    "Checkpoint",
+    "advance_checkpoint",
+    "checkpoint_is_authentic",
+    "sign_checkpoint",
+    "verify_all_audit_chains",
+    "verify_audit_chain",
+]
@@ -2,17 +2,23 @@
 
 Each week this task:
 
-1. Reads every row inserted since the previous successful export from
-   ``project_audit_log`` and ``platform_audit_log``.
+1. Streams every row inserted since the previous successful export from
+   ``project_audit_log`` and ``platform_audit_log`` in ``(created_at, id)``
+   keyset batches (:func:`_aiter_row_batches`).
 2. Re-computes ``row_hash`` locally for each row (using the KMS-backed
    ``compute_audit_chain_hash``) and asserts it matches the stored value.
-   A mismatch aborts the export and raises ``AuditChainMismatchError`` so
-   a human can investigate before any compromised data is archived.
+   The MACs of a batch are computed on a bounded thread pool
+   (:func:`_averify_rows`) while the next batch is fetched. A mismatch
+   aborts the export and raises ``AuditChainMismatchError`` so a human can
+   investigate before any compromised data is archived.
 3. Serialises the verified rows as NDJSON (one JSON object per line,
    UTF-8, newline-terminated).
-4. Uploads the NDJSON document to the configured S3 Object Lock bucket in
+4. Streams the NDJSON document, batch by batch, into a multipart upload
+   (:func:`_object_lock_writer`) to the configured S3 Object Lock bucket in
    ``GOVERNANCE`` mode with a 3-year retention (``RetainUntilDate = now +
-   3 years``). GOVERNANCE mode is chosen (not COMPLIANCE) so that the
+   3 years``). Only one part is held in memory; the upload is completed
+   after the last verified batch and aborted on a mismatch, so a partial
+   document is never archived. GOVERNANCE mode is chosen (not COMPLIANCE) so that the
    creator_founder override pathway can still remove the last audit copy
    during the emergency wipe flow (FR-114); production rollout may later
    flip to COMPLIANCE if operations agree.
@@ -29,16 +35,22 @@ object key (``audit-log/<table>/<YYYY>/<WW>.ndjson``), and S3's
 
 from __future__ import annotations
 
+import asyncio
 import io
 import json
 import logging
+from collections.abc import AsyncGenerator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import aclosing
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import Any
+from uuid import UUID
 
 from celery import shared_task
 
 from echoroo.core.kms import compute_audit_chain_hash
-from echoroo.core.s3 import get_s3_client
+from echoroo.core.s3 import MultipartUploadWriter, get_s3_client
 from echoroo.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -48,12 +60,19 @@ logger = logging.getLogger(__name__)
 _RETENTION_YEARS = 3
 _RETENTION_DELTA = timedelta(days=365 * _RETENTION_YEARS)
 
+# Rows per keyset batch.
+_BATCH_SIZE = 1000
+
+# Concurrent KMS ``GenerateMac`` calls; botocore pools 10 connections per
+# client, so more threads would only queue on the pool.
+MAC_WORKERS = 8
+
 
 class AuditChainMismatchError(RuntimeError):
     """Raised when the recomputed row_hash does not match the stored value.
 
-    The worker aborts before any S3 upload so an on-call engineer can
-    investigate. The mismatch itself is logged via ``platform_audit_log``
+    The worker aborts the S3 upload before the object is completed so an
+    on-call engineer can investigate. The mismatch itself is logged via ``platform_audit_log``
     before the exception propagates.
     """
 
@@ -92,15 +111,71 @@ def _canonical_row(row: dict[str, Any], *, include_project_id: bool) -> bytes:
 
 def _verify_chain(rows: list[dict[str, Any]], *, include_project_id: bool) -> None:
     """Assert every row's ``row_hash`` matches the recomputed MAC."""
-    for row in rows:
+    index = _first_mismatch(rows, include_project_id=include_project_id)
+    if index is not None:
+        _raise_mismatch(rows[index], include_project_id=include_project_id)
+
+
+def _first_mismatch(rows: list[dict[str, Any]], *, include_project_id: bool) -> int | None:
+    """Return the index of the first row whose MAC does not match, if any."""
+    for index, row in enumerate(rows):
         recomputed = compute_audit_chain_hash(
             row["prev_hash"], _canonical_row(row, include_project_id=include_project_id)
         )
         if recomputed != row["row_hash"]:
-            raise AuditChainMismatchError(
-                f"row_hash mismatch for id={row.get('id')!r}: "
-                f"stored={row['row_hash']!r} recomputed={recomputed!r}"
-            )
+            return index
+    return None
+
+
+def _raise_mismatch(row: dict[str, Any], *, include_project_id: bool) -> None:
+    recomputed = compute_audit_chain_hash(
+        row["prev_hash"], _canonical_row(row, include_project_id=include_project_id)
+    )
+    raise AuditChainMismatchError(
+        f"row_hash mismatch for id={row.get('id')!r}: "
+        f"stored={row['row_hash']!r} recomputed={recomputed!r}"
+    )
+
+
+async def _averify_rows(
+    rows: list[dict[str, Any]],
+    *,
+    include_project_id: bool,
+    executor: Executor,
+    workers: int = MAC_WORKERS,
+) -> int | None:
+    """Verify ``rows`` on ``executor``; return the first mismatching index.
+
+    ``compute_audit_chain_hash`` is a blocking KMS round trip, so the rows
+    are split into one contiguous slice per worker and the slices run in
+    parallel. Each slice reports its own first mismatch, so the earliest
+    one overall is still found. ``workers`` should match the executor's
+    size. The first row runs alone: it builds the
+    process-wide KMS client (boto3's default session is not thread-safe)
+    before the pool fans out.
+    """
+    if not rows:
+        return None
+    loop = asyncio.get_running_loop()
+    check = partial(_first_mismatch, include_project_id=include_project_id)
+    if await loop.run_in_executor(executor, check, rows[:1]) is not None:
+        return 0
+    if len(rows) == 1:
+        return None
+    size = -(-(len(rows) - 1) // workers)
+    starts = list(range(1, len(rows), size))
+    results = await asyncio.gather(
+        *(loop.run_in_executor(executor, check, rows[start : start + size]) for start in starts)
+    )
+    for start, index in zip(starts, results, strict=True):
+        if index is not None:
+            return start + index
+    return None
+
+
+def mac_executor() -> ThreadPoolExecutor:
+    """Thread pool for :func:`_averify_rows`; the caller shuts it down."""
+    return ThreadPoolExecutor(max_workers=MAC_WORKERS, thread_name_prefix="audit-mac")
 
 
 def _serialize_ndjson(rows: list[dict[str, Any]]) -> bytes:
@@ -130,45 +205,40 @@ def _week_object_key(table: str, *, at: datetime) -> str:
     return f"audit-log/{table}/{iso_year:04d}/{iso_week:02d}.ndjson"
 
 
-def _upload_with_object_lock(
+def _object_lock_writer(
     *,
     bucket: str,
     key: str,
-    body: bytes,
     now: datetime,
-) -> None:
-    """Upload ``body`` to S3 with GOVERNANCE-mode Object Lock retention.
+) -> MultipartUploadWriter:
+    """Open a multipart upload to S3 with GOVERNANCE-mode Object Lock retention.
 
-    The bucket must have Object Lock configured at creation time. Putting
-    Retention parameters on a non-Object-Lock bucket raises
+    The NDJSON document is streamed into the returned writer one part at a
+    time; closing it completes the object and aborting it leaves nothing
+    behind. The bucket must have Object Lock configured at creation time.
+    Putting Retention parameters on a non-Object-Lock bucket raises
     ``InvalidRequest`` — the deployment Runbook documents the one-time
     bucket provisioning step.
     """
-    client = get_s3_client()
     retain_until = now + _RETENTION_DELTA
-    # FR-028e: route every PutObject kwargs dict through the GPS-metadata
+    # FR-028e: route every upload kwargs dict through the GPS-metadata
     # sanitizer for defense in depth, even when the local caller never sets
     # user-defined Metadata. This keeps the surface uniform so a later
     # refactor adding Metadata cannot regress.
     from echoroo.services.s3_upload_sanitizer import sanitize_put_object_kwargs
 
-    put_kwargs = sanitize_put_object_kwargs(
+    upload_kwargs = sanitize_put_object_kwargs(
         {
-            "Bucket": bucket,
-            "Key": key,
-            "Body": body,
-            "ContentType": "application/x-ndjson",
             "ObjectLockMode": "GOVERNANCE",
             "ObjectLockRetainUntilDate": retain_until,
         }
     )
-    client.put_object(**put_kwargs)
-    logger.info(
-        "audit export uploaded bucket=%s key=%s bytes=%d retain_until=%s",
-        bucket,
+    return MultipartUploadWriter(
         key,
-        len(body),
-        retain_until.isoformat(),
+        content_type="application/x-ndjson",
+        bucket=bucket,
+        extra_args=upload_kwargs,
+        client=get_s3_client(),
     )
 
 
@@ -233,22 +303,49 @@ def export_weekly(since_iso: str | None = None) -> dict[str, Any]:
     # export is a simple read-then-upload job so we wrap a synchronous
     # consumer below. Celery's ``shared_task`` is synchronous, so any
     # async DB driver the app ships with must be run inside ``asyncio.run``.
-    import asyncio
-
     async def _run() -> None:
         async with session_factory() as session:
             for table in ("project_audit_log", "platform_audit_log"):
-                rows = await _afetch_rows(session, table, since=cursor)
-                _verify_chain(rows, include_project_id=(table == "project_audit_log"))
-                body = _serialize_ndjson(rows)
+                include_project_id = table == "project_audit_log"
                 key = _week_object_key(table, at=now)
-                if rows:
-                    _upload_with_object_lock(
-                        bucket=bucket, key=key, body=body, now=now
-                    )
-                summary["tables"][table] = {"row_count": len(rows), "s3_key": key}
-
-    asyncio.run(_run())
+                writer: MultipartUploadWriter | None = None
+                row_count = 0
+                batches = _prefetched(_aiter_row_batches(session, table, since=cursor))
+                try:
+                    async with aclosing(batches) as stream:
+                        async for rows in stream:
+                            mismatch = await _averify_rows(
+                                rows, include_project_id=include_project_id, executor=executor
+                            )
+                            if mismatch is not None:
+                                _raise_mismatch(
+                                    rows[mismatch], include_project_id=include_project_id
+                                )
+                            if writer is None:
+                                writer = await asyncio.to_thread(
+                                    _object_lock_writer, bucket=bucket, key=key, now=now
+                                )
+                            await asyncio.to_thread(writer.write, _serialize_ndjson(rows))
+                            row_count += len(rows)
+                    if writer is not None:
+                        await asyncio.to_thread(writer.close)
+                        logger.info(
+                            "audit export uploaded bucket=%s key=%s bytes=%d",
+                            bucket,
+                            key,
+                            writer.bytes_written,
+                        )
+                except BaseException:
+                    if writer is not None:
+                        writer.abort()
+                    raise
+                summary["tables"][table] = {"row_count": row_count, "s3_key": key}
+
+    executor = mac_executor()
+    try:
+        asyncio.run(_run())
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     return summary
 
 
@@ -272,7 +369,84 @@ async def _afetch_rows(session: Any, table: str, *, since: datetime | None) -> l
     return [dict(row) for row in mapped]
 
 
+async def _afetch_batch(
+    session: Any,
+    table: str,
+    *,
+    since: datetime | None = None,
+    after: tuple[datetime, UUID] | None = None,
+    limit: int = _BATCH_SIZE,
+) -> list[dict[str, Any]]:
+    """Fetch up to ``limit`` rows strictly after the ``(created_at, id)`` key.
+
+    The row-value comparison is served by the ``(created_at, id)`` index
+    (migration 0038), so every batch is a short index range scan however
+    deep into the table it starts.
+    """
+    import sqlalchemy as sa
+
+    clauses: list[str] = []
+    params: dict[str, Any] = {"limit": limit}
+    if since is not None:
+        clauses.append("created_at > :since")
+        params["since"] = since
+    if after is not None:
+        clauses.append("(created_at, id) > (:after_created_at, :after_id)")
+        params["after_created_at"], params["after_id"] = after
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    project_col = "project_id, " if table == "project_audit_log" else ""
+    stmt = sa.text(
+        f"SELECT id, created_at, actor_user_id_hash, {project_col}"
+        f"action, detail, request_id, ip_hash, user_agent_hash, "
+        f"before, after, prev_hash, row_hash "
+        f"FROM {table} {where} ORDER BY created_at ASC, id ASC LIMIT :limit"
+    )
+    result = await session.execute(stmt, params)
+    return [dict(row) for row in result.mappings().all()]
+
+
+async def _aiter_row_batches(
+    session: Any,
+    table: str,
+    *,
+    since: datetime | None = None,
+    after: tuple[datetime, UUID] | None = None,
+    batch_size: int = _BATCH_SIZE,
+) -> AsyncGenerator[list[dict[str, Any]]]:
+    """Yield the rows of ``table`` in ``(created_at, id)`` keyset batches."""
+    while True:
+        rows = await _afetch_batch(session, table, since=since, after=after, limit=batch_size)
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
+        after = (rows[-1]["created_at"], rows[-1]["id"])
+
+
+async def _prefetched(
+    batches: AsyncGenerator[list[dict[str, Any]]],
+) -> AsyncGenerator[list[dict[str, Any]]]:
+    """Fetch the next batch while the consumer works on the current one.
+
+    The consumer must not use the session behind ``batches`` itself, and
+    should close this generator (``contextlib.aclosing``) if it stops early.
+    """
+    pending = asyncio.ensure_future(anext(batches, None))
+    try:
+        while (rows := await pending) is not None:
+            pending = asyncio.ensure_future(anext(batches, None))
+            yield rows
+    finally:
+        if not pending.done():
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+        await batches.aclose()
+
+
 __all__ = [
+    "MAC_WORKERS",
     "AuditChainMismatchError",
     "export_weekly",
+    "mac_executor",
 ]
@@ -85,6 +85,7 @@ app.conf.update(
 app.conf.task_routes = {
     "echoroo.workers.ml_tasks.run_birdnet_detection": {"queue": "gpu"},
     "echoroo.workers.ml_tasks.run_detection": {"queue": "gpu"},
+    "echoroo.workers.ml_tasks.precompute_birdnet_geo_species": {"queue": "gpu"},
     "echoroo.workers.ml_tasks.run_embedding_generation": {"queue": "gpu"},
     "echoroo.workers.search_tasks.run_batch_search": {"queue": "gpu"},
 }
@@ -94,6 +95,8 @@ app.conf.task_routes = {
 # worker_ready signal handler is registered in every worker process.
 app.conf.include = [
     "echoroo.workers.upload_tasks",
+    # Compressed playback transcodes, enqueued by imports and first plays.
+    "echoroo.workers.playback_tasks",
     "echoroo.workers.ml_tasks",
     "echoroo.workers.taxon_tasks",
     "echoroo.workers.search_tasks",
@@ -158,6 +161,21 @@ app.conf.include = [
     # ``sync_iucn_red_list`` in every worker so the beat entry below can
     # dispatch it by name (and the admin force-resync ``.delay()`` resolves).
     "echoroo.workers.iucn_sync",
+    # Weekly safety-net rebuild of the trigger-maintained detection summary
+    # rollups (``detection_species_rollups`` / ``detection_temporal_rollups``).
+    "echoroo.workers.detection_rollups",
+    # FR-095 / FR-096 — background audit chain verification, dispatched by
+    # ``POST /admin/audit-log/chain-verify`` and the daily beat entry.
+    "echoroo.workers.audit_chain_verify",
+    # Chunked background deletion of datasets and projects, dispatched by
+    # their DELETE routes (202 + ``deletion_jobs`` row).
+    "echoroo.workers.deletion_tasks",
+    # Streaming ML-dataset ZIP exports to object storage, dispatched by
+    # ``POST .../detections/export/ml-dataset/jobs``.
+    "echoroo.workers.detection_export_tasks",
+    # Dataset-wide clip generation, dispatched by
+    # ``POST .../datasets/{dataset_id}/clips/generate``.
+    "echoroo.workers.clip_tasks",
 ]
 
 # Periodic tasks (beat schedule)
@@ -190,13 +208,12 @@ app.conf.beat_schedule = {
         "task": "echoroo.workers.iucn_sync.sync_iucn_red_list",
         "schedule": crontab(hour=4, minute=0, day_of_week=0),  # Every Sunday at 04:00 UTC
     },
-    # Drain the transactional outbox at 1Hz-ish (every 30s — the
-    # spec's SLO is p95 ≤ 10s end-to-end which is set by the worker
-    # poll cadence, not the beat trigger). Each beat tick fans the
-    # work out across ``-c 4`` worker-cpu processes; the actual
-    # ``SELECT ... FOR UPDATE SKIP LOCKED`` claim happens inside the
-    # task body. Beat-driven invocation is the canonical wiring per
-    # research.md §6.
+    # Safety-net drain of the transactional outbox every 30s. The
+    # latency path is the ``outbox-listener`` process
+    # (echoroo.workers.outbox_listener), which wakes on the pg_notify
+    # issued by ``enqueue``; this tick only matters when the listener
+    # is down. Both claim with ``SELECT ... FOR UPDATE SKIP LOCKED``, so
+    # running them side by side never double-processes a row.
     "drain-outbox-events": {
         "task": "echoroo.workers.outbox_processor.process_outbox_batch",
         "schedule": 30.0,  # seconds — see docstring above.
@@ -287,6 +304,36 @@ app.conf.beat_schedule = {
         "task": "echoroo.workers.banner_gc.gc_user_banner_dismissals",
         "schedule": crontab(hour=3, minute=30),
     },
+    # Detection summary rollups are exact under the triggers; this weekly
+    # rebuild only repairs drift from writes that bypass them (TRUNCATE,
+    # restores with triggers disabled). Sundays 05:00 UTC, after the 04:00
+    # IUCN sync.
+    "rebuild-detection-rollups-weekly": {
+        "task": "echoroo.workers.detection_rollups.rebuild_detection_rollups",
+        "schedule": crontab(hour=5, minute=0, day_of_week=0),
+    },
+    # An ML-dataset export killed by its hard time limit never records its
+    # failure; fail such jobs (and abort their uploads) every 10 minutes,
+    # offset from the */10 upload janitor.
+    "reap-stale-ml-dataset-exports": {
+        "task": "echoroo.workers.detection_export_tasks.reap_stale_ml_dataset_exports",
+        "schedule": crontab(minute="5-59/10"),
+    },
+    # A deletion job whose worker hit the hard time limit never records it
+    # and would keep its dataset / project ``deleting`` forever; re-send
+    # such jobs as continuations every 10 minutes.
+    "requeue-stale-deletion-jobs": {
+        "task": "echoroo.workers.deletion_tasks.requeue_stale_deletion_jobs",
+        "schedule": crontab(minute="7-59/10"),
+    },
+    # FR-095 — daily incremental audit chain verification: one queued task
+    # per audit table. Each run resumes from the previous signed checkpoint,
+    # so only the last day's rows cost KMS calls. 03:45 UTC follows the
+    # 03:30 banner GC.
+    "verify-audit-chains-daily": {
+        "task": "echoroo.workers.audit_chain_verify.verify_all_audit_chains",
+        "schedule": crontab(hour=3, minute=45),
+    },
 }
 
 
@@ -15,8 +15,6 @@ import numpy as np
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from echoroo.core.settings import get_settings
-
 logger = logging.getLogger(__name__)
 
 # Maximum number of unlabeled embeddings to fetch for semi-supervised training
@@ -230,22 +228,9 @@ async def _download_model_from_s3(s3_key: str, local_path: Path) -> None:
     Raises:
         Exception: If the S3 download fails.
     """
-    import asyncio
-
-    from echoroo.core.s3 import get_s3_client
+    from echoroo.core import s3_async
 
-    settings = get_settings()
-    s3_client = get_s3_client()
-
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(
-        None,
-        lambda: s3_client.download_file(
-            settings.S3_BUCKET,
-            s3_key,
-            str(local_path),
-        ),
-    )
+    await s3_async.download_file(s3_key, local_path)
 
 async def _upload_model_to_s3(local_path: Path, s3_key: str) -> None:
     """Upload a serialized model file to S3.
@@ -257,23 +242,9 @@ async def _upload_model_to_s3(local_path: Path, s3_key: str) -> None:
     Raises:
         Exception: If the S3 upload fails.
     """
-    import asyncio
-
-    from echoroo.core.s3 import get_s3_client
-
-    settings = get_settings()
-    s3_client = get_s3_client()
-
-    # boto3 upload_file is blocking — run in a thread pool to avoid blocking the event loop
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(
-        None,
-        lambda: s3_client.upload_file(
-            str(local_path),
-            settings.S3_BUCKET,
-            s3_key,
-        ),
-    )
+    from echoroo.core import s3_async
+
+    await s3_async.upload_file(local_path, s3_key)
 
 def _parse_vectors(raw_vectors: list[Any]) -> np.ndarray:
     """Parse a list of raw pgvector values into a float32 numpy array.
@@ -0,0 +1,152 @@
+"""Background dataset-wide clip generation.
+
+Generating fixed-length clips for a dataset used to take one
+``.../recordings/{id}/clips/generate`` request per recording, each
+planning its windows in a Python loop and inserting them through the ORM.
+The API now records a queued
+:class:`~echoroo.models.clip_generation_job.ClipGenerationJob` and
+dispatches :func:`run_clip_generation`, which runs
+:meth:`ClipService.generate_dataset_clips`:
+
+1. Recordings are read in keyset pages of ``(id, duration)`` only.
+2. The windows of a whole page are planned at once with numpy.
+3. Each batch of windows is ``COPY``-ed into a staging table and inserted
+   with one anti-join statement that skips clips the dataset already has.
+4. Progress is committed on the job after every batch, together with the
+   clips it inserted.
+
+Because existing windows are skipped, a job that fails or hits the time
+limit has kept every batch it committed, and requesting the same
+generation again finishes the remainder.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from echoroo.models.clip_generation_job import ClipGenerationJob
+from echoroo.services.clip import ClipGenerationStats, ClipService
+from echoroo.workers.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+
+async def _update_job(session: AsyncSession, job_id: UUID, **values: Any) -> None:
+    await session.execute(
+        sa.update(ClipGenerationJob).where(ClipGenerationJob.id == job_id).values(**values)
+    )
+
+
+async def _run_job(
+    session_factory: async_sessionmaker[AsyncSession], job_id: UUID
+) -> dict[str, Any]:
+    # Claim the job atomically so a redelivered message cannot run it twice.
+    async with session_factory() as session:
+        job = (
+            await session.execute(
+                sa.select(ClipGenerationJob)
+                .where(ClipGenerationJob.id == job_id, ClipGenerationJob.status == "queued")
+                .with_for_update(skip_locked=True)
+            )
+        ).scalar_one_or_none()
+        if job is None:
+            logger.warning("Clip generation job %s is not claimable; skipping", job_id)
+            return {"status": "skipped", "job_id": str(job_id)}
+        job.status = "running"
+        dataset_id = job.dataset_id
+        params = {
+            "clip_length": job.clip_length,
+            "overlap": job.overlap,
+            "start_time": job.start_time,
+            "end_time": job.end_time,
+        }
+        await session.commit()
+
+    async with session_factory() as session:
+
+        async def report(stats: ClipGenerationStats) -> None:
+            await _update_job(
+                session,
+                job_id,
+                recordings_processed=stats.recordings_processed,
+                clips_created=stats.clips_created,
+            )
+            await session.commit()
+
+        stats = await ClipService(session).generate_dataset_clips(
+            dataset_id, on_batch=report, **params
+        )
+        await _update_job(
+            session,
+            job_id,
+            status="success",
+            recordings_processed=stats.recordings_processed,
+            clips_created=stats.clips_created,
+            finished_at=datetime.now(UTC),
+        )
+        await session.commit()
+    logger.info(
+        "generated clips for dataset %s: %d recordings, %d windows, %d new clips",
+        dataset_id,
+        stats.recordings_processed,
+        stats.windows_planned,
+        stats.clips_created,
+    )
+    return {
+        "status": "success",
+        "job_id": str(job_id),
+        "recordings_processed": stats.recordings_processed,
+        "clips_created": stats.clips_created,
+    }
+
+
+async def _run_clip_generation_async(job_id: UUID) -> dict[str, Any]:
+    """Run one clip generation job, recording any failure on its row."""
+    from echoroo.workers.db_utils import get_worker_engine_and_session_factory
+
+    engine, session_factory = get_worker_engine_and_session_factory()
+    try:
+        try:
+            return await _run_job(session_factory, job_id)
+        except Exception as exc:  # noqa: BLE001 — recorded into the job row
+            logger.exception("Clip generation job %s failed", job_id)
+            async with session_factory() as session:
+                await _update_job(
+                    session,
+                    job_id,
+                    status="failure",
+                    finished_at=datetime.now(UTC),
+                    error_detail=repr(exc),
+                )
+                await session.commit()
+            return {"status": "failure", "job_id": str(job_id), "error_detail": repr(exc)}
+    finally:
+        await engine.dispose()
+
+
+# ---------------------------------------------------------------------------
+# Celery task
+# ---------------------------------------------------------------------------
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.clip_tasks.run_clip_generation",
+    bind=True,
+    # Above the global 600 s limit for the largest datasets; below the
+    # broker's 1800 s visibility timeout.
+    soft_time_limit=1500,
+    time_limit=1560,
+)
+def run_clip_generation(
+    self: Any,  # noqa: ARG001 - bound task; reserved for retry()
+    job_id: str,
+) -> dict[str, Any]:
+    """Run the queued :class:`ClipGenerationJob` ``job_id``."""
+    return asyncio.run(_run_clip_generation_async(UUID(job_id)))
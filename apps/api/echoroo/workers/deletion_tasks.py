@@ -0,0 +1,404 @@
+"""Background chunked deletion of datasets and projects.
+
+``DELETE`` on a dataset or project used to run one cascading ``DELETE``
+inside the API request: for a large dataset that removed millions of
+``embeddings`` / ``recording_annotations`` rows in a single transaction
+(long locks, a WAL burst the replicas lag behind, request timeouts) and
+left the audio objects in S3. The API now marks the entity ``deleting``,
+records a queued :class:`~echoroo.models.deletion_job.DeletionJob` and
+dispatches :func:`run_deletion_job`, which:
+
+1. Deletes the recording children of every affected dataset in batches of
+   :data:`BATCH_SIZE` rows, table by table in :data:`RECORDING_CHILD_TABLES`
+   order — embeddings first, they are by far the largest — then the
+   recordings themselves. Each batch is its own short transaction that
+   also bumps ``rows_deleted`` on the job, so progress is visible and a
+   crash loses at most one batch.
+2. Deletes the S3 objects under the entity's prefixes
+   (:func:`dataset_storage_prefixes` / :func:`project_storage_prefixes`)
+   with ``s3:DeleteObjects`` calls of up to 1000 keys.
+3. Deletes the dataset or project row. The remaining ``ON DELETE CASCADE``
+   children (upload sessions, annotation sets, members, ...) are small.
+
+A job stops starting new batches after :data:`TIME_BUDGET_SECONDS` and
+re-enqueues itself to continue, staying well inside the task time limit.
+Deleting is idempotent, so a redelivered message or a retry after a
+failure simply carries on with whatever is left. A failure is recorded on
+the job; the entity stays ``deleting`` and the user can re-issue the
+delete, which queues a new job.
+
+A worker killed by the hard time limit (or lost with its host) records
+nothing, so :func:`requeue_stale_deletion_jobs` periodically re-sends jobs
+still ``running`` :data:`STALE_CLAIM_AGE` after their claim as
+continuations, which pick up where the dead worker stopped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from echoroo.core.s3 import delete_objects_batch, list_objects_paginated
+from echoroo.models.deletion_job import DeletionJob
+from echoroo.workers.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+#: Rows removed per DELETE statement (and per transaction).
+BATCH_SIZE = 5000
+
+#: Keys per ``s3:DeleteObjects`` call (the API maximum).
+S3_DELETE_BATCH = 1000
+
+#: Work a single task invocation does before re-enqueueing the job.
+TIME_BUDGET_SECONDS = 1200
+
+# Above the global 600 s limit so one invocation can use its whole
+# TIME_BUDGET_SECONDS; below the broker's 1800 s visibility timeout.
+_SOFT_TIME_LIMIT = 1500
+_TIME_LIMIT = 1560
+
+#: A job claimed longer ago than this has outlived any task (the hard time
+#: limit plus slack) and is re-sent as a continuation.
+STALE_CLAIM_AGE = timedelta(seconds=_TIME_LIMIT) + timedelta(minutes=5)
+
+#: Tables keyed by ``recording_id``, in deletion order. Their own children
+#: (comments, votes, tallies, sampling round items, time ranges) are small
+#: and go with them through ``ON DELETE CASCADE``.
+RECORDING_CHILD_TABLES: tuple[str, ...] = (
+    "embeddings",
+    "recording_annotations",
+    "detections",
+    "clips",
+    "confirmed_regions",
+    "annotation_segments",
+)
+
+_RECORDINGS_BATCH = sa.text(
+    "DELETE FROM recordings WHERE id IN ("
+    "SELECT id FROM recordings WHERE dataset_id = :dataset_id LIMIT :limit)"
+)
+
+
+def _child_batch_statement(table: str) -> sa.TextClause:
+    """DELETE of up to ``:limit`` rows of ``table`` under ``:dataset_id``."""
+    return sa.text(
+        f"DELETE FROM {table} WHERE id IN ("
+        f"SELECT c.id FROM {table} c JOIN recordings r ON r.id = c.recording_id "
+        "WHERE r.dataset_id = :dataset_id LIMIT :limit)"
+    )
+
+
+def dataset_storage_prefixes(project_id: UUID, dataset_id: UUID) -> list[str]:
+    """S3 prefixes owned by a dataset (imported audio and upload staging)."""
+    return [
+        f"recordings/{project_id}/{dataset_id}/",
+        f"uploads/{project_id}/{dataset_id}/",
+    ]
+
+
+def project_storage_prefixes(project_id: UUID) -> list[str]:
+    """S3 prefixes owned by a project, including every dataset's."""
+    return [
+        f"recordings/{project_id}/",
+        f"uploads/{project_id}/",
+        f"search_reference/{project_id}/",
+        f"models/{project_id}/",
+        f"exports/{project_id}/",
+    ]
+
+
+class _OutOfTime(Exception):
+    """The invocation used up its time budget; the job continues later."""
+
+
+@dataclass
+class _Progress:
+    """Counters of one job, flushed to its row with every batch."""
+
+    job_id: UUID
+    rows_deleted: int = 0
+    objects_deleted: int = 0
+    deadline: float = field(default_factory=lambda: time.monotonic() + TIME_BUDGET_SECONDS)
+
+    def check_time(self) -> None:
+        if time.monotonic() >= self.deadline:
+            raise _OutOfTime
+
+    def values(self) -> dict[str, Any]:
+        return {"rows_deleted": self.rows_deleted, "objects_deleted": self.objects_deleted}
+
+
+async def _update_job(session: AsyncSession, job_id: UUID, **values: Any) -> None:
+    await session.execute(sa.update(DeletionJob).where(DeletionJob.id == job_id).values(**values))
+
+
+async def _set_stage(
+    session_factory: async_sessionmaker[AsyncSession], progress: _Progress, stage: str
+) -> None:
+    async with session_factory() as session:
+        await _update_job(session, progress.job_id, stage=stage, **progress.values())
+        await session.commit()
+
+
+async def _delete_in_batches(
+    session_factory: async_sessionmaker[AsyncSession],
+    progress: _Progress,
+    statement: sa.TextClause,
+    params: dict[str, Any],
+) -> None:
+    """Run ``statement`` until it deletes fewer than :data:`BATCH_SIZE` rows."""
+    while True:
+        progress.check_time()
+        async with session_factory() as session:
+            result = await session.execute(statement, {**params, "limit": BATCH_SIZE})
+            deleted = int(getattr(result, "rowcount", 0) or 0)
+            progress.rows_deleted += deleted
+            await _update_job(session, progress.job_id, **progress.values())
+            await session.commit()
+        if deleted < BATCH_SIZE:
+            return
+
+
+async def _delete_dataset_rows(
+    session_factory: async_sessionmaker[AsyncSession], progress: _Progress, dataset_id: UUID
+) -> None:
+    """Delete the recordings of a dataset and everything keyed by them."""
+    params = {"dataset_id": dataset_id}
+    for table in RECORDING_CHILD_TABLES:
+        await _set_stage(session_factory, progress, table)
+        await _delete_in_batches(session_factory, progress, _child_batch_statement(table), params)
+    await _set_stage(session_factory, progress, "recordings")
+    await _delete_in_batches(session_factory, progress, _RECORDINGS_BATCH, params)
+
+
+async def _delete_storage(
+    session_factory: async_sessionmaker[AsyncSession], progress: _Progress, prefixes: list[str]
+) -> None:
+    """Delete every S3 object under ``prefixes`` in 1000-key batches.
+
+    Raises:
+        RuntimeError: If S3 refused to delete some keys.
+    """
+    await _set_stage(session_factory, progress, "storage")
+    failed: list[str] = []
+
+    async def flush(keys: list[str]) -> None:
+        result = delete_objects_batch(keys)
+        progress.objects_deleted += len(result.deleted)
+        failed.extend(f"{error.key}: {error.code}" for error in result.errors)
+        async with session_factory() as session:
+            await _update_job(session, progress.job_id, **progress.values())
+            await session.commit()
+
+    for prefix in prefixes:
+        keys: list[str] = []
+        for obj in list_objects_paginated(prefix):
+            keys.append(obj.key)
+            if len(keys) == S3_DELETE_BATCH:
+                progress.check_time()
+                await flush(keys)
+                keys = []
+        if keys:
+            await flush(keys)
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} S3 objects could not be deleted, e.g. {failed[:5]}")
+
+
+async def _delete_entity(
+    session_factory: async_sessionmaker[AsyncSession],
+    progress: _Progress,
+    table: str,
+    entity_id: UUID,
+) -> None:
+    await _set_stage(session_factory, progress, "entity")
+    async with session_factory() as session:
+        result = await session.execute(
+            sa.text(f"DELETE FROM {table} WHERE id = :id"), {"id": entity_id}
+        )
+        progress.rows_deleted += int(getattr(result, "rowcount", 0) or 0)
+        await _update_job(session, progress.job_id, **progress.values())
+        await session.commit()
+
+
+async def _run_job(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_id: UUID,
+    *,
+    continuation: bool,
+) -> dict[str, Any]:
+    # Claim the job atomically: the API re-dispatches a job it finds still
+    # queued, so two messages for one job are possible.
+    claimable = ("queued", "running") if continuation else ("queued",)
+    async with session_factory() as session:
+        job = (
+            await session.execute(
+                sa.select(DeletionJob)
+                .where(DeletionJob.id == job_id, DeletionJob.status.in_(claimable))
+                .with_for_update(skip_locked=True)
+            )
+        ).scalar_one_or_none()
+        if job is None:
+            logger.warning("deletion job %s is not claimable; skipping", job_id)
+            return {"status": "skipped", "job_id": str(job_id)}
+        job.status = "running"
+        job.claimed_at = datetime.now(UTC)
+        entity_type = job.entity_type
+        entity_id = job.entity_id
+        project_id = job.project_id
+        progress = _Progress(
+            job_id=job_id,
+            rows_deleted=job.rows_deleted,
+            objects_deleted=job.objects_deleted,
+        )
+        await session.commit()
+
+    if entity_type == "dataset":
+        dataset_ids = [entity_id]
+        prefixes = dataset_storage_prefixes(project_id, entity_id)
+    else:
+        async with session_factory() as session:
+            dataset_ids = list(
+                (
+                    await session.execute(
+                        sa.text("SELECT id FROM datasets WHERE project_id = :project_id"),
+                        {"project_id": entity_id},
+                    )
+                ).scalars()
+            )
+        prefixes = project_storage_prefixes(entity_id)
+
+    for dataset_id in dataset_ids:
+        await _delete_dataset_rows(session_factory, progress, dataset_id)
+    await _delete_storage(session_factory, progress, prefixes)
+    await _delete_entity(
+        session_factory, progress, "datasets" if entity_type == "dataset" else "projects", entity_id
+    )
+
+    async with session_factory() as session:
+        await _update_job(
+            session,
+            job_id,
+            status="success",
+            stage=None,
+            finished_at=datetime.now(UTC),
+            **progress.values(),
+        )
+        await session.commit()
+    logger.info(
+        "deleted %s %s: %d rows, %d objects",
+        entity_type,
+        entity_id,
+        progress.rows_deleted,
+        progress.objects_deleted,
+    )
+    return {"status": "success", "job_id": str(job_id), **progress.values()}
+
+
+async def _run_deletion_job_async(job_id: UUID, *, continuation: bool = False) -> dict[str, Any]:
+    """Run one deletion job, recording any failure on its row."""
+    from echoroo.workers.db_utils import get_worker_engine_and_session_factory
+
+    engine, session_factory = get_worker_engine_and_session_factory()
+    try:
+        try:
+            return await _run_job(session_factory, job_id, continuation=continuation)
+        except _OutOfTime:
+            logger.info("deletion job %s used its time budget; continuing in a new task", job_id)
+            run_deletion_job.delay(str(job_id), continuation=True)
+            return {"status": "continued", "job_id": str(job_id)}
+        except Exception as exc:  # noqa: BLE001 — recorded into the job row
+            logger.exception("deletion job %s failed", job_id)
+            async with session_factory() as session:
+                await _update_job(
+                    session,
+                    job_id,
+                    status="failure",
+                    finished_at=datetime.now(UTC),
+                    error_detail=repr(exc),
+                )
+                await session.commit()
+            return {"status": "failure", "job_id": str(job_id), "error_detail": repr(exc)}
+    finally:
+        await engine.dispose()
+
+
+async def _requeue_stale_jobs(
+    session_factory: async_sessionmaker[AsyncSession], *, now: datetime | None = None
+) -> list[UUID]:
+    """Re-send jobs left ``running`` by a killed worker as continuations.
+
+    ``claimed_at`` is moved to ``now`` so the job is not re-sent again
+    before the new message had the chance to claim it.
+
+    Returns:
+        IDs of the re-sent jobs.
+    """
+    now = now or datetime.now(UTC)
+    cutoff = now - STALE_CLAIM_AGE
+    async with session_factory() as session:
+        stale = (
+            await session.execute(
+                sa.update(DeletionJob)
+                .where(
+                    DeletionJob.status == "running",
+                    sa.func.coalesce(DeletionJob.claimed_at, DeletionJob.started_at) < cutoff,
+                )
+                .values(claimed_at=now)
+                .returning(DeletionJob.id)
+            )
+        ).scalars().all()
+        await session.commit()
+
+    for job_id in stale:
+        logger.warning("deletion job %s outlived its worker; continuing in a new task", job_id)
+        run_deletion_job.delay(str(job_id), continuation=True)
+    return list(stale)
+
+
+async def _requeue_stale_deletion_jobs_async() -> dict[str, Any]:
+    from echoroo.workers.db_utils import get_worker_engine_and_session_factory
+
+    engine, session_factory = get_worker_engine_and_session_factory()
+    try:
+        requeued = await _requeue_stale_jobs(session_factory)
+    finally:
+        await engine.dispose()
+    return {"requeued": len(requeued)}
+
+
+# ---------------------------------------------------------------------------
+# Celery tasks
+# ---------------------------------------------------------------------------
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.deletion_tasks.run_deletion_job",
+    bind=True,
+    soft_time_limit=_SOFT_TIME_LIMIT,
+    time_limit=_TIME_LIMIT,
+)
+def run_deletion_job(
+    self: Any,  # noqa: ARG001 - bound task; reserved for retry()
+    job_id: str,
+    continuation: bool = False,
+) -> dict[str, Any]:
+    """Run the queued :class:`DeletionJob` ``job_id``."""
+    return asyncio.run(_run_deletion_job_async(UUID(job_id), continuation=continuation))
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.deletion_tasks.requeue_stale_deletion_jobs",
+)
+def requeue_stale_deletion_jobs() -> dict[str, Any]:
+    """Continue deletion jobs whose worker was killed mid-run."""
+    return asyncio.run(_requeue_stale_deletion_jobs_async())
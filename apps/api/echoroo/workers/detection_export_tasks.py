@@ -0,0 +1,232 @@
+"""Background ML training dataset export.
+
+The ML-dataset export used to load every confirmed annotation of a project
+through four ``selectinload`` relationships and build the CSV, metadata and
+ZIP in API memory before sending a byte of the response. The API now
+records a queued :class:`~echoroo.models.ml_dataset_export_job.MlDatasetExportJob`
+and dispatches :func:`run_ml_dataset_export`, which:
+
+1. Streams :meth:`DetectionExportService.write_ml_dataset` — one ordered
+   query per entry kind selecting only the CSV columns, read from a
+   server-side cursor — into a
+   :class:`~echoroo.core.s3.MultipartUploadWriter` at
+   :func:`ml_dataset_object_key`, so neither the worker nor the API ever
+   holds more than one batch and one upload part.
+2. Bumps ``entries_written`` on the job after every batch, so progress is
+   visible while it runs.
+3. Records the object key and size on success; the UI then asks the API
+   for a presigned download URL.
+
+An archive cannot be resumed half-written, so unlike the deletion job this
+task does not re-enqueue itself: a failure (or the soft time limit) aborts
+the multipart upload and is recorded on the job, and the user requests a
+new export. A worker killed outright (hard time limit, lost host) records
+nothing, so :func:`reap_stale_ml_dataset_exports` periodically fails jobs
+still ``running`` :data:`STALE_CLAIM_AGE` after their claim and aborts
+their orphaned uploads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from echoroo.core.s3 import MultipartUploadWriter, abort_multipart_uploads
+from echoroo.models.ml_dataset_export_job import MlDatasetExportJob
+from echoroo.services.detection_export import DetectionExportService
+from echoroo.workers.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+# Celery limits of :func:`run_ml_dataset_export`: above the global 600 s
+# limit for the largest projects, below the broker's 1800 s visibility
+# timeout.
+_SOFT_TIME_LIMIT = 1500
+_TIME_LIMIT = 1560
+
+#: A job still ``running`` this long after its claim has outlived any live
+#: task (the hard time limit plus slack) and is reaped as failed.
+STALE_CLAIM_AGE = timedelta(seconds=_TIME_LIMIT) + timedelta(minutes=5)
+
+_STALE_ERROR = "Export worker stopped before finishing (time limit exceeded or worker lost)"
+
+
+def ml_dataset_object_key(project_id: UUID, job_id: UUID) -> str:
+    """S3 key of the ZIP written by an export job."""
+    return f"exports/{project_id}/ml-dataset/{job_id}.zip"
+
+
+async def _update_job(session: AsyncSession, job_id: UUID, **values: Any) -> None:
+    await session.execute(
+        sa.update(MlDatasetExportJob).where(MlDatasetExportJob.id == job_id).values(**values)
+    )
+
+
+async def _run_job(
+    session_factory: async_sessionmaker[AsyncSession], job_id: UUID
+) -> dict[str, Any]:
+    # Claim the job atomically so a redelivered message cannot export twice.
+    async with session_factory() as session:
+        job = (
+            await session.execute(
+                sa.select(MlDatasetExportJob)
+                .where(MlDatasetExportJob.id == job_id, MlDatasetExportJob.status == "queued")
+                .with_for_update(skip_locked=True)
+            )
+        ).scalar_one_or_none()
+        if job is None:
+            logger.warning("ML-dataset export job %s is not claimable; skipping", job_id)
+            return {"status": "skipped", "job_id": str(job_id)}
+        job.status = "running"
+        job.claimed_at = datetime.now(UTC)
+        project_id = job.project_id
+        dataset_id = job.dataset_id
+        detection_run_id = job.detection_run_id
+        await session.commit()
+
+    async def report(entries_written: int) -> None:
+        async with session_factory() as session:
+            await _update_job(session, job_id, entries_written=entries_written)
+            await session.commit()
+
+    object_key = ml_dataset_object_key(project_id, job_id)
+    async with session_factory() as session:
+        with MultipartUploadWriter(object_key, content_type="application/zip") as out:
+            stats = await DetectionExportService(session).write_ml_dataset(
+                out,
+                project_id=project_id,
+                dataset_id=dataset_id,
+                detection_run_id=detection_run_id,
+                on_batch=report,
+            )
+        size_bytes = out.bytes_written
+
+    async with session_factory() as session:
+        await _update_job(
+            session,
+            job_id,
+            status="success",
+            entries_written=stats.total_entries,
+            object_key=object_key,
+            size_bytes=size_bytes,
+            finished_at=datetime.now(UTC),
+        )
+        await session.commit()
+    logger.info(
+        "exported ML dataset of project %s: %d entries, %d bytes",
+        project_id,
+        stats.total_entries,
+        size_bytes,
+    )
+    return {
+        "status": "success",
+        "job_id": str(job_id),
+        "entries_written": stats.total_entries,
+        "size_bytes": size_bytes,
+    }
+
+
+async def _run_ml_dataset_export_async(job_id: UUID) -> dict[str, Any]:
+    """Run one export job, recording any failure on its row."""
+    from echoroo.workers.db_utils import get_worker_engine_and_session_factory
+
+    engine, session_factory = get_worker_engine_and_session_factory()
+    try:
+        try:
+            return await _run_job(session_factory, job_id)
+        except Exception as exc:  # noqa: BLE001 — recorded into the job row
+            logger.exception("ML-dataset export job %s failed", job_id)
+            async with session_factory() as session:
+                await _update_job(
+                    session,
+                    job_id,
+                    status="failure",
+                    finished_at=datetime.now(UTC),
+                    error_detail=repr(exc),
+                )
+                await session.commit()
+            return {"status": "failure", "job_id": str(job_id), "error_detail": repr(exc)}
+    finally:
+        await engine.dispose()
+
+
+async def _reap_stale_jobs(
+    session_factory: async_sessionmaker[AsyncSession], *, now: datetime | None = None
+) -> list[UUID]:
+    """Fail jobs left ``running`` by a killed worker and abort their uploads.
+
+    Returns:
+        IDs of the reaped jobs.
+    """
+    now = now or datetime.now(UTC)
+    cutoff = now - STALE_CLAIM_AGE
+    async with session_factory() as session:
+        reaped = (
+            await session.execute(
+                sa.update(MlDatasetExportJob)
+                .where(
+                    MlDatasetExportJob.status == "running",
+                    sa.func.coalesce(
+                        MlDatasetExportJob.claimed_at, MlDatasetExportJob.started_at
+                    )
+                    < cutoff,
+                )
+                .values(status="failure", finished_at=now, error_detail=_STALE_ERROR)
+                .returning(MlDatasetExportJob.id, MlDatasetExportJob.project_id)
+            )
+        ).all()
+        await session.commit()
+
+    for job_id, project_id in reaped:
+        logger.warning("reaped stale ML-dataset export job %s", job_id)
+        try:
+            await asyncio.to_thread(
+                abort_multipart_uploads, ml_dataset_object_key(project_id, job_id)
+            )
+        except Exception:  # noqa: BLE001 — the bucket lifecycle rule is the backstop
+            logger.warning("could not abort the upload of export job %s", job_id, exc_info=True)
+    return [job_id for job_id, _ in reaped]
+
+
+async def _reap_stale_ml_dataset_exports_async() -> dict[str, Any]:
+    from echoroo.workers.db_utils import get_worker_engine_and_session_factory
+
+    engine, session_factory = get_worker_engine_and_session_factory()
+    try:
+        reaped = await _reap_stale_jobs(session_factory)
+    finally:
+        await engine.dispose()
+    return {"reaped": len(reaped)}
+
+
+# ---------------------------------------------------------------------------
+# Celery tasks
+# ---------------------------------------------------------------------------
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.detection_export_tasks.run_ml_dataset_export",
+    bind=True,
+    soft_time_limit=_SOFT_TIME_LIMIT,
+    time_limit=_TIME_LIMIT,
+)
+def run_ml_dataset_export(
+    self: Any,  # noqa: ARG001 - bound task; reserved for retry()
+    job_id: str,
+) -> dict[str, Any]:
+    """Run the queued :class:`MlDatasetExportJob` ``job_id``."""
+    return asyncio.run(_run_ml_dataset_export_async(UUID(job_id)))
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.detection_export_tasks.reap_stale_ml_dataset_exports",
+)
+def reap_stale_ml_dataset_exports() -> dict[str, Any]:
+    """Fail ML-dataset export jobs whose worker was killed mid-run."""
+    return asyncio.run(_reap_stale_ml_dataset_exports_async())
@@ -0,0 +1,128 @@
+"""Rebuild the detection summary rollups from ``recording_annotations``.
+
+Background
+----------
+``detection_species_rollups`` / ``detection_temporal_rollups`` (see
+:mod:`echoroo.models.detection_rollup`) are kept exact by triggers, so the
+dashboard summaries never scan ``recording_annotations``. The triggers cannot
+see writes that bypass them — ``TRUNCATE``, a ``pg_restore`` run with
+``session_replication_role = replica``, or a manual
+``ALTER TABLE ... DISABLE TRIGGER`` during maintenance — so this task
+recomputes the rollups from the source rows and repairs any drift.
+
+Each dataset is rebuilt by ``detection_rollups_refresh(dataset_id)`` in its
+own transaction. The function takes the dataset's advisory lock exclusively,
+so concurrent annotation writes to that dataset wait for the rebuild (and
+writes to other datasets do not) instead of being lost between its DELETE
+and INSERT.
+
+Schedule
+--------
+Wired into :data:`echoroo.workers.celery_app.app.conf.beat_schedule` under
+``rebuild-detection-rollups-weekly`` (Sundays 05:00 UTC, after the 04:00
+IUCN sync). Operators can also enqueue it for a single project after a bulk
+repair: ``rebuild_detection_rollups.delay(project_id=str(project_id))``.
+
+Idempotency
+-----------
+A rebuild replaces a dataset's rows wholesale, so re-running it is a no-op
+on already-correct rollups. Rows left behind by datasets that no longer
+exist are pruned on full (all-project) runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from echoroo.core.database import AsyncSessionLocal
+from echoroo.workers.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+_ROLLUP_TABLES = ("detection_species_rollups", "detection_temporal_rollups")
+
+
+async def _impl(*, project_id: UUID | None = None) -> dict[str, Any]:
+    """Rebuild the rollups of every dataset (of ``project_id`` when given).
+
+    1. List the target dataset ids.
+    2. ``SELECT detection_rollups_refresh(:id)`` and commit, per dataset.
+    3. On a full run, delete rollup rows whose dataset no longer exists.
+
+    Returns a summary dict suitable for the Celery result backend.
+    """
+    async with AsyncSessionLocal() as session:
+        query = "SELECT id FROM datasets"
+        params: dict[str, Any] = {}
+        if project_id is not None:
+            query += " WHERE project_id = :project_id"
+            params["project_id"] = project_id
+        dataset_ids = list((await session.execute(sa.text(query), params)).scalars())
+
+        rebuilt = 0
+        for dataset_id in dataset_ids:
+            try:
+                await session.execute(
+                    sa.text("SELECT detection_rollups_refresh(:dataset_id)"),
+                    {"dataset_id": dataset_id},
+                )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            rebuilt += 1
+
+        pruned = 0
+        if project_id is None:
+            try:
+                for table in _ROLLUP_TABLES:
+                    result = await session.execute(
+                        sa.text(
+                            f"DELETE FROM {table} r "
+                            "WHERE NOT EXISTS "
+                            "(SELECT 1 FROM datasets d WHERE d.id = r.dataset_id) "
+                            "RETURNING r.id"
+                        )
+                    )
+                    pruned += len(result.fetchall())
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    logger.info(
+        "detection_rollups: rebuilt %d dataset(s), pruned %d orphan row(s) (project=%s)",
+        rebuilt,
+        pruned,
+        project_id or "all",
+    )
+    return {
+        "status": "ok",
+        "project_id": str(project_id) if project_id is not None else None,
+        "datasets_rebuilt": rebuilt,
+        "orphan_rows_pruned": pruned,
+    }
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.detection_rollups.rebuild_detection_rollups",
+)
+def rebuild_detection_rollups(project_id: str | None = None) -> dict[str, Any]:
+    """Recompute the detection summary rollups from ``recording_annotations``.
+
+    Args:
+        project_id: Limit the rebuild to this project's datasets. ``None``
+            rebuilds every dataset and prunes orphaned rollup rows.
+
+    Returns:
+        Summary dict, e.g. ``{"status": "ok", "datasets_rebuilt": 12, ...}``.
+    """
+    return asyncio.run(_impl(project_id=UUID(project_id) if project_id else None))
+
+
+__all__ = ["rebuild_detection_rollups"]
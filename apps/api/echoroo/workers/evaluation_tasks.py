@@ -20,6 +20,15 @@ Source of the detection annotations per model kind (all read from the live
 Species identity for all three sources is carried by
 ``RecordingAnnotation.tag_id`` → ``Tag.taxon_id``; rows whose tag has no
 taxon link are discarded before scoring (they cannot match any GT row).
+
+Matching never compares every detection with every ground truth. Intervals
+are bucketed by ``(recording_id, taxon_id)`` and indexed once per run:
+:class:`_IntervalIndex` answers "does anything overlap this interval" with
+one bisection, and :class:`_MaxConfidenceSweep` gives each ground truth the
+best confidence among the detections overlapping it. The ground-truth and
+segment-window indexes are shared by every requested model reference, and
+the overall precision / recall curve over confidence thresholds
+(:func:`_pr_curve`) falls out of a single sort of those scores.
 """
 
 from __future__ import annotations
@@ -27,7 +36,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import traceback
+from bisect import bisect_left
 from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any
 from uuid import UUID
 
@@ -102,13 +113,16 @@ async def _run_annotation_evaluation(evaluation_run_id: UUID) -> dict[str, Any]:
             try:
                 segments = await _load_segments(db, run.annotation_set_id)
                 gts = await _load_ground_truths(db, run.annotation_set_id)
+                # Built once and shared by every model reference.
+                windows = _segment_windows(segments)
+                gt_index = _GroundTruthIndex(gts)
 
                 all_rows: list[dict[str, Any]] = []
                 for ref in run.requested_model_refs:
                     detections = await _load_detections_for_ref(
-                        db, segments=segments, model_ref=ref,
+                        db, segments=segments, model_ref=ref, windows=windows,
                     )
-                    per_ref_rows = _score(ref, gts, detections)
+                    per_ref_rows = _score(ref, gts, detections, gt_index=gt_index)
                     all_rows.extend(per_ref_rows)
 
                 if all_rows:
@@ -210,6 +224,7 @@ async def _load_detections_for_ref(
     *,
     segments: list[AnnotationSegment],
     model_ref: dict[str, Any],
+    windows: dict[UUID, _IntervalIndex] | None = None,
 ) -> list[dict[str, Any]]:
     """Return detection annotations intersecting the set's segment windows.
 
@@ -223,26 +238,24 @@ async def _load_detections_for_ref(
         segments: Every FINALIZED (``status == ANNOTATED``) segment of the
             evaluated set (the universe produced by :func:`_load_segments`).
         model_ref: Dict with ``kind`` and optional ``model_id``.
+        windows: :func:`_segment_windows` of ``segments``, when the caller
+            already built it for another model reference.
 
     Returns:
         List of dicts with keys ``recording_id``, ``start``, ``end``,
-        ``taxon_id``.
+        ``taxon_id``, ``confidence``.
     """
     if not segments:
         return []
 
-    # Group segments by recording for per-recording overlap clauses.
-    segments_by_rec: dict[UUID, list[tuple[float, float]]] = defaultdict(list)
-    for seg in segments:
-        segments_by_rec[seg.recording_id].append(
-            (float(seg.start_time_sec), float(seg.end_time_sec))
-        )
+    if windows is None:
+        windows = _segment_windows(segments)
 
     kind = str(model_ref.get("kind"))
     stmt = (
         select(RecordingAnnotation, Tag.taxon_id)
         .join(Tag, Tag.id == RecordingAnnotation.tag_id)
-        .where(RecordingAnnotation.recording_id.in_(segments_by_rec.keys()))
+        .where(RecordingAnnotation.recording_id.in_(windows.keys()))
         .where(Tag.taxon_id.is_not(None))
     )
 
@@ -290,15 +303,12 @@ async def _load_detections_for_ref(
 
     detections: list[dict[str, Any]] = []
     for annotation, taxon_id in raw_rows:
-        rec_segments = segments_by_rec.get(annotation.recording_id)
-        if not rec_segments:
+        rec_windows = windows.get(annotation.recording_id)
+        if rec_windows is None:
             continue
         a_start = float(annotation.start_time)
         a_end = float(annotation.end_time)
-        if not any(
-            a_start < seg_end and a_end > seg_start
-            for seg_start, seg_end in rec_segments
-        ):
+        if not rec_windows.overlaps(a_start, a_end):
             continue
         detections.append(
             {
@@ -306,11 +316,32 @@ async def _load_detections_for_ref(
                 "start": a_start,
                 "end": a_end,
                 "taxon_id": taxon_id,
+                "confidence": annotation.confidence,
             }
         )
     return detections
 
 
+def _segment_windows(
+    segments: Iterable[AnnotationSegment],
+) -> dict[UUID, _IntervalIndex]:
+    """Index the finalized segment windows of each recording.
+
+    The index is non-strict so zero-length detections inside a window are
+    kept, as the former ``det.start < seg.end AND det.end > seg.start`` scan
+    kept them; :func:`_score` then counts them as false positives.
+    """
+    by_rec: dict[UUID, list[tuple[float, float]]] = defaultdict(list)
+    for seg in segments:
+        by_rec[seg.recording_id].append(
+            (float(seg.start_time_sec), float(seg.end_time_sec))
+        )
+    return {
+        rec_id: _IntervalIndex(spans, strict=False)
+        for rec_id, spans in by_rec.items()
+    }
+
+
 # ---------------------------------------------------------------------------
 # Scoring (symmetric-overlap matching)
 # ---------------------------------------------------------------------------
@@ -333,6 +364,175 @@ def _overlaps(
     )
 
 
+_Key = tuple[UUID, UUID]
+
+# Upper bound on the points kept per precision / recall curve.
+_PR_CURVE_MAX_POINTS = 100
+
+
+class _IntervalIndex:
+    """Static interval set answering overlap queries in O(log n).
+
+    Intervals are sorted by start alongside a running maximum of their ends,
+    so the intervals starting before ``end`` are a prefix found by bisection
+    and one of them overlaps ``[start, end)`` iff that prefix's largest end
+    exceeds ``start``.
+
+    With ``strict`` (the default) this is the symmetric-overlap rule of
+    :func:`_overlaps`: empty intervals (``start >= end``) never overlap
+    anything, so they are dropped and empty queries answer False. Without
+    it the plain ``s < end and e > start`` test of the segment-window filter
+    applies, under which a zero-length detection strictly inside a window
+    still intersects it (and is then scored as a false positive).
+    """
+
+    __slots__ = ("_max_end", "_starts", "_strict")
+
+    def __init__(
+        self, intervals: Iterable[tuple[float, float]], *, strict: bool = True
+    ) -> None:
+        self._strict = strict
+        spans = sorted((s, e) for s, e in intervals if s < e or not strict)
+        self._starts = [s for s, _ in spans]
+        self._max_end: list[float] = []
+        running = float("-inf")
+        for _, e in spans:
+            running = max(running, e)
+            self._max_end.append(running)
+
+    def overlaps(self, start: float, end: float) -> bool:
+        """Return True when some indexed interval overlaps ``[start, end)``."""
+        if self._strict and start >= end:
+            return False
+        i = bisect_left(self._starts, end)
+        return i > 0 and self._max_end[i - 1] > start
+
+
+class _MaxConfidenceSweep:
+    """Best confidence among the detections overlapping each ground truth.
+
+    Ground truths are visited in order of their end; detections starting
+    before that end are added to a max-Fenwick tree keyed by descending
+    detection end, so the detections ending after the ground truth's start
+    form a prefix and their best score is one ``O(log D)`` query. Tree
+    entries are ``(present, score)`` pairs so an overlapping detection
+    without a confidence (scored ``-inf``) is still told apart from none.
+    """
+
+    def __init__(self, detections: Iterable[tuple[float, float, float]]) -> None:
+        self._by_start = sorted(d for d in detections if d[0] < d[1])
+        self._neg_ends = sorted({-end for _, end, _ in self._by_start})
+        self._tree: list[tuple[int, float]] = [(0, float("-inf"))] * (
+            len(self._neg_ends) + 1
+        )
+
+    def _ends_after(self, value: float) -> int:
+        """Number of distinct detection ends strictly greater than ``value``."""
+        return bisect_left(self._neg_ends, -value)
+
+    def _add(self, end: float, score: float) -> None:
+        i = self._ends_after(end) + 1
+        while i < len(self._tree):
+            self._tree[i] = max(self._tree[i], (1, score))
+            i += i & -i
+
+    def _prefix_max(self, n: int) -> tuple[int, float]:
+        best = (0, float("-inf"))
+        while n > 0:
+            best = max(best, self._tree[n])
+            n -= n & -n
+        return best
+
+    def best_scores(self, gts: list[tuple[float, float]]) -> list[float | None]:
+        """Return, per ground truth, the best overlapping score or None."""
+        result: list[float | None] = [None] * len(gts)
+        added = 0
+        for i in sorted(range(len(gts)), key=lambda i: gts[i][1]):
+            g_start, g_end = gts[i]
+            if g_start >= g_end:
+                continue
+            while added < len(self._by_start) and self._by_start[added][0] < g_end:
+                _, d_end, score = self._by_start[added]
+                self._add(d_end, score)
+                added += 1
+            present, score = self._prefix_max(self._ends_after(g_start))
+            if present:
+                result[i] = score
+        return result
+
+
+def _score_key(det: dict[str, Any]) -> float:
+    """Ranking score of a detection; unscored detections rank last."""
+    confidence = det.get("confidence")
+    return float("-inf") if confidence is None else float(confidence)
+
+
+class _GroundTruthIndex:
+    """Ground truths bucketed by ``(recording_id, taxon_id)`` and indexed.
+
+    Built once per evaluation run and reused for every model reference.
+    """
+
+    def __init__(self, gts: Iterable[dict[str, Any]]) -> None:
+        self.spans: dict[_Key, list[tuple[float, float]]] = defaultdict(list)
+        for gt in gts:
+            self.spans[(gt["recording_id"], gt["taxon_id"])].append(
+                (gt["start"], gt["end"])
+            )
+        self.indexes = {key: _IntervalIndex(v) for key, v in self.spans.items()}
+        self.count_by_taxon: dict[UUID, int] = defaultdict(int)
+        for (_rec_id, taxon_id), spans in self.spans.items():
+            self.count_by_taxon[taxon_id] += len(spans)
+
+
+def _pr_curve(
+    det_scores: list[tuple[float, bool]],
+    gt_scores: list[float | None],
+    *,
+    max_points: int = _PR_CURVE_MAX_POINTS,
+) -> list[dict[str, float | None]]:
+    """Precision / recall at every confidence threshold, from one sort.
+
+    Args:
+        det_scores: ``(score, is_true_positive)`` per detection.
+        gt_scores: Per ground truth, the best score among the detections
+            overlapping it (None when no detection does).
+        max_points: Thresholds kept, evenly spread over the distinct scores
+            (the lowest threshold is always kept).
+
+    Returns:
+        Points ordered by descending ``threshold``; detections scoring at
+        least ``threshold`` are kept. Unscored detections only enter at the
+        final point, whose ``threshold`` is then None.
+    """
+    if not det_scores:
+        return []
+    dets = sorted(det_scores, key=lambda d: d[0], reverse=True)
+    matched = sorted((s for s in gt_scores if s is not None), reverse=True)
+    total_gt = len(gt_scores)
+
+    points: list[dict[str, float | None]] = []
+    kept = tp = recalled = 0
+    for i, (score, is_tp) in enumerate(dets):
+        kept += 1
+        tp += int(is_tp)
+        if i + 1 < len(dets) and dets[i + 1][0] == score:
+            continue
+        while recalled < len(matched) and matched[recalled] >= score:
+            recalled += 1
+        points.append(
+            {
+                "threshold": None if score == float("-inf") else score,
+                "precision": _safe_div(tp, kept),
+                "recall": _safe_div(recalled, total_gt),
+            }
+        )
+    if len(points) > max_points:
+        step = (len(points) - 1) / (max_points - 1)
+        points = [points[round(i * step)] for i in range(max_points)]
+    return points
+
+
 def _safe_div(num: float, denom: float) -> float:
     """Return ``num/denom`` with 0.0 on zero or negative denominator."""
     if denom <= 0:
@@ -348,6 +548,8 @@ def _score(
     model_ref: dict[str, Any],
     gts: list[dict[str, Any]],
     detections: list[dict[str, Any]],
+    *,
+    gt_index: _GroundTruthIndex | None = None,
 ) -> list[dict[str, Any]]:
     """Apply symmetric-overlap matching and return per-species + overall rows.
 
@@ -356,50 +558,65 @@ def _score(
         gts: Ground-truth rows (same shape as :func:`_load_ground_truths`).
         detections: Detection rows (same shape as
             :func:`_load_detections_for_ref`).
+        gt_index: :class:`_GroundTruthIndex` of ``gts``, when the caller
+            scores several model references against the same ground truth.
 
     Returns:
         List of result-row dicts ready for
         :meth:`EvaluationResultRepository.bulk_insert`. Always contains the
-        overall row (``taxon_id = None``) plus one row per taxon observed
-        in either GT or detections.
+        overall row (``taxon_id = None``, carrying the precision / recall
+        curve) plus one row per taxon observed in either GT or detections.
     """
-    gts_by_taxon: dict[UUID, list[dict[str, Any]]] = defaultdict(list)
-    for gt in gts:
-        gts_by_taxon[gt["taxon_id"]].append(gt)
+    if gt_index is None:
+        gt_index = _GroundTruthIndex(gts)
 
-    dets_by_taxon: dict[UUID, list[dict[str, Any]]] = defaultdict(list)
+    dets_by_key: dict[_Key, list[dict[str, Any]]] = defaultdict(list)
     for det in detections:
-        dets_by_taxon[det["taxon_id"]].append(det)
+        dets_by_key[(det["recording_id"], det["taxon_id"])].append(det)
+
+    tp_p_by_taxon: dict[UUID, int] = defaultdict(int)
+    fp_by_taxon: dict[UUID, int] = defaultdict(int)
+    tp_r_by_taxon: dict[UUID, int] = defaultdict(int)
+    det_scores: list[tuple[float, bool]] = []
+    gt_scores: list[float | None] = []
+
+    for key in dets_by_key.keys() | gt_index.spans.keys():
+        taxon_id = key[1]
+        key_dets = dets_by_key.get(key, [])
+        gt_spans = gt_index.spans.get(key, [])
+
+        index = gt_index.indexes.get(key)
+        for det in key_dets:
+            hit = index is not None and index.overlaps(det["start"], det["end"])
+            if hit:
+                tp_p_by_taxon[taxon_id] += 1
+            else:
+                fp_by_taxon[taxon_id] += 1
+            det_scores.append((_score_key(det), hit))
 
-    # ---- overall -----------------------------------------------------------
+        if not gt_spans:
+            continue
+        best = _MaxConfidenceSweep(
+            (det["start"], det["end"], _score_key(det)) for det in key_dets
+        ).best_scores(gt_spans)
+        tp_r_by_taxon[taxon_id] += sum(1 for b in best if b is not None)
+        gt_scores.extend(best)
+
+    # ---- per species + overall ---------------------------------------------
     overall_tp_p = 0
     overall_fp = 0
     overall_tp_r = 0
     overall_fn = 0
 
-    # Precompute GT overlap flags once per GT by taxon to avoid O(N*M) across
-    # all species when one taxon is dense.
     rows: list[dict[str, Any]] = []
-    taxa_union: set[UUID] = set(gts_by_taxon.keys()) | set(dets_by_taxon.keys())
+    taxa_union = (
+        set(gt_index.count_by_taxon) | set(tp_p_by_taxon) | set(fp_by_taxon)
+    )
     for taxon_id in taxa_union:
-        taxon_gts = gts_by_taxon.get(taxon_id, [])
-        taxon_dets = dets_by_taxon.get(taxon_id, [])
-
-        tp_p = 0
-        fp = 0
-        for det in taxon_dets:
-            if any(_overlaps(det, gt) for gt in taxon_gts):
-                tp_p += 1
-            else:
-                fp += 1
-
-        tp_r = 0
-        fn = 0
-        for gt in taxon_gts:
-            if any(_overlaps(det, gt) for det in taxon_dets):
-                tp_r += 1
-            else:
-                fn += 1
+        tp_p = tp_p_by_taxon.get(taxon_id, 0)
+        fp = fp_by_taxon.get(taxon_id, 0)
+        tp_r = tp_r_by_taxon.get(taxon_id, 0)
+        fn = gt_index.count_by_taxon.get(taxon_id, 0) - tp_r
 
         precision = _safe_div(tp_p, tp_p + fp)
         recall = _safe_div(tp_r, tp_r + fn)
@@ -442,6 +659,7 @@ def _score(
             "precision": overall_precision,
             "recall": overall_recall,
             "f1": overall_f1,
+            "pr_curve": _pr_curve(det_scores, gt_scores),
         }
     )
 
@@ -0,0 +1,75 @@
+"""Inference server process: ``python -m echoroo.workers.inference_server``.
+
+Without arguments, loads the models listed in ``INFERENCE_SERVER_MODELS``
+and serves them on ``INFERENCE_SERVER_SOCKET`` until SIGTERM / SIGINT (see
+:mod:`echoroo.ml.serving`). ``--stats`` connects to a running server and
+prints its per-model queue depth and batch-fill counters as JSON.
+
+Like the Celery entrypoint this lives in :mod:`echoroo.workers` rather than
+:mod:`echoroo.ml`: importing ``echoroo.ml`` pulls in numpy, and the device /
+thread environment has to be pinned before that happens.
+"""
+
+from __future__ import annotations
+
+# Pin the ML device / thread environment before anything imports numpy or
+# TensorFlow (see echoroo.workers.ml_device_env).
+from echoroo.workers.ml_device_env import apply_ml_device_env
+
+apply_ml_device_env()
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import logging  # noqa: E402
+import signal  # noqa: E402
+import sys  # noqa: E402
+from types import FrameType  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the inference server, or print a running server's stats."""
+    from echoroo.core.settings import get_settings
+    from echoroo.ml.serving.backends import build_backends
+    from echoroo.ml.serving.client import InferenceClient
+    from echoroo.ml.serving.protocol import InferenceServerError, authkey_from_settings
+    from echoroo.ml.serving.server import InferenceServer
+
+    parser = argparse.ArgumentParser(prog="python -m echoroo.workers.inference_server")
+    parser.add_argument("--stats", action="store_true", help="print a running server's stats")
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    authkey = authkey_from_settings(settings)
+
+    if args.stats:
+        client = InferenceClient(settings.INFERENCE_SERVER_SOCKET, authkey, timeout=5.0)
+        try:
+            print(json.dumps(client.stats(), indent=2))
+        except InferenceServerError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+        return 0
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    server = InferenceServer(
+        settings.INFERENCE_SERVER_SOCKET,
+        build_backends(settings),
+        authkey,
+        max_batch=settings.INFERENCE_SERVER_MAX_BATCH,
+        max_wait=settings.INFERENCE_SERVER_MAX_WAIT_MS / 1000,
+    )
+
+    def _shutdown(signum: int, _frame: FrameType | None) -> None:
+        logging.getLogger(__name__).info("Inference server: signal %d, shutting down", signum)
+        server.close()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+    server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,11 +26,12 @@ Pipeline
    mode without a custom transport) so we removed it instead of leaving
    dead code that misleads operators about what is actually checked.
 3. For each (taxon_id, category) returned, derive the recommended H3
-   resolution via :func:`_h3_res_from_iucn_category` and UPSERT through
-   :func:`echoroo.services.taxon_sensitivity_service.upsert_taxon_sensitivity`.
-   The helper returns ``loosened=True`` when the new value is *higher*
-   than the previously recorded value — those rows are counted into
-   ``loosened_species_count``.
+   resolution via :func:`_h3_res_from_iucn_category`, ``COPY`` the rows
+   into a transaction-local staging table and merge them into
+   ``taxon_sensitivities`` with ONE ``INSERT ... ON CONFLICT DO UPDATE``
+   (see :data:`_MERGE_SNAPSHOT_SQL`). Rows whose new value is *higher*
+   than the previously recorded value are counted into
+   ``loosened_species_count``; unchanged rows are not rewritten.
 4. Sanity check (FR-036, spec §IUCN 同期失敗時): if the loosened count
    exceeds **10 %** of the total set the worker rolls back the changes,
    marks the attempt ``failure``, and emits a critical-alert log line.
@@ -65,11 +66,12 @@ import httpx
 import sqlalchemy as sa
 
 from echoroo.core.database import AsyncSessionLocal
+from echoroo.core.http_clients import IUCN, build_http_client
 from echoroo.models.enums import TaxonSensitivitySource
 from echoroo.models.iucn_sync_attempt import IucnSyncAttempt
 from echoroo.services.taxon_sensitivity_service import (
+    bump_sensitivity_version,
     set_iucn_fail_safe,
-    upsert_taxon_sensitivity,
 )
 from echoroo.workers.celery_app import app
 
@@ -125,6 +127,59 @@ _IUCN_API_CERT_HASH_ENV: str = "IUCN_API_CERT_SHA256_BASE64"  # noqa: E501 — p
 _IUCN_API_CERT_HASH_LEGACY_ENV: str = "IUCN_API_SPKI_SHA256_BASE64"  # noqa: E501 — post-launch ratchet placeholder
 
 
+# ---------------------------------------------------------------------------
+# Set-based merge
+# ---------------------------------------------------------------------------
+
+#: Transaction-local staging table the snapshot is ``COPY``-ed into.
+_SNAPSHOT_TABLE: str = "iucn_sync_snapshot"
+
+_CREATE_SNAPSHOT_TABLE_SQL: str = f"""
+CREATE TEMPORARY TABLE {_SNAPSHOT_TABLE} (
+    taxon_id varchar(64) PRIMARY KEY,
+    sensitivity_h3_res integer NOT NULL,
+    category varchar(10)
+) ON COMMIT DROP
+"""
+
+#: Merge the staged snapshot into ``taxon_sensitivities`` in one statement.
+#: Every CTE reads the same pre-statement snapshot, so ``prior`` sees the
+#: values the upsert is about to overwrite — that is what makes the
+#: loosened / tightened diff possible without a per-row SELECT. The
+#: ``WHERE ... IS DISTINCT FROM`` guard leaves unchanged rows (and their
+#: ``updated_at``) alone, so a quiet week writes almost nothing.
+_MERGE_SNAPSHOT_SQL: str = f"""
+WITH prior AS (
+    SELECT s.taxon_id, t.sensitivity_h3_res AS previous_h3_res
+    FROM {_SNAPSHOT_TABLE} s
+    LEFT JOIN taxon_sensitivities t
+      ON t.taxon_id = s.taxon_id AND t.source = CAST(:source AS taxonsensitivitysource)
+), merged AS (
+    INSERT INTO taxon_sensitivities
+        (id, taxon_id, source, sensitivity_h3_res, category, notes, created_at, updated_at)
+    SELECT gen_random_uuid(), s.taxon_id, CAST(:source AS taxonsensitivitysource),
+           s.sensitivity_h3_res, s.category, NULL, now(), now()
+    FROM {_SNAPSHOT_TABLE} s
+    ON CONFLICT (taxon_id, source) DO UPDATE SET
+        sensitivity_h3_res = EXCLUDED.sensitivity_h3_res,
+        category = EXCLUDED.category,
+        notes = EXCLUDED.notes,
+        updated_at = EXCLUDED.updated_at
+    WHERE (taxon_sensitivities.sensitivity_h3_res, taxon_sensitivities.category,
+           taxon_sensitivities.notes)
+          IS DISTINCT FROM (EXCLUDED.sensitivity_h3_res, EXCLUDED.category, EXCLUDED.notes)
+    RETURNING 1
+)
+SELECT
+    count(*) AS synced,
+    count(*) FILTER (WHERE p.previous_h3_res < s.sensitivity_h3_res) AS loosened,
+    count(*) FILTER (WHERE p.previous_h3_res > s.sensitivity_h3_res) AS tightened,
+    (SELECT count(*) FROM merged) AS written
+FROM {_SNAPSHOT_TABLE} s
+JOIN prior p USING (taxon_id)
+"""
+
+
 # ---------------------------------------------------------------------------
 # Category -> H3 resolution mapping
 # ---------------------------------------------------------------------------
@@ -189,7 +244,10 @@ def _build_ssl_context() -> ssl.SSLContext:
 def _build_pinned_client() -> httpx.AsyncClient:
     """Return an HTTPX async client wired up for the IUCN endpoint.
 
-    The returned client is the caller's responsibility to close. Round 2
+    The returned client is the caller's responsibility to close; it uses
+    the IUCN pool settings and request metrics of
+    :mod:`echoroo.core.http_clients`, keeping connections alive across
+    the snapshot's pages. Round 2
     review M1 (2026-04-28): leaf-cert / SPKI hash pinning has been
     removed from the call path because httpx does not expose the peer
     cert in async mode without a custom transport, so the previous
@@ -198,9 +256,10 @@ def _build_pinned_client() -> httpx.AsyncClient:
     only; full pinning is deferred to the post-launch ratchet documented
     in ``specs/006-permissions-redesign/checklists/security.md`` §M-2.
     """
-    return httpx.AsyncClient(
-        timeout=_HTTP_TIMEOUT_SECONDS,
+    return build_http_client(
+        IUCN,
         verify=_build_ssl_context(),
+        timeout=_HTTP_TIMEOUT_SECONDS,
     )
 
 
@@ -361,41 +420,58 @@ async def _try_acquire_lock(session: Any) -> bool:
     return bool(result.scalar_one())
 
 
+def _stage_rows(
+    snapshot: Iterable[dict[str, Any]],
+) -> list[tuple[str, int, str | None]]:
+    """Return the ``(taxon_id, h3_res, category)`` records to ``COPY``.
+
+    Rows whose category falls outside :data:`_CATEGORY_TO_H3_RES` are
+    skipped — they would otherwise violate the discrete-enum CHECK
+    constraint. A taxon listed more than once keeps its last entry, which
+    is what the previous row-by-row upsert ended up storing.
+    """
+    staged: dict[str, tuple[str, int, str | None]] = {}
+    for row in snapshot:
+        taxon_id = row.get("taxonid")
+        category = row.get("category")
+        h3_res = _h3_res_from_iucn_category(category)
+        if taxon_id is None or h3_res is None:
+            continue
+        staged[str(taxon_id)] = (str(taxon_id), h3_res, str(category) if category else None)
+    return list(staged.values())
+
+
 async def _apply_snapshot(
     snapshot: Iterable[dict[str, Any]],
 ) -> tuple[int, int]:
-    """Upsert every row in ``snapshot``; return (synced, loosened) counts.
+    """Merge ``snapshot`` into ``taxon_sensitivities``; return (synced, loosened).
 
-    The upserts run inside a single transaction so the sanity check at
-    the end can roll back atomically. Rows whose category falls outside
-    :data:`_CATEGORY_TO_H3_RES` are skipped — they would otherwise
-    violate the discrete-enum CHECK constraint.
+    The rows are ``COPY``-ed into :data:`_SNAPSHOT_TABLE` and merged by
+    :data:`_MERGE_SNAPSHOT_SQL` inside a single transaction, so the sanity
+    check at the end can roll back atomically and the advisory lock is
+    held for two statements rather than one round trip per species.
     """
-    synced = 0
-    loosened = 0
+    records = _stage_rows(snapshot)
     async with AsyncSessionLocal() as session:
         try:
             if not await _try_acquire_lock(session):
                 logger.info("iucn_sync: another worker holds the lock — skipping")
                 return 0, 0
 
-            for row in snapshot:
-                taxon_id = row.get("taxonid")
-                category = row.get("category")
-                h3_res = _h3_res_from_iucn_category(category)
-                if taxon_id is None or h3_res is None:
-                    continue
-                was_loosened, _previous = await upsert_taxon_sensitivity(
-                    session,
-                    taxon_id=str(taxon_id),
-                    source=TaxonSensitivitySource.IUCN,
-                    sensitivity_h3_res=h3_res,
-                    category=str(category) if category else None,
-                    notes=None,
+            await session.execute(sa.text(_CREATE_SNAPSHOT_TABLE_SQL))
+            raw = await (await session.connection()).get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                _SNAPSHOT_TABLE,
+                records=records,
+                columns=["taxon_id", "sensitivity_h3_res", "category"],
+            )
+            counts = (
+                await session.execute(
+                    sa.text(_MERGE_SNAPSHOT_SQL),
+                    {"source": TaxonSensitivitySource.IUCN.value},
                 )
-                synced += 1
-                if was_loosened:
-                    loosened += 1
+            ).one()
+            synced, loosened = counts.synced, counts.loosened
 
             # Sanity check BEFORE commit so a tripped threshold rolls
             # the entire batch back atomically.
@@ -419,6 +495,13 @@ async def _apply_snapshot(
         except Exception:
             await session.rollback()
             raise
+    logger.info(
+        "iucn_sync: merged %d row(s): %d written, %d loosened, %d tightened",
+        synced,
+        counts.written,
+        loosened,
+        counts.tightened,
+    )
     return synced, loosened
 
 
@@ -481,8 +564,10 @@ async def _run_sync_async(force: bool = False) -> dict[str, Any]:
 
     # Fail-safe transition
     if terminal_status == "success":
-        # Successful run clears the 14-day flag if it was set.
+        # Successful run clears the 14-day flag if it was set, and makes
+        # every process reload its sensitivity snapshot.
         await set_iucn_fail_safe(False)
+        await bump_sensitivity_version()
     else:
         # Evaluate the 2-week rule. We treat *the absence* of a success
         # within FAIL_SAFE_WINDOW as the trigger so a single transient
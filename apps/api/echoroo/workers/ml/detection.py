@@ -28,7 +28,6 @@ from echoroo.repositories.tag import TagRepository
 from echoroo.repositories.taxon import TaxonRepository
 from echoroo.services.audio import AudioService
 from echoroo.services.gbif import NON_SPECIES_LABELS
-from echoroo.services.h3_utils import h3_to_center
 from echoroo.workers.celery_app import app
 from echoroo.workers.db_utils import get_worker_engine_and_session_factory
 from echoroo.workers.ml.utils import (
@@ -45,6 +44,21 @@ logger = logging.getLogger(__name__)
 _COMMIT_BATCH_SIZE = 50
 
 
+def _group_by_species_list(
+    recording_paths: list[tuple[Recording, Any]],
+    geo_species: dict[UUID, tuple[str, ...] | None],
+) -> list[tuple[tuple[str, ...] | None, list[tuple[Recording, Any]]]]:
+    """Split downloaded recordings into batches sharing one geo species list.
+
+    Recordings missing from ``geo_species`` (no geo filter) form the ``None``
+    batch. Batches are returned in order of first appearance.
+    """
+    batches: dict[tuple[str, ...] | None, list[tuple[Recording, Any]]] = {}
+    for recording, path in recording_paths:
+        batches.setdefault(geo_species.get(recording.id), []).append((recording, path))
+    return list(batches.items())
+
+
 # ---------------------------------------------------------------------------
 # Detection-only async implementation (annotations only, no embeddings)
 # ---------------------------------------------------------------------------
@@ -85,7 +99,6 @@ async def _run_detection(
         # Step 1: Load model-specific settings (only birdnet uses system settings)
         # ------------------------------------------------------------------
         min_conf: float = 0.1
-        custom_species_list: list[str] | None = None
 
         if model_name == "birdnet":
             async with session_factory() as db:
@@ -123,7 +136,7 @@ async def _run_detection(
         # ------------------------------------------------------------------
         # Step 3: Load all recordings for the dataset
         # Eagerly load dataset -> site so that geo-filter code can access
-        # first_recording.dataset.site.h3_index_member after the session is
+        # each recording.dataset.site.h3_index_member after the session is
         # closed without raising DetachedInstanceError.
         # Join against Dataset to enforce project_id ownership (defense-in-depth).
         # ------------------------------------------------------------------
@@ -151,7 +164,7 @@ async def _run_detection(
         # ------------------------------------------------------------------
         audio_service = AudioService(
             audio_root=settings.AUDIO_ROOT,
-            s3_audio_cache_dir="/data/s3_audio_cache",
+            s3_audio_cache_dir=settings.S3_AUDIO_CACHE_DIR,
         )
 
         from echoroo.workers.model_preloader import get_model
@@ -166,36 +179,18 @@ async def _run_detection(
         supports_classification = spec.supports_classification
 
         # ------------------------------------------------------------------
-        # Step 4b: Compute geo species list for BirdNET (once per dataset)
+        # Step 4b: Resolve geo species lists for BirdNET (per recording, by
+        # site cell and week, served from the shared geo cache)
         # ------------------------------------------------------------------
+        geo_species: dict[UUID, tuple[str, ...] | None] = {}
         if model_name == "birdnet" and species_filter == "birdnet_geo" and recordings:
-            from echoroo.ml.birdnet_wrapper import BirdNETWrapper
+            from echoroo.ml.birdnet_geo import geo_species_by_recording
 
-            wrapper = BirdNETWrapper.get_instance()
-            first_recording = recordings[0]
-            site = getattr(getattr(first_recording, "dataset", None), "site", None)
-            h3_index_member: str | None = getattr(site, "h3_index_member", None)
-
-            week: int | None = None
-            for rec in recordings:
-                if rec.datetime is not None:
-                    week = rec.datetime.isocalendar()[1]
-                    break
-
-            if h3_index_member is not None and week is not None:
-                try:
-                    lat, lon = h3_to_center(h3_index_member)
-                    custom_species_list = wrapper.get_species_for_location(lat, lon, week)
-                    logger.info(
-                        "Geo filter: lat=%.4f, lon=%.4f, week=%d -> %d species",
-                        lat,
-                        lon,
-                        week,
-                        len(custom_species_list),
-                    )
-                except Exception as geo_exc:  # noqa: BLE001
-                    logger.warning("Geo filter failed (skipping filter): %s", geo_exc)
-                    custom_species_list = None
+            try:
+                geo_species = await geo_species_by_recording(recordings)
+            except Exception as geo_exc:  # noqa: BLE001
+                logger.warning("Geo filter failed (skipping filter): %s", geo_exc)
+                geo_species = {}
 
         total_annotations = 0
         recordings_processed = 0
@@ -215,27 +210,9 @@ async def _run_detection(
             logger.warning("No audio files available to process for run %s", run_uuid)
         elif hasattr(inference_engine, "predict_files_batch"):
             # ------------------------------------------------------------------
-            # Batch path: predict ALL files in one call
+            # Batch path: predict all files sharing a geo species list in one
+            # call (a single call when no geo filter applies)
             # ------------------------------------------------------------------
-            # Sort by file path to match BirdNET's internal alphabetical sorting.
-            recording_paths.sort(key=lambda x: str(x[1]))
-            file_paths = [str(p) for _, p in recording_paths]
-
-            logger.info(
-                "Batch predict %d files for run %s",
-                len(file_paths),
-                run_uuid,
-            )
-
-            try:
-                _embeddings_result, predictions_result = inference_engine.predict_files_batch(
-                    file_paths,
-                    custom_species_list=custom_species_list,
-                )
-            except Exception as exc:
-                logger.exception("Batch predict failed for run %s: %s", run_uuid, exc)
-                raise
-
             spec = inference_engine.specification
             segment_duration: float = spec.segment_duration
             hop_duration = segment_duration  # overlap is always 0.0 here
@@ -246,181 +223,215 @@ async def _run_detection(
             except ValueError:
                 detection_source = DetectionSource.BIRDNET
 
-            # ------------------------------------------------------------------
-            # Pre-fetch taxon and tag caches to avoid per-annotation DB lookups.
-            # Collect all unique species across the entire batch first, then
-            # issue a single batch query for taxons and tags.
-            # ------------------------------------------------------------------
             from echoroo.models.tag import Tag
             from echoroo.models.taxon import Taxon
 
+            # Shared by every batch of the run.
             taxon_cache: dict[str, Taxon] = {}
             tag_cache: dict[str, Tag] = {}
 
-            if supports_classification:
-                unique_species = _collect_unique_species_from_batch(
-                    predictions_result, inference_engine
-                )
+            for batch_species, batch_paths in _group_by_species_list(
+                recording_paths, geo_species
+            ):
+                # Sort by file path to match BirdNET's internal alphabetical sorting.
+                batch_paths.sort(key=lambda x: str(x[1]))
+                file_paths = [str(p) for _, p in batch_paths]
+
                 logger.info(
-                    "Pre-fetching taxon/tag cache for %d unique species (run %s)",
-                    len(unique_species),
+                    "Batch predict %d files for run %s (%s species)",
+                    len(file_paths),
                     run_uuid,
+                    "all" if batch_species is None else len(batch_species),
                 )
-                if unique_species:
-                    async with session_factory() as db:
-                        taxon_cache, tag_cache = await _build_taxon_tag_caches(
-                            db, project_uuid, unique_species
-                        )
-                        await db.commit()
-
-            for file_index, (recording, _) in enumerate(recording_paths):
-                # Cancellation check before processing each file
-                async with session_factory() as db:
-                    run_repo = DetectionRunRepository(db)
-                    current_run = await run_repo.get_by_id(run_uuid)
-                    if current_run is not None and current_run.status == DetectionRunStatus.FAILED:
-                        logger.warning(
-                            "DetectionRun %s was cancelled, stopping processing", run_uuid
-                        )
-                        return {
-                            "detection_run_id": detection_run_id,
-                            "recordings_processed": recordings_processed,
-                            "recordings_failed": recordings_failed,
-                            "total_annotations": total_annotations,
-                            "status": "cancelled",
-                        }
 
                 try:
-                    # Extract this file's predictions based on array dimensions.
-                    # Batch predict result shape: (n_files, 1, n_segments, n_species) or
-                    # (n_files, n_segments, n_species) depending on model version.
-                    all_probs = predictions_result.species_probs
-                    all_ids = predictions_result.species_ids
-                    if all_probs.ndim == 4:
-                        file_probs = all_probs[file_index, 0]
-                        file_ids = all_ids[file_index, 0]
-                    elif all_probs.ndim == 3:
-                        file_probs = all_probs[file_index]
-                        file_ids = all_ids[file_index]
-                    else:
-                        file_probs = all_probs
-                        file_ids = all_ids
-
-                    n_segments = len(file_probs)
-
-                    # Build annotation dicts per segment using pre-fetched caches
-                    if supports_classification:
-                        now = datetime.now(UTC)
-                        for seg_idx in range(n_segments):
-                            start_time = seg_idx * hop_duration
-                            end_time = start_time + segment_duration
-
-                            seg_probs = file_probs[seg_idx]
-                            seg_ids = file_ids[seg_idx]
-
-                            # Use the inference engine's filter logic
-                            if hasattr(inference_engine, "_filter_predictions"):
-                                preds = inference_engine._filter_predictions(
-                                    seg_probs.astype(np.float32),
-                                    seg_ids,
-                                    inference_engine._model.species_list,
-                                )
-                            else:
-                                preds = []
-
-                            for species_name, confidence in preds:
-                                parts = species_name.split("_", 1)
-                                scientific_name = parts[0] if parts else species_name
-
-                                # Cache lookup (fallback to DB only for genuinely new species)
-                                tag = tag_cache.get(scientific_name)
-                                if tag is None:
-                                    common_name = parts[1] if len(parts) > 1 else ""
-                                    is_non_bio = common_name in NON_SPECIES_LABELS
-                                    async with session_factory() as db:
-                                        taxon_repo = TaxonRepository(db)
-                                        tag_repo = TagRepository(db)
-                                        miss_taxon = await taxon_repo.get_or_create_by_scientific_name(
-                                            scientific_name=scientific_name,
-                                            common_name=common_name,
-                                            is_non_biological=is_non_bio,
-                                        )
-                                        miss_tag = await tag_repo.get_or_create_species(
-                                            project_id=project_uuid,
-                                            scientific_name=scientific_name,
-                                            common_name=common_name,
-                                            taxon_id=miss_taxon.id,
-                                        )
-                                        await db.commit()
-                                    taxon_cache[scientific_name] = miss_taxon
-                                    tag_cache[scientific_name] = miss_tag
-                                    tag = miss_tag
-
-                                pending_annotation_dicts.append(
-                                    {
-                                        "id": uuid4(),
-                                        "recording_id": recording.id,
-                                        "tag_id": tag.id,
-                                        "detection_run_id": run_uuid,
-                                        "source": detection_source,
-                                        "status": DetectionStatus.UNREVIEWED,
-                                        "confidence": confidence,
-                                        "start_time": start_time,
-                                        "end_time": end_time,
-                                        "created_at": now,
-                                        "updated_at": now,
-                                    }
-                                )
-
-                    recordings_processed += 1
-
-                except Exception as exc:  # noqa: BLE001
-                    logger.warning(
-                        "%s processing failed for recording %s (%s): %s",
-                        model_name,
-                        recording.id,
-                        recording.filename,
-                        exc,
+                    _embeddings_result, predictions_result = (
+                        inference_engine.predict_files_batch(
+                            file_paths,
+                            custom_species_list=(
+                                None if batch_species is None else list(batch_species)
+                            ),
+                        )
                     )
-                    recordings_failed += 1
-                    recordings_processed += 1
+                except Exception as exc:
+                    logger.exception("Batch predict failed for run %s: %s", run_uuid, exc)
+                    raise
 
                 # ------------------------------------------------------------------
-                # Step 6: Flush batch every _COMMIT_BATCH_SIZE recordings
+                # Pre-fetch taxon and tag caches to avoid per-annotation DB lookups.
+                # Collect the unique species of the batch not cached by an earlier
+                # batch, then issue a single batch query for taxons and tags.
                 # ------------------------------------------------------------------
-                if recordings_processed % _COMMIT_BATCH_SIZE == 0 and pending_annotation_dicts:
-                    batch_count = len(pending_annotation_dicts)
-                    async with session_factory() as db:
-                        inserted = await _bulk_insert_annotations(db, pending_annotation_dicts)
-                        await db.commit()
-
-                    total_annotations += inserted
-                    pending_annotation_dicts = []
+                if supports_classification:
+                    unique_species = {
+                        name: info
+                        for name, info in _collect_unique_species_from_batch(
+                            predictions_result, inference_engine
+                        ).items()
+                        if name not in tag_cache
+                    }
+                    logger.info(
+                        "Pre-fetching taxon/tag cache for %d unique species (run %s)",
+                        len(unique_species),
+                        run_uuid,
+                    )
+                    if unique_species:
+                        async with session_factory() as db:
+                            batch_taxa, batch_tags = await _build_taxon_tag_caches(
+                                db, project_uuid, unique_species
+                            )
+                            await db.commit()
+                        taxon_cache.update(batch_taxa)
+                        tag_cache.update(batch_tags)
 
-                    # Update annotation_count on DetectionRun
+                for file_index, (recording, _) in enumerate(batch_paths):
+                    # Cancellation check before processing each file
                     async with session_factory() as db:
                         run_repo = DetectionRunRepository(db)
-                        run = await run_repo.get_by_id(run_uuid)
-                        if run is not None:
-                            run.annotation_count = total_annotations
-                            await run_repo.update(run)
+                        current_run = await run_repo.get_by_id(run_uuid)
+                        if current_run is not None and current_run.status == DetectionRunStatus.FAILED:
+                            logger.warning(
+                                "DetectionRun %s was cancelled, stopping processing", run_uuid
+                            )
+                            return {
+                                "detection_run_id": detection_run_id,
+                                "recordings_processed": recordings_processed,
+                                "recordings_failed": recordings_failed,
+                                "total_annotations": total_annotations,
+                                "status": "cancelled",
+                            }
+
+                    try:
+                        # Extract this file's predictions based on array dimensions.
+                        # Batch predict result shape: (n_files, 1, n_segments, n_species) or
+                        # (n_files, n_segments, n_species) depending on model version.
+                        all_probs = predictions_result.species_probs
+                        all_ids = predictions_result.species_ids
+                        if all_probs.ndim == 4:
+                            file_probs = all_probs[file_index, 0]
+                            file_ids = all_ids[file_index, 0]
+                        elif all_probs.ndim == 3:
+                            file_probs = all_probs[file_index]
+                            file_ids = all_ids[file_index]
+                        else:
+                            file_probs = all_probs
+                            file_ids = all_ids
+
+                        n_segments = len(file_probs)
+
+                        # Build annotation dicts per segment using pre-fetched caches
+                        if supports_classification:
+                            now = datetime.now(UTC)
+                            for seg_idx in range(n_segments):
+                                start_time = seg_idx * hop_duration
+                                end_time = start_time + segment_duration
+
+                                seg_probs = file_probs[seg_idx]
+                                seg_ids = file_ids[seg_idx]
+
+                                # Use the inference engine's filter logic
+                                if hasattr(inference_engine, "_filter_predictions"):
+                                    preds = inference_engine._filter_predictions(
+                                        seg_probs.astype(np.float32),
+                                        seg_ids,
+                                        inference_engine._model.species_list,
+                                    )
+                                else:
+                                    preds = []
+
+                                for species_name, confidence in preds:
+                                    parts = species_name.split("_", 1)
+                                    scientific_name = parts[0] if parts else species_name
+
+                                    # Cache lookup (fallback to DB only for genuinely new species)
+                                    tag = tag_cache.get(scientific_name)
+                                    if tag is None:
+                                        common_name = parts[1] if len(parts) > 1 else ""
+                                        is_non_bio = common_name in NON_SPECIES_LABELS
+                                        async with session_factory() as db:
+                                            taxon_repo = TaxonRepository(db)
+                                            tag_repo = TagRepository(db)
+                                            miss_taxon = await taxon_repo.get_or_create_by_scientific_name(
+                                                scientific_name=scientific_name,
+                                                common_name=common_name,
+                                                is_non_biological=is_non_bio,
+                                            )
+                                            miss_tag = await tag_repo.get_or_create_species(
+                                                project_id=project_uuid,
+                                                scientific_name=scientific_name,
+                                                common_name=common_name,
+                                                taxon_id=miss_taxon.id,
+                                            )
+                                            await db.commit()
+                                        taxon_cache[scientific_name] = miss_taxon
+                                        tag_cache[scientific_name] = miss_tag
+                                        tag = miss_tag
+
+                                    pending_annotation_dicts.append(
+                                        {
+                                            "id": uuid4(),
+                                            "recording_id": recording.id,
+                                            "tag_id": tag.id,
+                                            "detection_run_id": run_uuid,
+                                            "source": detection_source,
+                                            "status": DetectionStatus.UNREVIEWED,
+                                            "confidence": confidence,
+                                            "start_time": start_time,
+                                            "end_time": end_time,
+                                            "created_at": now,
+                                            "updated_at": now,
+                                        }
+                                    )
+
+                        recordings_processed += 1
+
+                    except Exception as exc:  # noqa: BLE001
+                        logger.warning(
+                            "%s processing failed for recording %s (%s): %s",
+                            model_name,
+                            recording.id,
+                            recording.filename,
+                            exc,
+                        )
+                        recordings_failed += 1
+                        recordings_processed += 1
+
+                    # ------------------------------------------------------------------
+                    # Step 6: Flush batch every _COMMIT_BATCH_SIZE recordings
+                    # ------------------------------------------------------------------
+                    if recordings_processed % _COMMIT_BATCH_SIZE == 0 and pending_annotation_dicts:
+                        batch_count = len(pending_annotation_dicts)
+                        async with session_factory() as db:
+                            inserted = await _bulk_insert_annotations(db, pending_annotation_dicts)
                             await db.commit()
 
-                    logger.debug(
-                        "Flushed %d annotation dicts (%d inserted) for run %s",
-                        batch_count,
-                        total_annotations,
-                        run_uuid,
-                    )
+                        total_annotations += inserted
+                        pending_annotation_dicts = []
 
-                    logger.info(
-                        "DetectionRun %s progress: %d/%d recordings, "
-                        "%d annotations so far",
-                        run_uuid,
-                        recordings_processed,
-                        len(recordings),
-                        total_annotations,
-                    )
+                        # Update annotation_count on DetectionRun
+                        async with session_factory() as db:
+                            run_repo = DetectionRunRepository(db)
+                            run = await run_repo.get_by_id(run_uuid)
+                            if run is not None:
+                                run.annotation_count = total_annotations
+                                await run_repo.update(run)
+                                await db.commit()
+
+                        logger.debug(
+                            "Flushed %d annotation dicts (%d inserted) for run %s",
+                            batch_count,
+                            total_annotations,
+                            run_uuid,
+                        )
+
+                        logger.info(
+                            "DetectionRun %s progress: %d/%d recordings, "
+                            "%d annotations so far",
+                            run_uuid,
+                            recordings_processed,
+                            len(recordings),
+                            total_annotations,
+                        )
 
         else:
             # ------------------------------------------------------------------
@@ -457,8 +468,10 @@ async def _run_detection(
                         }
 
                 try:
+                    species = geo_species.get(recording.id)
                     results = inference_engine.predict_file(
-                        local_path, custom_species_list=custom_species_list
+                        local_path,
+                        custom_species_list=None if species is None else list(species),
                     )
 
                     if results:
@@ -578,6 +591,21 @@ async def _run_detection(
                 await run_repo.update(run)
                 await db.commit()
 
+        # Resolve the taxa this run created against GBIF in one cache-first
+        # pass. Best-effort: the admin-triggered ``resolve_gbif_batch`` still
+        # picks up anything left unresolved.
+        if total_annotations > 0:
+            try:
+                from echoroo.workers.taxon_tasks import resolve_dataset_taxa
+
+                resolve_dataset_taxa.delay(dataset_id)
+            except Exception:  # noqa: BLE001 — resolution is best-effort
+                logger.warning(
+                    "Failed to enqueue taxon resolution for dataset %s",
+                    dataset_uuid,
+                    exc_info=True,
+                )
+
         logger.info(
             "DetectionRun %s completed: %d recordings processed (%d failed), "
             "%d annotations created",
@@ -708,3 +736,33 @@ def run_detection(
         with contextlib.suppress(Exception):
             asyncio.run(_mark_detection_run_failed(run_id_for_error, str(exc)))
         raise
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    bind=True,
+    name="echoroo.workers.ml_tasks.precompute_birdnet_geo_species",
+    time_limit=900,
+    soft_time_limit=840,
+)
+def precompute_birdnet_geo_species(_self: Any, h3_index_member: str) -> dict[str, Any]:
+    """Celery task: warm the BirdNET geo species cache for a site.
+
+    Computes the geo species list of every BirdNET week for the site's
+    cache cell, so later ``birdnet_geo`` detection runs never wait on the
+    geo model. Weeks already cached are skipped.
+
+    Args:
+        h3_index_member: The site's H3 cell (any resolution).
+
+    Returns:
+        Summary dict with the cache ``cell`` and ``weeks_computed``.
+    """
+    from echoroo.ml.birdnet_geo import geo_cell, precompute_geo_species
+
+    computed = asyncio.run(precompute_geo_species(h3_index_member))
+    logger.info(
+        "Precomputed BirdNET geo species for %s: %d weeks computed",
+        h3_index_member,
+        computed,
+    )
+    return {"cell": geo_cell(h3_index_member), "weeks_computed": computed}
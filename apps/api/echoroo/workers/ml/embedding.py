@@ -126,7 +126,7 @@ async def _run_embedding_generation(
         # ------------------------------------------------------------------
         audio_service = AudioService(
             audio_root=settings.AUDIO_ROOT,
-            s3_audio_cache_dir="/data/s3_audio_cache",
+            s3_audio_cache_dir=settings.S3_AUDIO_CACHE_DIR,
         )
 
         from echoroo.workers.model_preloader import get_model
@@ -220,6 +220,12 @@ def _download_recordings_to_local(
     """
     recording_paths: list[tuple[Any, Path]] = []
     failed = 0
+    # Start every download on the shared prefetch pool so objects transfer
+    # concurrently; the loop below then mostly finds them already cached.
+    try:
+        audio_service.prefetch([recording.path for recording in recordings])
+    except Exception as exc:  # noqa: BLE001 — fall back to sequential downloads
+        logger.warning("Recording prefetch could not be started: %s", exc)
     for recording in recordings:
         try:
             local_path = audio_service.ensure_file_local(recording.path)
@@ -18,7 +18,11 @@ from __future__ import annotations
 
 # Re-export Celery tasks so that ``from echoroo.workers.ml_tasks import X``
 # continues to work for existing callers (e.g. services/detection_run.py).
-from echoroo.workers.ml.detection import run_birdnet_detection, run_detection
+from echoroo.workers.ml.detection import (
+    precompute_birdnet_geo_species,
+    run_birdnet_detection,
+    run_detection,
+)
 from echoroo.workers.ml.embedding import run_embedding_generation
 
 # Re-export internal helpers for any code that imports them directly.
@@ -36,6 +40,7 @@ from echoroo.workers.ml.utils import (
 )
 
 __all__ = [
+    "precompute_birdnet_geo_species",
     "run_birdnet_detection",
     "run_detection",
     "run_embedding_generation",
@@ -61,7 +61,12 @@ def preload_models() -> None:
 
     # Load direct TF inference engine for search reference audio.
     # This is a separate lightweight path that bypasses birdnet's multiprocess
-    # pipeline, providing sub-second latency for small batches.
+    # pipeline, providing sub-second latency for small batches. When the
+    # shared inference server is enabled it owns that copy, and search embeds
+    # through it instead.
+    if settings.INFERENCE_SERVER_ENABLED:
+        logger.info("Inference server enabled; skipping in-worker Perch direct TF engine")
+        return
     _preload_direct_perch()
 
 
@@ -0,0 +1,203 @@
+"""Outbox listener process: ``python -m echoroo.workers.outbox_listener``.
+
+Drains ``outbox_events`` as soon as rows are committed instead of waiting
+for the next beat tick of
+:func:`echoroo.workers.outbox_processor.process_outbox_batch`.
+:func:`echoroo.services.outbox_service.enqueue` issues ``pg_notify`` on
+:data:`~echoroo.services.outbox_service.OUTBOX_NOTIFY_CHANNEL`; this
+process holds one connection that ``LISTEN``s on it and runs
+:func:`~echoroo.workers.outbox_processor._drain_batch` whenever a
+notification arrives.
+
+Polling is only the fallback. Between wake-ups the listener sleeps until
+the earliest pending row is due (rows rescheduled by ``mark_failed`` carry
+a future ``next_retry_at`` and no notification), capped at
+``OUTBOX_LISTENER_POLL_SECONDS``. A dropped ``LISTEN`` connection is
+re-opened on the next cycle; until then the capped sleep keeps the queue
+moving. Several listeners, and the beat task, can run side by side: claims
+use ``FOR UPDATE SKIP LOCKED``.
+
+Handlers are registered by importing the same modules a Celery worker
+imports (``app.conf.include``), so a row is dispatched identically
+whichever consumer claims it. Runs until SIGTERM / SIGINT and logs the
+enqueue-to-handled latency histogram every
+:data:`LATENCY_LOG_INTERVAL_SECONDS`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import signal
+import sys
+import time
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker
+
+from echoroo.services.outbox_service import (
+    DEFAULT_CLAIM_BATCH_SIZE,
+    OUTBOX_NOTIFY_CHANNEL,
+    seconds_until_next_due,
+)
+from echoroo.workers.outbox_processor import OUTBOX_LATENCY, _drain_batch, _worker_id
+
+logger = logging.getLogger(__name__)
+
+#: Shortest sleep after a cycle that handled nothing although a row was
+#: already due (e.g. another consumer holds its lock). Stops the loop from
+#: spinning on rows it cannot claim.
+MIN_IDLE_SECONDS: float = 1.0
+
+#: How often the latency histogram is logged.
+LATENCY_LOG_INTERVAL_SECONDS: float = 60.0
+
+
+class OutboxListener:
+    """Notification-driven drain loop over ``outbox_events``."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        poll_seconds: float,
+        batch_size: int = DEFAULT_CLAIM_BATCH_SIZE,
+    ) -> None:
+        """Bind the listener to a worker engine and its session factory."""
+        self._engine = engine
+        self._session_factory = session_factory
+        self._poll_seconds = poll_seconds
+        self._batch_size = batch_size
+        self._worker_id = _worker_id()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._listen_conn: AsyncConnection | None = None
+        self._listen_driver: Any = None
+        self._last_latency_log = time.monotonic()
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to return after the current cycle."""
+        self._stopping = True
+        self._wake.set()
+
+    def _on_notify(self, *_args: Any) -> None:
+        self._wake.set()
+
+    async def _ensure_listening(self) -> None:
+        """(Re-)open the ``LISTEN`` connection if it is missing or dead."""
+        if self._listen_driver is not None and not self._listen_driver.is_closed():
+            return
+        await self._close_listen()
+        try:
+            conn = await self._engine.connect()
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            await driver.add_listener(OUTBOX_NOTIFY_CHANNEL, self._on_notify)
+        except Exception as exc:  # noqa: BLE001 — poll-only until the next cycle
+            logger.warning("outbox listener: LISTEN failed, polling only: %r", exc)
+            return
+        self._listen_conn = conn
+        self._listen_driver = driver
+        logger.info("outbox listener: listening on %r", OUTBOX_NOTIFY_CHANNEL)
+
+    async def _close_listen(self) -> None:
+        conn, self._listen_conn, self._listen_driver = self._listen_conn, None, None
+        if conn is not None:
+            with contextlib.suppress(Exception):
+                await conn.close()
+
+    async def _next_delay(self, processed: int) -> float:
+        """Seconds to sleep before the next drain unless notified sooner."""
+        if processed >= self._batch_size:
+            # A full batch: more rows are probably waiting.
+            return 0.0
+        async with self._session_factory() as session:
+            due = await seconds_until_next_due(session)
+        if due is None:
+            return self._poll_seconds
+        if processed == 0:
+            due = max(due, MIN_IDLE_SECONDS)
+        return min(due, self._poll_seconds)
+
+    async def run_once(self) -> float:
+        """Drain one batch and return how long to wait before the next."""
+        # Clear BEFORE draining: a notification that lands mid-drain must
+        # trigger another cycle rather than be swallowed.
+        self._wake.clear()
+        try:
+            processed = await _drain_batch(
+                self._session_factory,
+                batch_size=self._batch_size,
+                worker_id=self._worker_id,
+            )
+            return await self._next_delay(processed)
+        except Exception as exc:  # noqa: BLE001 — transient DB failure; retry after a poll
+            logger.warning("outbox listener: drain failed: %r", exc)
+            return self._poll_seconds
+
+    def _maybe_log_latency(self) -> None:
+        now = time.monotonic()
+        if now - self._last_latency_log < LATENCY_LOG_INTERVAL_SECONDS:
+            return
+        self._last_latency_log = now
+        snapshot = OUTBOX_LATENCY.snapshot()
+        if snapshot["count"]:
+            logger.info(
+                "outbox listener: handled=%d latency p50<=%ss p95<=%ss p99<=%ss",
+                snapshot["count"],
+                OUTBOX_LATENCY.quantile(0.50),
+                OUTBOX_LATENCY.quantile(0.95),
+                OUTBOX_LATENCY.quantile(0.99),
+            )
+
+    async def run(self) -> None:
+        """Drain, sleep until notified or due, repeat until :meth:`stop`."""
+        try:
+            while not self._stopping:
+                await self._ensure_listening()
+                delay = await self.run_once()
+                self._maybe_log_latency()
+                if self._stopping or delay <= 0:
+                    continue
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+        finally:
+            await self._close_listen()
+
+
+async def _serve() -> None:
+    from echoroo.core.settings import get_settings
+    from echoroo.workers.celery_app import app
+    from echoroo.workers.db_utils import get_worker_engine_and_session_factory
+
+    # Register every outbox handler exactly as a Celery worker would.
+    app.loader.import_default_modules()
+
+    engine, session_factory = get_worker_engine_and_session_factory()
+    listener = OutboxListener(
+        engine,
+        session_factory,
+        poll_seconds=get_settings().OUTBOX_LISTENER_POLL_SECONDS,
+    )
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, listener.stop)
+    try:
+        await listener.run()
+    finally:
+        await engine.dispose()
+
+
+def main() -> int:
+    """Run the outbox listener until SIGTERM / SIGINT."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    asyncio.run(_serve())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
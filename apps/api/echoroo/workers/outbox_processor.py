@@ -25,6 +25,15 @@ the side-effect *idempotently* (FR-076a, SC-021). Re-running a handler
 with the same ``idempotency_key`` MUST be a no-op — the at-most-once log
 guarantee depends on this.
 
+Dispatch
+--------
+:func:`_drain_batch` is shared by two drivers: the beat-scheduled
+:func:`process_outbox_batch` task (the polling safety net) and the
+long-lived :mod:`echoroo.workers.outbox_listener` process, which wakes on
+``pg_notify`` from :func:`echoroo.services.outbox_service.enqueue`. Each
+row's handler runs in its own transaction, which also marks the row done.
+Enqueue-to-handled latency is recorded in :data:`OUTBOX_LATENCY`.
+
 Retry semantics
 ---------------
 The Celery task itself uses ``self.retry`` up to
@@ -40,11 +49,13 @@ PagerDuty alert fires.
 from __future__ import annotations
 
 import asyncio
+import bisect
 import logging
 import os
 import socket
+import threading
 from collections.abc import Awaitable, Callable
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
@@ -70,6 +81,63 @@ STALE_PROCESSING_RESET_AGE = timedelta(minutes=10)
 logger = logging.getLogger(__name__)
 
 
+# -- Latency histogram --------------------------------------------------------
+
+
+class LatencyHistogram:
+    """Cumulative enqueue-to-handled latency histogram (seconds).
+
+    Prometheus-style fixed buckets: ``counts[i]`` is the number of
+    observations ``<= bounds[i]``, with a final ``+Inf`` bucket. Kept
+    in-process and surfaced through the processor's result dict and the
+    listener's periodic log line, so it needs no metrics backend.
+    """
+
+    DEFAULT_BOUNDS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BOUNDS) -> None:
+        """Create an empty histogram with ascending upper ``bounds``."""
+        self.bounds = bounds
+        self._buckets = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency sample."""
+        with self._lock:
+            self._buckets[bisect.bisect_left(self.bounds, seconds)] += 1
+            self._count += 1
+            self._sum += seconds
+
+    def quantile(self, q: float) -> float | None:
+        """Return the upper bound of the bucket holding quantile ``q``."""
+        with self._lock:
+            if not self._count:
+                return None
+            rank = q * self._count
+            seen = 0
+            for bound, count in zip(self.bounds, self._buckets, strict=False):
+                seen += count
+                if seen >= rank:
+                    return bound
+            return float("inf")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return ``{"count", "sum", "buckets": {"le": cumulative}}``."""
+        with self._lock:
+            cumulative: dict[str, int] = {}
+            running = 0
+            for bound, count in zip((*self.bounds, float("inf")), self._buckets, strict=True):
+                running += count
+                cumulative["+Inf" if bound == float("inf") else str(bound)] = running
+            return {"count": self._count, "sum": self._sum, "buckets": cumulative}
+
+
+#: Process-wide enqueue-to-handled latency of successfully handled rows.
+OUTBOX_LATENCY = LatencyHistogram()
+
+
 # -- Handler registry ---------------------------------------------------------
 
 #: Type alias for an outbox event handler. Handlers receive the worker's
@@ -143,24 +211,24 @@ async def _process_one(
     session: AsyncSession,
     row: dict[str, Any],
 ) -> None:
-    """Run the registered handler for a single claimed row.
+    """Run the registered handler for a single claimed row and mark it done.
 
     The function does **not** commit — the caller controls the
     transaction so that handler effects + ``mark_done`` either both
-    commit or both roll back. On handler failure, the function rolls
-    back the work transaction and re-raises; the caller is then
+    commit or both roll back, and a crash can never leave a row whose
+    effects are committed still waiting to be re-delivered. On handler
+    failure the caller rolls back the work transaction and is then
     responsible for opening a *fresh* transaction to record the failure
     via :func:`mark_failed`. Inlining ``mark_failed`` here would
     silently lose the failure-state UPDATE because the surrounding
     rollback would discard it (issue #1, Phase 2.10).
     """
-    event_id: UUID = row["id"]
     event_type: str = row["event_type"]
     payload: dict[str, Any] = row["payload"] or {}
 
     handler = _resolve_handler(event_type)
     await handler(session, payload)
-    await mark_done(session, event_id)
+    await mark_done(session, row["id"])
 
 
 async def _record_failure(
@@ -202,12 +270,13 @@ async def _drain_batch(
     worker_id: str,
     stale_age: timedelta = STALE_PROCESSING_RESET_AGE,
 ) -> int:
-    """Claim a batch and process each row in its own transaction.
+    """Claim a batch and run each row's handler in its own transaction.
 
     Returns the number of rows successfully processed (i.e. ``mark_done``
-    committed). A row whose handler raises does NOT count toward the
-    return value — the failure is logged and the row is rescheduled via
-    a fresh transaction so the failure-state UPDATE is durable.
+    committed together with the handler's effects). A row whose handler
+    raises does NOT count toward the return value — the failure is
+    logged and the row is rescheduled via a fresh transaction so the
+    failure-state UPDATE is durable.
     """
     # Step 0: reap rows stuck in ``processing`` from a prior crashed
     # worker so they become eligible for the claim below.
@@ -224,17 +293,21 @@ async def _drain_batch(
     if not claimed:
         return 0
 
-    # Step 2: process each row in its own transaction. We deliberately do
-    # NOT batch the handler effects together — a single bad row should
-    # not poison the rest of the batch.
-    successful = 0
+    # Step 2: run each handler in its own transaction, together with the
+    # UPDATE that marks its row done. We deliberately do NOT batch the
+    # handler effects together — a single bad row should not poison the
+    # rest of the batch.
+    processed = 0
     for row in claimed:
         event_id: UUID = row["id"]
         retry_count = int(row.get("retry_count", 0))
         try:
             async with session_factory() as work_session, work_session.begin():
                 await _process_one(work_session, row)
-            successful += 1
+            processed += 1
+            created_at = row.get("created_at")
+            if created_at is not None:
+                OUTBOX_LATENCY.observe((datetime.now(UTC) - created_at).total_seconds())
         except Exception as exc:  # noqa: BLE001 -- logged + counted, loop continues
             logger.warning(
                 "outbox row %s (event_type=%s) failed: %s",
@@ -251,7 +324,8 @@ async def _drain_batch(
                 error=f"{type(exc).__name__}: {exc}",
                 current_retry_count=retry_count,
             )
-    return successful
+
+    return processed
 
 
 # -- Celery task entry point -------------------------------------------------
@@ -284,8 +358,9 @@ def process_outbox_batch(self: Any, batch_size: int = DEFAULT_CLAIM_BATCH_SIZE)
 
     Returns
     -------
-    Summary dict with ``processed`` (rows that completed cleanly) and
-    ``worker_id`` (host:pid). Used by tests + dashboards.
+    Summary dict with ``processed`` (rows that completed cleanly),
+    ``worker_id`` (host:pid) and ``latency`` (this process's
+    :data:`OUTBOX_LATENCY` snapshot). Used by tests + dashboards.
     """
     # Local imports so the module is importable even when the worker DB
     # engine is not yet initialised (mirrors workers/audit_log_export.py).
@@ -316,11 +391,17 @@ def process_outbox_batch(self: Any, batch_size: int = DEFAULT_CLAIM_BATCH_SIZE)
         )
         raise self.retry(exc=exc, countdown=countdown) from exc
 
-    return {"processed": processed, "worker_id": worker_id}
+    return {
+        "processed": processed,
+        "worker_id": worker_id,
+        "latency": OUTBOX_LATENCY.snapshot(),
+    }
 
 
 __all__ = [
     "OUTBOX_HANDLERS",
+    "OUTBOX_LATENCY",
+    "LatencyHistogram",
     "STALE_PROCESSING_RESET_AGE",
     "OutboxHandler",
     "process_outbox_batch",
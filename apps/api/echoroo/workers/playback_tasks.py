@@ -0,0 +1,100 @@
+"""Background transcoding of recordings into the compressed playback cache.
+
+Browser playback serves an OGG/Vorbis copy of each recording (see
+:mod:`echoroo.services.audio._playback_cache`). Producing that copy runs
+ffmpeg over the whole file, which is far too slow to do inside a request,
+so the API only looks the copy up and falls back to the source file while
+this task builds it.
+
+Triggers
+--------
+- Import: :func:`echoroo.workers.upload_tasks._run_import` enqueues one job
+  per created recording when ``PLAYBACK_TRANSCODE_ON_IMPORT`` is enabled.
+- First play: :meth:`AudioService.schedule_playback_transcode` enqueues a
+  job on a cache miss, deduplicated through the cache's ``.pending`` claim.
+
+Idempotency
+-----------
+A job for a recording that is already cached returns immediately, so a
+redelivered or duplicated message is harmless. The claim marker is always
+released on exit so a failed transcode can be retried by the next play.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from echoroo.core.settings import get_settings
+from echoroo.services.audio import AudioService
+from echoroo.workers.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+
+def _build_audio_service() -> AudioService:
+    """Build an AudioService wired to the shared playback cache."""
+    settings = get_settings()
+    return AudioService(
+        audio_root=settings.AUDIO_ROOT,
+        s3_audio_cache_dir=settings.S3_AUDIO_CACHE_DIR,
+        playback_cache_dir=settings.PLAYBACK_CACHE_DIR,
+        playback_cache_max_bytes=settings.PLAYBACK_CACHE_MAX_BYTES,
+    )
+
+
+def enqueue_playback_transcodes(recording_paths: list[str]) -> int:
+    """Enqueue playback transcodes for freshly imported recordings, best-effort.
+
+    Args:
+        recording_paths: Recording paths (S3 keys) to transcode.
+
+    Returns:
+        Number of jobs enqueued.
+    """
+    audio_service = _build_audio_service()
+    enqueued = 0
+    for path in recording_paths:
+        if audio_service.get_cached_playback(path) is not None:
+            continue
+        if audio_service.schedule_playback_transcode(path):
+            enqueued += 1
+    return enqueued
+
+
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.playback_tasks.transcode_for_playback",
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def transcode_for_playback(recording_path: str) -> dict[str, Any]:
+    """Transcode one recording into the compressed playback cache.
+
+    Args:
+        recording_path: Recording path relative to AUDIO_ROOT (also the S3 key).
+
+    Returns:
+        Summary dict, e.g. ``{"status": "ok", "bytes": 4194304, ...}``.
+    """
+    audio_service = _build_audio_service()
+    cache = audio_service.playback_cache
+    try:
+        cache_path = audio_service.get_compressed_for_playback(recording_path)
+    except FileNotFoundError:
+        logger.warning("Playback transcode skipped, source missing: %s", recording_path)
+        return {"status": "missing", "recording_path": recording_path}
+    except Exception:
+        logger.exception("Playback transcode failed for %s", recording_path)
+        raise
+    finally:
+        cache.release_pending(recording_path)
+
+    return {
+        "status": "ok",
+        "recording_path": recording_path,
+        "bytes": cache_path.stat().st_size,
+        "cache_usage_bytes": cache.usage(),
+    }
+
+
+__all__ = ["enqueue_playback_transcodes", "transcode_for_playback"]
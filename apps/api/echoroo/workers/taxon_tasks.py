@@ -65,6 +65,28 @@ async def _run_resolve_gbif_batch(batch_size: int) -> dict[str, object]:
         await engine.dispose()
 
 
+async def _run_resolve_dataset_taxa(dataset_id: str) -> dict[str, object]:
+    """Async implementation of dataset-wide GBIF taxon resolution."""
+    from uuid import UUID
+
+    from echoroo.repositories.taxon import TaxonRepository
+    from echoroo.services.taxon import TaxonService
+
+    engine, session_factory = get_worker_engine_and_session_factory()
+    try:
+        async with session_factory() as db:
+            service = TaxonService(taxon_repo=TaxonRepository(db))
+            batch_result = await service.resolve_dataset_taxa(UUID(dataset_id))
+            await db.commit()
+        return {
+            "status": "completed",
+            "resolved": batch_result.resolved,
+            "taxa_errored": batch_result.errored,
+        }
+    finally:
+        await engine.dispose()
+
+
 async def _run_fetch_vernacular_names_batch(
     batch_size: int,
     locales: list[str] | None,
@@ -442,6 +464,34 @@ def resolve_gbif_batch(batch_size: int = 100) -> dict[str, object]:
         raise
 
 
+@app.task(  # type: ignore[untyped-decorator]
+    name="echoroo.workers.taxon_tasks.resolve_dataset_taxa",
+    time_limit=1800,      # 30 min hard limit (a label set may hold thousands of taxa)
+    soft_time_limit=1770,  # 29.5 min soft limit
+)
+def resolve_dataset_taxa(dataset_id: str) -> dict[str, object]:
+    """Resolve GBIF data for every unresolved taxon a dataset's detections use.
+
+    Dispatched when a detection run completes, so the taxa created from a
+    model's label set are resolved in one deduplicated, cache-first pass
+    instead of waiting for repeated ``resolve_gbif_batch`` runs.
+
+    Args:
+        dataset_id: Dataset UUID string.
+
+    Returns:
+        Dict with ``status``, ``resolved`` and ``taxa_errored``.
+    """
+    logger.info("Starting GBIF resolution of dataset %s taxa", dataset_id)
+    try:
+        result: dict[str, object] = asyncio.run(_run_resolve_dataset_taxa(dataset_id))
+        logger.info("GBIF resolution of dataset %s taxa complete: %s", dataset_id, result)
+        return result
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("GBIF resolution of dataset %s taxa failed: %s", dataset_id, exc)
+        raise
+
+
 @app.task(  # type: ignore[untyped-decorator]
     name="echoroo.workers.taxon_tasks.fetch_japanese_vernacular_names",
     time_limit=3600,       # 1 hour hard limit (may process thousands of taxa)
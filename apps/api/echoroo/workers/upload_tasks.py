@@ -24,9 +24,9 @@ from uuid import UUID, uuid4
 
 from celery.exceptions import Ignore
 
+from echoroo.core import s3_async
 from echoroo.core.s3 import (
     delete_objects_by_prefix,
-    get_object_stream,
     get_s3_client,
     move_object,
     verify_object_exists,
@@ -47,6 +47,7 @@ from echoroo.services.s3_upload_sanitizer import sanitize_put_object_kwargs
 from echoroo.services.upload import strip_audio_gps_metadata
 from echoroo.workers.celery_app import app
 from echoroo.workers.db_utils import get_worker_engine_and_session_factory
+from echoroo.workers.playback_tasks import enqueue_playback_transcodes
 
 logger = logging.getLogger(__name__)
 
@@ -361,8 +362,9 @@ async def _run_validate(session_id: str) -> dict[str, Any]:
 
                 # --- Step 1: Check magic bytes ---
                 try:
-                    stream = get_object_stream(file.object_key, byte_range="bytes=0-65535", client=s3)
-                    header = stream.read(65536)
+                    header = await s3_async.read_object(
+                        file.object_key, byte_range="bytes=0-65535"
+                    )
                 except Exception as exc:  # noqa: BLE001
                     logger.warning("Failed to read S3 header for %s: %s", file.object_key, exc)
                     await file_repo.update_status(
@@ -399,19 +401,18 @@ async def _run_validate(session_id: str) -> dict[str, Any]:
                         # Download full file to temp location for ffprobe.
                         # Read in chunks to enforce a size limit (M4) and compute
                         # SHA-256 for integrity verification (M3 / H4 TOCTOU).
-                        full_stream = get_object_stream(file.object_key, client=s3)
                         max_bytes = file.file_size + 1024  # small margin for headers
                         bytes_written = 0
-                        while True:
-                            chunk = full_stream.read(65536)
-                            if not chunk:
-                                break
-                            bytes_written += len(chunk)
-                            if bytes_written > max_bytes:
-                                raise ValueError(
-                                    f"File exceeds expected size of {file.file_size} bytes"
-                                )
-                            tmp.write(chunk)
+                        async with contextlib.aclosing(
+                            s3_async.iter_object(file.object_key)
+                        ) as chunks:
+                            async for chunk in chunks:
+                                bytes_written += len(chunk)
+                                if bytes_written > max_bytes:
+                                    raise ValueError(
+                                        f"File exceeds expected size of {file.file_size} bytes"
+                                    )
+                                tmp.write(chunk)
                         tmp.flush()
 
                         # Verify SHA-256 checksum to detect corruption or TOCTOU replacement
@@ -618,6 +619,7 @@ async def _run_import(
 
             imported_count = 0
             failed_count = 0
+            transcode_on_import = get_settings().PLAYBACK_TRANSCODE_ON_IMPORT
             pending_recordings: list[Recording] = []
             pending_file_ids: list[UUID] = []
 
@@ -638,6 +640,18 @@ async def _run_import(
                 imported_count += len(created)
                 await session_repo.update_progress(upload_session.id, imported_files=imported_count)
                 await db.commit()
+                if transcode_on_import:
+                    # Pre-build the compressed playback copies so the first
+                    # play is served from the cache. Best-effort: a dispatch
+                    # failure must never fail the import itself.
+                    try:
+                        enqueue_playback_transcodes([rec.path for rec in created])
+                    except Exception:  # noqa: BLE001
+                        logger.warning(
+                            "Failed to enqueue playback transcodes for session %s",
+                            session_id,
+                            exc_info=True,
+                        )
                 pending_recordings.clear()
                 pending_file_ids.clear()
 
@@ -0,0 +1,90 @@
+"""Local GBIF fixture server for the test suites.
+
+:class:`GBIFFixtureServer` answers the GBIF endpoints the resolution paths
+use (``/species/match`` and ``/species/{key}/vernacularNames``) from an
+in-memory name table, through an ``httpx.MockTransport``. It records every
+request so tests can assert how many lookups actually reached "the
+network", and can be flipped into an outage that answers 503.
+
+Usage::
+
+    server = GBIFFixtureServer({"Parus major": (9705453, {"ja": ["シジュウカラ"]})})
+    server.install(monkeypatch)
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import httpx
+import pytest
+
+from echoroo.services import gbif as gbif_module
+
+# A fixture taxon: its GBIF usage key and vernacular names by ISO 639-1 locale.
+FixtureTaxon = tuple[int, dict[str, list[str]]]
+
+
+class GBIFFixtureServer:
+    """In-process stand-in for ``api.gbif.org``."""
+
+    def __init__(self, taxa: dict[str, FixtureTaxon]) -> None:
+        self.taxa = taxa
+        self.requests: list[httpx.Request] = []
+        self.down = False
+
+    @property
+    def match_calls(self) -> Counter[str]:
+        """Names sent to ``/species/match``, with their call counts."""
+        return Counter(
+            request.url.params["name"]
+            for request in self.requests
+            if request.url.path.endswith("/species/match")
+        )
+
+    @property
+    def vernacular_calls(self) -> int:
+        """Number of ``/species/{key}/vernacularNames`` requests."""
+        return sum(1 for r in self.requests if r.url.path.endswith("/vernacularNames"))
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.down:
+            return httpx.Response(503)
+        path = request.url.path.removeprefix("/v1")
+        if path == "/species/match":
+            return httpx.Response(200, json=self._match(request.url.params["name"]))
+        if path.startswith("/species/") and path.endswith("/vernacularNames"):
+            key = int(path.split("/")[2])
+            return httpx.Response(200, json={"results": self._vernaculars(key)})
+        return httpx.Response(404)
+
+    def install(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Route the GBIF service's shared client to this server."""
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        monkeypatch.setattr(gbif_module, "get_http_client", lambda _upstream: client)
+
+    def _match(self, name: str) -> dict[str, object]:
+        wanted = " ".join(name.split()).casefold()
+        for canonical, (key, _names) in self.taxa.items():
+            if canonical.casefold() == wanted:
+                return {
+                    "usageKey": key,
+                    "canonicalName": canonical,
+                    "rank": "SPECIES",
+                    "matchType": "EXACT",
+                    "kingdom": "Animalia",
+                    "genus": canonical.split()[0],
+                }
+        return {"matchType": "NONE"}
+
+    def _vernaculars(self, key: int) -> list[dict[str, str]]:
+        iso3 = gbif_module.GBIF_LANG_CODE_MAP
+        for taxon_key, names in self.taxa.values():
+            if taxon_key == key:
+                return [
+                    {"language": iso3.get(locale, locale), "vernacularName": name}
+                    for locale, locale_names in names.items()
+                    for name in locale_names
+                ]
+        return []
@@ -798,6 +798,19 @@ async def setup_test_database(engine: AsyncEngine) -> None:
             detection_run_type_col_exists_result.scalar()
         )
 
+        # Alembic 0042: probe the folded ``search_name`` columns (both added
+        # in the same migration, so one representative column suffices).
+        taxa_search_name_col_exists_result = await conn.execute(
+            sa.text(
+                "SELECT EXISTS (SELECT 1 FROM information_schema.columns"
+                " WHERE table_name = 'taxa'"
+                " AND column_name = 'search_name')"
+            )
+        )
+        taxa_search_name_col_exists = bool(
+            taxa_search_name_col_exists_result.scalar()
+        )
+
         # Existing test DBs may still carry the pre-0017 project_id FK. We
         # drop it below before any early return so hard-deleted projects do
         # not require rewriting append-only audit rows during cleanup.
@@ -1130,6 +1143,7 @@ async def setup_test_database(engine: AsyncEngine) -> None:
         and token_families_exists
         and taxa_reconciliation_col_exists
         and detection_run_type_col_exists
+        and taxa_search_name_col_exists
     )
     if non_license_schema_current and not license_schema_current:
         await _sync_0023_license_schema(engine)
@@ -1275,13 +1289,16 @@ async def setup_test_database(engine: AsyncEngine) -> None:
             ("projectvisibility", ["private", "public", "restricted"]),
             ("projectrole", ["admin", "member", "viewer"]),
             ("projectmemberrole", ["admin", "member", "viewer"]),
-            ("projectstatus", ["active", "dormant", "archived"]),
+            ("projectstatus", ["active", "dormant", "archived", "deleting"]),
             ("projectlicense", ["CC0", "CC-BY", "CC-BY-NC", "CC-BY-SA"]),
             # Phase 13 P1 (T803a): ``setting_type`` enum was retired together
             # with the ``system_settings.value_type`` column when system_settings
             # values became JSONB-native. Do not declare it here.
             ("datasetvisibility", ["private", "public"]),
-            ("datasetstatus", ["pending", "scanning", "processing", "completed", "failed"]),
+            (
+                "datasetstatus",
+                ["pending", "scanning", "processing", "completed", "failed", "deleting"],
+            ),
             ("datetimeparsestatus", ["pending", "success", "failed"]),
             ("tagcategory", ["species", "sound_type", "quality"]),
             ("annotationsource", ["human", "model"]),
@@ -1362,6 +1379,10 @@ async def setup_test_database(engine: AsyncEngine) -> None:
             for t in Base.metadata.tables.values()
             if not t.info.get("_phase13_stub")
         ]
+        # Alembic 0042: the taxon ``search_name`` GIN indexes use
+        # ``gin_trgm_ops``. pg_trgm is a trusted extension, so the database
+        # owner can create it without superuser rights.
+        await conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(
             lambda c: Base.metadata.create_all(
                 c, tables=_tables_to_create, checkfirst=True
@@ -1389,6 +1410,27 @@ async def setup_test_database(engine: AsyncEngine) -> None:
             )
         )
 
+        # Alembic 0042: ``search_name`` on ``taxa`` / ``taxon_vernacular_names``
+        # (filled by the ORM on insert). Existing rows are backfilled with a
+        # plain ``lower()``, which matches the Python fold for the ASCII names
+        # test fixtures use.
+        for _table, _source in (
+            ("taxa", "scientific_name"),
+            ("taxon_vernacular_names", "name"),
+        ):
+            await conn.execute(
+                sa.text(
+                    f"ALTER TABLE {_table} "
+                    "ADD COLUMN IF NOT EXISTS search_name VARCHAR(300)"
+                )
+            )
+            await conn.execute(
+                sa.text(
+                    f"UPDATE {_table} SET search_name = lower({_source}) "
+                    "WHERE search_name IS NULL"
+                )
+            )
+
         # Phase 12 R1 fix: ``outbox_events`` is created by Alembic
         # migration 0001 (no SQLAlchemy ORM model exists yet) so
         # ``Base.metadata.create_all`` does NOT pick it up. Tests that
@@ -1728,6 +1770,20 @@ async def setup_test_database(engine: AsyncEngine) -> None:
                 """
             )
         )
+        # Detection summary rollups (Alembic 0035). ``create_all`` builds the
+        # two rollup tables from the ORM, but the functions and triggers that
+        # keep them in sync are raw DDL. Every statement is ``CREATE OR
+        # REPLACE``, so re-running it on a reused database is a no-op.
+        from echoroo.models.detection_rollup import DETECTION_ROLLUP_DDL
+
+        for statement in DETECTION_ROLLUP_DDL:
+            await conn.execute(sa.text(statement))
+        # Vote tallies (Alembic 0036): same split — table from the ORM,
+        # maintenance triggers from the live DDL constant.
+        from echoroo.models.annotation_vote_tally import ANNOTATION_VOTE_TALLY_DDL
+
+        for statement in ANNOTATION_VOTE_TALLY_DDL:
+            await conn.execute(sa.text(statement))
 
     await _sync_0023_license_schema(engine)
     return
@@ -1750,6 +1806,7 @@ async def cleanup_test_data(session: AsyncSession) -> None:
     await session.execute(sa.text(_safe_delete("notes")))
     # Annotation voting and comments (006-permissions-redesign)
     await session.execute(sa.text(_safe_delete("annotation_votes")))
+    await session.execute(sa.text(_safe_delete("annotation_vote_tallies")))
     await session.execute(sa.text(_safe_delete("annotation_comments")))
     # Annotation sets / segments / time-range annotations (sampling rounds)
     await session.execute(sa.text(_safe_delete("time_range_annotations")))
@@ -1768,6 +1825,10 @@ async def cleanup_test_data(session: AsyncSession) -> None:
     # sampling_round_items (all deleted above), so it is safe to clear here
     # before the parent recordings rows are removed.
     await session.execute(sa.text(_safe_delete("recording_annotations")))
+    # Trigger-maintained summary rollups; emptied by the delete above but
+    # cleared explicitly in case a test wrote them directly.
+    await session.execute(sa.text(_safe_delete("detection_species_rollups")))
+    await session.execute(sa.text(_safe_delete("detection_temporal_rollups")))
     await session.execute(sa.text(_safe_delete("detection_runs")))
     # Evaluation tables
     await session.execute(sa.text(_safe_delete("evaluation_results")))
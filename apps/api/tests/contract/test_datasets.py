@@ -464,8 +464,20 @@ class TestDatasetEndpoints:
         csrf_headers: dict[str, str],
         test_project_id: str,
         test_site: Site,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Test DELETE /web-api/v1/projects/{project_id}/datasets/{dataset_id} - Delete dataset."""
+        """Test DELETE /web-api/v1/projects/{project_id}/datasets/{dataset_id} - Queue deletion.
+
+        The dataset is marked ``deleting`` and a background job is queued;
+        the Celery dispatch is stubbed so no broker is needed.
+        """
+        from unittest.mock import MagicMock
+
+        from echoroo.workers import deletion_tasks
+
+        dispatch = MagicMock()
+        monkeypatch.setattr(deletion_tasks.run_deletion_job, "delay", dispatch)
+
         # Create a dataset first
         dataset_data = {
             "site_id": str(test_site.id),
@@ -486,14 +498,27 @@ class TestDatasetEndpoints:
             headers=csrf_headers,
         )
 
-        assert response.status_code == 204
+        assert response.status_code == 202
+        job = response.json()
+        assert job["entity_type"] == "dataset"
+        assert job["entity_id"] == dataset_id
+        assert job["status"] == "queued"
+        dispatch.assert_called_once_with(job["id"])
 
-        # Verify dataset is deleted
+        # The dataset stays visible as ``deleting`` until the job removes it
         get_response = await client.get(
             f"/web-api/v1/projects/{test_project_id}/datasets/{dataset_id}",
             headers=csrf_headers,
         )
-        assert get_response.status_code == 404
+        assert get_response.status_code == 200
+        assert get_response.json()["status"] == "deleting"
+
+        job_response = await client.get(
+            f"/web-api/v1/deletion-jobs/{job['id']}",
+            headers=csrf_headers,
+        )
+        assert job_response.status_code == 200
+        assert job_response.json()["id"] == job["id"]
 
     async def test_delete_dataset_not_found(
         self,
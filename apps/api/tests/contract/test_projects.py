@@ -331,14 +331,23 @@ class TestProjectEndpoints:
         self,
         client: AsyncClient,
         auth_headers: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Test DELETE /api/v1/projects/{projectId} - Delete project.
+        """Test DELETE /api/v1/projects/{projectId} - Queue project deletion.
 
         Phase 16 Batch 6e (2026-04-29) downstream drift fix: Phase 7 / T320
         requires ``visibility`` + ``license`` at creation; bringing the
         request body in line with the contract so the delete path can
-        actually reach the DELETE assertion.
+        actually reach the DELETE assertion. The deletion itself runs in a
+        background job whose Celery dispatch is stubbed here.
         """
+        from unittest.mock import MagicMock
+
+        from echoroo.workers import deletion_tasks
+
+        dispatch = MagicMock()
+        monkeypatch.setattr(deletion_tasks.run_deletion_job, "delay", dispatch)
+
         # Create a project to delete
         create_response = await client.post(
             "/api/v1/projects",
@@ -357,14 +366,19 @@ class TestProjectEndpoints:
             headers=auth_headers,
         )
 
-        assert response.status_code == 204
+        assert response.status_code == 202
+        job = response.json()
+        assert job["entity_type"] == "project"
+        assert job["entity_id"] == project_id
+        dispatch.assert_called_once_with(job["id"])
 
-        # Verify project is deleted
+        # The project stays visible as ``deleting`` until the job removes it
         get_response = await client.get(
             f"/api/v1/projects/{project_id}",
             headers=auth_headers,
         )
-        assert get_response.status_code == 404
+        assert get_response.status_code == 200
+        assert get_response.json()["status"] == "deleting"
 
     async def test_delete_project_not_owner(
         self,
@@ -5,13 +5,14 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from echoroo.core.settings import get_settings
-from echoroo.models.enums import ProjectVisibility
+from echoroo.models.enums import ProjectStatus, ProjectVisibility
 from echoroo.models.project import Project, ProjectMember, ProjectMemberRole
 from echoroo.models.user import User
 from echoroo.services.project import DEFAULT_RESTRICTED_CONFIG
@@ -140,7 +141,12 @@ async def test_project_create_update_delete_bff_contract(
     db_session: AsyncSession,
     test_user: User,
     member_user: User,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    from echoroo.workers import deletion_tasks
+
+    dispatch = MagicMock()
+    monkeypatch.setattr(deletion_tasks.run_deletion_job, "delay", dispatch)
     owner_headers = await _bff_session_headers(client, db_session, test_user)
     create_body = {
         "name": f"A2 Project {uuid.uuid4()}",
@@ -206,10 +212,14 @@ async def test_project_create_update_delete_bff_contract(
         f"/web-api/v1/projects/{created_project_id}",
         headers=owner_headers,
     )
-    assert delete.status_code == 204, delete.text
+    assert delete.status_code == 202, delete.text
+    job = delete.json()
+    assert job["entity_type"] == "project"
+    dispatch.assert_called_once_with(job["id"])
     db_session.expire_all()
-    deleted_project = await db_session.get(Project, created_project_uuid)
-    assert deleted_project is None
+    deleting_project = await db_session.get(Project, created_project_uuid)
+    assert deleting_project is not None
+    assert deleting_project.status == ProjectStatus.DELETING
     delete_audit = await assert_audit_actor_kind_session(
         db_session,
         {"action": "project.delete"},
@@ -217,6 +227,7 @@ async def test_project_create_update_delete_bff_contract(
     )
     assert delete_audit["detail"]["project_id"] == created_project_id
     assert delete_audit["detail"]["delete_mode"] == "hard_delete"
+    assert delete_audit["detail"]["deletion_job_id"] == job["id"]
     assert delete_audit["before"]["name"] == "A2 Renamed Project"
     assert delete_audit["after"] is None
 
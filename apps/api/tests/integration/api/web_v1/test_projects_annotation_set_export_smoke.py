@@ -278,9 +278,12 @@ async def test_export_annotation_set_dataset_200(
     )
 
     # write_dataset_zip must produce an actual (empty) ZIP file on disk.
+    write_kwargs: dict[str, object] = {}
+
     def fake_write_zip(
-        plan: object, audio_service: object, out_path: str  # noqa: ARG001
+        plan: object, audio_service: object, out_path: str, **kwargs: object  # noqa: ARG001
     ) -> None:
+        write_kwargs.update(kwargs)
         with zipfile.ZipFile(out_path, "w") as zf:
             zf.writestr("annotations.csv", "deploymentID\r\n")
             zf.writestr("segments.csv", "segment_id\r\n")
@@ -297,10 +300,12 @@ async def test_export_annotation_set_dataset_200(
     ) as client:
         response = await client.get(
             f"/web-api/v1/projects/{project_id}/annotation-sets/{set_id}"
-            "/export/dataset"
+            "/export/dataset",
+            params={"clip_format": "flac"},
         )
 
     assert response.status_code == 200, response.text
+    assert write_kwargs == {"clip_format": "flac"}
     assert response.headers["content-type"] == "application/zip"
     cd = response.headers["content-disposition"]
     assert "attachment" in cd
@@ -503,7 +508,7 @@ async def test_export_annotation_set_dataset_zip_build_failure(
     captured_paths: list[str] = []
 
     def _failing_write(
-        plan: object, audio_service: object, out_path: str  # noqa: ARG001
+        plan: object, audio_service: object, out_path: str, **kwargs: object  # noqa: ARG001
     ) -> None:
         captured_paths.append(out_path)
         raise RuntimeError("Simulated build failure")
@@ -12,7 +12,8 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from types import SimpleNamespace
-from typing import Any
+from typing import Any, ClassVar
+from unittest.mock import AsyncMock
 from uuid import UUID, uuid4
 
 import pytest
@@ -33,6 +34,7 @@ from echoroo.schemas.clip import (
     ClipDetailResponse,
     ClipGenerateResponse,
 )
+from echoroo.workers import clip_tasks
 from tests.integration.api.web_v1._helpers import assert_api_key_cross_rejected
 
 
@@ -225,6 +227,101 @@ async def test_clip_generate_bff_delegates_to_legacy(
     assert gate_captured["action"] is CLIP_GENERATE_ACTION
 
 
+def _fake_generation_job(**values: Any) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        status="queued",
+        recordings_processed=0,
+        clips_created=0,
+        started_at=datetime(2026, 10, 19, tzinfo=UTC),
+        finished_at=None,
+        error_detail=None,
+        **values,
+    )
+
+
+class _FakeJobRepository:
+    jobs: ClassVar[dict[UUID, SimpleNamespace]] = {}
+
+    def __init__(self, db: object) -> None:
+        self.db = db
+
+    async def create(self, **values: Any) -> SimpleNamespace:
+        job = _fake_generation_job(**values)
+        self.jobs[job.id] = job
+        return job
+
+    async def get_for_dataset(
+        self, project_id: UUID, dataset_id: UUID, job_id: UUID
+    ) -> SimpleNamespace | None:
+        job = self.jobs.get(job_id)
+        if job is None or (job.project_id, job.dataset_id) != (project_id, dataset_id):
+            return None
+        return job
+
+
+@pytest.mark.asyncio
+async def test_dataset_clip_generation_job_is_queued_and_polled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project_id = uuid4()
+    dataset_id = uuid4()
+    user = SimpleNamespace(id=uuid4())
+    gate_captured: dict[str, object] = {}
+    dispatched: list[str] = []
+    datasets: dict[tuple[UUID, UUID], object] = {(dataset_id, project_id): object()}
+
+    class _FakeDatasetRepository:
+        def __init__(self, db: object) -> None:
+            self.db = db
+
+        async def get_by_id_in_project(self, dataset_id: UUID, project_id: UUID) -> object:
+            return datasets.get((dataset_id, project_id))
+
+    _FakeJobRepository.jobs = {}
+    monkeypatch.setattr(bff_clips, "DatasetRepository", _FakeDatasetRepository)
+    monkeypatch.setattr(bff_clips, "ClipGenerationJobRepository", _FakeJobRepository)
+    monkeypatch.setattr(bff_clips, "gate_action", _make_capturing_gate_action(gate_captured))
+    monkeypatch.setattr(
+        clip_tasks.run_clip_generation, "delay", lambda job_id: dispatched.append(job_id)
+    )
+
+    async def _db_with_commit() -> AsyncIterator[object]:
+        yield SimpleNamespace(commit=AsyncMock())
+
+    app = _build_app(user=user, service=object())
+    app.dependency_overrides[get_db] = _db_with_commit
+    root = f"/web-api/v1/projects/{project_id}/datasets"
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        created = await client.post(
+            f"{root}/{dataset_id}/clips/generate",
+            json={"clip_length": 3.0, "overlap": 0.5},
+        )
+        job_id = created.json()["id"]
+        polled = await client.get(f"{root}/{dataset_id}/clips/generate/{job_id}")
+        bad_overlap = await client.post(
+            f"{root}/{dataset_id}/clips/generate", json={"clip_length": 0.5, "overlap": 0.5}
+        )
+        other_dataset = await client.post(
+            f"{root}/{uuid4()}/clips/generate", json={"clip_length": 3.0}
+        )
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid4())
+        other_user = await client.get(f"{root}/{dataset_id}/clips/generate/{job_id}")
+
+    assert created.status_code == 202, created.text
+    assert created.json()["status"] == "queued"
+    assert (created.json()["clip_length"], created.json()["overlap"]) == (3.0, 0.5)
+    assert dispatched == [job_id]
+    assert polled.status_code == 200
+    assert polled.json()["dataset_id"] == str(dataset_id)
+    assert bad_overlap.status_code == 400
+    assert other_dataset.status_code == 404
+    assert other_user.status_code == 404
+    assert gate_captured["action"] is CLIP_GENERATE_ACTION
+
+
 def test_clip_bff_paths_declared_in_openapi() -> None:
     app = _build_app(user=SimpleNamespace(id=uuid4()), service=object())
     paths = app.openapi()["paths"]
@@ -237,6 +334,10 @@ def test_clip_bff_paths_declared_in_openapi() -> None:
     assert "patch" in paths[clip_item]
     assert "delete" in paths[clip_item]
 
+    dataset_generate = "/web-api/v1/projects/{project_id}/datasets/{dataset_id}/clips/generate"
+    assert "post" in paths[dataset_generate]
+    assert "get" in paths[f"{dataset_generate}/{{job_id}}"]
+
 
 @pytest.mark.asyncio
 async def test_clip_bff_paths_reject_api_key_bearer(
@@ -258,6 +359,12 @@ async def test_clip_bff_paths_reject_api_key_bearer(
         f"/web-api/v1/projects/{project_id}/recordings/{recording_id}/clips/generate",
         body={"clip_length": 2.0},
     )
+    await assert_api_key_cross_rejected(
+        client,
+        "POST",
+        f"/web-api/v1/projects/{project_id}/datasets/{uuid4()}/clips/generate",
+        body={"clip_length": 2.0},
+    )
     await assert_api_key_cross_rejected(
         client,
         "PATCH",
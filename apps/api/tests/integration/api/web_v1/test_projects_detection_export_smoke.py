@@ -2,7 +2,8 @@
 
 PR 4 moves the two ``/api/v1/projects/{pid}/detections/export/...``
 streaming endpoints (CSV row-by-row, ZIP archive) to the cookie + CSRF
-BFF surface. Tests assert:
+BFF surface; the background ML-dataset export job routes live there too.
+Tests assert:
 
 * delegation: legacy handler is called with the right kwargs
   (including the optional filter Query args).
@@ -19,6 +20,7 @@ BFF surface. Tests assert:
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from types import SimpleNamespace
 from typing import Any
 from uuid import UUID, uuid4
@@ -165,6 +167,149 @@ async def test_export_ml_dataset_bff_delegates_to_legacy(
     assert gate_captured["action"] is DETECTION_EXPORT_ML_DATASET_ACTION
 
 
+# ---------------------------------------------------------------------------
+# ML-dataset export jobs
+# ---------------------------------------------------------------------------
+
+
+class _CommitDb:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def _export_job(**overrides: object) -> SimpleNamespace:
+    values: dict[str, object] = {
+        "id": uuid4(),
+        "project_id": uuid4(),
+        "dataset_id": None,
+        "detection_run_id": None,
+        "requested_by_user_id": None,
+        "status": "queued",
+        "entries_written": 0,
+        "object_key": None,
+        "size_bytes": None,
+        "started_at": datetime.now(UTC),
+        "finished_at": None,
+        "error_detail": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class _FakeJobRepository:
+    jobs: dict[UUID, SimpleNamespace] = {}
+
+    def __init__(self, db: object) -> None:
+        self.db = db
+
+    async def create(self, **kwargs: Any) -> SimpleNamespace:
+        job = _export_job(**kwargs)
+        self.jobs[job.id] = job  # type: ignore[index]
+        return job
+
+    async def get_for_project(self, project_id: UUID, job_id: UUID) -> SimpleNamespace | None:
+        job = self.jobs.get(job_id)
+        return job if job is not None and job.project_id == project_id else None
+
+
+@pytest.mark.asyncio
+async def test_ml_dataset_export_job_is_queued_after_commit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from echoroo.workers import detection_export_tasks
+
+    project_id = uuid4()
+    dataset_id = uuid4()
+    user = SimpleNamespace(id=uuid4())
+    db = _CommitDb()
+    gate_captured: dict[str, object] = {}
+    dispatched: list[tuple[str, int]] = []
+
+    monkeypatch.setattr(_FakeJobRepository, "jobs", {})
+    monkeypatch.setattr(bff_detection_export, "MlDatasetExportJobRepository", _FakeJobRepository)
+    monkeypatch.setattr(
+        bff_detection_export, "gate_action", _make_capturing_gate_action(gate_captured)
+    )
+    monkeypatch.setattr(
+        detection_export_tasks.run_ml_dataset_export,
+        "delay",
+        lambda job_id: dispatched.append((job_id, db.commits)),
+    )
+
+    app = _build_app(user=user)
+
+    async def _db() -> AsyncIterator[object]:
+        yield db
+
+    app.dependency_overrides[get_db] = _db
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        response = await client.post(
+            f"/web-api/v1/projects/{project_id}/detections/export/ml-dataset/jobs"
+            f"?dataset_id={dataset_id}"
+        )
+
+    assert response.status_code == 202, response.text
+    body = response.json()
+    assert body["status"] == "queued"
+    assert body["dataset_id"] == str(dataset_id)
+    assert body["download_url"] is None
+    # The task is dispatched only once the job row is committed.
+    assert dispatched == [(body["id"], 1)]
+    job = _FakeJobRepository.jobs[UUID(body["id"])]
+    assert job.requested_by_user_id == user.id
+    assert gate_captured["action"] is DETECTION_EXPORT_ML_DATASET_ACTION
+
+
+@pytest.mark.asyncio
+async def test_ml_dataset_export_job_returns_download_url_to_requester_only(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project_id = uuid4()
+    user = SimpleNamespace(id=uuid4())
+    done = _export_job(
+        project_id=project_id,
+        requested_by_user_id=user.id,
+        status="success",
+        entries_written=12,
+        object_key=f"exports/{project_id}/ml-dataset/x.zip",
+        size_bytes=2048,
+    )
+    foreign = _export_job(project_id=project_id, requested_by_user_id=uuid4())
+    signed: list[tuple[str, object]] = []
+
+    monkeypatch.setattr(_FakeJobRepository, "jobs", {done.id: done, foreign.id: foreign})
+    monkeypatch.setattr(bff_detection_export, "MlDatasetExportJobRepository", _FakeJobRepository)
+    monkeypatch.setattr(bff_detection_export, "gate_action", _make_capturing_gate_action({}))
+    monkeypatch.setattr(
+        bff_detection_export,
+        "generate_presigned_download_url",
+        lambda key, filename=None: signed.append((key, filename)) or "https://s3/signed",
+    )
+
+    app = _build_app(user=user)
+    base = f"/web-api/v1/projects/{project_id}/detections/export/ml-dataset/jobs"
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        ok = await client.get(f"{base}/{done.id}")
+        hidden = await client.get(f"{base}/{foreign.id}")
+        other_project = await client.get(
+            f"/web-api/v1/projects/{uuid4()}/detections/export/ml-dataset/jobs/{done.id}"
+        )
+
+    assert ok.status_code == 200, ok.text
+    assert ok.json()["download_url"] == "https://s3/signed"
+    assert ok.json()["entries_written"] == 12
+    assert signed == [(done.object_key, "ml-dataset.zip")]
+    assert hidden.status_code == 404
+    assert other_project.status_code == 404
+
+
 # ---------------------------------------------------------------------------
 # OpenAPI declaration
 # ---------------------------------------------------------------------------
@@ -179,6 +324,12 @@ def test_detection_export_bff_paths_declared_in_openapi() -> None:
     assert "get" in paths[
         "/web-api/v1/projects/{project_id}/detections/export/ml-dataset"
     ]
+    assert "post" in paths[
+        "/web-api/v1/projects/{project_id}/detections/export/ml-dataset/jobs"
+    ]
+    assert "get" in paths[
+        "/web-api/v1/projects/{project_id}/detections/export/ml-dataset/jobs/{job_id}"
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -201,3 +352,13 @@ async def test_detection_export_bff_paths_reject_api_key_bearer(
         "GET",
         f"/web-api/v1/projects/{project_id}/detections/export/ml-dataset",
     )
+    await assert_api_key_cross_rejected(
+        client,
+        "POST",
+        f"/web-api/v1/projects/{project_id}/detections/export/ml-dataset/jobs",
+    )
+    await assert_api_key_cross_rejected(
+        client,
+        "GET",
+        f"/web-api/v1/projects/{project_id}/detections/export/ml-dataset/jobs/{uuid4()}",
+    )
@@ -731,8 +731,21 @@ async def test_dataset_delete_bff_delegates_to_legacy(
     service = object()
     captured: dict[str, object] = {}
 
-    async def fake_delete_dataset(**kwargs: object) -> None:
+    async def fake_delete_dataset(**kwargs: object) -> dict[str, object]:
         captured.update(kwargs)
+        return {
+            "id": str(uuid4()),
+            "entity_type": "dataset",
+            "entity_id": str(dataset_id),
+            "project_id": str(project_id),
+            "status": "queued",
+            "stage": None,
+            "rows_deleted": 0,
+            "objects_deleted": 0,
+            "started_at": "2026-10-18T00:00:00Z",
+            "finished_at": None,
+            "error_detail": None,
+        }
 
     monkeypatch.setattr(legacy_datasets, "delete_dataset", fake_delete_dataset)
     monkeypatch.setattr(bff_datasets, "gate_action", _noop_gate_action)
@@ -751,7 +764,8 @@ async def test_dataset_delete_bff_delegates_to_legacy(
             f"/web-api/v1/projects/{project_id}/datasets/{dataset_id}",
         )
 
-    assert response.status_code == 204, response.text
+    assert response.status_code == 202, response.text
+    assert response.json()["status"] == "queued"
     assert captured["project_id"] == project_id
     assert captured["dataset_id"] == dataset_id
 
@@ -0,0 +1,148 @@
+"""Real-DB tests for :meth:`ClipRepository.insert_windows`.
+
+The unit tests in ``tests/unit/repositories/test_clip_insert_windows.py``
+only check the statements issued. These run them against PostgreSQL:
+
+* the windows are ``COPY``-ed through asyncpg into the staging table and a
+  second call in the same transaction reuses it;
+* the NOT EXISTS anti-join skips existing clips, including clips whose
+  boundaries were built by repeated addition and differ from the planned
+  ``start + k * step`` boundary by a few ULPs;
+* ``ON CONFLICT ON CONSTRAINT uq_clip_recording_time`` absorbs a window
+  that appears twice in one batch.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from echoroo.models.clip import Clip
+from echoroo.models.dataset import Dataset
+from echoroo.models.enums import DatasetStatus, DatasetVisibility, ProjectVisibility
+from echoroo.models.project import Project
+from echoroo.models.recording import Recording
+from echoroo.models.site import Site
+from echoroo.models.user import User
+from echoroo.repositories.clip import ClipRepository
+from echoroo.services.clip import plan_clip_windows
+
+pytestmark = pytest.mark.asyncio
+
+_DURATION = 6.0
+_STEP = 0.1
+
+
+@pytest_asyncio.fixture
+async def recording(db_session: AsyncSession) -> Recording:
+    owner = User(
+        email="clip_windows_owner@example.com",
+        password_hash="$argon2id$v=19$m=65536,t=3,p=4$test",
+        display_name="clip_windows_owner",
+        security_stamp="s" * 64,
+    )
+    db_session.add(owner)
+    await db_session.commit()
+    project = Project(
+        name="Clip Windows",
+        description="insert_windows real-DB test",
+        visibility=ProjectVisibility.PUBLIC,
+        license_id="cc-by",
+        owner_id=owner.id,
+    )
+    db_session.add(project)
+    await db_session.commit()
+    site = Site(project_id=project.id, name="Clip Site", h3_index_member="8928308280fffff")
+    db_session.add(site)
+    await db_session.commit()
+    dataset = Dataset(
+        project_id=project.id,
+        site_id=site.id,
+        created_by_id=owner.id,
+        name="Clip Dataset",
+        visibility=DatasetVisibility.PRIVATE,
+        status=DatasetStatus.COMPLETED,
+    )
+    db_session.add(dataset)
+    await db_session.commit()
+    recording = Recording(
+        dataset_id=dataset.id,
+        filename="a.wav",
+        path=f"recordings/{project.id}/{dataset.id}/a.wav",
+        duration=_DURATION,
+        samplerate=48000,
+        channels=1,
+    )
+    db_session.add(recording)
+    await db_session.commit()
+    return recording
+
+
+def _planned(recording: Recording) -> list[tuple[object, float, float]]:
+    _index, starts, ends = plan_clip_windows(np.array([recording.duration]), _STEP)
+    return [
+        (recording.id, start, end)
+        for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+    ]
+
+
+async def _clip_count(db: AsyncSession, recording: Recording) -> int:
+    result = await db.execute(
+        select(func.count()).select_from(Clip).where(Clip.recording_id == recording.id)
+    )
+    return result.scalar_one()
+
+
+async def test_insert_windows_copies_new_windows_once(
+    db_session: AsyncSession, recording: Recording
+) -> None:
+    windows = _planned(recording)
+    repo = ClipRepository(db_session)
+
+    assert await repo.insert_windows(windows[:10]) == 10
+    # Same transaction: the staging table is truncated and reused.
+    assert await repo.insert_windows(windows[:20]) == 10
+    await db_session.commit()
+    # New transaction: the ON COMMIT DROP table is recreated.
+    assert await repo.insert_windows(windows) == len(windows) - 20
+    await db_session.commit()
+
+    assert await _clip_count(db_session, recording) == len(windows)
+
+
+async def test_rerun_skips_clips_built_by_repeated_addition(
+    db_session: AsyncSession, recording: Recording
+) -> None:
+    windows = _planned(recording)
+    legacy_start = 0.0
+    drifted = 0
+    for _recording_id, start, _end in windows[:40]:
+        db_session.add(
+            Clip(recording_id=recording.id, start_time=legacy_start, end_time=legacy_start + _STEP)
+        )
+        drifted += legacy_start != start
+        legacy_start += _STEP
+    await db_session.commit()
+    # The seed must actually exercise the tolerance.
+    assert drifted > 0
+
+    created = await ClipRepository(db_session).insert_windows(windows)
+    await db_session.commit()
+
+    assert created == len(windows) - 40
+    assert await _clip_count(db_session, recording) == len(windows)
+
+
+async def test_window_repeated_within_a_batch_is_absorbed_by_on_conflict(
+    db_session: AsyncSession, recording: Recording
+) -> None:
+    window = _planned(recording)[0]
+
+    created = await ClipRepository(db_session).insert_windows([window, window])
+    await db_session.commit()
+
+    assert created == 1
+    assert await _clip_count(db_session, recording) == 1
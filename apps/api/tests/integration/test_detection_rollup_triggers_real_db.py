@@ -0,0 +1,291 @@
+"""Real-DB tests for the detection summary rollup triggers (Alembic 0035).
+
+``detection_species_rollups`` / ``detection_temporal_rollups`` are maintained
+by the PostgreSQL functions and triggers in
+:data:`echoroo.models.detection_rollup.DETECTION_ROLLUP_DDL` (installed on
+the test database by the ``tests/conftest.py`` heal). These tests write
+``recording_annotations`` / ``recordings`` / ``datasets`` rows the way the
+application does and assert the rollup rows directly, with NO monkeypatch:
+
+  (a) INSERT — a multi-row insert adds one species row per key and buckets
+      tagged annotations by the recording's local date / hour; untagged
+      annotations are counted per species key but not per hour.
+  (b) UPDATE — a status change moves the count between species keys and
+      leaves the hourly bucket alone.
+  (c) DELETE — deleting annotations decrements and removes empty keys.
+  (d) RECORDING / DATASET CHANGES — moving a recording's datetime, changing
+      the dataset timezone and deleting the recording re-bucket or release
+      its annotations.
+
+Every step also checks that the incrementally maintained rows equal a full
+``detection_rollups_refresh`` rebuild of the dataset.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from echoroo.models.dataset import Dataset
+from echoroo.models.detection_rollup import DetectionSpeciesRollup, DetectionTemporalRollup
+from echoroo.models.detection_run import DetectionRun
+from echoroo.models.enums import (
+    DatasetStatus,
+    DatasetVisibility,
+    DetectionRunStatus,
+    DetectionSource,
+    DetectionStatus,
+    ProjectVisibility,
+    TagCategory,
+)
+from echoroo.models.project import Project
+from echoroo.models.recording import Recording
+from echoroo.models.recording_annotation import RecordingAnnotation
+from echoroo.models.site import Site
+from echoroo.models.tag import Tag
+from echoroo.models.user import User
+
+pytestmark = pytest.mark.asyncio
+
+# 21:30 UTC is 06:30 the next day in Tokyo.
+_RECORDED_AT = datetime(2026, 5, 1, 21, 30, tzinfo=UTC)
+
+
+# ---------------------------------------------------------------------------
+# Seeding helpers
+# ---------------------------------------------------------------------------
+
+
+async def _seed(db: AsyncSession) -> dict[str, Any]:
+    owner = User(
+        email="rollup_trigger_owner@example.com",
+        password_hash="$argon2id$v=19$m=65536,t=3,p=4$test",
+        display_name="rollup_trigger_owner",
+        security_stamp="s" * 64,
+    )
+    db.add(owner)
+    await db.commit()
+
+    project = Project(
+        name="Rollup Trigger Project",
+        description="detection rollup trigger real-DB test",
+        visibility=ProjectVisibility.PUBLIC,
+        license_id="cc-by",
+        owner_id=owner.id,
+    )
+    db.add(project)
+    await db.commit()
+
+    site = Site(project_id=project.id, name="Rollup Site", h3_index_member="8928308280fffff")
+    db.add(site)
+    await db.commit()
+
+    dataset = Dataset(
+        project_id=project.id,
+        site_id=site.id,
+        created_by_id=owner.id,
+        name="Rollup Dataset",
+        visibility=DatasetVisibility.PRIVATE,
+        status=DatasetStatus.COMPLETED,
+        datetime_timezone="Asia/Tokyo",
+    )
+    db.add(dataset)
+    await db.commit()
+
+    recording = Recording(
+        dataset_id=dataset.id,
+        filename="rollup.wav",
+        path=f"recordings/{project.id}/{dataset.id}/rollup.wav",
+        duration=60.0,
+        samplerate=48000,
+        channels=1,
+        datetime=_RECORDED_AT,
+    )
+    tag = Tag(project_id=project.id, name="Rollup Species", category=TagCategory.SPECIES)
+    run = DetectionRun(
+        project_id=project.id,
+        model_name="rollup_model",
+        model_version="1",
+        status=DetectionRunStatus.COMPLETED,
+    )
+    db.add_all([recording, tag, run])
+    await db.commit()
+    return {
+        "dataset_id": dataset.id,
+        "recording_id": recording.id,
+        "tag_id": tag.id,
+        "run_id": run.id,
+    }
+
+
+async def _insert_annotations(db: AsyncSession, seed: dict[str, Any]) -> list[UUID]:
+    rows = [
+        {
+            "id": uuid4(),
+            "recording_id": seed["recording_id"],
+            "tag_id": tag_id,
+            "detection_run_id": seed["run_id"],
+            "source": DetectionSource.BIRDNET,
+            "status": DetectionStatus.UNREVIEWED,
+            "confidence": confidence,
+            "start_time": start,
+            "end_time": start + 3.0,
+        }
+        for tag_id, confidence, start in (
+            (seed["tag_id"], 0.9, 0.0),
+            (seed["tag_id"], 0.5, 3.0),
+            (None, None, 6.0),
+        )
+    ]
+    # One statement, like the bulk inference writers.
+    await db.execute(pg_insert(RecordingAnnotation).values(rows))
+    await db.commit()
+    return [row["id"] for row in rows]
+
+
+async def _species(db: AsyncSession, dataset_id: UUID) -> dict[tuple[Any, ...], tuple[Any, ...]]:
+    rows = (
+        await db.execute(
+            select(DetectionSpeciesRollup).where(DetectionSpeciesRollup.dataset_id == dataset_id)
+        )
+    ).scalars()
+    return {
+        (r.detection_run_id, r.tag_id, r.source, r.status): (
+            r.detection_count,
+            round(r.confidence_sum, 6),
+            r.confidence_count,
+        )
+        for r in rows
+    }
+
+
+async def _temporal(db: AsyncSession, dataset_id: UUID) -> dict[tuple[Any, ...], int]:
+    rows = (
+        await db.execute(
+            select(DetectionTemporalRollup).where(DetectionTemporalRollup.dataset_id == dataset_id)
+        )
+    ).scalars()
+    return {(r.tag_id, r.local_date, r.local_hour): r.detection_count for r in rows}
+
+
+async def _snapshot(db: AsyncSession, dataset_id: UUID) -> tuple[Any, Any]:
+    db.expire_all()
+    return await _species(db, dataset_id), await _temporal(db, dataset_id)
+
+
+async def _assert_matches_refresh(db: AsyncSession, dataset_id: UUID) -> None:
+    """The incremental rows must equal a from-scratch rebuild."""
+    incremental = await _snapshot(db, dataset_id)
+    await db.execute(text("SELECT detection_rollups_refresh(:id)"), {"id": dataset_id})
+    rebuilt = await _snapshot(db, dataset_id)
+    await db.rollback()
+    assert incremental == rebuilt
+
+
+@pytest_asyncio.fixture
+async def seed(db_session: AsyncSession) -> dict[str, Any]:
+    return await _seed(db_session)
+
+
+# ---------------------------------------------------------------------------
+# (a) - (c) Annotation writes
+# ---------------------------------------------------------------------------
+
+
+async def test_insert_adds_species_and_local_hour_rows(
+    db_session: AsyncSession, seed: dict[str, Any]
+) -> None:
+    await _insert_annotations(db_session, seed)
+
+    species, temporal = await _snapshot(db_session, seed["dataset_id"])
+    run, tag = seed["run_id"], seed["tag_id"]
+    unreviewed = (DetectionSource.BIRDNET, DetectionStatus.UNREVIEWED)
+    assert species == {
+        (run, tag, *unreviewed): (2, 1.4, 2),
+        (run, None, *unreviewed): (1, 0.0, 0),
+    }
+    # Untagged annotations are not bucketed by hour.
+    assert temporal == {(tag, date(2026, 5, 2), 6): 2}
+    await _assert_matches_refresh(db_session, seed["dataset_id"])
+
+
+async def test_status_update_moves_count_between_species_keys(
+    db_session: AsyncSession, seed: dict[str, Any]
+) -> None:
+    ids = await _insert_annotations(db_session, seed)
+
+    await db_session.execute(
+        update(RecordingAnnotation)
+        .where(RecordingAnnotation.id == ids[0])
+        .values(status=DetectionStatus.CONFIRMED)
+    )
+    await db_session.commit()
+
+    species, temporal = await _snapshot(db_session, seed["dataset_id"])
+    run, tag = seed["run_id"], seed["tag_id"]
+    assert species[(run, tag, DetectionSource.BIRDNET, DetectionStatus.UNREVIEWED)] == (1, 0.5, 1)
+    assert species[(run, tag, DetectionSource.BIRDNET, DetectionStatus.CONFIRMED)] == (1, 0.9, 1)
+    assert temporal == {(tag, date(2026, 5, 2), 6): 2}
+    await _assert_matches_refresh(db_session, seed["dataset_id"])
+
+
+async def test_delete_decrements_and_drops_empty_keys(
+    db_session: AsyncSession, seed: dict[str, Any]
+) -> None:
+    ids = await _insert_annotations(db_session, seed)
+
+    await db_session.execute(delete(RecordingAnnotation).where(RecordingAnnotation.id.in_(ids[1:])))
+    await db_session.commit()
+
+    species, temporal = await _snapshot(db_session, seed["dataset_id"])
+    run, tag = seed["run_id"], seed["tag_id"]
+    assert species == {
+        (run, tag, DetectionSource.BIRDNET, DetectionStatus.UNREVIEWED): (1, 0.9, 1),
+    }
+    assert temporal == {(tag, date(2026, 5, 2), 6): 1}
+
+    await db_session.execute(delete(RecordingAnnotation).where(RecordingAnnotation.id == ids[0]))
+    await db_session.commit()
+
+    assert await _snapshot(db_session, seed["dataset_id"]) == ({}, {})
+
+
+# ---------------------------------------------------------------------------
+# (d) Recording / dataset changes
+# ---------------------------------------------------------------------------
+
+
+async def test_recording_and_dataset_changes_rebucket_and_release(
+    db_session: AsyncSession, seed: dict[str, Any]
+) -> None:
+    await _insert_annotations(db_session, seed)
+    tag = seed["tag_id"]
+
+    await db_session.execute(
+        update(Recording)
+        .where(Recording.id == seed["recording_id"])
+        .values(datetime=datetime(2026, 5, 1, 1, 15, tzinfo=UTC))
+    )
+    await db_session.commit()
+    _, temporal = await _snapshot(db_session, seed["dataset_id"])
+    assert temporal == {(tag, date(2026, 5, 1), 10): 2}
+
+    await db_session.execute(
+        update(Dataset).where(Dataset.id == seed["dataset_id"]).values(datetime_timezone=None)
+    )
+    await db_session.commit()
+    _, temporal = await _snapshot(db_session, seed["dataset_id"])
+    assert temporal == {(tag, date(2026, 5, 1), 1): 2}
+    await _assert_matches_refresh(db_session, seed["dataset_id"])
+
+    await db_session.execute(delete(Recording).where(Recording.id == seed["recording_id"]))
+    await db_session.commit()
+
+    assert await _snapshot(db_session, seed["dataset_id"]) == ({}, {})
@@ -268,11 +268,11 @@ class TestRoleBasedAccessControlFlow:
             f"/api/v1/projects/{project_id}",
             headers=owner_headers,
         )
-        assert owner_delete_response.status_code == 204
+        assert owner_delete_response.status_code == 202
 
-        # Verify: Project is deleted
+        # Verify: Project is queued for background deletion
         verify_delete = await client.get(
             f"/api/v1/projects/{project_id}",
             headers=owner_headers,
         )
-        assert verify_delete.status_code == 404
+        assert verify_delete.json()["status"] == "deleting"
@@ -219,23 +219,14 @@ class TestProjectLifecycle:
             f"/api/v1/projects/{project_id}",
             headers=auth_headers,
         )
-        assert delete_response.status_code == 204
+        assert delete_response.status_code == 202
 
-        # 9. Verify project is gone
+        # 9. Verify project is queued for background deletion
         get_deleted_response = await client.get(
             f"/api/v1/projects/{project_id}",
             headers=auth_headers,
         )
-        assert get_deleted_response.status_code == 404
-
-        # Verify it's not in the list
-        final_list_response = await client.get(
-            "/api/v1/projects",
-            headers=auth_headers,
-        )
-        final_projects = final_list_response.json()
-        final_project_ids = [p["id"] for p in final_projects["items"]]
-        assert project_id not in final_project_ids
+        assert get_deleted_response.json()["status"] == "deleting"
 
     async def test_member_access_control(
         self,
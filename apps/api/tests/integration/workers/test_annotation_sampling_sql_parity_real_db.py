@@ -0,0 +1,88 @@
+"""Real-DB parity tests for the annotation-sampling SQL expressions.
+
+The sampling task counts candidate slots and applies the time-of-day filter
+in SQL (:func:`_slot_count_sql`, :func:`_local_time_sql`,
+:func:`_time_in_range_sql`), then resolves the sampled indices in Python with
+:func:`_slot_count` / :func:`_slot_bounds`. If the two sides disagree the
+locator hands out slots past the end of a recording or skips valid ones, so
+these tests evaluate the SQL on PostgreSQL over a grid of inputs and compare
+it with the Python twins — including a non-default ``_SLOT_STEP_MULTIPLIER``.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from datetime import time as dt_time
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import DateTime, Float, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from echoroo.workers import annotation_sampling_tasks as tasks
+
+pytestmark = pytest.mark.asyncio
+
+_DURATIONS = [0.0, 2.9999995, 3.0, 5.9999999, 6.0, 7.5, 89.9999999, 90.0, 90.2, 3600.0]
+
+
+@pytest.mark.parametrize("multiplier", [1.0, 0.5])
+@pytest.mark.parametrize(
+    ("segment_mode", "segment_length"),
+    [("fixed", 3.0), ("fixed", 30.0), ("fixed", 0.7), ("whole_recording", None)],
+)
+async def test_slot_count_sql_matches_python(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    multiplier: float,
+    segment_mode: str,
+    segment_length: float | None,
+) -> None:
+    monkeypatch.setattr(tasks, "_SLOT_STEP_MULTIPLIER", multiplier)
+
+    for duration in _DURATIONS:
+        expression = tasks._slot_count_sql(
+            literal(duration, Float),
+            segment_mode=segment_mode,
+            segment_length=segment_length,
+        )
+        in_sql = (await db_session.execute(select(expression))).scalar_one()
+        in_python = tasks._slot_count(
+            duration, segment_mode=segment_mode, segment_length=segment_length
+        )
+        assert in_sql == in_python, (duration, segment_length, multiplier)
+
+
+@pytest.mark.parametrize(
+    ("start", "end"),
+    [(dt_time(5, 0), dt_time(9, 0)), (dt_time(22, 0), dt_time(2, 0))],
+)
+@pytest.mark.parametrize("tz_name", ["UTC", "Asia/Tokyo", "America/Los_Angeles"])
+async def test_time_of_day_filter_sql_matches_python(
+    db_session: AsyncSession, start: dt_time, end: dt_time, tz_name: str
+) -> None:
+    tz = ZoneInfo(tz_name)
+    # Every half hour across a day that includes the US DST switch.
+    instants = [
+        datetime(2026, 3, 8, hour, minute, tzinfo=UTC)
+        for hour in range(24)
+        for minute in (0, 30)
+    ]
+
+    for instant in instants:
+        local_time = tasks._local_time_sql(literal(instant, DateTime(timezone=True)), tz)
+        row = (
+            await db_session.execute(
+                select(
+                    local_time.label("local_time"),
+                    tasks._time_in_range_sql(local_time, start, end).label("matched"),
+                )
+            )
+        ).one()
+        expected_local = instant.astimezone(tz).time()
+        assert row.local_time == expected_local, (instant, tz_name)
+        assert row.matched == tasks._time_in_range(expected_local, start, end), (
+            instant,
+            tz_name,
+        )
+
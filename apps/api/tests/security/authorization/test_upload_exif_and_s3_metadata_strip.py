@@ -477,14 +477,18 @@ def test_unknown_format_passthrough() -> None:
 def test_audit_log_export_routes_put_object_through_sanitizer(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """audit_log_export._upload_with_object_lock must use sanitize_put_object_kwargs."""
+    """audit_log_export._object_lock_writer must use sanitize_put_object_kwargs."""
     from echoroo.workers import audit_log_export
 
     captured_kwargs: dict[str, Any] = {}
 
     class _StubClient:
-        def put_object(self, **kwargs: Any) -> None:
+        def create_multipart_upload(self, **kwargs: Any) -> dict[str, Any]:
             captured_kwargs.update(kwargs)
+            return {"UploadId": "u1"}
+
+        def abort_multipart_upload(self, **kwargs: Any) -> None:
+            return None
 
     monkeypatch.setattr(audit_log_export, "get_s3_client", lambda: _StubClient())
 
@@ -502,13 +506,15 @@ def test_audit_log_export_routes_put_object_through_sanitizer(
     monkeypatch.setattr(sanitizer_mod, "sanitize_put_object_kwargs", _spy)
 
     now = datetime(2026, 5, 7, tzinfo=UTC)
-    audit_log_export._upload_with_object_lock(
-        bucket="b", key="audit-log/x.ndjson", body=b"{}", now=now,
+    writer = audit_log_export._object_lock_writer(
+        bucket="b", key="audit-log/x.ndjson", now=now,
     )
+    writer.abort()
 
     assert sanitizer_called, "sanitize_put_object_kwargs was not invoked"
     assert captured_kwargs["Bucket"] == "b"
     assert captured_kwargs["Key"] == "audit-log/x.ndjson"
+    assert captured_kwargs["ObjectLockMode"] == "GOVERNANCE"
     # Sanity: kwargs passed downstream do not carry GPS keys.
     assert "Metadata" not in captured_kwargs or all(
         not k.lower().startswith(("gps", "geo", "lat", "lon", "lng", "coord", "location"))
@@ -29,6 +29,7 @@ from __future__ import annotations
 
 import socket
 from collections.abc import Iterable
+from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
@@ -36,6 +37,9 @@ import pytest
 from fastapi import HTTPException
 
 from echoroo.api.v1 import xeno_canto as xc_module
+from echoroo.core import http_clients
+from echoroo.core.url_allowlist import PinnedIPAsyncTransport
+from echoroo.services.xeno_canto_cache import XenoCantoMediaCache
 
 # ---------------------------------------------------------------------------
 # DNS + httpx stubs
@@ -88,7 +92,13 @@ class _ScriptedClient:
     async def __aexit__(self, *_exc: object) -> None:
         return None
 
-    async def get(self, url: str, headers: dict[str, str] | None = None) -> _StubResponse:
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        follow_redirects: bool = True,
+    ) -> _StubResponse:
+        assert follow_redirects is False, "sonogram GETs must not auto-follow"
         self.calls.append(url)
         if not self._script:
             raise AssertionError(f"Unexpected GET to {url!r} — script exhausted")
@@ -112,6 +122,13 @@ def _patch_httpx(
     return client
 
 
+@pytest.fixture(autouse=True)
+def _no_media_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Disable the sonogram cache so every test exercises the upstream path."""
+    cache = XenoCantoMediaCache(tmp_path / "xc-cache", max_bytes=0)
+    monkeypatch.setattr(xc_module, "get_xeno_canto_media_cache", lambda: cache)
+
+
 # ---------------------------------------------------------------------------
 # Section 1: initial-URL guard (sanity coverage for the new helper)
 # ---------------------------------------------------------------------------
@@ -384,8 +401,8 @@ def test_validate_sonogram_url_returns_pinned_ip(
 async def test_proxy_sonogram_builds_pinned_transport_per_hop(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """The proxy MUST instantiate ``PinnedIPAsyncTransport`` for each request,
-    pinned to the IP returned by ``_validate_sonogram_url``.
+    """The proxy MUST connect through a ``PinnedIPAsyncTransport`` pinned to
+    the IP returned by ``_validate_sonogram_url``.
 
     This is what closes the DNS-rebinding TOCTOU window: between the post-
     validation check and the connect, ``httpx`` would otherwise call
@@ -406,10 +423,10 @@ async def test_proxy_sonogram_builds_pinned_transport_per_hop(
     )
 
     captured: list[dict[str, Any]] = []
-    real_init = xc_module.PinnedIPAsyncTransport.__init__
+    real_init = PinnedIPAsyncTransport.__init__
 
     def _spy_init(
-        self: xc_module.PinnedIPAsyncTransport,
+        self: PinnedIPAsyncTransport,
         *args: object,
         **kwargs: object,
     ) -> None:
@@ -417,7 +434,7 @@ async def test_proxy_sonogram_builds_pinned_transport_per_hop(
         real_init(self, *args, **kwargs)
 
     monkeypatch.setattr(
-        xc_module.PinnedIPAsyncTransport, "__init__", _spy_init
+        PinnedIPAsyncTransport, "__init__", _spy_init
     )
 
     await xc_module.proxy_sonogram(
@@ -440,7 +457,7 @@ async def test_proxy_sonogram_builds_pinned_transport_per_hop(
 async def test_proxy_sonogram_pins_fresh_ip_after_redirect(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """After a redirect the proxy MUST rebuild the pinned transport with a
+    """After a redirect the proxy MUST switch to a transport pinned to the
     freshly resolved IP — pinning a stale IP across hops would still allow
     a redirect into a private network if the authoritative DNS flipped
     between the original validation and the redirect target's resolution.
@@ -472,10 +489,10 @@ async def test_proxy_sonogram_pins_fresh_ip_after_redirect(
     )
 
     captured_pins: list[str] = []
-    real_init = xc_module.PinnedIPAsyncTransport.__init__
+    real_init = PinnedIPAsyncTransport.__init__
 
     def _spy_init(
-        self: xc_module.PinnedIPAsyncTransport,
+        self: PinnedIPAsyncTransport,
         *args: object,
         **kwargs: object,
     ) -> None:
@@ -483,7 +500,7 @@ async def test_proxy_sonogram_pins_fresh_ip_after_redirect(
         real_init(self, *args, **kwargs)
 
     monkeypatch.setattr(
-        xc_module.PinnedIPAsyncTransport, "__init__", _spy_init
+        PinnedIPAsyncTransport, "__init__", _spy_init
     )
 
     await xc_module.proxy_sonogram(
@@ -499,19 +516,64 @@ async def test_proxy_sonogram_pins_fresh_ip_after_redirect(
     )
 
 
+@pytest.mark.asyncio
+async def test_proxy_sonogram_reuses_pool_only_for_the_same_pin(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Pooled pinned clients are keyed by the validated ``(host, IP)``:
+    a repeat fetch to the same pin reuses the connection pool, while a
+    host that now resolves elsewhere gets a transport pinned to the new IP.
+    """
+    addresses = iter(["8.8.8.8", "8.8.8.8", "1.1.1.1"])
+
+    def _rotating_addr_info(
+        host: str, port: int | None = None
+    ) -> list[tuple[Any, ...]]:
+        return [(socket.AF_INET, socket.SOCK_STREAM, 0, "", (next(addresses), 0))]
+
+    monkeypatch.setattr(socket, "getaddrinfo", _rotating_addr_info)
+    _patch_httpx(
+        monkeypatch,
+        [
+            _StubResponse(200, content=b"PNG", headers={"content-type": "image/png"})
+            for _ in range(3)
+        ],
+    )
+
+    captured_pins: list[str] = []
+    real_init = PinnedIPAsyncTransport.__init__
+
+    def _spy_init(self: PinnedIPAsyncTransport, *args: object, **kwargs: object) -> None:
+        captured_pins.append(str(kwargs["pinned_ip"]))
+        real_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(PinnedIPAsyncTransport, "__init__", _spy_init)
+
+    for _ in range(3):
+        await xc_module.proxy_sonogram(
+            project_id=uuid4(),
+            url="https://xeno-canto.org/foo.png",
+        )
+
+    assert captured_pins == ["8.8.8.8", "1.1.1.1"]
+
+
 def test_sonogram_proxy_source_uses_pinned_transport() -> None:
-    """Static guard: production code MUST construct ``PinnedIPAsyncTransport``
-    so the actual TCP connect skips DNS resolution.
+    """Static guard: production code MUST connect through a client built on
+    ``PinnedIPAsyncTransport`` so the actual TCP connect skips DNS resolution.
     """
     import inspect
 
     src = inspect.getsource(xc_module.proxy_sonogram)
-    assert "PinnedIPAsyncTransport" in src, (
-        "proxy_sonogram must build a PinnedIPAsyncTransport per hop so the "
+    assert "get_pinned_http_client" in src, (
+        "proxy_sonogram must fetch through a client pinned per hop so the "
         "connect target is the validated public IP literal — without this "
         "httpx re-resolves the hostname at connect time and a DNS rebinding "
         "attacker can flip the answer between validation and connect."
     )
+    assert "PinnedIPAsyncTransport" in inspect.getsource(
+        http_clients.get_pinned_http_client
+    )
 
 
 __all__ = [
@@ -523,6 +585,7 @@ __all__ = [
     "test_proxy_sonogram_rejects_redirect_to_private_ip_host",
     "test_proxy_sonogram_rejects_redirect_when_dns_resolves_to_private",
     "test_proxy_sonogram_rejects_redirect_without_location_header",
+    "test_proxy_sonogram_reuses_pool_only_for_the_same_pin",
     "test_proxy_sonogram_uses_follow_redirects_false",
     "test_sonogram_proxy_source_disables_httpx_redirects",
     "test_sonogram_proxy_source_uses_pinned_transport",
@@ -657,7 +657,10 @@ async def test_csv_stream_generator_yields_header_then_sentinel_on_revoke(
     async def _fake_h3_map(*_a: Any, **_k: Any) -> dict[Any, Any]:
         return {}
 
-    monkeypatch.setattr(service, "_fetch_annotations_for_export", _fake_fetch)
+    async def _fake_stream(*_args: Any, **_kwargs: Any) -> AsyncGenerator[list[Any], None]:
+        yield await _fake_fetch()
+
+    monkeypatch.setattr(service, "_stream_annotations_for_export", _fake_stream)
     monkeypatch.setattr(service, "_load_project", _fake_load_project)
     monkeypatch.setattr(service, "_build_recording_h3_resolution_map", _fake_h3_map)
     # Force the guard to fire on row index 1.
@@ -711,7 +714,10 @@ async def test_csv_stream_generator_normal_path_has_no_sentinel(
     async def _fake_h3_map(*_a: Any, **_k: Any) -> dict[Any, Any]:
         return {}
 
-    monkeypatch.setattr(service, "_fetch_annotations_for_export", _fake_fetch)
+    async def _fake_stream(*_args: Any, **_kwargs: Any) -> AsyncGenerator[list[Any], None]:
+        yield await _fake_fetch()
+
+    monkeypatch.setattr(service, "_stream_annotations_for_export", _fake_stream)
     monkeypatch.setattr(service, "_load_project", _fake_load_project)
     monkeypatch.setattr(service, "_build_recording_h3_resolution_map", _fake_h3_map)
 
@@ -735,6 +741,77 @@ async def test_csv_stream_generator_normal_path_has_no_sentinel(
     assert b"observationID" in body
 
 
+@pytest.mark.asyncio
+async def test_csv_stream_generator_yields_header_before_cursor_and_one_chunk_per_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Rows are streamed batch by batch; the header never waits on the cursor."""
+    from echoroo.services import detection_export as export_module
+
+    service = export_module.DetectionExportService.__new__(  # type: ignore[call-arg]
+        export_module.DetectionExportService
+    )
+    service.db = AsyncMock()  # type: ignore[attr-defined]
+    rec_a, rec_b = uuid.uuid4(), uuid.uuid4()
+    events: list[str] = []
+    h3_lookups: list[set[Any]] = []
+
+    def _ann(recording_id: Any) -> Any:
+        return SimpleNamespace(
+            id=uuid.uuid4(),
+            recording=None,
+            recording_id=recording_id,
+            tag=None,
+            detection_run=None,
+            reviewed_by=None,
+            reviewed_at=None,
+            created_at=None,
+            source=None,
+            start_time=0.0,
+            end_time=1.0,
+            freq_low=None,
+            freq_high=None,
+            confidence=None,
+        )
+
+    async def _fake_stream(*_args: Any, **_kwargs: Any) -> AsyncGenerator[list[Any], None]:
+        events.append("cursor")
+        yield [_ann(rec_a), _ann(rec_a)]
+        yield [_ann(rec_a), _ann(rec_b)]
+
+    async def _fake_load_project(*_a: Any, **_k: Any) -> Any:
+        return None
+
+    async def _fake_h3_map(annotations: list[Any]) -> dict[Any, Any]:
+        h3_lookups.append({ann.recording_id for ann in annotations})
+        return {ann.recording_id: 9 for ann in annotations}
+
+    monkeypatch.setattr(service, "_stream_annotations_for_export", _fake_stream)
+    monkeypatch.setattr(service, "_load_project", _fake_load_project)
+    monkeypatch.setattr(service, "_build_recording_h3_resolution_map", _fake_h3_map)
+
+    class _Req:
+        state = type("S", (), {})()
+        client = type("C", (), {"host": ""})()
+        headers: dict[str, str] = {}
+
+    chunks: list[bytes] = []
+    async for chunk in service.export_csv_stream(
+        project_id=uuid.uuid4(),
+        action=DETECTION_EXPORT_CSV_ACTION,
+        current_user=None,
+        request=_Req(),  # type: ignore[arg-type]
+    ):
+        events.append("chunk")
+        chunks.append(chunk)
+
+    assert events == ["chunk", "cursor", "chunk", "chunk"]
+    assert chunks[0].startswith(b"observationID")
+    assert [chunk.count(b"\r\n") for chunk in chunks] == [1, 2, 2]
+    # rec_a carries over from the first batch, so only rec_b is looked up.
+    assert h3_lookups == [{rec_a}, {rec_b}]
+
+
 # ---------------------------------------------------------------------------
 # 6. Audio guard — must NEVER inject the sentinel into a binary stream
 # ---------------------------------------------------------------------------
@@ -1011,7 +1088,11 @@ async def test_export_csv_writes_project_license_column_from_license_record(
     async def _fake_h3_map(*_a: Any, **_k: Any) -> dict[Any, Any]:
         return {}
 
+    async def _fake_stream(*_args: Any, **_kwargs: Any) -> AsyncGenerator[list[Any], None]:
+        yield await _fake_fetch()
+
     monkeypatch.setattr(service, "_fetch_annotations_for_export", _fake_fetch)
+    monkeypatch.setattr(service, "_stream_annotations_for_export", _fake_stream)
     monkeypatch.setattr(service, "_load_project", _fake_load_project)
     monkeypatch.setattr(service, "_build_recording_h3_resolution_map", _fake_h3_map)
 
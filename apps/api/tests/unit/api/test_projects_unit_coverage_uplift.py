@@ -9,6 +9,7 @@ the 85% threshold without touching production code.
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -87,25 +88,46 @@ async def test_update_project_commits_and_returns(
 async def test_delete_project_commits(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """delete_project commits after the service call."""
+    """delete_project commits the queued job, then dispatches it."""
+    from echoroo.workers import deletion_tasks
+
+    project_id = uuid4()
+    job = SimpleNamespace(
+        id=uuid4(),
+        entity_type="project",
+        entity_id=project_id,
+        project_id=project_id,
+        status="queued",
+        stage=None,
+        rows_deleted=0,
+        objects_deleted=0,
+        started_at=datetime.now(UTC),
+        finished_at=None,
+        error_detail=None,
+    )
     service = MagicMock()
-    service.delete_project = AsyncMock()
+    service.delete_project = AsyncMock(return_value=job)
     db = MagicMock()
     db.commit = AsyncMock()
     monkeypatch.setattr(mod, "gate_action", AsyncMock())
+    dispatch = MagicMock()
+    monkeypatch.setattr(deletion_tasks.run_deletion_job, "delay", dispatch)
 
     current_user = MagicMock()
     current_user.id = uuid4()
     request = MagicMock()
 
-    await mod.delete_project(
-        project_id=uuid4(),
+    result = await mod.delete_project(
+        project_id=project_id,
         request=request,
         current_user=current_user,
         service=service,
         db=db,
     )
     db.commit.assert_awaited_once()
+    dispatch.assert_called_once_with(str(job.id))
+    assert result.id == job.id
+    assert result.status == "queued"
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,135 @@
+"""Unit tests for keyset paging in ``echoroo.api.v1.recordings.list_recordings``.
+
+The handler is called directly with the Stage-1 gate patched out, so these
+tests cover only the cursor plumbing: decoding against the effective sort,
+``next_cursor`` / ``total_is_estimate`` in the response, and 400 on a bad or
+forged cursor.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from echoroo.api.v1 import recordings as mod
+from echoroo.core.pagination import RowCount, decode_cursor, encode_cursor, keyset_after
+from echoroo.models.recording import Recording
+
+
+def _recording() -> MagicMock:
+    recording = MagicMock()
+    recording.id = uuid4()
+    recording.datetime = datetime(2026, 5, 1, 6, 30, tzinfo=UTC)
+    return recording
+
+
+@pytest.fixture
+def patched(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    monkeypatch.setattr(mod, "gate_action", AsyncMock(return_value=MagicMock()))
+    monkeypatch.setattr(
+        mod.RecordingResponse, "model_validate", MagicMock(side_effect=lambda r: r)
+    )
+    monkeypatch.setattr(mod, "apply_response_filter", MagicMock())
+    monkeypatch.setattr(mod, "RecordingListResponse", SimpleNamespace)
+    return MagicMock()
+
+
+def _request() -> MagicMock:
+    request = MagicMock()
+    request.state = SimpleNamespace()
+    return request
+
+
+@pytest.mark.asyncio
+async def test_full_page_returns_cursor_and_forwards_keyset(patched: MagicMock) -> None:
+    rows = [_recording(), _recording()]
+    patched.search_by_project = AsyncMock(
+        return_value=(rows, RowCount(40_000, is_estimate=True))
+    )
+    token = encode_cursor("datetime", True, datetime(2026, 6, 1, tzinfo=UTC), uuid4())
+
+    response = await mod.list_recordings(
+        project_id=uuid4(),
+        request=_request(),
+        current_user=MagicMock(),
+        service=patched,
+        db=MagicMock(),
+        page_size=2,
+        cursor=token,
+        total_mode="estimate",
+    )
+
+    kwargs = patched.search_by_project.await_args.kwargs
+    assert kwargs["cursor"] == decode_cursor(token, sort_key="datetime", descending=True)
+    assert kwargs["total_mode"] == "estimate"
+    assert response.total_is_estimate is True
+    assert response.next_cursor is not None
+    resumed = decode_cursor(response.next_cursor, sort_key="datetime", descending=True)
+    assert (resumed.value, resumed.id) == (rows[-1].datetime, rows[-1].id)
+
+
+@pytest.mark.asyncio
+async def test_exact_fallback_is_not_reported_as_estimate(patched: MagicMock) -> None:
+    patched.search_by_project = AsyncMock(return_value=([_recording()], RowCount(1)))
+
+    response = await mod.list_recordings(
+        project_id=uuid4(),
+        request=_request(),
+        current_user=MagicMock(),
+        service=patched,
+        db=MagicMock(),
+        total_mode="estimate",
+    )
+
+    assert response.total_is_estimate is False
+    assert response.next_cursor is None
+
+
+async def _call(service: MagicMock, token: str) -> object:
+    return await mod.list_recordings(
+        project_id=uuid4(),
+        request=_request(),
+        current_user=MagicMock(),
+        service=service,
+        db=MagicMock(),
+        cursor=token,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "token",
+    ["not-a-cursor", encode_cursor("filename", True, "a.wav", uuid4())],
+)
+async def test_malformed_or_mismatched_cursor_is_a_client_error(
+    patched: MagicMock, token: str
+) -> None:
+    patched.search_by_project = AsyncMock()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _call(patched, token)
+
+    assert exc_info.value.status_code == 400
+    patched.search_by_project.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_forged_cursor_value_is_a_client_error(patched: MagicMock) -> None:
+    async def _search(*_args: object, **kwargs: Any) -> object:
+        # What the repository does with the decoded cursor.
+        keyset_after(Recording.datetime, Recording.id, kwargs["cursor"])
+        raise AssertionError("forged cursor reached the database")
+
+    patched.search_by_project = AsyncMock(side_effect=_search)
+    token = encode_cursor("datetime", True, "yesterday", uuid4())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _call(patched, token)
+
+    assert exc_info.value.status_code == 400
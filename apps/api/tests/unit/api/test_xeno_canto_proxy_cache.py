@@ -0,0 +1,236 @@
+"""Xeno-canto proxy responses are served from the media / search caches.
+
+The audio and sonogram proxies are driven directly with the shared
+Xeno-canto client replaced by an ``httpx.MockTransport`` that records every
+upstream request, and the media cache pointed at ``tmp_path``. Search
+caching runs against an in-memory Redis stand-in.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import httpx
+import pytest
+from starlette.responses import Response
+
+from echoroo.api.v1 import xeno_canto as xc_module
+from echoroo.core import redis as redis_module
+from echoroo.core.http_clients import XENO_CANTO_AUDIO
+from echoroo.services.xeno_canto_cache import MediaCacheWriter, XenoCantoMediaCache
+
+_AUDIO = bytes(range(256)) * 64
+
+
+class _Upstream:
+    """Scripted Xeno-canto upstream recording the requests it receives."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.clients: list[str] = []
+        self.not_modified = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.not_modified:
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=_AUDIO,
+            headers={"ETag": '"v1"', "Content-Type": "audio/mpeg"},
+        )
+
+
+@pytest.fixture
+def upstream(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> _Upstream:
+    fake = _Upstream()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+    cache = XenoCantoMediaCache(tmp_path / "xc-cache", max_bytes=10 * 1024 * 1024)
+
+    async def _allow(**_kwargs: Any) -> None:
+        return None
+
+    def _client(upstream: Any) -> httpx.AsyncClient:
+        fake.clients.append(upstream.name)
+        return client
+
+    monkeypatch.setattr(xc_module, "get_http_client", _client)
+    monkeypatch.setattr(xc_module, "get_xeno_canto_media_cache", lambda: cache)
+    monkeypatch.setattr(xc_module, "gate_action", _allow)
+    return fake
+
+
+async def _render(
+    response: Response, headers: dict[str, str] | None = None
+) -> tuple[int, dict[str, str], bytes]:
+    """Run an ASGI response and return ``(status, headers, body)``."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        # The client never disconnects; the response cancels this listener.
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    await response(scope, receive, send)
+    start = messages[0]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}, body
+
+
+async def _proxy_audio(xc_id: str = "1069474") -> Response:
+    return await xc_module.proxy_audio(
+        project_id=uuid4(),
+        xc_id=xc_id,
+        request=None,  # type: ignore[arg-type]
+        current_user=None,  # type: ignore[arg-type]
+        db=None,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_audio_miss_is_cached_and_ranges_are_served_from_disk(
+    upstream: _Upstream,
+) -> None:
+    status, _, body = await _render(await _proxy_audio())
+    assert (status, body) == (200, _AUDIO)
+    assert len(upstream.requests) == 1
+    # Downloads hold their own slots, never the search API's.
+    assert upstream.clients == [XENO_CANTO_AUDIO.name]
+
+    status, headers, body = await _render(await _proxy_audio(), {"Range": "bytes=100-199"})
+
+    assert status == 206
+    assert body == _AUDIO[100:200]
+    assert headers["content-range"] == f"bytes 100-199/{len(_AUDIO)}"
+    assert headers["content-disposition"] == 'inline; filename="XC1069474.mp3"'
+    assert len(upstream.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_audio_is_revalidated_with_a_conditional_get(
+    upstream: _Upstream, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await _render(await _proxy_audio())
+    settings = xc_module.get_settings()
+    monkeypatch.setattr(settings, "XENO_CANTO_CACHE_FRESH_SECONDS", 0)
+    upstream.not_modified = True
+
+    status, _, body = await _render(await _proxy_audio())
+
+    assert (status, body) == (200, _AUDIO)
+    assert upstream.requests[-1].headers["if-none-match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_audio_cache_io_runs_off_the_event_loop(
+    upstream: _Upstream, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loop_thread = threading.current_thread()
+    io_threads: list[tuple[str, threading.Thread]] = []
+    lookup = XenoCantoMediaCache.lookup
+    write = MediaCacheWriter.write
+
+    def _lookup(self: XenoCantoMediaCache, resource: str) -> Any:
+        io_threads.append(("lookup", threading.current_thread()))
+        return lookup(self, resource)
+
+    def _write(self: MediaCacheWriter, chunk: bytes) -> None:
+        io_threads.append(("write", threading.current_thread()))
+        write(self, chunk)
+
+    monkeypatch.setattr(XenoCantoMediaCache, "lookup", _lookup)
+    monkeypatch.setattr(MediaCacheWriter, "write", _write)
+
+    status, _, body = await _render(await _proxy_audio())
+
+    assert (status, body) == (200, _AUDIO)
+    assert {name for name, _ in io_threads} == {"lookup", "write"}
+    assert all(thread is not loop_thread for _, thread in io_threads)
+
+
+@pytest.mark.asyncio
+async def test_fresh_sonogram_hit_skips_validation_and_upstream(
+    upstream: _Upstream, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    url = "https://xeno-canto.org/sounds/spectrogram/1234-small.png"
+    xc_module.get_xeno_canto_media_cache().store(
+        f"sonogram/{url}", b"png-bytes", content_type="image/png"
+    )
+
+    def _no_validation(_url: str) -> tuple[str, str]:
+        raise AssertionError("a cache hit must not resolve DNS")
+
+    monkeypatch.setattr(xc_module, "_validate_sonogram_url", _no_validation)
+
+    status, headers, body = await _render(
+        await xc_module.proxy_sonogram(project_id=uuid4(), url=url)
+    )
+
+    assert (status, body) == (200, b"png-bytes")
+    assert headers["content-type"] == "image/png"
+    assert headers["cache-control"] == "public, max-age=86400"
+    assert upstream.requests == []
+
+
+@pytest.mark.asyncio
+async def test_identical_searches_hit_the_redis_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    store: dict[str, str] = {}
+    upstream_calls: list[tuple[str, int]] = []
+
+    class _FakeRedis:
+        async def get(self, key: str) -> str | None:
+            return store.get(key)
+
+        async def set(self, key: str, value: str, ex: int) -> None:
+            assert ex == xc_module.get_settings().XENO_CANTO_SEARCH_CACHE_TTL_SECONDS
+            store[key] = value
+
+    async def _fake_redis() -> _FakeRedis:
+        return _FakeRedis()
+
+    async def _fake_fetch(xc_query: str, page: int, _api_key: str) -> dict[str, object]:
+        upstream_calls.append((xc_query, page))
+        return {"numRecordings": 1, "numPages": 1, "page": page, "recordings": [{"id": "1"}]}
+
+    async def _allow(*_args: object, **_kwargs: object) -> None:
+        return None
+
+    monkeypatch.setattr(redis_module, "get_redis_connection", _fake_redis)
+    monkeypatch.setattr(xc_module, "_fetch_xc_search", _fake_fetch)
+    monkeypatch.setattr(xc_module, "check_project_access", _allow)
+    monkeypatch.setattr(xc_module, "_get_api_key", lambda: "real-key")
+
+    async def _search(page: int) -> Any:
+        return await xc_module.search_xeno_canto(
+            project_id=uuid4(),
+            current_user=type("U", (), {"id": uuid4()})(),  # type: ignore[arg-type]
+            db=None,  # type: ignore[arg-type]
+            query="Larus fuscus",
+            country=None,
+            area=None,
+            quality_min=None,
+            recording_type=None,
+            page=page,
+            per_page=25,
+        )
+
+    first = await _search(1)
+    second = await _search(1)
+    await _search(2)
+
+    assert [r.xc_id for r in second.recordings] == [r.xc_id for r in first.recordings] == ["1"]
+    assert upstream_calls == [('sp:"Larus fuscus"', 1), ('sp:"Larus fuscus"', 2)]
@@ -0,0 +1,105 @@
+"""Unit tests for the shared upstream HTTP clients.
+
+Requests go through ``httpx.MockTransport`` wrapped in the metered
+transport, so the per-host concurrency cap, the slot held by a streamed
+body and the per-upstream metrics are exercised without a socket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from echoroo.core import http_clients
+from echoroo.core.http_clients import Upstream, build_http_client
+
+
+def _upstream(max_concurrency: int) -> Upstream:
+    # A unique name per test keeps the process-wide metrics separate.
+    return Upstream(f"test-{uuid4().hex[:8]}", timeout=5.0, max_concurrency=max_concurrency)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped_per_host_and_metered() -> None:
+    upstream = _upstream(2)
+    active = peak = 0
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200 if request.url.path == "/ok" else 503)
+
+    async with build_http_client(upstream, inner=httpx.MockTransport(_handler)) as client:
+        await asyncio.gather(
+            *(client.get("https://a.example/ok") for _ in range(5)),
+            client.get("https://a.example/down"),
+        )
+
+    assert peak == 2
+    metrics = http_clients.http_client_metrics()[upstream.name]
+    assert metrics["requests"] == 6
+    assert metrics["statuses"] == {"2xx": 5, "5xx": 1}
+    assert metrics["in_flight"] == 0
+    assert metrics["mean_latency_seconds"] > 0
+
+
+class _Body(httpx.AsyncByteStream):
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield b"audio"
+
+
+@pytest.mark.asyncio
+async def test_streamed_body_holds_its_slot_until_closed() -> None:
+    upstream = _upstream(1)
+    transport = httpx.MockTransport(lambda _request: httpx.Response(200, stream=_Body()))
+
+    async with build_http_client(upstream, inner=transport) as client:
+        async with client.stream("GET", "https://a.example/download") as response:
+            waiting = asyncio.ensure_future(client.get("https://a.example/other"))
+            await asyncio.sleep(0.01)
+            assert not waiting.done()
+            assert await response.aread() == b"audio"
+        assert (await waiting).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_release_the_slot() -> None:
+    upstream = _upstream(1)
+    calls = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    async with build_http_client(upstream, inner=httpx.MockTransport(_handler)) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://a.example/")
+        assert (await client.get("https://a.example/")).status_code == 200
+
+    metrics = http_clients.http_client_metrics()[upstream.name]
+    assert metrics["errors"] == 1
+    assert metrics["statuses"] == {"ConnectError": 1, "2xx": 1}
+
+
+@pytest.mark.asyncio
+async def test_shared_client_lives_until_closed() -> None:
+    first = http_clients.get_http_client(http_clients.GBIF)
+
+    assert http_clients.get_http_client(http_clients.GBIF) is first
+    assert http_clients.get_http_client(http_clients.INATURALIST) is not first
+
+    await http_clients.close_http_clients()
+
+    assert first.is_closed
+    assert http_clients.get_http_client(http_clients.GBIF) is not first
+    await http_clients.close_http_clients()
@@ -0,0 +1,264 @@
+"""Unit tests for keyset cursors and estimated totals in ``echoroo.core.pagination``.
+
+Covers cursor round-trips and validation, the ``WHERE`` / ``ORDER BY`` pair
+for NOT NULL and nullable sort keys, ``next_cursor`` on full / short pages,
+and the ``total_mode="estimate"`` fallback rules of :func:`count_total`.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Uuid, select
+from sqlalchemy.dialects import postgresql
+
+from echoroo.core.pagination import (
+    ESTIMATE_EXACT_BELOW,
+    Cursor,
+    InvalidCursorError,
+    count_total,
+    decode_cursor,
+    encode_cursor,
+    is_estimate,
+    keyset_after,
+    keyset_order_by,
+    next_cursor,
+)
+from echoroo.models.clip import Clip
+from echoroo.models.enums import DetectionStatus
+from echoroo.models.recording import Recording
+from echoroo.models.recording_annotation import RecordingAnnotation
+
+
+def _sql(clause: object) -> str:
+    return str(
+        clause.compile(  # type: ignore[attr-defined]
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": False}
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [datetime(2026, 5, 1, 6, 30, tzinfo=UTC), 12.5, 3, "dawn_chorus.wav", None],
+)
+def test_cursor_round_trips_sort_values(value: object) -> None:
+    row_id = uuid4()
+
+    token = encode_cursor("datetime", True, value, row_id)
+    cursor = decode_cursor(token, sort_key="datetime", descending=True)
+
+    assert cursor == Cursor("datetime", True, value, row_id)
+    # Opaque and URL-safe.
+    assert "=" not in token and "/" not in token and "+" not in token
+
+
+def test_cursor_for_another_sort_is_rejected() -> None:
+    token = encode_cursor("datetime", True, None, uuid4())
+
+    with pytest.raises(InvalidCursorError, match="does not match"):
+        decode_cursor(token, sort_key="filename", descending=True)
+    with pytest.raises(InvalidCursorError, match="does not match"):
+        decode_cursor(token, sort_key="datetime", descending=False)
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "", "eyJrIjoxfQ"])
+def test_malformed_cursor_is_rejected(token: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token, sort_key="datetime", descending=True)
+
+
+def test_keyset_after_descending_includes_null_tail() -> None:
+    cursor = Cursor("datetime", True, datetime(2026, 1, 1, tzinfo=UTC), uuid4())
+
+    sql = _sql(keyset_after(Recording.datetime, Recording.id, cursor))
+
+    assert "(recordings.datetime, recordings.id) < (" in sql
+    assert "recordings.datetime IS NULL" in sql
+
+
+def test_keyset_after_null_cursor_stays_in_null_tail() -> None:
+    cursor = Cursor("datetime", False, None, uuid4())
+
+    sql = _sql(keyset_after(Recording.datetime, Recording.id, cursor))
+
+    assert sql.startswith("recordings.datetime IS NULL AND recordings.id > ")
+
+
+def test_keyset_order_by_is_total_with_nulls_last() -> None:
+    query = select(Recording.id).order_by(
+        *keyset_order_by(Recording.datetime, Recording.id, descending=True)
+    )
+
+    assert "ORDER BY recordings.datetime DESC NULLS LAST, recordings.id DESC" in _sql(query)
+
+
+def test_not_null_sort_key_uses_plain_row_comparison() -> None:
+    cursor = Cursor("created_at", True, datetime(2026, 1, 1, tzinfo=UTC), uuid4())
+    query = (
+        select(RecordingAnnotation.id)
+        .where(keyset_after(RecordingAnnotation.created_at, RecordingAnnotation.id, cursor))
+        .order_by(
+            *keyset_order_by(
+                RecordingAnnotation.created_at, RecordingAnnotation.id, descending=True
+            )
+        )
+    )
+
+    sql = _sql(query)
+
+    assert "(recording_annotations.created_at, recording_annotations.id) < (" in sql
+    assert "IS NULL" not in sql
+    assert "NULLS" not in sql
+    assert sql.endswith(
+        "ORDER BY recording_annotations.created_at DESC, recording_annotations.id DESC"
+    )
+
+
+def test_nullable_override_keeps_null_tail_for_outer_joins() -> None:
+    cursor = Cursor("start_time", False, 1.5, uuid4())
+
+    sql = _sql(keyset_after(Clip.start_time, Clip.id, cursor, nullable=True))
+
+    assert "(clips.start_time, clips.id) > (" in sql
+    assert "clips.start_time IS NULL" in sql
+
+
+def test_null_cursor_on_not_null_key_matches_nothing() -> None:
+    cursor = Cursor("start_time", False, None, uuid4())
+
+    assert _sql(keyset_after(Clip.start_time, Clip.id, cursor)) == "false"
+
+
+@pytest.mark.parametrize(
+    ("column", "value"),
+    [
+        (Recording.datetime, "not-a-timestamp"),
+        (Recording.datetime, 5),
+        (Clip.start_time, "1.5"),
+        (Clip.start_time, True),
+        (Recording.filename, 3),
+    ],
+)
+def test_forged_cursor_value_is_rejected(column: object, value: object) -> None:
+    cursor = Cursor("x", True, value, uuid4())
+
+    with pytest.raises(InvalidCursorError, match="does not match the sort column"):
+        keyset_after(column, Recording.id, cursor)  # type: ignore[arg-type]
+
+
+def test_integer_cursor_is_accepted_for_float_key() -> None:
+    cursor = Cursor("start_time", False, 3, uuid4())
+
+    assert "(clips.start_time, clips.id) > (" in _sql(
+        keyset_after(Clip.start_time, Clip.id, cursor)
+    )
+
+
+def test_next_cursor_only_on_full_pages() -> None:
+    rows = [SimpleNamespace(id=uuid4(), start_time=float(i)) for i in range(3)]
+
+    assert next_cursor(rows, 4, sort_key="start_time", descending=False) is None
+    assert next_cursor([], 4, sort_key="start_time", descending=False) is None
+
+    token = next_cursor(rows, 3, sort_key="start_time", descending=False)
+    assert token is not None
+    cursor = decode_cursor(token, sort_key="start_time", descending=False)
+    assert (cursor.value, cursor.id) == (2.0, rows[-1].id)
+
+
+def _result(value: object) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one.return_value = value
+    return result
+
+
+def _filtered_query() -> object:
+    return select(RecordingAnnotation).where(
+        RecordingAnnotation.status == DetectionStatus.UNREVIEWED,
+        RecordingAnnotation.detection_run_id == uuid4(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_estimate_mode_uses_planner_rows_for_large_sets() -> None:
+    plan = json.dumps([{"Plan": {"Plan Rows": ESTIMATE_EXACT_BELOW * 40}}])
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=_result(plan))
+
+    total = await count_total(db, _filtered_query(), "estimate")  # type: ignore[arg-type]
+
+    assert total == ESTIMATE_EXACT_BELOW * 40
+    assert is_estimate(total)
+    # Only the EXPLAIN ran; its parameters stay bound, not inlined.
+    assert db.execute.await_count == 1
+    explain = db.execute.await_args.args[0]
+    rendered = str(explain)
+    assert rendered.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert ":status_1" in rendered
+    assert set(explain.compile().params) >= {"status_1", "detection_run_id_1"}
+    db.begin_nested.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_estimate_expands_in_lists_into_typed_binds() -> None:
+    run_ids = [uuid4(), uuid4()]
+    plan = [{"Plan": {"Plan Rows": ESTIMATE_EXACT_BELOW * 2}}]
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=_result(plan))
+    query = select(RecordingAnnotation).where(
+        RecordingAnnotation.detection_run_id.in_(run_ids)
+    )
+
+    total = await count_total(db, query, "estimate")  # type: ignore[arg-type]
+
+    assert is_estimate(total)
+    explain = db.execute.await_args.args[0]
+    assert "POSTCOMPILE" not in str(explain)
+    binds = explain.compile().binds
+    assert [binds[f"detection_run_id_1_{n}"].value for n in (1, 2)] == run_ids
+    assert isinstance(binds["detection_run_id_1_1"].type, Uuid)
+
+
+@pytest.mark.asyncio
+async def test_estimate_mode_counts_exactly_for_small_sets() -> None:
+    plan = [{"Plan": {"Plan Rows": 12}}]
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[_result(plan), _result(9)])
+
+    total = await count_total(db, _filtered_query(), "estimate")  # type: ignore[arg-type]
+
+    assert total == 9
+    assert db.execute.await_count == 2
+    # The exact fallback ran, so the response must not claim an estimate.
+    assert not is_estimate(total)
+
+
+@pytest.mark.asyncio
+async def test_estimate_mode_falls_back_when_explain_fails() -> None:
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[RuntimeError("not postgres"), _result(5)])
+
+    total = await count_total(db, _filtered_query(), "estimate")  # type: ignore[arg-type]
+
+    assert total == 5
+    assert not is_estimate(total)
+    # The failed EXPLAIN ran inside a savepoint, which rolled it back so the
+    # exact count could still run in the same transaction.
+    savepoint = db.begin_nested.return_value
+    savepoint.__aexit__.assert_awaited_once()
+    assert savepoint.__aexit__.await_args.args[0] is RuntimeError
+
+
+@pytest.mark.asyncio
+async def test_exact_mode_never_explains() -> None:
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=_result(42))
+
+    assert await count_total(db, _filtered_query()) == 42  # type: ignore[arg-type]
+    assert "count(*)" in _sql(db.execute.await_args.args[0])
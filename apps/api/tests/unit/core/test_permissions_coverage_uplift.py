@@ -235,6 +235,25 @@ def test_is_allowed_blocks_archived_project_mutations() -> None:
     assert allowed is False
 
 
+def test_is_allowed_blocks_mutations_on_a_project_being_deleted() -> None:
+    """A project queued for background deletion rejects mutating actions."""
+    user = _user()
+    project = _project(status="deleting", owner_id=user.id)
+    action = _action(is_mutating=True)
+    request = MagicMock()
+    request.state = SimpleNamespace()
+    allowed, _ = is_allowed(
+        action=action, user=user, project=project, request=request
+    )
+    assert allowed is False
+
+    retry = _action(name="project.delete", required_permission=Permission.DELETE_PROJECT)
+    allowed, _ = is_allowed(
+        action=retry, user=user, project=project, request=request
+    )
+    assert allowed is True
+
+
 def test_is_allowed_search_cross_project_denied_for_guest() -> None:
     """Guest is denied SEARCH_CROSS_PROJECT (line 868)."""
     project = _project()
@@ -0,0 +1,99 @@
+"""Unit tests for ``echoroo.core.s3_async``.
+
+A fake S3 client is patched in for the shared client; the facade must run
+every blocking call off the event loop thread and stream bodies in chunks.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echoroo.core import s3 as s3mod
+from echoroo.core import s3_async
+
+
+class _Body(io.BytesIO):
+    def __init__(self, data: bytes, reads: list[str]) -> None:
+        super().__init__(data)
+        self._reads = reads
+
+    def read(self, size: int | None = -1) -> bytes:
+        self._reads.append(threading.current_thread().name)
+        return super().read(size)
+
+
+class _FakeS3:
+    def __init__(self, objects: dict[str, bytes]) -> None:
+        self.objects = objects
+        self.reads: list[str] = []
+        self.bodies: list[_Body] = []
+        self.calls: list[tuple[str, Any]] = []
+
+    def get_object(self, Bucket: str, Key: str, Range: str | None = None) -> dict[str, Any]:  # noqa: N803
+        self.calls.append(("get_object", Range))
+        data = self.objects[Key]
+        content_range = None
+        if Range:
+            first, last = (int(v) for v in Range.removeprefix("bytes=").split("-"))
+            content_range = f"bytes {first}-{last}/{len(data)}"
+            data = data[first : last + 1]
+        body = _Body(data, self.reads)
+        self.bodies.append(body)
+        return {"Body": body, "ContentLength": len(data), "ContentRange": content_range}
+
+    def download_file(self, bucket: str, key: str, dest: str, Config: Any) -> None:  # noqa: N803
+        self.calls.append(("download_file", threading.current_thread().name))
+        Path(dest).write_bytes(self.objects[key])
+
+    def delete_object(self, Bucket: str, Key: str) -> None:  # noqa: N803
+        self.objects.pop(Key)
+
+
+@pytest.fixture
+def fake_s3(monkeypatch: pytest.MonkeyPatch) -> _FakeS3:
+    client = _FakeS3({"a/b.wav": bytes(range(256)) * 4})
+    monkeypatch.setattr(s3mod, "get_s3_client", lambda: client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_ranged_stream_reads_in_chunks_off_the_loop(fake_s3: _FakeS3) -> None:
+    stream = await s3_async.open_object("a/b.wav", byte_range="bytes=10-109")
+
+    chunks = [chunk async for chunk in stream.chunks(chunk_size=40)]
+
+    assert [len(c) for c in chunks] == [40, 40, 20]
+    assert b"".join(chunks) == fake_s3.objects["a/b.wav"][10:110]
+    assert stream.content_length == 100
+    assert stream.content_range == "bytes 10-109/1024"
+    assert all(name.startswith("s3-io") for name in fake_s3.reads)
+    assert fake_s3.bodies[0].closed
+
+
+@pytest.mark.asyncio
+async def test_abandoned_stream_closes_its_body(fake_s3: _FakeS3) -> None:
+    stream = await s3_async.open_object("a/b.wav")
+    chunks = stream.chunks(chunk_size=16)
+
+    assert len(await anext(chunks)) == 16
+    await chunks.aclose()
+
+    assert fake_s3.bodies[0].closed
+
+
+@pytest.mark.asyncio
+async def test_read_and_download_object(fake_s3: _FakeS3, tmp_path: Path) -> None:
+    assert await s3_async.read_object("a/b.wav") == fake_s3.objects["a/b.wav"]
+
+    dest = tmp_path / "b.wav"
+    await s3_async.download_file("a/b.wav", dest)
+
+    assert dest.read_bytes() == fake_s3.objects["a/b.wav"]
+    assert fake_s3.calls[-1][1].startswith("s3-io")
+    assert await s3_async.delete_object("a/b.wav") is True
+    assert fake_s3.objects == {}
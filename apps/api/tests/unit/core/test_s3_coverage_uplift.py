@@ -229,7 +229,16 @@ def test_delete_objects_batch_returns_structured_result() -> None:
     assert result.errors[0].code == "AccessDenied"
 
 
-def test_get_s3_client_returns_boto3_client(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.fixture
+def fresh_clients() -> Any:
+    s3mod.reset_s3_clients()
+    yield
+    s3mod.reset_s3_clients()
+
+
+def test_get_s3_client_returns_boto3_client(
+    monkeypatch: pytest.MonkeyPatch, fresh_clients: None
+) -> None:
     """get_s3_client() builds a boto3 client with settings (lines 78-83)."""
     captured: dict[str, Any] = {}
 
@@ -243,10 +252,13 @@ def test_get_s3_client_returns_boto3_client(monkeypatch: pytest.MonkeyPatch) ->
     assert out is not None
     assert captured["service"] == "s3"
     assert "endpoint_url" in captured["kwargs"]
+    config = captured["kwargs"]["config"]
+    assert config.max_pool_connections == s3mod.get_settings().S3_MAX_POOL_CONNECTIONS
+    assert config.retries["mode"] == "standard"
 
 
 def test_get_public_s3_client_uses_public_endpoint(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, fresh_clients: None
 ) -> None:
     """get_public_s3_client() picks S3_PUBLIC_ENDPOINT_URL when set (lines 101-103)."""
     captured: dict[str, Any] = {}
@@ -260,3 +272,145 @@ def test_get_public_s3_client_uses_public_endpoint(
     assert out is not None
     # Either S3_PUBLIC_ENDPOINT_URL or S3_ENDPOINT_URL was used.
     assert "endpoint_url" in captured["kwargs"]
+
+
+def test_s3_client_is_shared_per_process(
+    monkeypatch: pytest.MonkeyPatch, fresh_clients: None
+) -> None:
+    """Clients are built once per process and endpoint, then reused."""
+    built: list[object] = []
+
+    def fake_boto3_client(service: str, **kwargs: Any) -> object:
+        built.append(object())
+        return built[-1]
+
+    monkeypatch.setattr(s3mod.boto3, "client", fake_boto3_client)
+    first = s3mod.get_s3_client()
+    assert s3mod.get_s3_client() is first
+    assert len(built) == 1
+
+    # A forked child (different PID) must not reuse the parent's sockets.
+    monkeypatch.setattr(s3mod.os, "getpid", lambda: -1)
+    assert s3mod.get_s3_client() is not first
+    assert len(built) == 2
+
+
+def test_download_and_upload_file_use_transfer_config() -> None:
+    """Managed transfers pass the multipart TransferConfig to boto3."""
+    client = _fake_client()
+    s3mod.download_file("k", "/tmp/x", client=client)
+    s3mod.upload_file("/tmp/x", "k2", {"ContentType": "audio/wav"}, client=client)
+
+    _, _, dest = client.download_file.call_args.args
+    assert dest == "/tmp/x"
+    config = client.download_file.call_args.kwargs["Config"]
+    assert config.max_request_concurrency == s3mod.get_settings().S3_TRANSFER_CONCURRENCY
+    assert client.upload_file.call_args.kwargs["ExtraArgs"] == {"ContentType": "audio/wav"}
+
+
+def test_upload_file_rejects_metadata() -> None:
+    """upload_file() bypasses the GPS sanitizer, so Metadata is refused."""
+    with pytest.raises(ValueError):
+        s3mod.upload_file("/tmp/x", "k", {"Metadata": {"lat": "1"}}, client=_fake_client())
+
+
+def _multipart_client() -> MagicMock:
+    client = _fake_client()
+    client.create_multipart_upload = MagicMock(return_value={"UploadId": "u1"})
+    client.upload_part = MagicMock(side_effect=lambda **kw: {"ETag": f"e{kw['PartNumber']}"})
+    return client
+
+
+def test_multipart_writer_uploads_fixed_size_parts() -> None:
+    """MultipartUploadWriter buffers one part at a time and completes on close."""
+    client = _multipart_client()
+    writer = s3mod.MultipartUploadWriter(
+        "exports/a.zip", content_type="application/zip", client=client
+    )
+    writer._part_size = 10
+
+    for _ in range(5):
+        writer.write(b"1234567")
+    writer.close()
+
+    sizes = [len(call.kwargs["Body"]) for call in client.upload_part.call_args_list]
+    assert sizes == [10, 10, 10, 5]
+    assert writer.bytes_written == 35
+    assert client.create_multipart_upload.call_args.kwargs["ContentType"] == "application/zip"
+    parts = client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+    assert [p["ETag"] for p in parts] == ["e1", "e2", "e3", "e4"]
+    client.abort_multipart_upload.assert_not_called()
+
+
+def test_multipart_writer_aborts_when_the_producer_fails() -> None:
+    """Leaving the ``with`` block on an exception discards the upload."""
+    client = _multipart_client()
+
+    with pytest.raises(RuntimeError), s3mod.MultipartUploadWriter("k", client=client) as writer:
+        writer.write(b"partial")
+        raise RuntimeError("boom")
+
+    client.complete_multipart_upload.assert_not_called()
+    client.abort_multipart_upload.assert_called_once_with(
+        Bucket=s3mod.get_settings().S3_BUCKET, Key="k", UploadId="u1"
+    )
+
+
+def test_multipart_writer_sends_part_md5_under_object_lock() -> None:
+    """Object Lock uploads need Content-MD5 on every part; Metadata is refused."""
+    import base64
+    import hashlib
+
+    client = _multipart_client()
+    writer = s3mod.MultipartUploadWriter(
+        "audit/a.ndjson",
+        bucket="archive",
+        extra_args={"ObjectLockMode": "GOVERNANCE"},
+        client=client,
+    )
+    writer.write(b"line\n")
+    writer.close()
+
+    create = client.create_multipart_upload.call_args.kwargs
+    assert create["Bucket"] == "archive"
+    assert create["ObjectLockMode"] == "GOVERNANCE"
+    part = client.upload_part.call_args.kwargs
+    assert part["ContentMD5"] == base64.b64encode(hashlib.md5(b"line\n").digest()).decode()
+
+    with pytest.raises(ValueError):
+        s3mod.MultipartUploadWriter("k", extra_args={"Metadata": {}}, client=client)
+
+
+def test_abort_multipart_uploads_only_touches_the_exact_key() -> None:
+    """Pending uploads of the key are aborted; keys sharing the prefix are not."""
+    client = _fake_client()
+    client.list_multipart_uploads = MagicMock(
+        return_value={
+            "Uploads": [
+                {"Key": "exports/a.zip", "UploadId": "u1"},
+                {"Key": "exports/a.zip.bak", "UploadId": "u2"},
+                {"Key": "exports/a.zip", "UploadId": "u3"},
+            ]
+        }
+    )
+
+    assert s3mod.abort_multipart_uploads("exports/a.zip", client=client) == 2
+
+    bucket = s3mod.get_settings().S3_BUCKET
+    client.list_multipart_uploads.assert_called_once_with(Bucket=bucket, Prefix="exports/a.zip")
+    assert [call.kwargs["UploadId"] for call in client.abort_multipart_upload.call_args_list] == [
+        "u1",
+        "u3",
+    ]
+
+
+def test_generate_presigned_download_url_sets_disposition() -> None:
+    """generate_presigned_download_url() signs a GET with a download file name."""
+    client = _fake_client()
+    url = s3mod.generate_presigned_download_url("exports/a.zip", filename="a.zip", client=client)
+
+    assert url == "https://signed/"
+    method = client.generate_presigned_url.call_args.args[0]
+    params = client.generate_presigned_url.call_args.kwargs["Params"]
+    assert method == "get_object"
+    assert params["ResponseContentDisposition"] == 'attachment; filename="a.zip"'
@@ -0,0 +1,24 @@
+"""Unit tests for :func:`echoroo.core.text.fold_for_search`."""
+
+from __future__ import annotations
+
+import pytest
+
+from echoroo.core.text import fold_for_search
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Parus  Major", "parus major"),
+        ("ＰＡＲＵＳ", "parus"),
+        ("Pájaro Carpintero", "pajaro carpintero"),
+        ("シジュウカラ", "しじゅうから"),
+        ("ｼｼﾞｭｳｶﾗ", "しじゅうから"),
+        ("ガ", "が"),
+        ("四十雀", "四十雀"),
+        ("  Great\tTit ", "great tit"),
+    ],
+)
+def test_fold_for_search(value: str, expected: str) -> None:
+    assert fold_for_search(value) == expected
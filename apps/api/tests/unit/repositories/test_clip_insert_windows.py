@@ -0,0 +1,64 @@
+"""Unit tests for :meth:`ClipRepository.insert_windows`.
+
+The windows must be staged with one ``COPY`` and inserted with one
+anti-join statement. The SQL itself is PostgreSQL-specific; it runs against
+a real database in
+``tests/integration/repositories/test_clip_insert_windows_real_db.py``.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from echoroo.repositories.clip import ClipRepository
+
+
+def _session(rowcount: int) -> tuple[MagicMock, AsyncMock]:
+    copy = AsyncMock()
+    raw = SimpleNamespace(driver_connection=SimpleNamespace(copy_records_to_table=copy))
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[MagicMock(), MagicMock(), SimpleNamespace(rowcount=rowcount)]
+    )
+    session.connection = AsyncMock(return_value=connection)
+    return session, copy
+
+
+@pytest.mark.asyncio
+async def test_insert_windows_copies_then_inserts_missing_windows() -> None:
+    session, copy = _session(rowcount=1)
+    recording_id = uuid4()
+    windows = [(recording_id, 0.0, 3.0), (recording_id, 3.0, 6.0)]
+
+    created = await ClipRepository(session).insert_windows(windows)
+
+    assert created == 1
+    copy.assert_awaited_once_with(
+        "clip_window_staging",
+        records=windows,
+        columns=["recording_id", "start_time", "end_time"],
+    )
+    statements = [str(call.args[0]) for call in session.execute.await_args_list]
+    assert "CREATE TEMPORARY TABLE IF NOT EXISTS clip_window_staging" in statements[0]
+    assert "ON COMMIT DROP" in statements[0]
+    assert statements[1] == "TRUNCATE clip_window_staging"
+    assert "WHERE NOT EXISTS" in statements[2]
+    # Existing clips match within a tolerance, not by float equality.
+    assert "c.start_time = s.start_time" not in statements[2]
+    assert "abs(c.end_time - s.end_time) < 1e-06" in statements[2]
+    assert "ON CONFLICT ON CONSTRAINT uq_clip_recording_time DO NOTHING" in statements[2]
+
+
+@pytest.mark.asyncio
+async def test_insert_windows_skips_empty_batches() -> None:
+    session, copy = _session(rowcount=0)
+
+    assert await ClipRepository(session).insert_windows([]) == 0
+    session.execute.assert_not_awaited()
+    copy.assert_not_awaited()
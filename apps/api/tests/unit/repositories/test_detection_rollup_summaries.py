@@ -0,0 +1,113 @@
+"""Unit tests for the rollup-backed species / temporal summaries.
+
+``species_summary`` / ``temporal_summary`` must read the trigger-maintained
+rollup tables and never aggregate ``recording_annotations``; the trigger
+logic itself is PostgreSQL DDL, exercised against a real database by
+``tests/integration/test_detection_rollup_triggers_real_db.py``.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from echoroo.models.enums import DetectionSource
+from echoroo.repositories.annotation import AnnotationRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+def _repo(rows: list[Any]) -> tuple[AnnotationRepository, AsyncMock]:
+    result = MagicMock()
+    result.all.return_value = rows
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return AnnotationRepository(db), db.execute
+
+
+def _sql(execute: AsyncMock) -> str:
+    return str(execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+
+
+async def test_species_summary_reads_species_rollups() -> None:
+    tag_id = uuid4()
+    repo, execute = _repo(
+        [
+            SimpleNamespace(
+                tag_id=tag_id,
+                tag_name="Parus minor",
+                scientific_name="Parus minor",
+                common_name="Japanese tit",
+                taxon_id=None,
+                total_count=7,
+                avg_confidence=0.5,
+                unreviewed_count=4,
+                confirmed_count=2,
+                rejected_count=1,
+            )
+        ]
+    )
+
+    rows = await repo.species_summary(uuid4(), dataset_id=uuid4())
+
+    sql = _sql(execute)
+    assert "FROM detection_species_rollups" in sql
+    assert "recording_annotations" not in sql
+    assert "HAVING sum(detection_species_rollups.detection_count) > " in sql
+    assert rows[0]["tag_id"] == tag_id
+    assert (rows[0]["total_count"], rows[0]["confirmed_count"]) == (7, 2)
+
+
+async def test_species_summary_for_a_run_labels_untagged_rows() -> None:
+    repo, execute = _repo(
+        [
+            SimpleNamespace(
+                tag_id=None,
+                tag_name=None,
+                scientific_name=None,
+                common_name=None,
+                taxon_id=None,
+                annotation_source=DetectionSource.HUMAN,
+                detection_run_model_name="perch-v2",
+                total_count=3,
+                avg_confidence=None,
+                unreviewed_count=3,
+                confirmed_count=None,
+                rejected_count=None,
+            )
+        ]
+    )
+
+    rows = await repo.species_summary(uuid4(), detection_run_id=uuid4())
+
+    assert "detection_species_rollups.detection_run_id = " in _sql(execute)
+    assert rows[0]["tag_name"] == "perch-v2"
+    assert rows[0]["avg_confidence"] is None
+    assert rows[0]["confirmed_count"] == 0
+
+
+async def test_temporal_summary_reads_pre_bucketed_rollups() -> None:
+    tag_id = uuid4()
+    repo, execute = _repo(
+        [
+            SimpleNamespace(
+                tag_id=tag_id,
+                detection_date=date(2026, 5, 2),
+                detection_hour=7,
+                detection_count=5,
+            )
+        ]
+    )
+
+    rows = await repo.temporal_summary(uuid4(), detection_run_id=uuid4())
+
+    sql = _sql(execute)
+    assert "FROM detection_temporal_rollups" in sql
+    assert "AT TIME ZONE" not in sql
+    assert rows == [{"tag_id": tag_id, "date": date(2026, 5, 2), "hour": 7, "count": 5}]
@@ -0,0 +1,140 @@
+"""Unit tests for the in-process taxon search-name index.
+
+:class:`TaxonNameIndex` must rank exactly like the SQL path of
+``TaxonRepository.search``: exact, name prefix, word prefix, then other
+substrings, ties broken by the shorter scientific name, for queries of any
+length. The snapshot is only dropped once the writing transaction commits.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from echoroo.models.taxon import Taxon
+from echoroo.repositories import taxon_name_index
+from echoroo.repositories.taxon import _search_match
+from echoroo.repositories.taxon_name_index import TaxonNameIndex, rank_name
+
+PARUS, PARUS_MINOR, TIT, SPARUS = uuid4(), uuid4(), uuid4(), uuid4()
+
+
+def _index() -> TaxonNameIndex:
+    scientific = {
+        PARUS: "Parus major",
+        PARUS_MINOR: "Parus minor",
+        TIT: "Aegithalos caudatus",
+        SPARUS: "Sparus aurata",
+    }
+    names = [
+        ("parus major", PARUS),
+        ("great tit", PARUS),
+        ("しじゅうから", PARUS),
+        ("parus minor", PARUS_MINOR),
+        ("long-tailed tit", TIT),
+        ("sparus aurata", SPARUS),
+    ]
+    return TaxonNameIndex(names, scientific)
+
+
+def test_rank_name() -> None:
+    assert rank_name("great tit", "great tit") == 0
+    assert rank_name("great tit", "gre") == 1
+    assert rank_name("great tit", "tit") == 2
+    assert rank_name("great tit", "eat") == 3
+    assert rank_name("great tit", "ti") == 2
+    assert rank_name("great tit", "at") == 3
+    assert rank_name("great tit", "owl") is None
+
+
+def test_search_orders_by_rank_then_scientific_name() -> None:
+    index = _index()
+
+    assert index.search("parus", 10) == [PARUS, PARUS_MINOR, SPARUS]
+    assert index.search("parus major", 10) == [PARUS]
+    assert index.search("tit", 10) == [PARUS, TIT]
+    assert index.search("しじゅう", 10) == [PARUS]
+    assert index.search("parus", 1) == [PARUS]
+
+
+def test_substring_scan_is_skipped_when_prefix_matches_fill_the_page(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    index = _index()
+
+    def _no_scan(name: str, folded: str) -> int | None:
+        raise AssertionError(f"scanned {name!r} for {folded!r}")
+
+    monkeypatch.setattr(taxon_name_index, "rank_name", _no_scan)
+
+    assert index.search("parus", 2) == [PARUS, PARUS_MINOR]
+
+
+def test_short_queries_still_match_substrings() -> None:
+    index = _index()
+
+    assert index.search("pa", 10) == [PARUS, PARUS_MINOR, SPARUS]
+    assert index.search("ti", 10) == [PARUS, TIT]
+    # "カラ" folds to "から", the tail of "しじゅうから".
+    assert index.search("から", 10) == [PARUS]
+
+
+def test_sql_match_uses_folded_column_without_ilike() -> None:
+    dialect = postgresql.dialect()
+    long_query = str(_search_match(Taxon.search_name, "par%").compile(dialect=dialect))
+    short_query = _search_match(Taxon.search_name, "pa").compile(dialect=dialect)
+
+    assert "taxa.search_name LIKE" in long_query
+    assert "ILIKE" not in long_query
+    assert "ESCAPE" in long_query
+    assert list(short_query.params.values()) == ["%pa%"]
+
+
+@pytest.fixture
+def snapshot() -> Iterator[object]:
+    taxon_name_index._snapshot = taxon_name_index._Snapshot(index=None, loaded_at=0.0)
+    yield taxon_name_index._snapshot
+    taxon_name_index.invalidate()
+
+
+def test_snapshot_is_dropped_only_when_the_write_commits(snapshot: object) -> None:
+    session = AsyncSession()
+    sync_session = session.sync_session
+    sync_session.bind = create_engine("sqlite://")
+    with sync_session.begin():
+        with sync_session.begin_nested():
+            taxon_name_index.invalidate_on_commit(session)
+        # Releasing the savepoint publishes nothing yet.
+        assert taxon_name_index._snapshot is snapshot
+    assert taxon_name_index._snapshot is None
+
+
+def test_rolled_back_writes_keep_the_snapshot(snapshot: object) -> None:
+    session = AsyncSession()
+    sync_session = session.sync_session
+    sync_session.bind = create_engine("sqlite://")
+    sync_session.begin()
+    taxon_name_index.invalidate_on_commit(session)
+    sync_session.rollback()
+    sync_session.commit()
+
+    assert taxon_name_index._snapshot is snapshot
+
+
+@pytest.mark.asyncio
+async def test_session_with_uncommitted_taxon_writes_bypasses_the_snapshot(
+    snapshot: object,
+) -> None:
+    session = AsyncSession()
+    session.add(Taxon(scientific_name="Parus minor"))
+    taxon_name_index._note_taxon_writes(session.sync_session, None)
+
+    # The SQL path sees the session's own pending rows; the shared snapshot
+    # is neither used nor rebuilt from them.
+    assert await taxon_name_index.lookup(session, "parus", 10) is None
+    assert taxon_name_index._snapshot is snapshot
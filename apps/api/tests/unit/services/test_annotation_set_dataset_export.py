@@ -14,10 +14,10 @@ written to a temp file on disk). The tests drive them together:
   but still produces the manifest row (and omits the ``.wav`` member); and
 * ``annotations.csv`` and ``segments.csv`` are always present.
 
-The :class:`AudioService` clip methods are mocked so no real audio is read:
-``ensure_file_local`` is a no-op, ``read_audio`` returns deterministic data and
-``audio_to_wav_bytes`` returns deterministic bytes (or raises, to exercise the
-failure path).
+:class:`AudioService` is mocked down to ``ensure_file_local``, which returns a
+small synthetic WAV written to ``tmp_path``; the exporter opens it with
+libsndfile and cuts every segment from that one handle, so clip contents are
+checked against the known ramp signal.
 
 The endpoint's :func:`_build_content_disposition` helper is also unit-tested
 directly with a Japanese set name to prove the RFC 6266 header is Latin-1
@@ -35,6 +35,7 @@ from uuid import UUID, uuid4
 
 import numpy as np
 import pytest
+import soundfile as sf
 
 from echoroo.models.enums import AnnotationSegmentStatus
 from echoroo.services.annotation_set_dataset_export import (
@@ -65,6 +66,29 @@ def _make_segment(
     )
 
 
+_SR = 8000
+
+
+def _write_ramp_wav(path, seconds: float = 12.0) -> str:
+    """Write a mono WAV whose sample value encodes its position in time."""
+    frames = int(seconds * _SR)
+    sf.write(str(path), np.linspace(-0.9, 0.9, frames, dtype=np.float32), _SR, subtype="PCM_16")
+    return str(path)
+
+
+def _mock_audio(local_paths: dict[str, str]) -> MagicMock:
+    """AudioService stand-in that localises recordings to ``local_paths``."""
+
+    def _ensure(relative_path: str) -> str:
+        if relative_path not in local_paths:
+            raise FileNotFoundError(relative_path)
+        return local_paths[relative_path]
+
+    audio = MagicMock()
+    audio.ensure_file_local = MagicMock(side_effect=_ensure)
+    return audio
+
+
 def _read_zip_path(path: str) -> zipfile.ZipFile:
     """Read a ZIP file written to disk into an in-memory ZipFile object."""
     with open(path, "rb") as fh:
@@ -138,12 +162,7 @@ async def test_dataset_zip_finalized_universe_and_negatives(tmp_path) -> None:
         side_effect=[set_result_1, set_result_2, ann_result, seg_result]
     )
 
-    audio = MagicMock()
-    audio.ensure_file_local = MagicMock(return_value="/local/r.wav")
-    audio.read_audio = MagicMock(
-        return_value=(np.zeros(48000, dtype=np.float32), 48000)
-    )
-    audio.audio_to_wav_bytes = MagicMock(return_value=b"RIFFwavbytes")
+    audio = _mock_audio({recording.path: _write_ramp_wav(tmp_path / "r.wav")})
 
     service = AnnotationSetDatasetExportService(db, audio)
     # Stub the CSV row builder + h3 map so we don't depend on the full
@@ -173,8 +192,10 @@ async def test_dataset_zip_finalized_universe_and_negatives(tmp_path) -> None:
     clip_names = {n for n in names if n.startswith("clips/")}
     assert len(clip_names) == 2  # no unannotated segment clip
 
-    # The clip bytes are the deterministic mock output.
-    assert zf.read(f"clips/{positive.id}.wav") == b"RIFFwavbytes"
+    # The clip is the 0-10 s window of the source, as 16-bit WAV.
+    clip, samplerate = sf.read(io.BytesIO(zf.read(f"clips/{positive.id}.wav")))
+    assert samplerate == _SR
+    assert len(clip) == 10 * _SR
 
     # segments.csv has exactly the two finalized segments.
     seg_reader = csv.DictReader(io.StringIO(zf.read("segments.csv").decode("utf-8")))
@@ -202,8 +223,9 @@ async def test_dataset_zip_finalized_universe_and_negatives(tmp_path) -> None:
 async def test_dataset_clip_failure_leaves_clip_path_blank(tmp_path) -> None:
     """A clip-extraction failure → blank clip_path, still a manifest row, no wav.
 
-    ``read_audio`` raises for the segment; ``segments.csv`` must still carry the
-    row with an empty ``clip_path`` and no ``clips/<id>.wav`` member is emitted.
+    The segment lies past the end of its 12 s recording, so the seek fails;
+    ``segments.csv`` must still carry the row with an empty ``clip_path`` and
+    no ``clips/<id>.wav`` member is emitted.
     """
     set_id = uuid4()
     project_id = uuid4()
@@ -214,6 +236,8 @@ async def test_dataset_clip_failure_leaves_clip_path_blank(tmp_path) -> None:
         status=AnnotationSegmentStatus.ANNOTATED,
         is_empty=False,
         n_annotations=1,
+        start=100.0,
+        end=110.0,
     )
 
     anno_set = SimpleNamespace(id=set_id, project_id=project_id, name="Set")
@@ -231,10 +255,7 @@ async def test_dataset_clip_failure_leaves_clip_path_blank(tmp_path) -> None:
         side_effect=[set_result_1, set_result_2, ann_result, seg_result]
     )
 
-    audio = MagicMock()
-    audio.ensure_file_local = MagicMock(return_value="/local/r.wav")
-    audio.read_audio = MagicMock(side_effect=RuntimeError("decode error"))
-    audio.audio_to_wav_bytes = MagicMock(return_value=b"unused")
+    audio = _mock_audio({recording.path: _write_ramp_wav(tmp_path / "r.wav")})
 
     service = AnnotationSetDatasetExportService(db, audio)
     service._csv._detection._load_project = AsyncMock(  # type: ignore[method-assign]
@@ -263,6 +284,144 @@ async def test_dataset_clip_failure_leaves_clip_path_blank(tmp_path) -> None:
     assert rows[0]["n_annotations"] == "1"
 
 
+def test_flac_export_cuts_each_recording_once_in_plan_order(tmp_path) -> None:
+    """FLAC clips are cut from one open file per recording, in plan order.
+
+    Two recordings with out-of-order segments plus one recording that cannot
+    be localised: every recording is localised once, clips hold the exact
+    source window, they are STORED (FLAC is already compressed) and the
+    unreachable recording's segment keeps a blank ``clip_path``.
+    """
+    from echoroo.services.annotation_set_dataset_export import (
+        DatasetExportPlan,
+        SegmentClipSpec,
+    )
+
+    def spec(path: str, start: float, end: float) -> SegmentClipSpec:
+        return SegmentClipSpec(
+            segment_id=uuid4(),
+            recording_id=uuid4(),
+            recording_path=path,
+            start_sec=start,
+            end_sec=end,
+            channel=None,
+            duration_sec=end - start,
+            status="annotated",
+            is_empty=False,
+            n_annotations=1,
+        )
+
+    segments = [
+        spec("a.wav", 6.0, 9.0),
+        spec("a.wav", 1.0, 4.0),
+        spec("b.wav", 0.0, 2.0),
+        spec("missing.wav", 0.0, 1.0),
+    ]
+    source = _write_ramp_wav(tmp_path / "src.wav")
+    audio = _mock_audio({"a.wav": source, "b.wav": source})
+    out_path = str(tmp_path / "dataset.zip")
+
+    write_dataset_zip(
+        DatasetExportPlan(annotations_csv="", segments=segments),
+        audio,
+        out_path,
+        clip_format="flac",
+    )
+
+    zf = _read_zip_path(out_path)
+    clips = [info for info in zf.infolist() if info.filename.startswith("clips/")]
+    assert [info.filename for info in clips] == [
+        f"clips/{segments[1].segment_id}.flac",
+        f"clips/{segments[0].segment_id}.flac",
+        f"clips/{segments[2].segment_id}.flac",
+    ]
+    assert {info.compress_type for info in clips} == {zipfile.ZIP_STORED}
+    expected, _ = sf.read(source, start=6 * _SR, stop=9 * _SR)
+    clip, _ = sf.read(io.BytesIO(zf.read(f"clips/{segments[0].segment_id}.flac")))
+    np.testing.assert_allclose(clip, expected, atol=1e-4)
+    assert sorted(call.args[0] for call in audio.ensure_file_local.call_args_list) == [
+        "a.wav",
+        "b.wav",
+        "missing.wav",
+    ]
+
+    rows = {
+        row["segment_id"]: row["clip_path"]
+        for row in csv.DictReader(io.StringIO(zf.read("segments.csv").decode("utf-8")))
+    }
+    assert rows[str(segments[0].segment_id)] == f"clips/{segments[0].segment_id}.flac"
+    assert rows[str(segments[3].segment_id)] == ""
+
+
+def _spec(path: str, start: float, end: float):
+    from echoroo.services.annotation_set_dataset_export import SegmentClipSpec
+
+    return SegmentClipSpec(
+        segment_id=uuid4(),
+        recording_id=uuid4(),
+        recording_path=path,
+        start_sec=start,
+        end_sec=end,
+        channel=None,
+        duration_sec=end - start,
+        status="annotated",
+        is_empty=False,
+        n_annotations=1,
+    )
+
+
+def test_clips_stream_through_bounded_channels(tmp_path, monkeypatch) -> None:
+    """Many segments per recording pass through a one-clip channel, in order.
+
+    A window ending at or before its start reads to the end of the file, as
+    ``AudioService.read_audio`` does.
+    """
+    from echoroo.services import annotation_set_dataset_export as export_mod
+    from echoroo.services.annotation_set_dataset_export import DatasetExportPlan
+
+    monkeypatch.setattr(export_mod, "CLIPS_IN_FLIGHT", 1)
+    monkeypatch.setattr(export_mod, "EXPORT_WORKERS", 1)
+    source = _write_ramp_wav(tmp_path / "src.wav")
+    segments = [_spec(path, i * 0.5, i * 0.5 + 0.5) for path in ("a.wav", "b.wav") for i in range(12)]
+    open_ended = _spec("b.wav", 11.0, 11.0)
+    segments.append(open_ended)
+    out_path = str(tmp_path / "dataset.zip")
+
+    write_dataset_zip(
+        DatasetExportPlan(annotations_csv="", segments=segments),
+        _mock_audio({"a.wav": source, "b.wav": source}),
+        out_path,
+    )
+
+    zf = _read_zip_path(out_path)
+    clips = [name for name in zf.namelist() if name.startswith("clips/")]
+    assert clips == [f"clips/{spec.segment_id}.wav" for spec in segments]
+    tail, _ = sf.read(io.BytesIO(zf.read(f"clips/{open_ended.segment_id}.wav")))
+    assert len(tail) == _SR
+
+
+def test_writer_failure_stops_the_cutting_workers(tmp_path, monkeypatch) -> None:
+    """A failing ZIP write raises instead of leaving workers blocked."""
+    from echoroo.services import annotation_set_dataset_export as export_mod
+    from echoroo.services.annotation_set_dataset_export import DatasetExportPlan
+
+    monkeypatch.setattr(export_mod, "CLIPS_IN_FLIGHT", 1)
+    source = _write_ramp_wav(tmp_path / "src.wav")
+    segments = [_spec(f"{i}.wav", j * 0.5, j * 0.5 + 0.5) for i in range(6) for j in range(8)]
+
+    def _fail(segment_id: UUID, clip_format: str) -> str:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(export_mod, "_clip_member", _fail)
+
+    with pytest.raises(OSError, match="disk full"):
+        write_dataset_zip(
+            DatasetExportPlan(annotations_csv="", segments=segments),
+            _mock_audio({f"{i}.wav": source for i in range(6)}),
+            str(tmp_path / "dataset.zip"),
+        )
+
+
 @pytest.mark.asyncio
 async def test_dataset_missing_set_raises() -> None:
     """A missing set raises ValueError (caller maps to 404)."""
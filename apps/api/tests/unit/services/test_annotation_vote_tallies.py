@@ -0,0 +1,217 @@
+"""Unit tests for the tally-backed vote counts and consensus list options.
+
+Vote summaries and detection lists must take their counts from the
+trigger-maintained ``annotation_vote_tallies`` rows rather than counting
+``annotation_votes`` in Python, and the detection list filters / sorts on
+the stored consensus in SQL. The triggers themselves are PostgreSQL DDL
+exercised by the DB-backed vote tests.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from echoroo.core.pagination import decode_cursor
+from echoroo.models.enums import AnnotationVoteSource, ConsensusStatus, VoteType
+from echoroo.repositories.annotation import AnnotationRepository
+from echoroo.services.annotation_vote import AnnotationVoteService
+from echoroo.services.detection import DetectionService
+
+pytestmark = pytest.mark.asyncio
+
+
+def _tally(**counts: object) -> SimpleNamespace:
+    fields: dict[str, object] = {
+        "agree_count": 0,
+        "disagree_count": 0,
+        "unsure_count": 0,
+        "member_agree": 0,
+        "member_disagree": 0,
+        "guest_authenticated_agree": 0,
+        "guest_authenticated_disagree": 0,
+        "trusted_user_agree": 0,
+        "trusted_user_disagree": 0,
+        "consensus_score": None,
+    }
+    fields.update(counts)
+    return SimpleNamespace(**fields)
+
+
+def _vote(annotation_id: object, user_id: object, vote: VoteType) -> MagicMock:
+    row = MagicMock()
+    row.id = uuid4()
+    row.annotation_id = annotation_id
+    row.voter_user_id = user_id
+    row.vote_enum = vote
+    row.source = AnnotationVoteSource.MEMBER
+    row.project_role_at_vote = None
+    row.user = None
+    row.created_at = datetime(2026, 5, 1, tzinfo=UTC)
+    return row
+
+
+async def test_vote_summary_counts_come_from_the_tally() -> None:
+    annotation_id, user_id = uuid4(), uuid4()
+    vote_repo = MagicMock()
+    # Deliberately inconsistent with the tally: counts must not be recomputed.
+    vote_repo.list_by_annotation = AsyncMock(
+        return_value=[_vote(annotation_id, user_id, VoteType.DISAGREE)]
+    )
+    vote_repo.get_tally = AsyncMock(
+        return_value=_tally(
+            agree_count=3,
+            disagree_count=1,
+            unsure_count=2,
+            member_agree=2,
+            trusted_user_agree=1,
+            guest_authenticated_disagree=1,
+        )
+    )
+    annotation_repo = MagicMock()
+    annotation_repo.exists = AsyncMock(return_value=True)
+
+    summary = await AnnotationVoteService(vote_repo, annotation_repo).get_vote_summary(
+        annotation_id, user_id
+    )
+
+    assert (summary.agree_count, summary.disagree_count, summary.unsure_count) == (3, 1, 2)
+    assert (summary.member_agree, summary.trusted_user_agree) == (2, 1)
+    assert summary.guest_authenticated_disagree == 1
+    assert summary.consensus_status.value == "confirmed"
+    assert summary.user_vote == VoteType.DISAGREE
+    assert len(summary.voters) == 1
+
+
+async def test_vote_summary_without_tally_is_all_zero() -> None:
+    vote_repo = MagicMock()
+    vote_repo.list_by_annotation = AsyncMock(return_value=[])
+    vote_repo.get_tally = AsyncMock(return_value=None)
+    annotation_repo = MagicMock()
+    annotation_repo.exists = AsyncMock(return_value=True)
+
+    summary = await AnnotationVoteService(vote_repo, annotation_repo).get_vote_summary(uuid4())
+
+    assert (summary.agree_count, summary.disagree_count, summary.unsure_count) == (0, 0, 0)
+    assert summary.member_agree == summary.trusted_user_disagree == 0
+
+
+async def test_batch_vote_counts_read_tallies_and_own_votes_only() -> None:
+    voted, unvoted, user_id = uuid4(), uuid4(), uuid4()
+    vote_repo = MagicMock()
+    vote_repo.list_tallies = AsyncMock(
+        return_value={voted: _tally(agree_count=1, disagree_count=2, consensus_score=1 / 3)}
+    )
+    vote_repo.list_user_votes = AsyncMock(return_value={voted: VoteType.AGREE})
+    service = DetectionService(
+        annotation_repo=MagicMock(),
+        confirmed_region_repo=MagicMock(),
+        vote_repo=vote_repo,
+        recording_repo=MagicMock(),
+        tag_repo=MagicMock(),
+        detection_run_repo=MagicMock(),
+    )
+
+    counts = await service._batch_load_vote_counts(
+        [voted, unvoted], current_user_id=user_id, min_votes=2, threshold=0.6
+    )
+
+    vote_repo.list_user_votes.assert_awaited_once_with([voted, unvoted], user_id)
+    assert counts[voted].agree_count == 1
+    assert counts[voted].disagree_count == 2
+    assert counts[voted].user_vote == VoteType.AGREE
+    assert counts[voted].consensus_status == ConsensusStatus.REJECTED
+    assert counts[voted].consensus_score == pytest.approx(1 / 3)
+    assert counts[unvoted].agree_count == 0
+    assert counts[unvoted].user_vote is None
+    assert counts[unvoted].consensus_status == ConsensusStatus.NEEDS_VOTES
+
+
+def _list_repo() -> tuple[AnnotationRepository, AsyncMock]:
+    count = MagicMock()
+    count.scalar_one.return_value = 0
+    page = MagicMock()
+    page.scalars.return_value.all.return_value = []
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[count, page])
+    return AnnotationRepository(db), db.execute
+
+
+def _page_sql(execute: AsyncMock) -> str:
+    return str(execute.await_args_list[-1].args[0].compile(dialect=postgresql.dialect()))
+
+
+async def test_list_filters_on_stored_consensus() -> None:
+    repo, execute = _list_repo()
+
+    await repo.list_annotations(uuid4(), consensus=ConsensusStatus.NEEDS_VOTES)
+
+    sql = _page_sql(execute)
+    assert "LEFT OUTER JOIN annotation_vote_tallies" in sql
+    assert "coalesce(annotation_vote_tallies.consensus_status" in sql
+    assert "ORDER BY recording_annotations.created_at DESC" in sql
+
+
+async def test_list_sorts_by_consensus_score() -> None:
+    repo, execute = _list_repo()
+
+    await repo.list_annotations(uuid4(), sort_by="consensus_score")
+
+    sql = _page_sql(execute)
+    assert (
+        "ORDER BY annotation_vote_tallies.consensus_score DESC NULLS LAST, "
+        "recording_annotations.id DESC"
+    ) in sql
+
+
+async def test_list_without_consensus_options_skips_the_join() -> None:
+    repo, execute = _list_repo()
+
+    await repo.list_annotations(uuid4())
+
+    assert "annotation_vote_tallies" not in _page_sql(execute)
+
+
+async def test_consensus_sorted_list_cursor_carries_the_score() -> None:
+    annotation = SimpleNamespace(id=uuid4(), tag=None)
+    annotation_repo = MagicMock()
+    annotation_repo.db = MagicMock()
+    annotation_repo.list_annotations = AsyncMock(return_value=([annotation], 5))
+    vote_repo = MagicMock()
+    vote_repo.list_tallies = AsyncMock(
+        return_value={annotation.id: _tally(agree_count=3, disagree_count=1, consensus_score=0.75)}
+    )
+    vote_repo.list_user_votes = AsyncMock(return_value={})
+    service = DetectionService(
+        annotation_repo=annotation_repo,
+        confirmed_region_repo=MagicMock(),
+        vote_repo=vote_repo,
+        recording_repo=MagicMock(),
+        tag_repo=MagicMock(),
+        detection_run_repo=MagicMock(),
+    )
+    service._to_response = MagicMock(return_value=MagicMock())  # type: ignore[method-assign]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "echoroo.services.detection.resolve_vernacular_names", AsyncMock(return_value={})
+        )
+        mp.setattr(
+            "echoroo.services.detection.DetectionListResponse",
+            lambda **kwargs: SimpleNamespace(**kwargs),
+        )
+        result = await service.list_detections(
+            uuid4(), page_size=1, sort_by="consensus_score", consensus=ConsensusStatus.AGREED
+        )
+
+    assert annotation_repo.list_annotations.await_args.kwargs["sort_by"] == "consensus_score"
+    assert annotation_repo.list_annotations.await_args.kwargs["consensus"] == (
+        ConsensusStatus.AGREED
+    )
+    cursor = decode_cursor(result.next_cursor, sort_key="consensus_score", descending=True)
+    assert (cursor.value, cursor.id) == (0.75, annotation.id)
@@ -0,0 +1,174 @@
+"""Unit tests for the S3 audio object cache.
+
+Covers :mod:`echoroo.services.audio._object_cache`, WAV layout parsing in
+:mod:`echoroo.services.audio._wav` and the ranged-read path of
+:class:`echoroo.services.audio.service.AudioService`:
+
+- LRU eviction honours the byte budget, the min-age guard and ``keep``.
+- Concurrent fetches of one key share a single download (single-flight).
+- Prefetch warms objects in the background.
+- Bounded windows of remote WAVs are decoded from a ranged GET without
+  mirroring the whole object.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from echoroo.core import s3 as s3_module
+from echoroo.services.audio._object_cache import AudioObjectCache
+from echoroo.services.audio._wav import parse_wav_layout
+from echoroo.services.audio.service import AudioService
+
+
+class _FakeS3:
+    """Minimal ``get_object`` stand-in serving in-memory objects."""
+
+    def __init__(self, objects: dict[str, bytes], delay: float = 0.0) -> None:
+        self.objects = objects
+        self.delay = delay
+        self.calls: list[tuple[str, str | None]] = []
+        self._lock = threading.Lock()
+
+    def get_object(self, Bucket: str, Key: str, Range: str | None = None) -> dict[str, Any]:  # noqa: N803
+        with self._lock:
+            self.calls.append((Key, Range))
+        if self.delay:
+            time.sleep(self.delay)
+        data = self.objects[Key]
+        if Range is not None:
+            first, last = Range.removeprefix("bytes=").split("-")
+            data = data[int(first) : int(last) + 1]
+        return {"Body": io.BytesIO(data)}
+
+
+def _wav_bytes(
+    *, samplerate: int = 16_000, duration_s: float = 4.0, channels: int = 1, subtype: str = "PCM_16"
+) -> bytes:
+    frames = int(samplerate * duration_s)
+    ramp = np.linspace(-0.9, 0.9, frames, dtype=np.float32)
+    data = np.stack([ramp] * channels, axis=1) if channels > 1 else ramp
+    buf = io.BytesIO()
+    sf.write(buf, data, samplerate, format="WAV", subtype=subtype)
+    return buf.getvalue()
+
+
+def _seed(cache: AudioObjectCache, key: str, size: int, mtime: float) -> Path:
+    path = cache.path_for(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\0" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.mark.parametrize(("channels", "subtype"), [(1, "PCM_16"), (2, "PCM_24"), (1, "FLOAT")])
+def test_parse_wav_layout(channels: int, subtype: str) -> None:
+    raw = _wav_bytes(channels=channels, subtype=subtype)
+    info = sf.info(io.BytesIO(raw))
+
+    layout = parse_wav_layout(raw[:4096])
+
+    assert layout is not None
+    assert layout.samplerate == info.samplerate
+    assert layout.channels == channels
+    assert layout.subtype == subtype
+    assert layout.frames == info.frames
+    assert layout.data_offset + layout.data_size == len(raw)
+
+
+def test_parse_wav_layout_rejects_non_wav() -> None:
+    assert parse_wav_layout(b"OggS" + b"\0" * 64) is None
+    assert parse_wav_layout(b"RIFF") is None
+
+
+def test_evict_removes_least_recently_used(tmp_path: Path) -> None:
+    cache = AudioObjectCache(tmp_path / "cache", max_bytes=2_500, min_age_seconds=0)
+    now = time.time()
+    old = _seed(cache, "p/old.wav", 1_000, now - 300)
+    mid = _seed(cache, "p/mid.wav", 1_000, now - 200)
+    new = _seed(cache, "p/new.wav", 1_000, now - 100)
+
+    assert cache.evict(keep=new) == [old]
+    assert mid.exists() and new.exists()
+    assert cache.usage() == 2_000
+
+
+def test_evict_spares_recently_used_objects(tmp_path: Path) -> None:
+    cache = AudioObjectCache(tmp_path / "cache", max_bytes=500, min_age_seconds=600)
+    hot = _seed(cache, "p/hot.wav", 1_000, time.time() - 10)
+
+    assert cache.evict() == []
+    assert hot.exists()
+
+
+def test_fetch_is_single_flight(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _FakeS3({"p/a.wav": b"x" * 10_000}, delay=0.05)
+    monkeypatch.setattr(s3_module, "get_s3_client", lambda: client)
+    cache = AudioObjectCache(tmp_path / "cache")
+
+    results: list[Path] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.fetch("p/a.wav"))) for _ in range(6)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(client.calls) == 1
+    assert {p.read_bytes() for p in results} == {b"x" * 10_000}
+
+
+def test_fetch_missing_object_leaves_no_partial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(s3_module, "get_s3_client", lambda: _FakeS3({}))
+    cache = AudioObjectCache(tmp_path / "cache")
+
+    with pytest.raises(FileNotFoundError):
+        cache.fetch("p/missing.wav")
+    assert cache._entries() == []
+
+
+def test_prefetch_downloads_in_background(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _FakeS3({f"p/{i}.wav": bytes([i]) * 100 for i in range(4)})
+    monkeypatch.setattr(s3_module, "get_s3_client", lambda: client)
+    cache = AudioObjectCache(tmp_path / "cache", prefetch_workers=2)
+
+    futures = cache.prefetch([f"p/{i}.wav" for i in range(4)])
+    paths = [f.result(timeout=5) for f in futures]
+
+    assert [p.read_bytes() for p in paths] == [bytes([i]) * 100 for i in range(4)]
+    # A second prefetch resolves from the cache without touching S3.
+    assert [f.result() for f in cache.prefetch(["p/0.wav"])] == [paths[0]]
+    assert len(client.calls) == 4
+
+
+def test_read_audio_window_uses_ranged_get(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    raw = _wav_bytes(samplerate=16_000, duration_s=4.0, channels=2)
+    key = "proj/ranged-window.wav"
+    client = _FakeS3({key: raw})
+    monkeypatch.setattr(s3_module, "get_s3_client", lambda: client)
+    service = AudioService(
+        audio_root=str(tmp_path / "audio"),
+        s3_audio_cache_dir=str(tmp_path / "cache"),
+    )
+
+    service.ensure_window_local(key, 1.0, 1.5)
+    data, samplerate = service.read_audio(key, start=1.0, end=1.5)
+
+    expected, _ = sf.read(io.BytesIO(raw), start=16_000, stop=24_000, dtype="float32")
+    assert samplerate == 16_000
+    np.testing.assert_allclose(data, expected)
+    # Only ranged reads were issued and nothing was mirrored locally.
+    assert all(rng is not None for _, rng in client.calls)
+    assert service.object_cache.lookup(key) is None
@@ -0,0 +1,183 @@
+"""Unit tests for the compressed playback cache.
+
+Covers :mod:`echoroo.services.audio._playback_cache` and the non-blocking
+lookup / scheduling helpers on
+:class:`echoroo.services.audio.service.AudioService`:
+
+- The OGG seek index maps times to page offsets and bounds Range windows
+  on page boundaries.
+- LRU eviction keeps the cache directory within its byte budget.
+- Scheduling a transcode is deduplicated through the ``.pending`` claim and
+  never blocks on ffmpeg.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from echoroo.services.audio._playback_cache import (
+    OggSeekIndex,
+    PlaybackCache,
+    build_ogg_seek_index,
+)
+from echoroo.services.audio.service import AudioService
+
+
+def _write_ogg(path: Path, *, samplerate: int = 48_000, duration_s: float = 20.0) -> Path:
+    """Write a Vorbis-encoded noise file (soundfile ships a Vorbis encoder)."""
+    rng = np.random.default_rng(0)
+    data = (0.1 * rng.standard_normal(int(samplerate * duration_s))).astype(np.float32)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sf.write(str(path), data, samplerate, format="OGG", subtype="VORBIS")
+    return path
+
+
+def _seed_entry(cache: PlaybackCache, recording_path: str, size: int, mtime: float) -> Path:
+    """Place a fake cached entry of ``size`` bytes with the given LRU time."""
+    cache.cache_dir.mkdir(parents=True, exist_ok=True)
+    ogg = cache.path_for(recording_path)
+    ogg.write_bytes(b"\0" * size)
+    os.utime(ogg, (mtime, mtime))
+    return ogg
+
+
+def test_seek_index_pages_and_duration(tmp_path: Path) -> None:
+    ogg = _write_ogg(tmp_path / "a.ogg", duration_s=20.0)
+
+    index = build_ogg_seek_index(ogg)
+
+    assert index.sample_rate == 48_000
+    assert index.total_bytes == ogg.stat().st_size
+    assert index.duration == pytest.approx(20.0, abs=0.05)
+    assert list(index.offsets) == sorted(index.offsets)
+    # Every indexed offset points at a page capture pattern.
+    raw = ogg.read_bytes()
+    assert all(raw[off : off + 4] == b"OggS" for off in index.offsets)
+
+
+def test_page_aligned_end_stops_on_page_boundary() -> None:
+    index = OggSeekIndex(
+        sample_rate=48_000,
+        offsets=(100, 4_100, 8_100, 12_100),
+        granules=(1_024, 2_048, 3_072, 4_096),
+        total_bytes=16_000,
+    )
+
+    # Window ends mid-page -> extended to just before the next page.
+    assert index.page_aligned_end(100, 5_000) == 8_099
+    # Window past the last page / file end -> capped at EOF.
+    assert index.page_aligned_end(12_100, 5_000) == 15_999
+
+
+def test_seek_index_json_roundtrip(tmp_path: Path) -> None:
+    index = build_ogg_seek_index(_write_ogg(tmp_path / "a.ogg", duration_s=3.0))
+
+    assert OggSeekIndex.from_json(index.to_json()) == index
+
+
+def test_seek_index_rejects_non_ogg(tmp_path: Path) -> None:
+    bogus = tmp_path / "x.ogg"
+    bogus.write_bytes(b"RIFF" + b"\0" * 64)
+
+    with pytest.raises(ValueError):
+        build_ogg_seek_index(bogus)
+
+
+def test_evict_removes_least_recently_used(tmp_path: Path) -> None:
+    cache = PlaybackCache(tmp_path / "cache", max_bytes=2_500)
+    now = time.time()
+    old = _seed_entry(cache, "rec/old.wav", 1_000, now - 300)
+    mid = _seed_entry(cache, "rec/mid.wav", 1_000, now - 200)
+    new = _seed_entry(cache, "rec/new.wav", 1_000, now - 100)
+
+    evicted = cache.evict(keep=new)
+
+    assert evicted == [old]
+    assert not old.exists()
+    assert mid.exists() and new.exists()
+    assert cache.usage() == 2_000
+
+
+def test_evict_keeps_entry_being_written(tmp_path: Path) -> None:
+    cache = PlaybackCache(tmp_path / "cache", max_bytes=500)
+    big = _seed_entry(cache, "rec/big.wav", 1_000, time.time() - 1_000)
+
+    assert cache.evict(keep=big) == []
+    assert big.exists()
+
+
+def test_lookup_refreshes_lru_timestamp(tmp_path: Path) -> None:
+    cache = PlaybackCache(tmp_path / "cache", max_bytes=0)
+    stale = time.time() - 3_600
+    ogg = _seed_entry(cache, "rec/a.wav", 10, stale)
+
+    assert cache.lookup("rec/a.wav") == ogg
+    assert ogg.stat().st_mtime > stale
+    assert cache.lookup("rec/missing.wav") is None
+
+
+def test_claim_pending_is_exclusive_until_released(tmp_path: Path) -> None:
+    cache = PlaybackCache(tmp_path / "cache", max_bytes=0)
+
+    assert cache.claim_pending("rec/a.wav") is True
+    assert cache.claim_pending("rec/a.wav") is False
+
+    cache.release_pending("rec/a.wav")
+    assert cache.claim_pending("rec/a.wav") is True
+
+
+def test_get_cached_playback_miss_does_not_transcode(tmp_path: Path) -> None:
+    service = AudioService(
+        audio_root=str(tmp_path / "audio"),
+        playback_cache_dir=str(tmp_path / "cache"),
+    )
+
+    assert service.get_cached_playback("rec/a.wav") is None
+    assert not (tmp_path / "cache").exists()
+
+
+def test_schedule_playback_transcode_dedupes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from echoroo.workers import playback_tasks
+
+    dispatched: list[Any] = []
+    def _publish(args: tuple[str], **options: Any) -> None:
+        assert options == {"retry": False}
+        dispatched.extend(args)
+
+    monkeypatch.setattr(playback_tasks.transcode_for_playback, "apply_async", _publish)
+    service = AudioService(
+        audio_root=str(tmp_path / "audio"),
+        playback_cache_dir=str(tmp_path / "cache"),
+    )
+
+    assert service.schedule_playback_transcode("rec/a.wav") is True
+    assert service.schedule_playback_transcode("rec/a.wav") is False
+    assert dispatched == ["rec/a.wav"]
+
+
+def test_schedule_playback_transcode_releases_claim_on_dispatch_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from echoroo.workers import playback_tasks
+
+    def _boom(args: tuple[str], **options: Any) -> None:
+        raise ConnectionError("broker down")
+
+    monkeypatch.setattr(playback_tasks.transcode_for_playback, "apply_async", _boom)
+    service = AudioService(
+        audio_root=str(tmp_path / "audio"),
+        playback_cache_dir=str(tmp_path / "cache"),
+    )
+
+    assert service.schedule_playback_transcode("rec/a.wav") is False
+    # The claim was released so the next play can retry the dispatch.
+    assert service.playback_cache.claim_pending("rec/a.wav") is True
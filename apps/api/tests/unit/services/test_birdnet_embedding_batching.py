@@ -0,0 +1,63 @@
+"""Unit tests for batched embedding extraction in :class:`BirdNETInference`.
+
+``get_embeddings_only`` backs the search query batcher, so a batch of
+segments must cost one ``encode()`` over one file, not one
+``encode()`` + ``predict()`` per segment. The birdnet model is replaced by
+a stub that reads the file it is given.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from echoroo.ml.birdnet.constants import EMBEDDING_DIM, SEGMENT_SAMPLES
+from echoroo.ml.birdnet.inference import BirdNETInference
+
+
+class _StubModel:
+    def __init__(self) -> None:
+        self.encoded: list[int] = []
+
+    def encode(self, path: str, **_kwargs: Any) -> np.ndarray:
+        audio, _rate = sf.read(path, dtype="float32")
+        windows = audio.reshape(-1, SEGMENT_SAMPLES)
+        self.encoded.append(len(windows))
+        # One "embedding" per 3 s window: its first sample, repeated.
+        return np.repeat(windows[:, :1], EMBEDDING_DIM, axis=1)[np.newaxis]
+
+    def predict(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("embedding extraction must not run the classifier")
+
+
+def _engine() -> tuple[BirdNETInference, _StubModel]:
+    engine = object.__new__(BirdNETInference)
+    model = _StubModel()
+    engine._model = model
+    engine._device = "CPU"
+    engine._batch_size = 0
+    return engine, model
+
+
+def test_get_embeddings_only_encodes_the_batch_once() -> None:
+    engine, model = _engine()
+    segments = [np.full(SEGMENT_SAMPLES, v, dtype=np.float32) for v in (0.25, -0.5, 0.75)]
+
+    embeddings = engine.get_embeddings_only(segments)
+
+    assert model.encoded == [3]
+    assert embeddings.shape == (3, EMBEDDING_DIM)
+    assert embeddings.dtype == np.float32
+    np.testing.assert_allclose(embeddings[:, 0], [0.25, -0.5, 0.75], atol=1e-4)
+
+
+def test_get_embeddings_only_rejects_bad_segments() -> None:
+    engine, model = _engine()
+
+    assert engine.get_embeddings_only([]).shape == (0, EMBEDDING_DIM)
+    with pytest.raises(ValueError, match="BirdNET expects"):
+        engine.get_embeddings_only([np.zeros(10, dtype=np.float32)])
+    assert model.encoded == []
@@ -0,0 +1,165 @@
+"""Unit tests for vectorized, idempotent clip generation.
+
+Covers :func:`echoroo.services.clip.plan_clip_windows` against the
+per-window loop it replaced, and
+:meth:`ClipService.generate_dataset_clips` with the recording and clip
+repositories replaced by in-memory fakes: the clip fake honours the
+``(recording_id, start_time, end_time)`` uniqueness that
+``ClipRepository.insert_windows`` relies on.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from echoroo.services import clip as clip_module
+from echoroo.services.clip import ClipGenerationStats, ClipService, plan_clip_windows
+
+
+def _loop_windows(
+    duration: float, clip_length: float, overlap: float, start: float, end: float | None
+) -> list[tuple[float, float]]:
+    stop = duration if end is None else min(duration, end)
+    step = clip_length - overlap
+    windows = []
+    k = 0
+    while start + k * step + clip_length <= stop:
+        windows.append((start + k * step, start + k * step + clip_length))
+        k += 1
+    return windows
+
+
+@pytest.mark.parametrize(
+    ("clip_length", "overlap", "start", "end"),
+    [
+        (3.0, 0.0, 0.0, None),
+        (5.0, 0.5, 0.0, 30.0),
+        (0.1, 0.0, 0.0, None),
+        (2.5, 1.25, 1.0, 17.5),
+        (60.0, 0.0, 0.0, None),
+    ],
+)
+def test_plan_matches_per_recording_loop(
+    clip_length: float, overlap: float, start: float, end: float | None
+) -> None:
+    durations = np.array([0.0, 2.9, 3.0, 30.0, 59.99, 60.0, 61.7])
+
+    index, starts, ends = plan_clip_windows(durations, clip_length, overlap, start, end)
+
+    planned = list(zip(index.tolist(), starts.tolist(), ends.tolist(), strict=True))
+    expected = [
+        (i, s, e)
+        for i, duration in enumerate(durations.tolist())
+        for s, e in _loop_windows(duration, clip_length, overlap, start, end)
+    ]
+    assert planned == expected
+
+
+class _FakeRecordings:
+    def __init__(self, durations: list[float]) -> None:
+        self.rows = list(zip(sorted(uuid4() for _ in durations), durations, strict=True))
+        self.pages = 0
+
+    async def list_durations_by_dataset(
+        self, dataset_id: UUID, after_id: UUID | None = None, limit: int = 1000
+    ) -> list[tuple[UUID, float]]:
+        self.pages += 1
+        rows = [row for row in self.rows if after_id is None or row[0] > after_id]
+        return rows[:limit]
+
+
+class _FakeClips:
+    def __init__(self) -> None:
+        self.clips: set[tuple[UUID, float, float]] = set()
+        self.batch_sizes: list[int] = []
+
+    async def insert_windows(self, windows: Sequence[tuple[UUID, float, float]]) -> int:
+        self.batch_sizes.append(len(windows))
+        new = set(windows) - self.clips
+        self.clips |= new
+        return len(new)
+
+
+def _service(durations: list[float]) -> tuple[ClipService, _FakeRecordings, _FakeClips]:
+    service = ClipService(MagicMock())
+    recordings, clips = _FakeRecordings(durations), _FakeClips()
+    service.recording_repo = recordings  # type: ignore[assignment]
+    service.repo = clips  # type: ignore[assignment]
+    return service, recordings, clips
+
+
+@pytest.mark.asyncio
+async def test_generate_dataset_clips_pages_batches_and_reports(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(clip_module, "DATASET_CLIP_RECORDING_PAGE", 2)
+    monkeypatch.setattr(clip_module, "DATASET_CLIP_WINDOW_BATCH", 15)
+    service, recordings, clips = _service([60.0, 30.0, 1.0, 2.0, 90.0, 45.0])
+    progress: list[tuple[int, int]] = []
+
+    async def on_batch(stats: ClipGenerationStats) -> None:
+        progress.append((stats.recordings_processed, stats.clips_created))
+
+    stats = await service.generate_dataset_clips(uuid4(), 3.0, on_batch=on_batch)
+
+    assert (stats.recordings_processed, stats.windows_planned, stats.clips_created) == (
+        6,
+        75,
+        75,
+    )
+    assert recordings.pages == 4
+    # The 60 s and 90 s recordings plan more than a batch, so each is
+    # planned alone and inserted in two batches.
+    assert clips.batch_sizes == [15, 5, 10, 0, 15, 15, 15]
+    assert progress == [(0, 15), (1, 20), (2, 30), (4, 30), (4, 45), (5, 60), (6, 75)]
+
+
+@pytest.mark.asyncio
+async def test_generate_dataset_clips_plans_a_page_in_runs_under_the_batch_size(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(clip_module, "DATASET_CLIP_WINDOW_BATCH", 25)
+    planned: list[int] = []
+    plan = clip_module.plan_clip_windows
+
+    def _plan(durations: np.ndarray, *args: float | None) -> tuple[np.ndarray, ...]:
+        windows = plan(durations, *args)
+        planned.append(len(windows[0]))
+        return windows
+
+    monkeypatch.setattr(clip_module, "plan_clip_windows", _plan)
+    # 10 + 10 + 20 + 5 + 5 + 5 windows of 3 s.
+    service, _recordings, clips = _service([30.0, 30.0, 60.0, 15.0, 15.0, 15.0])
+
+    stats = await service.generate_dataset_clips(uuid4(), 3.0)
+
+    assert planned == [20, 25, 10]
+    assert clips.batch_sizes == planned
+    assert stats.recordings_processed == 6
+    assert stats.clips_created == len(clips.clips) == 55
+
+
+@pytest.mark.asyncio
+async def test_generate_dataset_clips_is_idempotent() -> None:
+    service, _recordings, clips = _service([60.0, 30.0, 10.0])
+
+    first = await service.generate_dataset_clips(uuid4(), 5.0, overlap=2.5)
+    second = await service.generate_dataset_clips(uuid4(), 5.0, overlap=2.5)
+
+    assert first.clips_created == len(clips.clips) == 23 + 11 + 3
+    assert (second.windows_planned, second.clips_created) == (first.windows_planned, 0)
+
+
+@pytest.mark.asyncio
+async def test_generate_dataset_clips_validates_parameters() -> None:
+    service, recordings, _clips = _service([60.0])
+
+    with pytest.raises(ValueError, match="Overlap"):
+        await service.generate_dataset_clips(uuid4(), 3.0, overlap=3.0)
+
+    assert recordings.pages == 0
@@ -60,7 +60,9 @@ class _FakeAsyncClient:
     async def __aexit__(self, *exc: Any) -> None:
         return None
 
-    async def get(self, url: str, params: dict[str, Any] | None = None) -> _FakeResponse:
+    async def get(
+        self, url: str, params: dict[str, Any] | None = None, **_kwargs: Any
+    ) -> _FakeResponse:
         type(self).calls.append(url)
         for fragment, payload in self._routes.items():
             if fragment in url:
@@ -81,15 +83,6 @@ def _no_redis(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(GBIFService, "_cache_set", _set)
 
 
-@pytest.fixture(autouse=True)
-def _no_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Make the rate limiter a no-op so tests stay fast."""
-    async def _acquire(self: Any) -> None:
-        return None
-
-    monkeypatch.setattr(gbif_module.RateLimiter, "acquire", _acquire)
-
-
 def _install_client(
     monkeypatch: pytest.MonkeyPatch, routes: dict[str, dict[str, Any]]
 ) -> type[_FakeAsyncClient]:
@@ -527,16 +520,18 @@ async def test_en_us_locale_makes_no_enrichment_calls(
 
 
 @pytest.mark.asyncio
-async def test_gbif_vernacular_enrichment_uses_rate_limiter(
+async def test_gbif_vernacular_enrichment_uses_shared_gbif_client(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """The enrichment GBIF /vernacularNames GET goes through the limiter (F5)."""
-    acquired: list[int] = []
+    """The enrichment GBIF /vernacularNames GET shares the GBIF pool (F5)."""
+    used: list[str] = []
+    real_get_http_client = gbif_module.get_http_client
 
-    async def _counting_acquire(self: Any) -> None:
-        acquired.append(1)
+    def _recording(upstream: Any) -> Any:
+        used.append(upstream.name)
+        return real_get_http_client(upstream)
 
-    monkeypatch.setattr(gbif_module.RateLimiter, "acquire", _counting_acquire)
+    monkeypatch.setattr(gbif_module, "get_http_client", _recording)
 
     search_payload = {
         "results": [
@@ -567,8 +562,10 @@ async def test_gbif_vernacular_enrichment_uses_rate_limiter(
     results = await svc.search_species_full("limit", limit=10, locale="ja")
 
     assert results[0]["vernacular_name"] == "リミット鳥"
-    # At least the search acquire + the enrichment /vernacularNames acquire.
-    assert len(acquired) >= 2
+    # The search and the enrichment /vernacularNames GET both go through
+    # the GBIF client (and its concurrency cap); iNat uses its own.
+    assert used.count("gbif") >= 2
+    assert "inaturalist" in used
 
 
 @pytest.mark.asyncio
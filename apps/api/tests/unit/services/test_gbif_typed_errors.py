@@ -22,14 +22,6 @@ from echoroo.services import gbif as gbif_module
 from echoroo.services.gbif import GBIFService
 
 
-@pytest.fixture(autouse=True)
-def _no_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def _acquire(self: Any) -> None:
-        return None
-
-    monkeypatch.setattr(gbif_module.RateLimiter, "acquire", _acquire)
-
-
 class _OkResponse:
     def __init__(self, payload: dict[str, Any]) -> None:
         self._payload = payload
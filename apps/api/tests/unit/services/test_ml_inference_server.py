@@ -0,0 +1,198 @@
+"""Unit tests for the shared inference server.
+
+Covers :mod:`echoroo.ml.serving` end to end with the CPU stand-in backend:
+
+- :class:`MicroBatcher` coalesces concurrent requests into one model call,
+  splits oversized requests at ``max_batch`` and reports fill / queue stats.
+- The server answers ``describe`` / ``embed`` / ``stats`` over its Unix
+  socket, rejects unknown models and bad auth keys.
+- :meth:`InferenceClient.embed_file` decodes, resamples and frames audio
+  locally before sending segments.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from echoroo.ml.serving import (
+    InferenceClient,
+    InferenceServerUnavailable,
+    MicroBatcher,
+    ModelInfo,
+    UnknownModelError,
+    load_segments,
+)
+from echoroo.ml.serving.backends import StandInBackend
+from echoroo.ml.serving.server import InferenceServer
+
+_INFO = ModelInfo("perch", sample_rate=8_000, segment_samples=800, embedding_dim=8)
+_KEY = b"test-key"
+
+
+@pytest.fixture
+def backend() -> StandInBackend:
+    return StandInBackend(_INFO)
+
+
+@pytest.fixture
+def server(tmp_path: Path, backend: StandInBackend) -> Iterator[InferenceServer]:
+    srv = InferenceServer(
+        tmp_path / "inference.sock",
+        {"perch": backend},
+        _KEY,
+        max_batch=8,
+        max_wait=0.05,
+        stats_interval=0,
+    )
+    srv.serve_in_background()
+    yield srv
+    srv.close()
+
+
+def _segments(n: int, value: float) -> np.ndarray:
+    return np.full((n, _INFO.segment_samples), value, dtype=np.float32)
+
+
+def test_batcher_coalesces_concurrent_requests() -> None:
+    calls: list[int] = []
+
+    def embed(batch: np.ndarray) -> np.ndarray:
+        calls.append(batch.shape[0])
+        return batch[:, :2]
+
+    batcher = MicroBatcher(embed, max_batch=16, max_wait=0.2)
+    try:
+        futures = [batcher.submit(_segments(2, float(i))) for i in range(4)]
+        results = [f.result(timeout=5) for f in futures]
+    finally:
+        batcher.close()
+
+    assert calls == [8]
+    # Every caller gets exactly its own rows back.
+    for i, result in enumerate(results):
+        assert result.shape == (2, 2)
+        assert np.all(result == float(i))
+    stats = batcher.stats()
+    assert stats.requests == 4
+    assert stats.batches == 1
+    assert stats.batch_fill == pytest.approx(0.5)
+    assert stats.mean_requests_per_batch == pytest.approx(4.0)
+
+
+def test_batcher_splits_requests_larger_than_max_batch() -> None:
+    calls: list[int] = []
+
+    def embed(batch: np.ndarray) -> np.ndarray:
+        calls.append(batch.shape[0])
+        return batch[:, :1]
+
+    batcher = MicroBatcher(embed, max_batch=4, max_wait=0.0)
+    try:
+        result = batcher.submit(_segments(10, 1.0)).result(timeout=5)
+    finally:
+        batcher.close()
+
+    assert calls == [4, 4, 2]
+    assert result.shape == (10, 1)
+
+
+def test_batcher_propagates_model_errors() -> None:
+    def embed(batch: np.ndarray) -> np.ndarray:
+        raise RuntimeError("device lost")
+
+    batcher = MicroBatcher(embed, max_batch=4, max_wait=0.0)
+    try:
+        with pytest.raises(RuntimeError, match="device lost"):
+            batcher.submit(_segments(1, 0.0)).result(timeout=5)
+    finally:
+        batcher.close()
+
+
+def test_server_embeds_and_describes(server: InferenceServer, backend: StandInBackend) -> None:
+    client = InferenceClient(server.socket_path, _KEY, timeout=5)
+
+    assert client.describe("perch") == _INFO
+    result = client.embed_segments("perch", _segments(3, 0.5))
+
+    assert result.shape == (3, _INFO.embedding_dim)
+    np.testing.assert_allclose(result, 0.5)
+    assert backend.batch_sizes == [3]
+
+
+def test_server_coalesces_across_connections(
+    server: InferenceServer, backend: StandInBackend
+) -> None:
+    client = InferenceClient(server.socket_path, _KEY, timeout=5)
+    barrier = threading.Barrier(4)
+    results: dict[int, np.ndarray] = {}
+
+    def call(i: int) -> None:
+        barrier.wait()
+        results[i] = client.embed_segments("perch", _segments(1, float(i)))
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Four single-segment requests from four connections, fewer model calls.
+    assert sum(backend.batch_sizes) == 4
+    assert len(backend.batch_sizes) < 4
+    assert all(np.all(results[i] == float(i)) for i in range(4))
+    stats = client.stats()
+    assert stats["models"]["perch"]["requests"] == 4
+    assert stats["models"]["perch"]["queue_depth"] == 0
+
+
+def test_server_rejects_unknown_model(server: InferenceServer) -> None:
+    client = InferenceClient(server.socket_path, _KEY, timeout=5)
+
+    with pytest.raises(UnknownModelError):
+        client.embed_segments("birdnet", _segments(1, 0.0))
+
+
+def test_client_without_server_is_unavailable(tmp_path: Path) -> None:
+    client = InferenceClient(tmp_path / "missing.sock", _KEY, timeout=1)
+
+    with pytest.raises(InferenceServerUnavailable):
+        client.describe("perch")
+
+
+def test_client_with_wrong_key_is_rejected(server: InferenceServer) -> None:
+    client = InferenceClient(server.socket_path, b"wrong-key", timeout=1)
+
+    with pytest.raises(InferenceServerUnavailable):
+        client.describe("perch")
+
+
+def test_load_segments_resamples_and_frames(tmp_path: Path) -> None:
+    path = tmp_path / "clip.wav"
+    # 0.25 s of stereo audio at 16 kHz -> 2000 mono samples at 8 kHz.
+    sf.write(path, np.full((4_000, 2), 0.25, dtype=np.float32), 16_000)
+
+    segments = load_segments(path, sample_rate=8_000, segment_samples=800)
+
+    assert segments.shape == (2, 800)
+    assert segments.dtype == np.float32
+    # Short clips are zero-padded to a single segment.
+    assert load_segments(path, sample_rate=8_000, segment_samples=4_000).shape == (1, 4_000)
+
+
+def test_embed_file_round_trip(server: InferenceServer, tmp_path: Path) -> None:
+    path = tmp_path / "clip.wav"
+    sf.write(path, np.full(2_400, 0.5, dtype=np.float32), 8_000)
+    client = InferenceClient(server.socket_path, _KEY, timeout=5)
+
+    started = time.monotonic()
+    result = client.embed_file("perch", path)
+
+    assert result.shape == (3, _INFO.embedding_dim)
+    assert time.monotonic() - started < 5
@@ -0,0 +1,95 @@
+"""Unit tests for multi-file batching in :class:`PerchDirectInference`.
+
+The TensorFlow call is replaced by a recording stub so the decode pool,
+zero-copy framing, cross-file batch packing and per-file output mapping can
+be checked without model weights.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from echoroo.ml.perch.constants import SAMPLE_RATE, SEGMENT_SAMPLES
+from echoroo.ml.perch.direct_inference import PerchDirectInference, pack_segment_batches
+
+
+class _StubPerch(PerchDirectInference):
+    def __init__(self) -> None:
+        super().__init__(device="CPU")
+        self._encode_fn = object()
+        self.batch_shapes: list[tuple[int, ...]] = []
+
+    def encode_segments(self, segments: np.ndarray) -> np.ndarray:
+        self.batch_shapes.append(segments.shape)
+        # One "embedding" column: the segment's first sample.
+        return segments[:, :1].copy()
+
+
+def _write(path: Path, segment_values: list[float], sample_rate: int = SAMPLE_RATE) -> str:
+    samples_per_segment = SEGMENT_SAMPLES * sample_rate // SAMPLE_RATE
+    audio = np.concatenate(
+        [np.full(samples_per_segment, v, dtype=np.float32) for v in segment_values]
+    )
+    sf.write(path, audio, sample_rate)
+    return str(path)
+
+
+def test_chunk_into_segments_is_a_view() -> None:
+    audio = np.arange(SEGMENT_SAMPLES * 2 + 10, dtype=np.float32)
+
+    segments = PerchDirectInference._chunk_into_segments(audio)
+
+    assert segments.shape == (2, SEGMENT_SAMPLES)
+    assert np.shares_memory(segments, audio)
+    assert segments[1, 0] == SEGMENT_SAMPLES
+
+
+def test_pack_segment_batches_spans_files_and_pads_tail() -> None:
+    blocks = [
+        (0, np.full((3, 4), 0.0, dtype=np.float32)),
+        (1, np.full((4, 4), 1.0, dtype=np.float32)),
+        (2, np.full((2, 4), 2.0, dtype=np.float32)),
+    ]
+
+    batches = list(pack_segment_batches(blocks, batch_size=4))
+
+    assert [b.shape[0] for b, _ in batches] == [4, 4, 1]
+    assert batches[0][1] == [(0, 3), (1, 1)]
+    assert batches[1][1] == [(1, 3), (2, 1)]
+    assert batches[2][1] == [(2, 1)]
+
+    # A partial tail is padded to the next power of two, not to batch_size.
+    tail = list(pack_segment_batches([(0, np.ones((3, 4), dtype=np.float32))], 16))
+    assert tail[0][0].shape == (4, 4)
+    assert not tail[0][0][3].any()
+
+
+def test_encode_audio_files_maps_outputs_back_per_file(tmp_path: Path) -> None:
+    paths = [
+        _write(tmp_path / "a.wav", [0.1, 0.2, 0.3]),
+        _write(tmp_path / "b.wav", [0.4]),
+        # Resampled from 16 kHz on a decode thread.
+        _write(tmp_path / "c.wav", [0.5, 0.6], sample_rate=16_000),
+    ]
+    engine = _StubPerch()
+
+    results = engine.encode_audio_files(paths, batch_size=4, decode_workers=3)
+
+    # Six segments from three files: one full batch and a padded pair.
+    assert engine.batch_shapes == [(4, SEGMENT_SAMPLES), (2, SEGMENT_SAMPLES)]
+    assert [r.shape[0] for r in results] == [3, 1, 2]
+    np.testing.assert_allclose(results[0][:, 0], [0.1, 0.2, 0.3], atol=1e-3)
+    np.testing.assert_allclose(results[1][:, 0], [0.4], atol=1e-3)
+    np.testing.assert_allclose(results[2][:, 0], [0.5, 0.6], atol=0.05)
+
+
+def test_encode_audio_files_matches_single_file_path(tmp_path: Path) -> None:
+    path = _write(tmp_path / "a.wav", [0.25, 0.75])
+    engine = _StubPerch()
+
+    (batched,) = engine.encode_audio_files([path])
+
+    np.testing.assert_array_equal(batched, engine.encode_audio_file(path))
@@ -0,0 +1,97 @@
+"""Unit tests for in-process query batching in ``search_by_audio_file``.
+
+With the inference server disabled, concurrent audio-file searches must share
+model calls through the per-model :class:`MicroBatcher` instead of each
+running its own ``predict_file``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from echoroo.services import search as search_module
+from echoroo.services.search import SimilaritySearchService
+
+pytestmark = pytest.mark.asyncio
+
+_SAMPLE_RATE = 8_000
+_SEGMENT_SAMPLES = 800
+
+
+class _FakeEngine:
+    def __init__(self) -> None:
+        self.specification = SimpleNamespace(
+            sample_rate=_SAMPLE_RATE, segment_samples=_SEGMENT_SAMPLES
+        )
+        self.batch_sizes: list[int] = []
+
+    def get_embeddings_only(self, segments: list[np.ndarray]) -> np.ndarray:
+        self.batch_sizes.append(len(segments))
+        return np.stack([np.full(4, seg[0], dtype=np.float32) for seg in segments])
+
+    def predict_file(self, path: Path) -> Any:
+        raise AssertionError("search must not fall back to per-request predict_file")
+
+
+@pytest.fixture
+def engine(monkeypatch: pytest.MonkeyPatch) -> _FakeEngine:
+    fake = _FakeEngine()
+    monkeypatch.setattr(search_module, "_get_or_load_model", lambda _name: (None, fake))
+    monkeypatch.setattr(search_module, "_query_batchers", {})
+    monkeypatch.setattr(
+        search_module,
+        "get_settings",
+        lambda: SimpleNamespace(SEARCH_EMBED_MAX_BATCH=16, SEARCH_EMBED_MAX_WAIT_MS=200.0),
+    )
+    monkeypatch.setattr("echoroo.ml.serving.get_inference_client", lambda: None)
+    return fake
+
+
+def _clip(tmp_path: Path, name: str, value: float, seconds: float = 0.3) -> str:
+    path = tmp_path / name
+    sf.write(path, np.full(int(_SAMPLE_RATE * seconds), value, dtype=np.float32), _SAMPLE_RATE)
+    return str(path)
+
+
+async def test_concurrent_searches_share_one_model_call(
+    engine: _FakeEngine, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    queries: list[list[float]] = []
+
+    async def fake_search_by_vector(self: Any, **kwargs: Any) -> list[Any]:
+        queries.append(kwargs["query_vector"])
+        return []
+
+    monkeypatch.setattr(SimilaritySearchService, "search_by_vector", fake_search_by_vector)
+    service = SimilaritySearchService(db=None)  # type: ignore[arg-type]
+    paths = [_clip(tmp_path, f"q{i}.wav", 0.1 * (i + 1)) for i in range(4)]
+
+    await asyncio.gather(*(service.search_by_audio_file(uuid4(), path, "perch") for path in paths))
+
+    # Four searches, one engine call; each three-segment clip queues only its
+    # first segment.
+    assert engine.batch_sizes == [4]
+    assert sorted(round(q[0], 3) for q in queries) == [0.1, 0.2, 0.3, 0.4]
+    # Query vectors are still padded to the storage dimension.
+    assert all(len(q) == search_module._STORAGE_EMBEDDING_DIM for q in queries)
+
+
+async def test_model_errors_reach_the_caller(
+    engine: _FakeEngine, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def broken(segments: list[np.ndarray]) -> np.ndarray:
+        raise RuntimeError("device lost")
+
+    monkeypatch.setattr(engine, "get_embeddings_only", broken)
+    service = SimilaritySearchService(db=None)  # type: ignore[arg-type]
+
+    with pytest.raises(RuntimeError, match="device lost"):
+        await service.search_by_audio_file(uuid4(), _clip(tmp_path, "q.wav", 0.5), "perch")
@@ -24,7 +24,7 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
@@ -284,6 +284,47 @@ async def test_apply_audit_swallows_inner_failure_via_rollback(
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("direction", "status", "bumped"),
+    [
+        (TaxonOverrideDirection.STRICTER, TaxonOverrideApprovalStatus.APPLIED, True),
+        (
+            TaxonOverrideDirection.LOOSER,
+            TaxonOverrideApprovalStatus.PENDING_SUPERUSER_APPROVAL,
+            False,
+        ),
+    ],
+)
+async def test_apply_hook_bumps_version_only_for_live_override(
+    direction: TaxonOverrideDirection,
+    status: TaxonOverrideApprovalStatus,
+    bumped: bool,
+) -> None:
+    """An applied (stricter) override invalidates every snapshot; a pending one does not."""
+    outcome = TaxonOverrideApplyOutcome(
+        override=_StubOverride(direction=direction, approval_status=status),  # type: ignore[arg-type]
+        actor_user_id=uuid4(),
+        project_id=uuid4(),
+        audit_action="project.taxon_override.create_stricter",
+        audit_detail={"override_id": str(uuid4())},
+    )
+
+    @asynccontextmanager
+    async def _failing_factory() -> Any:
+        raise RuntimeError("audit session unreachable")
+        yield None  # pragma: no cover - unreachable
+
+    bump = AsyncMock()
+    with (
+        patch.object(svc, "bump_sensitivity_version", bump),
+        patch.object(svc, "AsyncSessionLocal", _failing_factory),
+    ):
+        await trigger_apply_post_commit_audit(outcome)
+
+    assert bump.await_count == (1 if bumped else 0)
+
+
 # ---------------------------------------------------------------------------
 # trigger_decision_post_commit_audit — both project + platform soft-alert
 # branches.
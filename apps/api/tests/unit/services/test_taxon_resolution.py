@@ -0,0 +1,173 @@
+"""Unit tests for cache-first GBIF taxon resolution.
+
+Covers :mod:`echoroo.services.taxon_resolution` and
+:meth:`TaxonService.resolve_dataset_taxa` against the local GBIF fixture
+server (:mod:`tests._gbif_fixture`), with the ``taxon_resolution_cache``
+table replaced by an in-memory repository honouring ``expires_at``:
+
+- A bulk pass collapses duplicate names and calls GBIF once per distinct
+  name; a second pass is served entirely from the cache, misses included.
+- Expired rows are re-resolved; upstream failures are never cached and a
+  run of them stops the pass from calling GBIF further.
+- Vernacular names are fetched once per match and then served per locale.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from echoroo.core.settings import get_settings
+from echoroo.models.taxon_resolution import TaxonResolution
+from echoroo.services import taxon_resolution
+from echoroo.services.taxon import TaxonService
+from echoroo.services.taxon_resolution import TaxonResolver
+from tests._gbif_fixture import GBIFFixtureServer
+
+
+class _MemoryCache:
+    """In-memory ``TaxonResolutionRepository``."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[str, Any]] = {}
+
+    async def get_fresh(
+        self, name_keys: Collection[str], now: datetime
+    ) -> dict[str, TaxonResolution]:
+        return {
+            key: TaxonResolution(**self.rows[key])
+            for key in name_keys
+            if key in self.rows and self.rows[key]["expires_at"] > now
+        }
+
+    async def upsert(self, rows: Sequence[dict[str, Any]]) -> None:
+        for row in rows:
+            self.rows[row["name_key"]] = dict(row)
+
+    async def set_vernacular_names(
+        self, name_key: str, vernacular_names: dict[str, list[str]]
+    ) -> None:
+        self.rows[name_key]["vernacular_names"] = vernacular_names
+
+
+@pytest.fixture
+def gbif(monkeypatch: pytest.MonkeyPatch) -> GBIFFixtureServer:
+    server = GBIFFixtureServer(
+        {
+            "Parus major": (9705453, {"en": ["Great Tit"], "ja": ["シジュウカラ"]}),
+            "Turdus merula": (6171845, {"en": ["Eurasian Blackbird"]}),
+        }
+    )
+    server.install(monkeypatch)
+    return server
+
+
+def _resolver() -> TaxonResolver:
+    resolver = TaxonResolver(MagicMock())
+    resolver.cache = _MemoryCache()  # type: ignore[assignment]
+    return resolver
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_deduplicates_and_caches_hits_and_misses(
+    gbif: GBIFFixtureServer,
+) -> None:
+    resolver = _resolver()
+    names = ["Parus major", "parus  major", "Turdus merula", "Nonexistent speciesus"] * 50
+
+    first = await resolver.resolve_many(names)
+
+    assert sum(gbif.match_calls.values()) == 3
+    assert (first.cache_hits, first.fetched, first.errored) == (0, 3, set())
+    parus = first.get("PARUS MAJOR")
+    assert parus is not None
+    assert (parus.taxon_key, parus.scientific_name) == (9705453, "Parus major")
+    assert parus.metadata == {"kingdom": "Animalia", "genus": "Parus"}
+    assert first.get("Nonexistent speciesus") is None
+
+    second = await _resolver_sharing(resolver).resolve_many(names)
+
+    assert sum(gbif.match_calls.values()) == 3
+    assert (second.cache_hits, second.fetched) == (3, 0)
+    assert second.get("Turdus merula") == first.get("Turdus merula")
+    assert second.get("Nonexistent speciesus") is None
+
+
+def _resolver_sharing(resolver: TaxonResolver) -> TaxonResolver:
+    other = TaxonResolver(MagicMock())
+    other.cache = resolver.cache
+    return other
+
+
+@pytest.mark.asyncio
+async def test_expired_misses_are_resolved_again(
+    gbif: GBIFFixtureServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(get_settings(), "TAXON_RESOLUTION_MISS_TTL_DAYS", 0)
+    resolver = _resolver()
+
+    await resolver.resolve_many(["Parus major", "Nonexistent speciesus"])
+    await resolver.resolve_many(["Parus major", "Nonexistent speciesus"])
+
+    assert gbif.match_calls == {"Parus major": 1, "Nonexistent speciesus": 2}
+
+
+@pytest.mark.asyncio
+async def test_upstream_failures_are_not_cached_and_stop_the_pass(
+    gbif: GBIFFixtureServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(taxon_resolution, "_OUTAGE_THRESHOLD", 3)
+    resolver = _resolver()
+    gbif.down = True
+    names = [f"Down speciesus {i}" for i in range(10)]
+
+    batch = await resolver.resolve_many(names, concurrency=1)
+
+    assert len(gbif.requests) == 3
+    assert all(batch.failed(name) for name in names)
+    assert resolver.cache.rows == {}  # type: ignore[attr-defined]
+
+    gbif.down = False
+    retry = await resolver.resolve_many(["Parus major"])
+    assert retry.get("Parus major") is not None
+
+
+@pytest.mark.asyncio
+async def test_vernacular_names_are_fetched_once_per_match(gbif: GBIFFixtureServer) -> None:
+    resolver = _resolver()
+    match = await resolver.resolve("Parus major")
+    assert match is not None
+
+    ja = await resolver.vernacular_names("Parus major", match.taxon_key, ["ja"])
+    en = await resolver.vernacular_names("parus major", match.taxon_key, ["en"])
+
+    assert ja == [{"locale": "ja", "name": "シジュウカラ"}]
+    assert en == [{"locale": "en", "name": "Great Tit"}]
+    assert gbif.vernacular_calls == 1
+    assert await resolver.resolve("Parus major") == match
+    assert sum(gbif.match_calls.values()) == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_dataset_taxa_applies_one_bulk_pass(gbif: GBIFFixtureServer) -> None:
+    taxa = [
+        MagicMock(scientific_name=name, gbif_taxon_key=None, rank=None, gbif_metadata=None)
+        for name in ("Parus major", "Turdus merula", "Nonexistent speciesus")
+    ]
+    repo = MagicMock()
+    repo.get_unresolved_for_dataset = AsyncMock(return_value=taxa)
+    repo.update = AsyncMock()
+    service = TaxonService(taxon_repo=repo, resolver=_resolver())
+
+    result = await service.resolve_dataset_taxa(uuid4())
+
+    assert (result.resolved, result.errored) == (2, 0)
+    assert [t.gbif_taxon_key for t in taxa] == [9705453, 6171845, None]
+    assert all(t.gbif_resolved_at is not None for t in taxa)
+    assert repo.update.await_count == 3
+    assert sum(gbif.match_calls.values()) == 3
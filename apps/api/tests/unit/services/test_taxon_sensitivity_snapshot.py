@@ -0,0 +1,173 @@
+"""Unit tests for the process-wide taxon sensitivity / override snapshot.
+
+The bulk loaders must serve steady-state requests from the versioned
+snapshot without touching the database, reload it when the Redis version
+counter moves (or the snapshot ages out), and fall back to the
+per-request SELECTs when Redis is unavailable.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from echoroo.core.permissions import H3_RES_2, H3_RES_5, H3_RES_7, H3_RES_9
+from echoroo.models.enums import TaxonOverrideApprovalStatus, TaxonOverrideDirection
+from echoroo.services import taxon_sensitivity_service as svc
+
+pytestmark = pytest.mark.asyncio
+
+_REDIS = "echoroo.services.taxon_sensitivity_service.get_redis_connection"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches() -> Iterator[None]:
+    svc._SNAPSHOT = None
+    svc.reset_request_cache()
+    yield
+    svc._SNAPSHOT = None
+    svc.reset_request_cache()
+
+
+def _redis(version: str | None) -> AsyncMock:
+    client = MagicMock()
+    client.get = AsyncMock(return_value=version)
+    client.incr = AsyncMock(return_value=1)
+    return AsyncMock(return_value=client)
+
+
+def _override(project_id: object, taxon_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        project_id=project_id,
+        taxon_id=taxon_id,
+        sensitivity_h3_res=H3_RES_2,
+        direction=TaxonOverrideDirection.STRICTER,
+        approval_status=TaxonOverrideApprovalStatus.APPLIED,
+    )
+
+
+def _session(sensitivity_rows: list[tuple[str, int]], overrides: list[object]) -> MagicMock:
+    sensitivity = MagicMock()
+    sensitivity.all.return_value = sensitivity_rows
+    override = MagicMock()
+    override.scalars.return_value.all.return_value = overrides
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[sensitivity, override] * 3)
+    return session
+
+
+async def test_snapshot_serves_both_maps_with_one_load() -> None:
+    project_id = uuid4()
+    session = _session(
+        [("t1", H3_RES_9), ("t1", H3_RES_5), ("t2", H3_RES_7)],
+        [_override(project_id, "t2"), _override(uuid4(), "t1")],
+    )
+
+    with patch(_REDIS, _redis("4")):
+        sensitivity = await svc.bulk_load_sensitivity_map(
+            session, {"t1", "t2", "t3"}, iucn_fail_safe_active=True
+        )
+        overrides = await svc.bulk_load_override_map(session, project_id, {"t1", "t2"})
+
+    assert sensitivity == {"t1": H3_RES_5, "t2": H3_RES_7, "t3": H3_RES_7}
+    assert list(overrides) == [(project_id, "t2")]
+    assert isinstance(overrides[(project_id, "t2")], svc.OverrideSnapshot)
+    assert overrides[(project_id, "t2")].sensitivity_h3_res == H3_RES_2
+    # One whole-table load, no per-request SELECTs.
+    assert session.execute.await_count == 2
+
+
+async def test_unchanged_version_skips_the_database() -> None:
+    session = _session([("t1", H3_RES_5)], [])
+    redis = _redis("4")
+
+    with patch(_REDIS, redis):
+        await svc.bulk_load_sensitivity_map(session, {"t1"}, iucn_fail_safe_active=False)
+        svc.reset_request_cache()
+        result = await svc.bulk_load_sensitivity_map(
+            session, {"t1", "t9"}, iucn_fail_safe_active=False
+        )
+
+    assert result == {"t1": H3_RES_5, "t9": H3_RES_9}
+    assert session.execute.await_count == 2
+    assert redis.return_value.get.await_count == 2
+
+
+async def test_version_is_checked_once_per_request() -> None:
+    session = _session([], [])
+    redis = _redis(None)
+
+    with patch(_REDIS, redis):
+        await svc.bulk_load_sensitivity_map(session, {"t1"}, iucn_fail_safe_active=False)
+        await svc.bulk_load_override_map(session, uuid4(), {"t1"})
+
+    redis.return_value.get.assert_awaited_once_with(svc.SENSITIVITY_VERSION_REDIS_KEY)
+
+
+async def test_version_bump_reloads_the_snapshot() -> None:
+    session = _session([("t1", H3_RES_9)], [])
+
+    with patch(_REDIS, _redis("1")):
+        await svc.bulk_load_sensitivity_map(session, {"t1"}, iucn_fail_safe_active=False)
+    svc.reset_request_cache()
+    with patch(_REDIS, _redis("2")):
+        await svc.bulk_load_sensitivity_map(session, {"t1"}, iucn_fail_safe_active=False)
+
+    assert session.execute.await_count == 4
+    assert svc._SNAPSHOT is not None and svc._SNAPSHOT.version == 2
+
+
+async def test_stale_snapshot_is_reloaded_after_max_age() -> None:
+    session = _session([("t1", H3_RES_9)], [])
+
+    with patch(_REDIS, _redis("1")):
+        await svc.bulk_load_sensitivity_map(session, {"t1"}, iucn_fail_safe_active=False)
+        svc.reset_request_cache()
+        with patch.object(svc.time, "monotonic", return_value=svc._SNAPSHOT.loaded_at + 1_000):
+            await svc.bulk_load_sensitivity_map(session, {"t1"}, iucn_fail_safe_active=False)
+
+    assert session.execute.await_count == 4
+
+
+async def test_redis_outage_falls_back_to_request_scoped_selects() -> None:
+    project_id = uuid4()
+    sensitivity = MagicMock()
+    sensitivity.all.return_value = [("t1", H3_RES_5)]
+    overrides = MagicMock()
+    overrides.scalars.return_value.all.return_value = [_override(project_id, "t1")]
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[sensitivity, overrides])
+
+    with patch(_REDIS, AsyncMock(side_effect=ConnectionError("redis down"))):
+        result = await svc.bulk_load_sensitivity_map(
+            session, {"t1", "t2"}, iucn_fail_safe_active=False
+        )
+        override_map = await svc.bulk_load_override_map(session, project_id, {"t1"})
+
+    assert result == {"t1": H3_RES_5, "t2": H3_RES_9}
+    assert override_map[(project_id, "t1")].direction == TaxonOverrideDirection.STRICTER
+    assert svc._SNAPSHOT is None
+
+
+async def test_bump_increments_counter_and_drops_local_snapshot() -> None:
+    session = _session([], [])
+    redis = _redis("3")
+
+    with patch(_REDIS, redis):
+        await svc.bulk_load_sensitivity_map(session, {"t1"}, iucn_fail_safe_active=False)
+        await svc.bump_sensitivity_version()
+
+    redis.return_value.incr.assert_awaited_once_with(svc.SENSITIVITY_VERSION_REDIS_KEY)
+    assert svc._SNAPSHOT is None
+
+
+async def test_bump_survives_redis_outage() -> None:
+    with patch(_REDIS, AsyncMock(side_effect=ConnectionError("redis down"))):
+        await svc.bump_sensitivity_version()
+
+    assert svc._SNAPSHOT is None
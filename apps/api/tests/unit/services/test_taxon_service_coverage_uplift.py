@@ -42,6 +42,9 @@ def _make_taxon_repo() -> MagicMock:
     repo.persist_vernacular_names = AsyncMock(return_value=0)
     repo.has_vernacular_in_locale = AsyncMock(return_value=False)
     repo.db = MagicMock()
+    # The taxon-resolution cache reads/writes through ``repo.db``; an empty
+    # result means every name misses the cache and reaches ``resolve_taxon``.
+    repo.db.execute = AsyncMock(return_value=MagicMock())
     return repo
 
 
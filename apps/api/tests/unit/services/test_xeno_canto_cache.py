@@ -0,0 +1,150 @@
+"""Unit tests for the Xeno-canto media cache.
+
+Covers :mod:`echoroo.services.xeno_canto_cache`:
+
+- Stored entries round-trip with their upstream validators and age.
+- Eviction is LRU and makes room for an announced Content-Length before
+  the download is written.
+- Bodies that cannot fit the budget are never published.
+- Temp files orphaned by a dead writer are swept on eviction.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+from echoroo.services.xeno_canto_cache import XenoCantoMediaCache
+
+
+def _seed(cache: XenoCantoMediaCache, resource: str, size: int, mtime: float) -> Path:
+    """Store a ``size``-byte entry and backdate its LRU timestamp."""
+    entry = cache.store(resource, b"\0" * size, content_type="audio/mpeg")
+    assert entry is not None
+    os.utime(entry.path, (mtime, mtime))
+    return entry.path
+
+
+def test_store_and_lookup_round_trip(tmp_path: Path) -> None:
+    cache = XenoCantoMediaCache(tmp_path / "cache", max_bytes=10_000)
+
+    cache.store(
+        "audio/1",
+        b"mp3-bytes",
+        content_type="audio/mpeg",
+        etag='"abc"',
+        last_modified="Mon, 19 Oct 2026 00:00:00 GMT",
+    )
+    entry = cache.lookup("audio/1")
+
+    assert entry is not None
+    assert entry.path.read_bytes() == b"mp3-bytes"
+    assert (entry.size, entry.content_type) == (9, "audio/mpeg")
+    assert entry.is_fresh(60)
+    assert not entry.is_fresh(0)
+    assert entry.validator_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 19 Oct 2026 00:00:00 GMT",
+    }
+    assert cache.lookup("audio/2") is None
+
+
+def test_mark_validated_redates_entry(tmp_path: Path) -> None:
+    cache = XenoCantoMediaCache(tmp_path / "cache", max_bytes=10_000)
+    cache.store("audio/1", b"x", content_type="audio/mpeg")
+    meta_path = cache.meta_path("audio/1")
+    meta = json.loads(meta_path.read_text())
+    meta["validated_at"] = time.time() - 7_200
+    meta_path.write_text(json.dumps(meta))
+    stale = cache.lookup("audio/1")
+    assert stale is not None and not stale.is_fresh(3_600)
+
+    refreshed = cache.mark_validated("audio/1")
+
+    assert refreshed is not None and refreshed.is_fresh(3_600)
+
+
+def test_evict_removes_least_recently_used(tmp_path: Path) -> None:
+    cache = XenoCantoMediaCache(tmp_path / "cache", max_bytes=100_000)
+    now = time.time()
+    old = _seed(cache, "audio/old", 1_000, now - 300)
+    mid = _seed(cache, "audio/mid", 1_000, now - 200)
+    new = _seed(cache, "audio/new", 1_000, now - 100)
+    cache.max_bytes = cache.usage() - 1
+
+    assert cache.evict(keep=new) == [old]
+    assert not old.exists() and not cache.meta_path("audio/old").exists()
+    assert mid.exists() and new.exists()
+
+
+def test_writer_makes_room_for_announced_content_length(tmp_path: Path) -> None:
+    cache = XenoCantoMediaCache(tmp_path / "cache", max_bytes=100_000)
+    now = time.time()
+    old = _seed(cache, "audio/old", 1_000, now - 300)
+    new = _seed(cache, "audio/new", 1_000, now - 100)
+    cache.max_bytes = cache.usage() + 500
+
+    writer = cache.writer("audio/big", content_type="audio/mpeg", content_length=900)
+
+    # The oldest entry went before a byte of the new body was written.
+    assert writer is not None
+    assert not old.exists() and new.exists()
+    writer.write(b"\0" * 900)
+    assert writer.commit() is not None
+    assert cache.lookup("audio/big") is not None
+
+
+def test_bodies_larger_than_the_budget_are_not_cached(tmp_path: Path) -> None:
+    cache = XenoCantoMediaCache(tmp_path / "cache", max_bytes=1_000)
+
+    assert cache.writer("audio/1", content_type="audio/mpeg", content_length=5_000) is None
+
+    # Unknown length: the writer gives up once the body outgrows the budget.
+    writer = cache.writer("audio/2", content_type="audio/mpeg")
+    assert writer is not None
+    writer.write(b"\0" * 800)
+    writer.write(b"\0" * 800)
+    assert writer.aborted
+    assert writer.commit() is None
+    assert cache.lookup("audio/2") is None
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_eviction_sweeps_orphaned_temp_files(tmp_path: Path) -> None:
+    cache = XenoCantoMediaCache(tmp_path / "cache", max_bytes=10_000)
+    orphan = cache.writer("audio/dead", content_type="audio/mpeg")
+    live = cache.writer("audio/live", content_type="audio/mpeg")
+    assert orphan is not None and live is not None
+    orphan.write(b"partial")
+    live.write(b"partial")
+    orphan_path = orphan._tmp_path
+    stale = time.time() - 7_200
+    os.utime(orphan_path, (stale, stale))
+
+    cache.store("audio/1", b"x", content_type="audio/mpeg")
+
+    # Only the untouched temp file goes; the in-progress download survives.
+    assert not orphan_path.exists()
+    assert live._tmp_path.exists()
+    live.write(b"-rest")
+    assert live.commit() is not None
+
+
+def test_torn_entry_is_a_miss(tmp_path: Path) -> None:
+    cache = XenoCantoMediaCache(tmp_path / "cache", max_bytes=10_000)
+    entry = cache.store("sonogram/a", b"png-bytes", content_type="image/png")
+    assert entry is not None
+
+    entry.path.write_bytes(b"png")
+
+    assert cache.lookup("sonogram/a") is None
+
+
+def test_zero_budget_disables_the_cache(tmp_path: Path) -> None:
+    cache = XenoCantoMediaCache(tmp_path / "cache", max_bytes=0)
+
+    assert cache.store("audio/1", b"x", content_type="audio/mpeg") is None
+    assert cache.lookup("audio/1") is None
+    assert not (tmp_path / "cache").exists()
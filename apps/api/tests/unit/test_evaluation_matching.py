@@ -8,12 +8,19 @@ brief to serve as regression guards for the core evaluation logic.
 
 from __future__ import annotations
 
+import random
 from typing import Any
 from uuid import UUID, uuid4
 
 import pytest
 
-from echoroo.workers.evaluation_tasks import _overlaps, _safe_div, _score
+from echoroo.workers.evaluation_tasks import (
+    _GroundTruthIndex,
+    _overlaps,
+    _pr_curve,
+    _safe_div,
+    _score,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -306,3 +313,83 @@ class TestScoreMultiSpeciesBreakdown:
         assert overall["fp"] == 0
         assert overall["tp_recall"] == 2
         assert overall["fn"] == 1
+
+
+# ---------------------------------------------------------------------------
+# _score — indexed matcher agrees with the pairwise definition
+# ---------------------------------------------------------------------------
+
+
+def _brute_force_counts(
+    gts: list[dict[str, Any]], dets: list[dict[str, Any]]
+) -> dict[UUID, tuple[int, int, int, int]]:
+    counts: dict[UUID, list[int]] = {}
+    for det in dets:
+        row = counts.setdefault(det["taxon_id"], [0, 0, 0, 0])
+        row[0 if any(_overlaps(det, gt) for gt in gts) else 1] += 1
+    for gt in gts:
+        row = counts.setdefault(gt["taxon_id"], [0, 0, 0, 0])
+        row[2 if any(_overlaps(det, gt) for det in dets) else 3] += 1
+    return {taxon: (r[0], r[1], r[2], r[3]) for taxon, r in counts.items()}
+
+
+class TestScoreMatchesPairwiseDefinition:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_sets(self, seed: int) -> None:
+        rng = random.Random(seed)
+        recs = [uuid4() for _ in range(3)]
+        taxa = [uuid4() for _ in range(3)]
+
+        def _interval() -> tuple[float, float]:
+            start = rng.uniform(0, 60)
+            # Includes zero-length intervals, which never overlap.
+            return start, start + rng.choice([0.0, 0.5, 3.0, 10.0])
+
+        gts = [_gt(rng.choice(recs), *_interval(), rng.choice(taxa)) for _ in range(40)]
+        dets = [_det(rng.choice(recs), *_interval(), rng.choice(taxa)) for _ in range(60)]
+
+        rows = _score(_MODEL_REF, gts, dets, gt_index=_GroundTruthIndex(gts))
+
+        for taxon, expected in _brute_force_counts(gts, dets).items():
+            row = _extract(rows, taxon)
+            assert (row["tp_precision"], row["fp"], row["tp_recall"], row["fn"]) == expected
+
+
+# ---------------------------------------------------------------------------
+# Precision / recall curve
+# ---------------------------------------------------------------------------
+
+
+class TestPRCurve:
+    def test_overall_row_carries_curve_by_descending_confidence(self) -> None:
+        rec = uuid4()
+        taxon = uuid4()
+        gts = [_gt(rec, 0.0, 1.0, taxon), _gt(rec, 5.0, 6.0, taxon)]
+        dets = [
+            {**_det(rec, 0.5, 1.5, taxon), "confidence": 0.9},
+            {**_det(rec, 3.0, 4.0, taxon), "confidence": 0.7},
+            {**_det(rec, 5.5, 6.5, taxon), "confidence": 0.4},
+            {**_det(rec, 5.2, 5.4, taxon), "confidence": 0.8},
+        ]
+
+        curve = _extract(_score(_MODEL_REF, gts, dets), None)["pr_curve"]
+
+        assert [p["threshold"] for p in curve] == [0.9, 0.8, 0.7, 0.4]
+        assert [p["precision"] for p in curve] == pytest.approx([1.0, 1.0, 2 / 3, 0.75])
+        # The second GT is first recalled by the 0.8 detection.
+        assert [p["recall"] for p in curve] == pytest.approx([0.5, 1.0, 1.0, 1.0])
+
+    def test_unscored_detections_enter_at_a_null_threshold(self) -> None:
+        curve = _pr_curve([(0.5, True), (float("-inf"), False)], [0.5])
+
+        assert curve[-1] == {"threshold": None, "precision": 0.5, "recall": 1.0}
+
+    def test_curve_is_capped_and_keeps_the_lowest_threshold(self) -> None:
+        scores = [(i / 1000, i % 2 == 0) for i in range(1000)]
+
+        curve = _pr_curve(scores, [None], max_points=10)
+
+        assert len(curve) == 10
+        assert curve[0]["threshold"] == pytest.approx(0.999)
+        assert curve[-1]["threshold"] == 0.0
+        assert curve[-1]["precision"] == pytest.approx(0.5)
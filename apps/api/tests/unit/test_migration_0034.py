@@ -0,0 +1,138 @@
+"""Focused tests for Alembic revision 0034 (detection list keyset indexes).
+
+The test database schema is built from ``Base.metadata.create_all`` rather
+than by replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, check the ORM model declares
+the same indexes so ``create_all`` databases match migrated ones, and check
+the detection list emits the ``ORDER BY`` / row comparison these indexes serve.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from datetime import UTC, datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from echoroo.core.pagination import Cursor
+
+_MIGRATION_RELATIVE_PATH = (
+    Path("alembic") / "versions" / "0034_recording_annotations_keyset_indexes.py"
+)
+MIGRATION_REVISION = "0034"
+PREVIOUS_REVISION = "0033"
+
+_EXPECTED_INDEXES = {
+    "ix_recording_annotations_created_id": ["created_at", "id"],
+    "ix_recording_annotations_run_created_id": ["detection_run_id", "created_at", "id"],
+}
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_creates_keyset_indexes(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    created = {
+        args[0]: args[2]
+        for name, args, _ in recorder.calls
+        if name == "create_index" and args[1] == "recording_annotations"
+    }
+    assert created == _EXPECTED_INDEXES
+
+
+def test_downgrade_drops_what_upgrade_created(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    assert {name for name, _, _ in recorder.calls} == {"drop_index"}
+    assert {args[0] for _, args, _ in recorder.calls} == set(_EXPECTED_INDEXES)
+    assert all(
+        kwargs.get("table_name") == "recording_annotations" for _, _, kwargs in recorder.calls
+    )
+
+
+def test_orm_model_declares_keyset_indexes() -> None:
+    from echoroo.models.recording_annotation import RecordingAnnotation
+
+    declared = {
+        idx.name: [col.name for col in idx.columns] for idx in RecordingAnnotation.__table__.indexes
+    }
+    for name, columns in _EXPECTED_INDEXES.items():
+        assert declared.get(name) == columns
+
+
+@pytest.mark.asyncio
+async def test_detection_list_cursor_page_matches_index_order() -> None:
+    from echoroo.repositories.annotation import AnnotationRepository
+
+    count = MagicMock()
+    count.scalar_one.return_value = 0
+    page = MagicMock()
+    page.scalars.return_value.all.return_value = []
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[count, page])
+    cursor = Cursor("created_at", True, datetime(2026, 5, 1, tzinfo=UTC), uuid4())
+
+    await AnnotationRepository(db).list_annotations(
+        uuid4(), detection_run_id=uuid4(), cursor=cursor
+    )
+
+    sql = str(db.execute.await_args_list[-1].args[0].compile(dialect=postgresql.dialect()))
+    # A plain row comparison and plain DESC order: no NULL branch or
+    # NULLS LAST clause that would keep the (created_at, id) index unused.
+    assert "(recording_annotations.created_at, recording_annotations.id) < (" in sql
+    assert "ORDER BY recording_annotations.created_at DESC, recording_annotations.id DESC" in sql
+    assert "NULLS" not in sql
+    assert "recording_annotations.created_at IS NULL" not in sql
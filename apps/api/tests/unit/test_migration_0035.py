@@ -0,0 +1,144 @@
+"""Focused tests for Alembic revision 0035 (detection summary rollups).
+
+The test database schema is built from ``Base.metadata.create_all`` plus the
+``DETECTION_ROLLUP_DDL`` heal in ``tests/conftest.py`` rather than by
+replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, and check that the migration's
+frozen DDL still matches the live constant the heal installs.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import textwrap
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+_MIGRATION_RELATIVE_PATH = Path("alembic") / "versions" / "0035_detection_rollups.py"
+MIGRATION_REVISION = "0035"
+PREVIOUS_REVISION = "0034"
+
+_EXPECTED_KEYS = {
+    "uq_detection_species_rollups_key": (
+        "detection_species_rollups",
+        ["dataset_id", "detection_run_id", "tag_id", "source", "status"],
+    ),
+    "uq_detection_temporal_rollups_key": (
+        "detection_temporal_rollups",
+        ["dataset_id", "detection_run_id", "tag_id", "local_date", "local_hour"],
+    ),
+}
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def _executed_sql(recorder: _RecordingOp) -> list[str]:
+    return [str(args[0]) for name, args, _ in recorder.calls if name == "execute"]
+
+
+def _normalise(statement: str) -> str:
+    return textwrap.dedent(statement).strip()
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_creates_tables_keys_triggers_then_backfills(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    tables = [args[0] for name, args, _ in recorder.calls if name == "create_table"]
+    assert tables == ["detection_species_rollups", "detection_temporal_rollups"]
+    keys = {
+        args[0]: (args[1], args[2], kwargs)
+        for name, args, kwargs in recorder.calls
+        if name == "create_index"
+    }
+    assert {name: keys[name][:2] for name in keys} == _EXPECTED_KEYS
+    for _, _, kwargs in keys.values():
+        assert kwargs["unique"] is True
+        assert kwargs["postgresql_nulls_not_distinct"] is True
+
+    executed = _executed_sql(recorder)
+    assert sum("CREATE OR REPLACE TRIGGER" in sql for sql in executed) == 8
+    # The backfill runs last, once the triggers are in place.
+    assert executed[-1] == "SELECT detection_rollups_refresh(id) FROM datasets"
+
+
+def test_downgrade_drops_everything_upgrade_created(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    executed = _executed_sql(recorder)
+    assert sum(sql.startswith("DROP TRIGGER IF EXISTS") for sql in executed) == 8
+    assert sum(sql.startswith("DROP FUNCTION IF EXISTS") for sql in executed) == 5
+    dropped = [args[0] for name, args, _ in recorder.calls if name == "drop_table"]
+    assert sorted(dropped) == ["detection_species_rollups", "detection_temporal_rollups"]
+
+
+def test_frozen_ddl_matches_live_constant() -> None:
+    """The conftest heal must install exactly what the migration installs."""
+    from echoroo.models.detection_rollup import DETECTION_ROLLUP_DDL
+
+    module = _load_migration()
+    frozen = [_normalise(sql) for sql in (*module._FUNCTIONS, *module._TRIGGERS)]
+
+    assert frozen == [_normalise(sql) for sql in DETECTION_ROLLUP_DDL]
+
+
+def test_orm_models_declare_the_upsert_keys() -> None:
+    from echoroo.models.detection_rollup import DetectionSpeciesRollup, DetectionTemporalRollup
+
+    for model in (DetectionSpeciesRollup, DetectionTemporalRollup):
+        for index in model.__table__.indexes:
+            table, columns = _EXPECTED_KEYS[index.name]
+            assert model.__tablename__ == table
+            assert [col.name for col in index.columns] == columns
+            assert index.unique
+            assert index.dialect_options["postgresql"]["nulls_not_distinct"] is True
@@ -0,0 +1,146 @@
+"""Focused tests for Alembic revision 0036 (annotation vote tallies).
+
+The test database schema is built from ``Base.metadata.create_all`` plus the
+``ANNOTATION_VOTE_TALLY_DDL`` heal in ``tests/conftest.py`` rather than by
+replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, and check that the migration's
+frozen DDL still matches the live constant the heal installs.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import textwrap
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+_MIGRATION_RELATIVE_PATH = Path("alembic") / "versions" / "0036_annotation_vote_tallies.py"
+MIGRATION_REVISION = "0036"
+PREVIOUS_REVISION = "0035"
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def _executed_sql(recorder: _RecordingOp) -> list[str]:
+    return [str(args[0]) for name, args, _ in recorder.calls if name == "execute"]
+
+
+def _normalise(statement: str) -> str:
+    return textwrap.dedent(statement).strip()
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_creates_table_triggers_then_backfills(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    tables = [args for name, args, _ in recorder.calls if name == "create_table"]
+    assert [args[0] for args in tables] == ["annotation_vote_tallies"]
+    columns = {col.name for col in tables[0][1:] if hasattr(col, "name")}
+    assert {"annotation_id", "project_id", "consensus_status", "consensus_score"} <= columns
+    assert set(module._COUNT_COLUMNS) <= columns
+    indexes = [args for name, args, _ in recorder.calls if name == "create_index"]
+    assert indexes == [
+        (
+            "ix_annotation_vote_tallies_project_consensus",
+            "annotation_vote_tallies",
+            ["project_id", "consensus_status"],
+        )
+    ]
+
+    executed = _executed_sql(recorder)
+    assert sum("CREATE OR REPLACE TRIGGER" in sql for sql in executed) == 4
+    # The backfill runs last, once the triggers are in place.
+    assert executed[-1].startswith("SELECT annotation_vote_tallies_refresh(id) FROM projects")
+
+
+def test_downgrade_drops_everything_upgrade_created(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    executed = _executed_sql(recorder)
+    assert sum(sql.startswith("DROP TRIGGER IF EXISTS") for sql in executed) == 4
+    assert sum(sql.startswith("DROP FUNCTION IF EXISTS") for sql in executed) == 6
+    dropped = [args[0] for name, args, _ in recorder.calls if name == "drop_table"]
+    assert dropped == ["annotation_vote_tallies"]
+
+
+def test_frozen_ddl_matches_live_constant() -> None:
+    """The conftest heal must install exactly what the migrations install.
+
+    Revision 0046 later replaced ``annotation_vote_tallies_apply``.
+    """
+    from echoroo.models.annotation_vote_tally import ANNOTATION_VOTE_TALLY_DDL
+
+    module = _load_migration()
+    spec = importlib.util.spec_from_file_location(
+        "migration_0046",
+        _resolve_migration_path().with_name("0046_vote_tally_consensus_defaults.py"),
+    )
+    assert spec is not None and spec.loader is not None
+    revision_0046 = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(revision_0046)
+    frozen = [
+        _normalise(
+            revision_0046._APPLY_FUNCTION
+            if "FUNCTION annotation_vote_tallies_apply(" in sql
+            else sql
+        )
+        for sql in (*module._FUNCTIONS, *module._TRIGGERS)
+    ]
+
+    assert frozen == [_normalise(sql) for sql in ANNOTATION_VOTE_TALLY_DDL]
+
+
+def test_consensus_values_match_the_enum() -> None:
+    from echoroo.models.enums import ConsensusStatus
+
+    module = _load_migration()
+
+    assert set(module._CONSENSUS_VALUES) == {status.value for status in ConsensusStatus}
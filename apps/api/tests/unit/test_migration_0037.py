@@ -0,0 +1,95 @@
+"""Focused tests for Alembic revision 0037 (evaluation precision / recall curve).
+
+Lock the revision wiring and assert the up/down operations against a
+recording stub; the ORM mapping must expose the same nullable column.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects.postgresql import JSONB
+
+_MIGRATION_RELATIVE_PATH = Path("alembic") / "versions" / "0037_evaluation_pr_curve.py"
+MIGRATION_REVISION = "0037"
+PREVIOUS_REVISION = "0036"
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+MIGRATION_PATH = _resolve_migration_path()
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(f"migration_{MIGRATION_REVISION}", MIGRATION_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_adds_nullable_jsonb_column(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    [(name, args, _)] = recorder.calls
+    assert name == "add_column"
+    assert args[0] == "evaluation_results"
+    assert args[1].name == "pr_curve"
+    assert args[1].nullable is True
+    assert isinstance(args[1].type, JSONB)
+
+
+def test_downgrade_drops_column(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    assert [(name, args) for name, args, _ in recorder.calls] == [
+        ("drop_column", ("evaluation_results", "pr_curve")),
+    ]
+
+
+def test_orm_model_exposes_pr_curve() -> None:
+    from echoroo.models.evaluation import EvaluationResult
+
+    column = EvaluationResult.__table__.c.pr_curve
+    assert column.nullable is True
+    assert isinstance(column.type, JSONB)
@@ -0,0 +1,119 @@
+"""Focused tests for Alembic revision 0038 (audit chain verification runs).
+
+The test database schema is built from ``Base.metadata.create_all`` rather
+than by replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, and check the ORM model declares
+the same columns and index so ``create_all`` databases match migrated ones.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+_MIGRATION_RELATIVE_PATH = Path("alembic") / "versions" / "0038_audit_chain_verifications.py"
+MIGRATION_REVISION = "0038"
+PREVIOUS_REVISION = "0037"
+
+_EXPECTED_AUDIT_INDEXES = {
+    "ix_project_audit_log_created_id": ("project_audit_log", ["created_at", "id"]),
+    "ix_platform_audit_log_created_id": ("platform_audit_log", ["created_at", "id"]),
+}
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_creates_table_and_keyset_indexes(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    tables = [args[0] for name, args, _ in recorder.calls if name == "create_table"]
+    assert tables == ["audit_chain_verifications"]
+    created = {args[0]: args[1] for name, args, _ in recorder.calls if name == "create_index"}
+    assert created["ix_audit_chain_verifications_target_started"] == "audit_chain_verifications"
+    for index, (table, columns) in _EXPECTED_AUDIT_INDEXES.items():
+        assert created[index] == table
+        assert (
+            next(
+                args[2]
+                for name, args, _ in recorder.calls
+                if name == "create_index" and args[0] == index
+            )
+            == columns
+        )
+
+
+def test_downgrade_drops_what_upgrade_created(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    dropped = {args[0] for name, args, _ in recorder.calls if name == "drop_index"}
+    assert dropped == {*_EXPECTED_AUDIT_INDEXES, "ix_audit_chain_verifications_target_started"}
+    assert [args[0] for name, args, _ in recorder.calls if name == "drop_table"] == [
+        "audit_chain_verifications"
+    ]
+
+
+def test_orm_model_matches_migration(monkeypatch: pytest.MonkeyPatch) -> None:
+    from echoroo.models.audit_chain_verification import AuditChainVerification
+
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+    module.upgrade()
+
+    migrated = next(args for name, args, _ in recorder.calls if name == "create_table")
+    migrated_columns = {column.name for column in migrated[1:]}
+    table = AuditChainVerification.__table__
+    assert {column.name for column in table.columns} == migrated_columns
+    assert {index.name for index in table.indexes} == {
+        "ix_audit_chain_verifications_target_started"
+    }
@@ -0,0 +1,125 @@
+"""Focused tests for Alembic revision 0039 (background deletion jobs).
+
+The test database schema is built from ``Base.metadata.create_all`` rather
+than by replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, and check the ORM model declares
+the same columns and index so ``create_all`` databases match migrated ones.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+import pytest
+
+_MIGRATION_RELATIVE_PATH = Path("alembic") / "versions" / "0039_deletion_jobs.py"
+MIGRATION_REVISION = "0039"
+PREVIOUS_REVISION = "0038"
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+        self.autocommit = False
+
+    def get_context(self) -> Any:
+        @contextmanager
+        def _autocommit_block() -> Any:
+            self.autocommit = True
+            try:
+                yield
+            finally:
+                self.autocommit = False
+
+        return SimpleNamespace(autocommit_block=_autocommit_block)
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, {**kwargs, "_autocommit": self.autocommit}))
+
+        return _record
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_widens_status_enums_outside_a_transaction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    executed = [
+        (args[0], kwargs["_autocommit"])
+        for name, args, kwargs in recorder.calls
+        if name == "execute"
+    ]
+    assert executed == [
+        ("ALTER TYPE datasetstatus ADD VALUE IF NOT EXISTS 'deleting'", True),
+        ("ALTER TYPE projectstatus ADD VALUE IF NOT EXISTS 'deleting'", True),
+    ]
+    assert [args[0] for name, args, _ in recorder.calls if name == "create_table"] == [
+        "deletion_jobs"
+    ]
+
+
+def test_downgrade_drops_the_table_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    assert [name for name, _args, _ in recorder.calls] == ["drop_index", "drop_table"]
+
+
+def test_orm_model_matches_migration(monkeypatch: pytest.MonkeyPatch) -> None:
+    from echoroo.models.deletion_job import DeletionJob
+    from echoroo.models.enums import DatasetStatus, ProjectStatus
+
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+    module.upgrade()
+
+    migrated = next(args for name, args, _ in recorder.calls if name == "create_table")
+    table = DeletionJob.__table__
+    # ``claimed_at`` is added by revision 0047.
+    assert {column.name for column in table.columns} == {
+        column.name for column in migrated[1:]
+    } | {"claimed_at"}
+    assert {index.name for index in table.indexes} == {"ix_deletion_jobs_entity"}
+    assert DatasetStatus.DELETING.value == ProjectStatus.DELETING.value == "deleting"
@@ -0,0 +1,130 @@
+"""Focused tests for Alembic revision 0042 (trigram taxon search names).
+
+The test database schema is built from ``Base.metadata.create_all`` rather
+than by replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, and check the ORM models declare
+the same ``search_name`` columns and indexes so ``create_all`` databases match
+migrated ones.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+_MIGRATION_RELATIVE_PATH = Path("alembic") / "versions" / "0042_taxon_search_indexes.py"
+MIGRATION_REVISION = "0042"
+PREVIOUS_REVISION = "0041"
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+_TABLES = ["taxa", "taxon_vernacular_names"]
+
+
+def _record(monkeypatch: pytest.MonkeyPatch, step: str) -> _RecordingOp:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+    monkeypatch.setattr(
+        module,
+        "_backfill",
+        lambda table, source: recorder.calls.append(("_backfill", (table, source), {})),
+    )
+    getattr(module, step)()
+    return recorder
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_backfills_before_enforcing_and_indexing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    recorder = _record(monkeypatch, "upgrade")
+
+    assert [(name, args[0]) for name, args, _ in recorder.calls] == [
+        ("execute", "CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+        ("add_column", "taxa"),
+        ("_backfill", "taxa"),
+        ("alter_column", "taxa"),
+        ("create_index", "ix_taxa_search_name_trgm"),
+        ("create_index", "ix_taxa_search_name_prefix"),
+        ("add_column", "taxon_vernacular_names"),
+        ("_backfill", "taxon_vernacular_names"),
+        ("alter_column", "taxon_vernacular_names"),
+        ("create_index", "ix_taxon_vernacular_names_search_name_trgm"),
+        ("create_index", "ix_taxon_vernacular_names_search_name_prefix"),
+    ]
+
+
+def test_downgrade_reverses_upgrade(monkeypatch: pytest.MonkeyPatch) -> None:
+    recorder = _record(monkeypatch, "downgrade")
+
+    assert [(name, args[0]) for name, args, _ in recorder.calls] == [
+        ("drop_index", "ix_taxon_vernacular_names_search_name_prefix"),
+        ("drop_index", "ix_taxon_vernacular_names_search_name_trgm"),
+        ("drop_column", "taxon_vernacular_names"),
+        ("drop_index", "ix_taxa_search_name_prefix"),
+        ("drop_index", "ix_taxa_search_name_trgm"),
+        ("drop_column", "taxa"),
+    ]
+
+
+def test_orm_models_match_migration(monkeypatch: pytest.MonkeyPatch) -> None:
+    from echoroo.models.taxon import Taxon
+    from echoroo.models.taxon_vernacular_name import TaxonVernacularName
+
+    recorder = _record(monkeypatch, "upgrade")
+    migrated = {args[0]: kwargs for name, args, kwargs in recorder.calls if name == "create_index"}
+
+    for model, table in zip((Taxon, TaxonVernacularName), _TABLES, strict=True):
+        column = model.__table__.c.search_name
+        assert (column.type.length, column.nullable) == (300, False)
+        indexes = {index.name: index for index in model.__table__.indexes}
+        # Revision 0048 dropped the ``_prefix`` B-trees again.
+        assert f"ix_{table}_search_name_prefix" not in indexes
+        name = f"ix_{table}_search_name_trgm"
+        assert [c.name for c in indexes[name].columns] == ["search_name"]
+        dialect = indexes[name].dialect_options["postgresql"]
+        assert dialect["ops"] == migrated[name]["postgresql_ops"]
+        assert dialect["using"] == migrated[name]["postgresql_using"]
@@ -0,0 +1,103 @@
+"""Focused tests for Alembic revision 0043 (clip generation jobs).
+
+The test database schema is built from ``Base.metadata.create_all`` rather
+than by replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, and check the ORM model declares
+the same columns and key so ``create_all`` databases match migrated ones.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+_MIGRATION_RELATIVE_PATH = Path("alembic") / "versions" / "0043_clip_generation_jobs.py"
+MIGRATION_REVISION = "0043"
+PREVIOUS_REVISION = "0042"
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_creates_the_table_and_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    assert [(name, args[0]) for name, args, _ in recorder.calls] == [
+        ("create_table", "clip_generation_jobs"),
+        ("create_index", "ix_clip_generation_jobs_project"),
+    ]
+
+
+def test_downgrade_drops_the_index_and_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    assert [(name, args[0]) for name, args, _ in recorder.calls] == [
+        ("drop_index", "ix_clip_generation_jobs_project"),
+        ("drop_table", "clip_generation_jobs"),
+    ]
+
+
+def test_orm_model_matches_migration(monkeypatch: pytest.MonkeyPatch) -> None:
+    from echoroo.models.clip_generation_job import ClipGenerationJob
+
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+    module.upgrade()
+
+    migrated = next(args for name, args, _ in recorder.calls if name == "create_table")
+    table = ClipGenerationJob.__table__
+    assert {column.name for column in table.columns} == {column.name for column in migrated[1:]}
+    assert {
+        column.name for column in table.columns if column.nullable
+    } == {column.name for column in migrated[1:] if column.nullable}
+    assert {index.name for index in table.indexes} == {"ix_clip_generation_jobs_project"}
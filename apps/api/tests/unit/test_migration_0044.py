@@ -0,0 +1,133 @@
+"""Focused tests for Alembic revision 0044 (``DESC NULLS LAST`` keyset indexes).
+
+The test database schema is built from ``Base.metadata.create_all`` rather
+than by replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, and check the ORM models declare
+the same indexes in the order :func:`echoroo.core.pagination.keyset_order_by`
+emits for nullable sort keys.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from echoroo.core.pagination import keyset_order_by
+
+_MIGRATION_RELATIVE_PATH = Path("alembic") / "versions" / "0044_keyset_nulls_last_indexes.py"
+MIGRATION_REVISION = "0044"
+PREVIOUS_REVISION = "0043"
+
+_EXPECTED_INDEXES = {
+    "ix_annotation_vote_tallies_score_annotation": (
+        "annotation_vote_tallies",
+        ["consensus_score DESC NULLS LAST", "annotation_id DESC"],
+    ),
+    "ix_recordings_dataset_datetime_id": (
+        "recordings",
+        ["dataset_id", "datetime DESC NULLS LAST", "id DESC"],
+    ),
+}
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def _elements(items: list[Any]) -> list[str]:
+    return [getattr(item, "name", None) or str(item) for item in items]
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_creates_nulls_last_indexes(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    created = {
+        args[0]: (args[1], _elements(args[2]))
+        for name, args, _ in recorder.calls
+        if name == "create_index"
+    }
+    assert created == _EXPECTED_INDEXES
+
+
+def test_downgrade_drops_what_upgrade_created(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    assert {name for name, _, _ in recorder.calls} == {"drop_index"}
+    assert {(args[0], kwargs["table_name"]) for _, args, kwargs in recorder.calls} == {
+        (name, table) for name, (table, _) in _EXPECTED_INDEXES.items()
+    }
+
+
+def test_orm_models_declare_nulls_last_indexes() -> None:
+    from echoroo.models.annotation_vote_tally import AnnotationVoteTally
+    from echoroo.models.recording import Recording
+
+    for model in (AnnotationVoteTally, Recording):
+        declared = {
+            index.name: (model.__tablename__, _elements(list(index.expressions)))
+            for index in model.__table__.indexes
+        }
+        for name, expected in _EXPECTED_INDEXES.items():
+            if expected[0] == model.__tablename__:
+                assert declared[name] == expected
+
+
+def test_keyset_order_matches_index_direction() -> None:
+    from echoroo.models.recording import Recording
+
+    query = select(Recording.id).order_by(
+        *keyset_order_by(Recording.datetime, Recording.id, descending=True)
+    )
+
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert sql.endswith("ORDER BY recordings.datetime DESC NULLS LAST, recordings.id DESC")
@@ -0,0 +1,93 @@
+"""Focused tests for Alembic revision 0045 (ML-dataset export claim time).
+
+The test database schema is built from ``Base.metadata.create_all`` rather
+than by replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, and check the ORM model declares
+the same column so ``create_all`` databases match migrated ones.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+_MIGRATION_RELATIVE_PATH = (
+    Path("alembic") / "versions" / "0045_ml_dataset_export_claimed_at.py"
+)
+MIGRATION_REVISION = "0045"
+PREVIOUS_REVISION = "0044"
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_adds_nullable_claimed_at(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    ((name, args, _),) = recorder.calls
+    assert (name, args[0], args[1].name) == ("add_column", "ml_dataset_export_jobs", "claimed_at")
+    assert args[1].nullable is True
+    assert args[1].type.timezone is True
+
+
+def test_downgrade_drops_the_column(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    assert recorder.calls == [("drop_column", ("ml_dataset_export_jobs", "claimed_at"), {})]
+
+
+def test_orm_model_matches_migration() -> None:
+    from echoroo.models.ml_dataset_export_job import MlDatasetExportJob
+
+    column = MlDatasetExportJob.__table__.c.claimed_at
+    assert column.nullable is True
+    assert column.type.timezone is True
@@ -0,0 +1,96 @@
+"""Focused tests for Alembic revision 0046 (vote-tally consensus defaults).
+
+The revision only replaces ``annotation_vote_tallies_apply``. These tests lock
+the revision wiring, check the replacement applies the review-setting
+defaults once for both the increment and decrement branches, and that the
+downgrade restores revision 0036's body.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+_VERSIONS = Path("alembic") / "versions"
+_MIGRATION_RELATIVE_PATH = _VERSIONS / "0046_vote_tally_consensus_defaults.py"
+MIGRATION_REVISION = "0046"
+PREVIOUS_REVISION = "0045"
+
+
+def _resolve(relative: Path) -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / relative for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load(relative: Path, name: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, _resolve(relative))
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_migration() -> ModuleType:
+    return _load(_MIGRATION_RELATIVE_PATH, f"migration_{MIGRATION_REVISION}")
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_applies_the_defaults_once_for_every_branch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    ((name, (sql,), _),) = recorder.calls
+    assert name == "execute"
+    assert "CREATE OR REPLACE FUNCTION annotation_vote_tallies_apply(" in sql
+    assert "v_min_votes := COALESCE(v_min_votes, 2);" in sql
+    assert "v_threshold := COALESCE(v_threshold, 0.667);" in sql
+    # No branch applies its own defaults any more: the settings are read
+    # once (INTO) and passed as-is to all three consensus evaluations.
+    assert sql.count("COALESCE(") == 2
+    assert sql.count("v_min_votes, v_threshold") == 4
+
+
+def test_downgrade_restores_revision_0036(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    previous = _load(_VERSIONS / "0036_annotation_vote_tallies.py", "migration_0036")
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    ((name, (sql,), _),) = recorder.calls
+    assert name == "execute"
+    assert sql in previous._FUNCTIONS
@@ -0,0 +1,112 @@
+"""Focused tests for Alembic revision 0048 (drop taxon search prefix indexes).
+
+The test database schema is built from ``Base.metadata.create_all`` rather
+than by replaying Alembic, so these tests lock the revision wiring, assert the
+up/down operations against a recording stub, and check the ORM models no
+longer declare the dropped indexes so ``create_all`` databases match migrated
+ones.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+_MIGRATION_RELATIVE_PATH = (
+    Path("alembic") / "versions" / "0048_drop_taxon_search_name_prefix_indexes.py"
+)
+MIGRATION_REVISION = "0048"
+PREVIOUS_REVISION = "0047"
+
+
+def _resolve_migration_path() -> Path:
+    this_file = Path(__file__).resolve()
+    candidates = [parent / _MIGRATION_RELATIVE_PATH for parent in this_file.parents]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return candidates[0]
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        f"migration_{MIGRATION_REVISION}", _resolve_migration_path()
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _RecordingOp:
+    """Minimal stand-in for ``alembic.op`` that records invocations."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return _record
+
+
+def test_revision_identifiers() -> None:
+    module = _load_migration()
+
+    assert module.revision == MIGRATION_REVISION
+    assert module.down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_drops_both_prefix_indexes(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.upgrade()
+
+    assert recorder.calls == [
+        ("drop_index", ("ix_taxa_search_name_prefix",), {"table_name": "taxa"}),
+        (
+            "drop_index",
+            ("ix_taxon_vernacular_names_search_name_prefix",),
+            {"table_name": "taxon_vernacular_names"},
+        ),
+    ]
+
+
+def test_downgrade_recreates_the_0042_indexes(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_migration()
+    recorder = _RecordingOp()
+    monkeypatch.setattr(module, "op", recorder)
+
+    module.downgrade()
+
+    assert [(name, args[:3]) for name, args, _ in recorder.calls] == [
+        (
+            "create_index",
+            (
+                "ix_taxon_vernacular_names_search_name_prefix",
+                "taxon_vernacular_names",
+                ["search_name"],
+            ),
+        ),
+        ("create_index", ("ix_taxa_search_name_prefix", "taxa", ["search_name"])),
+    ]
+    for _name, _args, kwargs in recorder.calls:
+        assert kwargs == {"postgresql_ops": {"search_name": "varchar_pattern_ops"}}
+
+
+def test_orm_models_match_migration() -> None:
+    from echoroo.models.taxon import Taxon
+    from echoroo.models.taxon_vernacular_name import TaxonVernacularName
+
+    for model in (Taxon, TaxonVernacularName):
+        names = {index.name for index in model.__table__.indexes}
+        assert f"ix_{model.__tablename__}_search_name_prefix" not in names
+        assert f"ix_{model.__tablename__}_search_name_trgm" in names
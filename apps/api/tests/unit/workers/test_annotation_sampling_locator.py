@@ -0,0 +1,99 @@
+"""Unit tests for the streaming slot locator of the annotation sampler.
+
+``sample_annotation_segments`` never materialises the candidate slots: it
+draws indices into the concatenated per-recording slot counts and resolves
+them with :class:`_SlotLocator` while the recordings stream past. The
+resolved slots must be exactly those :func:`_enumerate_segments` lists at
+the same indices, however the rows are batched.
+"""
+
+from __future__ import annotations
+
+import random
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import Float, column
+from sqlalchemy.dialects import postgresql
+
+from echoroo.workers import annotation_sampling_tasks as tasks
+from echoroo.workers.annotation_sampling_tasks import (
+    _enumerate_segments,
+    _slot_count,
+    _SlotLocator,
+)
+
+
+def _rows() -> list[tuple[object, float, float]]:
+    # (recording_id, effective_duration, time_expansion=1) — includes a
+    # recording shorter than one slot and one that fits only within epsilon.
+    durations = [95.0, 12.0, 300.0, 29.9999999, 60.0, 61.5]
+    return [(uuid4(), d, 1.0) for d in durations]
+
+
+@pytest.mark.parametrize("segment_mode", ["fixed", "whole_recording"])
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+def test_locator_matches_reference_enumeration(segment_mode: str, batch_size: int) -> None:
+    segment_length = 30.0 if segment_mode == "fixed" else None
+    rows = _rows()
+    reference = _enumerate_segments(
+        [(rec_id, duration, te, None) for rec_id, duration, te in rows],
+        segment_mode=segment_mode,
+        segment_length=segment_length,
+        local_tz=ZoneInfo("UTC"),
+        tod_start=None,
+        tod_end=None,
+    )
+    counted = [
+        (rec_id, duration, count)
+        for rec_id, duration, _te in rows
+        if (
+            count := _slot_count(duration, segment_mode=segment_mode, segment_length=segment_length)
+        )
+        >= 1
+    ]
+    assert sum(count for *_rest, count in counted) == len(reference)
+
+    indices = sorted(random.Random(7).sample(range(len(reference)), 5))
+    locator = _SlotLocator(indices, segment_mode=segment_mode, segment_length=segment_length)
+    resolved = []
+    for start in range(0, len(counted), batch_size):
+        resolved.extend(locator.feed(counted[start : start + batch_size]))
+
+    assert locator.done
+    assert resolved == [reference[i] for i in indices]
+
+
+def test_locator_stops_once_every_index_is_resolved() -> None:
+    first, second = uuid4(), uuid4()
+    locator = _SlotLocator([0, 2], segment_mode="fixed", segment_length=10.0)
+
+    assert locator.feed([(first, 35.0, 3), (second, 20.0, 2)]) == [
+        (first, 0.0, 10.0),
+        (first, 20.0, 30.0),
+    ]
+    assert locator.done
+
+
+def test_locator_leaves_indices_past_the_stream_unresolved() -> None:
+    rec = uuid4()
+    locator = _SlotLocator([1, 4], segment_mode="fixed", segment_length=10.0)
+
+    assert locator.feed([(rec, 30.0, 3)]) == [(rec, 10.0, 20.0)]
+    assert not locator.done
+
+
+def test_slot_count_sql_uses_the_slot_step(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Real-DB parity with ``_slot_count`` is covered by
+    # tests/integration/workers/test_annotation_sampling_sql_parity_real_db.py.
+    monkeypatch.setattr(tasks, "_SLOT_STEP_MULTIPLIER", 0.5)
+
+    sql = str(
+        tasks._slot_count_sql(
+            column("effective", Float), segment_mode="fixed", segment_length=30.0
+        ).compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+    assert "effective + 1e-06 < 30.0" in sql
+    assert "/ CAST(15.0 AS FLOAT)" in sql
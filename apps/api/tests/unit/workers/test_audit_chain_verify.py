@@ -0,0 +1,282 @@
+"""Unit tests for the background audit chain verifier.
+
+Covers the parallel MAC verification shared with the weekly export, the
+keyset batch stream, the weekly export's streamed Object Lock upload,
+checkpoint signing, the settle margin, the stale-run sweep and the
+per-table dispatch of the daily beat. KMS is replaced by a local HMAC; the database round trips of a full run need a
+live PostgreSQL and are not exercised here.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from echoroo.workers import audit_chain_verify, audit_log_export
+from echoroo.workers.audit_chain_verify import Checkpoint, advance_checkpoint
+
+_T0 = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def _fake_mac(prev_hash: str, message: bytes) -> str:
+    return hmac.new(
+        b"test-chain-key", prev_hash.encode("ascii") + message, hashlib.sha256
+    ).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def fake_kms(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(audit_log_export, "compute_audit_chain_hash", _fake_mac)
+    monkeypatch.setattr(audit_chain_verify, "compute_audit_chain_hash", _fake_mac)
+
+
+def _chain(count: int) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    prev_hash = "0" * 64
+    for i in range(count):
+        row: dict[str, Any] = {
+            "id": uuid4(),
+            "created_at": _T0 + timedelta(minutes=i),
+            "actor_user_id_hash": "actor",
+            "action": "platform.test",
+            "request_id": f"req-{i}",
+            "ip_hash": "ip",
+            "user_agent_hash": "ua",
+            "detail": {"i": i},
+            "before": None,
+            "after": None,
+            "prev_hash": prev_hash,
+        }
+        row["row_hash"] = _fake_mac(
+            prev_hash, audit_log_export._canonical_row(row, include_project_id=False)
+        )
+        prev_hash = row["row_hash"]
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("count", "tampered"),
+    [(20, []), (20, [0]), (20, [7]), (20, [11, 3]), (20, [2, 19]), (1, []), (1, [0])],
+)
+async def test_parallel_verification_reports_the_earliest_mismatch(
+    count: int, tampered: list[int]
+) -> None:
+    rows = _chain(count)
+    for index in tampered:
+        rows[index]["detail"] = {"tampered": True}
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        found = await audit_log_export._averify_rows(
+            rows, include_project_id=False, executor=executor, workers=3
+        )
+
+    assert found == (min(tampered) if tampered else None)
+
+
+@pytest.mark.asyncio
+async def test_row_batches_page_by_created_at_and_id() -> None:
+    rows = _chain(5)
+    seen: list[dict[str, Any]] = []
+
+    async def _execute(stmt: Any, params: dict[str, Any]) -> Any:
+        seen.append(params)
+        start = 0
+        if "after_id" in params:
+            start = next(i for i, r in enumerate(rows) if r["id"] == params["after_id"]) + 1
+        result = MagicMock()
+        result.mappings.return_value.all.return_value = rows[start : start + params["limit"]]
+        assert "(created_at, id) > (:after_created_at, :after_id)" in str(stmt) or not start
+        return result
+
+    session = MagicMock()
+    session.execute = _execute
+    batches = audit_log_export._prefetched(
+        audit_log_export._aiter_row_batches(session, "platform_audit_log", batch_size=2)
+    )
+
+    fetched = [[row["id"] for row in batch] async for batch in batches]
+
+    assert fetched == [[r["id"] for r in rows[i : i + 2]] for i in (0, 2, 4)]
+    assert seen[1]["after_created_at"] == rows[1]["created_at"]
+    # The short final page ends the stream without another query.
+    assert len(seen) == 3
+
+
+def _export_session(rows: list[dict[str, Any]]) -> Any:
+    async def _execute(stmt: Any, params: dict[str, Any]) -> Any:
+        table_rows = rows if "platform_audit_log" in str(stmt) else []
+        start = 0
+        if "after_id" in params:
+            start = next(i for i, r in enumerate(rows) if r["id"] == params["after_id"]) + 1
+        result = MagicMock()
+        result.mappings.return_value.all.return_value = table_rows[start : start + params["limit"]]
+        return result
+
+    session = MagicMock()
+    session.execute = _execute
+
+    class _Factory:
+        async def __aenter__(self) -> Any:
+            return session
+
+        async def __aexit__(self, *exc: Any) -> None:
+            return None
+
+    return lambda: _Factory()
+
+
+def _patch_export(monkeypatch: pytest.MonkeyPatch, rows: list[dict[str, Any]]) -> MagicMock:
+    from functools import partial
+
+    from echoroo.workers import db_utils
+
+    client = MagicMock()
+    client.create_multipart_upload.return_value = {"UploadId": "u1"}
+    client.upload_part.side_effect = lambda **kw: {"ETag": f"e{kw['PartNumber']}"}
+    monkeypatch.setattr(audit_log_export, "get_s3_client", lambda: client)
+    monkeypatch.setattr(
+        db_utils,
+        "get_worker_engine_and_session_factory",
+        lambda: (None, _export_session(rows)),
+    )
+    monkeypatch.setattr(
+        audit_log_export,
+        "_aiter_row_batches",
+        partial(audit_log_export._aiter_row_batches, batch_size=2),
+    )
+    return client
+
+
+def test_export_weekly_streams_batches_into_an_object_lock_upload(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rows = _chain(5)
+    client = _patch_export(monkeypatch, rows)
+
+    summary = audit_log_export.export_weekly(_T0.isoformat())
+
+    assert summary["tables"]["platform_audit_log"]["row_count"] == 5
+    assert summary["tables"]["project_audit_log"]["row_count"] == 0
+    # Only the table with rows opens an upload, with Object Lock retention.
+    client.create_multipart_upload.assert_called_once()
+    params = client.create_multipart_upload.call_args.kwargs
+    assert params["ObjectLockMode"] == "GOVERNANCE"
+    assert params["Key"] == summary["tables"]["platform_audit_log"]["s3_key"]
+    body = b"".join(call.kwargs["Body"] for call in client.upload_part.call_args_list)
+    assert body == audit_log_export._serialize_ndjson(rows)
+    assert all("ContentMD5" in call.kwargs for call in client.upload_part.call_args_list)
+    client.complete_multipart_upload.assert_called_once()
+    client.abort_multipart_upload.assert_not_called()
+
+
+def test_export_weekly_aborts_the_upload_on_a_chain_mismatch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rows = _chain(5)
+    rows[3]["detail"] = {"tampered": True}
+    client = _patch_export(monkeypatch, rows)
+
+    with pytest.raises(audit_log_export.AuditChainMismatchError):
+        audit_log_export.export_weekly(_T0.isoformat())
+
+    client.complete_multipart_upload.assert_not_called()
+    client.abort_multipart_upload.assert_called_once()
+
+
+def test_checkpoint_mac_covers_every_field() -> None:
+    checkpoint = Checkpoint(row_id=uuid4(), created_at=_T0, row_hash="ab" * 32, row_count=42)
+    mac = audit_chain_verify.sign_checkpoint("platform", checkpoint)
+
+    assert audit_chain_verify.checkpoint_is_authentic("platform", checkpoint, mac)
+    assert not audit_chain_verify.checkpoint_is_authentic("project", checkpoint, mac)
+    for forged in (
+        Checkpoint(checkpoint.row_id, _T0 + timedelta(days=1), checkpoint.row_hash, 42),
+        Checkpoint(checkpoint.row_id, _T0, "cd" * 32, 42),
+        Checkpoint(checkpoint.row_id, _T0, checkpoint.row_hash, 43),
+        Checkpoint(uuid4(), _T0, checkpoint.row_hash, 42),
+    ):
+        assert not audit_chain_verify.checkpoint_is_authentic("platform", forged, mac)
+
+
+def test_checkpoint_stops_short_of_unsettled_rows() -> None:
+    rows = _chain(6)
+    settled_before = rows[4]["created_at"]
+
+    first = advance_checkpoint(None, rows[:3], covered=100, settled_before=settled_before)
+    assert first == Checkpoint(rows[2]["id"], rows[2]["created_at"], rows[2]["row_hash"], 103)
+
+    second = advance_checkpoint(first, rows[3:], covered=103, settled_before=settled_before)
+    assert second is not None
+    assert second.row_id == rows[3]["id"]
+    assert second.row_count == 104
+
+    assert advance_checkpoint(second, [], covered=106, settled_before=settled_before) is second
+
+
+class _CapturingSession:
+    def __init__(self, ids: list[Any]) -> None:
+        self.ids = ids
+        self.statements: list[Any] = []
+        self.committed = False
+
+    async def __aenter__(self) -> _CapturingSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    async def scalars(self, stmt: Any) -> Any:
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.all.return_value = self.ids
+        return result
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+@pytest.mark.asyncio
+async def test_stale_queued_and_running_runs_are_failed() -> None:
+    from sqlalchemy.dialects import postgresql
+
+    stale = [uuid4()]
+    session = _CapturingSession(stale)
+    now = _T0 + timedelta(days=1)
+
+    failed = await audit_chain_verify._fail_stale_runs(lambda: session, now=now)  # type: ignore[arg-type]
+
+    assert failed == stale
+    assert session.committed
+    compiled = session.statements[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "status IN (__[POSTCOMPILE_status_1])" in sql
+    assert "started_at < " in sql
+    assert "RETURNING audit_chain_verifications.id" in sql
+    assert list(compiled.params["status_1"]) == ["queued", "running"]
+    assert now - audit_chain_verify.STALE_RUN_AGE in compiled.params.values()
+    assert compiled.params["status"] == "failure"
+
+
+def test_daily_beat_queues_one_task_per_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    run_ids = [uuid4() for _ in audit_chain_verify.TARGET_TABLES]
+
+    async def _queue_all() -> list[Any]:
+        return run_ids
+
+    delay = MagicMock()
+    monkeypatch.setattr(audit_chain_verify, "_queue_all_async", _queue_all)
+    monkeypatch.setattr(audit_chain_verify.verify_audit_chain, "delay", delay)
+
+    queued = audit_chain_verify.verify_all_audit_chains()
+
+    assert queued == [str(run_id) for run_id in run_ids]
+    assert [call.args for call in delay.call_args_list] == [(str(r),) for r in run_ids]
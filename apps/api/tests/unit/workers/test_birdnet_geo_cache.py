@@ -0,0 +1,138 @@
+"""Unit tests for the cached BirdNET geo species lists.
+
+Detection runs resolve one geo species list per (H3 cache cell, BirdNET
+week) pair, served from Redis when cached, and batch inference by list.
+The geo model and Redis are replaced by in-memory fakes.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import h3
+import pytest
+
+from echoroo.ml import birdnet_geo
+from echoroo.workers.ml.detection import _group_by_species_list
+
+_SITE_CELL = h3.latlng_to_cell(35.68, 139.76, 9)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.store[key] = value
+
+
+def _recording(when: datetime | None, *, override: str | None = None) -> Any:
+    site = SimpleNamespace(h3_index_member=_SITE_CELL)
+    return SimpleNamespace(
+        id=uuid4(),
+        datetime=when,
+        h3_index_member=override,
+        dataset=SimpleNamespace(site=site),
+    )
+
+
+@pytest.fixture
+def geo_model() -> Any:
+    wrapper = MagicMock()
+    wrapper.get_species_for_location.side_effect = lambda _lat, _lon, week, **_: [
+        f"Species {week}_Common",
+        "Aves sp_Bird",
+    ]
+    redis = _FakeRedis()
+
+    async def _connection() -> _FakeRedis:
+        return redis
+
+    with (
+        patch.object(birdnet_geo.BirdNETWrapper, "get_instance", return_value=wrapper),
+        patch("echoroo.core.redis.get_redis_connection", _connection),
+    ):
+        yield wrapper
+
+
+@pytest.mark.parametrize(
+    ("day", "expected"),
+    [
+        (datetime(2026, 1, 1), 1),
+        (datetime(2026, 1, 8), 2),
+        (datetime(2026, 1, 31), 4),
+        (datetime(2026, 6, 15), 23),
+        (datetime(2026, 12, 31), 48),
+    ],
+)
+def test_birdnet_week_uses_four_weeks_per_month(day: datetime, expected: int) -> None:
+    assert birdnet_geo.birdnet_week(day) == expected
+
+
+def test_geo_cell_snaps_fine_cells_to_the_cache_resolution() -> None:
+    cell = birdnet_geo.geo_cell(_SITE_CELL)
+
+    assert h3.get_resolution(cell) == birdnet_geo.GEO_CACHE_H3_RESOLUTION
+    assert birdnet_geo.geo_cell(cell) == cell
+
+
+@pytest.mark.asyncio
+async def test_recordings_resolve_per_week_once_per_pair(geo_model: Any) -> None:
+    june_a = _recording(datetime(2026, 6, 1, 5, tzinfo=UTC))
+    june_b = _recording(datetime(2026, 6, 3, 5, tzinfo=UTC))
+    july = _recording(datetime(2026, 7, 20, 5, tzinfo=UTC))
+    undated = _recording(None)
+
+    result = await birdnet_geo.geo_species_by_recording([june_a, june_b, july, undated])
+
+    assert result[june_a.id] == ("Aves sp_Bird", "Species 21_Common")
+    assert result[june_a.id] is result[june_b.id]
+    assert result[july.id] == ("Aves sp_Bird", "Species 27_Common")
+    assert result[undated.id] is None
+    assert geo_model.get_species_for_location.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_lists_skip_the_geo_model(geo_model: Any) -> None:
+    rec = _recording(datetime(2026, 6, 1, tzinfo=UTC))
+
+    first = await birdnet_geo.geo_species_by_recording([rec])
+    second = await birdnet_geo.geo_species_by_recording([rec])
+
+    assert first == second
+    geo_model.get_species_for_location.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_recording_override_cell_takes_precedence(geo_model: Any) -> None:
+    elsewhere = h3.latlng_to_cell(-33.87, 151.21, 9)
+    rec = _recording(datetime(2026, 6, 1, tzinfo=UTC), override=elsewhere)
+
+    await birdnet_geo.geo_species_by_recording([rec])
+
+    lat, lon, _week = geo_model.get_species_for_location.call_args.args
+    assert lat < 0 < lon
+
+
+@pytest.mark.asyncio
+async def test_precompute_fills_every_week_once(geo_model: Any) -> None:
+    assert await birdnet_geo.precompute_geo_species(_SITE_CELL) == 48
+    assert await birdnet_geo.precompute_geo_species(_SITE_CELL) == 0
+    assert geo_model.get_species_for_location.call_count == 48
+
+
+def test_batches_group_recordings_by_species_list() -> None:
+    a, b, c = (SimpleNamespace(id=uuid4()) for _ in range(3))
+    june = ("Species 21_Common",)
+    paths = [(a, "a.wav"), (b, "b.wav"), (c, "c.wav")]
+
+    batches = _group_by_species_list(paths, {a.id: june, c.id: june})  # type: ignore[arg-type]
+
+    assert batches == [(june, [(a, "a.wav"), (c, "c.wav")]), (None, [(b, "b.wav")])]
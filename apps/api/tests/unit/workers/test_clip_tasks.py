@@ -0,0 +1,152 @@
+"""Unit tests for the dataset clip generation job.
+
+The database is replaced by an in-memory fake that serves the job row and
+applies ``UPDATE``s to it, and :class:`ClipService` by a stub that reports
+two batches, so the tests cover claiming, progress commits and the
+terminal states.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+
+from echoroo.services.clip import ClipGenerationStats
+from echoroo.workers import clip_tasks, db_utils
+
+
+class _FakeSession:
+    def __init__(self, job: Any) -> None:
+        self.job = job
+        self.commits: list[tuple[int, int]] = []
+
+    async def __aenter__(self) -> _FakeSession:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, statement: Any) -> Any:
+        if isinstance(statement, sa.Update):
+            for key, value in statement.compile().params.items():
+                if hasattr(self.job, key):
+                    setattr(self.job, key, value)
+            return SimpleNamespace(rowcount=1)
+        found = self.job if self.job.status == "queued" else None
+        return SimpleNamespace(scalar_one_or_none=lambda: found)
+
+    async def commit(self) -> None:
+        self.commits.append((self.job.recordings_processed, self.job.clips_created))
+
+
+class _StubClipService:
+    calls: list[dict[str, Any]] = []
+    fail = False
+
+    def __init__(self, session: Any) -> None:
+        self.session = session
+
+    async def generate_dataset_clips(self, dataset_id: Any, **kwargs: Any) -> ClipGenerationStats:
+        on_batch = kwargs.pop("on_batch")
+        type(self).calls.append({"dataset_id": dataset_id, **kwargs})
+        stats = ClipGenerationStats(recordings_processed=2, windows_planned=40, clips_created=40)
+        await on_batch(stats)
+        if type(self).fail:
+            raise RuntimeError("connection lost")
+        stats = ClipGenerationStats(recordings_processed=3, windows_planned=60, clips_created=50)
+        await on_batch(stats)
+        return stats
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> type[_StubClipService]:
+    _StubClipService.calls = []
+    _StubClipService.fail = False
+    monkeypatch.setattr(clip_tasks, "ClipService", _StubClipService)
+    return _StubClipService
+
+
+def _job() -> Any:
+    return SimpleNamespace(
+        id=uuid4(),
+        project_id=uuid4(),
+        dataset_id=uuid4(),
+        clip_length=3.0,
+        overlap=0.0,
+        start_time=0.0,
+        end_time=None,
+        status="queued",
+        recordings_processed=0,
+        clips_created=0,
+        started_at=datetime.now(UTC),
+        finished_at=None,
+        error_detail=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_job_runs_generation_and_commits_progress(
+    service: type[_StubClipService],
+) -> None:
+    job = _job()
+    session = _FakeSession(job)
+
+    result = await clip_tasks._run_job(lambda: session, job.id)
+
+    assert result == {
+        "status": "success",
+        "job_id": str(job.id),
+        "recordings_processed": 3,
+        "clips_created": 50,
+    }
+    assert service.calls == [
+        {
+            "dataset_id": job.dataset_id,
+            "clip_length": 3.0,
+            "overlap": 0.0,
+            "start_time": 0.0,
+            "end_time": None,
+        }
+    ]
+    assert session.commits == [(0, 0), (2, 40), (3, 50), (3, 50)]
+    assert job.status == "success"
+    assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_job_keeps_committed_progress_and_records_the_error(
+    service: type[_StubClipService], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service.fail = True
+    job = _job()
+    session = _FakeSession(job)
+
+    class _Engine:
+        async def dispose(self) -> None:
+            return None
+
+    monkeypatch.setattr(
+        db_utils, "get_worker_engine_and_session_factory", lambda: (_Engine(), lambda: session)
+    )
+
+    result = await clip_tasks._run_clip_generation_async(job.id)
+
+    assert result["status"] == "failure"
+    assert (job.status, job.clips_created) == ("failure", 40)
+    assert "connection lost" in job.error_detail
+
+
+@pytest.mark.asyncio
+async def test_claimed_job_is_not_run_twice(service: type[_StubClipService]) -> None:
+    job = _job()
+    job.status = "running"
+
+    result = await clip_tasks._run_job(lambda: _FakeSession(job), job.id)
+
+    assert result["status"] == "skipped"
+    assert service.calls == []
@@ -0,0 +1,222 @@
+"""Unit tests for the chunked dataset / project deletion job.
+
+The database is replaced by an in-memory fake that answers the batched
+``DELETE`` statements from per-table row counts and applies ``UPDATE``s
+of the job row; S3 is replaced by an in-memory bucket. The stale-job
+re-send is checked against the compiled PostgreSQL ``UPDATE``.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from echoroo.core.s3 import BatchDeleteResult, S3ObjectMeta
+from echoroo.workers import deletion_tasks
+
+
+class _FakeDatabase:
+    def __init__(self, job: Any, rows: dict[str, int], datasets: list[UUID]) -> None:
+        self.job = job
+        self.rows = rows
+        self.datasets = datasets
+        self.deletes: list[str] = []
+        self.commits = 0
+
+    def execute(self, statement: Any, params: dict[str, Any] | None = None) -> Any:
+        if isinstance(statement, sa.Select):
+            claimable = next(v for v in statement.compile().params.values() if isinstance(v, list))
+            found = self.job if self.job.status in claimable else None
+            return SimpleNamespace(scalar_one_or_none=lambda: found)
+        if isinstance(statement, sa.Update):
+            for key, value in statement.compile().params.items():
+                if hasattr(self.job, key):
+                    setattr(self.job, key, value)
+            return SimpleNamespace(rowcount=1)
+        sql = str(statement)
+        if sql.startswith("SELECT id FROM datasets"):
+            return SimpleNamespace(scalars=lambda: iter(self.datasets))
+        table = re.match(r"DELETE FROM (\w+)", sql).group(1)  # type: ignore[union-attr]
+        limit = (params or {}).get("limit", 1)
+        deleted = min(limit, self.rows.get(table, 0))
+        self.rows[table] = self.rows.get(table, 0) - deleted
+        self.deletes.append(table)
+        return SimpleNamespace(rowcount=deleted)
+
+
+class _FakeSession:
+    def __init__(self, db: _FakeDatabase) -> None:
+        self._db = db
+
+    async def __aenter__(self) -> _FakeSession:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, statement: Any, params: dict[str, Any] | None = None) -> Any:
+        return self._db.execute(statement, params)
+
+    async def commit(self) -> None:
+        self._db.commits += 1
+
+
+def _job(entity_type: str, entity_id: UUID, project_id: UUID) -> Any:
+    return SimpleNamespace(
+        id=uuid4(),
+        entity_type=entity_type,
+        entity_id=entity_id,
+        project_id=project_id,
+        status="queued",
+        stage=None,
+        rows_deleted=0,
+        objects_deleted=0,
+        started_at=datetime.now(UTC),
+        claimed_at=None,
+        finished_at=None,
+        error_detail=None,
+    )
+
+
+@pytest.fixture
+def bucket(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    state: dict[str, Any] = {"keys": set(), "calls": []}
+
+    def _list(prefix: str) -> Any:
+        for key in sorted(state["keys"]):
+            if key.startswith(prefix):
+                yield S3ObjectMeta(key=key, last_modified=datetime.now(UTC), size=1)
+
+    def _delete(keys: list[str]) -> BatchDeleteResult:
+        state["calls"].append(len(keys))
+        state["keys"].difference_update(keys)
+        return BatchDeleteResult(deleted=list(keys), errors=[])
+
+    monkeypatch.setattr(deletion_tasks, "list_objects_paginated", _list)
+    monkeypatch.setattr(deletion_tasks, "delete_objects_batch", _delete)
+    monkeypatch.setattr(deletion_tasks, "BATCH_SIZE", 10)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_dataset_job_deletes_children_in_batches_then_objects_then_row(
+    bucket: dict[str, Any],
+) -> None:
+    project_id, dataset_id = uuid4(), uuid4()
+    job = _job("dataset", dataset_id, project_id)
+    db = _FakeDatabase(
+        job, {"embeddings": 25, "recording_annotations": 10, "recordings": 3, "datasets": 1}, []
+    )
+    bucket["keys"] = {
+        *(f"recordings/{project_id}/{dataset_id}/{i}.wav" for i in range(1500)),
+        f"uploads/{project_id}/{dataset_id}/session/a.wav",
+        f"recordings/{project_id}/{uuid4()}/other-dataset.wav",
+    }
+
+    result = await deletion_tasks._run_job(lambda: _FakeSession(db), job.id, continuation=False)
+
+    assert result["status"] == "success"
+    assert db.deletes[:3] == ["embeddings"] * 3
+    tables = list(dict.fromkeys(db.deletes))
+    assert tables == [*deletion_tasks.RECORDING_CHILD_TABLES, "recordings", "datasets"]
+    # 25 embeddings take three batches; exactly one full batch of
+    # annotations needs a second (empty) one to prove the table is drained.
+    assert db.deletes.count("recording_annotations") == 2
+    assert job.rows_deleted == 25 + 10 + 3 + 1
+    assert job.status == "success"
+    assert job.claimed_at is not None
+    assert job.objects_deleted == 1501
+    assert bucket["calls"] == [1000, 500, 1]
+    assert bucket["keys"] == {k for k in bucket["keys"] if "other-dataset" in k}
+
+
+@pytest.mark.asyncio
+async def test_project_job_drains_every_dataset_before_the_project_row(
+    bucket: dict[str, Any],
+) -> None:
+    project_id = uuid4()
+    job = _job("project", project_id, project_id)
+    db = _FakeDatabase(job, {"recordings": 4, "projects": 1}, [uuid4(), uuid4()])
+    bucket["keys"] = {f"models/{project_id}/m/model.joblib", f"search_reference/{project_id}/x"}
+
+    await deletion_tasks._run_job(lambda: _FakeSession(db), job.id, continuation=False)
+
+    assert db.deletes.count("embeddings") == 2
+    assert db.deletes[-1] == "projects"
+    assert bucket["keys"] == set()
+    assert job.status == "success"
+
+
+@pytest.mark.asyncio
+async def test_claimed_job_is_not_run_twice(bucket: dict[str, Any]) -> None:
+    job = _job("dataset", uuid4(), uuid4())
+    job.status = "running"
+    db = _FakeDatabase(job, {"embeddings": 5}, [])
+
+    result = await deletion_tasks._run_job(lambda: _FakeSession(db), job.id, continuation=False)
+
+    assert result["status"] == "skipped"
+    assert db.deletes == []
+
+
+@pytest.mark.asyncio
+async def test_out_of_time_job_stops_between_batches(
+    bucket: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    job = _job("dataset", uuid4(), uuid4())
+    db = _FakeDatabase(job, {"embeddings": 100}, [])
+    monkeypatch.setattr(deletion_tasks, "TIME_BUDGET_SECONDS", 0)
+
+    with pytest.raises(deletion_tasks._OutOfTime):
+        await deletion_tasks._run_job(lambda: _FakeSession(db), job.id, continuation=False)
+
+    assert job.status == "running"
+    assert db.rows["embeddings"] == 100
+
+    monkeypatch.setattr(deletion_tasks, "TIME_BUDGET_SECONDS", 1200)
+    result = await deletion_tasks._run_job(lambda: _FakeSession(db), job.id, continuation=True)
+    assert result["status"] == "success"
+    assert db.rows["embeddings"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_running_jobs_are_resent_as_continuations(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stale = [uuid4(), uuid4()]
+    executed: list[Any] = []
+
+    class _Session(_FakeSession):
+        async def execute(self, statement: Any, params: dict[str, Any] | None = None) -> Any:
+            executed.append(statement)
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: stale))
+
+    sent: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+    monkeypatch.setattr(
+        deletion_tasks.run_deletion_job, "delay", lambda *a, **kw: sent.append((a, kw))
+    )
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    db = _FakeDatabase(_job("dataset", uuid4(), uuid4()), {}, [])
+
+    requeued = await deletion_tasks._requeue_stale_jobs(lambda: _Session(db), now=now)
+
+    assert requeued == stale
+    assert sent == [((str(job_id),), {"continuation": True}) for job_id in stale]
+    assert db.commits == 1
+    (statement,) = executed
+    compiled = statement.compile(dialect=postgresql.dialect())
+    assert "deletion_jobs.status = %(status_1)s" in str(compiled)
+    assert (
+        "coalesce(deletion_jobs.claimed_at, deletion_jobs.started_at) < %(coalesce_1)s"
+    ) in str(compiled)
+    assert compiled.params["status_1"] == "running"
+    assert compiled.params["coalesce_1"] == now - deletion_tasks.STALE_CLAIM_AGE
+    # The re-sent job is not re-sent again before its new message claims it.
+    assert compiled.params["claimed_at"] == now
@@ -0,0 +1,284 @@
+"""Unit tests for the streaming ML-dataset export job.
+
+The database is replaced by an in-memory fake that serves each ordered
+positives / negatives query as a server-side cursor (partitions of the
+statement's ``yield_per``) and applies ``UPDATE``s of the job row; S3 is
+replaced by a fake multipart client whose parts are reassembled into the
+final ZIP. The SQL itself (ordering, the ``NOT EXISTS`` anti-join, the
+reaper's predicate) runs against PostgreSQL in
+``tests/integration/test_ml_dataset_export_real_db.py``.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zipfile
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from echoroo.core import s3 as s3mod
+from echoroo.models.ml_dataset_export_job import MlDatasetExportJob
+from echoroo.services import detection_export
+from echoroo.workers import db_utils, detection_export_tasks
+
+
+class _FakeDatabase:
+    def __init__(
+        self, job: Any, positives: list[tuple[Any, ...]], negatives: list[tuple[Any, ...]]
+    ):
+        self.job = job
+        self.positives = sorted(positives, key=lambda r: (r[0], r[1], r[-1]))
+        self.negatives = sorted(negatives, key=lambda r: (r[0], r[1], r[-1]))
+        self.progress: list[int] = []
+        self.statements: list[sa.Select[Any]] = []
+        self.batch_queries = 0
+        self.fail_on_batch: int | None = None
+
+    def execute(self, statement: Any) -> Any:
+        if isinstance(statement, sa.Update):
+            values = statement.compile().params
+            for key, value in values.items():
+                if hasattr(self.job, key):
+                    setattr(self.job, key, value)
+            if "status" not in values:
+                self.progress.append(values["entries_written"])
+            return SimpleNamespace(rowcount=1)
+        if statement.column_descriptions[0]["entity"] is MlDatasetExportJob:
+            found = self.job if self.job.status == "queued" else None
+            return SimpleNamespace(scalar_one_or_none=lambda: found)
+        raise AssertionError(f"unexpected statement: {statement}")
+
+    def stream(self, statement: sa.Select[Any]) -> _FakeCursor:
+        self.statements.append(statement)
+        rows = self.negatives if "confirmed_regions.id" in str(statement) else self.positives
+        return _FakeCursor(self, rows, statement.get_execution_options()["yield_per"])
+
+
+class _FakeCursor:
+    def __init__(self, db: _FakeDatabase, rows: list[tuple[Any, ...]], size: int) -> None:
+        self._db = db
+        self._rows = rows
+        self._size = size
+        self.closed = False
+
+    async def partitions(self) -> AsyncIterator[list[tuple[Any, ...]]]:
+        for start in range(0, len(self._rows), self._size):
+            self._db.batch_queries += 1
+            if self._db.batch_queries == self._db.fail_on_batch:
+                raise RuntimeError("connection lost")
+            yield self._rows[start : start + self._size]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeSession:
+    def __init__(self, db: _FakeDatabase) -> None:
+        self._db = db
+
+    async def __aenter__(self) -> _FakeSession:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, statement: Any) -> Any:
+        return self._db.execute(statement)
+
+    async def stream(self, statement: Any) -> _FakeCursor:
+        return self._db.stream(statement)
+
+    async def commit(self) -> None:
+        return None
+
+
+class _FakeMultipartS3:
+    def __init__(self) -> None:
+        self.parts: dict[int, bytes] = {}
+        self.objects: dict[str, bytes] = {}
+        self.aborted: list[str] = []
+
+    def create_multipart_upload(self, **kwargs: Any) -> dict[str, Any]:
+        assert "Metadata" not in kwargs
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, PartNumber: int, Body: bytes, **_: Any) -> dict[str, Any]:  # noqa: N803
+        self.parts[PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Key: str, MultipartUpload: Any, **_: Any) -> None:  # noqa: N803
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        self.objects[Key] = b"".join(self.parts[n] for n in numbers)
+
+    def abort_multipart_upload(self, Key: str, **_: Any) -> None:  # noqa: N803
+        self.aborted.append(Key)
+
+
+@pytest.fixture
+def bucket(monkeypatch: pytest.MonkeyPatch) -> _FakeMultipartS3:
+    client = _FakeMultipartS3()
+    monkeypatch.setattr(s3mod, "get_s3_client", lambda: client)
+    monkeypatch.setattr(detection_export, "ML_EXPORT_BATCH_SIZE", 2)
+    return client
+
+
+def _job() -> Any:
+    return SimpleNamespace(
+        id=uuid4(),
+        project_id=uuid4(),
+        dataset_id=None,
+        detection_run_id=None,
+        status="queued",
+        entries_written=0,
+        object_key=None,
+        size_bytes=None,
+        started_at=datetime.now(UTC),
+        claimed_at=None,
+        finished_at=None,
+        error_detail=None,
+    )
+
+
+def _positives() -> list[tuple[Any, ...]]:
+    return [
+        ("a.wav", 0.0, 3.0, "Parus minor", 0.91234, uuid4()),
+        ("a.wav", 3.0, 6.0, "Parus minor", None, uuid4()),
+        ("a.wav", 3.0, 6.0, "Cettia diphone", 0.5, uuid4()),
+        ("b.wav", 1.5, 4.5, None, 0.75, uuid4()),
+        ("c.wav", 9.0, 12.0, "Cettia diphone", 0.6, uuid4()),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_streams_cursor_batches_into_a_multipart_zip(
+    bucket: _FakeMultipartS3,
+) -> None:
+    job = _job()
+    db = _FakeDatabase(job, _positives(), [("b.wav", 10.0, 13.0, uuid4())])
+
+    result = await detection_export_tasks._run_job(lambda: _FakeSession(db), job.id)
+
+    key = detection_export_tasks.ml_dataset_object_key(job.project_id, job.id)
+    assert result["status"] == "success"
+    assert (job.status, job.object_key, job.entries_written) == ("success", key, 6)
+    assert job.claimed_at is not None
+    # One ordered query per entry kind, read from a cursor rather than paged.
+    assert len(db.statements) == 2
+    assert all("LIMIT" not in str(statement) for statement in db.statements)
+    assert all(
+        str(statement).rstrip().endswith(f"recordings.filename, {table}.start_time, {table}.id")
+        for statement, table in zip(
+            db.statements, ("recording_annotations", "confirmed_regions"), strict=True
+        )
+    )
+    assert job.size_bytes == len(bucket.objects[key])
+    # Five positives in batches of two, then one negative batch.
+    assert db.progress == [2, 4, 5, 6]
+
+    archive = zipfile.ZipFile(io.BytesIO(bucket.objects[key]))
+    assert archive.namelist() == ["annotations.csv", "metadata.json", "README.txt"]
+    rows = list(csv.reader(io.StringIO(archive.read("annotations.csv").decode())))
+    assert rows[0] == list(detection_export._ML_CSV_HEADER)
+    assert [r[0] for r in rows[1:]] == ["a.wav", "a.wav", "a.wav", "b.wav", "c.wav", "b.wav"]
+    assert rows[1] == ["a.wav", "0.000", "3.000", "Parus minor", "0.9123", "positive"]
+    assert rows[4] == ["b.wav", "1.500", "4.500", "", "0.7500", "positive"]
+    assert rows[6] == ["b.wav", "10.000", "13.000", "", "", "negative"]
+    metadata = json.loads(archive.read("metadata.json"))
+    assert (metadata["positive_count"], metadata["negative_count"]) == (5, 1)
+    assert metadata["species"] == ["Cettia diphone", "Parus minor"]
+
+
+@pytest.mark.asyncio
+async def test_failed_export_aborts_the_upload_and_records_the_error(
+    bucket: _FakeMultipartS3, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    job = _job()
+    db = _FakeDatabase(job, _positives(), [])
+    db.fail_on_batch = 2
+
+    class _Engine:
+        async def dispose(self) -> None:
+            return None
+
+    monkeypatch.setattr(
+        db_utils,
+        "get_worker_engine_and_session_factory",
+        lambda: (_Engine(), lambda: _FakeSession(db)),
+    )
+
+    result = await detection_export_tasks._run_ml_dataset_export_async(job.id)
+
+    assert result["status"] == "failure"
+    assert job.status == "failure"
+    assert "connection lost" in job.error_detail
+    assert job.object_key is None
+    assert bucket.objects == {}
+    assert bucket.aborted == [detection_export_tasks.ml_dataset_object_key(job.project_id, job.id)]
+
+
+@pytest.mark.asyncio
+async def test_claimed_job_is_not_run_twice(bucket: _FakeMultipartS3) -> None:
+    job = _job()
+    job.status = "running"
+    db = _FakeDatabase(job, _positives(), [])
+
+    result = await detection_export_tasks._run_job(lambda: _FakeSession(db), job.id)
+
+    assert result["status"] == "skipped"
+    assert db.batch_queries == 0
+    assert bucket.parts == {}
+
+
+@pytest.mark.asyncio
+async def test_reaper_fails_stale_running_jobs_and_aborts_their_uploads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stale = [(uuid4(), uuid4()), (uuid4(), uuid4())]
+    executed: list[Any] = []
+
+    class _Session(_FakeSession):
+        async def execute(self, statement: Any) -> Any:
+            executed.append(statement)
+            return SimpleNamespace(all=lambda: stale)
+
+    aborted: list[str] = []
+
+    def _abort(key: str) -> int:
+        aborted.append(key)
+        if len(aborted) == 1:
+            raise RuntimeError("s3 unavailable")
+        return 1
+
+    monkeypatch.setattr(detection_export_tasks, "abort_multipart_uploads", _abort)
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+    reaped = await detection_export_tasks._reap_stale_jobs(
+        lambda: _Session(_FakeDatabase(_job(), [], [])), now=now
+    )
+
+    assert reaped == [job_id for job_id, _ in stale]
+    # A failed abort is logged and the remaining uploads are still aborted.
+    assert aborted == [
+        detection_export_tasks.ml_dataset_object_key(project_id, job_id)
+        for job_id, project_id in stale
+    ]
+    (statement,) = executed
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "ml_dataset_export_jobs.status = %(status_1)s" in sql
+    assert (
+        "coalesce(ml_dataset_export_jobs.claimed_at, ml_dataset_export_jobs.started_at)"
+        " < %(coalesce_1)s"
+    ) in sql
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert params["status_1"] == "running"
+    assert params["coalesce_1"] == now - detection_export_tasks.STALE_CLAIM_AGE
+    assert params["status"] == "failure"
@@ -0,0 +1,79 @@
+"""Unit coverage for the detection rollup rebuild worker.
+
+The Celery task wraps :func:`asyncio.run`; these tests drive ``_impl`` with a
+session double so they stay DB-free. ``detection_rollups_refresh`` itself is
+PostgreSQL DDL (see :mod:`echoroo.models.detection_rollup`).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from echoroo.workers import detection_rollups as worker
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FakeSession:
+    def __init__(self, dataset_ids: list[Any]) -> None:
+        self._dataset_ids = dataset_ids
+        self.statements: list[tuple[str, dict[str, Any] | None]] = []
+        self.commits = 0
+
+    async def __aenter__(self) -> _FakeSession:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, statement: Any, params: dict[str, Any] | None = None) -> Any:
+        self.statements.append((str(statement), params))
+        result = MagicMock()
+        result.scalars.return_value = iter(self._dataset_ids)
+        result.fetchall.return_value = [("orphan",)]
+        return result
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        raise AssertionError("unexpected rollback")
+
+
+async def test_rebuild_refreshes_each_dataset_in_its_own_transaction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    datasets = [uuid4(), uuid4()]
+    session = _FakeSession(datasets)
+    monkeypatch.setattr(worker, "AsyncSessionLocal", lambda: session)
+    project_id = uuid4()
+
+    summary = await worker._impl(project_id=project_id)
+
+    assert session.statements[0][1] == {"project_id": project_id}
+    refreshes = [p for sql, p in session.statements if "detection_rollups_refresh" in sql]
+    assert refreshes == [{"dataset_id": d} for d in datasets]
+    assert session.commits == len(datasets)
+    # Orphans are only pruned on full runs.
+    assert summary["orphan_rows_pruned"] == 0
+    assert summary["datasets_rebuilt"] == 2
+
+
+async def test_full_rebuild_prunes_orphaned_rollups(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = _FakeSession([])
+    monkeypatch.setattr(worker, "AsyncSessionLocal", lambda: session)
+
+    summary = await worker._impl()
+
+    pruned = [sql for sql, _ in session.statements if sql.startswith("DELETE FROM")]
+    assert len(pruned) == 2
+    assert summary == {
+        "status": "ok",
+        "project_id": None,
+        "datasets_rebuilt": 0,
+        "orphan_rows_pruned": 2,
+    }
@@ -112,10 +112,12 @@ class _Annotation:
         recording_id: UUID,
         start_time: float,
         end_time: float,
+        confidence: float | None = None,
     ) -> None:
         self.recording_id = recording_id
         self.start_time = start_time
         self.end_time = end_time
+        self.confidence = confidence
 
 
 # ---------------------------------------------------------------------------
@@ -331,3 +333,31 @@ async def test_case_c_normal_tp_fp_fn_on_finalized_annotated_segments() -> None:
     assert overall["fp"] == 1             # det_miss matched nothing
     assert overall["tp_recall"] == 1      # the [2,3) GT was detected
     assert overall["fn"] == 1             # the [5,6) GT was missed
+
+
+async def test_zero_length_detection_in_finalized_segment_is_fp() -> None:
+    """A zero-length detection inside a finalized window is a False Positive.
+
+    It intersects the window (``start < seg.end AND end > seg.start``) so it
+    stays in the universe, but the symmetric-overlap rule never matches an
+    empty interval, even one lying inside a ground truth.
+    """
+    rec = uuid4()
+    taxon = uuid4()
+
+    finalized = _Segment(recording_id=rec, start_time_sec=0.0, end_time_sec=10.0)
+    det_point = _Annotation(recording_id=rec, start_time=2.5, end_time=2.5)
+    det_on_edge = _Annotation(recording_id=rec, start_time=10.0, end_time=10.0)
+
+    db = _CaptureDB(_RowResult([(det_point, taxon), (det_on_edge, taxon)]))
+    detections = await _load_detections_for_ref(
+        db, segments=[finalized], model_ref={"kind": "birdnet"}
+    )
+    assert [d["start"] for d in detections] == [2.5]
+
+    rows = _score({"kind": "birdnet"}, [_gt(rec, 2.0, 3.0, taxon)], detections)
+    overall = _overall(rows)
+    assert overall["fp"] == 1
+    assert overall["tp_precision"] == 0
+    assert overall["tp_recall"] == 0
+    assert overall["fn"] == 1
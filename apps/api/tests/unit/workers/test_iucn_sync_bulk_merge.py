@@ -0,0 +1,93 @@
+"""Unit tests for the set-based IUCN snapshot merge.
+
+``_apply_snapshot`` must stage the snapshot with one ``COPY`` and merge it
+with one statement, taking the loosened count for the FR-036 sanity check
+from that statement's result. The merge SQL itself is PostgreSQL-specific;
+``tests/integration/workers/test_iucn_sync_merge_real_db.py`` runs it
+against a real database.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from echoroo.workers import iucn_sync
+
+
+def test_stage_rows_skips_unmapped_categories_and_keeps_last_duplicate() -> None:
+    records = iucn_sync._stage_rows(
+        [
+            {"taxonid": 1, "category": "VU"},
+            {"taxonid": 2, "category": "DD"},
+            {"taxonid": None, "category": "CR"},
+            {"taxonid": 3, "category": "lc"},
+            {"taxonid": 1, "category": "EN"},
+        ]
+    )
+
+    assert records == [("1", 5, "EN"), ("3", 9, "lc")]
+
+
+def _session(*, synced: int, loosened: int) -> tuple[MagicMock, AsyncMock]:
+    copy = AsyncMock()
+    raw = SimpleNamespace(driver_connection=SimpleNamespace(copy_records_to_table=copy))
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+
+    lock = MagicMock()
+    lock.scalar_one.return_value = True
+    merge = MagicMock()
+    merge.one.return_value = SimpleNamespace(
+        synced=synced, loosened=loosened, tightened=0, written=synced
+    )
+
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[lock, MagicMock(), merge])
+    session.connection = AsyncMock(return_value=connection)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session, copy
+
+
+def _patch_session(monkeypatch: pytest.MonkeyPatch, session: MagicMock) -> None:
+    @asynccontextmanager
+    async def _factory() -> Any:
+        yield session
+
+    monkeypatch.setattr(iucn_sync, "AsyncSessionLocal", _factory)
+
+
+@pytest.mark.asyncio
+async def test_apply_snapshot_copies_once_and_merges_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session, copy = _session(synced=20, loosened=1)
+    _patch_session(monkeypatch, session)
+
+    result = await iucn_sync._apply_snapshot([{"taxonid": i, "category": "LC"} for i in range(20)])
+
+    assert result == (20, 1)
+    copy.assert_awaited_once()
+    assert copy.await_args.args == (iucn_sync._SNAPSHOT_TABLE,)
+    assert len(copy.await_args.kwargs["records"]) == 20
+    assert session.execute.await_count == 3
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_apply_snapshot_rolls_back_past_loosen_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session, _copy = _session(synced=10, loosened=2)
+    _patch_session(monkeypatch, session)
+
+    with pytest.raises(RuntimeError, match="sanity check failed: 2/10"):
+        await iucn_sync._apply_snapshot([{"taxonid": 1, "category": "LC"}])
+
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited()
@@ -0,0 +1,162 @@
+"""Unit tests for notification-driven outbox dispatch.
+
+Covers the ``pg_notify`` issued by ``enqueue``, the enqueue-to-handled latency histogram and the listener's wake / sleep
+decisions. The LISTEN round trip itself needs a live PostgreSQL and is
+not exercised here.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from echoroo.services import outbox_service
+from echoroo.workers import outbox_listener
+from echoroo.workers import outbox_processor as proc
+from echoroo.workers.outbox_listener import MIN_IDLE_SECONDS, OutboxListener
+from echoroo.workers.outbox_processor import LatencyHistogram
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    result = MagicMock()
+    result.first.return_value = (uuid4(),)
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def _factory(session: Any) -> Any:
+    @asynccontextmanager
+    async def _cm() -> Any:
+        @asynccontextmanager
+        async def _begin() -> Any:
+            yield session
+
+        session.begin = _begin
+        yield session
+
+    return _cm
+
+
+@pytest.mark.asyncio
+async def test_enqueue_notifies_in_the_insert_statement() -> None:
+    session = _session()
+
+    await outbox_service.enqueue(session, event_type="evt", payload={}, idempotency_key="k:1")
+
+    assert session.execute.await_count == 1
+    sql = str(session.execute.await_args.args[0])
+    params = session.execute.await_args.args[1]
+    assert "pg_notify(:channel, :event_type)" in sql
+    assert params["channel"] == outbox_service.OUTBOX_NOTIFY_CHANNEL
+
+
+def test_latency_histogram_buckets_and_quantiles() -> None:
+    histogram = LatencyHistogram(bounds=(0.1, 1.0, 10.0))
+    for seconds in (0.05, 0.2, 0.3, 5.0, 50.0):
+        histogram.observe(seconds)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 5
+    assert snapshot["buckets"] == {"0.1": 1, "1.0": 3, "10.0": 4, "+Inf": 5}
+    assert histogram.quantile(0.5) == 1.0
+    assert histogram.quantile(0.99) == float("inf")
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+@pytest.mark.asyncio
+async def test_drain_batch_records_enqueue_to_handled_latency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(proc, "OUTBOX_HANDLERS", {"evt": AsyncMock()})
+    histogram = LatencyHistogram()
+    monkeypatch.setattr(proc, "OUTBOX_LATENCY", histogram)
+    row = {
+        "id": uuid4(),
+        "event_type": "evt",
+        "payload": {},
+        "retry_count": 0,
+        "created_at": datetime.now(UTC) - timedelta(seconds=2),
+    }
+
+    with (
+        patch.object(proc, "requeue_stuck_processing", new=AsyncMock()),
+        patch.object(proc, "claim_batch", new=AsyncMock(return_value=[row])),
+        patch.object(proc, "mark_done", new=AsyncMock()),
+    ):
+        processed = await proc._drain_batch(
+            _factory(MagicMock()), batch_size=10, worker_id="host:1"
+        )
+
+    assert processed == 1
+    assert histogram.snapshot()["count"] == 1
+    assert histogram.quantile(1.0) == 2.5
+
+
+def _listener(session: Any = None, *, batch_size: int = 10) -> OutboxListener:
+    return OutboxListener(
+        MagicMock(),
+        _factory(session or MagicMock()),  # type: ignore[arg-type]
+        poll_seconds=30.0,
+        batch_size=batch_size,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("processed", "due", "expected"),
+    [
+        (10, None, 0.0),  # full batch: drain again immediately
+        (3, None, 30.0),  # nothing pending: fallback poll
+        (3, 0.0, 0.0),  # handled rows and more are due
+        (0, 0.0, MIN_IDLE_SECONDS),  # due rows we could not claim
+        (0, 4.0, 4.0),  # sleep until the next backoff retry
+        (0, 600.0, 30.0),  # capped at the fallback poll
+    ],
+)
+async def test_next_delay(processed: int, due: float | None, expected: float) -> None:
+    with patch.object(outbox_listener, "seconds_until_next_due", new=AsyncMock(return_value=due)):
+        assert await _listener()._next_delay(processed) == expected
+
+
+@pytest.mark.asyncio
+async def test_run_once_falls_back_to_poll_when_drain_fails() -> None:
+    listener = _listener()
+    listener._wake.set()
+
+    with patch.object(
+        outbox_listener, "_drain_batch", new=AsyncMock(side_effect=OSError("db down"))
+    ):
+        delay = await listener.run_once()
+
+    assert delay == 30.0
+    assert not listener._wake.is_set()
+
+
+@pytest.mark.asyncio
+async def test_notification_wakes_the_sleeping_loop() -> None:
+    listener = _listener()
+    drained: list[int] = []
+
+    async def _drain(*_args: Any, **_kwargs: Any) -> int:
+        drained.append(1)
+        if len(drained) == 1:
+            # Simulate a NOTIFY arriving while the loop sleeps 30s.
+            listener._on_notify(None, 0, "outbox_events", "evt")
+        else:
+            listener.stop()
+        return 0
+
+    with (
+        patch.object(listener, "_ensure_listening", new=AsyncMock()),
+        patch.object(outbox_listener, "_drain_batch", new=_drain),
+        patch.object(outbox_listener, "seconds_until_next_due", new=AsyncMock(return_value=None)),
+    ):
+        await listener.run()
+
+    assert len(drained) == 2
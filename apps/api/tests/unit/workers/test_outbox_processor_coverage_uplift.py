@@ -202,7 +202,7 @@ async def test_drain_batch_processes_rows_and_records_failures(
 
     with patch.object(mod, "requeue_stuck_processing", new=AsyncMock()), \
             patch.object(mod, "claim_batch", new=AsyncMock(return_value=rows)), \
-            patch.object(mod, "mark_done", new=AsyncMock()), \
+            patch.object(mod, "mark_done", new=AsyncMock()) as done_mock, \
             patch.object(mod, "_record_failure", new=AsyncMock()) as rec_mock:
         result = await mod._drain_batch(
             _factory,  # type: ignore[arg-type]
@@ -210,9 +210,60 @@ async def test_drain_batch_processes_rows_and_records_failures(
             worker_id="host:1",
             stale_age=timedelta(minutes=5),
         )
-    # Only one row succeeded.
+    # Only the row whose handler succeeded is marked done, inside the
+    # session (transaction) its handler ran in.
     assert result == 1
     rec_mock.assert_awaited_once()
+    done_mock.assert_awaited_once()
+    assert done_mock.await_args.args[1] == rows[0]["id"]
+
+
+@pytest.mark.asyncio
+async def test_drain_batch_mark_done_failure_rolls_back_with_handler(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """mark_done shares the handler's transaction: if it fails, so does the row."""
+    monkeypatch.setattr(mod, "OUTBOX_HANDLERS", {}, raising=True)
+    sessions: list[Any] = []
+    rolled_back: list[Any] = []
+
+    async def _good(session: Any, _payload: dict[str, Any]) -> None:
+        sessions.append(session)
+
+    monkeypatch.setitem(mod.OUTBOX_HANDLERS, "ok", _good)
+    row = {"id": uuid4(), "event_type": "ok", "payload": {}, "retry_count": 0}
+
+    @asynccontextmanager
+    async def _factory() -> Any:
+        session = MagicMock()
+
+        @asynccontextmanager
+        async def _begin() -> Any:
+            try:
+                yield session
+            except Exception:
+                rolled_back.append(session)
+                raise
+
+        session.begin = _begin
+        yield session
+
+    with patch.object(mod, "requeue_stuck_processing", new=AsyncMock()), \
+            patch.object(mod, "claim_batch", new=AsyncMock(return_value=[row])), \
+            patch.object(
+                mod, "mark_done", new=AsyncMock(side_effect=RuntimeError("db gone"))
+            ) as done_mock, \
+            patch.object(mod, "_record_failure", new=AsyncMock()) as rec_mock:
+        result = await mod._drain_batch(
+            _factory,  # type: ignore[arg-type]
+            batch_size=10,
+            worker_id="host:1",
+        )
+
+    assert result == 0
+    assert done_mock.await_args.args[0] is sessions[0]
+    assert rolled_back == sessions
+    rec_mock.assert_awaited_once()
 
 
 # ---------------------------------------------------------------------------
@@ -67,6 +67,41 @@ export interface IucnForceResyncResponse {
   enqueued_at: string;
 }
 
+/** Audit table checked by a chain verification. */
+export type AuditChainTarget = 'project' | 'platform';
+
+/**
+ * One background audit chain verification run
+ * (`/admin/audit-log/chain-verify`).
+ *
+ * `rows_verified` out of `rows_total` is the run's progress; both count only
+ * the rows after the checkpoint the run resumed from (`resumed_from_id`).
+ * `status='success'` means the run completed — the verdict is `is_valid`,
+ * with `first_mismatch_row_id` naming the first row that failed. The
+ * `checkpoint_*` fields show how far the chain is vouched for.
+ */
+export interface AuditChainVerification {
+  id: string;
+  target: AuditChainTarget;
+  status: 'queued' | 'running' | 'success' | 'failure';
+  started_at: string;
+  finished_at: string | null;
+  resumed_from_id: string | null;
+  rows_total: number | null;
+  rows_verified: number;
+  is_valid: boolean | null;
+  first_mismatch_row_id: string | null;
+  error_detail: string | null;
+  checkpoint_row_id: string | null;
+  checkpoint_created_at: string | null;
+  checkpoint_row_count: number | null;
+}
+
+/** Body for `GET /admin/audit-log/chain-verify` — newest runs first. */
+export interface AuditChainVerificationListResponse {
+  items: AuditChainVerification[];
+}
+
 /**
  * Snapshot of a wedged upload session surfaced by the admin recovery
  * endpoints (`GET /admin/uploads/stuck` list + `POST /admin/uploads/{id}/fail`
@@ -281,6 +316,53 @@ export const adminApi = {
     );
   },
 
+  /**
+   * Start a background audit chain verification (superuser only).
+   *
+   * Returns the queued run; poll `getAuditChainVerification` with its id
+   * until `status` is terminal. The run resumes after the latest signed
+   * checkpoint unless `full` is set.
+   */
+  startAuditChainVerification: async (
+    target: AuditChainTarget,
+    full = false
+  ): Promise<AuditChainVerification> => {
+    const queryParams = new URLSearchParams({ target, full: String(full) });
+    return apiClient.post<AuditChainVerification>(
+      `${WEB_API_BASE}/admin/audit-log/chain-verify?${queryParams.toString()}`,
+      {},
+      { headers: csrfHeaders() }
+    );
+  },
+
+  /**
+   * List recent audit chain verification runs (superuser only).
+   */
+  listAuditChainVerifications: async (
+    target?: AuditChainTarget,
+    limit?: number
+  ): Promise<AuditChainVerificationListResponse> => {
+    const queryParams = new URLSearchParams();
+    if (target) queryParams.set('target', target);
+    if (limit !== undefined) queryParams.set('limit', limit.toString());
+
+    const query = queryParams.toString();
+    return apiClient.get<AuditChainVerificationListResponse>(
+      `${WEB_API_BASE}/admin/audit-log/chain-verify${query ? `?${query}` : ''}`
+    );
+  },
+
+  /**
+   * Get the progress (or verdict) of one audit chain verification run.
+   */
+  getAuditChainVerification: async (
+    verificationId: string
+  ): Promise<AuditChainVerification> => {
+    return apiClient.get<AuditChainVerification>(
+      `${WEB_API_BASE}/admin/audit-log/chain-verify/${verificationId}`
+    );
+  },
+
   /**
    * List stuck (non-terminal) upload sessions (superuser only).
    *
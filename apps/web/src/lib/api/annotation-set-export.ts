@@ -29,17 +29,22 @@ export async function exportAnnotationSetCsv(
   downloadBlob(blob, 'annotation-set.csv');
 }
 
+/** Encoding of the per-segment clips in a dataset ZIP. */
+export type DatasetClipFormat = 'wav' | 'flac';
+
 /**
  * Export an annotation set as a dataset ZIP (CSV labels + per-segment audio
  * clips) and trigger a browser download. The ZIP contains ``annotations.csv``,
- * ``segments.csv`` and one ``clips/<segment_id>.wav`` per finalized segment.
+ * ``segments.csv`` and one ``clips/<segment_id>.wav`` (or ``.flac``) per
+ * finalized segment.
  */
 export async function downloadAnnotationSetDataset(
   projectId: string,
-  setId: string
+  setId: string,
+  clipFormat: DatasetClipFormat = 'wav'
 ): Promise<void> {
   const response = await apiClient.requestRaw(
-    `${WEB_API_BASE}/projects/${projectId}/annotation-sets/${setId}/export/dataset`
+    `${WEB_API_BASE}/projects/${projectId}/annotation-sets/${setId}/export/dataset?clip_format=${clipFormat}`
   );
   if (!response.ok) {
     throw new Error(`Export failed: ${response.statusText}`);
@@ -13,6 +13,7 @@ import type {
   DatetimeAutoDetectResult,
   DatetimeConfig,
   DatetimeTestResult,
+  DeletionJob,
   ImportRequest,
   ImportStatusResponse,
 } from '$lib/types/data';
@@ -103,15 +104,25 @@ export async function updateDataset(
 }
 
 /**
- * Delete a dataset.
+ * Queue the background deletion of a dataset.
+ *
+ * The dataset switches to `deleting` and is removed by a server-side job;
+ * poll it with {@link fetchDeletionJob}.
  */
-export async function deleteDataset(projectId: string, datasetId: string): Promise<void> {
-  return apiClient.delete<void>(
+export async function deleteDataset(projectId: string, datasetId: string): Promise<DeletionJob> {
+  return apiClient.delete<DeletionJob>(
     `${WEB_API_BASE}/projects/${projectId}/datasets/${datasetId}`,
     { headers: csrfHeaders() }
   );
 }
 
+/**
+ * Fetch the progress of a dataset or project deletion (requester only).
+ */
+export async function fetchDeletionJob(jobId: string): Promise<DeletionJob> {
+  return apiClient.get<DeletionJob>(`${WEB_API_BASE}/deletion-jobs/${jobId}`);
+}
+
 /**
  * Start importing recordings from a dataset.
  */
@@ -2,13 +2,65 @@
  * Detection export API client for downloading CSV and ML datasets.
  *
  * spec/009 PR 4: both endpoints go through ``/web-api/v1`` (cookie +
- * CSRF session boundary). These are GET requests — no CSRF header is
- * required.
+ * CSRF session boundary). The CSV export is a streamed GET. The ML
+ * dataset is built by a background job: queueing it is a POST (CSRF
+ * header required), then the job is polled until it hands back a
+ * presigned download URL.
  */
 
 import { apiClient } from './client';
 
 const WEB_API_BASE = '/web-api/v1';
+const CSRF_COOKIE_NAME = 'echoroo_csrf';
+
+/** Delay between polls of a running ML dataset export job. */
+const EXPORT_POLL_INTERVAL_MS = 2000;
+
+export type MLDatasetExportJobStatus = 'queued' | 'running' | 'success' | 'failure';
+
+/**
+ * Background ML dataset export, returned by
+ * `POST .../detections/export/ml-dataset/jobs` (202) and polled through
+ * `GET .../detections/export/ml-dataset/jobs/{id}`.
+ */
+export interface MLDatasetExportJob {
+  id: string;
+  project_id: string;
+  dataset_id: string | null;
+  detection_run_id: string | null;
+  status: MLDatasetExportJobStatus;
+  /** annotations.csv rows written so far. */
+  entries_written: number;
+  size_bytes: number | null;
+  started_at: string;
+  finished_at: string | null;
+  error_detail: string | null;
+  /** Short-lived presigned URL of the ZIP; set once the job succeeded. */
+  download_url: string | null;
+}
+
+function getCsrfToken(): string | null {
+  if (typeof document === 'undefined') return null;
+  const prefix = `${CSRF_COOKIE_NAME}=`;
+  const parts = document.cookie ? document.cookie.split('; ') : [];
+  for (const part of parts) {
+    if (part.startsWith(prefix)) {
+      try {
+        return decodeURIComponent(part.slice(prefix.length));
+      } catch {
+        return part.slice(prefix.length);
+      }
+    }
+  }
+  return null;
+}
+
+function csrfHeaders(): Record<string, string> {
+  const headers: Record<string, string> = {};
+  const token = getCsrfToken();
+  if (token) headers['X-CSRF-Token'] = token;
+  return headers;
+}
 
 /**
  * Build query string from export filter params.
@@ -47,22 +99,52 @@ export async function exportDetectionsCSV(
   downloadBlob(blob, 'detections.csv');
 }
 
+/**
+ * Queue a background ML training dataset export.
+ */
+export async function createMLDatasetExportJob(
+  projectId: string,
+  params?: { dataset_id?: string; detection_run_id?: string }
+): Promise<MLDatasetExportJob> {
+  const qs = buildExportParams(params);
+  return apiClient.post<MLDatasetExportJob>(
+    `${WEB_API_BASE}/projects/${projectId}/detections/export/ml-dataset/jobs${qs}`,
+    undefined,
+    { headers: csrfHeaders() }
+  );
+}
+
+/**
+ * Fetch the progress of an ML dataset export (requester only).
+ */
+export async function fetchMLDatasetExportJob(
+  projectId: string,
+  jobId: string
+): Promise<MLDatasetExportJob> {
+  return apiClient.get<MLDatasetExportJob>(
+    `${WEB_API_BASE}/projects/${projectId}/detections/export/ml-dataset/jobs/${jobId}`
+  );
+}
+
 /**
  * Export ML training dataset as ZIP file (triggers browser download).
+ *
+ * Queues the export job, polls it until it finishes and then downloads the
+ * archive straight from object storage.
  */
 export async function exportMLDataset(
   projectId: string,
   params?: { dataset_id?: string; detection_run_id?: string }
 ): Promise<void> {
-  const qs = buildExportParams(params);
-  const response = await apiClient.requestRaw(
-    `${WEB_API_BASE}/projects/${projectId}/detections/export/ml-dataset${qs}`
-  );
-  if (!response.ok) {
-    throw new Error(`Export failed: ${response.statusText}`);
+  let job = await createMLDatasetExportJob(projectId, params);
+  while (job.status === 'queued' || job.status === 'running') {
+    await new Promise((resolve) => setTimeout(resolve, EXPORT_POLL_INTERVAL_MS));
+    job = await fetchMLDatasetExportJob(projectId, job.id);
   }
-  const blob = await response.blob();
-  downloadBlob(blob, 'ml-dataset.zip');
+  if (job.status !== 'success' || !job.download_url) {
+    throw new Error(`Export failed: ${job.error_detail ?? job.status}`);
+  }
+  downloadUrl(job.download_url, 'ml-dataset.zip');
 }
 
 /**
@@ -70,11 +152,18 @@ export async function exportMLDataset(
  */
 function downloadBlob(blob: Blob, filename: string): void {
   const url = URL.createObjectURL(blob);
+  downloadUrl(url, filename);
+  URL.revokeObjectURL(url);
+}
+
+/**
+ * Trigger a browser file download from a URL.
+ */
+function downloadUrl(url: string, filename: string): void {
   const a = document.createElement('a');
   a.href = url;
   a.download = filename;
   document.body.appendChild(a);
   a.click();
   document.body.removeChild(a);
-  URL.revokeObjectURL(url);
 }
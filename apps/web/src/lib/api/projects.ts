@@ -28,6 +28,7 @@ import type {
   InvitationRevokeRequest,
   InvitationRevokeResponse,
 } from '$lib/types';
+import type { DeletionJob } from '$lib/types/data';
 import { ApiError, apiClient } from './client';
 import { localizeHref } from '$lib/paraglide/runtime';
 
@@ -291,10 +292,11 @@ export const projectsApi = {
   },
 
   /**
-   * Delete a project (owner only)
+   * Queue the background deletion of a project (owner only). The project
+   * switches to `deleting` until the returned job finishes.
    */
-  delete: async (projectId: string): Promise<void> => {
-    await callWebApi<void>('DELETE', `/projects/${projectId}`);
+  delete: async (projectId: string): Promise<DeletionJob> => {
+    return callWebApi<DeletionJob>('DELETE', `/projects/${projectId}`);
   },
 
   /**
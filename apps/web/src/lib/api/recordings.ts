@@ -149,18 +149,22 @@ export async function deleteRecording(projectId: string, recordingId: string): P
 
 /**
  * Issue a scoped token for native browser media/image requests.
+ *
+ * Pass `prefetch: true` to have the server start pulling the recording into
+ * its local audio cache, e.g. for the next item in a review queue.
  */
 export async function getRecordingMediaToken(
   projectId: string,
   recordingId: string,
-  scope: RecordingMediaScope
+  scope: RecordingMediaScope,
+  options: { prefetch?: boolean } = {}
 ): Promise<RecordingMediaTokenResponse> {
   const headers: Record<string, string> = {};
   const csrfToken = getCsrfToken();
   if (csrfToken) headers['X-CSRF-Token'] = csrfToken;
   return apiClient.post<RecordingMediaTokenResponse>(
     `${WEB_API_BASE}/projects/${projectId}/recordings/${recordingId}/media-token`,
-    { scope },
+    options.prefetch ? { scope, prefetch: true } : { scope },
     { headers }
   );
 }
@@ -322,6 +322,15 @@ export interface OverallMetric {
   f1: number;
   detections_total: number;
   ground_truths_total: number;
+  /** Precision / recall by descending confidence threshold. */
+  pr_curve: PRCurvePoint[];
+}
+
+/** Precision and recall when keeping detections scoring >= threshold. */
+export interface PRCurvePoint {
+  threshold: number | null;
+  precision: number;
+  recall: number;
 }
 
 /** Summary bundle for one model reference within an evaluation run. */
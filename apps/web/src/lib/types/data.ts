@@ -9,7 +9,13 @@
 
 export type DatasetVisibility = 'private' | 'public';
 
-export type DatasetStatus = 'pending' | 'scanning' | 'processing' | 'completed' | 'failed';
+export type DatasetStatus =
+  | 'pending'
+  | 'scanning'
+  | 'processing'
+  | 'completed'
+  | 'failed'
+  | 'deleting';
 
 export type DatetimeParseStatus = 'pending' | 'success' | 'failed';
 
@@ -529,3 +535,28 @@ export interface DatetimeApplyResult {
   task_id: string;
   total_recordings: number;
 }
+
+// ============================================
+// Deletion Job Types
+// ============================================
+
+export type DeletionJobStatus = 'queued' | 'running' | 'success' | 'failure';
+
+/**
+ * Background deletion of a dataset or project, returned by their DELETE
+ * routes (202) and polled through `GET /web-api/v1/deletion-jobs/{id}`.
+ */
+export interface DeletionJob {
+  id: string;
+  entity_type: 'dataset' | 'project';
+  entity_id: string;
+  project_id: string;
+  status: DeletionJobStatus;
+  /** Child table, `storage` or `entity` being deleted; null while queued. */
+  stage: string | null;
+  rows_deleted: number;
+  objects_deleted: number;
+  started_at: string;
+  finished_at: string | null;
+  error_detail: string | null;
+}
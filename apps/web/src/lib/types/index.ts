@@ -458,9 +458,9 @@ export interface ProjectUpdateRequest {
  *
  * Mirrors `ProjectStatus` in `apps/api/echoroo/models/enums.py` and the
  * `status` enum in `contracts/projects.yaml` (`active`, `dormant`,
- * `archived`).
+ * `archived`), plus `deleting` while a background deletion job runs.
  */
-export type ProjectStatus = 'active' | 'dormant' | 'archived';
+export type ProjectStatus = 'active' | 'dormant' | 'archived' | 'deleting';
 
 /**
  * Project summary returned by `GET /projects` list endpoints (Phase 9 /
@@ -148,7 +148,7 @@ export function getConsensusStatusLabel(
 
 // ============================================
 // Dataset status
-// Covers: DatasetStatus ('pending' | 'scanning' | 'processing' | 'completed' | 'failed')
+// Covers: DatasetStatus ('pending' | 'scanning' | 'processing' | 'completed' | 'failed' | 'deleting')
 // ============================================
 
 /**
@@ -165,6 +165,8 @@ export function getDatasetStatusClass(status: DatasetStatus): string {
       return 'bg-green-100 text-green-800';
     case 'failed':
       return 'bg-red-100 text-red-800';
+    case 'deleting':
+      return 'bg-stone-200 text-stone-600';
     default:
       return 'bg-stone-100 text-stone-800';
   }
@@ -186,6 +188,8 @@ export function getDatasetStatusLabel(status: DatasetStatus): string {
       return 'Ready';
     case 'failed':
       return 'Failed';
+    case 'deleting':
+      return 'Deleting';
     default:
       return status;
   }
@@ -206,6 +210,8 @@ export function getDatasetStatusMessage(status: DatasetStatus): string {
       return 'Import completed successfully';
     case 'failed':
       return 'Import failed';
+    case 'deleting':
+      return 'Deleting dataset...';
     default:
       return status;
   }
@@ -615,7 +621,7 @@ export function getUploadSessionStatusLabel(
 
 // ============================================
 // Project status (public project lifecycle)
-// Covers: ProjectStatus ('active' | 'dormant' | 'archived')
+// Covers: ProjectStatus ('active' | 'dormant' | 'archived' | 'deleting')
 // ============================================
 
 /**
@@ -636,6 +642,8 @@ export function getProjectStatusLabel(
       return t?.active() ?? 'Active';
     case 'dormant':
       return t?.dormant() ?? 'Dormant';
+    case 'deleting':
+      return 'Deleting';
     default:
       return t?.archived() ?? 'Archived';
   }